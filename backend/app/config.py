@@ -36,6 +36,14 @@ class Settings(BaseSettings):
     
     # === CONFIGURAÇÕES DE BANCO DE DADOS ===
     database_url: str = "sqlite:///./tecnocursos.db"
+    async_database_url: Optional[str] = None  # derivada de database_url se vazia
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    sqlite_wal: bool = True
+    sqlite_busy_timeout_ms: int = 5000
     
     # === CONFIGURAÇÕES DE SERVIDOR ===
     host: str = "0.0.0.0"
@@ -141,6 +149,14 @@ class Settings(BaseSettings):
     
     # === CONFIGURAÇÕES DE CACHE ===
     redis_url: Optional[str] = None
+    preview_cache_memory_mb: int = 64
+    preview_cache_disk_mb: int = 512
+    preview_render_workers: int = 4
+    scenes_near_cache_ttl: float = 2.0   # segundos; cache em processo das leituras quentes
+    scenes_near_cache_size: int = 1024
+
+    # === CONFIGURAÇÕES DE BUSCA ===
+    search_index_path: str = "app/static/search/text_index.db"
     
     # === CONFIGURAÇÕES DE STORAGE ===
     aws_access_key_id: Optional[str] = None
@@ -181,6 +197,19 @@ class Settings(BaseSettings):
     worker_processes: int = 1
     max_connections: int = 1000
     connection_timeout: int = 30
+    lazy_routers: bool = True             # montar routers no primeiro request ao prefixo
+    lazy_routers_warmup: bool = False     # carregar os pendentes em background após o startup
+    tracing_enabled: bool = True          # spans por requisição (app.core.tracing)
+    tracing_slow_ms: float = 500.0        # traces acima disto são sempre guardados
+    tracing_sample_rate: float = 0.01     # fração dos traces rápidos guardada
+    tracing_max_traces: int = 200         # traces mantidos em memória
+    prometheus_enabled: bool = True       # métricas HTTP por template de rota e GET /metrics
+    scheduler_tick_seconds: float = 0.1   # resolução da roda de tempo (app.core.scheduler)
+    scheduler_executor_workers: int = 4   # threads para jobs agendados CPU-bound
+    job_queue_url: str = "sqlite:///./data/job_queue.db"  # redis://host:6379/1 para workers em vários hosts
+    job_queue_embedded_worker: bool = True  # worker dentro da API; desligar com workers dedicados
+    job_queue_concurrency: str = "render=1,export=1,tts=2"  # slots por fila em cada worker
+    job_queue_lease_seconds: float = 60.0  # sem heartbeat por este tempo, o job volta para a fila
     
     # === CONFIGURAÇÕES DE SEGURANÇA AVANÇADA ===
     jwt_algorithm: str = "HS256"
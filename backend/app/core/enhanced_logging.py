@@ -21,13 +21,16 @@ Funcionalidades:
 - Performance logging
 - Security event logging
 - Error tracking com stack traces
-- Log sampling para high-volume events
+- Log sampling por nível e limite de taxa por logger
+- Pipeline não bloqueante: fila limitada, formatação na thread de escrita,
+  escrita em lotes com fsync periódico
 - Integration com Sentry, DataDog, etc.
 
 Autor: TecnoCursos AI System
 Data: 17/01/2025
 """
 
+import atexit
 import json
 import logging
 import logging.handlers
@@ -45,6 +48,8 @@ import threading
 import queue
 import asyncio
 
+from app.core.tracing import current_trace_id, record_span
+
 try:
     import structlog
     STRUCTLOG_AVAILABLE = True
@@ -69,6 +74,18 @@ correlation_id_context: ContextVar[Optional[str]] = ContextVar('correlation_id',
 user_id_context: ContextVar[Optional[int]] = ContextVar('user_id', default=None)
 request_context: ContextVar[Optional[Dict]] = ContextVar('request_context', default=None)
 
+# Atributo do LogRecord com o contexto capturado na thread que gerou o log
+CONTEXT_ATTR = '_tc_context'
+
+def capture_log_context() -> tuple:
+    """(correlation_id, trace_id, user_id, request) do contexto atual"""
+    return (correlation_id_context.get(), current_trace_id(), user_id_context.get(), request_context.get())
+
+def _record_context(record: logging.LogRecord) -> tuple:
+    """Contexto capturado no enfileiramento ou, sem pipeline, o contexto atual"""
+    context = getattr(record, CONTEXT_ATTR, None)
+    return context if context is not None else capture_log_context()
+
 # ============================================================================
 # CONFIGURAÇÃO DE LOGGING
 # ============================================================================
@@ -85,7 +102,13 @@ class LogConfig:
     enable_correlation: bool = True
     enable_performance: bool = True
     enable_security: bool = True
-    sample_rate: float = 1.0  # 1.0 = log everything, 0.1 = log 10%
+    sample_rate: float = 1.0  # DEBUG/INFO: 1.0 = log everything, 0.1 = log 10%
+    rate_limit_per_logger: float = 0.0  # registros/s abaixo de WARNING por logger (0 = sem limite)
+    rate_limit_burst: int = 200
+    queue_size: int = 10000
+    batch_size: int = 256
+    flush_interval: float = 0.2  # segundos
+    fsync_interval: float = 1.0  # segundos
     external_integrations: List[str] = None
     sensitive_fields: List[str] = None
     
@@ -105,6 +128,14 @@ log_config = LogConfig()
 # FORMATTERS CUSTOMIZADOS
 # ============================================================================
 
+# Atributos padrão do LogRecord (o resto vira campo extra no JSON)
+_RESERVED_RECORD_ATTRS = frozenset([
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 'filename', 'module',
+    'lineno', 'funcName', 'created', 'msecs', 'relativeCreated', 'thread', 'threadName',
+    'processName', 'process', 'message', 'exc_info', 'exc_text', 'stack_info', 'taskName',
+    CONTEXT_ATTR,
+])
+
 class TecnoCursosJSONFormatter(logging.Formatter):
     """Formatter JSON customizado para TecnoCursos AI"""
     
@@ -130,28 +161,28 @@ class TecnoCursosJSONFormatter(logging.Formatter):
             'hostname': self.hostname
         }
         
+        # Contexto capturado na thread que gerou o log (pipeline) ou o atual
+        correlation_id, trace_id, user_id, request_ctx = _record_context(record)
+        
         # Adicionar correlation ID se disponível
-        correlation_id = correlation_id_context.get()
         if correlation_id:
             log_data['correlation_id'] = correlation_id
             
+        # Adicionar trace ID (app.core.tracing) se disponível
+        if trace_id:
+            log_data['trace_id'] = trace_id
+            
         # Adicionar user ID se disponível
-        user_id = user_id_context.get()
         if user_id:
             log_data['user_id'] = user_id
             
         # Adicionar contexto do request se disponível
-        request_ctx = request_context.get()
         if request_ctx:
             log_data['request'] = request_ctx
         
         # Adicionar campos extras do record
         for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                          'filename', 'module', 'lineno', 'funcName', 'created',
-                          'msecs', 'relativeCreated', 'thread', 'threadName',
-                          'processName', 'process', 'message', 'exc_info', 'exc_text',
-                          'stack_info']:
+            if key not in _RESERVED_RECORD_ATTRS:
                 log_data[key] = value
         
         # Adicionar exception info se presente
@@ -203,7 +234,7 @@ class ColoredFormatter(logging.Formatter):
         format_str = f"{color}%(asctime)s [%(levelname)s]{reset} %(name)s:%(funcName)s:%(lineno)d - %(message)s"
         
         # Adicionar correlation ID se disponível
-        correlation_id = correlation_id_context.get()
+        correlation_id = _record_context(record)[0]
         if correlation_id:
             format_str = f"{color}%(asctime)s [%(levelname)s] [{correlation_id}]{reset} %(name)s:%(funcName)s:%(lineno)d - %(message)s"
         
@@ -211,92 +242,429 @@ class ColoredFormatter(logging.Formatter):
         return formatter.format(record)
 
 # ============================================================================
-# HANDLERS CUSTOMIZADOS
+# PIPELINE DE LOGGING (FILA + THREAD DE ESCRITA)
 # ============================================================================
 
-class AsyncFileHandler(logging.Handler):
-    """Handler assíncrono para arquivos (melhor performance)"""
-    
-    def __init__(self, filename: str, max_bytes: int = 0, backup_count: int = 0):
-        super().__init__()
-        self.filename = filename
+class LevelAwareSampler:
+    """
+    Amostragem por nível com limite de taxa por logger.
+
+    WARNING e acima nunca são amostrados nem limitados. Abaixo disso, cada
+    (logger, nível) mantém 1 a cada round(1/taxa) registros, e cada logger
+    tem um token bucket de `rate_limit` registros/s (rajada `burst`), para
+    que um logger barulhento não consuma a fila dos demais.
+    """
+
+    def __init__(self, level_rates: Optional[Dict[int, float]] = None,
+                 rate_limit: float = 0.0, burst: int = 200):
+        self.level_rates = {level: rate for level, rate in (level_rates or {}).items() if rate < 1.0}
+        self.rate_limit = rate_limit
+        self.burst = max(burst, 1)
+        self.active = bool(self.level_rates) or rate_limit > 0
+        self._counters: Dict[tuple, int] = {}
+        self._buckets: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self.sampled_out: Dict[str, int] = {}   # por nível
+        self.rate_limited: Dict[str, int] = {}  # por logger
+
+    def allow(self, record: logging.LogRecord) -> bool:
+        """True se o registro deve seguir para a fila"""
+        if not self.active or record.levelno >= logging.WARNING:
+            return True
+        with self._lock:
+            rate = self.level_rates.get(record.levelno)
+            if rate is not None:
+                key = (record.name, record.levelno)
+                count = self._counters.get(key, 0)
+                self._counters[key] = count + 1
+                every = max(int(round(1 / rate)), 1) if rate > 0 else 0
+                if not every or count % every:
+                    self.sampled_out[record.levelname] = self.sampled_out.get(record.levelname, 0) + 1
+                    return False
+                record.sampled = True
+                record.sample_rate = rate
+
+            if self.rate_limit > 0:
+                now = time.monotonic()
+                bucket = self._buckets.get(record.name)
+                if bucket is None:
+                    bucket = self._buckets[record.name] = [float(self.burst), now]
+                tokens = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate_limit)
+                bucket[1] = now
+                if tokens < 1:
+                    bucket[0] = tokens
+                    self.rate_limited[record.name] = self.rate_limited.get(record.name, 0) + 1
+                    return False
+                bucket[0] = tokens - 1
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "level_rates": {logging.getLevelName(level): rate for level, rate in self.level_rates.items()},
+                "rate_limit_per_logger": self.rate_limit,
+                "sampled_out": dict(self.sampled_out),
+                "rate_limited": dict(self.rate_limited),
+            }
+
+
+def _format_records(formatter: logging.Formatter, records: List[logging.LogRecord]) -> str:
+    """Formata um lote; um registro com erro de formatação não derruba o lote"""
+    lines = []
+    for record in records:
+        try:
+            lines.append(formatter.format(record))
+        except Exception as e:
+            lines.append(f"{record.levelname} {record.name} {record.msg!r} [erro de formatação: {e}]")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+class StreamSink:
+    """Destino de lotes em stream (console)"""
+
+    def __init__(self, stream, formatter: Optional[logging.Formatter] = None):
+        self.stream = stream
+        self.formatter = formatter or logging.Formatter()
+
+    def write_batch(self, records: List[logging.LogRecord]):
+        text = _format_records(self.formatter, records)
+        if text:
+            self.stream.write(text)
+            self.stream.flush()
+
+    def sync(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class BatchFileSink:
+    """Destino de lotes em arquivo: uma escrita por lote, rotação por tamanho e fsync sob demanda"""
+
+    def __init__(self, filename: str, formatter: Optional[logging.Formatter] = None,
+                 max_bytes: int = 0, backup_count: int = 0):
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+        self.filename = os.path.abspath(filename)
+        self.formatter = formatter or logging.Formatter()
         self.max_bytes = max_bytes
         self.backup_count = backup_count
-        self.queue = queue.Queue()
-        self.thread = None
-        self.stop_event = threading.Event()
-        self._ensure_dir()
-        self._start_thread()
-    
-    def _ensure_dir(self):
-        """Garantir que o diretório existe"""
-        Path(self.filename).parent.mkdir(parents=True, exist_ok=True)
-    
-    def _start_thread(self):
-        """Iniciar thread de escrita"""
-        self.thread = threading.Thread(target=self._writer_thread, daemon=True)
-        self.thread.start()
-    
-    def _writer_thread(self):
-        """Thread que escreve logs no arquivo"""
-        file_handler = logging.handlers.RotatingFileHandler(
-            self.filename, maxBytes=self.max_bytes, backupCount=self.backup_count
-        )
-        file_handler.setFormatter(self.formatter)
-        
-        while not self.stop_event.is_set():
+        self._file = open(self.filename, "a", encoding="utf-8")
+        self._size = self._file.tell()
+        self._dirty = False
+
+    def write_batch(self, records: List[logging.LogRecord]):
+        text = _format_records(self.formatter, records)
+        if not text:
+            return
+        if self.max_bytes and self.backup_count and self._size and self._size + len(text) > self.max_bytes:
+            self._rotate()
+        self._file.write(text)
+        self._file.flush()
+        self._size += len(text)
+        self._dirty = True
+
+    def sync(self):
+        """fsync do que já foi escrito (chamado periodicamente pela thread de escrita)"""
+        if self._dirty:
+            os.fsync(self._file.fileno())
+            self._dirty = False
+
+    def _rotate(self):
+        """Mesmo esquema do RotatingFileHandler: app.log -> app.log.1 -> ... -> app.log.N"""
+        self.sync()
+        self._file.close()
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.filename}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.filename}.{index + 1}")
+        os.replace(self.filename, f"{self.filename}.1")
+        self._file = open(self.filename, "a", encoding="utf-8")
+        self._size = 0
+
+    def close(self):
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+
+_STOP = object()
+
+
+class LogPipeline:
+    """
+    Pipeline de logging não bloqueante.
+
+    Na thread que loga ficam só a amostragem, a captura do contexto
+    (correlation/trace/user) e um put_nowait na fila; formatação JSON,
+    sanitização e escrita rodam na thread de escrita, em lotes de até
+    `batch_size` registros, com flush por lote e fsync a cada
+    `fsync_interval` segundos.
+
+    A fila é limitada: registros abaixo de WARNING são descartados quando
+    ela passa de `low_priority_fill` da capacidade, preservando o espaço
+    restante para avisos e erros; com a fila cheia, qualquer registro é
+    descartado. Nada bloqueia quem loga, e os descartes são contados por
+    nível.
+    """
+
+    def __init__(self, sinks: List[Any], queue_size: int = 10000, batch_size: int = 256,
+                 flush_interval: float = 0.2, fsync_interval: float = 1.0,
+                 sampler: Optional[LevelAwareSampler] = None, low_priority_fill: float = 0.8):
+        self.sinks = list(sinks)
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.sampler = sampler or LevelAwareSampler()
+        self._low_priority_limit = int(queue_size * low_priority_fill)
+        self._drop_lock = threading.Lock()
+        self.dropped: Dict[str, int] = {}
+        self.written = 0
+        self.batches = 0
+        self.fsyncs = 0
+        self.write_errors = 0
+        self._last_sync = time.monotonic()
+        self._thread: Optional[threading.Thread] = None
+        self.handler = PipelineHandler(self)
+        self.start()
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def enqueue(self, record: logging.LogRecord) -> bool:
+        """Enfileira sem bloquear; False se o registro foi descartado"""
+        if record.levelno < logging.WARNING and self.queue.qsize() >= self._low_priority_limit:
+            self._count_drop(record)
+            return False
+        try:
+            self.queue.put_nowait(record)
+            return True
+        except queue.Full:
+            self._count_drop(record)
+            return False
+
+    def _count_drop(self, record: logging.LogRecord):
+        with self._drop_lock:
+            self.dropped[record.levelname] = self.dropped.get(record.levelname, 0) + 1
+
+    def _run(self):
+        """Thread de escrita: drena a fila em lotes"""
+        q = self.queue
+        running = True
+        while running:
             try:
-                record = self.queue.get(timeout=1)
-                if record is None:  # Sentinel para parar
-                    break
-                file_handler.emit(record)
+                item = q.get(timeout=self.flush_interval)
             except queue.Empty:
+                self._sync()
                 continue
+            batch = []
+            while True:
+                if item is _STOP:
+                    running = False
+                else:
+                    batch.append(item)
+                q.task_done()
+                if not running or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write(batch)
+            self._sync(force=not running)
+        for sink in self.sinks:
+            try:
+                sink.close()
             except Exception as e:
-                print(f"Erro no AsyncFileHandler: {e}", file=sys.stderr)
-    
-    def emit(self, record: logging.LogRecord):
-        """Enviar log record para a queue"""
+                print(f"Erro ao fechar destino de logs: {e}", file=sys.stderr)
+
+    def _write(self, batch: List[logging.LogRecord]):
+        for sink in self.sinks:
+            try:
+                sink.write_batch(batch)
+            except Exception as e:
+                self.write_errors += 1
+                print(f"Erro na escrita de logs: {e}", file=sys.stderr)
+        self.written += len(batch)
+        self.batches += 1
+
+    def _sync(self, force: bool = False):
+        now = time.monotonic()
+        if not force and now - self._last_sync < self.fsync_interval:
+            return
+        self._last_sync = now
+        for sink in self.sinks:
+            try:
+                sink.sync()
+            except Exception as e:
+                self.write_errors += 1
+                print(f"Erro no fsync de logs: {e}", file=sys.stderr)
+        self.fsyncs += 1
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Espera a fila esvaziar (testes e shutdown); True se esvaziou"""
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks and self.running:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return not self.queue.unfinished_tasks
+
+    def stop(self, timeout: float = 5.0):
+        """Escreve o que restou na fila, faz fsync e encerra a thread"""
+        if not self.running:
+            return
         try:
-            self.queue.put_nowait(record)
+            self.queue.put(_STOP, timeout=timeout)
         except queue.Full:
-            # Se a queue estiver cheia, descartar o log (evitar memory leak)
-            pass
-    
+            print("Fila de logs cheia no encerramento", file=sys.stderr)
+            return
+        self._thread.join(timeout=timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._drop_lock:
+            dropped = dict(self.dropped)
+        return {
+            "running": self.running,
+            "queue_size": self.queue.qsize(),
+            "queue_capacity": self.queue_size,
+            "written": self.written,
+            "batches": self.batches,
+            "fsyncs": self.fsyncs,
+            "write_errors": self.write_errors,
+            "dropped": dropped,
+            "sampling": self.sampler.get_stats(),
+        }
+
+
+class PipelineHandler(logging.handlers.QueueHandler):
+    """QueueHandler do LogPipeline: na thread chamadora só amostra, captura contexto e enfileira"""
+
+    def __init__(self, pipeline: LogPipeline):
+        super().__init__(pipeline.queue)
+        self.pipeline = pipeline
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # contextvars pertencem à tarefa/thread atual: precisam ser lidos aqui
+        setattr(record, CONTEXT_ATTR, capture_log_context())
+        # A mensagem é resolvida agora porque os args podem ser alterados
+        # depois; o JSON e a sanitização ficam para a thread de escrita
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            if self.pipeline.sampler.allow(record):
+                self.pipeline.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+
+class AsyncFileHandler(PipelineHandler):
+    """Handler assíncrono para arquivos (pipeline próprio, escrita em lotes)"""
+
+    def __init__(self, filename: str, max_bytes: int = 0, backup_count: int = 0):
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._sink = BatchFileSink(filename, max_bytes=max_bytes, backup_count=backup_count)
+        super().__init__(LogPipeline([self._sink]))
+
+    def setFormatter(self, fmt: Optional[logging.Formatter]):
+        super().setFormatter(fmt)
+        self._sink.formatter = fmt or logging.Formatter()
+
     def close(self):
-        """Fechar handler e parar thread"""
-        self.stop_event.set()
-        self.queue.put(None)  # Sentinel
-        if self.thread:
-            self.thread.join(timeout=5)
+        """Escrever o que restou e parar a thread"""
+        self.pipeline.stop()
         super().close()
 
+
 class SamplingHandler(logging.Handler):
-    """Handler que faz sampling de logs (para high-volume events)"""
-    
-    def __init__(self, target_handler: logging.Handler, sample_rate: float = 0.1):
+    """Handler que faz sampling de logs (WARNING+ sempre passa; ver LevelAwareSampler)"""
+
+    def __init__(self, target_handler: logging.Handler, sample_rate: float = 0.1,
+                 rate_limit: float = 0.0, burst: int = 200):
         super().__init__()
         self.target_handler = target_handler
         self.sample_rate = sample_rate
-        self.counter = 0
-        self.lock = threading.Lock()
-    
+        self.sampler = LevelAwareSampler(
+            {logging.DEBUG: sample_rate, logging.INFO: sample_rate}, rate_limit, burst
+        )
+
     def emit(self, record: logging.LogRecord):
         """Emitir apenas uma amostra dos logs"""
-        with self.lock:
-            self.counter += 1
-            
-            # Sempre logar errors e warnings
-            if record.levelno >= logging.WARNING:
-                self.target_handler.emit(record)
-                return
-            
-            # Sampling para outros níveis
-            if (self.counter % int(1 / self.sample_rate)) == 0:
-                # Adicionar informação de sampling
-                record.sampled = True
-                record.sample_rate = self.sample_rate
-                self.target_handler.emit(record)
+        if self.sampler.allow(record):
+            self.target_handler.handle(record)
+
+
+_pipelines: Dict[tuple, LogPipeline] = {}
+_pipelines_lock = threading.Lock()
+
+
+def _build_sinks(config: LogConfig) -> List[Any]:
+    """Destinos do pipeline conforme a configuração (console e/ou arquivo)"""
+    sinks: List[Any] = []
+    if config.output in ['console', 'both']:
+        formatter = TecnoCursosJSONFormatter() if config.format == 'json' else ColoredFormatter()
+        sinks.append(StreamSink(sys.stdout, formatter))
+    if config.output in ['file', 'both']:
+        if config.format == 'json':
+            formatter = TecnoCursosJSONFormatter()
+        else:
+            formatter = logging.Formatter(
+                '%(asctime)s [%(levelname)s] %(name)s:%(funcName)s:%(lineno)d - %(message)s'
+            )
+        sinks.append(BatchFileSink(
+            config.file_path, formatter,
+            max_bytes=config.max_file_size, backup_count=config.backup_count,
+        ))
+    return sinks
+
+
+def get_log_pipeline(config: LogConfig = None) -> LogPipeline:
+    """Pipeline compartilhado (uma fila e uma thread por destino configurado)"""
+    config = config or log_config
+    key = (config.format, config.output, config.file_path)
+    pipeline = _pipelines.get(key)
+    if pipeline is None:
+        with _pipelines_lock:
+            pipeline = _pipelines.get(key)
+            if pipeline is None:
+                level_rates = {logging.DEBUG: config.sample_rate, logging.INFO: config.sample_rate}
+                pipeline = LogPipeline(
+                    _build_sinks(config),
+                    queue_size=config.queue_size,
+                    batch_size=config.batch_size,
+                    flush_interval=config.flush_interval,
+                    fsync_interval=config.fsync_interval,
+                    sampler=LevelAwareSampler(
+                        level_rates, config.rate_limit_per_logger, config.rate_limit_burst
+                    ),
+                )
+                if not _pipelines:
+                    atexit.register(shutdown_log_pipelines)
+                _pipelines[key] = pipeline
+    return pipeline
+
+
+def shutdown_log_pipelines():
+    """Esvaziar e encerrar todos os pipelines (chamado no atexit)"""
+    with _pipelines_lock:
+        pipelines = list(_pipelines.values())
+    for pipeline in pipelines:
+        pipeline.stop()
+
 
 # ============================================================================
 # LOGGER PRINCIPAL
@@ -319,52 +687,8 @@ class TecnoCursosLogger:
         self._setup_external_integrations()
     
     def _setup_handlers(self):
-        """Configurar handlers de logging"""
-        handlers = []
-        
-        # Console handler
-        if self.config.output in ['console', 'both']:
-            console_handler = logging.StreamHandler(sys.stdout)
-            
-            if self.config.format == 'json':
-                console_handler.setFormatter(TecnoCursosJSONFormatter())
-            else:
-                console_handler.setFormatter(ColoredFormatter())
-                
-            handlers.append(console_handler)
-        
-        # File handler
-        if self.config.output in ['file', 'both']:
-            if self.config.format == 'json':
-                file_handler = AsyncFileHandler(
-                    self.config.file_path,
-                    max_bytes=self.config.max_file_size,
-                    backup_count=self.config.backup_count
-                )
-                file_handler.setFormatter(TecnoCursosJSONFormatter())
-            else:
-                file_handler = logging.handlers.RotatingFileHandler(
-                    self.config.file_path,
-                    maxBytes=self.config.max_file_size,
-                    backupCount=self.config.backup_count
-                )
-                file_handler.setFormatter(logging.Formatter(
-                    '%(asctime)s [%(levelname)s] %(name)s:%(funcName)s:%(lineno)d - %(message)s'
-                ))
-            
-            handlers.append(file_handler)
-        
-        # Aplicar sampling se configurado
-        if self.config.sample_rate < 1.0:
-            sampled_handlers = []
-            for handler in handlers:
-                sampled_handler = SamplingHandler(handler, self.config.sample_rate)
-                sampled_handlers.append(sampled_handler)
-            handlers = sampled_handlers
-        
-        # Adicionar handlers ao logger
-        for handler in handlers:
-            self.logger.addHandler(handler)
+        """Conectar o logger ao pipeline compartilhado (fila + thread de escrita)"""
+        self.logger.addHandler(get_log_pipeline(self.config).handler)
     
     def _setup_external_integrations(self):
         """Configurar integrações externas"""
@@ -413,9 +737,10 @@ class TecnoCursosLogger:
         
         # Performance timing se disponível
         if 'duration' in kwargs:
+            duration = kwargs.pop('duration')
             extra['performance'] = {
-                'duration_ms': kwargs.pop('duration') * 1000,
-                'slow_query': kwargs.pop('duration') > 1.0
+                'duration_ms': duration * 1000,
+                'slow_query': duration > 1.0
             }
         
         # Dados de negócio
@@ -494,8 +819,9 @@ class TecnoCursosLogger:
     
     def log_performance(self, operation: str, duration: float, 
                        success: bool = True, **kwargs):
-        """Log de performance"""
+        """Log de performance (também registrado como span no trace corrente)"""
         level = logging.INFO if success else logging.WARNING
+        record_span(operation, duration, category="performance")
         
         self._log(
             level,
@@ -615,7 +941,7 @@ class LogContext:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         for token in self.tokens.values():
-            token.var.set(token.old_value)
+            token.var.reset(token)
 
 # ============================================================================
 # FUNÇÕES UTILITÁRIAS
@@ -644,6 +970,9 @@ def configure_logging(config: LogConfig):
     # Desabilitar logs de bibliotecas externas se necessário
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+    
+    # Pipelines já criados seguem com a configuração antiga; novos loggers
+    # usam um pipeline da configuração nova se o destino mudou
 
 def setup_request_logging(app):
     """Configurar logging de requests para FastAPI"""
@@ -694,8 +1023,11 @@ def setup_request_logging(app):
 
 def get_logging_health() -> Dict[str, Any]:
     """Verificar saúde do sistema de logging"""
+    pipelines = [pipeline.get_stats() for pipeline in list(_pipelines.values())]
+    healthy = all(stats["running"] and not stats["write_errors"] for stats in pipelines)
     return {
-        "status": "healthy",
+        "status": "healthy" if healthy else "degraded",
+        "pipelines": pipelines,
         "config": {
             "level": log_config.level,
             "format": log_config.format,
@@ -0,0 +1,147 @@
+"""
+Relatório de Tempo de Import - TecnoCursos AI
+Análise da saída de `python -X importtime` para acompanhar o custo do startup
+
+O CPython escreve em stderr uma linha por módulo importado:
+    import time: self [us] | cumulative | imported package
+com a indentação do nome indicando a profundidade. Este módulo executa o
+import em um subprocesso limpo (o processo atual já tem tudo em cache),
+agrega os tempos por módulo e por pacote raiz e aponta os mais caros.
+
+Uso:
+    python -m app.core.import_profile [--module app.main] [--top 25] [--json]
+    python -X importtime -c "import app.main" 2> imports.log
+    python -m app.core.import_profile --file imports.log
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass
+class ImportRecord:
+    """Um módulo importado, com tempos em microssegundos"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(lines: Iterable[str]) -> List[ImportRecord]:
+    """Converte a saída de -X importtime em registros (linhas alheias são ignoradas)"""
+    records = []
+    for line in lines:
+        match = _LINE.match(line.rstrip("\n"))
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(ImportRecord(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return records
+
+
+def run_importtime(module: str = "app.main", cwd: Optional[Path] = None,
+                   python: Optional[str] = None, timeout: float = 300) -> Dict[str, Any]:
+    """Importa `module` em um subprocesso com -X importtime e devolve registros e tempo total"""
+    env = dict(os.environ)
+    env.setdefault("PYTHONPATH", str(cwd or BACKEND_DIR))
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(cwd or BACKEND_DIR), env=env, capture_output=True, text=True, timeout=timeout,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    records = parse_importtime(completed.stderr.splitlines())
+    errors = [line for line in completed.stderr.splitlines() if not line.startswith("import time:")]
+    return {
+        "module": module,
+        "returncode": completed.returncode,
+        "wall_ms": round(wall_ms, 1),
+        "records": records,
+        "errors": errors[-20:],
+    }
+
+
+def build_report(records: List[ImportRecord], top: int = 25) -> Dict[str, Any]:
+    """Resumo: total, módulos mais caros (cumulativo) e custo próprio por pacote raiz"""
+    by_package: Dict[str, int] = defaultdict(int)
+    for record in records:
+        by_package[record.module.split(".")[0]] += record.self_us
+
+    total_us = sum(record.self_us for record in records)
+    slowest = sorted(records, key=lambda r: r.cumulative_us, reverse=True)[:top]
+    packages = sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]
+    return {
+        "modules": len(records),
+        "total_ms": round(total_us / 1000, 1),
+        "slowest_modules": [
+            {"module": r.module, "cumulative_ms": round(r.cumulative_us / 1000, 1),
+             "self_ms": round(r.self_us / 1000, 1), "depth": r.depth}
+            for r in slowest
+        ],
+        "packages": [
+            {"package": name, "self_ms": round(us / 1000, 1),
+             "percent": round(us / total_us * 100, 1) if total_us else 0.0}
+            for name, us in packages
+        ],
+    }
+
+
+def profile_imports(module: str = "app.main", top: int = 25) -> Dict[str, Any]:
+    """Executa o import em subprocesso e devolve o relatório"""
+    result = run_importtime(module)
+    report = build_report(result["records"], top=top)
+    report.update(module=module, returncode=result["returncode"], wall_ms=result["wall_ms"],
+                  errors=result["errors"])
+    return report
+
+
+def _print_report(report: Dict[str, Any]):
+    print(f"Import de {report.get('module', '?')}: {report['total_ms']:.1f}ms em {report['modules']} módulos"
+          + (f" (processo: {report['wall_ms']:.0f}ms)" if "wall_ms" in report else ""))
+    print("\nPacotes (tempo próprio):")
+    for item in report["packages"]:
+        print(f"  {item['self_ms']:9.1f}ms  {item['percent']:5.1f}%  {item['package']}")
+    print("\nMódulos mais caros (cumulativo):")
+    for item in report["slowest_modules"]:
+        print(f"  {item['cumulative_ms']:9.1f}ms  {'  ' * item['depth']}{item['module']}")
+    if report.get("returncode"):
+        print(f"\n⚠️ Import terminou com código {report['returncode']}:")
+        for line in report.get("errors", []):
+            print(f"  {line}")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Relatório de tempo de import (-X importtime)")
+    parser.add_argument("--module", default="app.main", help="módulo a importar")
+    parser.add_argument("--file", help="usar a saída de -X importtime já gravada")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--json", action="store_true", help="saída em JSON")
+    args = parser.parse_args(argv)
+
+    if args.file:
+        with open(args.file, encoding="utf-8", errors="replace") as handle:
+            report = build_report(parse_importtime(handle), top=args.top)
+        report["module"] = args.file
+    else:
+        report = profile_imports(args.module, top=args.top)
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        _print_report(report)
+
+
+if __name__ == "__main__":
+    main()
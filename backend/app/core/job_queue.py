@@ -0,0 +1,852 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fila de Jobs Durável - TecnoCursos AI
+
+Trabalho longo (render de vídeo, exportação, narração TTS) sai do processo
+que atendeu a requisição: o job é gravado numa fila durável e executado por
+workers, no próprio servidor ou em outras máquinas (`python -m app.worker`).
+
+Funcionalidades:
+- Backends plugáveis: SQLite (um host, vários processos) e Redis (vários hosts),
+  escolhidos pela URL (`sqlite:///data/jobs.db`, `redis://host:6379/1`)
+- Leases com heartbeat: um job cujo worker morreu volta para a fila quando a
+  lease expira; heartbeat recusado (job cancelado/retomado) interrompe o handler
+- Chaves de idempotência: o mesmo pedido enfileirado duas vezes devolve o job
+  existente
+- Retries com backoff exponencial e jitter; `PermanentJobError` não é repetido
+- Prioridades (maior valor sai primeiro) e concorrência por fila: slots por
+  worker e limite global opcional de jobs em execução
+- Progresso (percentual e etapa) gravado junto com o heartbeat
+
+Uso:
+    from app.core.job_queue import job_task, get_job_queue
+
+    @job_task("video.render", queue="render", max_attempts=2)
+    async def render(ctx):
+        ctx.set_progress(10, "Gerando narração")
+        ...
+        return {"video_path": path}
+
+    job = await get_job_queue().enqueue("video.render", {"project_id": 1},
+                                        idempotency_key="render:1:v3")
+
+Autor: TecnoCursos AI System
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import random
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Estados de um job
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"        # falhou e não será repetido (tentativas esgotadas ou erro permanente)
+CANCELLED = "cancelled"
+FINAL_STATUSES = (SUCCEEDED, FAILED, CANCELLED)
+
+DEFAULT_QUEUE = "default"
+DEFAULT_LEASE_SECONDS = 60.0
+IDEMPOTENCY_TTL_SECONDS = 24 * 3600
+
+
+class JobQueueError(Exception):
+    """Erro da fila de jobs"""
+
+
+class PermanentJobError(Exception):
+    """Erro que não adianta repetir (dados inválidos, recurso inexistente)"""
+
+
+@dataclass
+class Job:
+    """Job persistido na fila"""
+    id: str
+    task: str
+    queue: str = DEFAULT_QUEUE
+    payload: Dict[str, Any] = field(default_factory=dict)
+    priority: int = 0
+    status: str = QUEUED
+    attempts: int = 0
+    max_attempts: int = 3
+    idempotency_key: Optional[str] = None
+    run_at: float = 0.0
+    lease_owner: Optional[str] = None
+    lease_expires_at: Optional[float] = None
+    progress: float = 0.0
+    stage: Optional[str] = None
+    result: Any = None
+    error: Optional[str] = None
+    created_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @property
+    def is_final(self) -> bool:
+        return self.status in FINAL_STATUSES
+
+
+@dataclass
+class TaskSpec:
+    """Handler registrado para um tipo de job"""
+    name: str
+    func: Callable
+    queue: str = DEFAULT_QUEUE
+    priority: int = 0
+    max_attempts: int = 3
+    retry_base: float = 10.0       # segundos antes da 2ª tentativa
+    retry_max: float = 600.0
+
+
+# Registro global de tasks (preenchido por app.jobs e por quem usar @job_task)
+_tasks: Dict[str, TaskSpec] = {}
+
+
+def job_task(name: str, queue: str = DEFAULT_QUEUE, priority: int = 0, max_attempts: int = 3,
+             retry_base: float = 10.0, retry_max: float = 600.0):
+    """Registra `func(ctx)` (sync ou async) como handler do job `name`"""
+    def decorator(func: Callable) -> Callable:
+        _tasks[name] = TaskSpec(name, func, queue, priority, max_attempts, retry_base, retry_max)
+        return func
+    return decorator
+
+
+def get_task(name: str) -> Optional[TaskSpec]:
+    return _tasks.get(name)
+
+
+def _dumps(value: Any) -> Optional[str]:
+    return None if value is None else json.dumps(value, default=str, ensure_ascii=False)
+
+
+def _loads(value: Optional[str]) -> Any:
+    return None if value in (None, "") else json.loads(value)
+
+
+# ============================================================================
+# BACKEND SQLITE
+# ============================================================================
+
+_JOB_COLUMNS = ("id", "task", "queue", "payload", "priority", "status", "attempts", "max_attempts",
+                "idempotency_key", "run_at", "lease_owner", "lease_expires_at", "progress", "stage",
+                "result", "error", "created_at", "started_at", "finished_at")
+
+
+class SQLiteJobBackend:
+    """
+    Fila em SQLite (WAL). Vários processos do mesmo host compartilham o
+    arquivo; o claim é feito numa transação BEGIN IMMEDIATE, então dois
+    workers nunca pegam o mesmo job.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        with self._transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY, task TEXT NOT NULL, queue TEXT NOT NULL,
+                    payload TEXT, priority INTEGER NOT NULL DEFAULT 0,
+                    status TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL DEFAULT 3, idempotency_key TEXT UNIQUE,
+                    run_at REAL NOT NULL, lease_owner TEXT, lease_expires_at REAL,
+                    progress REAL NOT NULL DEFAULT 0, stage TEXT, result TEXT, error TEXT,
+                    created_at REAL NOT NULL, started_at REAL, finished_at REAL
+                )""")
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_jobs_ready "
+                         "ON jobs (queue, status, priority DESC, run_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_jobs_lease "
+                         "ON jobs (queue, status, lease_expires_at)")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Job:
+        data = dict(row)
+        data["payload"] = _loads(data["payload"]) or {}
+        data["result"] = _loads(data["result"])
+        return Job(**data)
+
+    def enqueue(self, job: Job) -> Job:
+        with self._transaction() as conn:
+            if job.idempotency_key:
+                row = conn.execute("SELECT * FROM jobs WHERE idempotency_key = ?",
+                                   (job.idempotency_key,)).fetchone()
+                if row is not None:
+                    if row["created_at"] > time.time() - IDEMPOTENCY_TTL_SECONDS:
+                        return self._row_to_job(row)
+                    conn.execute("UPDATE jobs SET idempotency_key = NULL WHERE id = ?", (row["id"],))
+            values = job.to_dict()
+            values["payload"] = _dumps(job.payload)
+            values["result"] = _dumps(job.result)
+            conn.execute(f"INSERT INTO jobs ({', '.join(_JOB_COLUMNS)}) "
+                         f"VALUES ({', '.join('?' for _ in _JOB_COLUMNS)})",
+                         [values[column] for column in _JOB_COLUMNS])
+        return job
+
+    def claim(self, queue: str, worker_id: str, lease_seconds: float,
+              max_running: Optional[int] = None) -> Optional[Job]:
+        now = time.time()
+        with self._transaction() as conn:
+            self._recover_expired(conn, queue, now)
+            if max_running:
+                running = conn.execute("SELECT COUNT(*) FROM jobs WHERE queue = ? AND status = ?",
+                                       (queue, RUNNING)).fetchone()[0]
+                if running >= max_running:
+                    return None
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE queue = ? AND status = ? AND run_at <= ? "
+                "ORDER BY priority DESC, run_at, created_at LIMIT 1",
+                (queue, QUEUED, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = ?, lease_owner = ?, lease_expires_at = ?, "
+                "attempts = attempts + 1, started_at = ? WHERE id = ?",
+                (RUNNING, worker_id, now + lease_seconds, now, row["id"]),
+            )
+            return self._row_to_job(conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone())
+
+    @staticmethod
+    def _recover_expired(conn: sqlite3.Connection, queue: str, now: float):
+        # Worker morto: lease vencida volta para a fila (ou falha se esgotou tentativas)
+        conn.execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, lease_owner = NULL, "
+            "error = 'lease expirada (worker encerrado?)' "
+            "WHERE queue = ? AND status = ? AND lease_expires_at < ? AND attempts >= max_attempts",
+            (FAILED, now, queue, RUNNING, now),
+        )
+        conn.execute(
+            "UPDATE jobs SET status = ?, lease_owner = NULL, run_at = ? "
+            "WHERE queue = ? AND status = ? AND lease_expires_at < ?",
+            (QUEUED, now, queue, RUNNING, now),
+        )
+
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float,
+                  progress: Optional[float] = None, stage: Optional[str] = None) -> bool:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires_at = ?, progress = COALESCE(?, progress), "
+                "stage = COALESCE(?, stage) WHERE id = ? AND lease_owner = ? AND status = ?",
+                (time.time() + lease_seconds, progress, stage, job_id, worker_id, RUNNING),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: str, worker_id: str, result: Any = None) -> bool:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, progress = 100, finished_at = ?, "
+                "lease_owner = NULL, lease_expires_at = NULL, error = NULL "
+                "WHERE id = ? AND lease_owner = ? AND status = ?",
+                (SUCCEEDED, _dumps(result), time.time(), job_id, worker_id, RUNNING),
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, job_id: str, worker_id: str, error: str, retry_in: Optional[float]) -> Optional[str]:
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute("SELECT attempts, max_attempts FROM jobs WHERE id = ? AND lease_owner = ? "
+                               "AND status = ?", (job_id, worker_id, RUNNING)).fetchone()
+            if row is None:
+                return None
+            if retry_in is not None and row["attempts"] < row["max_attempts"]:
+                conn.execute("UPDATE jobs SET status = ?, run_at = ?, error = ?, lease_owner = NULL, "
+                             "lease_expires_at = NULL WHERE id = ?", (QUEUED, now + retry_in, error, job_id))
+                return QUEUED
+            conn.execute("UPDATE jobs SET status = ?, error = ?, finished_at = ?, lease_owner = NULL, "
+                         "lease_expires_at = NULL WHERE id = ?", (FAILED, error, now, job_id))
+            return FAILED
+
+    def cancel(self, job_id: str) -> bool:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, lease_owner = NULL "
+                "WHERE id = ? AND status IN (?, ?)",
+                (CANCELLED, time.time(), job_id, QUEUED, RUNNING),
+            )
+            return cursor.rowcount == 1
+
+    def get(self, job_id: str) -> Optional[Job]:
+        row = self._connection().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def get_by_key(self, idempotency_key: str) -> Optional[Job]:
+        row = self._connection().execute("SELECT * FROM jobs WHERE idempotency_key = ?",
+                                         (idempotency_key,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def purge(self, older_than: float) -> int:
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM jobs WHERE status IN (?, ?, ?) AND finished_at < ?",
+                                  (*FINAL_STATUSES, time.time() - older_than))
+            return cursor.rowcount
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        result: Dict[str, Dict[str, int]] = {}
+        for row in self._connection().execute(
+                "SELECT queue, status, COUNT(*) AS total FROM jobs GROUP BY queue, status"):
+            result.setdefault(row["queue"], {})[row["status"]] = row["total"]
+        return result
+
+
+# ============================================================================
+# BACKEND REDIS
+# ============================================================================
+
+# Operações que mudam estado e índices juntos rodam como scripts Lua (atômicos)
+_CLAIM_SCRIPT = """
+local prefix, queue = KEYS[1], KEYS[2]
+local now, worker, lease, max_running = tonumber(ARGV[1]), ARGV[2], tonumber(ARGV[3]), tonumber(ARGV[4])
+local ready, delayed, running = prefix..':ready:'..queue, prefix..':delayed:'..queue, prefix..':running:'..queue
+
+for _, id in ipairs(redis.call('ZRANGEBYSCORE', delayed, '-inf', now)) do
+  local key = prefix..':job:'..id
+  redis.call('ZREM', delayed, id)
+  redis.call('ZADD', ready, -tonumber(redis.call('HGET', key, 'priority')) * 1e13 + now * 1000, id)
+end
+for _, id in ipairs(redis.call('ZRANGEBYSCORE', running, '-inf', now)) do
+  local key = prefix..':job:'..id
+  redis.call('ZREM', running, id)
+  if tonumber(redis.call('HGET', key, 'attempts')) >= tonumber(redis.call('HGET', key, 'max_attempts')) then
+    redis.call('HSET', key, 'status', 'failed', 'finished_at', now, 'lease_owner', '',
+               'error', 'lease expirada (worker encerrado?)')
+  else
+    redis.call('HSET', key, 'status', 'queued', 'lease_owner', '', 'run_at', now)
+    redis.call('ZADD', ready, -tonumber(redis.call('HGET', key, 'priority')) * 1e13 + now * 1000, id)
+  end
+end
+if max_running > 0 and redis.call('ZCARD', running) >= max_running then
+  return false
+end
+local ids = redis.call('ZRANGE', ready, 0, 0)
+if #ids == 0 then
+  return false
+end
+local id = ids[1]
+local key = prefix..':job:'..id
+redis.call('ZREM', ready, id)
+redis.call('HINCRBY', key, 'attempts', 1)
+redis.call('HSET', key, 'status', 'running', 'lease_owner', worker, 'lease_expires_at', now + lease,
+           'started_at', now)
+redis.call('ZADD', running, now + lease, id)
+return id
+"""
+
+_HEARTBEAT_SCRIPT = """
+local key, running = KEYS[1], KEYS[2]
+if redis.call('HGET', key, 'status') ~= 'running' or redis.call('HGET', key, 'lease_owner') ~= ARGV[1] then
+  return 0
+end
+redis.call('HSET', key, 'lease_expires_at', ARGV[2])
+if ARGV[3] ~= '' then redis.call('HSET', key, 'progress', ARGV[3]) end
+if ARGV[4] ~= '' then redis.call('HSET', key, 'stage', ARGV[4]) end
+redis.call('ZADD', running, ARGV[2], ARGV[5])
+return 1
+"""
+
+_FINISH_SCRIPT = """
+local key, running, delayed = KEYS[1], KEYS[2], KEYS[3]
+local worker, outcome, now, id = ARGV[1], ARGV[2], tonumber(ARGV[3]), ARGV[4]
+if redis.call('HGET', key, 'status') ~= 'running' or redis.call('HGET', key, 'lease_owner') ~= worker then
+  return false
+end
+redis.call('ZREM', running, id)
+if outcome == 'succeeded' then
+  redis.call('HSET', key, 'status', 'succeeded', 'result', ARGV[5], 'progress', 100, 'finished_at', now,
+             'lease_owner', '', 'error', '')
+  redis.call('EXPIRE', key, tonumber(ARGV[6]))
+  return 'succeeded'
+end
+local retry_at = tonumber(ARGV[6])
+if retry_at >= 0 and tonumber(redis.call('HGET', key, 'attempts')) < tonumber(redis.call('HGET', key, 'max_attempts')) then
+  redis.call('HSET', key, 'status', 'queued', 'error', ARGV[5], 'run_at', retry_at, 'lease_owner', '')
+  redis.call('ZADD', delayed, retry_at, id)
+  return 'queued'
+end
+redis.call('HSET', key, 'status', 'failed', 'error', ARGV[5], 'finished_at', now, 'lease_owner', '')
+redis.call('EXPIRE', key, tonumber(ARGV[7]))
+return 'failed'
+"""
+
+_CANCEL_SCRIPT = """
+local prefix, id = KEYS[1], ARGV[1]
+local key = prefix..':job:'..id
+local status = redis.call('HGET', key, 'status')
+if status ~= 'queued' and status ~= 'running' then
+  return 0
+end
+local queue = redis.call('HGET', key, 'queue')
+redis.call('ZREM', prefix..':ready:'..queue, id)
+redis.call('ZREM', prefix..':delayed:'..queue, id)
+redis.call('ZREM', prefix..':running:'..queue, id)
+redis.call('HSET', key, 'status', 'cancelled', 'finished_at', ARGV[2], 'lease_owner', '')
+redis.call('EXPIRE', key, tonumber(ARGV[3]))
+return 1
+"""
+
+
+class RedisJobBackend:
+    """
+    Fila em Redis para workers em vários hosts. Cada job é um hash; por fila
+    há sorted sets de prontos (prioridade, ordem de chegada), agendados
+    (retry/delay) e em execução (pontuados pelo vencimento da lease).
+    """
+
+    def __init__(self, url: str, prefix: str = "tc:jobs", result_ttl: float = 7 * 24 * 3600):
+        if not REDIS_AVAILABLE:
+            raise JobQueueError("Pacote redis não instalado")
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+        self.result_ttl = int(result_ttl)
+        self._claim = self.client.register_script(_CLAIM_SCRIPT)
+        self._heartbeat = self.client.register_script(_HEARTBEAT_SCRIPT)
+        self._finish = self.client.register_script(_FINISH_SCRIPT)
+        self._cancel = self.client.register_script(_CANCEL_SCRIPT)
+
+    def _key(self, *parts: str) -> str:
+        return ":".join((self.prefix,) + parts)
+
+    @staticmethod
+    def _encode(job: Job) -> Dict[str, Any]:
+        data = job.to_dict()
+        data["payload"] = _dumps(job.payload)
+        data["result"] = _dumps(job.result)
+        return {key: "" if value is None else value for key, value in data.items()}
+
+    @staticmethod
+    def _decode(data: Dict[str, str]) -> Job:
+        values: Dict[str, Any] = {key: (None if value == "" else value) for key, value in data.items()}
+        for key in ("priority", "attempts", "max_attempts"):
+            values[key] = int(float(values[key] or 0))
+        for key in ("run_at", "progress", "created_at"):
+            values[key] = float(values[key] or 0)
+        for key in ("lease_expires_at", "started_at", "finished_at"):
+            values[key] = float(values[key]) if values[key] is not None else None
+        values["payload"] = _loads(values["payload"]) or {}
+        values["result"] = _loads(values["result"])
+        return Job(**{key: values.get(key) for key in _JOB_COLUMNS})
+
+    def enqueue(self, job: Job) -> Job:
+        if job.idempotency_key:
+            idem_key = self._key("idem", job.idempotency_key)
+            if not self.client.set(idem_key, job.id, nx=True, ex=IDEMPOTENCY_TTL_SECONDS):
+                existing = self.get(self.client.get(idem_key) or "")
+                if existing is not None:
+                    return existing
+                self.client.set(idem_key, job.id, ex=IDEMPOTENCY_TTL_SECONDS)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.hset(self._key("job", job.id), mapping=self._encode(job))
+        if job.run_at > time.time():
+            pipe.zadd(self._key("delayed", job.queue), {job.id: job.run_at})
+        else:
+            pipe.zadd(self._key("ready", job.queue), {job.id: -job.priority * 1e13 + job.run_at * 1000})
+        pipe.sadd(self._key("queues"), job.queue)
+        pipe.execute()
+        return job
+
+    def claim(self, queue: str, worker_id: str, lease_seconds: float,
+              max_running: Optional[int] = None) -> Optional[Job]:
+        job_id = self._claim(keys=[self.prefix, queue],
+                             args=[time.time(), worker_id, lease_seconds, max_running or 0])
+        return self.get(job_id) if job_id else None
+
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float,
+                  progress: Optional[float] = None, stage: Optional[str] = None) -> bool:
+        queue = self.client.hget(self._key("job", job_id), "queue")
+        if queue is None:
+            return False
+        return bool(self._heartbeat(
+            keys=[self._key("job", job_id), self._key("running", queue)],
+            args=[worker_id, time.time() + lease_seconds,
+                  "" if progress is None else progress, stage or "", job_id],
+        ))
+
+    def _finish_job(self, job_id: str, worker_id: str, outcome: str, *args) -> Optional[str]:
+        queue = self.client.hget(self._key("job", job_id), "queue")
+        if queue is None:
+            return None
+        return self._finish(
+            keys=[self._key("job", job_id), self._key("running", queue), self._key("delayed", queue)],
+            args=[worker_id, outcome, time.time(), job_id, *args],
+        )
+
+    def complete(self, job_id: str, worker_id: str, result: Any = None) -> bool:
+        return self._finish_job(job_id, worker_id, SUCCEEDED, _dumps(result) or "",
+                                self.result_ttl) == SUCCEEDED
+
+    def fail(self, job_id: str, worker_id: str, error: str, retry_in: Optional[float]) -> Optional[str]:
+        retry_at = time.time() + retry_in if retry_in is not None else -1
+        return self._finish_job(job_id, worker_id, FAILED, error, retry_at, self.result_ttl)
+
+    def cancel(self, job_id: str) -> bool:
+        return bool(self._cancel(keys=[self.prefix], args=[job_id, time.time(), self.result_ttl]))
+
+    def get(self, job_id: str) -> Optional[Job]:
+        data = self.client.hgetall(self._key("job", job_id)) if job_id else None
+        return self._decode(data) if data else None
+
+    def get_by_key(self, idempotency_key: str) -> Optional[Job]:
+        job_id = self.client.get(self._key("idem", idempotency_key))
+        return self.get(job_id) if job_id else None
+
+    def purge(self, older_than: float) -> int:
+        return 0  # jobs finalizados expiram sozinhos (result_ttl)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        result = {}
+        for queue in sorted(self.client.smembers(self._key("queues"))):
+            result[queue] = {
+                QUEUED: self.client.zcard(self._key("ready", queue)),
+                "delayed": self.client.zcard(self._key("delayed", queue)),
+                RUNNING: self.client.zcard(self._key("running", queue)),
+            }
+        return result
+
+
+def create_backend(url: str):
+    """Cria o backend a partir da URL (redis://, rediss://, sqlite:///caminho)"""
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisJobBackend(url)
+    if url.startswith("sqlite:///"):
+        return SQLiteJobBackend(url[len("sqlite:///"):])
+    if "://" in url:
+        raise JobQueueError(f"URL de fila não suportada: {url}")
+    return SQLiteJobBackend(url)
+
+
+# ============================================================================
+# FILA E WORKER
+# ============================================================================
+
+class JobQueue:
+    """Interface assíncrona sobre o backend (chamadas de I/O rodam em thread)"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self._listeners: List[Callable[[str], None]] = []
+
+    async def enqueue(self, task: str, payload: Optional[Dict[str, Any]] = None, *,
+                      queue: Optional[str] = None, priority: Optional[int] = None,
+                      idempotency_key: Optional[str] = None, max_attempts: Optional[int] = None,
+                      delay: float = 0.0) -> Job:
+        """
+        Enfileira o job `task`. Com `idempotency_key`, um segundo enqueue com a
+        mesma chave (em até 24h) devolve o job já existente.
+        """
+        spec = get_task(task)
+        now = time.time()
+        job = Job(
+            id=uuid.uuid4().hex,
+            task=task,
+            queue=queue or (spec.queue if spec else DEFAULT_QUEUE),
+            payload=payload or {},
+            priority=priority if priority is not None else (spec.priority if spec else 0),
+            max_attempts=max_attempts or (spec.max_attempts if spec else 3),
+            idempotency_key=idempotency_key,
+            run_at=now + max(0.0, delay),
+            created_at=now,
+        )
+        stored = await asyncio.to_thread(self.backend.enqueue, job)
+        if stored.id == job.id:
+            logger.info(f"📥 Job {job.id} ({task}) enfileirado em '{job.queue}'")
+            for listener in self._listeners:
+                listener(job.queue)
+        return stored
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        return await asyncio.to_thread(self.backend.get, job_id)
+
+    async def get_by_key(self, idempotency_key: str) -> Optional[Job]:
+        return await asyncio.to_thread(self.backend.get_by_key, idempotency_key)
+
+    async def cancel(self, job_id: str) -> bool:
+        return await asyncio.to_thread(self.backend.cancel, job_id)
+
+    async def purge(self, older_than: float = 7 * 24 * 3600) -> int:
+        return await asyncio.to_thread(self.backend.purge, older_than)
+
+    async def stats(self) -> Dict[str, Dict[str, int]]:
+        return await asyncio.to_thread(self.backend.stats)
+
+    def add_listener(self, callback: Callable[[str], None]):
+        """Avisado a cada job novo enfileirado neste processo (acorda workers embutidos)"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str], None]):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+
+class JobContext:
+    """Passado ao handler: payload, tentativa atual e registro de progresso"""
+
+    def __init__(self, job: Job, worker_id: str):
+        self.job = job
+        self.worker_id = worker_id
+        self.progress: Optional[float] = None
+        self.stage: Optional[str] = None
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        return self.job.payload
+
+    @property
+    def attempt(self) -> int:
+        return self.job.attempts
+
+    def set_progress(self, progress: float, stage: Optional[str] = None):
+        """Registra o progresso; é gravado no próximo heartbeat"""
+        self.progress = float(progress)
+        if stage is not None:
+            self.stage = stage
+
+
+def parse_concurrency(spec: str) -> Dict[str, int]:
+    """'render=1,tts=4' -> {'render': 1, 'tts': 4}"""
+    result = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, slots = item.partition("=")
+        result[name.strip()] = int(slots or 1)
+    return result
+
+
+class Worker:
+    """
+    Executa jobs das filas configuradas. `concurrency` dá os slots por fila
+    neste processo; `max_running` limita jobs simultâneos da fila em todos
+    os workers (ex.: licenças ou GPUs compartilhadas).
+    """
+
+    def __init__(self, queue: JobQueue, concurrency: Dict[str, int], *,
+                 worker_id: Optional[str] = None, lease_seconds: float = DEFAULT_LEASE_SECONDS,
+                 max_running: Optional[Dict[str, int]] = None, poll_interval: float = 1.0,
+                 max_poll_interval: float = 5.0):
+        self.queue = queue
+        self.concurrency = {name: max(1, slots) for name, slots in concurrency.items()}
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.lease_seconds = lease_seconds
+        self.max_running = max_running or {}
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self._fetchers: List[asyncio.Task] = []
+        self._active: Dict[str, asyncio.Task] = {}
+        self._wakeups: Dict[str, asyncio.Event] = {}
+        self._stopping = False
+        self.processed = 0
+        self.failed = 0
+
+    async def start(self):
+        if self._fetchers:
+            return
+        self._stopping = False
+        loop = asyncio.get_running_loop()
+        for name, slots in self.concurrency.items():
+            self._wakeups[name] = asyncio.Event()
+            self._fetchers.append(loop.create_task(self._fetch_loop(name, slots), name=f"jobs:{name}"))
+        self.queue.add_listener(self._on_enqueue)
+        logger.info(f"👷 Worker {self.worker_id} iniciado: {self.concurrency}")
+
+    async def stop(self, timeout: float = 30.0):
+        """Para de buscar jobs e aguarda os em execução (depois cancela)"""
+        self._stopping = True
+        self.queue.remove_listener(self._on_enqueue)
+        for task in self._fetchers:
+            task.cancel()
+        await asyncio.gather(*self._fetchers, return_exceptions=True)
+        self._fetchers.clear()
+        if self._active:
+            done, pending = await asyncio.wait(list(self._active.values()), timeout=timeout)
+            for task in pending:
+                task.cancel()  # lease expira e outro worker retoma o job
+            await asyncio.gather(*pending, return_exceptions=True)
+        logger.info(f"👷 Worker {self.worker_id} parado")
+
+    async def run_forever(self):
+        await self.start()
+        try:
+            await asyncio.gather(*self._fetchers)
+        except asyncio.CancelledError:
+            pass
+
+    def _on_enqueue(self, queue_name: str):
+        event = self._wakeups.get(queue_name)
+        if event is not None:
+            event.set()
+
+    async def _fetch_loop(self, queue_name: str, slots: int):
+        semaphore = asyncio.Semaphore(slots)
+        idle = self.poll_interval
+        wakeup = self._wakeups[queue_name]
+        while not self._stopping:
+            await semaphore.acquire()
+            try:
+                job = await asyncio.to_thread(self.queue.backend.claim, queue_name, self.worker_id,
+                                              self.lease_seconds, self.max_running.get(queue_name))
+            except Exception as e:
+                logger.error(f"Erro ao buscar job da fila '{queue_name}': {e}")
+                job = None
+            if job is None:
+                semaphore.release()
+                wakeup.clear()
+                try:
+                    await asyncio.wait_for(wakeup.wait(), idle)
+                    idle = self.poll_interval
+                except asyncio.TimeoutError:
+                    idle = min(idle * 2, self.max_poll_interval)
+                continue
+            idle = self.poll_interval
+            task = asyncio.create_task(self._execute(job), name=f"job:{job.id}")
+            self._active[job.id] = task
+
+            def release(_, job_id=job.id):
+                self._active.pop(job_id, None)
+                semaphore.release()
+
+            task.add_done_callback(release)
+
+    async def _execute(self, job: Job):
+        spec = get_task(job.task)
+        ctx = JobContext(job, self.worker_id)
+        backend = self.queue.backend
+        started = time.perf_counter()
+        if spec is None:
+            await asyncio.to_thread(backend.fail, job.id, self.worker_id,
+                                    f"task não registrada: {job.task}", None)
+            self.failed += 1
+            return
+
+        handler = asyncio.create_task(self._call(spec, ctx))
+        lease_lost = False
+        try:
+            while not handler.done():
+                done, _ = await asyncio.wait({handler}, timeout=self.lease_seconds / 3)
+                if done:
+                    break
+                alive = await asyncio.to_thread(backend.heartbeat, job.id, self.worker_id,
+                                                self.lease_seconds, ctx.progress, ctx.stage)
+                if not alive:
+                    lease_lost = True
+                    handler.cancel()
+                    logger.warning(f"Job {job.id} cancelado ou retomado por outro worker; interrompendo")
+            result = await handler
+        except asyncio.CancelledError:
+            handler.cancel()
+            if not lease_lost:
+                raise
+            return
+        except Exception as e:
+            permanent = isinstance(e, PermanentJobError)
+            retry_in = None if permanent else min(spec.retry_base * 2 ** (job.attempts - 1), spec.retry_max) \
+                * random.uniform(0.8, 1.2)
+            outcome = await asyncio.to_thread(backend.fail, job.id, self.worker_id,
+                                              f"{type(e).__name__}: {e}", retry_in)
+            self.failed += 1
+            logger.error(f"❌ Job {job.id} ({job.task}) falhou na tentativa {job.attempts}/{job.max_attempts}: "
+                         f"{e} -> {outcome}")
+            return
+        await asyncio.to_thread(backend.complete, job.id, self.worker_id, result)
+        self.processed += 1
+        logger.info(f"✅ Job {job.id} ({job.task}) concluído em {time.perf_counter() - started:.1f}s")
+
+    @staticmethod
+    async def _call(spec: TaskSpec, ctx: JobContext):
+        if inspect.iscoroutinefunction(spec.func):
+            return await spec.func(ctx)
+        # Handlers síncronos (render, CPU) não travam o event loop do worker
+        return await asyncio.to_thread(spec.func, ctx)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "worker_id": self.worker_id,
+            "concurrency": self.concurrency,
+            "active_jobs": sorted(self._active),
+            "processed": self.processed,
+            "failed": self.failed,
+        }
+
+
+# Instâncias globais
+_job_queue: Optional[JobQueue] = None
+_embedded_worker: Optional[Worker] = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Obtém a fila global (backend definido por settings.job_queue_url)"""
+    global _job_queue
+    if _job_queue is None:
+        with _job_queue_lock:
+            if _job_queue is None:
+                from app.config import get_settings
+                _job_queue = JobQueue(create_backend(get_settings().job_queue_url))
+                import app.jobs  # noqa: F401  registra os handlers e as filas padrão
+    return _job_queue
+
+
+async def start_embedded_worker() -> Optional[Worker]:
+    """Worker dentro do servidor da API (instalação de um nó só)"""
+    global _embedded_worker
+    from app.config import get_settings
+    settings = get_settings()
+    if not settings.job_queue_embedded_worker or _embedded_worker is not None:
+        return _embedded_worker
+    _embedded_worker = Worker(get_job_queue(), parse_concurrency(settings.job_queue_concurrency),
+                              lease_seconds=settings.job_queue_lease_seconds)
+    await _embedded_worker.start()
+    return _embedded_worker
+
+
+async def stop_embedded_worker():
+    global _embedded_worker
+    if _embedded_worker is not None:
+        await _embedded_worker.stop()
+        _embedded_worker = None
+
+
+def get_embedded_worker() -> Optional[Worker]:
+    return _embedded_worker
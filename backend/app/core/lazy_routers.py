@@ -0,0 +1,206 @@
+"""
+Montagem Preguiçosa de Routers - TecnoCursos AI
+Routers registrados por prefixo e importados no primeiro request que os usa
+
+Importar todos os routers no startup carrega junto as pilhas de mídia e ML
+(PyMuPDF, PIL, MoviePy, torch) mesmo em processos que só atendem auth ou
+estatísticas. Aqui cada router é declarado como (módulo, atributo, prefixo);
+o LazyRouterMiddleware importa o módulo (em thread, sem bloquear o event loop)
+quando chega o primeiro request ao prefixo e inclui o router na aplicação.
+Requisições à documentação (/openapi.json) carregam todos os pendentes.
+"""
+
+import asyncio
+import importlib
+import importlib.util
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LazyRouterSpec:
+    """Router a ser montado sob demanda"""
+    name: str
+    module: str
+    attr: Optional[str] = "router"        # None: o próprio atributo é o router
+    prefix: str = ""
+    tags: Sequence[str] = ()
+    match: Sequence[str] = ()             # prefixos de URL que disparam o carregamento
+    on_mount: Optional[Callable[[], Awaitable[Any]]] = None  # inicialização do serviço do router
+    router: Any = None
+    state: str = "pending"                # pending | loaded | mounted | unavailable
+    error: Optional[str] = None
+    load_ms: float = 0.0
+    initialized: bool = False
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def match_prefixes(self) -> Tuple[str, ...]:
+        return tuple(self.match) or (self.prefix or "/",)
+
+    def matches(self, path: str) -> bool:
+        for prefix in self.match_prefixes:
+            prefix = prefix.rstrip("/")
+            if not prefix or path == prefix or path.startswith(prefix + "/"):
+                return True
+        return False
+
+    def resolve(self) -> Any:
+        """Importa o módulo e obtém o router (thread-safe, uma única vez)"""
+        with self._lock:
+            if self.state != "pending":
+                return self.router
+            started = time.perf_counter()
+            try:
+                module = importlib.import_module(self.module)
+                router = getattr(module, self.attr) if self.attr else module
+                if router is None:
+                    raise ImportError(f"{self.module}.{self.attr} é None")
+                self.router = router
+                self.state = "loaded"
+            except Exception as e:
+                self.state = "unavailable"
+                self.error = str(e)
+                logger.warning(f"⚠️ Router {self.name} não disponível: {e}")
+            self.load_ms = (time.perf_counter() - started) * 1000
+            return self.router
+
+
+class LazyRouterRegistry:
+    """Registro dos routers da aplicação e de seu estado de carregamento"""
+
+    def __init__(self, app=None):
+        self.app = app
+        self.specs: Dict[str, LazyRouterSpec] = {}
+
+    def register(self, name: str, module: str, attr: Optional[str] = "router", prefix: str = "",
+                 tags: Sequence[str] = (), match: Sequence[str] = (),
+                 on_mount: Optional[Callable[[], Awaitable[Any]]] = None) -> LazyRouterSpec:
+        spec = LazyRouterSpec(name=name, module=module, attr=attr, prefix=prefix,
+                              tags=list(tags), match=tuple(match), on_mount=on_mount)
+        self.specs[name] = spec
+        return spec
+
+    def pending(self, path: Optional[str] = None) -> List[LazyRouterSpec]:
+        """Specs ainda não montados (opcionalmente só os que atendem o path)"""
+        return [
+            spec for spec in self.specs.values()
+            if spec.state in ("pending", "loaded") and (path is None or spec.matches(path))
+        ]
+
+    def _mount(self, spec: LazyRouterSpec):
+        """Inclui o router na aplicação; chamado no event loop (ou no import)"""
+        if spec.state != "loaded":
+            return
+        try:
+            self.app.include_router(spec.router, prefix=spec.prefix, tags=list(spec.tags))
+            spec.state = "mounted"
+            # Rotas novas: o schema OpenAPI precisa ser regenerado
+            self.app.openapi_schema = None
+            logger.info(f"✅ Router {spec.name} montado em {spec.prefix or '/'} ({spec.load_ms:.0f}ms)")
+        except Exception as e:
+            spec.state = "unavailable"
+            spec.error = str(e)
+            logger.error(f"❌ Erro ao incluir router {spec.name}: {e}")
+
+    def load_now(self, names: Optional[Sequence[str]] = None):
+        """Importa e monta imediatamente (modo não preguiçoso)"""
+        for spec in self.pending():
+            if names is None or spec.name in names:
+                spec.resolve()
+                self._mount(spec)
+
+    async def ensure_loaded(self, specs: Sequence[LazyRouterSpec]):
+        """Importa em thread e monta no event loop"""
+        for spec in specs:
+            if spec.state == "pending":
+                await asyncio.to_thread(spec.resolve)
+            self._mount(spec)
+        await self.initialize_mounted()
+
+    async def initialize_mounted(self):
+        """Executa (uma vez) o on_mount dos routers já montados"""
+        for spec in self.specs.values():
+            if spec.state != "mounted" or spec.initialized or spec.on_mount is None:
+                continue
+            spec.initialized = True
+            try:
+                await spec.on_mount()
+            except Exception as e:
+                logger.warning(f"⚠️ Erro ao inicializar serviço do router {spec.name}: {e}")
+
+    async def warmup(self):
+        """Carrega em background todos os routers ainda pendentes"""
+        await self.ensure_loaded(self.pending())
+
+    def status(self, *names: str) -> str:
+        """
+        Estado agregado dos routers: "available" se algum já foi importado,
+        "pending" se algum ainda não foi importado mas o módulo existe
+        (verificado com find_spec, sem executá-lo) e "unavailable" caso contrário.
+        Um pendente só prova que o módulo existe, não que importa sem erros.
+        """
+        pending = False
+        for name in names:
+            spec = self.specs.get(name)
+            if spec is None or spec.state == "unavailable":
+                continue
+            if spec.state in ("loaded", "mounted"):
+                return "available"
+            if not pending:
+                try:
+                    pending = importlib.util.find_spec(spec.module) is not None
+                except (ImportError, ValueError):
+                    continue
+        return "pending" if pending else "unavailable"
+
+    def available(self, *names: str) -> bool:
+        """True se algum dos routers já foi importado com sucesso"""
+        return self.status(*names) == "available"
+
+    def get_status(self) -> Dict[str, Any]:
+        routers = {
+            name: {
+                "module": spec.module,
+                "prefix": spec.prefix,
+                "state": spec.state,
+                "load_ms": round(spec.load_ms, 1),
+                **({"error": spec.error} if spec.error else {}),
+            }
+            for name, spec in self.specs.items()
+        }
+        return {
+            "total": len(routers),
+            "mounted": sum(1 for r in routers.values() if r["state"] == "mounted"),
+            "pending": sum(1 for r in routers.values() if r["state"] in ("pending", "loaded")),
+            "routers": routers,
+        }
+
+
+class LazyRouterMiddleware:
+    """
+    Middleware ASGI: antes de rotear, monta os routers pendentes do prefixo
+    requisitado. Depois que todos estão montados, o custo por request é uma
+    varredura dos specs em memória.
+    """
+
+    def __init__(self, app, registry: LazyRouterRegistry, load_all_paths: Sequence[str] = ("/openapi.json",)):
+        self.app = app
+        self.registry = registry
+        self.load_all_paths = set(load_all_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket"):
+            path = scope.get("path", "")
+            if path in self.load_all_paths:
+                specs = self.registry.pending()
+            else:
+                specs = self.registry.pending(path)
+            if specs:
+                await self.registry.ensure_loaded(specs)
+        await self.app(scope, receive, send)
@@ -0,0 +1,184 @@
+"""
+Paginação por Cursor (Keyset) - TecnoCursos AI
+Helpers para paginar consultas SQLAlchemy sem OFFSET
+"""
+
+import base64
+import json
+from datetime import datetime
+import logging
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import String, and_, false, func, inspect, literal_column, or_, select, text, type_coerce
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidCursorError(ValueError):
+    """Cursor de paginação malformado ou incompatível com a ordenação"""
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Codifica os valores da última linha de uma página em um cursor opaco.
+
+    Datetimes são serializados em ISO 8601 e marcados para reconversão.
+    """
+    payload = [
+        {"dt": value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, expected_length: Optional[int] = None) -> List[Any]:
+    """Decodifica um cursor gerado por `encode_cursor`."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Cursor inválido: {e}") from e
+
+    if not isinstance(payload, list) or (expected_length and len(payload) != expected_length):
+        raise InvalidCursorError("Cursor incompatível com a ordenação solicitada")
+
+    return [
+        datetime.fromisoformat(value["dt"]) if isinstance(value, dict) and "dt" in value else value
+        for value in payload
+    ]
+
+
+def keyset_condition(columns: Sequence[Any], values: Sequence[Any], descending: bool = False):
+    """
+    Monta a condição "linha depois do cursor" para uma ordenação composta.
+
+    Para colunas (a, b) ascendentes gera `a > :a OR (a = :a AND b > :b)`,
+    que os bancos resolvem com um range scan no índice composto.
+    NULL ordena antes de qualquer valor (como SQLite e MySQL; no PostgreSQL
+    `apply_keyset_pagination` pede NULLS FIRST/LAST explicitamente), e
+    valores nulos no cursor viram comparações `IS NULL`/`IS NOT NULL`.
+    """
+    clauses = []
+    for position, (column, value) in enumerate(zip(columns, values)):
+        step = _keyset_step(column, value, descending)
+        if step is None:
+            continue
+        equals = [_keyset_equals(c, v) for c, v in zip(columns[:position], values[:position])]
+        clauses.append(and_(*equals, step) if equals else step)
+    return or_(*clauses) if clauses else false()
+
+
+def _nullable(column) -> bool:
+    return getattr(column, "nullable", True) is not False
+
+
+def _keyset_equals(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def _keyset_step(column, value, descending: bool):
+    """Linhas estritamente depois de `value` nesta coluna (None se não houver)"""
+    if value is None:
+        # NULL é o menor valor: ascendente segue para os não nulos, descendente termina
+        return None if descending else column.isnot(None)
+    if descending:
+        return or_(column < value, column.is_(None)) if _nullable(column) else column < value
+    return column > value
+
+
+def _order_by(column, descending: bool, dialect_name: Optional[str]):
+    ordered = column.desc() if descending else column.asc()
+    if dialect_name == "postgresql" and _nullable(column):
+        return ordered.nulls_last() if descending else ordered.nulls_first()
+    return ordered
+
+
+def apply_keyset_pagination(query, columns: Sequence[Any], cursor: Optional[str],
+                            size: int, descending: bool = False):
+    """
+    Aplica ordenação, condição de cursor e limite a uma `Query`.
+
+    Busca `size + 1` linhas para saber se existe próxima página sem COUNT.
+    Use `build_keyset_page` no resultado para obter itens e próximo cursor.
+    """
+    bind = query.session.get_bind() if query.session is not None else None
+    dialect_name = bind.dialect.name if bind is not None else None
+    if cursor:
+        values = decode_cursor(cursor, expected_length=len(columns))
+        if dialect_name == "sqlite":
+            compare_columns, values = _sqlite_datetime_keys(columns, values)
+        else:
+            compare_columns = columns
+        query = query.filter(keyset_condition(compare_columns, values, descending))
+
+    query = query.order_by(*[_order_by(c, descending, dialect_name) for c in columns])
+    return query.limit(size + 1)
+
+
+def _sqlite_datetime_keys(columns: Sequence[Any], values: Sequence[Any]):
+    """
+    No SQLite datas são texto; `CURRENT_TIMESTAMP` grava sem microssegundos
+    e o bind do SQLAlchemy sempre inclui `.000000`, quebrando `=`/`<`.
+    Compara essas colunas como texto no mesmo formato do armazenamento.
+    """
+    compare_columns, compare_values = [], []
+    for column, value in zip(columns, values):
+        if isinstance(value, datetime):
+            text_value = value.strftime("%Y-%m-%d %H:%M:%S")
+            if value.microsecond:
+                text_value += f".{value.microsecond:06d}"
+            compare_columns.append(type_coerce(column, String))
+            compare_values.append(text_value)
+        else:
+            compare_columns.append(column)
+            compare_values.append(value)
+    return compare_columns, compare_values
+
+
+def build_keyset_page(rows: List[Any], attributes: Sequence[str], size: int):
+    """
+    Separa a linha excedente buscada por `apply_keyset_pagination`.
+
+    Returns:
+        tuple: (itens da página, próximo cursor ou None)
+    """
+    has_next = len(rows) > size
+    items = rows[:size]
+    next_cursor = None
+    if has_next and items:
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, attr) for attr in attributes])
+    return items, next_cursor
+
+
+def estimate_count(query, cap: int = 10000) -> Tuple[int, bool]:
+    """
+    Contagem barata para listagens grandes.
+
+    - PostgreSQL: estimativa do planner (`EXPLAIN`), sem varrer as linhas
+    - Demais bancos: `COUNT` limitado a `cap` linhas (exato abaixo do limite)
+
+    Returns:
+        tuple: (total, se o valor é exato)
+    """
+    session = query.session
+    base = query.order_by(None)
+    bind = session.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        try:
+            compiled = base.statement.compile(
+                dialect=bind.dialect, compile_kwargs={"literal_binds": True}
+            )
+            plan = session.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar()
+            return int(plan[0]["Plan"]["Plan Rows"]), False
+        except Exception as e:
+            logger.debug(f"Estimativa via EXPLAIN indisponível: {e}")
+
+    # Apenas a chave primária: mantém o FROM sem materializar colunas pesadas
+    entity = query.column_descriptions[0].get("entity")
+    key_columns = inspect(entity).primary_key if entity is not None else [literal_column("1")]
+    limited = base.with_entities(*key_columns).limit(cap + 1).subquery()
+    total = session.execute(select(func.count()).select_from(limited)).scalar() or 0
+    return min(total, cap), total <= cap
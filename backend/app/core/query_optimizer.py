@@ -5,7 +5,10 @@ Classes e funções para otimizar consultas do banco de dados
 
 from typing import List, Optional, Dict, Any, Type, Union
 from sqlalchemy.orm import Session, selectinload, joinedload, contains_eager
-from sqlalchemy import select, func, and_, or_, case
+from sqlalchemy import (
+    select, func, and_, or_, case, literal, null, type_coerce, union_all,
+    Integer, String, DateTime
+)
 from sqlalchemy.sql import Select
 from dataclasses import dataclass
 
@@ -21,6 +24,19 @@ class QueryOptions:
     select_fields: List[str] = None
     join_tables: List[str] = None
 
+def _null(type_):
+    """NULL tipado, para colunas uniformes em UNION ALL"""
+    return type_coerce(null(), type_)
+
+def _project_aggregate(model, project_ids, *aggregates):
+    """Subconsulta agregada por projeto (GROUP BY project_id) restrita a project_ids"""
+    return (
+        select(model.project_id.label("project_id"), *aggregates)
+        .where(model.project_id.in_(project_ids))
+        .group_by(model.project_id)
+        .subquery()
+    )
+
 class OptimizedQueries:
     """Classe para consultas otimizadas com eager loading e cache"""
     
@@ -37,56 +53,81 @@ class OptimizedQueries:
     ) -> List[Dict[str, Any]]:
         """
         Busca projetos do usuário com otimizações:
-        - Eager loading de relacionamentos
+        - Apenas colunas necessárias (sem carregar objetos ORM)
         - Cache de resultado
-        - Estatísticas agregadas em uma consulta
+        - Estatísticas agregadas no banco (GROUP BY) restritas à página,
+          tudo em uma única consulta
         """
         
-        # Query principal com eager loading
-        query = (
-            select(Project)
-            .options(
-                selectinload(Project.files),
-                selectinload(Project.videos),
-                selectinload(Project.scenes),
-                joinedload(Project.owner)
-            )
+        # Página de projetos (desempate por id para paginação estável)
+        page = (
+            select(Project.id)
             .where(Project.owner_id == user_id)
+            .order_by(Project.updated_at.desc(), Project.id.desc())
             .offset(skip)
             .limit(limit)
-            .order_by(Project.updated_at.desc())
+            .subquery("page")
+        )
+        
+        query = (
+            select(
+                Project.id, Project.uuid, Project.name, Project.description,
+                Project.status, Project.is_public, Project.created_at, Project.updated_at,
+                User.id.label("owner_id"), User.username.label("owner_username"),
+                User.full_name.label("owner_full_name")
+            )
+            .join(page, page.c.id == Project.id)
+            .join(User, User.id == Project.owner_id)
+            .order_by(Project.updated_at.desc(), Project.id.desc())
         )
         
-        projects = self.db.execute(query).unique().scalars().all()
+        if include_stats:
+            page_ids = select(page.c.id)
+            files = _project_aggregate(
+                FileUpload, page_ids,
+                func.count(FileUpload.id).label("total"),
+                func.max(FileUpload.uploaded_at).label("last_upload")
+            )
+            videos = _project_aggregate(Video, page_ids, func.count(Video.id).label("total"))
+            scenes = _project_aggregate(Scene, page_ids, func.count(Scene.id).label("total"))
+            
+            query = (
+                query
+                .add_columns(
+                    func.coalesce(files.c.total, 0).label("total_files"),
+                    func.coalesce(videos.c.total, 0).label("total_videos"),
+                    func.coalesce(scenes.c.total, 0).label("total_scenes"),
+                    files.c.last_upload.label("last_file_upload")
+                )
+                .outerjoin(files, files.c.project_id == Project.id)
+                .outerjoin(videos, videos.c.project_id == Project.id)
+                .outerjoin(scenes, scenes.c.project_id == Project.id)
+            )
         
         result = []
-        for project in projects:
+        for row in self.db.execute(query):
             project_data = {
-                "id": project.id,
-                "uuid": project.uuid,
-                "name": project.name,
-                "description": project.description,
-                "status": project.status,
-                "is_public": project.is_public,
-                "created_at": project.created_at,
-                "updated_at": project.updated_at,
+                "id": row.id,
+                "uuid": row.uuid,
+                "name": row.name,
+                "description": row.description,
+                "status": row.status,
+                "is_public": row.is_public,
+                "created_at": row.created_at,
+                "updated_at": row.updated_at,
                 "owner": {
-                    "id": project.owner.id,
-                    "username": project.owner.username,
-                    "full_name": project.owner.full_name
+                    "id": row.owner_id,
+                    "username": row.owner_username,
+                    "full_name": row.owner_full_name
                 }
             }
             
             if include_stats:
-                # Estatísticas já carregadas via eager loading
                 project_data.update({
-                    "total_files": len(project.files),
-                    "total_videos": len(project.videos),
-                    "total_scenes": len(project.scenes),
-                    "last_file_upload": max(
-                        (f.uploaded_at for f in project.files), 
-                        default=None
-                    )
+                    "total_files": row.total_files,
+                    "total_videos": row.total_videos,
+                    "total_scenes": row.total_scenes,
+                    "last_file_upload": row.last_file_upload
                 })
             
             result.append(project_data)
@@ -223,76 +264,107 @@ class OptimizedQueries:
     
     async def get_user_dashboard_data(self, user_id: int) -> Dict[str, Any]:
         """
-        Busca dados do dashboard em consultas otimizadas
-        """
+        Busca dados do dashboard em uma única ida ao banco.
         
-        # Estatísticas básicas em uma consulta
-        stats_query = (
-            select(
-                func.count(Project.id).label('total_projects'),
-                func.count(
-                    case([(Project.status == 'completed', 1)])
-                ).label('completed_projects'),
-                func.count(
-                    case([(Project.is_public == True, 1)])
-                ).label('public_projects')
-            )
-            .where(Project.owner_id == user_id)
-        )
+        Estatísticas, projetos recentes e arquivos recentes são combinados em
+        um UNION ALL com colunas uniformes e um discriminador "kind".
+        """
         
-        stats_result = self.db.execute(stats_query).first()
+        stats = select(
+            literal("stats").label("kind"),
+            _null(Integer).label("id"),
+            _null(String).label("name"),
+            _null(String).label("status"),
+            _null(String).label("file_type"),
+            _null(DateTime(timezone=True)).label("ts"),
+            _null(String).label("project_name"),
+            func.count(Project.id).label("total_projects"),
+            func.count(case((Project.status == 'completed', 1))).label("completed_projects"),
+            func.count(case((Project.is_public == True, 1))).label("public_projects")
+        ).where(Project.owner_id == user_id)
         
         # Projetos recentes com informações básicas
-        recent_projects_query = (
-            select(Project)
-            .options(joinedload(Project.owner))
+        recent_projects = (
+            select(
+                literal("project").label("kind"),
+                Project.id, Project.name, Project.status,
+                _null(String).label("file_type"),
+                Project.updated_at.label("ts"),
+                _null(String).label("project_name"),
+                _null(Integer).label("total_projects"),
+                _null(Integer).label("completed_projects"),
+                _null(Integer).label("public_projects")
+            )
             .where(Project.owner_id == user_id)
-            .order_by(Project.updated_at.desc())
+            .order_by(Project.updated_at.desc(), Project.id.desc())
             .limit(5)
+            .subquery()
         )
         
-        recent_projects = self.db.execute(recent_projects_query).unique().scalars().all()
-        
         # Arquivos recentes
-        recent_files_query = (
-            select(FileUpload)
-            .options(joinedload(FileUpload.project))
+        recent_files = (
+            select(
+                literal("file").label("kind"),
+                FileUpload.id, FileUpload.filename.label("name"),
+                _null(String).label("status"),
+                FileUpload.file_type,
+                FileUpload.uploaded_at.label("ts"),
+                Project.name.label("project_name"),
+                _null(Integer).label("total_projects"),
+                _null(Integer).label("completed_projects"),
+                _null(Integer).label("public_projects")
+            )
+            .outerjoin(Project, Project.id == FileUpload.project_id)
             .where(FileUpload.user_id == user_id)
-            .order_by(FileUpload.uploaded_at.desc())
+            .order_by(FileUpload.uploaded_at.desc(), FileUpload.id.desc())
             .limit(10)
+            .subquery()
         )
         
-        recent_files = self.db.execute(recent_files_query).unique().scalars().all()
+        # Subconsultas com LIMIT precisam ser embrulhadas (exigência do SQLite)
+        query = union_all(stats, select(recent_projects), select(recent_files))
+        
+        statistics = None
+        projects: List[Dict[str, Any]] = []
+        files: List[Dict[str, Any]] = []
+        for row in self.db.execute(query):
+            if row.kind == "stats":
+                statistics = row
+            elif row.kind == "project":
+                projects.append({
+                    "id": row.id,
+                    "name": row.name,
+                    "status": row.status,
+                    "updated_at": row.ts
+                })
+            else:
+                files.append({
+                    "id": row.id,
+                    "filename": row.name,
+                    "file_type": row.file_type,
+                    "uploaded_at": row.ts,
+                    "project_name": row.project_name
+                })
+        
+        # A ordem entre partes de um UNION ALL não é garantida
+        projects.sort(key=lambda p: (p["updated_at"] is not None, p["updated_at"] or 0, p["id"]), reverse=True)
+        files.sort(key=lambda f: (f["uploaded_at"] is not None, f["uploaded_at"] or 0, f["id"]), reverse=True)
+        
+        total_projects = statistics.total_projects or 0
+        completed_projects = statistics.completed_projects or 0
         
         return {
             "statistics": {
-                "total_projects": stats_result.total_projects,
-                "completed_projects": stats_result.completed_projects,
-                "public_projects": stats_result.public_projects,
+                "total_projects": total_projects,
+                "completed_projects": completed_projects,
+                "public_projects": statistics.public_projects or 0,
                 "completion_rate": (
-                    stats_result.completed_projects / stats_result.total_projects * 100
-                    if stats_result.total_projects > 0 else 0
+                    completed_projects / total_projects * 100
+                    if total_projects > 0 else 0
                 )
             },
-            "recent_projects": [
-                {
-                    "id": p.id,
-                    "name": p.name,
-                    "status": p.status,
-                    "updated_at": p.updated_at
-                }
-                for p in recent_projects
-            ],
-            "recent_files": [
-                {
-                    "id": f.id,
-                    "filename": f.filename,
-                    "file_type": f.file_type,
-                    "uploaded_at": f.uploaded_at,
-                    "project_name": f.project.name if f.project else None
-                }
-                for f in recent_files
-            ]
+            "recent_projects": projects,
+            "recent_files": files
         }
     
     async def search_projects_optimized(
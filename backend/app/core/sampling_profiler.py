@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Profiler por Amostragem Sob Demanda - TecnoCursos AI
+
+Amostra as pilhas de todas as threads do processo em execução, por N
+segundos, sem reiniciar o worker e sem instrumentar o código.
+
+Funcionalidades:
+- Thread de amostragem lendo sys._current_frames() a cada `interval`
+- Modo "wall": toda amostra conta (inclui espera de I/O e locks)
+- Modo "cpu": cada pilha pesa o tempo de CPU que a thread consumiu desde a
+  amostra anterior (psutil, por thread nativa); threads ociosas não contam
+- Saída em pilhas colapsadas (flamegraph.pl, speedscope) ou perfil
+  "sampled" do speedscope, além das funções mais caras (self/total)
+- Diff opcional de tracemalloc (top N linhas que mais alocaram)
+- Mede o próprio custo: CPU da thread de amostragem / duração
+
+Uma sessão por vez; use ProfilerBusyError para responder 409.
+
+Autor: TecnoCursos AI System
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MAX_DURATION_SECONDS = 120.0
+MIN_INTERVAL_SECONDS = 0.001
+
+Stack = Tuple[str, ...]
+
+
+class ProfilerBusyError(RuntimeError):
+    """Já existe uma sessão de profiling em andamento"""
+
+
+@dataclass
+class ProfileResult:
+    """Resultado de uma sessão de amostragem"""
+    mode: str
+    duration_seconds: float
+    interval_seconds: float
+    samples: int
+    weight_unit: str                                  # "samples" ou "cpu_ms"
+    stacks: Counter = field(default_factory=Counter)  # (thread, frame raiz, ..., folha) -> peso
+    sampler_cpu_seconds: float = 0.0
+    allocations: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def overhead_percent(self) -> float:
+        """CPU gasta pela thread de amostragem em relação à duração"""
+        if not self.duration_seconds:
+            return 0.0
+        return round(self.sampler_cpu_seconds / self.duration_seconds * 100, 2)
+
+    def collapsed(self) -> str:
+        """Formato "pilhas colapsadas": `thread;raiz;...;folha peso` por linha"""
+        lines = []
+        for stack, weight in self.stacks.most_common():
+            value = round(weight, 3) if isinstance(weight, float) else weight
+            lines.append(f"{';'.join(frame.replace(';', ':') for frame in stack)} {value}")
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def top_functions(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Funções com maior peso próprio (folha) e total (em qualquer ponto da pilha)"""
+        self_weight: Counter = Counter()
+        total_weight: Counter = Counter()
+        grand_total = sum(self.stacks.values()) or 1
+        for stack, weight in self.stacks.items():
+            frames = stack[1:]  # sem o nome da thread
+            if not frames:
+                continue
+            self_weight[frames[-1]] += weight
+            for frame in set(frames):
+                total_weight[frame] += weight
+        return [
+            {
+                "function": frame,
+                "self": round(weight, 3),
+                "self_percent": round(weight / grand_total * 100, 2),
+                "total": round(total_weight[frame], 3),
+                "total_percent": round(total_weight[frame] / grand_total * 100, 2),
+            }
+            for frame, weight in self_weight.most_common(limit)
+        ]
+
+    def speedscope(self, name: str = "TecnoCursos AI") -> Dict[str, Any]:
+        """Arquivo speedscope com um perfil "sampled" por thread"""
+        frames: List[Dict[str, Any]] = []
+        frame_index: Dict[str, int] = {}
+        by_thread: Dict[str, List[Tuple[List[int], float]]] = {}
+        for stack, weight in self.stacks.items():
+            indexes = []
+            for frame in stack[1:]:
+                if frame not in frame_index:
+                    frame_index[frame] = len(frames)
+                    frames.append(_speedscope_frame(frame))
+                indexes.append(frame_index[frame])
+            by_thread.setdefault(stack[0], []).append((indexes, weight))
+
+        unit = "milliseconds" if self.weight_unit == "cpu_ms" else "none"
+        profiles = []
+        for thread_name, entries in sorted(by_thread.items()):
+            total = sum(weight for _, weight in entries)
+            profiles.append({
+                "type": "sampled",
+                "name": f"{thread_name} ({self.mode})",
+                "unit": unit,
+                "startValue": 0,
+                "endValue": round(total, 3),
+                "samples": [indexes for indexes, _ in entries],
+                "weights": [round(weight, 3) for _, weight in entries],
+            })
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": profiles,
+            "name": name,
+            "exporter": "app.core.sampling_profiler",
+        }
+
+    def summary(self, top: int = 20) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "interval_seconds": self.interval_seconds,
+            "samples": self.samples,
+            "weight_unit": self.weight_unit,
+            "unique_stacks": len(self.stacks),
+            "overhead_percent": self.overhead_percent,
+            "top_functions": self.top_functions(top),
+            **({"allocations": self.allocations} if self.allocations is not None else {}),
+        }
+
+
+def _speedscope_frame(label: str) -> Dict[str, Any]:
+    # label: "func (arquivo:linha)"
+    name, _, location = label.partition(" (")
+    file, _, line = location.rstrip(")").rpartition(":")
+    frame: Dict[str, Any] = {"name": name}
+    if file:
+        frame["file"] = file
+        if line.isdigit():
+            frame["line"] = int(line)
+    return frame
+
+
+class StackSampler:
+    """
+    Amostrador de pilhas baseado em thread.
+
+    A cada intervalo, com o GIL, copia as pilhas de todas as threads (exceto
+    a própria) e soma o peso de cada pilha. Os rótulos de frame ficam em
+    cache por code object, então o custo por amostra é proporcional à
+    profundidade das pilhas.
+    """
+
+    def __init__(self, interval: float = 0.01, mode: str = "wall", max_depth: int = 128,
+                 include_threads: Optional[List[str]] = None):
+        if mode not in ("wall", "cpu"):
+            raise ValueError("mode deve ser 'wall' ou 'cpu'")
+        if mode == "cpu" and not PSUTIL_AVAILABLE:
+            raise RuntimeError("Modo cpu requer psutil")
+        self.interval = max(interval, MIN_INTERVAL_SECONDS)
+        self.mode = mode
+        self.max_depth = max_depth
+        self.include_threads = include_threads
+        self._labels: Dict[Any, str] = {}
+        self._cwd = os.getcwd() + os.sep
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            if filename.startswith(self._cwd):
+                filename = filename[len(self._cwd):]
+            name = getattr(code, "co_qualname", code.co_name)
+            label = f"{name} ({filename}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+    def _stack(self, frame) -> Stack:
+        frames = []
+        while frame is not None and len(frames) < self.max_depth:
+            frames.append(self._label(frame.f_code))
+            frame = frame.f_back
+        frames.reverse()
+        return tuple(frames)
+
+    @staticmethod
+    def _thread_cpu_times() -> Dict[int, float]:
+        """CPU (user+system) por thread nativa"""
+        return {t.id: t.user_time + t.system_time for t in psutil.Process().threads()}
+
+    def run(self, duration: float, stop_event: Optional[threading.Event] = None) -> ProfileResult:
+        """Amostra por `duration` segundos na thread corrente (bloqueante)"""
+        duration = min(max(duration, self.interval), MAX_DURATION_SECONDS)
+        own_ident = threading.get_ident()
+        stop_event = stop_event or threading.Event()
+        result = ProfileResult(
+            mode=self.mode, duration_seconds=0.0, interval_seconds=self.interval, samples=0,
+            weight_unit="cpu_ms" if self.mode == "cpu" else "samples",
+        )
+        stacks = result.stacks
+        cpu_start = time.thread_time()
+        started = time.perf_counter()
+        deadline = started + duration
+        previous_cpu = self._thread_cpu_times() if self.mode == "cpu" else {}
+
+        next_tick = started
+        while not stop_event.is_set():
+            next_tick += self.interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                stop_event.wait(delay)
+            elif delay < -self.interval:
+                # Atrasou (GIL ocupado): não tenta recuperar amostras perdidas
+                next_tick = time.perf_counter()
+            if time.perf_counter() >= deadline:
+                break
+
+            threads = {t.ident: t for t in threading.enumerate()}
+            frames = sys._current_frames()
+            if self.mode == "cpu":
+                current_cpu = self._thread_cpu_times()
+
+            for ident, frame in frames.items():
+                if ident == own_ident:
+                    continue
+                thread = threads.get(ident)
+                thread_name = thread.name if thread is not None else f"thread-{ident}"
+                if self.include_threads and thread_name not in self.include_threads:
+                    continue
+                if self.mode == "cpu":
+                    native_id = getattr(thread, "native_id", None)
+                    if native_id is None:
+                        continue
+                    delta = current_cpu.get(native_id, 0.0) - previous_cpu.get(native_id, 0.0)
+                    if delta <= 0:
+                        continue
+                    stacks[(thread_name,) + self._stack(frame)] += delta * 1000
+                else:
+                    stacks[(thread_name,) + self._stack(frame)] += 1
+            del frames
+            if self.mode == "cpu":
+                previous_cpu = current_cpu
+            result.samples += 1
+
+        result.duration_seconds = time.perf_counter() - started
+        result.sampler_cpu_seconds = time.thread_time() - cpu_start
+        return result
+
+
+class AllocationTracker:
+    """Diff de snapshots do tracemalloc entre o início e o fim da sessão"""
+
+    def __init__(self, top: int = 20, frames: int = 1):
+        self.top = top
+        self.frames = frames
+        self._started_here = False
+        self._before = None
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_here = True
+        self._before = tracemalloc.take_snapshot()
+
+    def stop(self) -> List[Dict[str, Any]]:
+        try:
+            after = tracemalloc.take_snapshot()
+            filters = [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ]
+            diff = after.filter_traces(filters).compare_to(self._before.filter_traces(filters), "lineno")
+            return [
+                {
+                    "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    "size_diff_kb": round(stat.size_diff / 1024, 1),
+                    "count_diff": stat.count_diff,
+                    "size_kb": round(stat.size / 1024, 1),
+                    "count": stat.count,
+                }
+                for stat in diff[:self.top]
+            ]
+        finally:
+            self._before = None
+            if self._started_here:
+                tracemalloc.stop()
+                self._started_here = False
+
+
+_session_lock = threading.Lock()
+_last_result: Optional[ProfileResult] = None
+
+
+def profile(duration: float = 10.0, interval: float = 0.01, mode: str = "wall",
+            allocations: bool = False, allocation_top: int = 20,
+            include_threads: Optional[List[str]] = None) -> ProfileResult:
+    """
+    Executa uma sessão de amostragem (bloqueante: chame em thread, ex.
+    asyncio.to_thread). Levanta ProfilerBusyError se outra estiver ativa.
+    """
+    global _last_result
+    if not _session_lock.acquire(blocking=False):
+        raise ProfilerBusyError("Já existe uma sessão de profiling em andamento")
+    try:
+        sampler = StackSampler(interval=interval, mode=mode, include_threads=include_threads)
+        tracker = AllocationTracker(top=allocation_top) if allocations else None
+        if tracker:
+            tracker.start()
+        logger.info(f"🔬 Profiling iniciado: {duration:.1f}s, modo {mode}, intervalo {interval * 1000:.1f}ms")
+        try:
+            result = sampler.run(duration)
+        finally:
+            if tracker:
+                allocation_diff = tracker.stop()
+        if tracker:
+            result.allocations = allocation_diff
+        logger.info(f"🔬 Profiling concluído: {result.samples} amostras, overhead {result.overhead_percent}%")
+        _last_result = result
+        return result
+    finally:
+        _session_lock.release()
+
+
+def is_running() -> bool:
+    return _session_lock.locked()
+
+
+def last_result() -> Optional[ProfileResult]:
+    return _last_result
@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Agendador Compartilhado de Tarefas Periódicas - TecnoCursos AI
+
+Substitui os loops `while True: await asyncio.sleep(...)` de cada serviço por
+um único agendador sobre o event loop, com uma só task acordando apenas
+quando há job vencendo.
+
+Funcionalidades:
+- Roda de tempo hierárquica (4 níveis x 64 slots): inserção e remoção O(1),
+  vencimentos de segundos a semanas com o mesmo custo
+- Jitter por job (espalha jobs de mesmo intervalo e de vários workers)
+- Ticks perdidos (loop bloqueado, job mais longo que o intervalo) são
+  coalescidos numa única execução ou recuperados em sequência
+- Métricas por job: execuções, falhas, sobreposições evitadas, ticks
+  coalescidos e tempo de execução (p50/p95/máx)
+- Jobs CPU-bound rodam num executor (pool de threads compartilhado ou um
+  executor próprio, ex.: ProcessPoolExecutor) sem travar o event loop
+
+Uso:
+    from app.core.scheduler import get_scheduler
+
+    scheduler = get_scheduler()
+    scheduler.add_job("autosave.cleanup", service.cleanup, interval=3600, jitter=60)
+    scheduler.add_job("reports.rebuild", rebuild_reports, interval=300, executor=True)
+    ...
+    scheduler.remove_job("autosave.cleanup")
+
+Autor: TecnoCursos AI System
+"""
+
+import asyncio
+import inspect
+import logging
+import math
+import random
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from app.services.quantile_sketch import DDSketch
+
+logger = logging.getLogger(__name__)
+
+# Geometria da roda: nível N cobre 64^(N+1) ticks (com tick de 0,1 s:
+# 6,4 s / 6,8 min / 7,3 h / 19,4 dias); além disso o job fica em espera
+WHEEL_BITS = 6
+WHEEL_SIZE = 1 << WHEEL_BITS
+WHEEL_MASK = WHEEL_SIZE - 1
+WHEEL_LEVELS = 4
+
+# Execuções de recuperação seguidas quando coalesce=False
+MAX_CATCH_UP_RUNS = 10
+
+
+class ScheduledJob:
+    """Job periódico registrado no agendador"""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Union[Any, Awaitable[Any]]],
+        interval: float,
+        jitter: float = 0.0,
+        coalesce: bool = True,
+        executor: Union[bool, Executor] = False,
+        timeout: Optional[float] = None,
+    ):
+        if interval <= 0:
+            raise ValueError("interval deve ser positivo")
+        self.name = name
+        self.func = func
+        self.interval = float(interval)
+        self.jitter = max(0.0, float(jitter))
+        self.coalesce = coalesce
+        self.executor = executor
+        self.timeout = timeout
+        self.is_coroutine = inspect.iscoroutinefunction(func)
+
+        # Estado de agendamento
+        self.grid_at = 0.0        # próximo vencimento sem jitter (monotonic)
+        self.due_at = 0.0         # próximo vencimento efetivo
+        self.deadline_tick = 0    # tick da roda onde o job está
+        self.cancelled = False
+        self.running = False
+
+        # Métricas
+        self.runs = 0
+        self.failures = 0
+        self.overlaps = 0         # vencimentos pulados porque a execução anterior não terminou
+        self.coalesced = 0        # ticks perdidos absorvidos numa execução só
+        self.last_run_at: Optional[float] = None
+        self.last_runtime: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.runtime = DDSketch()
+
+    def schedule_from(self, grid_at: float):
+        """Define o próximo vencimento a partir do instante da grade"""
+        self.grid_at = grid_at
+        self.due_at = grid_at + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        runtime = self.runtime.summary()
+        return {
+            "interval": self.interval,
+            "jitter": self.jitter,
+            "coalesce": self.coalesce,
+            "executor": bool(self.executor),
+            "running": self.running,
+            "runs": self.runs,
+            "failures": self.failures,
+            "overlaps": self.overlaps,
+            "coalesced_ticks": self.coalesced,
+            "last_run_at": self.last_run_at,
+            "last_runtime_ms": round(self.last_runtime * 1000, 3) if self.last_runtime is not None else None,
+            "last_error": self.last_error,
+            "next_run_in": round(max(0.0, self.due_at - time.monotonic()), 3) if not self.cancelled else None,
+            "runtime_ms": {key: round(value * 1000, 3) if key != "count" else value
+                           for key, value in runtime.items()},
+        }
+
+
+class TimingWheel:
+    """
+    Roda de tempo hierárquica (Varghese & Lauck) sobre ticks inteiros.
+
+    O nível 0 tem um slot por tick; o nível N tem slots de 64^N ticks. Um item
+    é colocado no nível mais baixo que alcança seu vencimento e desce de nível
+    (cascata) quando o tempo entra no bloco dele. `advance` processa só os
+    ticks com algo a fazer, então a task do agendador não acorda a cada tick.
+    """
+
+    def __init__(self, tick: float = 0.1, clock: Callable[[], float] = time.monotonic):
+        self.tick = tick
+        self.clock = clock
+        self.origin = clock()
+        self.current = 0
+        self._slots: List[List[List[ScheduledJob]]] = [
+            [[] for _ in range(WHEEL_SIZE)] for _ in range(WHEEL_LEVELS)
+        ]
+        self._overflow: List[ScheduledJob] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def tick_of(self, when: float) -> int:
+        return math.ceil((when - self.origin) / self.tick - 1e-9)
+
+    def time_of(self, tick: int) -> float:
+        return self.origin + tick * self.tick
+
+    def add(self, job: ScheduledJob, when: float):
+        job.deadline_tick = max(self.tick_of(when), self.current + 1)
+        self._place(job)
+        self._count += 1
+
+    def _place(self, job: ScheduledJob):
+        delta = job.deadline_tick - self.current
+        for level in range(WHEEL_LEVELS):
+            if delta < 1 << (WHEEL_BITS * (level + 1)):
+                slot = (job.deadline_tick >> (WHEEL_BITS * level)) & WHEEL_MASK
+                self._slots[level][slot].append(job)
+                return
+        self._overflow.append(job)
+
+    def next_tick(self) -> Optional[int]:
+        """Próximo tick com vencimento ou cascata pendente (None se vazia)"""
+        if not self._count:
+            return None
+        best = None
+        for level in range(WHEEL_LEVELS):
+            shift = WHEEL_BITS * level
+            block = self.current >> shift
+            index = block & WHEEL_MASK
+            slots = self._slots[level]
+            for step in range(1, WHEEL_SIZE + 1):
+                if slots[(index + step) & WHEEL_MASK]:
+                    tick = (block + step) << shift if level else self.current + step
+                    if best is None or tick < best:
+                        best = tick
+                    break
+        if self._overflow:
+            shift = WHEEL_BITS * WHEEL_LEVELS
+            tick = ((self.current >> shift) + 1) << shift
+            best = tick if best is None else min(best, tick)
+        return best
+
+    def advance(self, now: float) -> List[ScheduledJob]:
+        """Avança até `now` e devolve os jobs vencidos"""
+        target = math.floor((now - self.origin) / self.tick + 1e-9)
+        expired: List[ScheduledJob] = []
+        while True:
+            tick = self.next_tick()
+            if tick is None or tick > target:
+                self.current = max(self.current, target)
+                return expired
+            self.current = tick
+            self._cascade(tick)
+            slot = self._slots[0][tick & WHEEL_MASK]
+            if slot:
+                self._slots[0][tick & WHEEL_MASK] = []
+                for job in slot:
+                    if job.deadline_tick > tick:
+                        self._place(job)
+                        continue
+                    self._count -= 1
+                    if not job.cancelled:
+                        expired.append(job)
+
+    def _cascade(self, tick: int):
+        if self._overflow and tick & ((1 << (WHEEL_BITS * WHEEL_LEVELS)) - 1) == 0:
+            pending, self._overflow = self._overflow, []
+            for job in pending:
+                self._place(job)
+        for level in range(WHEEL_LEVELS - 1, 0, -1):
+            shift = WHEEL_BITS * level
+            if tick & ((1 << shift) - 1):
+                continue
+            index = (tick >> shift) & WHEEL_MASK
+            pending = self._slots[level][index]
+            if pending:
+                self._slots[level][index] = []
+                for job in pending:
+                    self._place(job)
+
+
+class Scheduler:
+    """Agendador de jobs periódicos com uma única task no event loop"""
+
+    def __init__(self, tick: float = 0.1, executor_workers: int = 4):
+        self.wheel = TimingWheel(tick)
+        self.executor_workers = executor_workers
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running_tasks: set = set()
+        self._lock = threading.Lock()
+        self.wakeups = 0
+
+    # ------------------------------------------------------------------
+    # Registro de jobs
+    # ------------------------------------------------------------------
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], Union[Any, Awaitable[Any]]],
+        interval: float,
+        *,
+        jitter: float = 0.0,
+        initial_delay: Optional[float] = None,
+        coalesce: bool = True,
+        executor: Union[bool, Executor] = False,
+        timeout: Optional[float] = None,
+    ) -> ScheduledJob:
+        """
+        Registra (ou substitui) o job `name`.
+
+        func: coroutine function ou callable síncrono; síncronos rodam no loop,
+            a menos que `executor` seja True (pool compartilhado) ou um Executor
+        initial_delay: atraso da primeira execução (padrão: um intervalo)
+        coalesce: True executa uma vez após ticks perdidos; False recupera
+            até MAX_CATCH_UP_RUNS execuções em sequência
+        """
+        if executor and inspect.iscoroutinefunction(func):
+            raise ValueError("jobs em executor devem ser funções síncronas")
+        job = ScheduledJob(name, func, interval, jitter, coalesce, executor, timeout)
+        first = interval if initial_delay is None else max(0.0, initial_delay)
+        with self._lock:
+            previous = self._jobs.pop(name, None)
+            if previous is not None:
+                previous.cancelled = True
+            job.schedule_from(time.monotonic() + first)
+            self._jobs[name] = job
+            self.wheel.add(job, job.due_at)
+        self._wake()
+        self.ensure_started()
+        return job
+
+    def remove_job(self, name: str) -> bool:
+        with self._lock:
+            job = self._jobs.pop(name, None)
+        if job is None:
+            return False
+        job.cancelled = True  # removido da roda quando o slot vencer
+        return True
+
+    def get_job(self, name: str) -> Optional[ScheduledJob]:
+        return self._jobs.get(name)
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def ensure_started(self) -> bool:
+        """Inicia a task do agendador no loop atual (sem efeito fora de um loop)"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        if self.is_running and self._loop is loop:
+            return True
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._task = loop.create_task(self._run(), name="scheduler")
+        logger.info(f"⏱️ Agendador iniciado ({len(self._jobs)} jobs)")
+        return True
+
+    async def start(self):
+        self.ensure_started()
+
+    async def stop(self, wait: bool = True, timeout: float = 10.0):
+        """Para a task do agendador; com wait, aguarda execuções em andamento"""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if wait and self._running_tasks:
+            await asyncio.wait(list(self._running_tasks), timeout=timeout)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _wake(self):
+        loop, event = self._loop, self._wakeup
+        if loop is None or event is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            event.set()
+        else:
+            loop.call_soon_threadsafe(event.set)
+
+    async def _run(self):
+        wheel = self.wheel
+        while True:
+            with self._lock:
+                next_tick = wheel.next_tick()
+            self._wakeup.clear()
+            delay = None if next_tick is None else wheel.time_of(next_tick) - wheel.clock()
+            if delay is None or delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+            self.wakeups += 1
+            now = wheel.clock()
+            with self._lock:
+                due = wheel.advance(now)
+            for job in due:
+                self._dispatch(job, now)
+
+    # ------------------------------------------------------------------
+    # Execução
+    # ------------------------------------------------------------------
+
+    def _dispatch(self, job: ScheduledJob, now: float):
+        missed = max(0, int((now - job.due_at) // job.interval))
+        next_grid = job.grid_at + (missed + 1) * job.interval
+        if job.running:
+            job.overlaps += 1
+            runs = 0
+        elif job.coalesce:
+            job.coalesced += missed
+            runs = 1
+        else:
+            runs = min(missed + 1, MAX_CATCH_UP_RUNS)
+            job.coalesced += missed + 1 - runs
+        with self._lock:
+            if not job.cancelled:
+                job.schedule_from(next_grid)
+                self.wheel.add(job, job.due_at)
+        if runs:
+            job.running = True
+            task = self._loop.create_task(self._execute(job, runs), name=f"scheduler:{job.name}")
+            self._running_tasks.add(task)
+            task.add_done_callback(self._running_tasks.discard)
+
+    async def _execute(self, job: ScheduledJob, runs: int):
+        try:
+            for _ in range(runs):
+                if job.cancelled:
+                    break
+                await self._run_once(job)
+        finally:
+            job.running = False
+
+    async def _run_once(self, job: ScheduledJob):
+        started = time.perf_counter()
+        job.last_run_at = time.time()
+        try:
+            if job.executor:
+                executor = job.executor if isinstance(job.executor, Executor) else self._get_executor()
+                call = self._loop.run_in_executor(executor, job.func)
+            elif job.is_coroutine:
+                call = job.func()
+            else:
+                call = None
+                result = job.func()
+                if inspect.isawaitable(result):
+                    call = result
+            if call is not None:
+                await (asyncio.wait_for(call, job.timeout) if job.timeout else call)
+            job.last_error = None
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            job.failures += 1
+            job.last_error = f"{type(e).__name__}: {e}"
+            logger.error(f"Erro no job agendado {job.name}: {e}")
+        finally:
+            elapsed = time.perf_counter() - started
+            job.runs += 1
+            job.last_runtime = elapsed
+            job.runtime.add(elapsed)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.executor_workers,
+                                                thread_name_prefix="scheduler")
+        return self._executor
+
+    # ------------------------------------------------------------------
+    # Diagnóstico
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.is_running,
+            "tick_seconds": self.wheel.tick,
+            "wakeups": self.wakeups,
+            "pending_entries": len(self.wheel),
+            "jobs": {name: job.get_stats() for name, job in sorted(self._jobs.items())},
+        }
+
+
+# Instância global
+_scheduler: Optional[Scheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> Scheduler:
+    """Obtém o agendador global"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                try:
+                    from app.config import get_settings
+                    settings = get_settings()
+                    _scheduler = Scheduler(tick=settings.scheduler_tick_seconds,
+                                           executor_workers=settings.scheduler_executor_workers)
+                except Exception:
+                    _scheduler = Scheduler()
+    return _scheduler
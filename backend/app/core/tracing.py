@@ -0,0 +1,600 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tracing de Requisições em Processo - TecnoCursos AI
+
+Spans leves, propagados por contextvars, para ver onde uma requisição lenta
+gastou o tempo (banco, cache, TTS, etapas de render) sem coletor externo.
+
+Funcionalidades:
+- `span("db.query")` como context manager ou `@traced` em funções sync/async;
+  fora de um trace ativo o custo é um ContextVar.get()
+- IDs de trace/span propagados pelo contexto (inclusive em asyncio.gather e
+  threads iniciadas com asyncio.to_thread / run_in_threadpool)
+- TracingMiddleware (ASGI) abre um trace por requisição e devolve X-Trace-ID
+- Amostragem de cauda: ao terminar, o trace só é guardado se foi lento,
+  falhou ou caiu na amostra aleatória; os demais são descartados
+- Exportação em Chrome trace (chrome://tracing, Perfetto) e speedscope
+
+Uso:
+    from app.core.tracing import span, traced
+
+    with span("tts.generate", category="tts", chars=len(text)):
+        ...
+
+    @traced("video.render_scene", category="video")
+    async def render_scene(...):
+        ...
+
+Autor: TecnoCursos AI System
+"""
+
+import functools
+import inspect
+import itertools
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Limite de spans por trace (requisições com milhares de queries não crescem sem limite)
+MAX_SPANS_PER_TRACE = 2000
+
+_ids = itertools.count(1)
+_PID = os.getpid()
+
+
+def _new_id() -> str:
+    return f"{random.getrandbits(64):016x}"
+
+
+class Span:
+    """Intervalo de tempo nomeado dentro de um trace"""
+
+    __slots__ = ("trace", "span_id", "parent_id", "name", "category", "start_ns", "end_ns",
+                 "thread_id", "attrs", "error", "_token")
+
+    def __init__(self, trace: "Trace", name: str, category: str, parent_id: Optional[int],
+                 attrs: Optional[Dict[str, Any]]):
+        self.trace = trace
+        self.span_id = next(_ids)
+        self.parent_id = parent_id
+        self.name = name
+        self.category = category
+        self.attrs = attrs
+        self.error: Optional[str] = None
+        self.thread_id = threading.get_ident()
+        self.end_ns = 0
+        self._token = None
+        self.start_ns = time.perf_counter_ns()
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns or time.perf_counter_ns()
+        return (end - self.start_ns) / 1e6
+
+    def set(self, **attrs):
+        """Acrescenta atributos ao span"""
+        if self.attrs is None:
+            self.attrs = {}
+        self.attrs.update(attrs)
+
+    def finish(self, error: Optional[BaseException] = None):
+        if self.end_ns:
+            return
+        self.end_ns = time.perf_counter_ns()
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+            self.trace.error = True
+        if self._token is not None:
+            try:
+                _current_span.reset(self._token)
+            except ValueError:
+                # Finalizado em outro contexto (ex.: evento do SQLAlchemy em outra task)
+                pass
+            self._token = None
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.finish(exc)
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        origin = self.trace.start_ns
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "category": self.category,
+            "start_ms": round((self.start_ns - origin) / 1e6, 3),
+            "duration_ms": round(self.duration_ms, 3),
+            "thread_id": self.thread_id,
+            **({"attrs": self.attrs} if self.attrs else {}),
+            **({"error": self.error} if self.error else {}),
+        }
+
+
+class _NoopSpan:
+    """Span devolvido quando não há trace ativo (não mede nada)"""
+
+    __slots__ = ()
+    span_id = None
+    duration_ms = 0.0
+
+    def set(self, **attrs):
+        pass
+
+    def finish(self, error: Optional[BaseException] = None):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Trace:
+    """Spans de uma requisição (ou tarefa) e seus metadados"""
+
+    __slots__ = ("trace_id", "name", "attrs", "start_ns", "end_ns", "wall_start", "spans",
+                 "dropped_spans", "error", "status_code", "root")
+
+    def __init__(self, name: str, trace_id: Optional[str] = None, attrs: Optional[Dict[str, Any]] = None):
+        self.trace_id = trace_id or _new_id()
+        self.name = name
+        self.attrs = attrs or {}
+        self.wall_start = time.time()
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns = 0
+        self.spans: List[Span] = []
+        self.dropped_spans = 0
+        self.error = False
+        self.status_code: Optional[int] = None
+        self.root: Optional[Span] = None
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns or time.perf_counter_ns()
+        return (end - self.start_ns) / 1e6
+
+    def summary(self) -> Dict[str, Any]:
+        by_category: Dict[str, float] = {}
+        for s in self.spans:
+            if s is not self.root:
+                by_category[s.category] = by_category.get(s.category, 0.0) + s.duration_ms
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "started_at": self.wall_start,
+            "duration_ms": round(self.duration_ms, 3),
+            "status_code": self.status_code,
+            "error": self.error,
+            "spans": len(self.spans),
+            "dropped_spans": self.dropped_spans,
+            "time_by_category_ms": {k: round(v, 3) for k, v in sorted(by_category.items(), key=lambda i: -i[1])},
+            **({"attrs": self.attrs} if self.attrs else {}),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = self.summary()
+        data["span_list"] = [s.to_dict() for s in self.spans]
+        return data
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("trace_span", default=None)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+def current_trace_id() -> Optional[str]:
+    trace_ = _current_trace.get()
+    return trace_.trace_id if trace_ is not None else None
+
+
+def start_span(name: str, category: str = "app", **attrs):
+    """
+    Abre um span filho do span corrente e o torna corrente. Devolve NOOP_SPAN
+    se não há trace ativo. Use `finish()` (ou `with`) para fechá-lo.
+    """
+    trace_ = _current_trace.get()
+    if trace_ is None or trace_.end_ns:
+        # Sem trace, ou trace já encerrado (tarefa de background herdou o contexto)
+        return NOOP_SPAN
+    if len(trace_.spans) >= MAX_SPANS_PER_TRACE:
+        trace_.dropped_spans += 1
+        return NOOP_SPAN
+    parent = _current_span.get()
+    span_ = Span(trace_, name, category, parent.span_id if parent is not None else None, attrs or None)
+    trace_.spans.append(span_)
+    span_._token = _current_span.set(span_)
+    return span_
+
+
+# `with span(...)` é o uso principal
+span = start_span
+
+
+def record_span(name: str, duration_seconds: float, category: str = "app", **attrs):
+    """
+    Registra um span já concluído (terminando agora), para medições feitas
+    fora do tracing, como as de log_performance
+    """
+    trace_ = _current_trace.get()
+    if trace_ is None or trace_.end_ns or len(trace_.spans) >= MAX_SPANS_PER_TRACE:
+        return
+    parent = _current_span.get()
+    span_ = Span(trace_, name, category, parent.span_id if parent is not None else None, attrs or None)
+    span_.end_ns = span_.start_ns
+    span_.start_ns -= int(duration_seconds * 1e9)
+    trace_.spans.append(span_)
+
+
+def traced(name: Optional[str] = None, category: str = "app"):
+    """Decorator: executa a função (sync ou async) dentro de um span"""
+    def decorator(func: Callable):
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with start_span(span_name, category):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            with start_span(span_name, category):
+                return func(*args, **kwargs)
+        return sync_wrapper
+    return decorator
+
+
+class TailSampler:
+    """
+    Decide, ao fim do trace, se ele é guardado: lento (>= slow_ms), com erro
+    (exceção ou status >= 500) ou na amostra aleatória de `sample_rate`.
+    """
+
+    def __init__(self, slow_ms: float = 500.0, sample_rate: float = 0.01, keep_errors: bool = True):
+        self.slow_ms = slow_ms
+        self.sample_rate = sample_rate
+        self.keep_errors = keep_errors
+
+    def reason(self, trace: Trace) -> Optional[str]:
+        if trace.duration_ms >= self.slow_ms:
+            return "slow"
+        if self.keep_errors and (trace.error or (trace.status_code or 0) >= 500):
+            return "error"
+        if self.sample_rate and random.random() < self.sample_rate:
+            return "sampled"
+        return None
+
+
+class TraceStore:
+    """Traces guardados pela amostragem (os mais recentes, em memória)"""
+
+    def __init__(self, sampler: Optional[TailSampler] = None, max_traces: int = 200):
+        self.sampler = sampler or TailSampler()
+        self.traces: Deque[Trace] = deque(maxlen=max_traces)
+        self.reasons: Dict[str, str] = {}
+        self.stats = {"finished": 0, "kept": 0, "discarded": 0}
+        self._lock = threading.Lock()
+
+    def offer(self, trace: Trace) -> bool:
+        reason = self.sampler.reason(trace)
+        with self._lock:
+            self.stats["finished"] += 1
+            if reason is None:
+                self.stats["discarded"] += 1
+                return False
+            self.stats["kept"] += 1
+            if len(self.traces) == self.traces.maxlen:
+                self.reasons.pop(self.traces[0].trace_id, None)
+            self.traces.append(trace)
+            self.reasons[trace.trace_id] = reason
+            return True
+
+    def get(self, trace_id: str) -> Optional[Trace]:
+        with self._lock:
+            return next((t for t in self.traces if t.trace_id == trace_id), None)
+
+    def list(self, limit: int = 50, min_duration_ms: float = 0.0, name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Resumos dos traces guardados, mais recentes primeiro"""
+        with self._lock:
+            traces = list(self.traces)
+        result = []
+        for trace in reversed(traces):
+            if trace.duration_ms < min_duration_ms or (name and name not in trace.name):
+                continue
+            item = trace.summary()
+            item["kept_because"] = self.reasons.get(trace.trace_id)
+            result.append(item)
+            if len(result) >= limit:
+                break
+        return result
+
+    def select(self, trace_ids: Optional[Iterable[str]] = None, limit: int = 20) -> List[Trace]:
+        with self._lock:
+            traces = list(self.traces)
+        if trace_ids:
+            wanted = set(trace_ids)
+            return [t for t in traces if t.trace_id in wanted]
+        return traces[-limit:]
+
+    def clear(self):
+        with self._lock:
+            self.traces.clear()
+            self.reasons.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "stored": len(self.traces),
+                "max_traces": self.traces.maxlen,
+                "slow_ms": self.sampler.slow_ms,
+                "sample_rate": self.sampler.sample_rate,
+            }
+
+
+class _TraceScope:
+    """Context manager de `trace()`: abre o trace e o span raiz"""
+
+    __slots__ = ("trace", "store", "_tokens")
+
+    def __init__(self, trace_: Trace, store: Optional[TraceStore]):
+        self.trace = trace_
+        self.store = store
+        self._tokens = None
+
+    def __enter__(self) -> Trace:
+        trace_ = self.trace
+        trace_token = _current_trace.set(trace_)
+        root = Span(trace_, trace_.name, "request", None, None)
+        trace_.root = root
+        trace_.spans.append(root)
+        span_token = _current_span.set(root)
+        self._tokens = (trace_token, span_token)
+        return trace_
+
+    def __exit__(self, exc_type, exc, tb):
+        trace_ = self.trace
+        trace_.root.finish(exc)
+        trace_.end_ns = trace_.root.end_ns
+        trace_token, span_token = self._tokens
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+        if self.store is not None:
+            self.store.offer(trace_)
+        return False
+
+
+def trace(name: str, trace_id: Optional[str] = None, store: Optional[TraceStore] = None, **attrs) -> _TraceScope:
+    """
+    Abre um trace (para requisições, jobs ou scripts). Ao sair, o trace é
+    oferecido ao `store` (padrão: o global), que aplica a amostragem de cauda.
+    """
+    return _TraceScope(Trace(name, trace_id, attrs or None), store if store is not None else get_trace_store())
+
+
+def ensure_trace(name: str, category: str = "job", **attrs):
+    """
+    Span dentro do trace corrente ou, se não há trace em andamento (tarefa em
+    background, worker, script), um trace próprio. Tarefas de background
+    herdam o contexto da requisição já encerrada: esse trace não é reaberto.
+    """
+    active = _current_trace.get()
+    if active is not None and not active.end_ns:
+        return start_span(name, category, **attrs)
+    return trace(name, **attrs)
+
+
+# ============================================================================
+# EXPORTAÇÃO
+# ============================================================================
+
+def to_chrome_trace(traces: Iterable[Trace]) -> Dict[str, Any]:
+    """
+    Formato Trace Event (chrome://tracing, ui.perfetto.dev): um evento
+    completo ("X") por span; cada trace vira um "processo" nomeado.
+    """
+    events: List[Dict[str, Any]] = []
+    for pid, trace_ in enumerate(traces, start=1):
+        events.append({"name": "process_name", "ph": "M", "pid": pid,
+                       "args": {"name": f"{trace_.name} [{trace_.trace_id}] {trace_.duration_ms:.1f}ms"}})
+        # Origem comum: o início do trace no relógio de parede
+        origin_us = trace_.wall_start * 1e6
+        for s in trace_.spans:
+            end_ns = s.end_ns or trace_.end_ns or time.perf_counter_ns()
+            args = dict(s.attrs or {})
+            args.update(span_id=s.span_id, parent_id=s.parent_id)
+            if s.error:
+                args["error"] = s.error
+            events.append({
+                "name": s.name,
+                "cat": s.category,
+                "ph": "X",
+                "ts": round(origin_us + (s.start_ns - trace_.start_ns) / 1e3, 3),
+                "dur": round((end_ns - s.start_ns) / 1e3, 3),
+                "pid": pid,
+                "tid": s.thread_id,
+                "args": args,
+            })
+    return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"pid": _PID}}
+
+
+def _lanes(spans: List[Span], fallback_end: int) -> List[List[Span]]:
+    """
+    Distribui spans em faixas bem aninhadas (exigência do formato "evented"
+    do speedscope). Spans concorrentes (asyncio.gather) vão para faixas
+    diferentes; um filho fica na faixa do pai sempre que cabe nela.
+    """
+    ordered = sorted(spans, key=lambda s: (s.start_ns, -((s.end_ns or fallback_end) - s.start_ns)))
+    lanes: List[List[Span]] = []
+    stacks: List[List[Span]] = []
+    for s in ordered:
+        end = s.end_ns or fallback_end
+        placed = False
+        for lane, stack in zip(lanes, stacks):
+            while stack and (stack[-1].end_ns or fallback_end) <= s.start_ns:
+                stack.pop()
+            if not stack or (stack[-1].end_ns or fallback_end) >= end:
+                lane.append(s)
+                stack.append(s)
+                placed = True
+                break
+        if not placed:
+            lanes.append([s])
+            stacks.append([s])
+    return lanes
+
+
+def to_speedscope(traces: Iterable[Trace]) -> Dict[str, Any]:
+    """Arquivo speedscope (https://www.speedscope.app), um perfil por faixa de cada trace"""
+    frames: List[Dict[str, Any]] = []
+    frame_index: Dict[tuple, int] = {}
+    profiles: List[Dict[str, Any]] = []
+
+    def frame_for(s: Span) -> int:
+        key = (s.name, s.category)
+        if key not in frame_index:
+            frame_index[key] = len(frames)
+            frames.append({"name": s.name, "file": s.category})
+        return frame_index[key]
+
+    for trace_ in traces:
+        fallback_end = trace_.end_ns or time.perf_counter_ns()
+        total_us = (fallback_end - trace_.start_ns) / 1e3
+        for number, lane in enumerate(_lanes(trace_.spans, fallback_end)):
+            events = []
+            for s in lane:
+                end = s.end_ns or fallback_end
+                events.append(("O", (s.start_ns - trace_.start_ns) / 1e3, frame_for(s), -(end - s.start_ns)))
+                events.append(("C", (end - trace_.start_ns) / 1e3, frame_for(s), 0))
+            # Fechamentos antes de aberturas no mesmo instante; pais abrem antes dos filhos
+            events.sort(key=lambda e: (e[1], 0 if e[0] == "C" else 1, e[3]))
+            _fix_close_order(events)
+            name = f"{trace_.name} [{trace_.trace_id}]" + (f" #{number + 1}" if number else "")
+            profiles.append({
+                "type": "evented",
+                "name": name,
+                "unit": "microseconds",
+                "startValue": 0,
+                "endValue": round(total_us, 3),
+                "events": [{"type": kind, "frame": frame, "at": round(at, 3)} for kind, at, frame, _ in events],
+            })
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": profiles,
+        "name": "TecnoCursos AI traces",
+        "exporter": "app.core.tracing",
+    }
+
+
+def _fix_close_order(events: List[tuple]):
+    """Reordena fechamentos simultâneos para respeitar a pilha de aberturas"""
+    stack: List[int] = []
+    i = 0
+    while i < len(events):
+        kind, at, frame, _ = events[i]
+        if kind == "O":
+            stack.append(frame)
+            i += 1
+            continue
+        j = i
+        while j < len(events) and events[j][0] == "C" and events[j][1] == at:
+            j += 1
+        closing = [e[2] for e in events[i:j]]
+        ordered = []
+        for _ in closing:
+            ordered.append(stack.pop())
+        events[i:j] = [("C", at, frame_, 0) for frame_ in ordered]
+        i = j
+
+
+# ============================================================================
+# MIDDLEWARE
+# ============================================================================
+
+class TracingMiddleware:
+    """
+    Middleware ASGI: um trace por requisição HTTP, com o status da resposta
+    e o cabeçalho X-Trace-ID. Honra um X-Trace-ID recebido.
+    """
+
+    def __init__(self, app, store: Optional[TraceStore] = None, exclude_paths: Iterable[str] = ()):
+        self.app = app
+        self.store = store
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("path", "").startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+
+        incoming = None
+        for key, value in scope.get("headers", ()):
+            if key == b"x-trace-id":
+                incoming = value.decode("latin-1")[:64]
+                break
+
+        scope_ = trace(f"{scope.get('method', 'GET')} {scope.get('path', '')}", trace_id=incoming,
+                       store=self.store, method=scope.get("method"), path=scope.get("path"))
+        trace_ = scope_.trace
+        header = (b"x-trace-id", trace_.trace_id.encode("latin-1"))
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                trace_.status_code = message.get("status")
+                message = dict(message)
+                message["headers"] = list(message.get("headers", [])) + [header]
+            await send(message)
+
+        with scope_:
+            await self.app(scope, receive, send_wrapper)
+            route = scope.get("route")
+            if route is not None and getattr(route, "path", None):
+                # Agrupa por template de rota (/api/scenes/{scene_id}), não pelo path concreto
+                trace_.name = f"{scope.get('method', 'GET')} {route.path}"
+
+
+# ============================================================================
+# INSTÂNCIA GLOBAL
+# ============================================================================
+
+_trace_store: Optional[TraceStore] = None
+
+
+def get_trace_store() -> TraceStore:
+    """Store global, configurado pelas settings tracing_* na primeira chamada"""
+    global _trace_store
+    if _trace_store is None:
+        try:
+            from app.config import get_settings
+            settings = get_settings()
+            sampler = TailSampler(
+                slow_ms=getattr(settings, "tracing_slow_ms", 500.0),
+                sample_rate=getattr(settings, "tracing_sample_rate", 0.01),
+            )
+            _trace_store = TraceStore(sampler, max_traces=getattr(settings, "tracing_max_traces", 200))
+        except Exception as e:
+            logger.warning(f"⚠️ Configuração de tracing indisponível, usando padrões: {e}")
+            _trace_store = TraceStore()
+    return _trace_store
@@ -3,28 +3,136 @@ Sistema de banco de dados para TecnoCursos AI
 Usando SQLite para simplicidade e portabilidade
 """
 
-from sqlalchemy import create_engine, MetaData, text
+from sqlalchemy import create_engine, MetaData, text, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
-from typing import Generator
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool, QueuePool
+from typing import Any, AsyncGenerator, Dict, Generator
 import logging
 import asyncio
 
 from app.config import get_settings
+from app.core.tracing import current_trace, start_span
+
+try:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    ASYNC_SQLALCHEMY_AVAILABLE = True
+except ImportError:
+    ASYNC_SQLALCHEMY_AVAILABLE = False
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
-# Configuração do SQLite com pooling
 SQLALCHEMY_DATABASE_URL = settings.database_url
 
+# Drivers assíncronos equivalentes aos drivers síncronos padrão
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+}
+
+def _is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+def _is_sqlite_memory(url: str) -> bool:
+    database = make_url(url).database
+    return not database or database == ":memory:" or "mode=memory" in url
+
+def engine_options(url: str) -> Dict[str, Any]:
+    """
+    Opções de pool conforme a URL:
+    - SQLite em memória: StaticPool (uma conexão compartilhada, senão cada
+      conexão veria um banco vazio)
+    - SQLite em arquivo: QueuePool + WAL, leitores concorrentes com um escritor
+    - Demais bancos: QueuePool com pre-ping e reciclagem de conexões
+    """
+    if _is_sqlite(url):
+        options: Dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+        if _is_sqlite_memory(url):
+            options["poolclass"] = StaticPool
+            return options
+        options["connect_args"]["timeout"] = settings.sqlite_busy_timeout_ms / 1000
+    else:
+        options = {"pool_recycle": settings.db_pool_recycle}
+    
+    options.update({
+        "poolclass": QueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    })
+    return options
+
+def configure_sqlite(target: Engine, url: str):
+    """Aplica PRAGMAs (WAL, busy_timeout, synchronous) a cada nova conexão SQLite"""
+    if not _is_sqlite(url):
+        return
+    use_wal = settings.sqlite_wal and not _is_sqlite_memory(url)
+    
+    @event.listens_for(target, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA busy_timeout = {int(settings.sqlite_busy_timeout_ms)}")
+            if use_wal:
+                cursor.execute("PRAGMA journal_mode = WAL")
+                # Seguro com WAL e evita fsync a cada commit
+                cursor.execute("PRAGMA synchronous = NORMAL")
+        finally:
+            cursor.close()
+
+def configure_tracing(target: Engine):
+    """Um span "db.query" por execução de cursor quando há um trace ativo"""
+    
+    @event.listens_for(target, "before_cursor_execute")
+    def _start_query_span(conn, cursor, statement, parameters, context, executemany):
+        if current_trace() is None:
+            return
+        span = start_span("db.query", category="db", statement=statement[:300], executemany=executemany)
+        if context is not None:
+            context._trace_span = span
+    
+    @event.listens_for(target, "after_cursor_execute")
+    def _finish_query_span(conn, cursor, statement, parameters, context, executemany):
+        span = getattr(context, "_trace_span", None)
+        if span is not None:
+            rowcount = getattr(cursor, "rowcount", -1)
+            if rowcount is not None and rowcount >= 0:
+                span.set(rows=rowcount)
+            span.finish()
+            context._trace_span = None
+    
+    @event.listens_for(target, "handle_error")
+    def _fail_query_span(exception_context):
+        span = getattr(exception_context.execution_context, "_trace_span", None)
+        if span is not None:
+            span.finish(exception_context.original_exception)
+            exception_context.execution_context._trace_span = None
+
+def build_engine(url: str, **kwargs) -> Engine:
+    """Cria engine síncrono com pool, PRAGMAs adequados à URL e spans de query"""
+    options = engine_options(url)
+    options.update(kwargs)
+    new_engine = create_engine(url, **options)
+    configure_sqlite(new_engine, url)
+    configure_tracing(new_engine)
+    return new_engine
+
+def async_url_for(url: str) -> str:
+    """Deriva a URL assíncrona (sqlite -> sqlite+aiosqlite, postgresql -> asyncpg...)"""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.drivername)
+    if driver is None:
+        return url
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
 # Engine do SQLAlchemy
-engine = create_engine(
+engine = build_engine(
     SQLALCHEMY_DATABASE_URL,
-    poolclass=StaticPool,
-    connect_args={
-        "check_same_thread": False,  # Necessário para SQLite
-    },
     echo=settings.debug,  # Log SQL queries em debug
 )
 
@@ -35,6 +143,69 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# Engine assíncrono: criado sob demanda, pois depende do driver (aiosqlite/asyncpg)
+_async_engine = None
+_async_session_factory = None
+
+def async_uses_sync_engine() -> bool:
+    """
+    SQLite em memória sem `async_database_url`: um engine assíncrono abriria
+    outra conexão, ou seja, outro banco vazio. As sessões assíncronas usam
+    então a conexão compartilhada do engine síncrono (ver SyncSessionAdapter).
+    """
+    return not settings.async_database_url and _is_sqlite(SQLALCHEMY_DATABASE_URL) \
+        and _is_sqlite_memory(SQLALCHEMY_DATABASE_URL)
+
+class SyncSessionAdapter:
+    """
+    Interface mínima de AsyncSession (`run_sync`, commit, rollback, close)
+    sobre uma Session síncrona; as chamadas rodam direto no event loop.
+    """
+
+    def __init__(self, session: Session):
+        self.sync_session = session
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self.sync_session, *args, **kwargs)
+
+    async def commit(self):
+        self.sync_session.commit()
+
+    async def rollback(self):
+        self.sync_session.rollback()
+
+    async def close(self):
+        self.sync_session.close()
+
+def get_async_engine():
+    """Obtém (criando na primeira chamada) o engine assíncrono"""
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        if async_uses_sync_engine():
+            raise RuntimeError(
+                "SQLite em memória não tem engine assíncrono: ele veria outro banco vazio. "
+                "Use get_async_db (que recorre ao engine síncrono) ou configure async_database_url"
+            )
+        if not ASYNC_SQLALCHEMY_AVAILABLE:
+            raise RuntimeError("sqlalchemy.ext.asyncio indisponível (instale greenlet)")
+        url = settings.async_database_url or async_url_for(SQLALCHEMY_DATABASE_URL)
+        options = engine_options(SQLALCHEMY_DATABASE_URL)
+        if options.get("poolclass") is QueuePool:
+            # Engines assíncronos usam a variante asyncio do QueuePool
+            options["poolclass"] = AsyncAdaptedQueuePool
+        _async_engine = create_async_engine(url, echo=settings.debug, **options)
+        configure_sqlite(_async_engine.sync_engine, SQLALCHEMY_DATABASE_URL)
+        configure_tracing(_async_engine.sync_engine)
+        _async_session_factory = async_sessionmaker(
+            _async_engine, expire_on_commit=False, autoflush=False
+        )
+    return _async_engine
+
+def get_async_session_factory():
+    """Factory de AsyncSession ligada ao engine assíncrono"""
+    get_async_engine()
+    return _async_session_factory
+
 # Base para modelos - Usando SQLAlchemy 2.0 compatible
 from sqlalchemy.orm import DeclarativeBase
 
@@ -57,11 +228,90 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+def get_db_session() -> Session:
+    """Sessão avulsa para serviços fora do ciclo de request (o chamador fecha)"""
+    return SessionLocal()
+
+async def get_async_db() -> AsyncGenerator["AsyncSession", None]:
+    """
+    Dependency para obter AsyncSession; consultas aguardadas não bloqueiam o loop.
+
+    Com SQLite em memória, entrega um SyncSessionAdapter sobre o mesmo banco
+    das sessões síncronas.
+    """
+    if async_uses_sync_engine():
+        db = SyncSessionAdapter(SessionLocal())
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Erro na sessão do banco: {e}")
+            await db.rollback()
+            raise
+        finally:
+            await db.close()
+        return
+
+    async with get_async_session_factory()() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Erro na sessão assíncrona do banco: {e}")
+            await db.rollback()
+            raise
+
+async def dispose_engines():
+    """Fecha os pools de conexões (shutdown da aplicação)"""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
+    engine.dispose()
+
+def _pool_stats(pool) -> Dict[str, Any]:
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        })
+    return status
+
+def get_pool_status() -> Dict[str, Any]:
+    """Estado dos pools de conexões (o assíncrono só depois de criado)"""
+    status = _pool_stats(engine.pool)
+    if async_uses_sync_engine():
+        status["async"] = {"pool_class": "shared_sync_engine"}
+    else:
+        status["async"] = _pool_stats(_async_engine.sync_engine.pool) if _async_engine is not None else None
+    return status
+
+def _ensure_model_indexes():
+    """Cria índices declarados nos modelos que faltem em tabelas já existentes"""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(bind=engine, checkfirst=True)
+            except Exception as e:
+                logger.warning(f"Índice {index.name} não criado: {e}")
+
+def _ensure_search_indexes():
+    """Cria/popula os índices de busca full-text de cenas e assets"""
+    try:
+        from app.services.search_index_service import ensure_search_indexes
+        ensure_search_indexes(engine)
+    except Exception as e:
+        logger.warning(f"Índices de busca não inicializados: {e}")
+
 async def create_database():
     """Cria o banco de dados e todas as tabelas"""
     try:
         # Criar todas as tabelas
         Base.metadata.create_all(bind=engine)
+        _ensure_model_indexes()
+        _ensure_search_indexes()
         logger.info("Banco de dados criado com sucesso")
         return True
     except Exception as e:
@@ -74,6 +324,8 @@ def create_database_sync():
     """
     try:
         Base.metadata.create_all(bind=engine)
+        _ensure_model_indexes()
+        _ensure_search_indexes()
         logger.info("Banco de dados criado com sucesso")
     except Exception as e:
         logger.error(f"Erro ao criar banco de dados: {e}")
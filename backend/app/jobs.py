@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Handlers da Fila de Jobs - TecnoCursos AI
+
+Tarefas longas executadas pelos workers (app.worker ou o worker embutido na
+API). Cada handler recebe um JobContext, pode registrar progresso e devolve
+um resultado serializável em JSON; exceções levam a novo retry conforme a
+task (PermanentJobError encerra o job).
+
+Filas:
+- render: geração de vídeo de projetos (scenes)
+- export: exportação de vídeo com montagem MoviePy (video_export)
+- tts: narrações do processamento assíncrono de áudios
+
+Autor: TecnoCursos AI System
+"""
+
+import asyncio
+import logging
+
+from app.core.job_queue import JobContext, PermanentJobError, job_task
+
+logger = logging.getLogger(__name__)
+
+
+@job_task("video.generate_project", queue="render", max_attempts=2, retry_base=30)
+async def generate_project_video(ctx: JobContext):
+    """Geração de vídeo de um projeto (antes um BackgroundTask em routers/scenes.py)"""
+    from app.services.video_generation_service import video_generation_service
+
+    payload = ctx.payload
+    ctx.set_progress(5, "Gerando vídeo")
+    video_result = await video_generation_service.generate_project_video(
+        project_id=payload["project_id"],
+        user_id=payload["user_id"],
+        quality=payload["quality"],
+        include_avatar=payload["include_avatar"],
+        include_narration=payload["include_narration"],
+    )
+    if not video_result.get("success"):
+        raise RuntimeError(video_result.get("error") or "Falha na geração do vídeo")
+    logger.info(f"✅ Vídeo do projeto {payload['project_id']} gerado: {video_result.get('filename')}")
+    return video_result
+
+
+@job_task("video.export", queue="export", max_attempts=2, retry_base=60)
+async def export_video(ctx: JobContext):
+    """Exportação de vídeo (antes um BackgroundTask em routers/video_export.py)"""
+    from app.routers.video_export import (
+        TTSConfig, TTSProvider, VideoExportRequest, process_video_export, video_jobs,
+    )
+
+    payload = ctx.payload
+    video_id = payload["video_id"]
+    request = VideoExportRequest(**payload["request"])
+    try:
+        tts_config = TTSConfig(
+            provider=TTSProvider(request.tts_provider),
+            voice=request.tts_voice,
+            language="pt",
+            output_format="mp3"
+        )
+    except (TypeError, ValueError) as e:
+        raise PermanentJobError(f"Configuração TTS inválida: {e}")
+
+    export = asyncio.create_task(process_video_export(video_id, request, tts_config, payload.get("user_id")))
+    # Repassa o progresso de video_jobs para o heartbeat do job
+    while not export.done():
+        await asyncio.wait({export}, timeout=2)
+        state = video_jobs.get(video_id, {})
+        ctx.set_progress(state.get("progress", 0), state.get("current_stage"))
+    await export
+
+    state = video_jobs.get(video_id, {})
+    if state.get("status") != "completed":
+        raise RuntimeError(state.get("error_message") or "Exportação não concluída")
+    return {
+        "video_id": video_id,
+        "duration": state.get("duration"),
+        "file_size": state.get("file_size"),
+    }
+
+
+@job_task("audio.narration", queue="tts", max_attempts=4, retry_base=60)
+async def audio_narration(ctx: JobContext):
+    """Narração de arquivo grande (AsyncAudioProcessor)"""
+    from app.services.async_audio_processor import ProcessingTask, async_processor
+
+    task = ProcessingTask.from_dict(dict(ctx.payload))
+    return await async_processor.process_job(task, ctx)
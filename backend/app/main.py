@@ -8,11 +8,13 @@ from __future__ import annotations
 from fastapi import FastAPI, HTTPException, Depends, Request, status
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse, FileResponse, RedirectResponse
+from fastapi.responses import JSONResponse, HTMLResponse, FileResponse, RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 import uvicorn
+import asyncio
+import importlib.util
 import logging
 import time
 import os
@@ -47,147 +49,16 @@ def create_directories():
     for directory in directories:
         Path(directory).mkdir(parents=True, exist_ok=True)
 
-# Importar routers principais
-try:
-    from app.routers import auth_router, users_router, projects_router, files_router, admin_router, stats_router
-    _core_routers_available = True
-except ImportError as e:
-    print(f"⚠️ Erro ao importar routers principais: {e}")
-    _core_routers_available = False
-
-# Tentar importar router do editor de vídeo
-try:
-    from app.routers.video_editor_advanced import router as video_editor_router
-    _video_editor_available = True
-except ImportError:
-    video_editor_router = None
-    _video_editor_available = False
-    print("⚠️ Video Editor Router não disponível")
-
-# Tentar importar router do avatar
-try:
-    from app.routers import avatar_router
-    _avatar_available = True
-    if avatar_router is None:
-        _avatar_available = False
-        print("⚠️ Avatar router é None")
-except ImportError as e:
-    avatar_router = None
-    _avatar_available = False
-    print(f"⚠️ Avatar router não disponível: {e}")
-
-# Tentar importar routers TTS
-try:
-    from app.routers import tts
-    from app.routers import tts_advanced
-    _tts_available = True
-except ImportError:
-    tts = None
-    tts_advanced = None
-    _tts_available = False
-    print("⚠️ Routers TTS não disponíveis")
-
-# Tentar importar router de admin de áudios
-try:
-    from app.routers import audio_admin
-    _audio_admin_available = True
-except ImportError:
-    audio_admin = None
-    _audio_admin_available = False
-    print("⚠️ Router de admin de áudios não disponível")
-
-# Tentar importar router de notificações
-try:
-    from app.routers.notifications import router as notifications_router
-    _notifications_available = True
-    print("✅ Router de notificações disponível")
-except ImportError:
-    notifications_router = None
-    _notifications_available = False
-    print("⚠️ Router de notificações não disponível")
-
-# Tentar importar routers avançados
-try:
-    from app.routers import batch_upload, websocket_router, analytics
-    _advanced_routers_available = True
-except ImportError:
-    batch_upload = None
-    websocket_router = None
-    analytics = None
-    _advanced_routers_available = False
-    print("⚠️ Routers avançados não disponíveis")
-
-# Tentar importar router de cenas e assets
-try:
-    from app.routers import scenes_router
-    _scenes_available = True
-except ImportError:
-    scenes_router = None
-    _scenes_available = False
-    print("⚠️ Router de cenas não disponível")
-
-# Tentar importar routers enterprise
-try:
-    from app.routers import enterprise_router, system_control
-    _enterprise_available = True
-except ImportError:
-    enterprise_router = None
-    system_control = None
-    _enterprise_available = False
-    print("⚠️ Routers enterprise não disponíveis")
+# Routers e serviços opcionais são importados sob demanda (ver ROUTERS abaixo)
+from app.core.lazy_routers import LazyRouterMiddleware, LazyRouterRegistry
+from app.core.tracing import TracingMiddleware, get_trace_store
 
-# Tentar importar routers de vídeo
-try:
-    from app.routers import video_generation, advanced_video_processing, video_export
-    _video_routers_available = True
-except ImportError:
-    video_generation = None
-    advanced_video_processing = None
-    video_export = None
-    _video_routers_available = False
-    print("⚠️ Routers de vídeo não disponíveis")
-
-# Importar novos routers
-try:
-    from app.routers.analytics import router as analytics_router
-    from app.routers.export import router as export_router
-    _new_routers_available = True
-    print("✅ Novos routers (analytics, export) disponíveis")
-except ImportError:
-    analytics_router = None
-    export_router = None
-    _new_routers_available = False
-    print("⚠️ Novos routers não disponíveis")
-
-# 🆕 NOVOS SERVIÇOS 2025 - Tecnologias de Vanguarda
-# Tentar importar routers dos novos serviços de última geração
-try:
-    from app.routers.modern_ai_router import router as modern_ai_router
-    _modern_ai_available = True
-    print("✅ Modern AI Router disponível")
-except ImportError:
-    modern_ai_router = None
-    _modern_ai_available = False
-    print("⚠️ Modern AI Router não disponível")
-
-try:
-    from app.routers.quantum_router import router as quantum_router
-    _quantum_available = True
-    print("✅ Quantum Optimization Router disponível")
-except ImportError:
-    quantum_router = None
-    _quantum_available = False
-    print("⚠️ Quantum Router não disponível")
-
-try:
-    from app.services.edge_computing_service import get_edge_computing_service, initialize_edge_computing
-    _edge_computing_available = True
-    print("✅ Edge Computing Service disponível")
-except ImportError:
-    get_edge_computing_service = None
-    initialize_edge_computing = None
-    _edge_computing_available = False
-    print("⚠️ Edge Computing Service não disponível")
+def _module_available(module: str) -> bool:
+    """Verifica se o módulo existe sem executá-lo"""
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
 
 # Configuração de logging
 try:
@@ -303,134 +174,85 @@ app.state.start_time = time.time()
 # INCLUSÃO DE ROUTERS
 # ============================================================================
 
-# Routers principais (obrigatórios)
-if _core_routers_available:
-    try:
-        app.include_router(auth_router, prefix="/api/auth", tags=["Autenticação"])
-        app.include_router(users_router, prefix="/api/users", tags=["Usuários"])
-        app.include_router(projects_router, prefix="/api/projects", tags=["Projetos"])
-        app.include_router(files_router, prefix="/api/files", tags=["Arquivos"])
-        app.include_router(admin_router, prefix="/admin", tags=["Administração"])
-        app.include_router(stats_router, prefix="/api/stats", tags=["Estatísticas"])
-        logger.info("✅ Routers principais incluídos com sucesso")
-    except Exception as e:
-        logger.error(f"❌ Erro ao incluir routers principais: {e}")
-
-# Router do editor de vídeo
-if _video_editor_available and video_editor_router:
-    try:
-        app.include_router(video_editor_router, prefix="/api/editor", tags=["Editor de Vídeo"])
-        logger.info("✅ Video Editor Router incluído")
-    except Exception as e:
-        logger.error(f"❌ Erro ao incluir Video Editor router: {e}")
-
-# Router de avatar
-if _avatar_available and avatar_router:
-    try:
-        app.include_router(avatar_router, prefix="/api/avatar", tags=["Avatar"])
-        logger.info("✅ Avatar Router incluído")
-    except Exception as e:
-        logger.error(f"❌ Erro ao incluir Avatar router: {e}")
-
-# Routers TTS
-if _tts_available:
-    try:
-        if tts:
-            app.include_router(tts.router, prefix="/api/tts", tags=["TTS"])
-        if tts_advanced:
-            app.include_router(tts_advanced.router, prefix="/api/tts/advanced", tags=["TTS Avançado"])
-        logger.info("✅ Routers TTS incluídos")
-    except Exception as e:
-        logger.error(f"❌ Erro ao incluir routers TTS: {e}")
-
-# Router de admin de áudios
-if _audio_admin_available and audio_admin:
-    try:
-        app.include_router(audio_admin.router, prefix="/api/audio", tags=["Admin de Áudios"])
-        logger.info("✅ Audio Admin Router incluído")
-    except Exception as e:
-        logger.error(f"❌ Erro ao incluir Audio Admin router: {e}")
-
-# Router de notificações
-if _notifications_available and notifications_router:
-    try:
-        app.include_router(notifications_router, prefix="/api", tags=["Notificações"])
-        logger.info("✅ Router de notificações incluído")
-    except Exception as e:
-        logger.error(f"❌ Erro ao incluir router de notificações: {e}")
-
-# Routers avançados
-if _advanced_routers_available:
-    try:
-        if batch_upload:
-            app.include_router(batch_upload, prefix="/api/batch", tags=["Upload em Lote"])
-        if websocket_router:
-            app.include_router(websocket_router, prefix="/api/websocket", tags=["WebSocket"])
-        if analytics:
-            app.include_router(analytics, prefix="/api/analytics", tags=["Analytics"])
-        logger.info("✅ Routers avançados incluídos")
-    except Exception as e:
-        logger.error(f"❌ Erro ao incluir routers avançados: {e}")
+# Cada router é importado no primeiro request ao seu prefixo (ou todos, com
+# LAZY_ROUTERS=false). `match` restringe o gatilho quando o prefixo de montagem
+# é mais amplo que as rotas do router.
+ROUTERS = [
+    # Routers principais
+    ("auth", "app.routers.auth", "router", "/api/auth", ["Autenticação"], ()),
+    ("users", "app.routers.users", "router", "/api/users", ["Usuários"], ()),
+    ("projects", "app.routers.projects", "router", "/api/projects", ["Projetos"], ()),
+    ("files", "app.routers.files", "router", "/api/files", ["Arquivos"], ()),
+    ("admin", "app.routers.admin", "router", "/admin", ["Administração"], ()),
+    ("stats", "app.routers.stats", "router", "/api/stats", ["Estatísticas"], ()),
+    # Editor de vídeo e avatar
+    ("video_editor", "app.routers.video_editor_advanced", "router", "/api/editor", ["Editor de Vídeo"], ()),
+    ("avatar", "app.routers.avatar", "avatar_router", "/api/avatar", ["Avatar"], ()),
+    # TTS e áudios
+    ("tts", "app.routers.tts", "router", "/api/tts", ["TTS"], ()),
+    ("tts_advanced", "app.routers.tts_advanced", "router", "/api/tts/advanced", ["TTS Avançado"], ()),
+    ("audio_admin", "app.routers.audio_admin", "router", "/api/audio", ["Admin de Áudios"], ()),
+    ("notifications", "app.routers.notifications", "router", "/api", ["Notificações"], ("/api/notifications",)),
+    # Routers avançados
+    ("batch_upload", "app.routers.batch_upload", "router", "/api/batch", ["Upload em Lote"], ()),
+    ("websocket", "app.routers.websocket_router", "router", "/api/websocket", ["WebSocket"], ()),
+    ("analytics", "app.routers.analytics", "router", "/api/analytics", ["Analytics"], ()),
+    ("scenes", "app.routers.scenes", "router", "/api/scenes", ["Cenas"], ()),
+    # Enterprise
+    ("enterprise", "app.routers.enterprise_router", "enterprise_router", "/enterprise", ["Enterprise"], ()),
+    ("system_control", "app.routers.system_control", "router", "/api/system", ["Controle do Sistema"], ()),
+    # Vídeo
+    ("video_generation", "app.routers.video_generation", "router", "/api/video/generation", ["Geração de Vídeo"], ()),
+    ("advanced_video_processing", "app.routers.advanced_video_processing", "router", "/api/video/processing", ["Processamento Avançado"], ()),
+    ("video_export", "app.routers.video_export", "router", "/api/video/export", ["Exportação de Vídeo"], ()),
+    ("export", "app.routers.export", "router", "/api/export", ["Export"], ()),
+    # 🆕 NOVOS SERVIÇOS 2025
+    ("modern_ai", "app.routers.modern_ai_router", "router", "/api/modern-ai", ["Modern AI"], ()),
+    ("quantum", "app.routers.quantum_router", "router", "/api/quantum", ["Quantum Optimization"], ()),
+]
+
+async def _initialize_modern_ai():
+    from app.services.modern_ai_service import initialize_modern_ai
+    await initialize_modern_ai()
+    logger.info("🤖 Modern AI Service inicializado com sucesso")
+
+async def _initialize_quantum():
+    from app.services.quantum_optimization_service import get_quantum_optimization_service
+    get_quantum_optimization_service()
+    logger.info("🔬 Quantum Optimization Service inicializado com sucesso")
+
+ROUTER_INITIALIZERS = {
+    "modern_ai": _initialize_modern_ai,
+    "quantum": _initialize_quantum,
+}
+
+router_registry = LazyRouterRegistry(app)
+for name, module, attr, prefix, tags, match in ROUTERS:
+    router_registry.register(name, module, attr=attr, prefix=prefix, tags=tags, match=match,
+                             on_mount=ROUTER_INITIALIZERS.get(name))
+app.state.router_registry = router_registry
+
+if settings.lazy_routers:
+    app.add_middleware(LazyRouterMiddleware, registry=router_registry,
+                       load_all_paths=(app.openapi_url, app.docs_url, app.redoc_url))
+    logger.info(f"✅ {len(ROUTERS)} routers registrados para montagem sob demanda")
+else:
+    router_registry.load_now()
+    logger.info(f"✅ Routers montados: {router_registry.get_status()['mounted']}/{len(ROUTERS)}")
 
-# Router de cenas
-if _scenes_available and scenes_router:
-    try:
-        app.include_router(scenes_router, prefix="/api/scenes", tags=["Cenas"])
-        logger.info("✅ Scenes Router incluído")
-    except Exception as e:
-        logger.error(f"❌ Erro ao incluir Scenes router: {e}")
+# Métricas Prometheus (labels por template de rota; multiprocesso via
+# PROMETHEUS_MULTIPROC_DIR). Scrape síncrono: roda no threadpool
+if settings.prometheus_enabled:
+    from app.monitoring.prometheus_metrics import CONTENT_TYPE_LATEST, PrometheusMiddleware, get_metrics
+    app.add_middleware(PrometheusMiddleware, exclude_paths=("/metrics",))
 
-# Routers enterprise
-if _enterprise_available:
-    try:
-        if enterprise_router:
-            app.include_router(enterprise_router, prefix="/enterprise", tags=["Enterprise"])
-        if system_control:
-            app.include_router(system_control, prefix="/api/system", tags=["Controle do Sistema"])
-        logger.info("✅ Routers enterprise incluídos")
-    except Exception as e:
-        logger.error(f"❌ Erro ao incluir routers enterprise: {e}")
+    @app.get("/metrics", include_in_schema=False)
+    def prometheus_metrics():
+        return Response(get_metrics(), media_type=CONTENT_TYPE_LATEST)
 
-# Routers de vídeo
-if _video_routers_available:
-    try:
-        if video_generation:
-            app.include_router(video_generation, prefix="/api/video/generation", tags=["Geração de Vídeo"])
-        if advanced_video_processing:
-            app.include_router(advanced_video_processing, prefix="/api/video/processing", tags=["Processamento Avançado"])
-        if video_export:
-            app.include_router(video_export, prefix="/api/video/export", tags=["Exportação de Vídeo"])
-        logger.info("✅ Routers de vídeo incluídos")
-    except Exception as e:
-        logger.error(f"❌ Erro ao incluir routers de vídeo: {e}")
-
-# Novos routers (analytics e export)
-if _new_routers_available:
-    try:
-        if analytics_router:
-            app.include_router(analytics_router, prefix="/api/analytics", tags=["Analytics"])
-        if export_router:
-            app.include_router(export_router, prefix="/api/export", tags=["Export"])
-        logger.info("✅ Novos routers (analytics, export) incluídos")
-    except Exception as e:
-        logger.error(f"❌ Erro ao incluir novos routers: {e}")
-
-# 🆕 NOVOS SERVIÇOS 2025
-# Modern AI Router
-if _modern_ai_available and modern_ai_router:
-    try:
-        app.include_router(modern_ai_router, prefix="/api/modern-ai", tags=["Modern AI"])
-        logger.info("🤖 Modern AI Router incluído - Multimodal AI")
-    except Exception as e:
-        logger.error(f"❌ Erro ao incluir Modern AI router: {e}")
-
-# Quantum Optimization Router
-if _quantum_available and quantum_router:
-    try:
-        app.include_router(quantum_router, prefix="/api/quantum", tags=["Quantum Optimization"])
-        logger.info("🔬 Quantum Optimization Router incluído - Quantum Algorithms")
-    except Exception as e:
-        logger.error(f"❌ Erro ao incluir Quantum router: {e}")
+# Tracing por requisição (mais externo: inclui a montagem preguiçosa de routers)
+if settings.tracing_enabled:
+    app.add_middleware(TracingMiddleware, store=get_trace_store(), exclude_paths=("/static",))
 
 # ============================================================================
 # EVENTOS DE INICIALIZAÇÃO
@@ -438,28 +260,25 @@ if _quantum_available and quantum_router:
 
 async def initialize_services():
     """Inicializa todos os serviços principais da aplicação."""
-    if _modern_ai_available:
-        try:
-            from app.services.modern_ai_service import initialize_modern_ai
-            await initialize_modern_ai()
-            logger.info("🤖 Modern AI Service inicializado com sucesso")
-        except Exception as e:
-            logger.warning(f"⚠️ Erro ao inicializar Modern AI: {e}")
+    # Serviços dos routers (Modern AI, Quantum) inicializam quando o router é
+    # montado; no modo preguiçoso, no primeiro request ao prefixo
+    await router_registry.initialize_mounted()
 
-    if _edge_computing_available:
+    if _module_available("app.services.edge_computing_service"):
         try:
+            from app.services.edge_computing_service import initialize_edge_computing
             await initialize_edge_computing()
             logger.info("🌐 Edge Computing Service inicializado com sucesso")
         except Exception as e:
             logger.warning(f"⚠️ Erro ao inicializar Edge Computing: {e}")
 
-    if _quantum_available:
-        try:
-            from app.services.quantum_optimization_service import get_quantum_optimization_service
-            quantum_service = get_quantum_optimization_service()
-            logger.info("🔬 Quantum Optimization Service inicializado com sucesso")
-        except Exception as e:
-            logger.warning(f"⚠️ Erro ao inicializar Quantum Service: {e}")
+    # Catálogo de templates em memória (índices montados uma vez)
+    try:
+        from app.services.scene_template_service import scene_template_service
+        catalog = scene_template_service.load_catalog()
+        logger.info(f"🎨 Catálogo de templates carregado: {len(catalog)} templates")
+    except Exception as e:
+        logger.warning(f"⚠️ Erro ao carregar catálogo de templates: {e}")
 
     # Inicializar outros serviços enterprise se disponíveis
     try:
@@ -491,6 +310,22 @@ async def startup_event():
         # Inicializar serviços
         await initialize_services()
         
+        # Escritas do ORM em cenas/assets invalidam o cache de cenas (qualquer router)
+        import app.services.scenes_cache_service  # noqa: F401
+        
+        # Agendador compartilhado dos jobs periódicos dos serviços
+        from app.core.scheduler import get_scheduler
+        await get_scheduler().start()
+        
+        # Worker da fila de jobs (render/export/TTS) neste processo, se habilitado
+        from app.core.job_queue import get_job_queue, start_embedded_worker
+        await start_embedded_worker()
+        get_scheduler().add_job("job_queue.purge", get_job_queue().purge, interval=3600, jitter=60)
+        
+        # Carregar em background os routers ainda não montados
+        if settings.lazy_routers and settings.lazy_routers_warmup:
+            app.state.router_warmup = asyncio.create_task(router_registry.warmup())
+        
         logger.info("✅ Sistema inicializado com sucesso")
         
     except Exception as e:
@@ -502,9 +337,24 @@ async def shutdown_event():
     """Eventos executados no encerramento da aplicação"""
     logger.info("🔄 Encerrando TecnoCursos AI Enterprise Edition 2025...")
     
+    # Parar jobs periódicos
+    try:
+        from app.core.scheduler import get_scheduler
+        await get_scheduler().stop()
+    except Exception as e:
+        logger.warning(f"Erro ao parar agendador: {e}")
+    
+    # Jobs em execução terminam; os não concluídos voltam à fila quando a lease expira
+    try:
+        from app.core.job_queue import stop_embedded_worker
+        await stop_embedded_worker()
+    except Exception as e:
+        logger.warning(f"Erro ao parar worker da fila de jobs: {e}")
+    
     # Fechar conexões de banco
     try:
-        engine.dispose()
+        from app.database import dispose_engines
+        await dispose_engines()
         logger.info("✅ Conexões de banco fechadas")
     except:
         pass
@@ -593,21 +443,21 @@ async def health_check():
         # Verificar serviços disponíveis
         services_status = {
             "database": "connected" if db_healthy else "disconnected",
-            "avatar_service": "available" if _avatar_available else "unavailable",
-            "tts_service": "available" if _tts_available else "unavailable",
-            "audio_admin": "available" if _audio_admin_available else "unavailable",
-            "advanced_features": "available" if _advanced_routers_available else "unavailable",
-            "enterprise_features": "available" if _enterprise_available else "unavailable",
-            "video_processing": "available" if _video_routers_available else "unavailable",
-            "modern_ai": "available" if _modern_ai_available else "unavailable",
-            "quantum_optimization": "available" if _quantum_available else "unavailable",
-            "edge_computing": "available" if _edge_computing_available else "unavailable"
+            "avatar_service": router_registry.status("avatar"),
+            "tts_service": router_registry.status("tts", "tts_advanced"),
+            "audio_admin": router_registry.status("audio_admin"),
+            "advanced_features": router_registry.status("batch_upload", "websocket", "analytics"),
+            "enterprise_features": router_registry.status("enterprise", "system_control"),
+            "video_processing": router_registry.status("video_generation", "advanced_video_processing", "video_export"),
+            "modern_ai": router_registry.status("modern_ai"),
+            "quantum_optimization": router_registry.status("quantum"),
+            "edge_computing": "available" if _module_available("app.services.edge_computing_service") else "unavailable"
         }
         
-        # Calcular score de saúde geral
-        healthy_services = sum(1 for status in services_status.values() if "available" in status or "connected" in status)
-        total_services = len(services_status)
-        health_score = (healthy_services / total_services) * 100
+        # Calcular score de saúde geral (routers ainda não importados ficam de fora)
+        known_services = [status for status in services_status.values() if status != "pending"]
+        healthy_services = sum(1 for status in known_services if status in ("available", "connected"))
+        health_score = (healthy_services / len(known_services)) * 100
         
         # Determinar status geral
         if health_score >= 90:
@@ -702,15 +552,15 @@ async def system_info():
         "environment": settings.environment,
         "description": "Plataforma SaaS para criação de conteúdo educacional com IA",
         "features": {
-            "authentication": True,
-            "file_upload": True,
-            "video_generation": _video_routers_available,
-            "tts": _tts_available,
-            "avatar": _avatar_available,
-            "enterprise": _enterprise_available,
-            "modern_ai": _modern_ai_available,
-            "quantum": _quantum_available,
-            "edge_computing": _edge_computing_available
+            "authentication": "available",
+            "file_upload": "available",
+            "video_generation": router_registry.status("video_generation", "advanced_video_processing", "video_export"),
+            "tts": router_registry.status("tts", "tts_advanced"),
+            "avatar": router_registry.status("avatar"),
+            "enterprise": router_registry.status("enterprise", "system_control"),
+            "modern_ai": router_registry.status("modern_ai"),
+            "quantum": router_registry.status("quantum"),
+            "edge_computing": "available" if _module_available("app.services.edge_computing_service") else "unavailable"
         },
         "endpoints": {
             "health": "/api/health",
@@ -17,7 +17,7 @@ from fastapi import FastAPI, Request, HTTPException, Depends
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from contextlib import asynccontextmanager
 import logging
 from datetime import datetime
@@ -245,6 +245,14 @@ async def get_detailed_metrics():
     from datetime import timedelta
     return monitoring_service.get_detailed_report(timedelta(hours=1))
 
+@app.get("/metrics/prometheus", tags=["system"], response_class=PlainTextResponse)
+async def get_prometheus_metrics():
+    """Percentis de latência por endpoint no formato do Prometheus"""
+    return PlainTextResponse(
+        monitoring_service.export_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
 @app.get("/backup/status", tags=["system"])
 async def backup_status():
     """Status do sistema de backup"""
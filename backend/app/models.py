@@ -3,7 +3,7 @@ Modelos de dados para TecnoCursos AI
 Usando SQLAlchemy ORM com SQLite
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -255,6 +255,10 @@ class Scene(Base):
     Cada cena contém configurações visuais e uma lista de assets
     """
     __tablename__ = "scenes"
+    __table_args__ = (
+        # Listagem/paginação por projeto em (ordem, id) sem ordenar em memória
+        Index("ix_scenes_project_ordem", "project_id", "ordem"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     uuid = Column(String(36), unique=True, index=True, default=lambda: str(uuid.uuid4()))
@@ -477,10 +481,29 @@ class Asset(Base):
     last_editor = relationship("User", foreign_keys=[last_modified_by])
     parent_asset = relationship("Asset", remote_side=[id])
     child_assets = relationship("Asset", back_populates="parent_asset")
+    tag_links = relationship("AssetTag", back_populates="asset", cascade="all, delete-orphan")
     
     def __repr__(self):
         return f"<Asset(name='{self.name}', tipo='{self.tipo}', cena='{self.scene.name if self.scene else 'Biblioteca'}', camada={self.camada})>"
 
+class AssetTag(Base):
+    """
+    Tag normalizada de asset - espelha `Asset.library_tags` em uma tabela
+    indexada para filtros por tag sem varrer o JSON
+    """
+    __tablename__ = "asset_tags"
+    __table_args__ = (
+        Index("ix_asset_tags_tag_asset", "tag", "asset_id"),
+    )
+
+    asset_id = Column(Integer, ForeignKey("assets.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String(100), primary_key=True)  # Tag normalizada (minúsculas, sem espaços extras)
+
+    asset = relationship("Asset", back_populates="tag_links")
+
+    def __repr__(self):
+        return f"<AssetTag(asset_id={self.asset_id}, tag='{self.tag}')>"
+
 class SceneTemplate(Base):
     """
     Modelo de template de cena - templates pré-definidos para criação rápida
@@ -12,10 +12,10 @@ from pydantic import BaseModel
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from .database import get_db, engine
-from .models import User, Project, FileUpload, Video
-from .config import get_settings
-from .logger import get_logger, log_performance_metric
+from ..database import get_db, engine
+from ..models import User, Project, FileUpload, Video
+from ..config import get_settings
+from ..logger import get_logger, log_performance_metric
 
 logger = get_logger("monitoring")
 settings = get_settings()
@@ -20,6 +20,10 @@ Funcionalidades:
 - Métricas de cache Redis
 - Custom metrics para business logic
 - Health checks avançados
+- Labels de baixa cardinalidade: template da rota (/api/scenes/{scene_id}),
+  nunca o path concreto; séries filhas pré-resolvidas no caminho quente
+- Modo multiprocesso (PROMETHEUS_MULTIPROC_DIR) para workers gunicorn/uvicorn,
+  com compactação dos arquivos de workers encerrados
 
 Autor: TecnoCursos AI System
 Data: 17/01/2025
@@ -27,24 +31,32 @@ Data: 17/01/2025
 
 import time
 import asyncio
+import glob
 import logging
 from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from functools import wraps
+from contextlib import contextmanager
 import psutil
 import os
 
+try:
+    import fcntl
+except ImportError:  # Windows: compactação sem lock entre processos
+    fcntl = None
+
 try:
     from prometheus_client import (
-        Counter, Histogram, Gauge, Info, Enum,
-        CollectorRegistry, generate_latest,
-        multiprocess, values
+        Counter, Histogram, Gauge,
+        CollectorRegistry, generate_latest, CONTENT_TYPE_LATEST,
+        multiprocess
     )
-    from prometheus_client.metrics import MetricWrapperBase
+    from prometheus_client.mmap_dict import MmapedDict, mmap_key
     PROMETHEUS_AVAILABLE = True
 except ImportError:
     PROMETHEUS_AVAILABLE = False
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
     # Fallback classes
     class Counter:
         def __init__(self, *args, **kwargs): pass
@@ -67,8 +79,7 @@ except ImportError:
         def labels(self, *args, **kwargs): return self
 
 try:
-    from fastapi import Request, Response
-    from starlette.middleware.base import BaseHTTPMiddleware
+    from starlette.routing import Mount
     FASTAPI_AVAILABLE = True
 except ImportError:
     FASTAPI_AVAILABLE = False
@@ -104,46 +115,59 @@ class MetricsConfig:
 # Configuração global
 metrics_config = MetricsConfig()
 
-# Registry para métricas multiprocesso
-if PROMETHEUS_AVAILABLE:
-    registry = CollectorRegistry()
-    multiprocess.MultiProcessCollector(registry)
+# Diretório dos arquivos mmap de cada worker (definido antes de o processo
+# importar prometheus_client; ver gunicorn.conf.py na raiz do projeto)
+MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR") or os.environ.get("prometheus_multiproc_dir")
+MULTIPROCESS_MODE = PROMETHEUS_AVAILABLE and bool(MULTIPROC_DIR)
+if MULTIPROCESS_MODE:
+    os.makedirs(MULTIPROC_DIR, exist_ok=True)
+
+# Registry próprio (não o global do prometheus_client). Em modo
+# multiprocesso os valores vivem nos arquivos mmap e a exposição usa um
+# registry novo com MultiProcessCollector a cada scrape (get_metrics)
+registry = CollectorRegistry(auto_describe=True) if PROMETHEUS_AVAILABLE else None
 
 # ============================================================================
 # MÉTRICAS HTTP
 # ============================================================================
 
+# Labels HTTP: `path` é sempre o template da rota (ou UNMATCHED_PATH), o
+# que limita as séries a rotas x métodos x status
+UNMATCHED_PATH = "<unmatched>"
+HTTP_METHODS = frozenset(["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"])
+
 # Contador de requests HTTP
 http_requests_total = Counter(
     name='http_requests_total',
     documentation='Total HTTP requests',
-    labelnames=['method', 'endpoint', 'status_code', 'user_type'],
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    labelnames=['method', 'path', 'status', 'user_type'],
+    registry=registry
 )
 
-# Histograma de latência HTTP
+# Histograma de latência HTTP (classe de status: 2xx, 4xx...)
 http_request_duration_seconds = Histogram(
     name='http_request_duration_seconds',
     documentation='HTTP request duration in seconds',
-    labelnames=['method', 'endpoint', 'status_code'],
+    labelnames=['method', 'path', 'status_class'],
     buckets=[0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0],
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    registry=registry
 )
 
 # Tamanho das respostas HTTP
 http_response_size_bytes = Histogram(
     name='http_response_size_bytes',
     documentation='HTTP response size in bytes',
-    labelnames=['method', 'endpoint', 'status_code'],
+    labelnames=['method', 'path', 'status_class'],
     buckets=[64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304],
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    registry=registry
 )
 
-# Requests ativas
+# Requests ativas (soma dos workers vivos)
 http_requests_active = Gauge(
     name='http_requests_active',
     documentation='Number of active HTTP requests',
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    multiprocess_mode='livesum',
+    registry=registry
 )
 
 # ============================================================================
@@ -155,19 +179,22 @@ users_total = Gauge(
     name='users_total',
     documentation='Total number of users',
     labelnames=['status'],  # active, inactive, pending
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    multiprocess_mode='livemostrecent',
+    registry=registry
 )
 
 users_online = Gauge(
     name='users_online',
     documentation='Number of users currently online',
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    multiprocess_mode='livemostrecent',
+    registry=registry
 )
 
 user_sessions = Gauge(
     name='user_sessions_active',
     documentation='Number of active user sessions',
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    multiprocess_mode='livemostrecent',
+    registry=registry
 )
 
 # Projetos
@@ -175,14 +202,15 @@ projects_total = Gauge(
     name='projects_total',
     documentation='Total number of projects',
     labelnames=['status', 'type'],  # draft, published, archived + course, presentation
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    multiprocess_mode='livemostrecent',
+    registry=registry
 )
 
 projects_created = Counter(
     name='projects_created_total',
     documentation='Total projects created',
     labelnames=['type', 'user_type'],
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    registry=registry
 )
 
 # Cenas
@@ -190,14 +218,15 @@ scenes_total = Gauge(
     name='scenes_total',
     documentation='Total number of scenes',
     labelnames=['status'],
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    multiprocess_mode='livemostrecent',
+    registry=registry
 )
 
 scenes_processed = Counter(
     name='scenes_processed_total',
     documentation='Total scenes processed',
     labelnames=['operation', 'status'],  # create, update, delete + success, error
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    registry=registry
 )
 
 # Vídeos
@@ -205,7 +234,7 @@ videos_generated = Counter(
     name='videos_generated_total',
     documentation='Total videos generated',
     labelnames=['quality', 'status', 'duration_range'],
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    registry=registry
 )
 
 video_generation_duration = Histogram(
@@ -213,7 +242,7 @@ video_generation_duration = Histogram(
     documentation='Video generation duration in seconds',
     labelnames=['quality', 'scene_count_range'],
     buckets=[1, 5, 10, 30, 60, 120, 300, 600, 1200, 3600],
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    registry=registry
 )
 
 video_files_size = Histogram(
@@ -221,7 +250,7 @@ video_files_size = Histogram(
     documentation='Generated video file sizes',
     labelnames=['quality', 'duration_range'],
     buckets=[1024*1024, 5*1024*1024, 10*1024*1024, 50*1024*1024, 100*1024*1024, 500*1024*1024],
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    registry=registry
 )
 
 # ============================================================================
@@ -232,14 +261,16 @@ video_files_size = Histogram(
 cpu_usage_percent = Gauge(
     name='cpu_usage_percent',
     documentation='CPU usage percentage',
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    multiprocess_mode='livemostrecent',
+    registry=registry
 )
 
 cpu_load_average = Gauge(
     name='cpu_load_average',
     documentation='CPU load average',
     labelnames=['period'],  # 1m, 5m, 15m
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    multiprocess_mode='livemostrecent',
+    registry=registry
 )
 
 # Memória
@@ -247,13 +278,15 @@ memory_usage_bytes = Gauge(
     name='memory_usage_bytes',
     documentation='Memory usage in bytes',
     labelnames=['type'],  # total, available, used, free
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    multiprocess_mode='livemostrecent',
+    registry=registry
 )
 
 memory_usage_percent = Gauge(
     name='memory_usage_percent',
     documentation='Memory usage percentage',
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    multiprocess_mode='livemostrecent',
+    registry=registry
 )
 
 # Disco
@@ -261,14 +294,16 @@ disk_usage_bytes = Gauge(
     name='disk_usage_bytes',
     documentation='Disk usage in bytes',
     labelnames=['mountpoint', 'type'],  # total, used, free
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    multiprocess_mode='livemostrecent',
+    registry=registry
 )
 
 disk_usage_percent = Gauge(
     name='disk_usage_percent',
     documentation='Disk usage percentage',
     labelnames=['mountpoint'],
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    multiprocess_mode='livemostrecent',
+    registry=registry
 )
 
 # ============================================================================
@@ -278,7 +313,8 @@ disk_usage_percent = Gauge(
 database_connections = Gauge(
     name='database_connections_active',
     documentation='Number of active database connections',
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    multiprocess_mode='livemostrecent',
+    registry=registry
 )
 
 database_query_duration = Histogram(
@@ -286,21 +322,22 @@ database_query_duration = Histogram(
     documentation='Database query duration in seconds',
     labelnames=['operation', 'table'],
     buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    registry=registry
 )
 
 database_queries_total = Counter(
     name='database_queries_total',
     documentation='Total database queries',
     labelnames=['operation', 'table', 'status'],
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    registry=registry
 )
 
 database_size_bytes = Gauge(
     name='database_size_bytes',
     documentation='Database size in bytes',
     labelnames=['database', 'table'],
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    multiprocess_mode='livemostrecent',
+    registry=registry
 )
 
 # ============================================================================
@@ -311,27 +348,30 @@ cache_operations_total = Counter(
     name='cache_operations_total',
     documentation='Total cache operations',
     labelnames=['operation', 'status'],  # get, set, delete + hit, miss, error
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    registry=registry
 )
 
 cache_hit_ratio = Gauge(
     name='cache_hit_ratio',
     documentation='Cache hit ratio',
     labelnames=['cache_type'],
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    multiprocess_mode='livemostrecent',
+    registry=registry
 )
 
 cache_memory_usage_bytes = Gauge(
     name='cache_memory_usage_bytes',
     documentation='Cache memory usage in bytes',
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    multiprocess_mode='livemostrecent',
+    registry=registry
 )
 
 cache_keys_total = Gauge(
     name='cache_keys_total',
     documentation='Total number of cache keys',
     labelnames=['pattern'],
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    multiprocess_mode='livemostrecent',
+    registry=registry
 )
 
 # ============================================================================
@@ -342,7 +382,7 @@ ai_requests_total = Counter(
     name='ai_requests_total',
     documentation='Total AI service requests',
     labelnames=['service', 'operation', 'status'],  # openai, azure, d_id + tts, avatar, image + success, error
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    registry=registry
 )
 
 ai_request_duration = Histogram(
@@ -350,21 +390,21 @@ ai_request_duration = Histogram(
     documentation='AI service request duration',
     labelnames=['service', 'operation'],
     buckets=[0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0],
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    registry=registry
 )
 
 ai_tokens_consumed = Counter(
     name='ai_tokens_consumed_total',
     documentation='Total AI tokens consumed',
     labelnames=['service', 'operation', 'model'],
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    registry=registry
 )
 
 ai_cost_estimated = Counter(
     name='ai_cost_estimated_total',
     documentation='Estimated AI service costs',
     labelnames=['service', 'operation'],
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    registry=registry
 )
 
 # ============================================================================
@@ -375,123 +415,123 @@ business_conversions = Counter(
     name='business_conversions_total',
     documentation='Business conversions',
     labelnames=['type', 'source'],  # signup, subscription, purchase + web, api, mobile
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    registry=registry
 )
 
 business_revenue = Counter(
     name='business_revenue_total',
     documentation='Total revenue',
     labelnames=['type', 'currency'],  # subscription, one_time + BRL, USD
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    registry=registry
 )
 
 business_errors = Counter(
     name='business_errors_total',
     documentation='Business logic errors',
     labelnames=['type', 'severity'],  # payment, upload, generation + low, medium, high, critical
-    registry=registry if PROMETHEUS_AVAILABLE else None
+    registry=registry
 )
 
+# ============================================================================
+# SÉRIES PRÉ-RESOLVIDAS
+# ============================================================================
+
+_children: Dict[tuple, Any] = {}
+
+def _child(metric, *labelvalues):
+    """
+    Série filha de `metric` para os valores de label (na ordem de
+    labelnames), resolvida uma vez e reaproveitada: evita o lock e a
+    validação de labels() a cada observação.
+    """
+    key = (id(metric),) + labelvalues
+    child = _children.get(key)
+    if child is None:
+        child = _children.setdefault(key, metric.labels(*labelvalues))
+    return child
+
+def observe_http_request(method: str, path: str, status_code: int, duration: float,
+                         response_size: int = 0, user_type: str = "anonymous"):
+    """Registrar uma requisição HTTP (`path` deve ser o template da rota)"""
+    if method not in HTTP_METHODS:
+        method = "OTHER"
+    status = str(status_code)
+    status_class = f"{status_code // 100}xx"
+    _child(http_requests_total, method, path, status, user_type).inc()
+    _child(http_request_duration_seconds, method, path, status_class).observe(duration)
+    _child(http_response_size_bytes, method, path, status_class).observe(response_size)
+
 # ============================================================================
 # MIDDLEWARE DE MÉTRICAS
 # ============================================================================
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
+def route_template(scope) -> str:
+    """Template da rota que atendeu a requisição (/api/scenes/{scene_id})"""
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path is None:
+        return UNMATCHED_PATH
+    # Apps montados (Mount) acumulam o prefixo em root_path
+    app_root = scope.get("app_root_path", scope.get("root_path", ""))
+    prefix = scope.get("root_path", "")[len(app_root):]
+    if FASTAPI_AVAILABLE and isinstance(route, Mount):
+        return f"{prefix}/{{path}}"
+    return prefix + path
+
+class PrometheusMiddleware:
     """
-    Middleware para coleta automática de métricas HTTP
+    Middleware ASGI para coleta automática de métricas HTTP.
+
+    O label `path` é o template resolvido pelo roteador (scope["route"]),
+    então /api/scenes/1 e /api/scenes/2 caem na mesma série; requisições
+    sem rota (404 de scanners) vão para UNMATCHED_PATH.
     """
     
-    def __init__(self, app, config: MetricsConfig = None):
-        super().__init__(app)
+    def __init__(self, app, config: MetricsConfig = None, exclude_paths: List[str] = ()):
+        self.app = app
         self.config = config or metrics_config
+        self.exclude_paths = tuple(exclude_paths)
         
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        if not self.config.enabled:
-            return await call_next(request)
-        
-        # Incrementar requests ativos
-        http_requests_active.inc()
-        
-        # Dados do request
-        method = request.method
-        path = request.url.path
-        start_time = time.time()
+    async def __call__(self, scope, receive, send):
+        if (scope["type"] != "http" or not self.config.enabled
+                or (self.exclude_paths and scope.get("path", "").startswith(self.exclude_paths))):
+            await self.app(scope, receive, send)
+            return
         
-        # Determinar endpoint (remover IDs para agrupamento)
-        endpoint = self._get_endpoint_label(path)
+        status_code = 500
+        response_size = 0
         
-        # Determinar tipo de usuário
-        user_type = self._get_user_type(request)
+        async def send_wrapper(message):
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
         
+        http_requests_active.inc()
+        start_time = time.perf_counter()
         try:
-            response = await call_next(request)
-            status_code = response.status_code
-            
-        except Exception as e:
-            logger.error(f"Request failed: {e}")
-            status_code = 500
-            raise
-        
+            await self.app(scope, receive, send_wrapper)
         finally:
-            # Decrementar requests ativos
             http_requests_active.dec()
-            
-            # Calcular duração
-            duration = time.time() - start_time
-            
-            # Calcular tamanho da resposta
-            response_size = len(response.body) if hasattr(response, 'body') else 0
-            
-            # Registrar métricas
-            http_requests_total.labels(
-                method=method,
-                endpoint=endpoint,
-                status_code=status_code,
-                user_type=user_type
-            ).inc()
-            
-            http_request_duration_seconds.labels(
-                method=method,
-                endpoint=endpoint,
-                status_code=status_code
-            ).observe(duration)
-            
-            http_response_size_bytes.labels(
-                method=method,
-                endpoint=endpoint,
-                status_code=status_code
-            ).observe(response_size)
-        
-        return response
-    
-    def _get_endpoint_label(self, path: str) -> str:
-        """Normalizar path para agrupamento de métricas"""
-        # Remover IDs numéricos e UUIDs
-        import re
-        
-        # Padrões para normalização
-        patterns = [
-            (r'/\d+', '/{id}'),                    # IDs numéricos
-            (r'/[0-9a-f-]{36}', '/{uuid}'),        # UUIDs
-            (r'/[0-9a-f]{8,}', '/{hash}'),         # Hashes
-        ]
-        
-        normalized = path
-        for pattern, replacement in patterns:
-            normalized = re.sub(pattern, replacement, normalized)
-        
-        return normalized
+            observe_http_request(
+                scope.get("method", "GET"),
+                route_template(scope),
+                status_code,
+                time.perf_counter() - start_time,
+                response_size,
+                self._get_user_type(scope),
+            )
     
-    def _get_user_type(self, request: Request) -> str:
+    def _get_user_type(self, scope) -> str:
         """Determinar tipo de usuário"""
         # TODO: Implementar lógica baseada em JWT ou sessão
-        auth_header = request.headers.get("authorization", "")
-        
-        if not auth_header:
-            return "anonymous"
-        
-        # Placeholder - implementar extração de role do JWT
-        return "authenticated"
+        for key, value in scope.get("headers", ()):
+            if key == b"authorization" and value:
+                # Placeholder - implementar extração de role do JWT
+                return "authenticated"
+        return "anonymous"
 
 # ============================================================================
 # COLETORES DE MÉTRICAS
@@ -509,8 +549,8 @@ class SystemMetricsCollector:
             return
         
         try:
-            # CPU
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU (desde a última coleta; interval=1 bloquearia o event loop)
+            cpu_percent = psutil.cpu_percent(interval=None)
             cpu_usage_percent.set(cpu_percent)
             
             # Load average (apenas Unix)
@@ -581,14 +621,14 @@ class ApplicationMetricsCollector:
 def track_ai_request(service: str, operation: str, duration: float, 
                     status: str = "success", tokens: int = 0, cost: float = 0.0):
     """Registrar métrica de request de IA"""
-    ai_requests_total.labels(service=service, operation=operation, status=status).inc()
-    ai_request_duration.labels(service=service, operation=operation).observe(duration)
+    _child(ai_requests_total, service, operation, status).inc()
+    _child(ai_request_duration, service, operation).observe(duration)
     
     if tokens > 0:
-        ai_tokens_consumed.labels(service=service, operation=operation, model="default").inc(tokens)
+        _child(ai_tokens_consumed, service, operation, "default").inc(tokens)
     
     if cost > 0:
-        ai_cost_estimated.labels(service=service, operation=operation).inc(cost)
+        _child(ai_cost_estimated, service, operation).inc(cost)
 
 def track_video_generation(quality: str, duration: float, scene_count: int, 
                           file_size: int, status: str = "success"):
@@ -615,12 +655,12 @@ def track_video_generation(quality: str, duration: float, scene_count: int,
 
 def track_database_query(operation: str, table: str, duration: float, status: str = "success"):
     """Registrar métrica de query do banco"""
-    database_queries_total.labels(operation=operation, table=table, status=status).inc()
-    database_query_duration.labels(operation=operation, table=table).observe(duration)
+    _child(database_queries_total, operation, table, status).inc()
+    _child(database_query_duration, operation, table).observe(duration)
 
 def track_cache_operation(operation: str, status: str, cache_type: str = "default"):
     """Registrar métrica de operação de cache"""
-    cache_operations_total.labels(operation=operation, status=status).inc()
+    _child(cache_operations_total, operation, status).inc()
 
 def track_business_event(event_type: str, value: float = 1.0, **labels):
     """Registrar evento de negócio"""
@@ -735,19 +775,137 @@ async def start_metrics_collection():
     asyncio.create_task(collect_loop())
     logger.info("✅ Coleta de métricas iniciada")
 
+# ============================================================================
+# MULTIPROCESSO
+# ============================================================================
+
+# Cada worker escreve {tipo}_{pid}.db (gauges: gauge_{modo}_{pid}.db).
+# Contadores e histogramas de workers encerrados são somados em
+# {tipo}_archive.db pela compactação; gauges live* deles são descartados
+_ACCUMULATED_TYPES = ("counter", "histogram", "summary")
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def dead_worker_files(path: str = None) -> Dict[str, List[str]]:
+    """Arquivos de workers encerrados, por tipo (contadores, histogramas e gauges live*)"""
+    path = path or MULTIPROC_DIR
+    alive: Dict[int, bool] = {os.getpid(): True}
+    result: Dict[str, List[str]] = {}
+    for filename in glob.glob(os.path.join(path, "*.db")):
+        parts = os.path.basename(filename)[:-3].split("_")
+        typ, tail = parts[0], parts[-1]
+        if not tail.isdigit():
+            continue
+        if typ == "gauge":
+            if not parts[1].startswith("live"):
+                continue
+        elif typ not in _ACCUMULATED_TYPES:
+            continue
+        pid = int(tail)
+        if pid not in alive:
+            alive[pid] = _pid_alive(pid)
+        if not alive[pid]:
+            result.setdefault(typ, []).append(filename)
+    return result
+
+@contextmanager
+def _multiproc_lock(path: str, exclusive: bool):
+    """flock no diretório: scrapes compartilham, a compactação é exclusiva"""
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.join(path, ".lock"), "a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+def compact_dead_workers(path: str = None) -> int:
+    """
+    Somar contadores/histogramas de workers encerrados em {tipo}_archive.db
+    e remover os arquivos deles.
+
+    Com max_requests o gunicorn recicla workers continuamente; sem isto o
+    diretório cresce sem limite e cada scrape relê todos os arquivos já
+    criados. Também remove os gauges live* desses workers. Retorna o
+    número de arquivos removidos.
+    """
+    path = path or MULTIPROC_DIR
+    if not PROMETHEUS_AVAILABLE or not path:
+        return 0
+    removed = 0
+    with _multiproc_lock(path, exclusive=True):
+        for typ, files in dead_worker_files(path).items():
+            if typ == "gauge":
+                # Mesmo efeito de multiprocess.mark_process_dead (sem hook no uvicorn)
+                for filename in files:
+                    os.remove(filename)
+                removed += len(files)
+                continue
+            archive = os.path.join(path, f"{typ}_archive.db")
+            sources = files + ([archive] if os.path.exists(archive) else [])
+            merged = multiprocess.MultiProcessCollector.merge(sources, accumulate=False)
+            
+            # Escreve ao lado (fora do glob *.db) e troca atomicamente
+            staging = archive + ".tmp"
+            if os.path.exists(staging):
+                os.remove(staging)
+            target = MmapedDict(staging)
+            try:
+                for metric in merged:
+                    for sample in metric.samples:
+                        key = mmap_key(metric.name, sample.name, list(sample.labels),
+                                       list(sample.labels.values()), metric.documentation)
+                        target.write_value(key, sample.value, sample.timestamp or 0.0)
+            finally:
+                target.close()
+            os.replace(staging, archive)
+            for filename in files:
+                os.remove(filename)
+            removed += len(files)
+    if removed:
+        logger.info(f"📦 Métricas de workers encerrados compactadas: {removed} arquivos")
+    return removed
+
+# ============================================================================
+# EXPOSIÇÃO
+# ============================================================================
+
 def get_metrics() -> str:
     """Obter métricas formatadas para Prometheus"""
     if not PROMETHEUS_AVAILABLE:
         return "# Prometheus não disponível\n"
     
-    return generate_latest(registry).decode('utf-8')
+    if not MULTIPROCESS_MODE:
+        return generate_latest(registry).decode('utf-8')
+    
+    # Workers encerrados entre scrapes (uvicorn --workers não tem hook de saída)
+    if dead_worker_files():
+        compact_dead_workers()
+    scrape_registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(scrape_registry, path=MULTIPROC_DIR)
+    with _multiproc_lock(MULTIPROC_DIR, exclusive=False):
+        return generate_latest(scrape_registry).decode('utf-8')
 
 def get_metrics_summary() -> Dict[str, Any]:
     """Obter resumo das métricas principais"""
-    return {
+    summary = {
         "timestamp": datetime.utcnow().isoformat(),
         "metrics_enabled": metrics_config.enabled,
         "prometheus_available": PROMETHEUS_AVAILABLE,
+        "multiprocess": MULTIPROCESS_MODE,
         "collection_interval": metrics_config.collect_interval,
-        "total_metrics": len([m for m in registry._collector_to_names.keys()]) if PROMETHEUS_AVAILABLE else 0
-    } 
\ No newline at end of file
+        "total_metrics": len(registry._collector_to_names) if PROMETHEUS_AVAILABLE else 0,
+        "bound_series": len(_children),
+    }
+    if MULTIPROCESS_MODE:
+        summary["multiprocess_files"] = len(glob.glob(os.path.join(MULTIPROC_DIR, "*.db")))
+    return summary
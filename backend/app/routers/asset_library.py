@@ -19,7 +19,7 @@ Autor: TecnoCursos AI System
 Data: 17/01/2025
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form, Body, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form, Body, BackgroundTasks, Response
 from fastapi.responses import JSONResponse, FileResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any, BinaryIO
@@ -36,6 +36,7 @@ from app.schemas import (
     AssetRatingCreate, AssetRatingUpdate, AssetRatingResponse
 )
 from app.logger import get_logger
+from app.core.pagination import InvalidCursorError
 
 # Importar serviços
 try:
@@ -146,6 +147,7 @@ async def upload_asset(
 
 @router.get("/", response_model=List[AssetResponse])
 async def search_assets(
+    response: Response,
     query: Optional[str] = Query(None, description="Termo de busca"),
     asset_type: Optional[str] = Query(None, description="Filtrar por tipo"),
     category: Optional[str] = Query(None, description="Filtrar por categoria"),
@@ -158,6 +160,8 @@ async def search_assets(
     sort_order: str = Query("desc", regex="^(asc|desc)$", description="Ordem"),
     skip: int = Query(0, ge=0, description="Registros a pular"),
     limit: int = Query(50, ge=1, le=100, description="Máximo de registros"),
+    cursor: Optional[str] = Query(None, description="Cursor (paginação keyset; ignora skip)"),
+    pagination: str = Query("page", regex="^(page|cursor)$", description="Modo de paginação"),
     current_user: Optional[User] = Depends(get_current_user_optional),
     db: Session = Depends(get_db)
 ):
@@ -170,6 +174,7 @@ async def search_assets(
     - **is_public**: assets públicos
     - **is_premium**: assets premium
     - **min_rating**: rating mínimo (0-5)
+    - **cursor/pagination**: paginação keyset; o próximo cursor vem no header `X-Next-Cursor`
     """
     
     if not ASSET_SERVICE_AVAILABLE:
@@ -179,6 +184,27 @@ async def search_assets(
         # Converter tags para lista
         tags_list = [tag.strip() for tag in tags.split(",")] if tags else None
         
+        if cursor or pagination == "cursor":
+            page = asset_library_service.search_assets_page(
+                cursor=cursor,
+                limit=limit,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                db=db,
+                query=query,
+                asset_type=asset_type,
+                category=category,
+                is_public=is_public,
+                is_premium=is_premium,
+                license_type=license_type,
+                tags=tags_list,
+                user_id=current_user.id if current_user else None,
+                min_rating=min_rating
+            )
+            if page["next_cursor"]:
+                response.headers["X-Next-Cursor"] = page["next_cursor"]
+            return page["items"]
+        
         # Buscar assets
         assets = asset_library_service.search_assets(
             query=query,
@@ -199,6 +225,11 @@ async def search_assets(
         
         return assets
         
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Erro na busca de assets: {e}")
         raise HTTPException(
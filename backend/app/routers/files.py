@@ -6,8 +6,9 @@ Endpoints para upload, download e gestão de arquivos
 from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form, Query, BackgroundTasks, Body
 from fastapi import status
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, or_
 from typing import List, Optional
+import asyncio
 import os
 import shutil
 from pathlib import Path
@@ -24,6 +25,7 @@ from app.models import Project, Scene, Asset
 from app.database import get_db
 from sqlalchemy.orm import Session
 from app.parsers import get_parser, PARSER_REGISTRY
+from app.services.text_search_index import PAGED_FILE_TYPES, get_text_search_index, index_file_upload
 import logging
 
 logger = get_logger("files_router")
@@ -169,6 +171,13 @@ async def upload_file(
         db.commit()
         db.refresh(file_upload)
 
+        # Indexar texto por página para busca full-text
+        if extracted_text:
+            try:
+                await asyncio.to_thread(index_file_upload, file_upload, extracted_text)
+            except Exception as e:
+                logger.error(f"Erro ao indexar texto do arquivo: {e}")
+
         logger.info(f"Arquivo enviado com sucesso",
                    filename=file.filename,
                    user_id=current_user.id,
@@ -315,6 +324,88 @@ async def list_files(
     files = query.offset(skip).limit(limit).all()
     return [FileUploadResponse.from_orm(file) for file in files]
 
+@router.get("/search")
+async def search_files_text(
+    q: str = Query(..., min_length=1, description="Termos de busca"),
+    phrase: bool = Query(False, description="Buscar frase exata"),
+    prefix: bool = Query(False, description="Tratar termos como prefixo"),
+    file_id: Optional[List[int]] = Query(None, description="Restringir a arquivos"),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    current_user: User = Depends(get_current_user_optional)
+):
+    """
+    Busca full-text na biblioteca do usuário
+
+    Consulta o índice invertido alimentado no upload, sem reabrir os arquivos.
+
+    - **q**: Termos de busca (use aspas para frase e `*` para prefixo)
+    - **phrase**: Consulta inteira como frase exata
+    - **prefix**: Todos os termos como prefixo
+    - **file_id**: IDs de arquivos para restringir a busca (opcional)
+    """
+
+    if not current_user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Usuário não autenticado"
+        )
+
+    result = get_text_search_index().search(
+        q,
+        user_id=current_user.id,
+        file_ids=file_id,
+        phrase=phrase,
+        prefix=prefix,
+        limit=limit,
+        offset=offset
+    )
+
+    if result["error"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=result["error"]
+        )
+
+    return result
+
+@router.post("/search/reindex")
+async def reindex_files_text(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_optional)
+):
+    """
+    Reindexa os arquivos do usuário, página a página
+
+    O texto é reextraído de cada arquivo armazenado (PDF/PPTX), preservando
+    o número da página nos hits; `text_content` é o fallback quando o
+    arquivo não existe mais.
+    """
+
+    if not current_user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Usuário não autenticado"
+        )
+
+    paged_types = [*PAGED_FILE_TYPES, *(file_type.lstrip(".") for file_type in PAGED_FILE_TYPES)]
+    files = db.query(FileUpload).filter(
+        FileUpload.user_id == current_user.id,
+        or_(FileUpload.text_content.isnot(None), FileUpload.file_type.in_(paged_types))
+    ).all()
+
+    indexed_pages = 0
+    for file_upload in files:
+        # Reextração do PDF/PPTX é pesada: fora do event loop
+        indexed_pages += await asyncio.to_thread(index_file_upload, file_upload)
+
+    get_text_search_index().optimize()
+
+    return {
+        "indexed_files": len(files),
+        "indexed_pages": indexed_pages
+    }
+
 @router.get("/{file_id}", response_model=FileUploadResponse)
 async def get_file(
     file_id: int,
@@ -384,6 +475,8 @@ async def delete_file(
         db.delete(file_upload)
         db.commit()
 
+        get_text_search_index().remove_document(file_id)
+
         logger.info(f"Arquivo deletado", file_id=file_id, user_id=current_user.id)
 
         return {"message": "Arquivo deletado com sucesso"}
@@ -3,10 +3,12 @@ Serviço de Preview em Tempo Real - TecnoCursos AI
 Gera previews instantâneos de cenas e elementos do editor
 """
 
-from fastapi import APIRouter, HTTPException, Depends, WebSocket, WebSocketDisconnect
-from fastapi.responses import StreamingResponse, FileResponse
+from fastapi import APIRouter, HTTPException, Depends, WebSocket, WebSocketDisconnect, Request, Query
+from fastapi.responses import StreamingResponse, FileResponse, Response
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import json
 import os
 import uuid
@@ -18,11 +20,15 @@ import base64
 from datetime import datetime
 import logging
 
+from app.config import get_settings
 from app.database import get_db
 from app.auth import get_current_user
 from app.models import User, Project
+from app.services.preview_cache import PreviewCache, PreviewEntry, is_valid_key
+from app.services.live_preview import LivePreviewSession, SceneCompositor, get_layer_cache, hex_to_rgb
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 router = APIRouter()
 
@@ -38,352 +44,312 @@ class PreviewService:
         self.preview_size = (640, 360)  # Tamanho reduzido para performance
         self.background_color = "#1a202c"
         
-        # Cache de previews
-        self.preview_cache = {}
+        # Cache de previews: LRU limitado em bytes + nível em disco
+        self.preview_cache = PreviewCache(
+            max_memory_bytes=settings.preview_cache_memory_mb * 1024 * 1024,
+            disk_dir=self.temp_dir / "cache",
+            max_disk_bytes=settings.preview_cache_disk_mb * 1024 * 1024,
+        )
+        
+        # Renderização com PIL fora do event loop
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.preview_render_workers),
+            thread_name_prefix="preview-render",
+        )
+        
+        # Renderizações em andamento por chave (coalescência de pedidos iguais)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
+        # Camadas rasterizadas por elemento (compartilhadas com o preview ao vivo)
+        self.layer_cache = get_layer_cache()
         
         # Conexões WebSocket ativas
         self.active_connections: List[WebSocket] = []
+        
+        # Sessões de preview incremental por conexão
+        self.live_sessions: Dict[WebSocket, LivePreviewSession] = {}
+    
+    # ------------------------------------------------------------------
+    # API pública: entradas binárias
+    # ------------------------------------------------------------------
+    
+    async def render_scene_preview(self, scene_data: Dict[str, Any]) -> PreviewEntry:
+        """Gerar preview binário (JPEG) de uma cena"""
+        # A chave inclui o mtime dos assets (os.stat): fora do event loop
+        cache_key = await asyncio.to_thread(self._generate_cache_key, scene_data)
+        return await self._get_or_render(cache_key, self._render_scene, scene_data)
+    
+    async def render_element_preview(self, element_data: Dict[str, Any]) -> PreviewEntry:
+        """Gerar preview binário de um elemento específico"""
+        assets = await asyncio.to_thread(self._asset_versions, [element_data])
+        cache_key = self._hash_payload({"element": element_data, "assets": assets})
+        return await self._get_or_render(cache_key, self._render_element, element_data)
+    
+    async def render_timeline_preview(self, timeline_data: List[Dict[str, Any]]) -> PreviewEntry:
+        """Gerar preview binário (PNG) da timeline completa"""
+        cache_key = self._hash_payload({"timeline": timeline_data})
+        return await self._get_or_render(cache_key, self._render_timeline, timeline_data)
+    
+    # ------------------------------------------------------------------
+    # API compatível: data URLs em base64
+    # ------------------------------------------------------------------
     
     async def generate_scene_preview(self, scene_data: Dict[str, Any]) -> str:
-        """Gerar preview de uma cena"""
-        try:
-            # Criar chave de cache
-            cache_key = self._generate_cache_key(scene_data)
-            
-            # Verificar cache
-            if cache_key in self.preview_cache:
-                return self.preview_cache[cache_key]
-            
-            # Criar imagem base
-            img = Image.new("RGB", self.preview_size, self._hex_to_rgb(self.background_color))
-            draw = ImageDraw.Draw(img)
-            
-            # Adicionar gradiente sutil
-            self._add_gradient(img, draw)
-            
-            # Processar elementos da cena
-            elements = scene_data.get("elements", [])
-            for element in elements:
-                await self._add_element_to_preview(img, element)
-            
-            # Adicionar título se presente
-            title = scene_data.get("title", "")
-            if title:
-                self._add_title_to_preview(img, draw, title)
-            
-            # Converter para base64
-            buffer = io.BytesIO()
-            img.save(buffer, format='JPEG', quality=85)
-            img_data = base64.b64encode(buffer.getvalue()).decode()
-            preview_url = f"data:image/jpeg;base64,{img_data}"
-            
-            # Salvar no cache
-            self.preview_cache[cache_key] = preview_url
-            
-            return preview_url
-            
-        except Exception as e:
-            logger.error(f"Erro ao gerar preview da cena: {e}")
-            return self._generate_error_preview()
+        """Gerar preview de uma cena (data URL)"""
+        return self.to_data_url(await self.render_scene_preview(scene_data))
     
     async def generate_element_preview(self, element_data: Dict[str, Any]) -> str:
-        """Gerar preview de um elemento específico"""
-        try:
-            element_type = element_data.get("type", "unknown")
-            
-            if element_type == "image":
-                return await self._preview_image_element(element_data)
-            elif element_type == "video":
-                return await self._preview_video_element(element_data)
-            elif element_type == "text":
-                return await self._preview_text_element(element_data)
-            elif element_type == "audio":
-                return await self._preview_audio_element(element_data)
-            else:
-                return self._generate_placeholder_preview(element_type)
-                
-        except Exception as e:
-            logger.error(f"Erro ao gerar preview do elemento: {e}")
-            return self._generate_error_preview()
+        """Gerar preview de um elemento específico (data URL)"""
+        return self.to_data_url(await self.render_element_preview(element_data))
     
     async def generate_timeline_preview(self, timeline_data: List[Dict[str, Any]]) -> str:
-        """Gerar preview da timeline completa"""
-        try:
-            # Criar imagem da timeline
-            timeline_width = max(800, len(timeline_data) * 120)
-            timeline_height = 80
-            
-            img = Image.new("RGB", (timeline_width, timeline_height), "#2d3748")
-            draw = ImageDraw.Draw(img)
-            
-            # Desenhar clips da timeline
-            x_offset = 10
-            for i, clip in enumerate(timeline_data):
-                clip_width = max(60, clip.get("duration", 3) * 20)
-                
-                # Cor baseada no tipo
-                clip_type = clip.get("type", "scene")
-                color = self._get_clip_color(clip_type)
-                
-                # Desenhar clip
-                draw.rectangle(
-                    [x_offset, 20, x_offset + clip_width, 60],
-                    fill=color,
-                    outline="#4fc3f7",
-                    width=1
-                )
-                
-                # Adicionar texto
-                title = clip.get("title", f"Clip {i+1}")
-                try:
-                    font = ImageFont.load_default()
-                    text_bbox = draw.textbbox((0, 0), title, font=font)
-                    text_width = text_bbox[2] - text_bbox[0]
-                    text_x = x_offset + (clip_width - text_width) // 2
-                    draw.text((text_x, 35), title, fill="white", font=font)
-                except:
-                    draw.text((x_offset + 5, 35), title[:8], fill="white")
-                
-                x_offset += clip_width + 5
-            
-            # Converter para base64
-            buffer = io.BytesIO()
-            img.save(buffer, format='PNG')
-            img_data = base64.b64encode(buffer.getvalue()).decode()
-            
-            return f"data:image/png;base64,{img_data}"
-            
-        except Exception as e:
-            logger.error(f"Erro ao gerar preview da timeline: {e}")
-            return self._generate_error_preview()
+        """Gerar preview da timeline completa (data URL)"""
+        return self.to_data_url(await self.render_timeline_preview(timeline_data))
     
-    async def _add_element_to_preview(self, img: Image.Image, element: Dict[str, Any]):
-        """Adicionar elemento ao preview"""
-        try:
-            element_type = element.get("type", "unknown")
-            x = int(element.get("x", 0) * self.preview_size[0] / 1920)  # Escalar posição
-            y = int(element.get("y", 0) * self.preview_size[1] / 1080)
-            width = int(element.get("width", 100) * self.preview_size[0] / 1920)
-            height = int(element.get("height", 50) * self.preview_size[1] / 1080)
-            
-            draw = ImageDraw.Draw(img)
-            
-            if element_type == "image":
-                # Tentar carregar imagem real
-                asset_path = element.get("asset_path")
-                if asset_path and os.path.exists(asset_path):
-                    try:
-                        element_img = Image.open(asset_path)
-                        element_img = element_img.resize((width, height))
-                        img.paste(element_img, (x, y))
-                        return
-                    except:
-                        pass
-                
-                # Fallback: retângulo colorido
-                draw.rectangle([x, y, x + width, y + height], fill="#10b981", outline="#059669")
-                
-            elif element_type == "video":
-                draw.rectangle([x, y, x + width, y + height], fill="#8b5cf6", outline="#7c3aed")
-                # Adicionar ícone de play
-                play_x = x + width // 2 - 8
-                play_y = y + height // 2 - 8
-                draw.polygon([(play_x, play_y), (play_x + 16, play_y + 8), (play_x, play_y + 16)], fill="white")
-                
-            elif element_type == "text":
-                draw.rectangle([x, y, x + width, y + height], fill="#f59e0b", outline="#d97706")
-                text = element.get("text", "Texto")[:10]
-                try:
-                    font = ImageFont.load_default()
-                    draw.text((x + 5, y + 5), text, fill="white", font=font)
-                except:
-                    draw.text((x + 5, y + 5), text, fill="white")
-                    
-            elif element_type == "audio":
-                draw.rectangle([x, y, x + width, y + height], fill="#ef4444", outline="#dc2626")
-                # Adicionar ondas sonoras
-                for i in range(3):
-                    wave_x = x + 5 + i * 5
-                    draw.line([(wave_x, y + 5), (wave_x, y + height - 5)], fill="white", width=2)
-            
-        except Exception as e:
-            logger.error(f"Erro ao adicionar elemento ao preview: {e}")
+    @staticmethod
+    def to_data_url(entry: PreviewEntry) -> str:
+        """Converter uma entrada binária em data URL"""
+        return f"data:{entry.content_type};base64,{base64.b64encode(entry.data).decode()}"
     
-    async def _preview_image_element(self, element_data: Dict[str, Any]) -> str:
-        """Preview específico para elemento de imagem"""
-        try:
-            asset_path = element_data.get("asset_path")
-            if asset_path and os.path.exists(asset_path):
-                # Carregar e redimensionar imagem
-                img = Image.open(asset_path)
-                img.thumbnail((200, 150), Image.Resampling.LANCZOS)
-                
-                # Converter para base64
-                buffer = io.BytesIO()
-                img.save(buffer, format='JPEG', quality=85)
-                img_data = base64.b64encode(buffer.getvalue()).decode()
-                
-                return f"data:image/jpeg;base64,{img_data}"
-            
-            return self._generate_placeholder_preview("image")
-            
-        except Exception as e:
-            logger.error(f"Erro no preview de imagem: {e}")
-            return self._generate_error_preview()
+    def get_cached_preview(self, key: str) -> Optional[PreviewEntry]:
+        """Buscar um preview já renderizado (memória ou disco)"""
+        return self.preview_cache.get(key)
     
-    async def _preview_video_element(self, element_data: Dict[str, Any]) -> str:
-        """Preview específico para elemento de vídeo"""
+    # ------------------------------------------------------------------
+    # Cache, thread pool e coalescência
+    # ------------------------------------------------------------------
+    
+    async def _get_or_render(self, cache_key: str, render, *args) -> PreviewEntry:
+        """
+        Retorna a entrada do cache ou agenda uma única renderização por chave.
+        
+        Pedidos concorrentes com a mesma chave aguardam a mesma tarefa; o
+        `shield` evita que o cancelamento de um cliente derrube os demais.
+        """
+        entry = self.preview_cache.get(cache_key, include_disk=False)
+        if entry is not None:
+            return entry
+        
+        task = self._inflight.get(cache_key)
+        if task is None:
+            loop = asyncio.get_running_loop()
+            task = loop.run_in_executor(self._executor, self._load_or_render, cache_key, render, args)
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        
         try:
-            # Para vídeo, gerar thumbnail do primeiro frame
-            asset_path = element_data.get("asset_path")
-            if asset_path and os.path.exists(asset_path):
-                try:
-                    # Tentar extrair frame com moviepy (se disponível)
-                    from moviepy.editor import VideoFileClip
-                    
-                    clip = VideoFileClip(asset_path)
-                    frame = clip.get_frame(0)  # Primeiro frame
-                    
-                    # Converter numpy array para PIL Image
-                    img = Image.fromarray(frame)
-                    img.thumbnail((200, 150), Image.Resampling.LANCZOS)
-                    
-                    # Adicionar ícone de play
-                    draw = ImageDraw.Draw(img)
-                    width, height = img.size
-                    play_x = width // 2 - 15
-                    play_y = height // 2 - 15
-                    draw.polygon([(play_x, play_y), (play_x + 30, play_y + 15), (play_x, play_y + 30)], 
-                               fill="white", outline="black")
-                    
-                    # Converter para base64
-                    buffer = io.BytesIO()
-                    img.save(buffer, format='JPEG', quality=85)
-                    img_data = base64.b64encode(buffer.getvalue()).decode()
-                    
-                    clip.close()
-                    return f"data:image/jpeg;base64,{img_data}"
-                    
-                except ImportError:
-                    # MoviePy não disponível
-                    pass
-                except Exception as e:
-                    logger.warning(f"Erro ao extrair frame do vídeo: {e}")
-            
-            return self._generate_placeholder_preview("video")
-            
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            logger.error(f"Erro no preview de vídeo: {e}")
-            return self._generate_error_preview()
+            logger.error(f"Erro ao gerar preview: {e}")
+            return self._error_entry()
     
-    async def _preview_text_element(self, element_data: Dict[str, Any]) -> str:
-        """Preview específico para elemento de texto"""
-        try:
-            text = element_data.get("text", "Texto")
-            font_size = element_data.get("font_size", 24)
-            color = element_data.get("color", "#ffffff")
-            
-            # Criar imagem para o texto
-            img = Image.new("RGBA", (300, 100), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(img)
-            
+    def _load_or_render(self, cache_key: str, render, args) -> PreviewEntry:
+        """Executado no thread pool: nível em disco, depois renderização"""
+        entry = self.preview_cache.get(cache_key)
+        if entry is not None:
+            return entry
+        
+        data, content_type = render(*args)
+        entry = PreviewEntry(key=cache_key, data=data, content_type=content_type)
+        self.preview_cache.put(entry)
+        return entry
+    
+    def _error_entry(self) -> PreviewEntry:
+        data = self._generate_error_preview()
+        entry = PreviewEntry(key=hashlib.sha1(data).hexdigest(), data=data, content_type="image/png")
+        self.preview_cache.put(entry)
+        return entry
+    
+    # ------------------------------------------------------------------
+    # Renderização (síncrona, roda no thread pool)
+    # ------------------------------------------------------------------
+    
+    def _render_scene(self, scene_data: Dict[str, Any]) -> Tuple[bytes, str]:
+        # Composição por camadas: elementos já rasterizados vêm do cache
+        compositor = SceneCompositor(self.preview_size, self.background_color, self.layer_cache)
+        compositor.update(scene_data)
+        return self._encode(compositor.frame, "JPEG"), "image/jpeg"
+    
+    def _render_element(self, element_data: Dict[str, Any]) -> Tuple[bytes, str]:
+        element_type = element_data.get("type", "unknown")
+        
+        if element_type == "image":
+            return self._preview_image_element(element_data)
+        elif element_type == "video":
+            return self._preview_video_element(element_data)
+        elif element_type == "text":
+            return self._preview_text_element(element_data)
+        elif element_type == "audio":
+            return self._preview_audio_element(element_data)
+        else:
+            return self._generate_placeholder_preview(element_type), "image/png"
+    
+    def _render_timeline(self, timeline_data: List[Dict[str, Any]]) -> Tuple[bytes, str]:
+        # Criar imagem da timeline
+        timeline_width = max(800, len(timeline_data) * 120)
+        timeline_height = 80
+        
+        img = Image.new("RGB", (timeline_width, timeline_height), "#2d3748")
+        draw = ImageDraw.Draw(img)
+        
+        # Desenhar clips da timeline
+        x_offset = 10
+        for i, clip in enumerate(timeline_data):
+            clip_width = max(60, clip.get("duration", 3) * 20)
+            
+            # Cor baseada no tipo
+            clip_type = clip.get("type", "scene")
+            color = self._get_clip_color(clip_type)
+            
+            # Desenhar clip
+            draw.rectangle(
+                [x_offset, 20, x_offset + clip_width, 60],
+                fill=color,
+                outline="#4fc3f7",
+                width=1
+            )
+            
+            # Adicionar texto
+            title = clip.get("title", f"Clip {i+1}")
             try:
-                # Tentar usar fonte personalizada
-                font = ImageFont.truetype("arial.ttf", font_size)
-            except:
                 font = ImageFont.load_default()
+                text_bbox = draw.textbbox((0, 0), title, font=font)
+                text_width = text_bbox[2] - text_bbox[0]
+                text_x = x_offset + (clip_width - text_width) // 2
+                draw.text((text_x, 35), title, fill="white", font=font)
+            except:
+                draw.text((x_offset + 5, 35), title[:8], fill="white")
             
-            # Desenhar texto
-            draw.text((10, 20), text[:30], fill=self._hex_to_rgb(color), font=font)
-            
-            # Converter para base64
-            buffer = io.BytesIO()
-            img.save(buffer, format='PNG')
-            img_data = base64.b64encode(buffer.getvalue()).decode()
-            
-            return f"data:image/png;base64,{img_data}"
-            
-        except Exception as e:
-            logger.error(f"Erro no preview de texto: {e}")
-            return self._generate_error_preview()
+            x_offset += clip_width + 5
+        
+        return self._encode(img, "PNG"), "image/png"
     
-    async def _preview_audio_element(self, element_data: Dict[str, Any]) -> str:
-        """Preview específico para elemento de áudio"""
-        try:
-            # Gerar waveform visual para áudio
-            img = Image.new("RGB", (200, 60), "#2d3748")
-            draw = ImageDraw.Draw(img)
-            
-            # Simular waveform
-            import random
-            for i in range(0, 200, 3):
-                height = random.randint(5, 50)
-                draw.line([(i, 30 - height//2), (i, 30 + height//2)], fill="#4fc3f7", width=2)
-            
-            # Converter para base64
-            buffer = io.BytesIO()
-            img.save(buffer, format='PNG')
-            img_data = base64.b64encode(buffer.getvalue()).decode()
-            
-            return f"data:image/png;base64,{img_data}"
-            
-        except Exception as e:
-            logger.error(f"Erro no preview de áudio: {e}")
-            return self._generate_error_preview()
+    @staticmethod
+    def _encode(img: Image.Image, image_format: str) -> bytes:
+        buffer = io.BytesIO()
+        if image_format == "JPEG":
+            img.save(buffer, format="JPEG", quality=85)
+        else:
+            img.save(buffer, format=image_format)
+        return buffer.getvalue()
     
-    def _add_title_to_preview(self, img: Image.Image, draw: ImageDraw.Draw, title: str):
-        """Adicionar título ao preview"""
+    def _preview_image_element(self, element_data: Dict[str, Any]) -> Tuple[bytes, str]:
+        """Preview específico para elemento de imagem"""
+        asset_path = element_data.get("asset_path")
+        if asset_path and os.path.exists(asset_path):
+            # Carregar e redimensionar imagem
+            img = Image.open(asset_path)
+            img.thumbnail((200, 150), Image.Resampling.LANCZOS)
+            return self._encode(img.convert("RGB"), "JPEG"), "image/jpeg"
+        
+        return self._generate_placeholder_preview("image"), "image/png"
+    
+    def _preview_video_element(self, element_data: Dict[str, Any]) -> Tuple[bytes, str]:
+        """Preview específico para elemento de vídeo"""
+        # Para vídeo, gerar thumbnail do primeiro frame
+        asset_path = element_data.get("asset_path")
+        if asset_path and os.path.exists(asset_path):
+            try:
+                # Tentar extrair frame com moviepy (se disponível)
+                from moviepy.editor import VideoFileClip
+                
+                clip = VideoFileClip(asset_path)
+                frame = clip.get_frame(0)  # Primeiro frame
+                clip.close()
+                
+                # Converter numpy array para PIL Image
+                img = Image.fromarray(frame)
+                img.thumbnail((200, 150), Image.Resampling.LANCZOS)
+                
+                # Adicionar ícone de play
+                draw = ImageDraw.Draw(img)
+                width, height = img.size
+                play_x = width // 2 - 15
+                play_y = height // 2 - 15
+                draw.polygon([(play_x, play_y), (play_x + 30, play_y + 15), (play_x, play_y + 30)], 
+                           fill="white", outline="black")
+                
+                return self._encode(img, "JPEG"), "image/jpeg"
+                
+            except ImportError:
+                # MoviePy não disponível
+                pass
+            except Exception as e:
+                logger.warning(f"Erro ao extrair frame do vídeo: {e}")
+        
+        return self._generate_placeholder_preview("video"), "image/png"
+    
+    def _preview_text_element(self, element_data: Dict[str, Any]) -> Tuple[bytes, str]:
+        """Preview específico para elemento de texto"""
+        text = element_data.get("text", "Texto")
+        font_size = element_data.get("font_size", 24)
+        color = element_data.get("color", "#ffffff")
+        
+        # Criar imagem para o texto
+        img = Image.new("RGBA", (300, 100), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        
         try:
+            # Tentar usar fonte personalizada
+            font = ImageFont.truetype("arial.ttf", font_size)
+        except:
             font = ImageFont.load_default()
-            text_bbox = draw.textbbox((0, 0), title, font=font)
-            text_width = text_bbox[2] - text_bbox[0]
-            text_height = text_bbox[3] - text_bbox[1]
-            
-            # Posição centralizada na parte inferior
-            x = (self.preview_size[0] - text_width) // 2
-            y = self.preview_size[1] - text_height - 20
-            
-            # Fundo semi-transparente para o texto
-            draw.rectangle([x - 5, y - 5, x + text_width + 5, y + text_height + 5], 
-                         fill=(0, 0, 0, 128))
-            
-            # Desenhar texto
-            draw.text((x, y), title, fill="white", font=font)
-            
-        except Exception as e:
-            logger.error(f"Erro ao adicionar título: {e}")
+        
+        # Desenhar texto
+        draw.text((10, 20), text[:30], fill=self._hex_to_rgb(color), font=font)
+        
+        return self._encode(img, "PNG"), "image/png"
     
-    def _add_gradient(self, img: Image.Image, draw: ImageDraw.Draw):
-        """Adicionar gradiente sutil ao background"""
-        try:
-            width, height = img.size
-            for i in range(height // 2):
-                alpha = i / (height // 2) * 0.1
-                color = tuple(max(0, min(255, int(c * (1 + alpha)))) 
-                             for c in self._hex_to_rgb(self.background_color))
-                draw.line([(0, i), (width, i)], fill=color)
-        except Exception as e:
-            logger.error(f"Erro ao adicionar gradiente: {e}")
+    def _preview_audio_element(self, element_data: Dict[str, Any]) -> Tuple[bytes, str]:
+        """Preview específico para elemento de áudio"""
+        # Gerar waveform visual para áudio
+        img = Image.new("RGB", (200, 60), "#2d3748")
+        draw = ImageDraw.Draw(img)
+        
+        # Simular waveform (semente fixa: o mesmo elemento gera a mesma imagem)
+        import random
+        rng = random.Random(self._hash_payload(element_data))
+        for i in range(0, 200, 3):
+            height = rng.randint(5, 50)
+            draw.line([(i, 30 - height//2), (i, 30 + height//2)], fill="#4fc3f7", width=2)
+        
+        return self._encode(img, "PNG"), "image/png"
     
     def _generate_cache_key(self, scene_data: Dict[str, Any]) -> str:
         """Gerar chave única para cache do preview"""
         # Criar hash baseado nos dados relevantes da cena
-        import hashlib
-        
+        elements = scene_data.get("elements", [])
         relevant_data = {
             "title": scene_data.get("title", ""),
-            "elements": scene_data.get("elements", []),
-            "background": scene_data.get("background_color", self.background_color)
+            "elements": elements,
+            "background": scene_data.get("background_color", self.background_color),
+            "assets": self._asset_versions(elements)
         }
-        
-        data_str = json.dumps(relevant_data, sort_keys=True)
+        return self._hash_payload(relevant_data)
+    
+    @staticmethod
+    def _hash_payload(payload: Any) -> str:
+        data_str = json.dumps(payload, sort_keys=True, default=str)
         return hashlib.md5(data_str.encode()).hexdigest()
     
+    @staticmethod
+    def _asset_versions(elements: List[Dict[str, Any]]) -> List[Any]:
+        """Data de modificação dos arquivos referenciados (invalida a chave ao trocar o asset)"""
+        versions = []
+        for element in elements:
+            asset_path = element.get("asset_path") if isinstance(element, dict) else None
+            if asset_path:
+                try:
+                    versions.append([asset_path, os.stat(asset_path).st_mtime_ns])
+                except OSError:
+                    versions.append([asset_path, None])
+        return versions
+    
     def _hex_to_rgb(self, hex_color: str) -> tuple:
         """Converter cor hex para RGB"""
-        if hex_color.startswith("#"):
-            hex_color = hex_color[1:]
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        return hex_to_rgb(hex_color)
     
     def _get_clip_color(self, clip_type: str) -> str:
         """Obter cor baseada no tipo de clip"""
@@ -396,8 +362,8 @@ class PreviewService:
         }
         return colors.get(clip_type, "#6b7280")
     
-    def _generate_placeholder_preview(self, element_type: str) -> str:
-        """Gerar preview placeholder"""
+    def _generate_placeholder_preview(self, element_type: str) -> bytes:
+        """Gerar preview placeholder (PNG)"""
         try:
             img = Image.new("RGB", (150, 100), "#4a5568")
             draw = ImageDraw.Draw(img)
@@ -414,31 +380,21 @@ class PreviewService:
             icon = icons.get(element_type, "❓")
             draw.text((60, 40), icon, fill="white")
             
-            # Converter para base64
-            buffer = io.BytesIO()
-            img.save(buffer, format='PNG')
-            img_data = base64.b64encode(buffer.getvalue()).decode()
-            
-            return f"data:image/png;base64,{img_data}"
+            return self._encode(img, "PNG")
             
         except Exception as e:
             logger.error(f"Erro ao gerar placeholder: {e}")
             return self._generate_error_preview()
     
-    def _generate_error_preview(self) -> str:
-        """Gerar preview de erro"""
+    def _generate_error_preview(self) -> bytes:
+        """Gerar preview de erro (PNG)"""
         try:
             img = Image.new("RGB", (150, 100), "#ef4444")
             draw = ImageDraw.Draw(img)
             draw.text((50, 40), "ERRO", fill="white")
-            
-            buffer = io.BytesIO()
-            img.save(buffer, format='PNG')
-            img_data = base64.b64encode(buffer.getvalue()).decode()
-            
-            return f"data:image/png;base64,{img_data}"
+            return self._encode(img, "PNG")
         except:
-            return "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+            return base64.b64decode("iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg==")
     
     # WebSocket para updates em tempo real
     async def connect_websocket(self, websocket: WebSocket):
@@ -451,6 +407,27 @@ class PreviewService:
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
     
+    def get_live_session(self, websocket: WebSocket, binary: bool = True) -> LivePreviewSession:
+        """Sessão de preview incremental da conexão (criada no primeiro uso)"""
+        session = self.live_sessions.get(websocket)
+        if session is None:
+            send = websocket.send_bytes if binary else websocket.send_text
+            session = LivePreviewSession(
+                send,
+                executor=self._executor,
+                preview_size=self.preview_size,
+                default_background=self.background_color,
+                binary=binary,
+            )
+            self.live_sessions[websocket] = session
+        return session
+    
+    async def close_live_session(self, websocket: WebSocket):
+        """Encerrar a sessão incremental de uma conexão"""
+        session = self.live_sessions.pop(websocket, None)
+        if session is not None:
+            await session.close()
+    
     async def broadcast_preview_update(self, preview_data: Dict[str, Any]):
         """Broadcast de update de preview para todos os clientes conectados"""
         if self.active_connections:
@@ -479,19 +456,68 @@ preview_service = PreviewService()
 # ENDPOINTS DA API
 # ============================================================================
 
+# Previews mostram conteúdo dos projetos: só o navegador guarda, nunca CDN/proxy
+PREVIEW_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+def _preview_url(connection, entry: PreviewEntry) -> str:
+    """URL endereçada por conteúdo do preview binário"""
+    return str(connection.url_for("get_preview_image", key=entry.key))
+
+
+def _preview_payload(connection, entry: PreviewEntry, inline: bool) -> Dict[str, Any]:
+    return {
+        "preview_url": preview_service.to_data_url(entry) if inline else _preview_url(connection, entry),
+        "image_url": _preview_url(connection, entry),
+        "etag": entry.etag,
+        "content_type": entry.content_type,
+        "size_bytes": entry.size,
+    }
+
+
+@router.get("/preview/image/{key}", name="get_preview_image")
+async def get_preview_image(key: str, request: Request):
+    """
+    Servir um preview binário já renderizado.
+    
+    A chave é o hash do conteúdo da cena, então a resposta nunca muda:
+    pode ser cacheada indefinidamente pelo navegador (`private`, fora de
+    caches compartilhados) e revalidada por ETag (304) sem transferir a imagem.
+    """
+    if not is_valid_key(key):
+        raise HTTPException(status_code=404, detail="Preview não encontrado")
+    
+    entry = preview_service.preview_cache.get(key, include_disk=False)
+    if entry is None:
+        loop = asyncio.get_running_loop()
+        entry = await loop.run_in_executor(preview_service._executor, preview_service.get_cached_preview, key)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Preview não encontrado")
+    
+    etag = f'"{entry.etag}"'
+    headers = {"ETag": etag, "Cache-Control": PREVIEW_CACHE_CONTROL}
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=entry.data, media_type=entry.content_type, headers=headers)
+
 @router.post("/scene/preview")
 async def generate_scene_preview(
     scene_data: dict,
+    request: Request,
+    inline: bool = Query(False, description="Retornar data URL em base64 em vez da URL binária"),
     current_user: User = Depends(get_current_user)
 ):
     """Gerar preview de uma cena"""
     try:
-        preview_url = await preview_service.generate_scene_preview(scene_data)
+        entry = await preview_service.render_scene_preview(scene_data)
         
         return {
             "success": True,
-            "preview_url": preview_url,
-            "cache_key": preview_service._generate_cache_key(scene_data),
+            **_preview_payload(request, entry, inline),
+            "cache_key": entry.key,
             "generated_at": datetime.now().isoformat()
         }
         
@@ -502,15 +528,17 @@ async def generate_scene_preview(
 @router.post("/element/preview")
 async def generate_element_preview(
     element_data: dict,
+    request: Request,
+    inline: bool = Query(False, description="Retornar data URL em base64 em vez da URL binária"),
     current_user: User = Depends(get_current_user)
 ):
     """Gerar preview de um elemento"""
     try:
-        preview_url = await preview_service.generate_element_preview(element_data)
+        entry = await preview_service.render_element_preview(element_data)
         
         return {
             "success": True,
-            "preview_url": preview_url,
+            **_preview_payload(request, entry, inline),
             "element_type": element_data.get("type", "unknown"),
             "generated_at": datetime.now().isoformat()
         }
@@ -522,16 +550,18 @@ async def generate_element_preview(
 @router.post("/timeline/preview")
 async def generate_timeline_preview(
     timeline_data: dict,
+    request: Request,
+    inline: bool = Query(False, description="Retornar data URL em base64 em vez da URL binária"),
     current_user: User = Depends(get_current_user)
 ):
     """Gerar preview da timeline"""
     try:
         clips = timeline_data.get("clips", [])
-        preview_url = await preview_service.generate_timeline_preview(clips)
+        entry = await preview_service.render_timeline_preview(clips)
         
         return {
             "success": True,
-            "preview_url": preview_url,
+            **_preview_payload(request, entry, inline),
             "clips_count": len(clips),
             "generated_at": datetime.now().isoformat()
         }
@@ -542,7 +572,17 @@ async def generate_timeline_preview(
 
 @router.websocket("/preview/live")
 async def websocket_preview_updates(websocket: WebSocket):
-    """WebSocket para updates de preview em tempo real"""
+    """
+    WebSocket para updates de preview em tempo real.
+    
+    Mensagens aceitas:
+    - scene_update / element_update: preview completo, URL em broadcast
+    - scene_live: estado completo da cena para preview incremental
+    - element_live: alteração de um elemento (`scene_id`, `element` com `id`, `remove`)
+    
+    As respostas incrementais seguem o formato de `app.services.live_preview`
+    (binário por padrão; `"binary": false` na primeira mensagem usa JSON).
+    """
     await preview_service.connect_websocket(websocket)
     
     try:
@@ -554,40 +594,69 @@ async def websocket_preview_updates(websocket: WebSocket):
             if message.get("type") == "scene_update":
                 # Gerar preview da cena atualizada
                 scene_data = message.get("scene_data", {})
-                preview_url = await preview_service.generate_scene_preview(scene_data)
+                entry = await preview_service.render_scene_preview(scene_data)
                 
-                # Broadcast do preview atualizado
+                # Broadcast apenas da URL; os clientes baixam (e cacheiam) o binário
                 await preview_service.broadcast_preview_update({
                     "scene_id": scene_data.get("id"),
-                    "preview_url": preview_url
+                    "preview_url": _preview_url(websocket, entry),
+                    "etag": entry.etag
                 })
                 
             elif message.get("type") == "element_update":
                 # Gerar preview do elemento atualizado
                 element_data = message.get("element_data", {})
-                preview_url = await preview_service.generate_element_preview(element_data)
+                entry = await preview_service.render_element_preview(element_data)
                 
                 # Broadcast do preview atualizado
                 await preview_service.broadcast_preview_update({
                     "element_id": element_data.get("id"),
-                    "preview_url": preview_url
+                    "preview_url": _preview_url(websocket, entry),
+                    "etag": entry.etag
                 })
+            
+            elif message.get("type") == "scene_live":
+                # Preview incremental: o primeiro envio devolve o quadro inteiro,
+                # os seguintes apenas as regiões alteradas (só para este cliente)
+                session = preview_service.get_live_session(websocket, binary=message.get("binary", True))
+                session.submit_scene(message.get("scene_data", {}))
+            
+            elif message.get("type") == "element_live":
+                # Alteração de um único elemento (ex.: arrastar no editor)
+                session = preview_service.get_live_session(websocket, binary=message.get("binary", True))
+                accepted = session.submit_element(
+                    message.get("scene_id"),
+                    message.get("element", {}),
+                    remove=bool(message.get("remove", False))
+                )
+                if not accepted:
+                    await websocket.send_text(json.dumps({
+                        "type": "error",
+                        "message": "Envie a cena completa (scene_live) antes de alterar elementos"
+                    }))
                 
     except WebSocketDisconnect:
-        preview_service.disconnect_websocket(websocket)
+        pass
     except Exception as e:
         logger.error(f"Erro no WebSocket de preview: {e}")
+    finally:
         preview_service.disconnect_websocket(websocket)
+        await preview_service.close_live_session(websocket)
 
 @router.get("/cache/stats")
 async def get_cache_stats(current_user: User = Depends(get_current_user)):
     """Obter estatísticas do cache de previews"""
+    cache_stats = preview_service.preview_cache.get_stats()
     return {
         "success": True,
-        "cache_size": len(preview_service.preview_cache),
+        "cache_size": cache_stats["memory_entries"] + cache_stats["disk_entries"],
         "active_connections": len(preview_service.active_connections),
         "stats": {
-            "total_previews_cached": len(preview_service.preview_cache),
+            **cache_stats,
+            "total_previews_cached": cache_stats["memory_entries"] + cache_stats["disk_entries"],
+            "renders_in_progress": len(preview_service._inflight),
+            "live_sessions": len(preview_service.live_sessions),
+            "layer_cache": preview_service.layer_cache.get_stats(),
             "websocket_connections": len(preview_service.active_connections)
         }
     }
@@ -595,10 +664,12 @@ async def get_cache_stats(current_user: User = Depends(get_current_user)):
 @router.delete("/cache/clear")
 async def clear_preview_cache(current_user: User = Depends(get_current_user)):
     """Limpar cache de previews"""
-    preview_service.preview_cache.clear()
+    # Remove os arquivos do nível em disco: fora do event loop
+    await asyncio.to_thread(preview_service.preview_cache.clear)
+    preview_service.layer_cache.clear()
     
     return {
         "success": True,
         "message": "Cache de previews limpo",
         "cleared_at": datetime.now().isoformat()
-    }
\ No newline at end of file
+    }
@@ -19,15 +19,15 @@ Data: 17/01/2025
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks, Body, File, UploadFile
 from fastapi.responses import JSONResponse, FileResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
-from typing import List, Optional, Dict, Any
+from sqlalchemy.orm import Session, defer
+from sqlalchemy import func, and_, or_, inspect
+from typing import List, Optional, Dict, Any, Set
 import json
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.auth import get_current_active_user
 from app.models import User, Project, Scene, Asset, SceneComment, SceneTemplate
 from app.schemas import (
@@ -38,6 +38,18 @@ from app.schemas import (
     SceneCommentCreate, SceneCommentUpdate, SceneCommentResponse
 )
 from app.logger import get_logger
+from app.core.pagination import apply_keyset_pagination, build_keyset_page, estimate_count, InvalidCursorError
+from app.services.search_index_service import scene_search_condition
+from app.services.scene_ordering import move_scene, next_scene_rank
+from app.core.job_queue import get_job_queue
+from app.services.scene_bulk_operations import (
+    bulk_delete_scenes, bulk_duplicate_scenes, bulk_reorder_scenes, bulk_update_style
+)
+
+try:
+    from sqlalchemy.ext.asyncio import AsyncSession
+except ImportError:
+    AsyncSession = Any  # Sem greenlet: get_async_db falha na primeira chamada
 
 # Importar serviços com fallback
 try:
@@ -88,10 +100,13 @@ router = APIRouter(
 # UTILITÁRIOS E HELPERS
 # ============================================================================
 
-def build_pagination_meta(page: int, size: int, total: int) -> PaginationMeta:
-    """Constrói metadados de paginação"""
-    pages = (total + size - 1) // size  # Ceiling division
-    has_next = page < pages
+def build_pagination_meta(page: int, size: int, total: Optional[int],
+                          has_next: Optional[bool] = None,
+                          total_is_estimate: bool = False) -> PaginationMeta:
+    """Constrói metadados de paginação (total pode ser None ou estimado)"""
+    pages = (total + size - 1) // size if total is not None else None  # Ceiling division
+    if has_next is None:
+        has_next = page < pages
     has_prev = page > 1
     
     return PaginationMeta(
@@ -102,9 +117,31 @@ def build_pagination_meta(page: int, size: int, total: int) -> PaginationMeta:
         has_next=has_next,
         has_prev=has_prev,
         next_page=page + 1 if has_next else None,
-        prev_page=page - 1 if has_prev else None
+        prev_page=page - 1 if has_prev else None,
+        total_is_estimate=total_is_estimate
     )
 
+# Colunas de texto volumosas adiadas nas listagens resumidas
+SCENE_HEAVY_COLUMNS = (
+    Scene.texto, Scene.background_config, Scene.layout_config, Scene.transition_config,
+    Scene.animation_config, Scene.notes, Scene.custom_properties
+)
+
+# Limite de linhas contadas no modo de contagem estimada
+SCENE_COUNT_ESTIMATE_CAP = 10000
+
+def scene_list_item(scene: Scene) -> SceneResponse:
+    """Serializa cena de listagem sem disparar carga de colunas adiadas"""
+    unloaded = inspect(scene).unloaded
+    if not unloaded:
+        return SceneResponse.from_orm(scene)
+    data = {
+        column.key: getattr(scene, column.key)
+        for column in Scene.__table__.columns
+        if column.key not in unloaded
+    }
+    return SceneResponse.model_validate(data)
+
 def apply_scene_filters(query, filters: SceneFilterParams, user_id: int):
     """Aplica filtros avançados à query de cenas"""
     
@@ -127,16 +164,9 @@ def apply_scene_filters(query, filters: SceneFilterParams, user_id: int):
     if filters.is_active is not None:
         query = query.filter(Scene.is_active == filters.is_active)
     
-    # Busca textual
+    # Busca textual (índice full-text quando disponível)
     if filters.search:
-        search_term = f"%{filters.search}%"
-        query = query.filter(
-            or_(
-                Scene.name.ilike(search_term),
-                Scene.texto.ilike(search_term),
-                Scene.notes.ilike(search_term)
-            )
-        )
+        query = query.filter(scene_search_condition(query.session, filters.search))
     
     # Filtros de duração
     if filters.duration_min is not None:
@@ -188,8 +218,12 @@ async def list_scenes(
     duration_max: Optional[float] = Query(None, gt=0, description="Duração máxima"),
     order_by: str = Query("ordem", description="Campo para ordenação"),
     order_direction: str = Query("asc", pattern="^(asc|desc)$", description="Direção da ordenação"),
+    pagination: str = Query("page", pattern="^(page|cursor)$", description="Modo de paginação"),
+    cursor: Optional[str] = Query(None, description="Cursor da próxima página (modo cursor)"),
+    count: str = Query("exact", pattern="^(exact|estimated|none)$", description="Modo de contagem do total"),
+    view: str = Query("full", pattern="^(full|summary)$", description="Campos retornados"),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Listar cenas do usuário com filtros e paginação avançada.
@@ -197,6 +231,12 @@ async def list_scenes(
     **Parâmetros de Paginação:**
     - **page**: Número da página (inicia em 1)
     - **size**: Itens por página (1-100)
+    - **pagination**: `page` (padrão) ou `cursor` (keyset, sem OFFSET nem COUNT)
+    - **cursor**: Valor de `meta.next_cursor` da resposta anterior
+    - **count**: `exact` (padrão), `estimated` (contagem limitada/estimativa do
+      planner, `meta.total_is_estimate`) ou `none` (sem total)
+    - **view**: `summary` omite colunas de texto volumosas (texto, configs JSON,
+      notas, propriedades customizadas), que não são carregadas do banco
     
     **Filtros Disponíveis:**
     - **project_id**: ID do projeto para filtrar
@@ -215,10 +255,25 @@ async def list_scenes(
     - Lista paginada com metadados completos
     - Filtros aplicados documentados
     - Total de resultados e páginas
+    - Com **project_id**, a página fica em cache até a cena/projeto mudar
     """
-    try:
+    # Listagens de um projeto ficam em cache (invalidadas pela geração do projeto)
+    list_cache_params = None
+    if CACHE_AVAILABLE and scenes_cache and project_id:
+        list_cache_params = {
+            'user_id': current_user.id, 'project_id': project_id, 'page': page, 'size': size,
+            'template_id': template_id, 'style_preset': style_preset, 'is_template': is_template,
+            'is_active': is_active, 'search': search, 'duration_min': duration_min,
+            'duration_max': duration_max, 'order_by': order_by, 'order_direction': order_direction,
+            'pagination': pagination, 'cursor': cursor, 'count': count, 'view': view
+        }
+        cached_page = scenes_cache.get('scene_list', **list_cache_params)
+        if cached_page is not None:
+            return cached_page
+    
+    def load_page(sync_db: Session):
         # Construir query base
-        query = db.query(Scene).join(Project).filter(Project.owner_id == current_user.id)
+        query = sync_db.query(Scene).join(Project).filter(Project.owner_id == current_user.id)
         
         # Aplicar filtros
         if project_id:
@@ -237,14 +292,7 @@ async def list_scenes(
             query = query.filter(Scene.is_active == is_active)
         
         if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                or_(
-                    Scene.name.ilike(search_term),
-                    Scene.texto.ilike(search_term),
-                    Scene.notes.ilike(search_term)
-                )
-            )
+            query = query.filter(scene_search_condition(sync_db, search))
         
         if duration_min is not None:
             query = query.filter(Scene.duracao >= duration_min)
@@ -252,24 +300,63 @@ async def list_scenes(
         if duration_max is not None:
             query = query.filter(Scene.duracao <= duration_max)
         
-        # Aplicar ordenação
-        order_column = getattr(Scene, order_by, Scene.ordem)
-        if order_direction == "desc":
-            query = query.order_by(order_column.desc())
-        else:
-            query = query.order_by(order_column.asc())
+        if view == "summary":
+            query = query.options(*[defer(column) for column in SCENE_HEAVY_COLUMNS])
         
-        # Contar total
-        total = query.count()
-        
-        # Calcular offset
-        offset = (page - 1) * size
+        order_column = getattr(Scene, order_by, Scene.ordem)
         
-        # Aplicar paginação
-        scenes = query.offset(offset).limit(size).all()
+        if cursor or pagination == "cursor":
+            # Paginação keyset em (coluna de ordenação, id): sem OFFSET nem COUNT
+            keyset_columns = [order_column, Scene.id] if order_column is not Scene.id else [Scene.id]
+            rows = apply_keyset_pagination(
+                query, keyset_columns, cursor, size, descending=order_direction == "desc"
+            ).all()
+            scenes, next_cursor = build_keyset_page(rows, [c.key for c in keyset_columns], size)
+            total = None
+            meta = PaginationMeta(
+                page=1, size=size, total=None, pages=None,
+                has_next=next_cursor is not None, has_prev=cursor is not None,
+                next_cursor=next_cursor
+            )
+        else:
+            # Aplicar ordenação (id como desempate estável)
+            if order_direction == "desc":
+                query = query.order_by(order_column.desc(), Scene.id.desc())
+            else:
+                query = query.order_by(order_column.asc(), Scene.id.asc())
+            
+            offset = (page - 1) * size
+            if count == "exact":
+                # Total calculado na mesma consulta via window function
+                rows = query.add_columns(func.count().over().label("total")).offset(offset).limit(size).all()
+                scenes = [row[0] for row in rows]
+                if rows:
+                    total = rows[0].total
+                else:
+                    total = query.order_by(None).count() if page > 1 else 0
+                
+                # Construir metadados de paginação
+                meta = build_pagination_meta(page, size, total)
+            else:
+                # Linha extra indica a próxima página sem depender do total
+                rows = query.offset(offset).limit(size + 1).all()
+                scenes = rows[:size]
+                has_next = len(rows) > size
+                total, exact = None, True
+                if count == "estimated":
+                    cap = max(SCENE_COUNT_ESTIMATE_CAP, offset + size + 1)
+                    total, exact = estimate_count(query, cap=cap)
+                    total = max(total, offset + len(scenes))
+                meta = build_pagination_meta(
+                    page, size, total, has_next=has_next, total_is_estimate=not exact
+                )
         
-        # Construir metadados de paginação
-        meta = build_pagination_meta(page, size, total)
+        return [scene_list_item(scene) for scene in scenes], meta, total
+    
+    try:
+        # As consultas rodam via run_sync: o I/O do banco é aguardado
+        # (aiosqlite/asyncpg) sem bloquear o event loop
+        items, meta, total = await db.run_sync(load_page)
         
         # Documentar filtros aplicados
         filters_applied = {
@@ -281,23 +368,35 @@ async def list_scenes(
             "search": search,
             "duration_range": [duration_min, duration_max] if duration_min or duration_max else None,
             "order_by": order_by,
-            "order_direction": order_direction
+            "order_direction": order_direction,
+            "pagination": "cursor" if cursor or pagination == "cursor" else None,
+            "count": count if count != "exact" else None,
+            "view": view if view != "full" else None
         }
         
         # Remover filtros nulos
         filters_applied = {k: v for k, v in filters_applied.items() if v is not None}
         
-        logger.info(f"Cenas listadas: {len(scenes)} de {total} total", 
+        logger.info(f"Cenas listadas: {len(items)} de {total if total is not None else '?'} total", 
                    user_id=current_user.id, 
                    page=page, 
                    filters=len(filters_applied))
         
-        return PaginatedSceneResponse(
-            items=[SceneResponse.from_orm(scene) for scene in scenes],
+        response = PaginatedSceneResponse(
+            items=items,
             meta=meta,
             filters_applied=filters_applied
         )
+        if list_cache_params:
+            scenes_cache.set('scene_list', response, **list_cache_params)
+        
+        return response
         
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Erro ao listar cenas: {e}")
         raise HTTPException(
@@ -318,6 +417,7 @@ async def get_scene(
     
     **Otimizações:**
     - Cache automático de 15 minutos para detalhes de cena
+    - Cache em processo de alguns segundos para as cenas mais acessadas
     - Invalidação automática quando cena é modificada
     - Carregamento opcional de assets e comentários
     - Query otimizada com joins seletivos
@@ -447,11 +547,8 @@ async def create_scene(
                 detail="Projeto não encontrado"
             )
         
-        # Determinar ordem da cena de forma otimizada
-        max_ordem = db.query(func.max(Scene.ordem)).filter(
-            Scene.project_id == scene_data.project_id
-        ).scalar()
-        nova_ordem = (max_ordem or 0) + 1
+        # Rank esparso no final do projeto
+        nova_ordem = next_scene_rank(db, scene_data.project_id)
         
         # Criar cena em transação atômica
         scene = Scene(
@@ -724,11 +821,8 @@ async def duplicate_scene(
         if not new_name:
             new_name = f"{original_scene.name} (Cópia)"
         
-        # Determinar nova ordem
-        max_ordem = db.query(db.func.max(Scene.ordem)).filter(
-            Scene.project_id == original_scene.project_id
-        ).scalar()
-        nova_ordem = (max_ordem or 0) + 1
+        # Determinar nova ordem (rank esparso no final do projeto)
+        nova_ordem = next_scene_rank(db, original_scene.project_id)
         
         # Criar nova cena
         new_scene = Scene(
@@ -814,11 +908,17 @@ async def duplicate_scene(
 @router.put("/{scene_id}/reorder")
 async def reorder_scene(
     scene_id: int,
-    new_order: int = Body(..., description="Nova posição da cena"),
+    background_tasks: BackgroundTasks,
+    new_order: int = Body(..., description="Nova posição da cena (1 = primeira)"),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    """Reordenar cena no projeto."""
+    """
+    Reordenar cena no projeto.
+    
+    A cena recebe um rank entre os vizinhos da nova posição, então apenas
+    ela é atualizada (o projeto só é renumerado quando o intervalo se esgota).
+    """
     try:
         scene = db.query(Scene).join(Project).filter(
             Scene.id == scene_id,
@@ -831,34 +931,21 @@ async def reorder_scene(
                 detail="Cena não encontrada"
             )
         
-        old_order = scene.ordem
-        project_id = scene.project_id
-        
-        # Reordenar outras cenas do projeto
-        if new_order > old_order:
-            # Mover para frente - diminuir ordem das cenas intermediárias
-            db.query(Scene).filter(
-                Scene.project_id == project_id,
-                Scene.ordem > old_order,
-                Scene.ordem <= new_order,
-                Scene.id != scene_id
-            ).update({Scene.ordem: Scene.ordem - 1})
-        else:
-            # Mover para trás - aumentar ordem das cenas intermediárias
-            db.query(Scene).filter(
-                Scene.project_id == project_id,
-                Scene.ordem >= new_order,
-                Scene.ordem < old_order,
-                Scene.id != scene_id
-            ).update({Scene.ordem: Scene.ordem + 1})
-        
-        # Atualizar ordem da cena
-        scene.ordem = new_order
+        move = move_scene(db, scene, new_order)
         scene.last_modified_by = current_user.id
         
         db.commit()
         
-        return {"message": "Cena reordenada com sucesso", "old_order": old_order, "new_order": new_order}
+        # Só a ordenação do projeto (e a própria cena) mudou
+        background_tasks.add_task(_invalidate_ordering_cache, scene_id, scene.project_id)
+        
+        return {
+            "message": "Cena reordenada com sucesso",
+            "old_order": move.old_rank,
+            "new_order": move.position,
+            "rank": move.new_rank,
+            "rebalanced": move.rebalanced
+        }
         
     except HTTPException:
         raise
@@ -1184,7 +1271,7 @@ async def bulk_scene_operations(
     """
     try:
         # Validar se cenas existem e pertencem ao usuário
-        valid_scenes = db.query(Scene).join(Project).filter(
+        valid_scenes = db.query(Scene).join(Project).order_by(Scene.id).filter(
             Scene.id.in_(operation.scene_ids),
             Project.owner_id == current_user.id
         ).all()
@@ -1214,12 +1301,12 @@ async def bulk_scene_operations(
         
         elif operation.operation == "update_style":
             success_count = await _bulk_update_style(
-                valid_ids, db, background_tasks, operation.parameters
+                valid_ids, db, background_tasks, operation.parameters, current_user.id
             )
         
         elif operation.operation == "reorder":
             success_count = await _bulk_reorder_scenes(
-                valid_ids, db, background_tasks, operation.parameters
+                valid_scenes, db, background_tasks, operation.parameters
             )
         
         else:
@@ -1228,6 +1315,14 @@ async def bulk_scene_operations(
                 detail=f"Operação não suportada: {operation.operation}"
             )
         
+        # Uma única invalidação por projeto afetado
+        if success_count:
+            background_tasks.add_task(
+                _invalidate_projects_cache,
+                {scene.project_id for scene in valid_scenes},
+                current_user.id
+            )
+        
         # Construir resposta
         total_requested = len(operation.scene_ids)
         message = f"Operação {operation.operation} executada: {success_count} sucessos, {error_count} erros"
@@ -1268,55 +1363,70 @@ async def get_scenes_summary(
     **Características:**
     - Dados essenciais apenas (performance otimizada)
     - Contagem de assets incluída
-    - Cache habilitado para resultados frequentes
+    - Cache por projeto, lido com um único MGET para todos os projetos
     - Ideal para interfaces de dashboard
     """
     try:
-        # Query otimizada com contagem de assets
-        query = db.query(
-            Scene.id,
-            Scene.uuid,
-            Scene.name,
-            Scene.ordem,
-            Scene.duracao,
-            Scene.style_preset,
-            Scene.background_color,
-            Scene.is_active,
-            Scene.created_at,
-            Scene.updated_at,
-            Scene.project_id,
-            func.count(Asset.id).label('assets_count')
-        ).join(Project).outerjoin(Asset).filter(
-            Project.owner_id == current_user.id
-        ).group_by(Scene.id)
-        
+        # Projetos no escopo do resumo (consulta apenas de ids)
+        project_query = db.query(Project.id).filter(Project.owner_id == current_user.id)
         if project_id:
-            query = query.filter(Scene.project_id == project_id)
-        
-        # Ordenar por projeto e ordem
-        query = query.order_by(Scene.project_id, Scene.ordem)
+            project_query = project_query.filter(Project.id == project_id)
+        project_ids = [pid for (pid,) in project_query.order_by(Project.id)]
         
-        # Aplicar limite
-        scenes_data = query.limit(limit).all()
+        # Resumo de cada projeto em cache: um único MGET para todos
+        cache_params = [{'project_id': pid, 'user_id': current_user.id} for pid in project_ids]
+        if CACHE_AVAILABLE and scenes_cache:
+            cached = scenes_cache.get_many('project_scenes', cache_params)
+        else:
+            cached = [None] * len(project_ids)
+        by_project = {pid: items for pid, items in zip(project_ids, cached) if items is not None}
+        missing = [pid for pid in project_ids if pid not in by_project]
+        
+        if missing:
+            # Query otimizada com contagem de assets, só para projetos fora do cache
+            scenes_data = db.query(
+                Scene.id,
+                Scene.uuid,
+                Scene.name,
+                Scene.ordem,
+                Scene.duracao,
+                Scene.style_preset,
+                Scene.background_color,
+                Scene.is_active,
+                Scene.created_at,
+                Scene.updated_at,
+                Scene.project_id,
+                func.count(Asset.id).label('assets_count')
+            ).outerjoin(Asset, Asset.scene_id == Scene.id).filter(
+                Scene.project_id.in_(missing)
+            ).group_by(Scene.id).order_by(Scene.project_id, Scene.ordem, Scene.id).all()
+            
+            for pid in missing:
+                by_project[pid] = []
+            for scene_data in scenes_data:
+                by_project[scene_data.project_id].append(SceneSummary(
+                    id=scene_data.id,
+                    uuid=scene_data.uuid,
+                    name=scene_data.name,
+                    ordem=scene_data.ordem,
+                    duracao=scene_data.duracao,
+                    style_preset=scene_data.style_preset,
+                    background_color=scene_data.background_color,
+                    is_active=scene_data.is_active,
+                    created_at=scene_data.created_at,
+                    updated_at=scene_data.updated_at,
+                    project_id=scene_data.project_id,
+                    assets_count=scene_data.assets_count or 0
+                ))
+            
+            if CACHE_AVAILABLE and scenes_cache:
+                scenes_cache.set_many('project_scenes', [
+                    (params, by_project[params['project_id']])
+                    for params in cache_params if params['project_id'] in missing
+                ])
         
-        # Construir resposta otimizada
-        scenes_summary = []
-        for scene_data in scenes_data:
-            summary = SceneSummary(
-                id=scene_data.id,
-                uuid=scene_data.uuid,
-                name=scene_data.name,
-                ordem=scene_data.ordem,
-                duracao=scene_data.duracao,
-                style_preset=scene_data.style_preset,
-                background_color=scene_data.background_color,
-                is_active=scene_data.is_active,
-                created_at=scene_data.created_at,
-                updated_at=scene_data.updated_at,
-                project_id=scene_data.project_id,
-                assets_count=scene_data.assets_count or 0
-            )
-            scenes_summary.append(summary)
+        # Ordenar por projeto e ordem, aplicando o limite
+        scenes_summary = [summary for pid in project_ids for summary in by_project[pid]][:limit]
         
         logger.info(f"Resumo de cenas obtido: {len(scenes_summary)} cenas", 
                    user_id=current_user.id, project_id=project_id)
@@ -1421,9 +1531,9 @@ async def render_scene(
 # ============================================================================
 
 async def _bulk_delete_scenes(scene_ids: List[int], db: Session, background_tasks: BackgroundTasks) -> int:
-    """Deletar cenas em lote"""
+    """Deletar cenas em lote (assets e comentários incluídos, uma transação)"""
     try:
-        deleted_count = db.query(Scene).filter(Scene.id.in_(scene_ids)).delete(synchronize_session=False)
+        deleted_count = bulk_delete_scenes(db, scene_ids)
         db.commit()
         return deleted_count
     except Exception as e:
@@ -1433,34 +1543,25 @@ async def _bulk_delete_scenes(scene_ids: List[int], db: Session, background_task
 
 async def _bulk_duplicate_scenes(scenes: List[Scene], user_id: int, db: Session, 
                                 background_tasks: BackgroundTasks, parameters: Dict) -> int:
-    """Duplicar cenas em lote"""
+    """Duplicar cenas em lote com INSERTs multi-linha de cenas e assets"""
     try:
-        success_count = 0
-        for scene in scenes:
-            # Lógica de duplicação similar ao endpoint individual
-            # ... (implementação da duplicação)
-            success_count += 1
-        
+        copies = bulk_duplicate_scenes(
+            db, scenes, user_id, name_suffix=parameters.get('name_suffix', ' (Cópia)')
+        )
         db.commit()
-        return success_count
+        return len(copies)
     except Exception as e:
         db.rollback()
         logger.error(f"Erro em bulk duplicate: {e}")
         return 0
 
 async def _bulk_update_style(scene_ids: List[int], db: Session, 
-                           background_tasks: BackgroundTasks, parameters: Dict) -> int:
+                           background_tasks: BackgroundTasks, parameters: Dict,
+                           user_id: Optional[int] = None) -> int:
     """Atualizar estilo de cenas em lote"""
     try:
         style_preset = parameters.get('style_preset', 'modern')
-        
-        updated_count = db.query(Scene).filter(
-            Scene.id.in_(scene_ids)
-        ).update({
-            Scene.style_preset: style_preset,
-            Scene.updated_at: datetime.utcnow()
-        }, synchronize_session=False)
-        
+        updated_count = bulk_update_style(db, scene_ids, style_preset, user_id)
         db.commit()
         return updated_count
     except Exception as e:
@@ -1468,21 +1569,12 @@ async def _bulk_update_style(scene_ids: List[int], db: Session,
         logger.error(f"Erro em bulk update style: {e}")
         return 0
 
-async def _bulk_reorder_scenes(scene_ids: List[int], db: Session,
+async def _bulk_reorder_scenes(scenes: List[Scene], db: Session,
                               background_tasks: BackgroundTasks, parameters: Dict) -> int:
-    """Reordenar cenas em lote"""
+    """Reordenar cenas em lote (um UPDATE em lote por chave primária)"""
     try:
-        new_orders = parameters.get('new_orders', {})
-        success_count = 0
-        
-        for scene_id in scene_ids:
-            if str(scene_id) in new_orders:
-                db.query(Scene).filter(Scene.id == scene_id).update({
-                    Scene.ordem: new_orders[str(scene_id)],
-                    Scene.updated_at: datetime.utcnow()
-                })
-                success_count += 1
-        
+        new_orders = {str(k): v for k, v in parameters.get('new_orders', {}).items()}
+        success_count = bulk_reorder_scenes(db, scenes, new_orders)
         db.commit()
         return success_count
     except Exception as e:
@@ -1534,37 +1626,45 @@ async def _invalidate_related_cache(user_id: int, project_id: int):
     """Invalidar cache relacionado a usuário e projeto"""
     if CACHE_AVAILABLE and scenes_cache:
         try:
-            # Invalidar cache do usuário
-            user_count = scenes_cache.invalidate_user_cache(user_id)
-            
-            # Invalidar cache do projeto
-            project_count = scenes_cache.invalidate_project_cache(project_id)
-            
-            logger.debug(f"Cache invalidado: {user_count} usuário, {project_count} projeto")
+            count = scenes_cache.invalidate(user_ids=[user_id], project_ids=[project_id])
+            logger.debug(f"Cache invalidado: usuário {user_id}, projeto {project_id} ({count} gerações)")
         except Exception as e:
             logger.error(f"Erro ao invalidar cache relacionado: {e}")
 
+async def _invalidate_projects_cache(project_ids: Set[int], user_id: int):
+    """Invalidar cache após operação em lote: uma vez por projeto e usuário"""
+    if CACHE_AVAILABLE and scenes_cache:
+        try:
+            count = scenes_cache.invalidate(user_ids=[user_id], project_ids=project_ids)
+            logger.debug(f"Cache invalidado: {len(project_ids)} projetos e usuário {user_id} ({count} gerações)")
+        except Exception as e:
+            logger.error(f"Erro ao invalidar cache dos projetos: {e}")
+
 async def _invalidate_scene_cache(scene_id: int, project_id: int, user_id: int):
     """Invalidar cache específico de uma cena"""
     if CACHE_AVAILABLE and scenes_cache:
         try:
-            scene_count = scenes_cache.invalidate_scene_cache(scene_id)
-            project_count = scenes_cache.invalidate_project_cache(project_id)
-            
-            logger.debug(f"Cache invalidado: {scene_count} cena, {project_count} projeto")
+            count = scenes_cache.invalidate(scene_ids=[scene_id], project_ids=[project_id])
+            logger.debug(f"Cache invalidado: cena {scene_id}, projeto {project_id} ({count} gerações)")
         except Exception as e:
             logger.error(f"Erro ao invalidar cache de cena: {e}")
 
+async def _invalidate_ordering_cache(scene_id: int, project_id: int):
+    """Invalidar cache após reordenação: ordenação do projeto e a cena movida"""
+    if CACHE_AVAILABLE and scenes_cache:
+        try:
+            scenes_cache.invalidate(scene_ids=[scene_id], ordering_project_ids=[project_id])
+        except Exception as e:
+            logger.error(f"Erro ao invalidar cache de ordenação: {e}")
+
 async def _invalidate_complete_cache(scene_id: int, project_id: int, user_id: int):
     """Invalidar completamente cache relacionado"""
     if CACHE_AVAILABLE and scenes_cache:
         try:
-            scene_count = scenes_cache.invalidate_scene_cache(scene_id)
-            project_count = scenes_cache.invalidate_project_cache(project_id)
-            user_count = scenes_cache.invalidate_user_cache(user_id)
-            
-            total_invalidated = scene_count + project_count + user_count
-            logger.info(f"Cache completamente invalidado: {total_invalidated} chaves")
+            count = scenes_cache.invalidate(
+                user_ids=[user_id], project_ids=[project_id], scene_ids=[scene_id]
+            )
+            logger.info(f"Cache completamente invalidado: {count} gerações")
         except Exception as e:
             logger.error(f"Erro ao invalidar cache completo: {e}")
 
@@ -2083,20 +2183,29 @@ async def generate_project_video(
                 )
         
         else:
-            # Para projetos grandes, processar em background
-            background_tasks.add_task(
-                _generate_video_background,
-                project_id=project_id,
-                user_id=current_user.id,
-                quality=quality,
-                include_avatar=include_avatar,
-                include_narration=include_narration
+            # Para projetos grandes, enfileirar para os workers de render; a chave
+            # de idempotência evita renders duplicados do mesmo estado do projeto
+            project_version = project.updated_at or project.created_at
+            job = await get_job_queue().enqueue(
+                "video.generate_project",
+                {
+                    "project_id": project_id,
+                    "user_id": current_user.id,
+                    "quality": quality,
+                    "include_avatar": include_avatar,
+                    "include_narration": include_narration
+                },
+                idempotency_key=(
+                    f"scenes.video:{project_id}:{quality}:{int(include_avatar)}:{int(include_narration)}:"
+                    f"{project_version.isoformat() if project_version else ''}"
+                )
             )
             
             return {
                 "status": "processing",
                 "message": f"Geração de vídeo iniciada para projeto '{project.name}' ({scenes_count} cenas)",
                 "project_id": project_id,
+                "job_id": job.id,
                 "scenes_count": scenes_count,
                 "quality": quality,
                 "estimated_time": f"{scenes_count * 30} segundos",
@@ -2105,7 +2214,7 @@ async def generate_project_video(
                     "include_narration": include_narration,
                     "export_format": export_format
                 },
-                "status_endpoint": f"/api/scenes/video-status/{project_id}",
+                "status_endpoint": f"/api/scenes/video-status/{project_id}?job_id={job.id}",
                 "message_detail": "Use o endpoint de status para acompanhar o progresso"
             }
         
@@ -2180,6 +2289,7 @@ async def download_video(
 @router.get("/video-status/{project_id}")
 async def get_video_generation_status(
     project_id: int,
+    job_id: Optional[str] = None,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -2192,10 +2302,8 @@ async def get_video_generation_status(
     - Informações de erro se houver
     - Metadados do vídeo quando concluído
     
-    TODO: Implementar sistema de status persistente
-    - Redis para status em tempo real
-    - WebSocket para updates automáticos
-    - Queue system para gerenciar jobs
+    Com `job_id` (devolvido por generate-video em projetos grandes), o estado
+    vem da fila de jobs; sem ele, apenas o vídeo gerado mais recente é buscado.
     """
     try:
         # Verificar permissões
@@ -2210,8 +2318,26 @@ async def get_video_generation_status(
                 detail="Projeto não encontrado"
             )
         
-        # TODO: Implementar sistema de status real
-        # Por enquanto, buscar vídeos gerados na pasta
+        # Job na fila: status, progresso e erro enquanto não terminar com sucesso
+        if job_id:
+            job = await get_job_queue().get(job_id)
+            if not job or job.payload.get("project_id") != project_id:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Job de geração não encontrado"
+                )
+            if job.status != "succeeded":
+                return {
+                    "status": {"running": "processing"}.get(job.status, job.status),
+                    "project_id": project_id,
+                    "job_id": job.id,
+                    "progress": job.progress,
+                    "current_stage": job.stage,
+                    "attempts": job.attempts,
+                    "error": job.error
+                }
+        
+        # Buscar vídeos gerados na pasta
         
         video_dir = Path("app/static/videos/generated")
         project_videos = list(video_dir.glob(f"project_{project_id}_*.mp4"))
@@ -2246,49 +2372,3 @@ async def get_video_generation_status(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Erro interno ao verificar status"
         )
-
-# ============================================================================
-# FUNÇÕES AUXILIARES PARA GERAÇÃO DE VÍDEO
-# ============================================================================
-
-async def _generate_video_background(
-    project_id: int,
-    user_id: int,
-    quality: str,
-    include_avatar: bool,
-    include_narration: bool
-):
-    """
-    Gerar vídeo em background para projetos grandes
-    
-    Args:
-        project_id: ID do projeto
-        user_id: ID do usuário
-        quality: Qualidade do vídeo
-        include_avatar: Incluir avatar
-        include_narration: Incluir narração
-    """
-    try:
-        logger.info(f"🎬 Iniciando geração de vídeo em background: projeto {project_id}")
-        
-        # Gerar vídeo
-        video_result = await video_generation_service.generate_project_video(
-            project_id=project_id,
-            user_id=user_id,
-            quality=quality,
-            include_avatar=include_avatar,
-            include_narration=include_narration
-        )
-        
-        if video_result["success"]:
-            logger.info(f"✅ Vídeo gerado em background: {video_result['filename']}")
-            
-            # TODO: Notificar usuário (email, websocket, push)
-            
-        else:
-            logger.error(f"❌ Erro na geração em background: {video_result['error']}")
-            
-            # TODO: Notificar usuário sobre o erro
-        
-    except Exception as e:
-        logger.error(f"❌ Erro na geração de vídeo em background: {e}") 
\ No newline at end of file
@@ -15,14 +15,16 @@ Autor: TecnoCursos AI System
 Data: 17/01/2025
 """
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 from pydantic import BaseModel
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import psutil
+import asyncio
 import logging
 import os
+import time
 
 # Importar serviços
 try:
@@ -47,12 +49,17 @@ except ImportError:
     ANALYTICS_AVAILABLE = False
 
 try:
-    from app.auth import get_current_user
+    from app.auth import get_current_user, get_current_admin_user
     from app.models import User
     AUTH_AVAILABLE = True
 except ImportError:
     AUTH_AVAILABLE = False
 
+if not AUTH_AVAILABLE:
+    async def get_current_admin_user():
+        """Sem autenticação configurada, endpoints administrativos ficam fechados"""
+        raise HTTPException(status_code=503, detail="Autenticação indisponível")
+
 logger = logging.getLogger(__name__)
 
 # Configurar router
@@ -491,6 +498,176 @@ async def get_performance_diagnostics():
         logger.error(f"Erro no diagnóstico de performance: {e}")
         raise HTTPException(status_code=500, detail=f"Erro no diagnóstico: {str(e)}")
 
+_import_report_cache: Dict[str, Any] = {}
+_import_report_lock = asyncio.Lock()
+
+@router.get("/diagnostics/startup")
+async def get_startup_diagnostics(request: Request, import_report: bool = False, refresh: bool = False,
+                                  top: int = Query(25, ge=1, le=200), admin=Depends(get_current_admin_user)):
+    """
+    Diagnóstico do startup: estado dos routers montados sob demanda e,
+    com import_report=true, o relatório de -X importtime de app.main
+    (somente administradores).
+
+    O relatório roda em subprocesso que importa a aplicação inteira: é
+    gerado uma vez e servido do cache; refresh=true gera outro. Uma
+    execução por vez (409 se já houver uma em andamento).
+    """
+    registry = getattr(request.app.state, "router_registry", None)
+    result: Dict[str, Any] = {
+        "uptime_seconds": round(time.time() - getattr(request.app.state, "start_time", time.time()), 1),
+        "routers": registry.get_status() if registry else None,
+        "timestamp": datetime.now().isoformat(),
+    }
+    if import_report and (refresh or not _import_report_cache):
+        if _import_report_lock.locked():
+            raise HTTPException(status_code=409, detail="Relatório de imports já em andamento")
+        async with _import_report_lock:
+            try:
+                from app.core.import_profile import profile_imports
+                report = await asyncio.to_thread(profile_imports, "app.main", top)
+                _import_report_cache.clear()
+                _import_report_cache.update(report)
+                _import_report_cache["generated_at"] = datetime.now().isoformat()
+            except Exception as e:
+                logger.error(f"Erro no relatório de imports: {e}")
+                raise HTTPException(status_code=500, detail=f"Erro no relatório de imports: {str(e)}")
+            logger.info(f"📦 Relatório de imports gerado por {getattr(admin, 'email', 'admin')}")
+    if _import_report_cache:
+        result["imports"] = _import_report_cache
+    return result
+
+@router.get("/diagnostics/scheduler")
+async def scheduler_stats():
+    """
+    Jobs periódicos do agendador compartilhado: intervalo, próxima execução,
+    execuções, falhas, ticks coalescidos e tempo de execução (p50/p95/máx).
+    """
+    from app.core.scheduler import get_scheduler
+    return get_scheduler().get_stats()
+
+@router.get("/diagnostics/jobs")
+async def job_queue_stats():
+    """
+    Fila de jobs durável: contagem por fila e status (queued, running,
+    succeeded, failed, cancelled) e o worker embutido neste processo.
+    """
+    from app.core.job_queue import get_embedded_worker, get_job_queue
+    worker = get_embedded_worker()
+    return {
+        "queues": await get_job_queue().stats(),
+        "embedded_worker": worker.get_stats() if worker else None,
+    }
+
+@router.get("/diagnostics/database")
+async def database_pool_stats():
+    """
+    Pools de conexões do banco: classe do pool, conexões em uso/livres e
+    overflow do engine síncrono e do assíncrono (AsyncSession).
+    """
+    from app.database import get_pool_status
+    return get_pool_status()
+
+@router.get("/diagnostics/traces")
+async def list_traces(limit: int = 50, min_duration_ms: float = 0.0, name: Optional[str] = None,
+                      admin=Depends(get_current_admin_user)):
+    """
+    Traces de requisições guardados pela amostragem de cauda (lentos, com
+    erro ou amostrados), mais recentes primeiro, com o tempo por categoria
+    (db, cache, tts, video...). Somente administradores: expõe rotas e SQL.
+    """
+    from app.core.tracing import get_trace_store
+    store = get_trace_store()
+    return {
+        "stats": store.get_stats(),
+        "traces": store.list(limit=limit, min_duration_ms=min_duration_ms, name=name),
+    }
+
+@router.get("/diagnostics/traces/export")
+async def export_traces(format: str = "chrome", trace_id: Optional[List[str]] = Query(None), limit: int = 20,
+                        admin=Depends(get_current_admin_user)):
+    """
+    Exporta traces guardados como JSON do Chrome trace (chrome://tracing,
+    ui.perfetto.dev) ou do speedscope (format=speedscope). Somente administradores.
+    """
+    from app.core.tracing import get_trace_store, to_chrome_trace, to_speedscope
+    exporters = {"chrome": to_chrome_trace, "speedscope": to_speedscope}
+    if format not in exporters:
+        raise HTTPException(status_code=400, detail="format deve ser 'chrome' ou 'speedscope'")
+    traces = get_trace_store().select(trace_id, limit=limit)
+    if trace_id and not traces:
+        raise HTTPException(status_code=404, detail="Trace não encontrado")
+    return JSONResponse(
+        exporters[format](traces),
+        headers={"Content-Disposition": f'attachment; filename="traces.{format}.json"'},
+    )
+
+@router.get("/diagnostics/traces/{trace_id}")
+async def get_trace(trace_id: str, admin=Depends(get_current_admin_user)):
+    """Trace completo, com todos os spans (somente administradores)"""
+    from app.core.tracing import get_trace_store
+    trace = get_trace_store().get(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail="Trace não encontrado")
+    return trace.to_dict()
+
+# ============================================================================
+# PROFILING SOB DEMANDA
+# ============================================================================
+
+@router.post("/profiling/sample")
+async def sample_profile(
+    seconds: float = Query(10.0, gt=0, le=60),
+    mode: str = Query("wall", pattern="^(wall|cpu)$"),
+    format: str = Query("json", pattern="^(json|collapsed|speedscope)$"),
+    interval_ms: float = Query(10.0, ge=1, le=1000),
+    tracemalloc: bool = False,
+    top: int = Query(20, ge=1, le=200),
+    admin=Depends(get_current_admin_user),
+):
+    """
+    Amostra as pilhas de todas as threads deste worker por `seconds`
+    segundos, sem reiniciar o processo (somente administradores).
+
+    - mode=wall conta toda amostra (inclui espera); mode=cpu pesa pelo tempo
+      de CPU de cada thread
+    - format=collapsed devolve pilhas colapsadas (flamegraph.pl, speedscope);
+      format=speedscope um perfil "sampled"; json as funções mais caras
+    - tracemalloc=true inclui o diff de alocações (top N linhas) da sessão
+
+    A amostragem roda em outra thread, então o event loop também é medido.
+    Uma sessão por vez (409 se ocupado).
+    """
+    from app.core.sampling_profiler import ProfilerBusyError, profile
+    try:
+        result = await asyncio.to_thread(
+            profile, seconds, interval_ms / 1000, mode, tracemalloc, top,
+        )
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    logger.info(f"🔬 Profiling solicitado por {getattr(admin, 'email', 'admin')}: {result.samples} amostras")
+    headers = {"X-Profile-Overhead-Percent": str(result.overhead_percent)}
+    if format == "collapsed":
+        return PlainTextResponse(result.collapsed(), headers=headers)
+    if format == "speedscope":
+        headers["Content-Disposition"] = 'attachment; filename="profile.speedscope.json"'
+        return JSONResponse(result.speedscope(f"worker {os.getpid()}"), headers=headers)
+    return JSONResponse(result.summary(top), headers=headers)
+
+@router.get("/profiling/status")
+async def profiling_status(admin=Depends(get_current_admin_user)):
+    """Se há sessão em andamento e o resumo da última"""
+    from app.core.sampling_profiler import is_running, last_result
+    last = last_result()
+    return {
+        "running": is_running(),
+        "pid": os.getpid(),
+        "last": last.summary(10) if last else None,
+    }
+
 # ============================================================================
 # ENDPOINT DE EMERGÊNCIA
 # ============================================================================
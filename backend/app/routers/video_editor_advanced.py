@@ -25,6 +25,7 @@ from app.services.audio_sync_service import audio_sync_service, AudioTrack, Sync
 from app.services.text_editor_service import text_editor_service, TextElement
 from app.services.autosave_service import autosave_service
 from app.services.collaboration_service import collaboration_service, Permission
+from app.services.presence_channel import negotiate_presence_format
 
 # Configurar logger
 logger = logging.getLogger(__name__)
@@ -1256,6 +1257,12 @@ async def collaboration_websocket(websocket: WebSocket, project_id: int):
         user_email = "demo@tecnocursos.ai"
         permission = Permission.EDITOR
         
+        # Presença em JSON, a menos que o cliente peça quadros binários
+        binary_presence, subprotocol = negotiate_presence_format(
+            websocket.query_params.get("presence"),
+            websocket.scope.get("subprotocols")
+        )
+        
         # Tentar conectar
         success = await collaboration_service.join_project(
             project_id=project_id,
@@ -1263,7 +1270,9 @@ async def collaboration_websocket(websocket: WebSocket, project_id: int):
             user_name=user_name,
             user_email=user_email,
             websocket=websocket,
-            permission=permission
+            permission=permission,
+            binary_presence=binary_presence,
+            subprotocol=subprotocol
         )
         
         if not success:
@@ -35,6 +35,7 @@ from app.database import get_db
 from app.auth import get_current_user
 from app.models import User, Project, Scene, Asset
 from app.services.video_pipeline_service import export_project_video_with_ia
+from app.core.job_queue import get_job_queue
 import smtplib
 from email.mime.text import MIMEText
 
@@ -527,13 +528,15 @@ async def export_video(
         db.commit()
         db.refresh(video)
 
-        # Processar vídeo em background
-        background_tasks.add_task(
-            process_video_export,
-            video_id,
-            request,
-            tts_config,
-            current_user.id if current_user else None
+        # Enfileirar para os workers de exportação (app.jobs.export_video)
+        await get_job_queue().enqueue(
+            "video.export",
+            {
+                "video_id": video_id,
+                "request": request.model_dump(mode="json"),
+                "user_id": current_user.id if current_user else None
+            },
+            idempotency_key=f"video.export:{video_id}"
         )
 
         return VideoExportResponse(
@@ -668,14 +671,22 @@ async def get_video_export_status(
 ):
     """Verifica o status de exportação de um vídeo"""
     try:
-        # Verificar se job existe
-        if video_id not in video_jobs:
-            raise HTTPException(
-                status_code=404,
-                detail="Vídeo não encontrado"
-            )
-
-        job = video_jobs[video_id]
+        # Progresso local quando o job roda neste processo; senão, estado da fila
+        job = video_jobs.get(video_id)
+        if job is None:
+            queued = await get_job_queue().get_by_key(f"video.export:{video_id}")
+            if queued is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail="Vídeo não encontrado"
+                )
+            job = {
+                "status": {"running": "processing", "succeeded": "completed"}.get(queued.status, queued.status),
+                "progress": queued.progress,
+                "current_stage": queued.stage or queued.status,
+                "error_message": queued.error,
+                "duration": (queued.result or {}).get("duration")
+            }
 
         # Verificar se vídeo está pronto
         video_path = f"app/static/videos/{video_id}.mp4"
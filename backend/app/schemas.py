@@ -926,12 +926,14 @@ class PaginationMeta(BaseModel):
     """Metadados de paginação"""
     page: int = Field(..., ge=1, description="Página atual")
     size: int = Field(..., ge=1, le=100, description="Itens por página")
-    total: int = Field(..., ge=0, description="Total de itens")
-    pages: int = Field(..., ge=0, description="Total de páginas")
+    total: Optional[int] = Field(..., ge=0, description="Total de itens (None na paginação por cursor)")
+    pages: Optional[int] = Field(..., ge=0, description="Total de páginas (None na paginação por cursor)")
     has_next: bool = Field(..., description="Tem próxima página")
     has_prev: bool = Field(..., description="Tem página anterior")
     next_page: Optional[int] = Field(None, description="Número da próxima página")
     prev_page: Optional[int] = Field(None, description="Número da página anterior")
+    next_cursor: Optional[str] = Field(None, description="Cursor da próxima página (paginação keyset)")
+    total_is_estimate: bool = Field(False, description="Total aproximado (modo de contagem estimated)")
 
 class PaginatedSceneResponse(BaseModel):
     """Resposta paginada para cenas"""
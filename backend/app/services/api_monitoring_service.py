@@ -10,12 +10,15 @@ Sistema completo de monitoramento e observabilidade:
 - Dashboards e relatórios
 - Rastreamento de uso por usuário/endpoint
 - Detecção de anomalias
+- Percentis por sketches de quantis (DDSketch) em janelas de tempo,
+  com exportação no formato do Prometheus
 """
 
 import asyncio
+import re
 import time
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from collections import defaultdict, deque
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
@@ -24,6 +27,13 @@ import statistics
 import logging
 
 from app.logger import get_logger
+from app.services.quantile_sketch import DDSketch, WindowedSketch
+
+try:
+    from prometheus_client.core import Metric
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
 
 logger = get_logger("api_monitoring")
 
@@ -34,13 +44,6 @@ class AlertLevel(Enum):
     CRITICAL = "critical"
     EMERGENCY = "emergency"
 
-@dataclass
-class MetricPoint:
-    """Ponto de métrica"""
-    timestamp: datetime
-    value: float
-    labels: Dict[str, str] = None
-
 @dataclass
 class APICall:
     """Chamada de API registrada"""
@@ -69,19 +72,50 @@ class Alert:
     is_resolved: bool = False
     resolved_at: Optional[datetime] = None
 
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# Série que recebe os registros quando o limite de séries é atingido
+OVERFLOW_LABELS: LabelKey = (("series", "__overflow__"),)
+
+
+class MetricSeries:
+    """Série de uma métrica (nome + labels): sketch por janela e totais cumulativos"""
+
+    __slots__ = ("name", "labels", "sketch", "count", "sum")
+
+    def __init__(self, name: str, labels: LabelKey, relative_accuracy: float):
+        self.name = name
+        self.labels = labels
+        self.sketch = WindowedSketch(relative_accuracy)
+        self.count = 0
+        self.sum = 0.0
+
+    def add(self, value: float, timestamp: float):
+        self.sketch.add(value, timestamp)
+        self.count += 1
+        self.sum += value
+
+    @property
+    def label_dict(self) -> Dict[str, str]:
+        return dict(self.labels)
+
+
 class MetricsCollector:
-    """Coletor de métricas"""
-    
-    def __init__(self, max_points: int = 10000):
-        self.metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_points))
-        self.api_calls: deque = deque(maxlen=max_points)
+    """
+    Coletor de métricas
+
+    Cada série (nome + labels, ex.: response_time por endpoint/método/status)
+    guarda DDSketches por intervalo de tempo em vez dos pontos: registrar é
+    O(1), a memória é constante por série e p50/p95/p99 de qualquer janela
+    saem da mescla dos intervalos que ela cobre (erro relativo de 1%).
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_series: int = 2000, max_recent_errors: int = 200):
+        self.series: Dict[Tuple[str, LabelKey], MetricSeries] = {}
+        self.recent_errors: deque = deque(maxlen=max_recent_errors)
         self.alerts: List[Alert] = []
-        self.max_points = max_points
-        
-        # Contadores
-        self.request_count = defaultdict(int)
-        self.error_count = defaultdict(int)
-        self.status_code_count = defaultdict(int)
+        self.relative_accuracy = relative_accuracy
+        self.max_series = max_series
         
         # Configurações de alerta
         self.alert_thresholds = {
@@ -94,66 +128,197 @@ class MetricsCollector:
         
         logger.info("✅ Metrics Collector inicializado")
 
+    def _series_for(self, name: str, labels: LabelKey) -> MetricSeries:
+        key = (name, labels)
+        series = self.series.get(key)
+        if series is None:
+            if len(self.series) >= self.max_series:
+                # Cardinalidade limitada: labels novos caem em uma série única
+                key = (name, OVERFLOW_LABELS)
+                series = self.series.get(key)
+                if series is not None:
+                    return series
+                labels = OVERFLOW_LABELS
+            series = MetricSeries(name, labels, self.relative_accuracy)
+            self.series[key] = series
+        return series
+
+    def record_request(self, endpoint: str, method: str, status_code: int,
+                       response_time_ms: float, timestamp: Optional[float] = None):
+        """Registrar uma requisição (O(1), sem alocar pontos)"""
+        labels = (("endpoint", endpoint), ("method", method), ("status", str(status_code)))
+        self._series_for("response_time", labels).add(
+            response_time_ms, time.time() if timestamp is None else timestamp
+        )
+
+    def _count_requests(self, key) -> Dict[Any, int]:
+        counts: Dict[Any, int] = defaultdict(int)
+        for series in self.iter_series("response_time"):
+            counts[key(series.label_dict)] += series.count
+        return counts
+
+    # Contadores cumulativos derivados das séries (mesmo limite de cardinalidade)
+    @property
+    def request_count(self) -> Dict[str, int]:
+        return self._count_requests(lambda labels: labels.get("endpoint", "__overflow__"))
+
+    @property
+    def error_count(self) -> Dict[str, int]:
+        counts: Dict[str, int] = defaultdict(int)
+        for series in self.iter_series("response_time"):
+            labels = series.label_dict
+            if int(labels.get("status", 0)) >= 400:
+                counts[labels.get("endpoint", "__overflow__")] += series.count
+        return counts
+
+    @property
+    def status_code_count(self) -> Dict[int, int]:
+        return self._count_requests(lambda labels: int(labels.get("status", 0)))
+
     def record_api_call(self, api_call: APICall):
         """Registrar chamada de API"""
-        self.api_calls.append(api_call)
-        
-        # Atualizar contadores
-        self.request_count[api_call.endpoint] += 1
-        self.status_code_count[api_call.status_code] += 1
-        
-        if api_call.status_code >= 400:
-            self.error_count[api_call.endpoint] += 1
-        
-        # Registrar métricas derivadas
-        self.record_metric("response_time", api_call.response_time_ms, {
-            "endpoint": api_call.endpoint,
-            "method": api_call.method,
-            "status": str(api_call.status_code)
-        })
-        
-        self.record_metric("request_count", 1, {
-            "endpoint": api_call.endpoint,
-            "method": api_call.method
-        })
+        self.record_request(
+            api_call.endpoint,
+            api_call.method,
+            api_call.status_code,
+            api_call.response_time_ms,
+            api_call.timestamp.replace(tzinfo=timezone.utc).timestamp()
+        )
+        if api_call.status_code >= 400 or api_call.error:
+            self.recent_errors.append(api_call)
 
-    def record_metric(self, name: str, value: float, labels: Dict[str, str] = None):
+    def record_metric(self, name: str, value: float, labels: Dict[str, str] = None,
+                      timestamp: Optional[float] = None):
         """Registrar métrica"""
-        metric_point = MetricPoint(
-            timestamp=datetime.utcnow(),
-            value=value,
-            labels=labels or {}
-        )
-        
-        self.metrics[name].append(metric_point)
+        label_key = tuple(sorted((labels or {}).items()))
+        self._series_for(name, label_key).add(value, time.time() if timestamp is None else timestamp)
+
+    def iter_series(self, metric_name: str, **label_filters: str) -> List[MetricSeries]:
+        """Séries de uma métrica cujos labels batem com os filtros"""
+        return [
+            series for (name, _), series in list(self.series.items())
+            if name == metric_name and all(
+                series.label_dict.get(label) == value for label, value in label_filters.items()
+            )
+        ]
 
-    def get_metric_summary(self, metric_name: str, time_window: timedelta = None) -> Dict[str, float]:
+    def merged_sketch(self, metric_name: str, time_window: timedelta = None, **label_filters: str) -> DDSketch:
+        """Sketch com todos os valores da métrica na janela"""
+        window = time_window.total_seconds() if time_window else None
+        now = time.time()
+        result = DDSketch(self.relative_accuracy)
+        for series in self.iter_series(metric_name, **label_filters):
+            for _, sketch in series.sketch.intervals(window, now):
+                result.merge(sketch)
+        return result
+
+    def get_metric_summary(self, metric_name: str, time_window: timedelta = None,
+                           **label_filters: str) -> Dict[str, float]:
         """Obter resumo de métrica"""
-        if metric_name not in self.metrics:
-            return {}
-        
-        points = self.metrics[metric_name]
-        
-        # Filtrar por janela de tempo se especificada
-        if time_window:
-            cutoff_time = datetime.utcnow() - time_window
-            points = [p for p in points if p.timestamp >= cutoff_time]
-        
-        if not points:
-            return {}
-        
-        values = [p.value for p in points]
-        
+        return self.merged_sketch(metric_name, time_window, **label_filters).summary()
+
+    def get_interval_summaries(self, metric_name: str, time_window: timedelta = None) -> List[Tuple[datetime, DDSketch]]:
+        """Sketch mesclado de cada intervalo da janela, em ordem cronológica"""
+        window = time_window.total_seconds() if time_window else None
+        now = time.time()
+        by_start: Dict[int, DDSketch] = {}
+        for series in self.iter_series(metric_name):
+            for start, sketch in series.sketch.intervals(window, now):
+                by_start.setdefault(start, DDSketch(self.relative_accuracy)).merge(sketch)
+        return [(datetime.utcfromtimestamp(start), by_start[start]) for start in sorted(by_start)]
+
+    def get_request_stats(self, time_window: timedelta = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Estatísticas por endpoint na janela: requisições, erros, status codes
+        e o sketch de tempos de resposta
+        """
+        window = time_window.total_seconds() if time_window else None
+        now = time.time()
+        stats: Dict[str, Dict[str, Any]] = {}
+        for series in self.iter_series("response_time"):
+            labels = series.label_dict
+            merged = series.sketch.merged(window, now)
+            if not merged.count:
+                continue
+            endpoint = labels.get("endpoint", "__overflow__")
+            entry = stats.get(endpoint)
+            if entry is None:
+                entry = stats[endpoint] = {
+                    "requests": 0, "errors": 0, "server_errors": 0,
+                    "status_codes": defaultdict(int), "sketch": DDSketch(self.relative_accuracy)
+                }
+            status = int(labels.get("status", 0))
+            entry["requests"] += merged.count
+            entry["status_codes"][status] += merged.count
+            if status >= 400:
+                entry["errors"] += merged.count
+            if status >= 500:
+                entry["server_errors"] += merged.count
+            entry["sketch"].merge(merged)
+        return stats
+
+    def export_prometheus(self, prefix: str = "tecnocursos_api", quantile_window: timedelta = timedelta(minutes=10),
+                          quantiles: Tuple[float, ...] = (0.5, 0.95, 0.99)) -> str:
+        """
+        Séries no formato texto do Prometheus, como `summary`: quantis da
+        janela recente e _sum/_count cumulativos
+        """
+        window = quantile_window.total_seconds()
+        now = time.time()
+        by_name: Dict[str, List[MetricSeries]] = defaultdict(list)
+        for (name, _), series in list(self.series.items()):
+            by_name[name].append(series)
+
+        lines = []
+        for name in sorted(by_name):
+            metric = _prometheus_name(f"{prefix}_{name}{METRIC_UNITS.get(name, '')}")
+            lines.append(f"# HELP {metric} {name} (sketch de quantis, janela de {window:.0f}s)")
+            lines.append(f"# TYPE {metric} summary")
+            for series in by_name[name]:
+                values = series.sketch.merged(window, now).quantiles(quantiles)
+                for q, value in zip(quantiles, values):
+                    labels = _prometheus_labels(series.labels + (("quantile", str(q)),))
+                    lines.append(f"{metric}{labels} {_prometheus_value(value)}")
+                labels = _prometheus_labels(series.labels)
+                lines.append(f"{metric}_sum{labels} {_prometheus_value(series.sum)}")
+                lines.append(f"{metric}_count{labels} {series.count}")
+        return "\n".join(lines) + "\n"
+
+    def memory_stats(self) -> Dict[str, int]:
+        """Séries e buckets de sketch em memória"""
         return {
-            "count": len(values),
-            "min": min(values),
-            "max": max(values),
-            "mean": statistics.mean(values),
-            "median": statistics.median(values),
-            "p95": statistics.quantiles(values, n=20)[18] if len(values) >= 20 else max(values),
-            "p99": statistics.quantiles(values, n=100)[98] if len(values) >= 100 else max(values)
+            "series": len(self.series),
+            "sketch_buckets": sum(series.sketch.memory_buckets() for series in list(self.series.values())),
+            "recent_errors": len(self.recent_errors),
         }
 
+
+# Sufixo de unidade no nome exportado
+METRIC_UNITS = {"response_time": "_ms"}
+
+_PROMETHEUS_NAME_RE = re.compile(r"[^a-zA-Z0-9_:]")
+
+
+def _prometheus_name(name: str) -> str:
+    return _PROMETHEUS_NAME_RE.sub("_", name)
+
+
+def _prometheus_labels(labels: LabelKey) -> str:
+    if not labels:
+        return ""
+    pairs = []
+    for key, value in labels:
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{_prometheus_name(key)}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _prometheus_value(value: Optional[float]) -> str:
+    if value is None:
+        return "NaN"
+    return repr(float(value))
+
+
 class PerformanceAnalyzer:
     """Analisador de performance"""
     
@@ -186,28 +351,19 @@ class PerformanceAnalyzer:
     
     def analyze_error_rates(self, time_window: timedelta = timedelta(minutes=15)) -> Dict[str, Any]:
         """Analisar taxas de erro"""
-        cutoff_time = datetime.utcnow() - time_window
-        
-        recent_calls = [call for call in self.collector.api_calls if call.timestamp >= cutoff_time]
+        endpoint_stats = self.collector.get_request_stats(time_window)
         
-        if not recent_calls:
+        if not endpoint_stats:
             return {"status": "no_data"}
         
-        total_calls = len(recent_calls)
-        error_calls = sum(1 for call in recent_calls if call.status_code >= 400)
+        total_calls = sum(stats["requests"] for stats in endpoint_stats.values())
+        error_calls = sum(stats["errors"] for stats in endpoint_stats.values())
         error_rate = (error_calls / total_calls) * 100
         
         # Analisar por endpoint
-        endpoint_stats = defaultdict(lambda: {"total": 0, "errors": 0})
-        
-        for call in recent_calls:
-            endpoint_stats[call.endpoint]["total"] += 1
-            if call.status_code >= 400:
-                endpoint_stats[call.endpoint]["errors"] += 1
-        
         endpoint_error_rates = {}
         for endpoint, stats in endpoint_stats.items():
-            endpoint_error_rates[endpoint] = (stats["errors"] / stats["total"]) * 100
+            endpoint_error_rates[endpoint] = (stats["errors"] / stats["requests"]) * 100
         
         return {
             "overall_error_rate": error_rate,
@@ -217,32 +373,37 @@ class PerformanceAnalyzer:
             "status": "healthy" if error_rate < 1 else "degraded" if error_rate < 5 else "unhealthy"
         }
     
-    def detect_anomalies(self, metric_name: str) -> List[Dict[str, Any]]:
-        """Detectar anomalias em métricas"""
-        if metric_name not in self.collector.metrics:
-            return []
-        
-        points = list(self.collector.metrics[metric_name])
-        if len(points) < 30:  # Necessário histórico mínimo
+    def detect_anomalies(self, metric_name: str, time_window: timedelta = timedelta(hours=1),
+                         recent_intervals: int = 5) -> List[Dict[str, Any]]:
+        """
+        Detectar anomalias em métricas
+
+        Compara a média de cada um dos últimos intervalos (1 min) com a média
+        e o desvio padrão dos intervalos anteriores da janela.
+        """
+        intervals = [
+            (start, sketch.mean) for start, sketch in
+            self.collector.get_interval_summaries(metric_name, time_window) if sketch.count
+        ]
+        if len(intervals) < recent_intervals + 10:  # Necessário histórico mínimo
             return []
         
-        # Usar últimos 30 pontos como baseline
-        baseline_values = [p.value for p in points[-30:]]
+        baseline_values = [mean for _, mean in intervals[:-recent_intervals]]
         mean_baseline = statistics.mean(baseline_values)
         std_baseline = statistics.stdev(baseline_values)
         
-        # Detectar pontos fora de 2 desvios padrão
+        # Detectar intervalos fora de 2 desvios padrão
         anomalies = []
         threshold = 2 * std_baseline
         
-        for point in points[-10:]:  # Verificar últimos 10 pontos
-            if abs(point.value - mean_baseline) > threshold:
+        for start, value in intervals[-recent_intervals:]:
+            if abs(value - mean_baseline) > threshold:
                 anomalies.append({
-                    "timestamp": point.timestamp.isoformat(),
-                    "value": point.value,
+                    "timestamp": start.isoformat(),
+                    "value": value,
                     "expected_range": [mean_baseline - threshold, mean_baseline + threshold],
-                    "deviation": abs(point.value - mean_baseline),
-                    "severity": "high" if abs(point.value - mean_baseline) > 3 * std_baseline else "medium"
+                    "deviation": abs(value - mean_baseline),
+                    "severity": "high" if abs(value - mean_baseline) > 3 * std_baseline else "medium"
                 })
         
         return anomalies
@@ -369,23 +530,24 @@ class SLAMonitor:
     
     def calculate_sla_metrics(self, time_window: timedelta = timedelta(days=1)) -> Dict[str, Any]:
         """Calcular métricas de SLA"""
-        cutoff_time = datetime.utcnow() - time_window
-        recent_calls = [call for call in self.collector.api_calls if call.timestamp >= cutoff_time]
+        endpoint_stats = self.collector.get_request_stats(time_window)
         
-        if not recent_calls:
+        if not endpoint_stats:
             return {"status": "no_data"}
         
         # Calcular disponibilidade
-        total_requests = len(recent_calls)
-        successful_requests = sum(1 for call in recent_calls if call.status_code < 500)
+        total_requests = sum(stats["requests"] for stats in endpoint_stats.values())
+        successful_requests = total_requests - sum(stats["server_errors"] for stats in endpoint_stats.values())
         availability = (successful_requests / total_requests) * 100
         
         # Calcular response time P95
-        response_times = [call.response_time_ms for call in recent_calls]
-        p95_response_time = statistics.quantiles(response_times, n=20)[18] if len(response_times) >= 20 else max(response_times)
+        response_times = DDSketch(self.collector.relative_accuracy)
+        for stats in endpoint_stats.values():
+            response_times.merge(stats["sketch"])
+        p95_response_time = response_times.quantile(0.95)
         
         # Calcular error rate
-        error_requests = sum(1 for call in recent_calls if call.status_code >= 400)
+        error_requests = sum(stats["errors"] for stats in endpoint_stats.values())
         error_rate = (error_requests / total_requests) * 100
         
         # Verificar compliance com SLA
@@ -480,20 +642,22 @@ class AdvancedAPIMonitoringService:
         response_size: Optional[int] = None
     ):
         """Registrar requisição"""
-        api_call = APICall(
-            timestamp=datetime.utcnow(),
-            endpoint=endpoint,
-            method=method,
-            status_code=status_code,
-            response_time_ms=response_time_ms,
-            user_id=user_id,
-            ip_address=ip_address,
-            error=error,
-            request_size=request_size,
-            response_size=response_size
-        )
-        
-        self.collector.record_api_call(api_call)
+        self.collector.record_request(endpoint, method, status_code, response_time_ms)
+        
+        # Só os erros guardam o registro completo (para diagnóstico)
+        if status_code >= 400 or error:
+            self.collector.recent_errors.append(APICall(
+                timestamp=datetime.utcnow(),
+                endpoint=endpoint,
+                method=method,
+                status_code=status_code,
+                response_time_ms=response_time_ms,
+                user_id=user_id,
+                ip_address=ip_address,
+                error=error,
+                request_size=request_size,
+                response_size=response_size
+            ))
     
     def get_dashboard_data(self) -> Dict[str, Any]:
         """Obter dados para dashboard"""
@@ -505,12 +669,9 @@ class AdvancedAPIMonitoringService:
         sla_metrics = self.sla_monitor.calculate_sla_metrics(timedelta(hours=24))
         
         # Top endpoints por volume
-        cutoff_time = datetime.utcnow() - time_window
-        recent_calls = [call for call in self.collector.api_calls if call.timestamp >= cutoff_time]
-        
-        endpoint_counts = defaultdict(int)
-        for call in recent_calls:
-            endpoint_counts[call.endpoint] += 1
+        endpoint_stats = self.collector.get_request_stats(time_window)
+        endpoint_counts = {endpoint: stats["requests"] for endpoint, stats in endpoint_stats.items()}
+        total_requests = sum(endpoint_counts.values())
         
         top_endpoints = sorted(endpoint_counts.items(), key=lambda x: x[1], reverse=True)[:10]
         
@@ -522,43 +683,30 @@ class AdvancedAPIMonitoringService:
             "sla_metrics": sla_metrics,
             "top_endpoints": top_endpoints,
             "active_alerts": len([a for a in self.alert_manager.active_alerts if not a.is_resolved]),
-            "total_requests_15min": len(recent_calls),
-            "requests_per_minute": len(recent_calls) / 15
+            "total_requests_15min": total_requests,
+            "requests_per_minute": total_requests / 15
         }
     
     def get_detailed_report(self, time_window: timedelta = timedelta(hours=24)) -> Dict[str, Any]:
         """Gerar relatório detalhado"""
         cutoff_time = datetime.utcnow() - time_window
-        calls_in_window = [call for call in self.collector.api_calls if call.timestamp >= cutoff_time]
-        
-        # Análise por endpoint
-        endpoint_analysis = defaultdict(lambda: {
-            "count": 0, "errors": 0, "response_times": [],
-            "status_codes": defaultdict(int)
-        })
-        
-        for call in calls_in_window:
-            analysis = endpoint_analysis[call.endpoint]
-            analysis["count"] += 1
-            analysis["response_times"].append(call.response_time_ms)
-            analysis["status_codes"][call.status_code] += 1
-            
-            if call.status_code >= 400:
-                analysis["errors"] += 1
+        endpoint_analysis = self.collector.get_request_stats(time_window)
+        total_requests = sum(analysis["requests"] for analysis in endpoint_analysis.values())
         
         # Calcular estatísticas por endpoint
         endpoint_stats = {}
         for endpoint, analysis in endpoint_analysis.items():
-            if analysis["response_times"]:
-                endpoint_stats[endpoint] = {
-                    "requests": analysis["count"],
-                    "error_rate": (analysis["errors"] / analysis["count"]) * 100,
-                    "avg_response_time": statistics.mean(analysis["response_times"]),
-                    "p95_response_time": statistics.quantiles(analysis["response_times"], n=20)[18] 
-                                       if len(analysis["response_times"]) >= 20 
-                                       else max(analysis["response_times"]),
-                    "status_codes": dict(analysis["status_codes"])
-                }
+            sketch = analysis["sketch"]
+            p50, p95, p99 = sketch.quantiles((0.5, 0.95, 0.99))
+            endpoint_stats[endpoint] = {
+                "requests": analysis["requests"],
+                "error_rate": (analysis["errors"] / analysis["requests"]) * 100,
+                "avg_response_time": sketch.mean,
+                "p50_response_time": p50,
+                "p95_response_time": p95,
+                "p99_response_time": p99,
+                "status_codes": dict(analysis["status_codes"])
+            }
         
         return {
             "report_period": {
@@ -567,27 +715,86 @@ class AdvancedAPIMonitoringService:
                 "duration_hours": time_window.total_seconds() / 3600
             },
             "summary": {
-                "total_requests": len(calls_in_window),
+                "total_requests": total_requests,
                 "unique_endpoints": len(endpoint_analysis),
-                "total_errors": sum(1 for call in calls_in_window if call.status_code >= 400),
-                "avg_requests_per_hour": len(calls_in_window) / (time_window.total_seconds() / 3600)
+                "total_errors": sum(analysis["errors"] for analysis in endpoint_analysis.values()),
+                "avg_requests_per_hour": total_requests / (time_window.total_seconds() / 3600)
             },
             "endpoint_analysis": endpoint_stats,
             "sla_compliance": self.sla_monitor.calculate_sla_metrics(time_window),
             "alerts_in_period": [
                 asdict(alert) for alert in self.alert_manager.alert_history
                 if alert.timestamp >= cutoff_time
+            ],
+            "recent_errors": [
+                asdict(call) for call in list(self.collector.recent_errors)[-20:]
+                if call.timestamp >= cutoff_time
             ]
         }
+    
+    def export_prometheus(self) -> str:
+        """Percentis por endpoint/método/status no formato texto do Prometheus"""
+        return self.collector.export_prometheus()
+    
+    def register_prometheus_collector(self, registry=None) -> bool:
+        """Expõe as séries no registry do prometheus_client (padrão: o global)"""
+        if not PROMETHEUS_AVAILABLE:
+            return False
+        if registry is None:
+            from prometheus_client import REGISTRY as registry
+        registry.register(SketchPrometheusCollector(self.collector))
+        return True
+
+
+class SketchPrometheusCollector:
+    """Collector customizado do prometheus_client: uma métrica `summary` por nome"""
+    
+    def __init__(self, collector: MetricsCollector, prefix: str = "tecnocursos_api",
+                 quantile_window: timedelta = timedelta(minutes=10),
+                 quantiles: Tuple[float, ...] = (0.5, 0.95, 0.99)):
+        self.collector = collector
+        self.prefix = prefix
+        self.quantile_window = quantile_window
+        self.quantiles = quantiles
+    
+    def collect(self):
+        window = self.quantile_window.total_seconds()
+        now = time.time()
+        by_name: Dict[str, List[MetricSeries]] = defaultdict(list)
+        for (name, _), series in list(self.collector.series.items()):
+            by_name[name].append(series)
+        
+        for name, series_list in sorted(by_name.items()):
+            metric_name = _prometheus_name(f"{self.prefix}_{name}{METRIC_UNITS.get(name, '')}")
+            metric = Metric(metric_name, f"{name} (sketch de quantis)", "summary")
+            for series in series_list:
+                labels = series.label_dict
+                values = series.sketch.merged(window, now).quantiles(self.quantiles)
+                for q, value in zip(self.quantiles, values):
+                    metric.add_sample(metric_name, dict(labels, quantile=str(q)),
+                                      float("nan") if value is None else value)
+                metric.add_sample(metric_name + "_sum", labels, series.sum)
+                metric.add_sample(metric_name + "_count", labels, series.count)
+            yield metric
 
 # Instância global do serviço
 monitoring_service = AdvancedAPIMonitoringService()
 
+UNMATCHED_ENDPOINT = "<unmatched>"
+
+
+def _endpoint_label(request) -> str:
+    """Template da rota (/api/scenes/{scene_id}) em vez do path concreto"""
+    route = request.scope.get("route")
+    path = getattr(route, "path", None)
+    return path if path else UNMATCHED_ENDPOINT
+
+
 # Função para integração com middleware
 def track_api_call(request, response, response_time_ms: float, error: Optional[str] = None):
     """Função helper para tracking de chamadas de API"""
     monitoring_service.record_request(
-        endpoint=request.url.path,
+        endpoint=_endpoint_label(request),
         method=request.method,
         status_code=response.status_code,
         response_time_ms=response_time_ms,
@@ -61,6 +61,8 @@ try:
     from sqlalchemy import func, and_, or_, desc
     from app.database import get_db_session
     from app.models import Asset, User, Project, AssetRating
+    from app.services.search_index_service import asset_search_condition, asset_tags_condition
+    from app.core.pagination import apply_keyset_pagination, build_keyset_page
     from app.schemas import (
         AssetCreate, AssetUpdate, AssetResponse,
         AssetRatingCreate, AssetRatingResponse
@@ -302,56 +304,17 @@ class AssetLibraryService:
             db = get_db_session()
         
         try:
-            query_obj = db.query(Asset).filter(Asset.is_library_asset == True)
-            
-            # Filtros de acesso
-            if user_id is not None:
-                # Mostrar assets públicos OU do usuário
-                query_obj = query_obj.filter(
-                    or_(
-                        Asset.is_public == True,
-                        Asset.created_by == user_id
-                    )
-                )
-            elif is_public is not None:
-                query_obj = query_obj.filter(Asset.is_public == is_public)
-            
-            # Filtros de conteúdo
-            if query:
-                search_term = f"%{query}%"
-                query_obj = query_obj.filter(
-                    or_(
-                        Asset.name.ilike(search_term),
-                        Asset.description.ilike(search_term),
-                        Asset.library_tags.ilike(search_term)
-                    )
-                )
-            
-            if asset_type:
-                query_obj = query_obj.filter(Asset.tipo == asset_type)
-            
-            if category:
-                query_obj = query_obj.filter(Asset.library_category == category)
-            
-            if is_premium is not None:
-                query_obj = query_obj.filter(Asset.is_premium == is_premium)
-            
-            if license_type:
-                query_obj = query_obj.filter(Asset.license_type == license_type)
-            
-            if min_rating is not None:
-                query_obj = query_obj.filter(Asset.rating_avg >= min_rating)
-            
-            if tags:
-                for tag in tags:
-                    query_obj = query_obj.filter(Asset.library_tags.ilike(f"%{tag}%"))
+            query_obj = self._build_search_query(
+                db, query, asset_type, category, is_public, is_premium,
+                license_type, tags, user_id, min_rating
+            )
             
             # Ordenação
             order_column = getattr(Asset, sort_by, Asset.created_at)
             if sort_order.lower() == "desc":
                 order_column = desc(order_column)
             
-            query_obj = query_obj.order_by(order_column)
+            query_obj = query_obj.order_by(order_column, Asset.id)
             
             # Paginação
             assets = query_obj.offset(skip).limit(limit).all()
@@ -361,6 +324,97 @@ class AssetLibraryService:
         finally:
             db.close()
     
+    def search_assets_page(self,
+                          cursor: Optional[str] = None,
+                          limit: int = 50,
+                          sort_by: str = "created_at",
+                          sort_order: str = "desc",
+                          db: Session = None,
+                          **filters) -> Dict[str, Any]:
+        """
+        Busca com paginação por cursor (keyset em coluna de ordenação + id).
+        
+        Aceita os mesmos filtros de `search_assets` e retorna
+        `{"items": [...], "next_cursor": str | None}`.
+        """
+        if not DATABASE_AVAILABLE:
+            return {"items": [], "next_cursor": None}
+        
+        if db is None:
+            db = get_db_session()
+        
+        try:
+            query_obj = self._build_search_query(
+                db,
+                filters.get("query"), filters.get("asset_type"), filters.get("category"),
+                filters.get("is_public"), filters.get("is_premium"), filters.get("license_type"),
+                filters.get("tags"), filters.get("user_id"), filters.get("min_rating")
+            )
+            
+            order_column = getattr(Asset, sort_by, Asset.created_at)
+            keyset_columns = [order_column, Asset.id] if order_column is not Asset.id else [Asset.id]
+            rows = apply_keyset_pagination(
+                query_obj, keyset_columns, cursor, limit,
+                descending=sort_order.lower() == "desc"
+            ).all()
+            assets, next_cursor = build_keyset_page(rows, [c.key for c in keyset_columns], limit)
+            
+            return {
+                "items": [AssetResponse.from_orm(asset) for asset in assets],
+                "next_cursor": next_cursor
+            }
+            
+        finally:
+            db.close()
+    
+    def _build_search_query(self, db: Session, query: Optional[str], asset_type: Optional[str],
+                            category: Optional[str], is_public: Optional[bool],
+                            is_premium: Optional[bool], license_type: Optional[str],
+                            tags: Optional[List[str]], user_id: Optional[int],
+                            min_rating: Optional[float]):
+        """Monta a query filtrada de busca de assets (sem ordenação/paginação)."""
+        query_obj = db.query(Asset).filter(Asset.is_library_asset == True)
+            
+        
+        # Filtros de acesso
+        if user_id is not None:
+            # Mostrar assets públicos OU do usuário
+            query_obj = query_obj.filter(
+                or_(
+                    Asset.is_public == True,
+                    Asset.created_by == user_id
+                )
+            )
+        elif is_public is not None:
+            query_obj = query_obj.filter(Asset.is_public == is_public)
+        
+        # Filtros de conteúdo (índice full-text quando disponível)
+        if query:
+            query_obj = query_obj.filter(asset_search_condition(db, query))
+        
+        if asset_type:
+            query_obj = query_obj.filter(Asset.tipo == asset_type)
+        
+        if category:
+            query_obj = query_obj.filter(Asset.library_category == category)
+        
+        if is_premium is not None:
+            query_obj = query_obj.filter(Asset.is_premium == is_premium)
+        
+        if license_type:
+            query_obj = query_obj.filter(Asset.license_type == license_type)
+        
+        if min_rating is not None:
+            query_obj = query_obj.filter(Asset.rating_avg >= min_rating)
+        
+        # Tags via tabela normalizada `asset_tags` (todas as tags exigidas)
+        if tags:
+            tags_condition = asset_tags_condition(tags)
+            if tags_condition is not None:
+                query_obj = query_obj.filter(tags_condition)
+        
+        return query_obj
+    
     def get_asset(self, asset_id: int, user_id: Optional[int] = None, db: Session = None) -> Optional[AssetResponse]:
         """Obter asset por ID."""
         if not DATABASE_AVAILABLE:
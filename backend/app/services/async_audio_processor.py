@@ -3,16 +3,16 @@ Serviço de Processamento Assíncrono de Áudios
 ============================================
 
 Sistema avançado para processamento assíncrono de arquivos grandes:
-- Fila de processamento com prioridades
-- Workers paralelos para processamento
+- Fila de processamento com prioridades (app.core.job_queue, fila "tts")
+- Workers paralelos, no processo da API ou dedicados (python -m app.worker)
 - Notificações de progresso em tempo real
 - Retry automático em caso de falhas
 - Monitoramento de recursos do sistema
 
 Funcionalidades:
 1. Processamento em background para arquivos grandes
-2. Sistema de filas com Redis ou memória
-3. Workers escaláveis
+2. Fila durável (SQLite ou Redis) que sobrevive a reinícios
+3. Workers escaláveis em um ou vários hosts
 4. WebSocket para notificações em tempo real
 5. Políticas de retry inteligentes
 """
@@ -42,6 +42,7 @@ except ImportError:
     _psutil_available = False
 
 from app.config import get_settings
+from app.core.job_queue import get_embedded_worker, get_job_queue
 from app.database import get_db_session
 from app.models import Audio, User, FileUpload
 
@@ -96,6 +97,9 @@ class ProcessingTask:
     audio_path: Optional[str] = None
     duration: Optional[float] = None
     
+    # Job correspondente na fila durável
+    job_id: Optional[str] = None
+    
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.now()
@@ -125,15 +129,21 @@ class ProcessingTask:
         
         return cls(**data)
 
+# Status dos jobs da fila -> ProcessingStatus
+_JOB_STATUS = {
+    "queued": ProcessingStatus.QUEUED.value,
+    "running": ProcessingStatus.PROCESSING.value,
+    "succeeded": ProcessingStatus.COMPLETED.value,
+    "failed": ProcessingStatus.FAILED.value,
+    "cancelled": ProcessingStatus.CANCELLED.value,
+}
+
 class AsyncAudioProcessor:
     """Processador assíncrono de áudios"""
     
     def __init__(self):
         self.tasks: Dict[str, ProcessingTask] = {}
-        self.workers: List[asyncio.Task] = []
         self.is_running = False
-        self.max_workers = 3
-        self.worker_semaphore = asyncio.Semaphore(self.max_workers)
         
         # Callbacks para notificações
         self.progress_callbacks: List[Callable] = []
@@ -164,15 +174,10 @@ class AsyncAudioProcessor:
         self.is_running = True
         logger.info("🚀 Iniciando serviço de processamento assíncrono")
         
-        # Carregar tarefas persistidas
+        # Carregar tarefas persistidas; a execução fica com os workers da fila "tts"
         await self._load_persisted_tasks()
         
-        # Iniciar workers
-        for i in range(self.max_workers):
-            worker = asyncio.create_task(self._worker_loop(f"worker-{i}"))
-            self.workers.append(worker)
-        
-        logger.info(f"✅ {self.max_workers} workers iniciados")
+        logger.info("✅ Processamento assíncrono pronto (fila 'tts')")
     
     async def stop(self):
         """Parar o serviço de processamento"""
@@ -182,17 +187,9 @@ class AsyncAudioProcessor:
         logger.info("🛑 Parando serviço de processamento assíncrono")
         self.is_running = False
         
-        # Persistir tarefas pendentes
+        # Persistir tarefas pendentes (os jobs continuam na fila durável)
         await self._persist_tasks()
         
-        # Cancelar workers
-        for worker in self.workers:
-            worker.cancel()
-        
-        # Aguardar finalização
-        await asyncio.gather(*self.workers, return_exceptions=True)
-        self.workers.clear()
-        
         logger.info("✅ Serviço de processamento parado")
     
     async def submit_task(
@@ -226,7 +223,15 @@ class AsyncAudioProcessor:
             priority=priority
         )
         
-        # Adicionar à fila
+        # Adicionar à fila durável; prioridade maior sai primeiro
+        job = await get_job_queue().enqueue(
+            "audio.narration",
+            task.to_dict(),
+            priority=priority.value,
+            max_attempts=task.max_retries + 1,
+            idempotency_key=f"audio.narration:{task_id}"
+        )
+        task.job_id = job.id
         self.tasks[task_id] = task
         await self._persist_task(task)
         
@@ -244,19 +249,36 @@ class AsyncAudioProcessor:
             # Tentar carregar do Redis
             task = await self._load_task(task_id)
         
-        if task:
-            return task.to_dict()
-        return None
+        if not task:
+            return None
+        
+        data = task.to_dict()
+        # O job é a fonte da verdade quando o worker roda em outro processo
+        job = await get_job_queue().get(task.job_id) if task.job_id else None
+        if job:
+            data["status"] = _JOB_STATUS.get(job.status, job.status)
+            if job.status == "queued" and job.attempts:
+                data["status"] = ProcessingStatus.RETRY.value
+            data["progress"] = job.progress
+            # Tentativas que falharam (a em execução não conta)
+            data["retry_count"] = job.attempts - 1 if job.status in ("running", "succeeded") else job.attempts
+            data["error_message"] = job.error or data["error_message"]
+            data.update(job.result or {})
+        return data
     
     async def cancel_task(self, task_id: str) -> bool:
         """Cancelar uma tarefa"""
-        task = self.tasks.get(task_id)
+        task = self.tasks.get(task_id) or await self._load_task(task_id)
         if not task:
             return False
         
         if task.status in [ProcessingStatus.COMPLETED, ProcessingStatus.FAILED]:
             return False
         
+        # Remove da fila ou interrompe o worker no próximo heartbeat
+        if task.job_id and not await get_job_queue().cancel(task.job_id):
+            return False
+        
         task.status = ProcessingStatus.CANCELLED
         await self._persist_task(task)
         
@@ -285,7 +307,8 @@ class AsyncAudioProcessor:
             "by_status": {},
             "by_priority": {},
             "avg_processing_time": 0.0,
-            "active_workers": len([w for w in self.workers if not w.done()]),
+            "queue": (await get_job_queue().stats()).get("tts", {}),
+            "embedded_worker": get_embedded_worker().get_stats() if get_embedded_worker() else None,
             "system_resources": {}
         }
         
@@ -339,64 +362,19 @@ class AsyncAudioProcessor:
         if old_task_ids:
             logger.info(f"🧹 {len(old_task_ids)} tarefas antigas removidas da memória")
     
-    # Métodos privados
-    async def _worker_loop(self, worker_name: str):
-        """Loop principal do worker"""
-        logger.info(f"👷 Worker {worker_name} iniciado")
-        
-        while self.is_running:
-            try:
-                # Buscar próxima tarefa
-                task = await self._get_next_task()
-                
-                if task:
-                    async with self.worker_semaphore:
-                        await self._process_task(task, worker_name)
-                else:
-                    # Não há tarefas, aguardar um pouco
-                    await asyncio.sleep(1)
-                    
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Erro no worker {worker_name}: {e}", exc_info=True)
-                await asyncio.sleep(5)  # Aguardar antes de continuar
-        
-        logger.info(f"👷 Worker {worker_name} finalizado")
-    
-    async def _get_next_task(self) -> Optional[ProcessingTask]:
-        """Obter próxima tarefa para processamento"""
-        # Filtrar tarefas que podem ser processadas
-        eligible_tasks = []
-        
-        for task in self.tasks.values():
-            if task.status == ProcessingStatus.QUEUED:
-                eligible_tasks.append(task)
-            elif task.status == ProcessingStatus.RETRY:
-                # Verificar se já passou o tempo de retry
-                if task.started_at:
-                    retry_delay = 60 * (2 ** task.retry_count)  # Backoff exponencial
-                    if datetime.now() > task.started_at + timedelta(seconds=retry_delay):
-                        eligible_tasks.append(task)
-        
-        if not eligible_tasks:
-            return None
-        
-        # Ordenar por prioridade e depois por data de criação
-        eligible_tasks.sort(
-            key=lambda x: (x.priority.value, x.created_at),
-            reverse=True
-        )
-        
-        return eligible_tasks[0]
-    
-    async def _process_task(self, task: ProcessingTask, worker_name: str):
-        """Processar uma tarefa específica"""
-        logger.info(f"🔄 {worker_name} processando tarefa {task.id}")
+    async def process_job(self, task: ProcessingTask, ctx) -> Dict:
+        """
+        Executa a narração de uma tarefa; chamado pelo handler "audio.narration"
+        no worker da fila. Exceções voltam para a fila, que faz o retry.
+        """
+        logger.info(f"🔄 {ctx.worker_id} processando tarefa {task.id} (tentativa {ctx.attempt})")
+        task.job_id = ctx.job.id
+        self.tasks[task.id] = task
         
         # Atualizar status
         task.status = ProcessingStatus.PROCESSING
         task.started_at = datetime.now()
+        task.retry_count = ctx.attempt - 1
         task.progress = 0.0
         await self._persist_task(task)
         await self._notify_progress(task)
@@ -405,53 +383,57 @@ class AsyncAudioProcessor:
             # Importar função de geração de narração
             from app.utils import generate_narration_sync
             
-            # Simular progresso durante processamento
-            await self._update_progress(task, 10.0)
+            await self._update_progress(task, 10.0, ctx)
             
-            # Gerar narração
-            result = generate_narration_sync(
+            # Gerar narração fora do event loop do worker
+            result = await asyncio.to_thread(
+                generate_narration_sync,
                 text=task.extracted_text,
                 output_path=task.output_path,
                 voice=task.voice,
                 provider=task.provider
             )
             
-            await self._update_progress(task, 80.0)
+            await self._update_progress(task, 80.0, ctx)
             
-            if result.get('success'):
-                # Salvar no banco de dados
-                await self._save_audio_to_db(task, result)
-                await self._update_progress(task, 100.0)
-                
-                # Marcar como concluída
-                task.status = ProcessingStatus.COMPLETED
-                task.completed_at = datetime.now()
-                task.audio_path = result.get('audio_path')
-                task.duration = result.get('duration')
-                
-                logger.info(f"✅ Tarefa {task.id} concluída com sucesso")
-                
-            else:
+            if not result.get('success'):
                 raise Exception(result.get('error', 'Erro desconhecido na geração'))
-                
+            
+            # Salvar no banco de dados
+            await self._save_audio_to_db(task, result)
+            await self._update_progress(task, 100.0, ctx)
+            
+            # Marcar como concluída
+            task.status = ProcessingStatus.COMPLETED
+            task.completed_at = datetime.now()
+            task.audio_path = result.get('audio_path')
+            task.duration = result.get('duration')
+            
+            logger.info(f"✅ Tarefa {task.id} concluída com sucesso")
+            
         except Exception as e:
             logger.error(f"❌ Erro ao processar tarefa {task.id}: {e}")
             
             task.error_message = str(e)
-            task.retry_count += 1
+            task.retry_count = ctx.attempt
             
-            if task.retry_count <= task.max_retries:
+            if ctx.attempt < ctx.job.max_attempts:
                 task.status = ProcessingStatus.RETRY
                 logger.info(f"🔄 Tarefa {task.id} será tentada novamente ({task.retry_count}/{task.max_retries})")
             else:
                 task.status = ProcessingStatus.FAILED
                 task.completed_at = datetime.now()
                 logger.error(f"💀 Tarefa {task.id} falhou definitivamente")
+            raise
         
-        await self._persist_task(task)
-        await self._notify_progress(task)
-        await self._notify_completion(task)
+        finally:
+            await self._persist_task(task)
+            await self._notify_progress(task)
+            await self._notify_completion(task)
+        
+        return {"audio_id": task.audio_id, "audio_path": task.audio_path, "duration": task.duration}
     
+    # Métodos privados
     async def _save_audio_to_db(self, task: ProcessingTask, result: Dict):
         """Salvar áudio no banco de dados"""
         db = next(get_db_session())
@@ -497,9 +479,11 @@ class AsyncAudioProcessor:
         finally:
             db.close()
     
-    async def _update_progress(self, task: ProcessingTask, progress: float):
+    async def _update_progress(self, task: ProcessingTask, progress: float, ctx=None):
         """Atualizar progresso da tarefa"""
         task.progress = progress
+        if ctx is not None:
+            ctx.set_progress(progress)
         await self._persist_task(task)
         await self._notify_progress(task)
     
@@ -23,6 +23,9 @@ try:
 except ImportError:
     SQLALCHEMY_AVAILABLE = False
 
+from app.services.version_store import VersionIndexEntry, VersionStore, count_changes
+from app.core.scheduler import get_scheduler
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -32,12 +35,14 @@ class AutoSaveVersion:
     project_id: int
     user_id: int
     version_number: int
-    data: Dict[str, Any]
+    data: Optional[Dict[str, Any]]  # None quando listado só pelo índice
     data_hash: str
     file_size: int
     created_at: datetime
     is_manual: bool = False
     description: Optional[str] = None
+    storage_kind: str = "snapshot"  # snapshot completo ou delta (JSON Patch)
+    stored_size: int = 0
 
 class AutoSaveService:
     """Serviço completo para auto-save automático"""
@@ -57,11 +62,21 @@ class AutoSaveService:
         self.max_age_days = 30
         self.compression_enabled = True
         self.min_changes_threshold = 5  # mínimo de mudanças para salvar
+        self.snapshot_interval = 20  # snapshot completo a cada N versões
+        
+        # Versões: índice por projeto + snapshots periódicos e deltas
+        self.version_store = VersionStore(
+            self.versions_dir,
+            snapshot_interval=self.snapshot_interval,
+            compression=self.compression_enabled
+        )
+        self._import_legacy_versions()
         
         # Estado interno
         self.active_sessions = {}  # {user_id: {project_id: session_data}}
         self.save_queue = asyncio.Queue()
         self.is_running = False
+        self._save_worker_task = None
         
         # Cache de projetos
         self.project_cache = {}
@@ -75,15 +90,23 @@ class AutoSaveService:
         
         self.is_running = True
         
-        # Iniciar workers
-        asyncio.create_task(self._autosave_worker())
-        asyncio.create_task(self._cleanup_worker())
+        # Fila de saves consumida por um worker; checagens periódicas no agendador
+        self._save_worker_task = asyncio.create_task(self._autosave_worker())
+        scheduler = get_scheduler()
+        scheduler.add_job("autosave.time_based", self._check_time_based_saves, interval=5, jitter=1)
+        scheduler.add_job("autosave.cleanup", self._cleanup_old_versions_all, interval=3600, jitter=60)
         
         logger.info("🔄 Serviço de auto-save iniciado")
     
     async def stop_service(self):
         """Parar serviço de auto-save"""
         self.is_running = False
+        scheduler = get_scheduler()
+        scheduler.remove_job("autosave.time_based")
+        scheduler.remove_job("autosave.cleanup")
+        if self._save_worker_task is not None:
+            self._save_worker_task.cancel()
+            self._save_worker_task = None
         logger.info("⏹️ Serviço de auto-save parado")
     
     async def register_session(self, user_id: int, project_id: int, 
@@ -189,27 +212,13 @@ class AutoSaveService:
             return False
     
     async def _autosave_worker(self):
-        """Worker para processar auto-saves"""
+        """Worker para processar a fila de auto-saves (acorda só quando há request)"""
         while self.is_running:
+            save_request = await self.save_queue.get()
             try:
-                # Processar fila de saves
-                try:
-                    save_request = await asyncio.wait_for(
-                        self.save_queue.get(), 
-                        timeout=1.0
-                    )
-                    await self._process_save_request(save_request)
-                except asyncio.TimeoutError:
-                    pass
-                
-                # Auto-save baseado em tempo
-                await self._check_time_based_saves()
-                
-                await asyncio.sleep(5)  # Check a cada 5 segundos
-                
+                await self._process_save_request(save_request)
             except Exception as e:
                 logger.error(f"Erro no worker de auto-save: {e}")
-                await asyncio.sleep(10)
     
     async def _process_save_request(self, save_request: Dict[str, Any]):
         """Processar request de save"""
@@ -250,31 +259,27 @@ class AutoSaveService:
             data_json = json.dumps(data, sort_keys=True)
             data_hash = hashlib.md5(data_json.encode()).hexdigest()
             
-            # Verificar se é diferente da última versão
-            existing_versions = await self.get_project_versions(project_id, limit=1)
-            if existing_versions and existing_versions[0].data_hash == data_hash:
+            # Verificar se é diferente da última versão (só o índice é consultado)
+            latest = self.version_store.latest(project_id)
+            if latest and latest.data_hash == data_hash:
                 logger.debug("📋 Dados inalterados, skip save")
                 return None
             
-            # Obter próximo número de versão
-            version_number = len(await self.get_project_versions(project_id)) + 1
-            
-            # Criar objeto de versão
-            version = AutoSaveVersion(
+            # Gravar como delta da versão anterior ou snapshot periódico
+            entry = self.version_store.append(project_id, VersionIndexEntry(
                 id=str(uuid.uuid4()),
-                project_id=project_id,
+                version_number=0,  # definido pelo store
                 user_id=user_id,
-                version_number=version_number,
-                data=data,
                 data_hash=data_hash,
-                file_size=len(data_json),
-                created_at=datetime.now(),
+                size=len(data_json),
+                stored_size=0,
+                created_at=datetime.now().isoformat(),
+                kind="snapshot",
                 is_manual=is_manual,
                 description=description
-            )
+            ), data)
             
-            # Salvar arquivo
-            await self._save_version_file(version)
+            version = self._version_from_entry(project_id, entry, data)
             
             # Limpar versões antigas se necessário
             await self._cleanup_old_versions(project_id)
@@ -285,120 +290,94 @@ class AutoSaveService:
             logger.error(f"Erro ao criar versão: {e}")
             return None
     
-    async def _save_version_file(self, version: AutoSaveVersion):
-        """Salvar arquivo de versão"""
-        try:
-            version_filename = f"project_{version.project_id}_v{version.version_number}_{version.id}.json"
-            
-            if self.compression_enabled:
-                version_filename += ".gz"
-                version_path = self.versions_dir / version_filename
-                
-                # Salvar comprimido
-                version_data = {
-                    "id": version.id,
-                    "project_id": version.project_id,
-                    "user_id": version.user_id,
-                    "version_number": version.version_number,
-                    "data": version.data,
-                    "data_hash": version.data_hash,
-                    "file_size": version.file_size,
-                    "created_at": version.created_at.isoformat(),
-                    "is_manual": version.is_manual,
-                    "description": version.description
-                }
-                
-                with gzip.open(version_path, 'wt', encoding='utf-8') as f:
-                    json.dump(version_data, f, indent=2)
-            else:
-                version_path = self.versions_dir / version_filename
-                
-                version_data = {
-                    "id": version.id,
-                    "project_id": version.project_id,
-                    "user_id": version.user_id,
-                    "version_number": version.version_number,
-                    "data": version.data,
-                    "data_hash": version.data_hash,
-                    "file_size": version.file_size,
-                    "created_at": version.created_at.isoformat(),
-                    "is_manual": version.is_manual,
-                    "description": version.description
-                }
-                
-                with open(version_path, 'w', encoding='utf-8') as f:
-                    json.dump(version_data, f, indent=2)
-            
-            logger.debug(f"💾 Versão salva: {version_filename}")
-            
-        except Exception as e:
-            logger.error(f"Erro ao salvar arquivo de versão: {e}")
-            raise
+    def _version_from_entry(self, project_id: int, entry: VersionIndexEntry,
+                            data: Optional[Dict[str, Any]] = None) -> AutoSaveVersion:
+        return AutoSaveVersion(
+            id=entry.id,
+            project_id=project_id,
+            user_id=entry.user_id,
+            version_number=entry.version_number,
+            data=data,
+            data_hash=entry.data_hash,
+            file_size=entry.size,
+            created_at=datetime.fromisoformat(entry.created_at),
+            is_manual=entry.is_manual,
+            description=entry.description,
+            storage_kind=entry.kind,
+            stored_size=entry.stored_size
+        )
     
-    async def get_project_versions(self, project_id: int, 
-                                 limit: int = None) -> List[AutoSaveVersion]:
-        """Obter versões do projeto"""
+    async def get_project_versions(self, project_id: int, limit: int = None,
+                                 include_data: bool = False) -> List[AutoSaveVersion]:
+        """
+        Obter versões do projeto (mais recente primeiro).
+        
+        A listagem vem do índice; os dados só são reconstruídos com
+        `include_data=True`.
+        """
         try:
             versions = []
-            
-            # Buscar arquivos de versão
-            pattern = f"project_{project_id}_v*.json*"
-            version_files = list(self.versions_dir.glob(pattern))
-            
-            # Ordenar por data de modificação (mais recente primeiro)
-            version_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            
-            for version_file in version_files[:limit] if limit else version_files:
-                try:
-                    version = await self._load_version_file(version_file)
-                    if version:
-                        versions.append(version)
-                except Exception as e:
-                    logger.warning(f"Erro ao carregar versão {version_file}: {e}")
-            
+            for entry in self.version_store.list_versions(project_id, limit):
+                data = self.version_store.load_data(project_id, entry.version_number) if include_data else None
+                versions.append(self._version_from_entry(project_id, entry, data))
             return versions
             
         except Exception as e:
             logger.error(f"Erro ao obter versões: {e}")
             return []
     
-    async def _load_version_file(self, version_file: Path) -> Optional[AutoSaveVersion]:
-        """Carregar arquivo de versão"""
-        try:
-            if version_file.suffix == '.gz':
-                with gzip.open(version_file, 'rt', encoding='utf-8') as f:
-                    version_data = json.load(f)
-            else:
-                with open(version_file, 'r', encoding='utf-8') as f:
-                    version_data = json.load(f)
-            
-            return AutoSaveVersion(
-                id=version_data["id"],
-                project_id=version_data["project_id"],
-                user_id=version_data["user_id"],
-                version_number=version_data["version_number"],
-                data=version_data["data"],
-                data_hash=version_data["data_hash"],
-                file_size=version_data["file_size"],
-                created_at=datetime.fromisoformat(version_data["created_at"]),
-                is_manual=version_data.get("is_manual", False),
-                description=version_data.get("description")
-            )
-            
-        except Exception as e:
-            logger.error(f"Erro ao carregar versão: {e}")
-            return None
+    def _import_legacy_versions(self):
+        """Migrar arquivos do formato antigo (um JSON completo por versão) para o store"""
+        legacy_files = list(self.versions_dir.glob("project_*_v*.json*"))
+        if not legacy_files:
+            return
+        
+        legacy_versions = []
+        for version_file in legacy_files:
+            try:
+                if version_file.suffix == '.gz':
+                    with gzip.open(version_file, 'rt', encoding='utf-8') as f:
+                        legacy_versions.append((version_file, json.load(f)))
+                else:
+                    with open(version_file, 'r', encoding='utf-8') as f:
+                        legacy_versions.append((version_file, json.load(f)))
+            except Exception as e:
+                logger.warning(f"Erro ao carregar versão antiga {version_file}: {e}")
+        
+        legacy_versions.sort(key=lambda item: (item[1]["project_id"], item[1]["version_number"]))
+        for version_file, version_data in legacy_versions:
+            try:
+                project_id = version_data["project_id"]
+                if self.version_store.find(project_id, version_data["id"]) is None:
+                    self.version_store.append(project_id, VersionIndexEntry(
+                        id=version_data["id"],
+                        version_number=0,
+                        user_id=version_data["user_id"],
+                        data_hash=version_data["data_hash"],
+                        size=version_data["file_size"],
+                        stored_size=0,
+                        created_at=version_data["created_at"],
+                        kind="snapshot",
+                        is_manual=version_data.get("is_manual", False),
+                        description=version_data.get("description")
+                    ), version_data["data"])
+                version_file.unlink()
+            except Exception as e:
+                logger.warning(f"Erro ao migrar versão {version_file}: {e}")
+        
+        logger.info(f"📦 {len(legacy_versions)} versões migradas para o armazenamento com deltas")
     
     async def restore_version(self, project_id: int, version_id: str, 
                             user_id: int) -> Optional[Dict[str, Any]]:
         """Restaurar versão específica"""
         try:
-            versions = await self.get_project_versions(project_id)
-            
-            target_version = next((v for v in versions if v.id == version_id), None)
-            if not target_version:
+            entry = self.version_store.find(project_id, version_id)
+            if not entry:
                 logger.warning(f"Versão não encontrada: {version_id}")
                 return None
+            target_version = self._version_from_entry(
+                project_id, entry, self.version_store.load_data(project_id, entry.version_number)
+            )
             
             # Criar nova versão como backup antes de restaurar
             if user_id in self.active_sessions and project_id in self.active_sessions[user_id]:
@@ -451,21 +430,11 @@ class AutoSaveService:
         except Exception as e:
             logger.error(f"Erro no check de saves por tempo: {e}")
     
-    async def _cleanup_worker(self):
-        """Worker para limpeza de versões antigas"""
-        while self.is_running:
-            try:
-                await self._cleanup_old_versions_all()
-                await asyncio.sleep(3600)  # Executar a cada hora
-                
-            except Exception as e:
-                logger.error(f"Erro no worker de limpeza: {e}")
-                await asyncio.sleep(1800)  # Retry em 30 min
-    
     async def _cleanup_old_versions(self, project_id: int):
         """Limpar versões antigas de um projeto"""
         try:
             versions = await self.get_project_versions(project_id)
+            to_delete = set()
             
             # Remover versões em excesso
             if len(versions) > self.max_versions_per_project:
@@ -477,15 +446,15 @@ class AutoSaveService:
                                                 len([v for v in versions if v.is_manual]))
                 
                 if to_remove > 0:
-                    for version in auto_versions[:to_remove]:
-                        await self._delete_version_file(version)
+                    to_delete.update(v.version_number for v in auto_versions[:to_remove])
             
             # Remover versões muito antigas
             cutoff_date = datetime.now() - timedelta(days=self.max_age_days)
-            old_versions = [v for v in versions if v.created_at < cutoff_date and not v.is_manual]
+            to_delete.update(v.version_number for v in versions if v.created_at < cutoff_date and not v.is_manual)
             
-            for version in old_versions:
-                await self._delete_version_file(version)
+            if to_delete:
+                removed = self.version_store.delete_versions(project_id, to_delete)
+                logger.debug(f"🗑️ {removed} versões removidas do projeto {project_id}")
             
         except Exception as e:
             logger.error(f"Erro na limpeza de versões: {e}")
@@ -493,16 +462,7 @@ class AutoSaveService:
     async def _cleanup_old_versions_all(self):
         """Limpar versões antigas de todos os projetos"""
         try:
-            # Obter todos os IDs de projeto dos arquivos
-            project_ids = set()
-            for version_file in self.versions_dir.glob("project_*.json*"):
-                try:
-                    parts = version_file.stem.split('_')
-                    if len(parts) >= 2:
-                        project_id = int(parts[1])
-                        project_ids.add(project_id)
-                except:
-                    pass
+            project_ids = self.version_store.project_ids()
             
             # Limpar cada projeto
             for project_id in project_ids:
@@ -514,20 +474,9 @@ class AutoSaveService:
             logger.error(f"Erro na limpeza geral: {e}")
     
     async def _delete_version_file(self, version: AutoSaveVersion):
-        """Deletar arquivo de versão"""
+        """Deletar versão"""
         try:
-            version_filename = f"project_{version.project_id}_v{version.version_number}_{version.id}.json"
-            
-            # Tentar versão comprimida primeiro
-            version_path = self.versions_dir / (version_filename + ".gz")
-            if version_path.exists():
-                version_path.unlink()
-            else:
-                # Tentar versão não comprimida
-                version_path = self.versions_dir / version_filename
-                if version_path.exists():
-                    version_path.unlink()
-            
+            self.version_store.delete_versions(version.project_id, [version.version_number])
             logger.debug(f"🗑️ Versão removida: v{version.version_number}")
             
         except Exception as e:
@@ -556,18 +505,10 @@ class AutoSaveService:
             logger.error(f"Erro ao atualizar projeto no banco: {e}")
     
     def _count_changes(self, old_data: Dict[str, Any], new_data: Dict[str, Any]) -> int:
-        """Contar mudanças entre dois datasets"""
+        """Contar mudanças (caminhos alterados) entre dois datasets"""
         try:
-            old_json = json.dumps(old_data, sort_keys=True)
-            new_json = json.dumps(new_data, sort_keys=True)
-            
-            if old_json == new_json:
-                return 0
-            
-            # Contagem simples baseada em diferença de tamanho
-            # Em produção, poderia usar algoritmo mais sofisticado
-            size_diff = abs(len(new_json) - len(old_json))
-            return max(1, size_diff // 100)  # 1 mudança a cada 100 chars de diff
+            # Diferença estrutural: subárvores iguais são puladas sem serializar
+            return count_changes(old_data, new_data)
             
         except Exception as e:
             logger.error(f"Erro ao contar mudanças: {e}")
@@ -39,11 +39,7 @@ import subprocess
 import logging
 from contextlib import contextmanager
 
-try:
-    import schedule
-    SCHEDULE_AVAILABLE = True
-except ImportError:
-    SCHEDULE_AVAILABLE = False
+from app.core.scheduler import get_scheduler
 
 try:
     from cryptography.fernet import Fernet
@@ -594,7 +590,6 @@ class BackupScheduler:
         self.executor = executor
         self.configs: Dict[str, BackupConfig] = {}
         self.running = False
-        self.scheduler_thread = None
     
     def add_backup_config(self, config: BackupConfig):
         """Adicionar configuração de backup."""
@@ -609,37 +604,30 @@ class BackupScheduler:
     
     def start_scheduler(self):
         """Iniciar agendador de backups."""
-        if self.running or not SCHEDULE_AVAILABLE:
+        if self.running:
             return
         
         self.running = True
-        self.scheduler_thread = threading.Thread(target=self._run_scheduler)
-        self.scheduler_thread.daemon = True
-        self.scheduler_thread.start()
+        # Verificação a cada minuto, alinhada ao início do minuto, no agendador
+        # compartilhado; roda no executor porque compressão e cópia bloqueiam
+        get_scheduler().add_job(
+            "backup.schedule_check", self._run_scheduler, interval=60,
+            initial_delay=61 - time.time() % 60, executor=True,
+        )
         
         logger.info("🚀 Agendador de backups iniciado")
     
     def stop_scheduler(self):
         """Parar agendador de backups."""
         self.running = False
-        if self.scheduler_thread:
-            self.scheduler_thread.join(timeout=5)
+        get_scheduler().remove_job("backup.schedule_check")
         logger.info("⏹️ Agendador de backups parado")
     
     def _run_scheduler(self):
-        """Loop principal do agendador."""
-        while self.running:
-            try:
-                # Verificar backups agendados
-                for config in self.configs.values():
-                    if self._should_run_backup(config):
-                        asyncio.create_task(self._run_scheduled_backup(config))
-                
-                time.sleep(60)  # Verificar a cada minuto
-                
-            except Exception as e:
-                logger.error(f"Erro no agendador: {e}")
-                time.sleep(60)
+        """Verificar backups agendados (job do agendador, em thread do executor)."""
+        for config in list(self.configs.values()):
+            if self._should_run_backup(config):
+                asyncio.run(self._run_scheduled_backup(config))
     
     def _should_run_backup(self, config: BackupConfig) -> bool:
         """Verificar se backup deve ser executado agora."""
@@ -34,6 +34,8 @@ import threading
 from contextlib import asynccontextmanager
 import functools
 
+from app.core.tracing import traced
+
 try:
     import redis
     import redis.asyncio as aioredis
@@ -584,6 +586,7 @@ class HierarchicalCache:
             'writebacks': 0   # L1 -> L2
         }
     
+    @traced("cache.get", category="cache")
     def get(self, key: str) -> Optional[Any]:
         """Obter valor do cache hierárquico."""
         self.global_stats['total_requests'] += 1
@@ -608,6 +611,7 @@ class HierarchicalCache:
         self.global_stats['misses'] += 1
         return None
     
+    @traced("cache.get", category="cache")
     async def get_async(self, key: str) -> Optional[Any]:
         """Obter valor do cache hierárquico (async)."""
         self.global_stats['total_requests'] += 1
@@ -631,6 +635,7 @@ class HierarchicalCache:
         self.global_stats['misses'] += 1
         return None
     
+    @traced("cache.set", category="cache")
     def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None, tags: List[str] = None) -> bool:
         """Definir valor no cache hierárquico."""
         success = True
@@ -648,6 +653,7 @@ class HierarchicalCache:
         
         return l1_success or l2_success
     
+    @traced("cache.set", category="cache")
     async def set_async(self, key: str, value: Any, ttl_seconds: Optional[int] = None, tags: List[str] = None) -> bool:
         """Definir valor no cache hierárquico (async)."""
         # L1 síncrono
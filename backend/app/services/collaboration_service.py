@@ -14,6 +14,9 @@ import logging
 from dataclasses import dataclass
 from enum import Enum
 
+from app.services.presence_channel import PresenceChannel
+from app.core.scheduler import get_scheduler
+
 try:
     from fastapi import WebSocket, WebSocketDisconnect
     from sqlalchemy.orm import Session
@@ -91,6 +94,10 @@ class CollaborationSession:
     created_at: datetime
     last_activity: datetime
     settings: Dict[str, Any]
+    presence: Optional[PresenceChannel] = None
+
+# Ações de presença: coalescidas no canal de presença, fora do histórico
+PRESENCE_ACTIONS = {ActionType.CURSOR_MOVE, ActionType.ELEMENT_SELECT}
 
 class CollaborationService:
     """Serviço completo para colaboração em tempo real"""
@@ -108,12 +115,15 @@ class CollaborationService:
         self.active_sessions: Dict[int, CollaborationSession] = {}
         self.user_to_project: Dict[int, int] = {}  # user_id -> project_id
         self.websocket_to_user: Dict[str, int] = {}  # connection_id -> user_id
+        self.socket_to_connection: Dict[int, str] = {}  # id(websocket) -> connection_id
         
         # Configurações
         self.max_users_per_project = 20
         self.action_history_limit = 1000
         self.inactive_timeout = timedelta(minutes=30)
-        self.cursor_update_throttle = 0.1  # segundos
+        self.presence_tick_rate = 15  # quadros de presença por segundo
+        self.presence_send_timeout = 2.0  # segundos
+        self.broadcast_send_timeout = 5.0  # segundos
         
         # Rate limiting
         self.rate_limits = {
@@ -126,16 +136,32 @@ class CollaborationService:
     
     async def start_service(self):
         """Iniciar serviço de colaboração"""
-        # Iniciar workers
-        asyncio.create_task(self._cleanup_worker())
-        asyncio.create_task(self._heartbeat_worker())
+        # Limpeza e heartbeat rodam no agendador compartilhado
+        scheduler = get_scheduler()
+        scheduler.add_job("collaboration.cleanup", self._cleanup_inactive_sessions, interval=300, jitter=30)
+        scheduler.add_job("collaboration.heartbeat", self._send_heartbeats, interval=30, jitter=3)
         
         logger.info("🚀 Serviço de colaboração iniciado")
     
+    async def stop_service(self):
+        """Parar serviço de colaboração"""
+        scheduler = get_scheduler()
+        scheduler.remove_job("collaboration.cleanup")
+        scheduler.remove_job("collaboration.heartbeat")
+        logger.info("⏹️ Serviço de colaboração parado")
+    
     async def join_project(self, project_id: int, user_id: int, user_name: str,
                           user_email: str, websocket: WebSocket, 
-                          permission: Permission = Permission.VIEWER) -> bool:
-        """Usuário se junta a um projeto"""
+                          permission: Permission = Permission.VIEWER,
+                          binary_presence: bool = False,
+                          subprotocol: Optional[str] = None) -> bool:
+        """Usuário se junta a um projeto
+
+        Cursores e seleções dos outros usuários chegam pelo canal de presença,
+        em JSON compacto; quadros binários só com binary_presence=True (ver
+        `negotiate_presence_format`). O `subprotocol` negociado é devolvido
+        no handshake.
+        """
         try:
             # Verificar se o projeto existe
             if not await self._project_exists(project_id):
@@ -164,7 +190,7 @@ class CollaborationService:
                     return False
             
             # Aceitar conexão WebSocket
-            await websocket.accept()
+            await websocket.accept(subprotocol=subprotocol)
             connection_id = str(uuid.uuid4())
             
             # Criar ou obter sessão
@@ -192,10 +218,13 @@ class CollaborationService:
             session.active_users[user_id] = collab_user
             session.websocket_connections[connection_id] = websocket
             session.last_activity = datetime.now()
+            session.presence.add_connection(connection_id, websocket, user_id, binary_presence)
+            session.presence.start()
             
             # Mapear conexões
             self.user_to_project[user_id] = project_id
             self.websocket_to_user[connection_id] = user_id
+            self.socket_to_connection[id(websocket)] = connection_id
             
             # Notificar outros usuários
             join_action = CollaborationAction(
@@ -211,7 +240,7 @@ class CollaborationService:
             await self._broadcast_action(session, join_action, exclude_user=user_id)
             
             # Enviar estado atual para o novo usuário
-            await self._send_current_state(websocket, session)
+            await self._send_current_state(websocket, session, binary_presence)
             
             logger.info(f"👤 {user_name} entrou no projeto {project_id}")
             return True
@@ -243,10 +272,13 @@ class CollaborationService:
             del self.user_to_project[user_id]
             
             # Remover conexão WebSocket
-            if connection_id and connection_id in session.websocket_connections:
-                del session.websocket_connections[connection_id]
-            if connection_id and connection_id in self.websocket_to_user:
-                del self.websocket_to_user[connection_id]
+            connection_id = connection_id or user.connection_id
+            websocket = session.websocket_connections.pop(connection_id, None)
+            if websocket is not None:
+                self.socket_to_connection.pop(id(websocket), None)
+            self.websocket_to_user.pop(connection_id, None)
+            session.presence.remove_connection(connection_id)
+            session.presence.forget_user(user_id)
             
             # Notificar outros usuários
             leave_action = CollaborationAction(
@@ -264,6 +296,7 @@ class CollaborationService:
             # Limpar sessão se vazia
             if not session.active_users:
                 del self.active_sessions[project_id]
+                await session.presence.stop()
             
             logger.info(f"👤 {user.name} saiu do projeto {project_id}")
             
@@ -274,14 +307,8 @@ class CollaborationService:
         """Processar mensagem WebSocket"""
         try:
             # Identificar usuário
-            connection_id = None
-            user_id = None
-            
-            for conn_id, ws in self.websocket_to_user.items():
-                if id(websocket) == id(self._get_websocket_by_connection(conn_id)):
-                    connection_id = conn_id
-                    user_id = ws
-                    break
+            connection_id = self.socket_to_connection.get(id(websocket))
+            user_id = self.websocket_to_user.get(connection_id) if connection_id else None
             
             if not user_id or user_id not in self.user_to_project:
                 await websocket.send_json({
@@ -311,6 +338,12 @@ class CollaborationService:
                 })
                 return
             
+            # Presença (cursor/seleção): apenas atualizar estado, o envio é por tick
+            if action_type in PRESENCE_ACTIONS:
+                self._update_presence(session, user, action_type, message.get("data") or {})
+                user.last_seen = datetime.now()
+                return
+            
             # Verificar rate limiting
             if not await self._check_rate_limit(user_id, action_type):
                 await websocket.send_json({
@@ -344,22 +377,22 @@ class CollaborationService:
         except Exception as e:
             logger.error(f"Erro ao processar mensagem WebSocket: {e}")
     
+    def _update_presence(self, session: CollaborationSession, user: CollaborationUser,
+                         action_type: ActionType, data: Dict[str, Any]):
+        """Atualizar cursor/seleção e enfileirar no canal de presença"""
+        if action_type == ActionType.CURSOR_MOVE:
+            position = data.get("position") or {"x": 0, "y": 0}
+            user.cursor_position = position
+            session.presence.update_cursor(user.id, position)
+        else:
+            elements = data.get("elements") or []
+            user.selected_elements = elements
+            session.presence.update_selection(user.id, elements)
+    
     async def _process_action(self, session: CollaborationSession, action: CollaborationAction):
         """Processar ação específica"""
         try:
-            if action.action_type == ActionType.CURSOR_MOVE:
-                # Atualizar posição do cursor
-                user = session.active_users.get(action.user_id)
-                if user:
-                    user.cursor_position = action.data.get("position", {"x": 0, "y": 0})
-            
-            elif action.action_type == ActionType.ELEMENT_SELECT:
-                # Atualizar elementos selecionados
-                user = session.active_users.get(action.user_id)
-                if user:
-                    user.selected_elements = action.data.get("elements", [])
-            
-            elif action.action_type in [ActionType.ELEMENT_MOVE, ActionType.ELEMENT_RESIZE, 
+            if action.action_type in [ActionType.ELEMENT_MOVE, ActionType.ELEMENT_RESIZE, 
                                       ActionType.ELEMENT_EDIT]:
                 # Estas ações são apenas broadcastadas para sincronizar estado
                 pass
@@ -400,20 +433,24 @@ class CollaborationService:
                 }
             }
             
-            # Enviar para todos os usuários conectados (exceto o originador)
-            disconnected_connections = []
-            
-            for conn_id, websocket in session.websocket_connections.items():
-                user_id = self.websocket_to_user.get(conn_id)
-                
-                if user_id == exclude_user:
-                    continue
-                
-                try:
-                    await websocket.send_json(message)
-                except:
-                    # Conexão perdida
-                    disconnected_connections.append(conn_id)
+            # Enviar para todos os usuários conectados (exceto o originador),
+            # serializando uma única vez e com envios concorrentes
+            text = json.dumps(message)
+            targets = [
+                (conn_id, websocket)
+                for conn_id, websocket in list(session.websocket_connections.items())
+                if self.websocket_to_user.get(conn_id) != exclude_user
+            ]
+            results = await asyncio.gather(*[
+                asyncio.wait_for(websocket.send_text(text), timeout=self.broadcast_send_timeout)
+                for _, websocket in targets
+            ], return_exceptions=True)
+            
+            # Conexões perdidas
+            disconnected_connections = [
+                conn_id for (conn_id, _), result in zip(targets, results)
+                if isinstance(result, Exception)
+            ]
             
             # Limpar conexões perdidas
             for conn_id in disconnected_connections:
@@ -422,7 +459,8 @@ class CollaborationService:
         except Exception as e:
             logger.error(f"Erro no broadcast: {e}")
     
-    async def _send_current_state(self, websocket: WebSocket, session: CollaborationSession):
+    async def _send_current_state(self, websocket: WebSocket, session: CollaborationSession,
+                                  binary_presence: bool = False):
         """Enviar estado atual do projeto para novo usuário"""
         try:
             # Preparar estado atual
@@ -452,7 +490,11 @@ class CollaborationService:
                         }
                         for action in session.recent_actions[-50:]  # Últimas 50 ações
                     ],
-                    "settings": session.settings
+                    "settings": session.settings,
+                    "presence": {
+                        "format": "binary" if binary_presence else "json",
+                        "tick_hz": self.presence_tick_rate
+                    }
                 }
             }
             
@@ -481,7 +523,12 @@ class CollaborationService:
                     "max_users": self.max_users_per_project,
                     "chat_enabled": True,
                     "voice_enabled": False
-                }
+                },
+                presence=PresenceChannel(
+                    tick_rate=self.presence_tick_rate,
+                    send_timeout=self.presence_send_timeout,
+                    on_disconnect=self._cleanup_disconnected_connection
+                )
             )
             
             return session
@@ -564,66 +611,51 @@ class CollaborationService:
             logger.error(f"Erro ao obter usuários ativos: {e}")
             return []
     
-    async def _cleanup_worker(self):
-        """Worker para limpeza de sessões inativas"""
-        while True:
-            try:
-                current_time = datetime.now()
-                inactive_projects = []
-                
-                for project_id, session in self.active_sessions.items():
-                    # Verificar timeout de inatividade
-                    if current_time - session.last_activity > self.inactive_timeout:
-                        inactive_projects.append(project_id)
-                        continue
-                    
-                    # Limpar usuários inativos
-                    inactive_users = []
-                    for user_id, user in session.active_users.items():
-                        if current_time - user.last_seen > self.inactive_timeout:
-                            inactive_users.append(user_id)
-                    
-                    for user_id in inactive_users:
-                        await self.leave_project(user_id)
-                
-                # Limpar sessões inativas
-                for project_id in inactive_projects:
-                    if project_id in self.active_sessions:
-                        del self.active_sessions[project_id]
-                        logger.info(f"🧹 Sessão inativa removida: projeto {project_id}")
-                
-                await asyncio.sleep(300)  # Check a cada 5 minutos
-                
-            except Exception as e:
-                logger.error(f"Erro no worker de limpeza: {e}")
-                await asyncio.sleep(60)
+    async def _cleanup_inactive_sessions(self):
+        """Limpeza de sessões e usuários inativos (job a cada 5 minutos)"""
+        current_time = datetime.now()
+        inactive_projects = []
+        
+        for project_id, session in list(self.active_sessions.items()):
+            # Verificar timeout de inatividade
+            if current_time - session.last_activity > self.inactive_timeout:
+                inactive_projects.append(project_id)
+                continue
+            
+            # Limpar usuários inativos
+            inactive_users = []
+            for user_id, user in list(session.active_users.items()):
+                if current_time - user.last_seen > self.inactive_timeout:
+                    inactive_users.append(user_id)
+            
+            for user_id in inactive_users:
+                await self.leave_project(user_id)
+        
+        # Limpar sessões inativas
+        for project_id in inactive_projects:
+            if project_id in self.active_sessions:
+                session = self.active_sessions.pop(project_id)
+                await session.presence.stop()
+                logger.info(f"🧹 Sessão inativa removida: projeto {project_id}")
     
-    async def _heartbeat_worker(self):
-        """Worker para heartbeat das conexões"""
-        while True:
-            try:
-                for session in self.active_sessions.values():
-                    disconnected_connections = []
-                    
-                    for conn_id, websocket in session.websocket_connections.items():
-                        try:
-                            # Enviar ping
-                            await websocket.send_json({
-                                "type": "ping",
-                                "timestamp": datetime.now().isoformat()
-                            })
-                        except:
-                            disconnected_connections.append(conn_id)
-                    
-                    # Limpar conexões perdidas
-                    for conn_id in disconnected_connections:
-                        await self._cleanup_disconnected_connection(conn_id)
-                
-                await asyncio.sleep(30)  # Heartbeat a cada 30 segundos
-                
-            except Exception as e:
-                logger.error(f"Erro no heartbeat: {e}")
-                await asyncio.sleep(60)
+    async def _send_heartbeats(self):
+        """Heartbeat das conexões (job a cada 30 segundos)"""
+        for session in list(self.active_sessions.values()):
+            disconnected_connections = []
+            
+            for conn_id, websocket in list(session.websocket_connections.items()):
+                try:
+                    # Enviar ping
+                    await websocket.send_json({
+                        "type": "ping",
+                        "timestamp": datetime.now().isoformat()
+                    })
+                except:
+                    disconnected_connections.append(conn_id)
+            
+            # Limpar conexões perdidas
+            for conn_id in disconnected_connections:
+                await self._cleanup_disconnected_connection(conn_id)
     
     async def _cleanup_disconnected_connection(self, connection_id: str):
         """Limpar conexão desconectada"""
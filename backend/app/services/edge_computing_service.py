@@ -49,6 +49,7 @@ except ImportError:
 
 from app.logger import get_logger
 from app.config import get_settings
+from app.core.scheduler import get_scheduler
 
 logger = get_logger("edge_computing_service")
 settings = get_settings()
@@ -329,6 +330,7 @@ class EdgeTaskScheduler:
         self.active_tasks: Dict[str, EdgeTask] = {}
         self.completed_tasks: Dict[str, EdgeTask] = {}
         self.scheduler_running = False
+        self._consumer_task: Optional[asyncio.Task] = None
         
         logger.info("✅ Edge Task Scheduler inicializado")
     
@@ -357,27 +359,27 @@ class EdgeTaskScheduler:
             return
         
         self.scheduler_running = True
-        asyncio.create_task(self._scheduler_loop())
+        self._consumer_task = asyncio.create_task(self._scheduler_loop())
         logger.info("🚀 Edge Task Scheduler iniciado")
     
+    async def stop_scheduler(self):
+        """Parar o agendador de tarefas"""
+        self.scheduler_running = False
+        if self._consumer_task is not None:
+            self._consumer_task.cancel()
+            self._consumer_task = None
+    
     async def _scheduler_loop(self):
-        """Loop principal do agendador"""
+        """Consumidor da fila de prioridade (acorda só quando há tarefa)"""
         while self.scheduler_running:
+            # Aguardar próxima tarefa na fila
+            priority, timestamp, task = await self.task_queue.get()
+            
             try:
-                # Aguardar próxima tarefa na fila
-                priority, timestamp, task = await asyncio.wait_for(
-                    self.task_queue.get(), timeout=1.0
-                )
-                
                 # Atribuir tarefa a um nó
                 await self._assign_task_to_node(task)
-                
-            except asyncio.TimeoutError:
-                # Timeout normal - continuar loop
-                continue
             except Exception as e:
                 logger.error(f"Erro no scheduler loop: {e}")
-                await asyncio.sleep(1)
     
     async def _assign_task_to_node(self, task: EdgeTask):
         """Atribuir tarefa a um nó específico"""
@@ -646,8 +648,8 @@ class EdgeComputingService:
             # Iniciar agendador de tarefas
             await self.task_scheduler.start_scheduler()
             
-            # Iniciar monitoramento
-            asyncio.create_task(self._monitoring_loop())
+            # Iniciar monitoramento no agendador compartilhado
+            get_scheduler().add_job("edge.monitoring", self._monitoring_cycle, interval=30, jitter=3)
             self.monitoring_active = True
             
             logger.info("🚀 Edge Computing Service totalmente iniciado")
@@ -726,23 +728,14 @@ class EdgeComputingService:
         
         return optimizations
     
-    async def _monitoring_loop(self):
-        """Loop de monitoramento do sistema edge"""
-        while self.monitoring_active:
-            try:
-                # Atualizar métricas de todos os nós
-                for node_id in self.node_manager.nodes:
-                    await self._update_node_metrics(node_id)
-                
-                # Calcular métricas globais
-                await self._calculate_global_metrics()
-                
-                # Aguardar próximo ciclo
-                await asyncio.sleep(30)  # Monitor a cada 30 segundos
-                
-            except Exception as e:
-                logger.error(f"Erro no monitoring loop: {e}")
-                await asyncio.sleep(10)
+    async def _monitoring_cycle(self):
+        """Ciclo de monitoramento do sistema edge (job a cada 30 segundos)"""
+        # Atualizar métricas de todos os nós
+        for node_id in list(self.node_manager.nodes):
+            await self._update_node_metrics(node_id)
+        
+        # Calcular métricas globais
+        await self._calculate_global_metrics()
     
     async def _update_node_metrics(self, node_id: str):
         """Atualizar métricas de um nó específico"""
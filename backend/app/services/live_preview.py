@@ -0,0 +1,622 @@
+"""
+Preview Incremental em Tempo Real - TecnoCursos AI
+Modelo de camadas retidas: cada elemento é rasterizado uma vez e, a cada
+alteração, só a região afetada do quadro é recomposta e enviada ao cliente.
+
+Protocolo binário (uma mensagem WebSocket por atualização):
+    [4 bytes big-endian: tamanho do cabeçalho][cabeçalho JSON][regiões JPEG]
+O cabeçalho lista as regiões com `x`, `y`, `width`, `height`, `offset` e
+`length` (posição dos bytes da região logo após o cabeçalho).
+"""
+
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import logging
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from PIL import Image, ImageDraw, ImageFont
+
+logger = logging.getLogger(__name__)
+
+# (x0, y0, x1, y1) com x1/y1 exclusivos
+Box = Tuple[int, int, int, int]
+
+REFERENCE_SIZE = (1920, 1080)  # coordenadas do editor
+REGION_ALIGN = 16  # alinhamento aos blocos JPEG (MCU 16x16 em 4:2:0)
+FULL_FRAME_RATIO = 0.6  # acima disso é mais barato reenviar o quadro inteiro
+REGION_QUALITY = 80
+TITLE_LAYER_ID = "__title__"
+
+
+def hex_to_rgb(hex_color: str) -> tuple:
+    """Converter cor hex para RGB"""
+    if hex_color.startswith("#"):
+        hex_color = hex_color[1:]
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+
+def _digest(payload: Any) -> str:
+    data_str = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.md5(data_str.encode()).hexdigest()
+
+
+def element_key(element: Dict[str, Any]) -> str:
+    """
+    Chave da camada rasterizada de um elemento.
+
+    Ignora posição e id: arrastar um elemento reaproveita a mesma camada.
+    Inclui a data de modificação do asset para invalidar ao trocar o arquivo.
+    """
+    visual = {k: v for k, v in element.items() if k not in ("x", "y", "id")}
+    asset_path = element.get("asset_path")
+    if asset_path:
+        try:
+            visual["_asset_mtime"] = os.stat(asset_path).st_mtime_ns
+        except OSError:
+            visual["_asset_mtime"] = None
+    return _digest(visual)
+
+
+# ============================================================================
+# RASTERIZAÇÃO DAS CAMADAS
+# ============================================================================
+
+def _scale(element: Dict[str, Any], preview_size: Tuple[int, int]) -> Tuple[int, int, int, int]:
+    x = int(element.get("x", 0) * preview_size[0] / REFERENCE_SIZE[0])
+    y = int(element.get("y", 0) * preview_size[1] / REFERENCE_SIZE[1])
+    width = int(element.get("width", 100) * preview_size[0] / REFERENCE_SIZE[0])
+    height = int(element.get("height", 50) * preview_size[1] / REFERENCE_SIZE[1])
+    return x, y, max(1, width), max(1, height)
+
+
+def _text_extent(origin: Tuple[int, int], text: str, font) -> Tuple[int, int]:
+    probe = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+    bbox = probe.textbbox(origin, text, font=font)
+    return bbox[2], bbox[3]
+
+
+def rasterize_element(element: Dict[str, Any], preview_size: Tuple[int, int]) -> Optional[Image.Image]:
+    """
+    Rasterizar um elemento em uma camada RGBA com origem no canto do elemento.
+
+    Returns:
+        Image.Image ou None para tipos sem representação visual
+    """
+    element_type = element.get("type", "unknown")
+    _, _, width, height = _scale(element, preview_size)
+
+    if element_type == "image":
+        # Tentar carregar imagem real
+        asset_path = element.get("asset_path")
+        if asset_path and os.path.exists(asset_path):
+            try:
+                with Image.open(asset_path) as source:
+                    return source.convert("RGBA").resize((width, height))
+            except Exception as e:
+                logger.debug(f"Falha ao carregar asset do preview: {e}")
+
+        # Fallback: retângulo colorido
+        layer = Image.new("RGBA", (width + 1, height + 1), (0, 0, 0, 0))
+        ImageDraw.Draw(layer).rectangle([0, 0, width, height], fill="#10b981", outline="#059669")
+        return layer
+
+    if element_type == "video":
+        layer = Image.new("RGBA", (width + 1, height + 1), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(layer)
+        draw.rectangle([0, 0, width, height], fill="#8b5cf6", outline="#7c3aed")
+        # Ícone de play
+        play_x = width // 2 - 8
+        play_y = height // 2 - 8
+        draw.polygon([(play_x, play_y), (play_x + 16, play_y + 8), (play_x, play_y + 16)], fill="white")
+        return layer
+
+    if element_type == "text":
+        text = str(element.get("text", "Texto"))[:10]
+        font = ImageFont.load_default()
+        # O texto pode ultrapassar o retângulo; a camada cobre os dois
+        text_right, text_bottom = _text_extent((5, 5), text, font)
+        layer = Image.new("RGBA", (max(width + 1, text_right), max(height + 1, text_bottom)), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(layer)
+        draw.rectangle([0, 0, width, height], fill="#f59e0b", outline="#d97706")
+        draw.text((5, 5), text, fill="white", font=font)
+        return layer
+
+    if element_type == "audio":
+        layer = Image.new("RGBA", (width + 1, height + 1), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(layer)
+        draw.rectangle([0, 0, width, height], fill="#ef4444", outline="#dc2626")
+        # Ondas sonoras
+        for i in range(3):
+            wave_x = 5 + i * 5
+            draw.line([(wave_x, 5), (wave_x, height - 5)], fill="white", width=2)
+        return layer
+
+    return None
+
+
+def rasterize_title(title: str, preview_size: Tuple[int, int]) -> Tuple[Image.Image, Tuple[int, int]]:
+    """Rasterizar o título (centralizado na parte inferior) e sua posição no quadro"""
+    font = ImageFont.load_default()
+    probe = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+    text_bbox = probe.textbbox((0, 0), title, font=font)
+    text_width = text_bbox[2] - text_bbox[0]
+    text_height = text_bbox[3] - text_bbox[1]
+
+    x = (preview_size[0] - text_width) // 2
+    y = preview_size[1] - text_height - 20
+
+    text_right, text_bottom = _text_extent((5, 5), title, font)
+    layer = Image.new(
+        "RGBA",
+        (max(text_width + 11, text_right), max(text_height + 11, text_bottom)),
+        (0, 0, 0, 0)
+    )
+    draw = ImageDraw.Draw(layer)
+    # Fundo semi-transparente para o texto
+    draw.rectangle([0, 0, text_width + 10, text_height + 10], fill=(0, 0, 0, 128))
+    draw.text((5, 5), title, fill="white", font=font)
+    return layer, (x - 5, y - 5)
+
+
+def render_background(preview_size: Tuple[int, int], background_color: str) -> Image.Image:
+    """Fundo com gradiente sutil (RGBA)"""
+    base_rgb = hex_to_rgb(background_color)
+    img = Image.new("RGB", preview_size, base_rgb)
+    draw = ImageDraw.Draw(img)
+    width, height = preview_size
+    for i in range(height // 2):
+        alpha = i / (height // 2) * 0.1
+        color = tuple(max(0, min(255, int(c * (1 + alpha)))) for c in base_rgb)
+        draw.line([(0, i), (width, i)], fill=color)
+    return img.convert("RGBA")
+
+
+def _layer_bytes(value: Any) -> int:
+    """Bytes de uma camada (imagem ou (imagem, posição)) em memória"""
+    image = value[0] if isinstance(value, tuple) else value
+    if not isinstance(image, Image.Image):
+        return 0
+    return image.width * image.height * len(image.getbands())
+
+
+class LayerCache:
+    """
+    LRU de camadas rasterizadas, compartilhado entre sessões.
+
+    Limitado pelo total de bytes das imagens (w * h * bandas) e pelo número
+    de entradas; uma camada maior que o orçamento inteiro não é guardada.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, max_entries: int = 512):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._layers: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_create(self, key: str, factory: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._layers:
+                self._layers.move_to_end(key)
+                self.hits += 1
+                return self._layers[key][0]
+            self.misses += 1
+
+        value = factory()
+        size = _layer_bytes(value)
+        if size > self.max_bytes:
+            return value
+
+        with self._lock:
+            previous = self._layers.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._layers[key] = (value, size)
+            self._bytes += size
+            while self._layers and (self._bytes > self.max_bytes or len(self._layers) > self.max_entries):
+                _, (_, old_size) = self._layers.popitem(last=False)
+                self._bytes -= old_size
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._layers.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "layers": len(self._layers), "bytes": self._bytes, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+            }
+
+
+# ============================================================================
+# REGIÕES SUJAS
+# ============================================================================
+
+def _clip(box: Box, size: Tuple[int, int]) -> Optional[Box]:
+    x0, y0 = max(0, box[0]), max(0, box[1])
+    x1, y1 = min(size[0], box[2]), min(size[1], box[3])
+    if x0 >= x1 or y0 >= y1:
+        return None
+    return x0, y0, x1, y1
+
+
+def _align(box: Box, size: Tuple[int, int]) -> Box:
+    x0 = box[0] - box[0] % REGION_ALIGN
+    y0 = box[1] - box[1] % REGION_ALIGN
+    x1 = min(size[0], -(-box[2] // REGION_ALIGN) * REGION_ALIGN)
+    y1 = min(size[1], -(-box[3] // REGION_ALIGN) * REGION_ALIGN)
+    return x0, y0, x1, y1
+
+
+def _touches(a: Box, b: Box) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _area(box: Box) -> int:
+    return (box[2] - box[0]) * (box[3] - box[1])
+
+
+def merge_regions(boxes: List[Box], size: Tuple[int, int]) -> List[Box]:
+    """
+    Recorta, alinha e une regiões sobrepostas.
+
+    Se a área total passar de `FULL_FRAME_RATIO` do quadro, retorna o
+    quadro inteiro (uma imagem maior sai mais barata que muitas pequenas).
+    """
+    regions = []
+    for box in boxes:
+        clipped = _clip(box, size)
+        if clipped:
+            regions.append(_align(clipped, size))
+
+    merged = True
+    while merged:
+        merged = False
+        for i in range(len(regions)):
+            for j in range(i + 1, len(regions)):
+                if _touches(regions[i], regions[j]):
+                    a, b = regions[i], regions.pop(j)
+                    regions[i] = (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+                    merged = True
+                    break
+            if merged:
+                break
+
+    if sum(_area(box) for box in regions) >= FULL_FRAME_RATIO * size[0] * size[1]:
+        return [(0, 0, size[0], size[1])]
+    return regions
+
+
+@dataclass
+class Layer:
+    """Camada posicionada no quadro"""
+    layer_id: str
+    key: str
+    image: Image.Image
+    box: Box
+
+
+def diff_layers(old: List[Layer], new: List[Layer]) -> List[Box]:
+    """
+    Regiões afetadas entre duas listas de camadas (ordem = eixo z).
+
+    Uma camada suja a caixa antiga e a nova quando muda de conteúdo, de
+    posição ou de ordem relativa às demais; camadas novas/removidas sujam
+    apenas a própria caixa.
+    """
+    old_by_id = {layer.layer_id: layer for layer in old}
+    new_ids = {layer.layer_id for layer in new}
+
+    common_old = [layer.layer_id for layer in old if layer.layer_id in new_ids]
+    common_new = [layer.layer_id for layer in new if layer.layer_id in old_by_id]
+    rank_old = {layer_id: i for i, layer_id in enumerate(common_old)}
+    rank_new = {layer_id: i for i, layer_id in enumerate(common_new)}
+
+    dirty: List[Box] = []
+    for layer in new:
+        previous = old_by_id.get(layer.layer_id)
+        if previous is None:
+            dirty.append(layer.box)
+        elif (previous.key != layer.key or previous.box != layer.box
+              or rank_old[layer.layer_id] != rank_new[layer.layer_id]):
+            dirty.extend((previous.box, layer.box))
+
+    dirty.extend(layer.box for layer in old if layer.layer_id not in new_ids)
+    return dirty
+
+
+# ============================================================================
+# COMPOSITOR
+# ============================================================================
+
+class SceneCompositor:
+    """
+    Mantém o quadro composto de uma cena e recompõe só o que mudou.
+
+    Não é thread-safe: cada compositor deve ser usado por uma tarefa de
+    cada vez (o `LayerCache` compartilhado, por sua vez, é).
+    """
+
+    def __init__(self, preview_size: Tuple[int, int] = (640, 360),
+                 default_background: str = "#1a202c",
+                 layer_cache: Optional[LayerCache] = None):
+        self.size = preview_size
+        self.default_background = default_background
+        self.layer_cache = layer_cache or get_layer_cache()
+
+        self.frame: Optional[Image.Image] = None
+        self.version = 0
+        self._background_color: Optional[str] = None
+        self._background: Optional[Image.Image] = None
+        self._layers: List[Layer] = []
+
+    def build_layers(self, scene_data: Dict[str, Any]) -> List[Layer]:
+        """Camadas da cena, reaproveitando rasterizações em cache"""
+        layers: List[Layer] = []
+        seen = set()
+
+        for index, element in enumerate(scene_data.get("elements", []) or []):
+            if not isinstance(element, dict):
+                continue
+            key = element_key(element)
+            image = self.layer_cache.get_or_create(
+                f"el:{self.size[0]}x{self.size[1]}:{key}",
+                lambda element=element: rasterize_element(element, self.size)
+            )
+            if image is None:
+                continue
+
+            layer_id = str(element.get("id", f"#{index}"))
+            if layer_id in seen:
+                layer_id = f"{layer_id}#{index}"
+            seen.add(layer_id)
+
+            x, y, _, _ = _scale(element, self.size)
+            layers.append(Layer(layer_id, key, image, (x, y, x + image.width, y + image.height)))
+
+        title = scene_data.get("title", "")
+        if title:
+            key = _digest(["title", title])
+            image, (x, y) = self.layer_cache.get_or_create(
+                f"title:{self.size[0]}x{self.size[1]}:{key}",
+                lambda: rasterize_title(title, self.size)
+            )
+            layers.append(Layer(TITLE_LAYER_ID, key, image, (x, y, x + image.width, y + image.height)))
+
+        return layers
+
+    def update(self, scene_data: Dict[str, Any]) -> List[Box]:
+        """
+        Aplica o novo estado da cena e recompõe as regiões afetadas.
+
+        Returns:
+            Lista de regiões (já alinhadas e unidas) que mudaram no quadro
+        """
+        background_color = scene_data.get("background_color") or self.default_background
+        layers = self.build_layers(scene_data)
+
+        if self.frame is None or background_color != self._background_color:
+            self._background_color = background_color
+            self._background = self.layer_cache.get_or_create(
+                f"bg:{self.size[0]}x{self.size[1]}:{background_color}",
+                lambda: render_background(self.size, background_color)
+            )
+            self.frame = Image.new("RGB", self.size)
+            dirty = [(0, 0, self.size[0], self.size[1])]
+        else:
+            dirty = merge_regions(diff_layers(self._layers, layers), self.size)
+
+        self._layers = layers
+        for box in dirty:
+            self._composite(box)
+        if dirty:
+            self.version += 1
+        return dirty
+
+    def _composite(self, box: Box) -> None:
+        region = self._background.crop(box)
+        for layer in self._layers:
+            ix0, iy0 = max(box[0], layer.box[0]), max(box[1], layer.box[1])
+            ix1, iy1 = min(box[2], layer.box[2]), min(box[3], layer.box[3])
+            if ix0 >= ix1 or iy0 >= iy1:
+                continue
+            region.alpha_composite(
+                layer.image,
+                dest=(ix0 - box[0], iy0 - box[1]),
+                source=(ix0 - layer.box[0], iy0 - layer.box[1], ix1 - layer.box[0], iy1 - layer.box[1])
+            )
+        self.frame.paste(region.convert("RGB"), box[:2])
+
+    def encode_region(self, box: Box, quality: int = REGION_QUALITY) -> bytes:
+        buffer = io.BytesIO()
+        self.frame.crop(box).save(buffer, format="JPEG", quality=quality)
+        return buffer.getvalue()
+
+
+def encode_patch(header: Dict[str, Any], blobs: List[bytes], binary: bool = True) -> Union[bytes, str]:
+    """
+    Serializa uma atualização incremental.
+
+    Binário: prefixo com o tamanho do cabeçalho, cabeçalho JSON e os bytes
+    das regiões concatenados. Texto: JSON com cada região em base64.
+    """
+    regions = header["regions"]
+    if not binary:
+        for region, blob in zip(regions, blobs):
+            region["image"] = f"data:image/jpeg;base64,{base64.b64encode(blob).decode()}"
+        return json.dumps(header)
+
+    offset = 0
+    for region, blob in zip(regions, blobs):
+        region["offset"] = offset
+        region["length"] = len(blob)
+        offset += len(blob)
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    return struct.pack(">I", len(header_bytes)) + header_bytes + b"".join(blobs)
+
+
+def decode_patch(message: bytes) -> Tuple[Dict[str, Any], List[bytes]]:
+    """Inverso de `encode_patch` (formato binário)"""
+    (header_length,) = struct.unpack(">I", message[:4])
+    header = json.loads(message[4:4 + header_length])
+    body = message[4 + header_length:]
+    blobs = [body[r["offset"]:r["offset"] + r["length"]] for r in header["regions"]]
+    return header, blobs
+
+
+# ============================================================================
+# SESSÃO AO VIVO (POR CONEXÃO)
+# ============================================================================
+
+class LivePreviewSession:
+    """
+    Estado de preview incremental de uma conexão WebSocket.
+
+    Atualizações recebidas enquanto um quadro está sendo composto substituem
+    a pendente da mesma cena (a mais recente vence), então a taxa de envio
+    se ajusta sozinha ao custo de renderização em vez de acumular fila.
+    """
+
+    def __init__(self, send: Callable[[Union[bytes, str]], Awaitable[None]],
+                 executor=None, preview_size: Tuple[int, int] = (640, 360),
+                 default_background: str = "#1a202c", binary: bool = True):
+        self._send = send
+        self._executor = executor
+        self.preview_size = preview_size
+        self.default_background = default_background
+        self.binary = binary
+
+        self._scenes: Dict[str, Dict[str, Any]] = {}
+        self._compositors: Dict[str, SceneCompositor] = {}
+        self._pending: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.frames_sent = 0
+
+    @staticmethod
+    def _scene_key(scene_id: Any) -> str:
+        return str(scene_id) if scene_id is not None else "default"
+
+    def submit_scene(self, scene_data: Dict[str, Any]) -> None:
+        """Substituir o estado completo de uma cena"""
+        key = self._scene_key(scene_data.get("id"))
+        self._scenes[key] = dict(scene_data)
+        self._schedule(key)
+
+    def submit_element(self, scene_id: Any, element: Dict[str, Any], remove: bool = False) -> bool:
+        """
+        Alterar um único elemento (mesclado pelo `id`) de uma cena já enviada.
+
+        Returns:
+            bool: False se a cena ainda não foi enviada por `submit_scene`
+        """
+        key = self._scene_key(scene_id)
+        scene = self._scenes.get(key)
+        if scene is None or element.get("id") is None:
+            return False
+
+        # Cópia na escrita: o quadro anterior pode estar sendo composto em outra thread
+        elements = []
+        found = False
+        for current in scene.get("elements", []) or []:
+            if isinstance(current, dict) and current.get("id") == element["id"]:
+                found = True
+                if not remove:
+                    elements.append({**current, **element})
+            else:
+                elements.append(current)
+        if not found and not remove:
+            elements.append(dict(element))
+
+        self._scenes[key] = {**scene, "elements": elements}
+        self._schedule(key)
+        return True
+
+    def _schedule(self, key: str) -> None:
+        self._pending[key] = self._scenes[key]
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._pending:
+                key, scene = self._pending.popitem(last=False)
+                compositor = self._compositors.get(key)
+                if compositor is None:
+                    compositor = SceneCompositor(self.preview_size, self.default_background)
+                    self._compositors[key] = compositor
+                try:
+                    message = await loop.run_in_executor(self._executor, self.render_patch, compositor, scene)
+                    if message is not None:
+                        await self._send(message)
+                        self.frames_sent += 1
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Erro no preview incremental da cena {key}: {e}")
+
+    def render_patch(self, compositor: SceneCompositor, scene: Dict[str, Any]) -> Optional[Union[bytes, str]]:
+        """Compor a cena e serializar só as regiões alteradas"""
+        started = time.perf_counter()
+        dirty = compositor.update(scene)
+        if not dirty:
+            return None
+
+        blobs = [compositor.encode_region(box) for box in dirty]
+        header = {
+            "type": "preview_patch",
+            "scene_id": scene.get("id"),
+            "version": compositor.version,
+            "width": compositor.size[0],
+            "height": compositor.size[1],
+            "full": dirty == [(0, 0, compositor.size[0], compositor.size[1])],
+            "regions": [
+                {"x": box[0], "y": box[1], "width": box[2] - box[0], "height": box[3] - box[1],
+                 "content_type": "image/jpeg"}
+                for box in dirty
+            ],
+            "render_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+        return encode_patch(header, blobs, binary=self.binary)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._pending.clear()
+        self._compositors.clear()
+
+
+# Instância global do cache de camadas
+_layer_cache: Optional[LayerCache] = None
+
+
+def get_layer_cache() -> LayerCache:
+    """Obter o cache global de camadas rasterizadas"""
+    global _layer_cache
+    if _layer_cache is None:
+        _layer_cache = LayerCache()
+    return _layer_cache
@@ -35,6 +35,8 @@ import logging
 from pathlib import Path
 import os
 
+from app.core.scheduler import get_scheduler
+
 try:
     import requests
     HTTP_AVAILABLE = True
@@ -1021,38 +1023,32 @@ class PerformanceMonitoringService:
         # Iniciar coleta de métricas
         self.collector.start_collection()
         
-        # Iniciar loop de análise
-        asyncio.create_task(self._monitoring_loop())
+        # Análise periódica no agendador compartilhado
+        get_scheduler().add_job("performance.analysis", self._run_analysis,
+                                interval=self.monitoring_interval, jitter=3)
         
         logger.info("🚀 Monitoramento de performance iniciado")
     
     def stop_monitoring(self):
         """Parar monitoramento de performance."""
         self.running = False
+        get_scheduler().remove_job("performance.analysis")
         self.collector.stop_collection()
         logger.info("⏹️ Monitoramento de performance parado")
     
-    async def _monitoring_loop(self):
-        """Loop principal de monitoramento."""
-        while self.running:
-            try:
-                # Analisar performance atual
-                snapshot = self.analyzer.analyze_current_performance()
-                
-                # Enviar alertas se necessário
-                await self._process_alerts(snapshot.active_alerts)
-                
-                # Aplicar otimizações automáticas
-                await self.optimizer.auto_optimize_system(snapshot)
-                
-                # Notificar via WebSocket se disponível
-                await self._send_performance_update(snapshot)
-                
-                await asyncio.sleep(self.monitoring_interval)
-                
-            except Exception as e:
-                logger.error(f"Erro no loop de monitoramento: {e}")
-                await asyncio.sleep(60)
+    async def _run_analysis(self):
+        """Ciclo de análise (job a cada `monitoring_interval` segundos)."""
+        # Analisar performance atual
+        snapshot = self.analyzer.analyze_current_performance()
+        
+        # Enviar alertas se necessário
+        await self._process_alerts(snapshot.active_alerts)
+        
+        # Aplicar otimizações automáticas
+        await self.optimizer.auto_optimize_system(snapshot)
+        
+        # Notificar via WebSocket se disponível
+        await self._send_performance_update(snapshot)
     
     async def _process_alerts(self, alerts: List[PerformanceAlert]):
         """Processar alertas de performance."""
@@ -0,0 +1,325 @@
+"""
+Canal de Presença para Colaboração - TecnoCursos AI
+Cursores e seleções coalescidos por usuário e enviados em lotes a taxa fixa
+
+Formato binário do quadro (little-endian):
+    cabeçalho: b"P", versão (u8), tick (u32), quantidade (u16)
+    entrada:   user_id (u32), x (f32), y (f32), flags (u8)
+               se flags & SELECTION: n (u16) e n ids (u8 tamanho + utf-8)
+"""
+
+import asyncio
+import json
+import struct
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+FRAME_MAGIC = b"P"
+FRAME_VERSION = 1
+
+FLAG_CURSOR = 0x01
+FLAG_SELECTION = 0x02
+
+_HEADER = struct.Struct("<cBIH")
+_ENTRY = struct.Struct("<IffB")
+_COUNT = struct.Struct("<H")
+
+Frame = Union[bytes, str]
+
+# Subprotocolo (Sec-WebSocket-Protocol) com que o cliente pede quadros binários
+BINARY_PRESENCE_SUBPROTOCOL = "tecnocursos.presence.v1"
+
+
+def negotiate_presence_format(presence: Optional[str] = None,
+                              subprotocols: Optional[List[str]] = None) -> Tuple[bool, Optional[str]]:
+    """
+    Escolhe o formato de presença de uma conexão.
+
+    O padrão é JSON, que qualquer cliente entende; quadros binários só são
+    enviados a quem os pede com `?presence=binary` ou com o subprotocolo
+    BINARY_PRESENCE_SUBPROTOCOL.
+
+    Returns:
+        Tuple[bool, Optional[str]]: (binário, subprotocolo a aceitar no handshake)
+    """
+    if subprotocols and BINARY_PRESENCE_SUBPROTOCOL in subprotocols:
+        return True, BINARY_PRESENCE_SUBPROTOCOL
+    return (presence or "").strip().lower() == "binary", None
+
+
+@dataclass
+class PresenceUpdate:
+    """Estado de presença pendente de um usuário (o mais recente vence)"""
+    user_id: int
+    x: float = 0.0
+    y: float = 0.0
+    selection: Optional[List[str]] = None
+    flags: int = 0
+
+    def merge(self, other: "PresenceUpdate") -> None:
+        """Incorporar atualização mais nova sem perder campos não reenviados"""
+        if other.flags & FLAG_CURSOR:
+            self.x, self.y = other.x, other.y
+        if other.flags & FLAG_SELECTION:
+            self.selection = other.selection
+        self.flags |= other.flags
+
+    def copy(self) -> "PresenceUpdate":
+        return PresenceUpdate(self.user_id, self.x, self.y, self.selection, self.flags)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"id": self.user_id}
+        if self.flags & FLAG_CURSOR:
+            data["x"], data["y"] = self.x, self.y
+        if self.flags & FLAG_SELECTION:
+            data["sel"] = self.selection or []
+        return data
+
+
+def encode_presence_frame(tick: int, updates: List[PresenceUpdate]) -> bytes:
+    """Serializar lote de atualizações no formato binário compacto"""
+    parts = [_HEADER.pack(FRAME_MAGIC, FRAME_VERSION, tick & 0xFFFFFFFF, len(updates))]
+    for update in updates:
+        parts.append(_ENTRY.pack(update.user_id, update.x, update.y, update.flags))
+        if update.flags & FLAG_SELECTION:
+            selection = (update.selection or [])[:0xFFFF]
+            parts.append(_COUNT.pack(len(selection)))
+            for element_id in selection:
+                raw = str(element_id).encode("utf-8")[:255]
+                parts.append(bytes((len(raw),)) + raw)
+    return b"".join(parts)
+
+
+def decode_presence_frame(frame: bytes) -> Tuple[int, List[PresenceUpdate]]:
+    """Decodificar quadro binário (usado em testes e clientes Python)"""
+    magic, version, tick, count = _HEADER.unpack_from(frame, 0)
+    if magic != FRAME_MAGIC or version != FRAME_VERSION:
+        raise ValueError("Quadro de presença inválido")
+
+    offset = _HEADER.size
+    updates = []
+    for _ in range(count):
+        user_id, x, y, flags = _ENTRY.unpack_from(frame, offset)
+        offset += _ENTRY.size
+        selection = None
+        if flags & FLAG_SELECTION:
+            (total,) = _COUNT.unpack_from(frame, offset)
+            offset += _COUNT.size
+            selection = []
+            for _ in range(total):
+                size = frame[offset]
+                selection.append(frame[offset + 1:offset + 1 + size].decode("utf-8"))
+                offset += 1 + size
+        updates.append(PresenceUpdate(user_id, x, y, selection, flags))
+    return tick, updates
+
+
+def encode_presence_json(tick: int, updates: List[PresenceUpdate]) -> str:
+    """Variante JSON compacta para clientes sem suporte a quadros binários"""
+    payload = {"type": "presence", "tick": tick, "users": [u.to_dict() for u in updates]}
+    return json.dumps(payload, separators=(",", ":"))
+
+
+@dataclass
+class PresenceStats:
+    """Contadores do canal de presença"""
+    updates_received: int = 0
+    updates_coalesced: int = 0
+    frames_sent: int = 0
+    bytes_sent: int = 0
+    sends_deferred: int = 0
+    send_failures: int = 0
+
+
+@dataclass
+class _Connection:
+    websocket: Any
+    user_id: int
+    binary: bool
+    outbox: Dict[int, PresenceUpdate] = field(default_factory=dict)
+    sending: bool = False
+
+
+class PresenceChannel:
+    """
+    Canal de presença de uma sessão colaborativa.
+
+    Atualizações de cursor/seleção apenas sobrescrevem o estado pendente do
+    usuário; a cada tick um único quadro por conexão é montado com tudo o que
+    mudou desde o último envio. Conexões lentas não bloqueiam as demais: enquanto
+    um envio está em andamento, as mudanças seguintes se acumulam (coalescidas)
+    na caixa de saída daquela conexão.
+    """
+
+    def __init__(self, tick_rate: float = 15.0, send_timeout: float = 2.0,
+                 on_disconnect: Optional[Callable[[str], Awaitable[None]]] = None):
+        self.tick_interval = 1.0 / max(tick_rate, 1.0)
+        self.send_timeout = send_timeout
+        self.on_disconnect = on_disconnect
+        self.tick = 0
+        self.stats = PresenceStats()
+
+        self._pending: Dict[int, PresenceUpdate] = {}
+        self._connections: Dict[str, _Connection] = {}
+        self._sends: Set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # Conexões
+    # ------------------------------------------------------------------
+
+    def add_connection(self, connection_id: str, websocket: Any, user_id: int,
+                       binary: bool = True):
+        self._connections[connection_id] = _Connection(websocket, user_id, binary)
+
+    def remove_connection(self, connection_id: str):
+        self._connections.pop(connection_id, None)
+
+    def forget_user(self, user_id: int):
+        self._pending.pop(user_id, None)
+        for connection in self._connections.values():
+            connection.outbox.pop(user_id, None)
+
+    # ------------------------------------------------------------------
+    # Atualizações
+    # ------------------------------------------------------------------
+
+    def update_cursor(self, user_id: int, position: Dict[str, Any]):
+        self._push(PresenceUpdate(
+            user_id,
+            x=float(position.get("x", 0) or 0),
+            y=float(position.get("y", 0) or 0),
+            flags=FLAG_CURSOR
+        ))
+
+    def update_selection(self, user_id: int, elements: List[Any]):
+        self._push(PresenceUpdate(
+            user_id, selection=[str(e) for e in elements], flags=FLAG_SELECTION
+        ))
+
+    def _push(self, update: PresenceUpdate):
+        self.stats.updates_received += 1
+        current = self._pending.get(update.user_id)
+        if current is None:
+            self._pending[update.user_id] = update
+        else:
+            current.merge(update)
+            self.stats.updates_coalesced += 1
+
+    # ------------------------------------------------------------------
+    # Montagem e envio dos quadros
+    # ------------------------------------------------------------------
+
+    def collect(self) -> Dict[str, Frame]:
+        """Distribuir pendências nas caixas de saída e montar os quadros do tick"""
+        if self._pending:
+            pending, self._pending = self._pending, {}
+            for connection in self._connections.values():
+                for user_id, update in pending.items():
+                    if user_id == connection.user_id:
+                        continue
+                    queued = connection.outbox.get(user_id)
+                    if queued is None:
+                        connection.outbox[user_id] = update.copy()
+                    else:
+                        queued.merge(update)
+
+        frames: Dict[str, Frame] = {}
+        if not any(c.outbox for c in self._connections.values()):
+            return frames
+
+        self.tick += 1
+        for connection_id, connection in self._connections.items():
+            if not connection.outbox:
+                continue
+            if connection.sending:
+                self.stats.sends_deferred += 1
+                continue
+            updates = list(connection.outbox.values())
+            connection.outbox = {}
+            if connection.binary:
+                frames[connection_id] = encode_presence_frame(self.tick, updates)
+            else:
+                frames[connection_id] = encode_presence_json(self.tick, updates)
+        return frames
+
+    def flush(self) -> int:
+        """Disparar os envios do tick sem aguardá-los; retorna quadros enviados"""
+        frames = self.collect()
+        for connection_id, frame in frames.items():
+            connection = self._connections[connection_id]
+            connection.sending = True
+            task = asyncio.create_task(self._send(connection_id, connection, frame))
+            self._sends.add(task)
+            task.add_done_callback(self._sends.discard)
+        return len(frames)
+
+    async def _send(self, connection_id: str, connection: _Connection, frame: Frame):
+        try:
+            if isinstance(frame, bytes):
+                coro = connection.websocket.send_bytes(frame)
+            else:
+                coro = connection.websocket.send_text(frame)
+            await asyncio.wait_for(coro, timeout=self.send_timeout)
+            self.stats.frames_sent += 1
+            self.stats.bytes_sent += len(frame)
+        except Exception as e:
+            self.stats.send_failures += 1
+            logger.debug(f"Falha ao enviar presença para {connection_id}: {e}")
+            self.remove_connection(connection_id)
+            if self.on_disconnect:
+                await self.on_disconnect(connection_id)
+        finally:
+            connection.sending = False
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        for send in list(self._sends):
+            send.cancel()
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while True:
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Erro no tick de presença: {e}")
+            next_tick += self.tick_interval
+            delay = next_tick - loop.time()
+            if delay < 0:
+                # Atrasado (loop sobrecarregado): descartar ticks perdidos
+                next_tick = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "tick_hz": round(1.0 / self.tick_interval, 2),
+            "tick": self.tick,
+            "connections": len(self._connections),
+            "pending_users": len(self._pending),
+            "updates_received": self.stats.updates_received,
+            "updates_coalesced": self.stats.updates_coalesced,
+            "frames_sent": self.stats.frames_sent,
+            "bytes_sent": self.stats.bytes_sent,
+            "sends_deferred": self.stats.sends_deferred,
+            "send_failures": self.stats.send_failures,
+        }
@@ -0,0 +1,291 @@
+"""
+Cache de Previews - TecnoCursos AI
+LRU limitado por bytes com segundo nível em disco para imagens de preview
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+_EXTENSIONS = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/webp": "webp",
+}
+_CONTENT_TYPES = {ext: content_type for content_type, ext in _EXTENSIONS.items()}
+
+# Chaves são hashes hexadecimais; também impede path traversal no disco
+KEY_PATTERN = re.compile(r"^[0-9a-f]{16,64}$")
+
+
+def is_valid_key(key: str) -> bool:
+    """Verifica se a chave tem o formato de hash aceito pelo cache"""
+    return bool(KEY_PATTERN.match(key or ""))
+
+
+@dataclass
+class PreviewEntry:
+    """Preview renderizado (binário) com metadados para HTTP"""
+    key: str
+    data: bytes
+    content_type: str = "image/jpeg"
+    etag: str = field(default="")
+
+    def __post_init__(self):
+        if not self.etag:
+            self.etag = hashlib.sha1(self.data).hexdigest()[:20]
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    @property
+    def extension(self) -> str:
+        return _EXTENSIONS.get(self.content_type, "bin")
+
+
+@dataclass
+class PreviewCacheStats:
+    """Estatísticas do cache de previews"""
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    disk_evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.memory_hits + self.disk_hits + self.misses
+        return ((self.memory_hits + self.disk_hits) / total * 100) if total > 0 else 0.0
+
+
+class PreviewCache:
+    """
+    LRU em memória limitado pelo tamanho total em bytes.
+
+    Entradas expulsas da memória descem para um diretório em disco,
+    também limitado em bytes (remove os arquivos acessados há mais tempo).
+    Um acerto em disco promove a entrada de volta para a memória.
+
+    O nível em disco tem um índice LRU em memória (chave -> arquivo e
+    tamanho) com o total de bytes; o diretório só é listado na criação.
+    """
+
+    def __init__(self, max_memory_bytes: int = 64 * 1024 * 1024,
+                 disk_dir: Optional[Union[str, Path]] = None,
+                 max_disk_bytes: int = 512 * 1024 * 1024):
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+
+        self._entries: "OrderedDict[str, PreviewEntry]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_index: "OrderedDict[str, Tuple[Path, int]]" = OrderedDict()
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        self.stats = PreviewCacheStats()
+
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._load_disk_index()
+
+    # ------------------------------------------------------------------
+    # Operações principais
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, include_disk: bool = True) -> Optional[PreviewEntry]:
+        """
+        Busca uma entrada na memória e, se `include_disk`, no disco.
+
+        Com `include_disk=False` a chamada nunca bloqueia em I/O (útil no
+        event loop) e uma falta não é contabilizada nas estatísticas.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats.memory_hits += 1
+                return entry
+
+        if not include_disk:
+            return None
+
+        entry = self._read_disk(key)
+        if entry is None:
+            with self._lock:
+                self.stats.misses += 1
+            return None
+
+        with self._lock:
+            self.stats.disk_hits += 1
+        self.put(entry)
+        return entry
+
+    def put(self, entry: PreviewEntry) -> None:
+        if entry.size > self.max_memory_bytes:
+            # Grande demais para a memória: vai direto para o disco
+            self._write_disk(entry)
+            return
+
+        evicted = []
+        with self._lock:
+            previous = self._entries.pop(entry.key, None)
+            if previous is not None:
+                self._memory_bytes -= previous.size
+            self._entries[entry.key] = entry
+            self._memory_bytes += entry.size
+
+            while self._memory_bytes > self.max_memory_bytes and self._entries:
+                _, old = self._entries.popitem(last=False)
+                self._memory_bytes -= old.size
+                self.stats.evictions += 1
+                evicted.append(old)
+
+        for old in evicted:
+            self._write_disk(old)
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            if key in self._entries:
+                return True
+        return self._disk_path(key) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._memory_bytes = 0
+            self._disk_index.clear()
+            self._disk_bytes = 0
+        if self.disk_dir:
+            for path in self.disk_dir.iterdir():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        with self._lock:
+            memory_entries = len(self._entries)
+            memory_bytes = self._memory_bytes
+            disk_entries = len(self._disk_index)
+            disk_bytes = self._disk_bytes
+        return {
+            "memory_entries": memory_entries,
+            "memory_bytes": memory_bytes,
+            "max_memory_bytes": self.max_memory_bytes,
+            "disk_entries": disk_entries,
+            "disk_bytes": disk_bytes,
+            "max_disk_bytes": self.max_disk_bytes,
+            "memory_hits": self.stats.memory_hits,
+            "disk_hits": self.stats.disk_hits,
+            "misses": self.stats.misses,
+            "evictions": self.stats.evictions,
+            "disk_evictions": self.stats.disk_evictions,
+            "hit_rate": round(self.stats.hit_rate, 2),
+        }
+
+    # ------------------------------------------------------------------
+    # Nível em disco
+    # ------------------------------------------------------------------
+
+    def _load_disk_index(self) -> None:
+        """Lista o diretório uma única vez, do acesso mais antigo ao mais recente"""
+        files = []
+        for path in self.disk_dir.iterdir():
+            if path.suffix[1:] not in _CONTENT_TYPES or not is_valid_key(path.stem):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, path, stat.st_size))
+
+        stale = []
+        for _, path, size in sorted(files):
+            previous = self._disk_index.pop(path.stem, None)
+            if previous is not None:
+                # Mesma chave em outro formato: fica a gravação mais recente
+                self._disk_bytes -= previous[1]
+                stale.append(previous[0])
+            self._disk_index[path.stem] = (path, size)
+            self._disk_bytes += size
+        stale.extend(self._evict_disk())
+        self._unlink(stale)
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        if not self.disk_dir or not is_valid_key(key):
+            return None
+        with self._lock:
+            indexed = self._disk_index.get(key)
+        return indexed[0] if indexed else None
+
+    def _read_disk(self, key: str) -> Optional[PreviewEntry]:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            data = path.read_bytes()
+            os.utime(path)  # preserva a ordem de acesso entre reinícios
+        except OSError:
+            with self._lock:
+                indexed = self._disk_index.pop(key, None)
+                if indexed is not None:
+                    self._disk_bytes -= indexed[1]
+            return None
+        with self._lock:
+            if key in self._disk_index:
+                self._disk_index.move_to_end(key)
+        return PreviewEntry(key=key, data=data, content_type=_CONTENT_TYPES[path.suffix[1:]])
+
+    def _write_disk(self, entry: PreviewEntry) -> None:
+        if not self.disk_dir or entry.size > self.max_disk_bytes or not is_valid_key(entry.key):
+            return
+        path = self.disk_dir / f"{entry.key}.{entry.extension}"
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        try:
+            tmp_path.write_bytes(entry.data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Falha ao gravar preview em disco: {e}")
+            return
+
+        stale = []
+        with self._lock:
+            previous = self._disk_index.pop(entry.key, None)
+            if previous is not None:
+                self._disk_bytes -= previous[1]
+                if previous[0] != path:
+                    stale.append(previous[0])
+            self._disk_index[entry.key] = (path, entry.size)
+            self._disk_bytes += entry.size
+            stale.extend(self._evict_disk())
+        self._unlink(stale)
+
+    def _evict_disk(self) -> List[Path]:
+        """Tira do índice os arquivos mais antigos até caber no limite (com o lock)"""
+        evicted = []
+        while self._disk_bytes > self.max_disk_bytes and self._disk_index:
+            _, (path, size) = self._disk_index.popitem(last=False)
+            self._disk_bytes -= size
+            self.stats.disk_evictions += 1
+            evicted.append(path)
+        return evicted
+
+    @staticmethod
+    def _unlink(paths: List[Path]) -> None:
+        for path in paths:
+            try:
+                path.unlink()
+            except OSError:
+                pass
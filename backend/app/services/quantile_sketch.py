@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sketches de Quantis - TecnoCursos AI
+
+Estruturas de tamanho constante para percentis de latência (p50/p95/p99)
+sem guardar as amostras.
+
+Funcionalidades:
+- DDSketch: buckets logarítmicos com erro relativo garantido (padrão 1%),
+  registro O(1) e mescla exata entre sketches (soma de contadores)
+- WindowedSketch: sketches por intervalo de tempo em duas resoluções
+  (1 min na última hora, 15 min nas últimas 24h); uma janela arbitrária é
+  respondida mesclando os intervalos que ela cobre
+- Memória limitada por série: número fixo de intervalos x número máximo de
+  buckets por sketch
+
+Referência: Masson, Rim, Lee - "DDSketch: A Fast and Fully-Mergeable
+Quantile Sketch with Relative-Error Guarantees" (VLDB 2019).
+
+Autor: TecnoCursos AI System
+"""
+
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+# Valores abaixo disto (inclusive zero e negativos) vão para o bucket zero
+MIN_INDEXABLE_VALUE = 1e-9
+
+
+class DDSketch:
+    """
+    Sketch de quantis com erro relativo `relative_accuracy`.
+
+    Cada valor v > 0 cai no bucket ceil(log_gamma(v)), gamma = (1+a)/(1-a);
+    o quantil devolvido está a no máximo `a * v` do valor real. Quando há
+    mais de `max_buckets` buckets, os menores são colapsados (a precisão dos
+    quantis altos, que interessam para latência, é preservada).
+    """
+
+    __slots__ = ("relative_accuracy", "gamma", "_multiplier", "max_buckets",
+                 "bins", "zero_count", "count", "sum", "min", "max")
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy deve estar entre 0 e 1")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._multiplier = 1 / math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, weight: int = 1):
+        """Registra um valor (O(1))"""
+        if value > MIN_INDEXABLE_VALUE:
+            key = math.ceil(math.log(value) * self._multiplier)
+            bins = self.bins
+            if key in bins:
+                bins[key] += weight
+            else:
+                bins[key] = weight
+                if len(bins) > self.max_buckets:
+                    self._collapse()
+        else:
+            self.zero_count += weight
+        self.count += weight
+        self.sum += value * weight
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def _collapse(self):
+        """Junta os buckets mais baixos até voltar ao limite"""
+        keys = sorted(self.bins)
+        excess = len(keys) - self.max_buckets
+        target = keys[excess]
+        for key in keys[:excess]:
+            self.bins[target] += self.bins.pop(key)
+
+    def merge(self, other: "DDSketch"):
+        """Soma outro sketch a este (exige a mesma precisão)"""
+        if other.count == 0:
+            return
+        if other.gamma != self.gamma:
+            raise ValueError("Sketches com precisões diferentes não podem ser mesclados")
+        bins = self.bins
+        for key, count in other.bins.items():
+            bins[key] = bins.get(key, 0) + count
+        if len(bins) > self.max_buckets:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def copy(self) -> "DDSketch":
+        clone = DDSketch(self.relative_accuracy, self.max_buckets)
+        clone.merge(self)
+        return clone
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Valor aproximado do quantil q (0..1); None se vazio"""
+        if self.count == 0:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return max(self.min, 0.0)
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if rank < seen:
+                value = 2 * self.gamma ** key / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def quantiles(self, qs: Iterable[float]) -> List[Optional[float]]:
+        """Vários quantis com uma única ordenação dos buckets"""
+        qs = list(qs)
+        if self.count == 0:
+            return [None] * len(qs)
+        order = sorted(range(len(qs)), key=lambda i: qs[i])
+        results: List[Optional[float]] = [None] * len(qs)
+        keys = iter(sorted(self.bins))
+        seen = self.zero_count
+        value = max(self.min, 0.0)
+        for i in order:
+            q = qs[i]
+            if q <= 0:
+                results[i] = self.min
+                continue
+            if q >= 1:
+                results[i] = self.max
+                continue
+            rank = q * (self.count - 1)
+            while seen <= rank:
+                key = next(keys, None)
+                if key is None:
+                    value = self.max
+                    break
+                seen += self.bins[key]
+                value = min(max(2 * self.gamma ** key / (self.gamma + 1), self.min), self.max)
+            results[i] = value
+        return results
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def summary(self) -> Dict[str, float]:
+        """Resumo no formato usado pelos dashboards (vazio se não há dados)"""
+        if self.count == 0:
+            return {}
+        median, p95, p99 = self.quantiles((0.5, 0.95, 0.99))
+        return {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.sum / self.count,
+            "median": median,
+            "p95": p95,
+            "p99": p99,
+        }
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class WindowedSketch:
+    """
+    DDSketches por intervalo de tempo, em duas resoluções.
+
+    Cada valor vai só para o intervalo fino corrente; quando ele fecha, é
+    mesclado no intervalo grosso correspondente (custo amortizado de uma
+    mescla por minuto). Intervalos mais antigos que a retenção são
+    descartados no próprio registro. Janelas até `fine_retention` usam os
+    intervalos finos, as maiores os grossos mais o intervalo fino ainda
+    aberto; a borda da janela tem a granularidade do intervalo usado.
+    """
+
+    __slots__ = ("relative_accuracy", "max_buckets", "fine_seconds", "fine_retention",
+                 "coarse_seconds", "coarse_retention", "fine", "coarse", "_open_until")
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048,
+                 fine_seconds: int = 60, fine_retention: int = 3600,
+                 coarse_seconds: int = 900, coarse_retention: int = 86400):
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.fine_seconds = fine_seconds
+        self.fine_retention = fine_retention
+        self.coarse_seconds = coarse_seconds
+        self.coarse_retention = coarse_retention
+        self.fine: Deque[Tuple[int, DDSketch]] = deque()
+        self.coarse: Deque[Tuple[int, DDSketch]] = deque()
+        self._open_until = -math.inf  # fim do intervalo fino corrente
+
+    def add(self, value: float, timestamp: Optional[float] = None):
+        now = time.time() if timestamp is None else timestamp
+        fine = self.fine
+        if fine and fine[-1][0] <= now < self._open_until:
+            fine[-1][1].add(value)
+            return
+        start = int(now // self.fine_seconds) * self.fine_seconds
+        if fine and start < fine[-1][0]:
+            # Valor atrasado: intervalo fino já fechado (e já mesclado no grosso)
+            self._add_late(value, start)
+            return
+        self._rotate(start, now)
+        fine[-1][1].add(value)
+
+    def _new_sketch(self) -> DDSketch:
+        return DDSketch(self.relative_accuracy, self.max_buckets)
+
+    def _coarse_sketch(self, start: int) -> Optional[DDSketch]:
+        """Sketch grosso que contém `start` (criado se for o mais novo)"""
+        coarse_start = int(start // self.coarse_seconds) * self.coarse_seconds
+        for bucket_start, sketch in reversed(self.coarse):
+            if bucket_start == coarse_start:
+                return sketch
+            if bucket_start < coarse_start:
+                break
+        if self.coarse and coarse_start < self.coarse[-1][0]:
+            return None
+        sketch = self._new_sketch()
+        self.coarse.append((coarse_start, sketch))
+        return sketch
+
+    def _rotate(self, start: int, now: float):
+        """Fecha o intervalo fino corrente (mesclando no grosso) e abre `start`"""
+        fine = self.fine
+        if fine:
+            closed_start, closed = fine[-1]
+            target = self._coarse_sketch(closed_start)
+            if target is not None:
+                target.merge(closed)
+        fine.append((start, self._new_sketch()))
+        self._open_until = start + self.fine_seconds
+
+        cutoff = now - self.fine_retention
+        while fine and fine[0][0] + self.fine_seconds <= cutoff:
+            fine.popleft()
+        cutoff = now - self.coarse_retention
+        while self.coarse and self.coarse[0][0] + self.coarse_seconds <= cutoff:
+            self.coarse.popleft()
+
+    def _add_late(self, value: float, start: int):
+        for bucket_start, sketch in self.fine:
+            if bucket_start == start:
+                sketch.add(value)
+                break
+        target = self._coarse_sketch(start)
+        if target is not None:
+            target.add(value)
+
+    def intervals(self, window_seconds: Optional[float] = None,
+                  now: Optional[float] = None) -> List[Tuple[int, DDSketch]]:
+        """Intervalos (início, sketch) que cobrem a janela, do mais antigo ao mais novo"""
+        now = time.time() if now is None else now
+        if window_seconds is not None and window_seconds <= self.fine_retention:
+            cutoff = now - window_seconds
+            return [(start, sketch) for start, sketch in self.fine if start + self.fine_seconds > cutoff]
+
+        cutoff = now - (self.coarse_retention if window_seconds is None else window_seconds)
+        result = [(start, sketch) for start, sketch in self.coarse if start + self.coarse_seconds > cutoff]
+        if self.fine:
+            # O intervalo fino aberto ainda não foi mesclado no grosso
+            result.append(self.fine[-1])
+        return result
+
+    def merged(self, window_seconds: Optional[float] = None, now: Optional[float] = None) -> DDSketch:
+        """Um sketch com todos os valores da janela (None = toda a retenção)"""
+        result = self._new_sketch()
+        for _, sketch in self.intervals(window_seconds, now):
+            result.merge(sketch)
+        return result
+
+    def memory_buckets(self) -> int:
+        """Total de buckets em memória (para diagnóstico)"""
+        return sum(len(sketch.bins) + 1 for buckets in (self.fine, self.coarse) for _, sketch in buckets)
@@ -0,0 +1,180 @@
+"""
+Operações em Lote de Cenas - TecnoCursos AI
+Exclusão, duplicação, estilo e reordenação com SQL baseado em conjuntos
+
+Cada operação emite um número constante de comandos (DELETE/UPDATE ... IN,
+INSERT multi-linha/executemany, UPDATE por chave primária em lote),
+independente da quantidade de cenas. Nenhuma função faz commit: o chamador
+executa tudo em uma única transação.
+
+Comandos em massa não disparam os eventos do ORM; os índices de busca
+(FTS e `asset_tags`) são atualizados aqui, na mesma transação.
+"""
+
+import uuid
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Sequence
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models import Asset, Scene, SceneComment
+from app.services.scene_ordering import RANK_GAP, rebalance_project
+from app.services.search_index_service import (
+    index_assets, index_scenes, unindex_assets, unindex_scenes
+)
+
+logger = logging.getLogger(__name__)
+
+# Colunas copiadas na duplicação (mesmas do endpoint de duplicação individual)
+SCENE_COPY_COLUMNS = (
+    "texto", "duracao", "template_id", "template_version", "style_preset",
+    "background_color", "background_type", "background_config", "layout_type",
+    "layout_config", "aspect_ratio", "resolution", "transition_in", "transition_out",
+    "transition_duration", "animation_preset", "animation_config",
+)
+
+ASSET_COPY_COLUMNS = (
+    "project_id", "name", "description", "tipo", "subtipo", "caminho_arquivo",
+    "url_external", "file_size", "mime_type", "width", "height", "duration",
+    "posicao_x", "posicao_y", "escala", "rotacao", "opacidade", "camada",
+    "volume", "loop", "fade_in", "fade_out", "library_tags",
+)
+
+
+def bulk_delete_scenes(db: Session, scene_ids: Sequence[int]) -> int:
+    """Remove cenas, seus assets e comentários com um comando por tabela"""
+    if not scene_ids:
+        return 0
+    ids = list(scene_ids)
+    connection = db.connection()
+    unindex_assets(connection, select(Asset.id).where(Asset.scene_id.in_(ids)))
+    unindex_scenes(connection, ids)
+    db.execute(delete(Asset).where(Asset.scene_id.in_(ids)))
+    db.execute(delete(SceneComment).where(SceneComment.scene_id.in_(ids)))
+    db.execute(
+        update(Scene).where(Scene.parent_scene_id.in_(ids)).values(parent_scene_id=None)
+    )
+    result = db.execute(delete(Scene).where(Scene.id.in_(ids)))
+    return result.rowcount or 0
+
+
+def bulk_duplicate_scenes(db: Session, scenes: Iterable[Scene], user_id: int,
+                          name_suffix: str = " (Cópia)") -> Dict[int, int]:
+    """
+    Duplica cenas e seus assets.
+
+    Cópias são anexadas ao final de cada projeto, na ordem original.
+    Emite: 1 SELECT de ranks, 1 INSERT multi-linha de cenas (RETURNING),
+    1 SELECT de assets, 1 INSERT executemany de assets (RETURNING) e os
+    INSERT ... SELECT dos índices de busca.
+
+    Returns:
+        Mapa id original -> id da cópia
+    """
+    originals = sorted(scenes, key=lambda s: (s.project_id, s.ordem or 0, s.id))
+    if not originals:
+        return {}
+
+    project_ids = {scene.project_id for scene in originals}
+    next_rank = dict(db.execute(
+        select(Scene.project_id, func.max(Scene.ordem))
+        .where(Scene.project_id.in_(project_ids))
+        .group_by(Scene.project_id)
+    ).all())
+
+    scene_rows = []
+    for scene in originals:
+        rank = (next_rank.get(scene.project_id) or 0) + RANK_GAP
+        next_rank[scene.project_id] = rank
+        row = {column: getattr(scene, column) for column in SCENE_COPY_COLUMNS}
+        row.update(
+            uuid=str(uuid.uuid4()),
+            project_id=scene.project_id,
+            name=f"{scene.name}{name_suffix}",
+            ordem=rank,
+            created_by=user_id,
+            last_modified_by=user_id,
+            parent_scene_id=scene.id,
+            version=1,
+        )
+        scene_rows.append(row)
+
+    # INSERT multi-linha (insertmanyvalues); RETURNING associa cópia -> original
+    created = db.execute(
+        insert(Scene).returning(Scene.id, Scene.parent_scene_id), scene_rows
+    ).all()
+    copies = {original_id: new_id for new_id, original_id in created}
+
+    asset_columns = [getattr(Asset, column) for column in ASSET_COPY_COLUMNS]
+    asset_rows = []
+    for asset in db.execute(
+        select(Asset.id, Asset.scene_id, *asset_columns).where(Asset.scene_id.in_(list(copies)))
+    ).mappings():
+        row = {column: asset[column] for column in ASSET_COPY_COLUMNS}
+        row.update(
+            uuid=str(uuid.uuid4()),
+            scene_id=copies[asset["scene_id"]],
+            created_by=user_id,
+            parent_asset_id=asset["id"],
+            version=1,
+        )
+        asset_rows.append(row)
+
+    new_asset_ids = []
+    if asset_rows:
+        new_asset_ids = db.execute(insert(Asset).returning(Asset.id), asset_rows).scalars().all()
+
+    connection = db.connection()
+    index_scenes(connection, list(copies.values()))
+    index_assets(connection, new_asset_ids)
+
+    logger.debug(f"Duplicação em lote: {len(copies)} cenas, {len(asset_rows)} assets")
+    return copies
+
+
+def bulk_update_style(db: Session, scene_ids: Sequence[int], style_preset: str,
+                      user_id: int = None) -> int:
+    """Atualiza o estilo de várias cenas com um único UPDATE"""
+    if not scene_ids:
+        return 0
+    values = {"style_preset": style_preset, "updated_at": datetime.utcnow()}
+    if user_id is not None:
+        values["last_modified_by"] = user_id
+    result = db.execute(update(Scene).where(Scene.id.in_(list(scene_ids))).values(**values))
+    return result.rowcount or 0
+
+
+def bulk_reorder_scenes(db: Session, scenes: Iterable[Scene], new_orders: Dict[str, int]) -> int:
+    """
+    Reordena as cenas entre si.
+
+    Os ranks já ocupados pelas cenas de cada projeto são redistribuídos
+    conforme a ordem pedida em `new_orders` (id -> posição); as demais cenas
+    do projeto não são tocadas. Um único UPDATE em lote por chave primária.
+    """
+    by_project: Dict[int, List[Scene]] = defaultdict(list)
+    for scene in scenes:
+        if str(scene.id) in new_orders:
+            by_project[scene.project_id].append(scene)
+
+    now = datetime.utcnow()
+    mappings = []
+    for project_id, project_scenes in by_project.items():
+        ranks = {scene.id: scene.ordem or 0 for scene in project_scenes}
+        if len(set(ranks.values())) < len(ranks):
+            # Ranks repetidos (dados legados): renumerar o projeto antes
+            rebalance_project(db, project_id)
+            ranks = dict(db.execute(
+                select(Scene.id, Scene.ordem).where(Scene.id.in_(list(ranks)))
+            ).all())
+        slots = sorted(ranks.values())
+        requested = sorted(project_scenes, key=lambda s: (new_orders[str(s.id)], ranks[s.id], s.id))
+        for scene, rank in zip(requested, slots):
+            mappings.append({"id": scene.id, "ordem": rank, "updated_at": now})
+
+    if mappings:
+        db.execute(update(Scene), mappings)
+    return len(mappings)
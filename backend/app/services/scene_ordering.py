@@ -0,0 +1,116 @@
+"""
+Ordenação Esparsa de Cenas - TecnoCursos AI
+Ranks inteiros com intervalos para reordenar cenas alterando uma única linha
+
+`Scene.ordem` passa a ser um rank esparso (múltiplos de RANK_GAP): a ordem
+relativa continua sendo dada por (ordem, id), mas mover uma cena só reescreve
+a própria cena, recebendo o ponto médio entre os vizinhos. Quando não há mais
+espaço entre dois vizinhos o projeto é renumerado uma única vez.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.models import Scene
+
+logger = logging.getLogger(__name__)
+
+# Intervalo entre ranks consecutivos: ~10 movimentos para o mesmo ponto
+# antes de uma renumeração
+RANK_GAP = 1024
+
+
+@dataclass
+class SceneMove:
+    """Resultado de um movimento de cena"""
+    old_rank: int
+    new_rank: int
+    position: int
+    rebalanced: bool = False
+
+
+def next_scene_rank(db: Session, project_id: int) -> int:
+    """Rank para anexar uma cena ao final do projeto"""
+    max_rank = db.query(func.max(Scene.ordem)).filter(Scene.project_id == project_id).scalar()
+    return (max_rank or 0) + RANK_GAP
+
+
+def rank_between(before: Optional[int], after: Optional[int]) -> Optional[int]:
+    """
+    Rank estritamente entre dois vizinhos (None nas pontas).
+
+    Returns:
+        int ou None se não houver inteiro livre entre eles
+    """
+    low = before if before is not None else 0
+    if after is None:
+        return low + RANK_GAP
+    if after - low < 2:
+        return None
+    return (low + after) // 2
+
+
+def rebalance_project(db: Session, project_id: int) -> int:
+    """
+    Renumera as cenas do projeto em múltiplos de RANK_GAP, preservando a ordem.
+
+    Returns:
+        Número de cenas renumeradas
+    """
+    ids = db.execute(
+        select(Scene.id)
+        .where(Scene.project_id == project_id)
+        .order_by(Scene.ordem, Scene.id)
+    ).scalars().all()
+    if ids:
+        db.execute(
+            update(Scene),
+            [{"id": scene_id, "ordem": (index + 1) * RANK_GAP} for index, scene_id in enumerate(ids)]
+        )
+    logger.info(f"Ranks do projeto {project_id} renumerados: {len(ids)} cenas")
+    return len(ids)
+
+
+def _neighbor_ranks(db: Session, scene: Scene, position: int):
+    """Ranks das cenas que ficarão antes e depois da posição (1-based)"""
+    ranks = db.execute(
+        select(Scene.ordem)
+        .where(Scene.project_id == scene.project_id, Scene.id != scene.id)
+        .order_by(Scene.ordem, Scene.id)
+        .offset(max(position - 2, 0))
+        .limit(2)
+    ).scalars().all()
+    if position <= 1:
+        return None, ranks[0] if ranks else None
+    before = ranks[0] if ranks else None
+    after = ranks[1] if len(ranks) > 1 else None
+    return before, after
+
+
+def move_scene(db: Session, scene: Scene, position: int) -> SceneMove:
+    """
+    Move a cena para a posição (1-based) dentro do projeto.
+
+    Apenas a linha da cena é atualizada, exceto quando o intervalo entre os
+    vizinhos se esgota e o projeto precisa ser renumerado. Não faz commit.
+    """
+    total = db.query(func.count(Scene.id)).filter(Scene.project_id == scene.project_id).scalar()
+    position = max(1, min(position, total or 1))
+    old_rank = scene.ordem
+
+    before, after = _neighbor_ranks(db, scene, position)
+    new_rank = rank_between(before, after)
+    rebalanced = False
+    if new_rank is None:
+        rebalance_project(db, scene.project_id)
+        db.expire(scene, ["ordem"])
+        before, after = _neighbor_ranks(db, scene, position)
+        new_rank = rank_between(before, after)
+        rebalanced = True
+
+    scene.ordem = new_rank
+    return SceneMove(old_rank=old_rank, new_rank=new_rank, position=position, rebalanced=rebalanced)
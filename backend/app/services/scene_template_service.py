@@ -9,7 +9,7 @@ de cenas para criação rápida e eficiente de apresentações visuais.
 Funcionalidades:
 - Biblioteca de templates predefinidos
 - Templates customizados por usuário
-- Sistema de categorização e busca
+- Sistema de categorização e busca (catálogo imutável em memória)
 - Templates públicos e premium
 - Sistema de avaliação e favoritos
 - Aplicação automática de templates
@@ -27,6 +27,9 @@ from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 import uuid
+import time
+
+from app.services.template_catalog import CatalogRef, TemplateCatalog
 
 try:
     from sqlalchemy.orm import Session
@@ -60,6 +63,8 @@ class TemplateCategory(Enum):
     SOCIAL_MEDIA = "social_media"
     TUTORIAL = "tutorial"
     REPORT = "report"
+    TECH = "tech"
+    MINIMAL = "minimal"
 
 class TemplateStyle(Enum):
     """Estilos visuais dos templates"""
@@ -95,10 +100,22 @@ class SceneTemplateService:
     - Aplicação de templates a cenas
     - Sistema de busca e filtros
     - Avaliações e favoritos
+    
+    Listagens e leituras por id são respondidas por um catálogo imutável
+    (índices de categoria, estilo, tag e tokens), trocado atomicamente a
+    cada escrita e recarregado do banco após CATALOG_MAX_AGE segundos para
+    refletir escritas de outros processos.
     """
     
+    # Colunas JSON armazenadas como texto no modelo
+    JSON_COLUMNS = ('background_config', 'layout_config', 'template_data', 'default_assets', 'tags')
+    
+    # Idade máxima do catálogo antes de recarregar do banco (segundos)
+    CATALOG_MAX_AGE = 300
+    
     def __init__(self):
         self.predefined_templates = self._load_predefined_templates()
+        self.catalog: CatalogRef = CatalogRef()
         logger.info("✅ Scene Template Service inicializado")
     
     def _load_predefined_templates(self) -> Dict[str, TemplateConfig]:
@@ -304,6 +321,88 @@ class SceneTemplateService:
         
         return templates
     
+    # ------------------------------------------------------------------
+    # Catálogo em memória
+    # ------------------------------------------------------------------
+    
+    @classmethod
+    def _template_response(cls, template: "SceneTemplate") -> SceneTemplateResponse:
+        """Converte o modelo em resposta, decodificando as colunas JSON"""
+        data = {column.key: getattr(template, column.key) for column in SceneTemplate.__table__.columns}
+        for column in cls.JSON_COLUMNS:
+            if isinstance(data.get(column), str):
+                data[column] = json.loads(data[column])
+        return SceneTemplateResponse.model_validate(data)
+    
+    @staticmethod
+    def _catalog_order(template: SceneTemplateResponse):
+        """Featured primeiro, depois por rating, uso e data de criação"""
+        created = template.created_at.timestamp() if template.created_at else 0
+        return (
+            not template.is_featured,
+            template.rating_avg is None,
+            -(template.rating_avg or 0),
+            -(template.usage_count or 0),
+            -created,
+        )
+    
+    def _build_catalog(self, templates: List[SceneTemplateResponse]) -> TemplateCatalog:
+        return TemplateCatalog(
+            sorted(templates, key=self._catalog_order),
+            key=lambda t: t.id,
+            category=lambda t: t.category,
+            style=lambda t: t.style,
+            tags=lambda t: t.tags or (),
+            text=lambda t: (t.name, t.description),
+        )
+    
+    def load_catalog(self, db: Session = None) -> TemplateCatalog:
+        """Carrega todos os templates do banco e publica um novo catálogo"""
+        if not DATABASE_AVAILABLE:
+            catalog = self._build_catalog([])
+            self.catalog.swap(catalog)
+            return catalog
+        
+        if db is None:
+            db = get_db_session()
+        
+        try:
+            started = time.perf_counter()
+            catalog = self._build_catalog([
+                self._template_response(template) for template in db.query(SceneTemplate).all()
+            ])
+            self.catalog.swap(catalog)
+            logger.info(f"Catálogo de templates montado: {len(catalog)} templates "
+                        f"em {(time.perf_counter() - started) * 1000:.1f}ms")
+            return catalog
+        finally:
+            db.close()
+    
+    def get_catalog(self, db: Session = None) -> TemplateCatalog:
+        """Catálogo atual, recarregado se ausente ou mais velho que CATALOG_MAX_AGE"""
+        catalog = self.catalog.current
+        if catalog is None or time.time() - catalog.built_at > self.CATALOG_MAX_AGE:
+            catalog = self.load_catalog(db)
+        return catalog
+    
+    def _publish(self, template: SceneTemplateResponse):
+        """
+        Troca o catálogo por uma cópia com o template inserido/atualizado.
+
+        Sem catálogo carregado não há o que atualizar: o próximo
+        `get_catalog` lê todos os templates do banco.
+        """
+        self.catalog.update(
+            lambda catalog: catalog.with_record(template, sort_key=self._catalog_order)
+            if catalog is not None else None
+        )
+    
+    def _unpublish(self, template_id: int):
+        """Troca o catálogo por uma cópia sem o template"""
+        self.catalog.update(
+            lambda catalog: catalog.without(template_id) if catalog is not None else None
+        )
+    
     def create_template(self, template_data: SceneTemplateCreate, created_by: int, db: Session = None) -> SceneTemplateResponse:
         """Criar novo template."""
         if not DATABASE_AVAILABLE:
@@ -345,7 +444,9 @@ class SceneTemplateService:
             db.refresh(template)
             
             logger.info(f"Template criado: {template.name} por usuário {created_by}")
-            return SceneTemplateResponse.from_orm(template)
+            response = self._template_response(template)
+            self._publish(response)
+            return response
             
         except Exception as e:
             db.rollback()
@@ -355,17 +456,21 @@ class SceneTemplateService:
             db.close()
     
     def get_template(self, template_id: int, db: Session = None) -> Optional[SceneTemplateResponse]:
-        """Obter template por ID."""
+        """Obter template por ID (do catálogo em memória quando disponível)."""
         if not DATABASE_AVAILABLE:
             return None
         
+        catalog = self.catalog.current
+        if catalog is not None and time.time() - catalog.built_at <= self.CATALOG_MAX_AGE:
+            return catalog.get(template_id)
+        
         if db is None:
             db = get_db_session()
         
         try:
             template = db.query(SceneTemplate).filter(SceneTemplate.id == template_id).first()
             if template:
-                return SceneTemplateResponse.from_orm(template)
+                return self._template_response(template)
             return None
         finally:
             db.close()
@@ -380,61 +485,35 @@ class SceneTemplateService:
                       skip: int = 0,
                       limit: int = 50,
                       db: Session = None) -> List[SceneTemplateResponse]:
-        """Listar templates com filtros."""
+        """
+        Listar templates com filtros.
+        
+        Resolvido no catálogo em memória: categoria, estilo e busca usam os
+        índices; a busca casa prefixos de palavras de nome, descrição e tags.
+        """
         if not DATABASE_AVAILABLE:
             return []
         
-        if db is None:
-            db = get_db_session()
+        catalog = self.get_catalog(db)
         
-        try:
-            query = db.query(SceneTemplate)
-            
-            # Filtros
-            if category:
-                query = query.filter(SceneTemplate.category == category)
-            
-            if style:
-                query = query.filter(SceneTemplate.style == style)
-            
-            if is_public is not None:
-                query = query.filter(SceneTemplate.is_public == is_public)
-            
-            if is_featured is not None:
-                query = query.filter(SceneTemplate.is_featured == is_featured)
-            
+        def visible(template: SceneTemplateResponse) -> bool:
+            if is_public is not None and template.is_public != is_public:
+                return False
+            if is_featured is not None and template.is_featured != is_featured:
+                return False
             if user_id is not None:
                 # Mostrar templates públicos OU do usuário
-                query = query.filter(
-                    or_(
-                        SceneTemplate.is_public == True,
-                        SceneTemplate.created_by == user_id
-                    )
-                )
-            
-            if search:
-                search_term = f"%{search}%"
-                query = query.filter(
-                    or_(
-                        SceneTemplate.name.ilike(search_term),
-                        SceneTemplate.description.ilike(search_term),
-                        SceneTemplate.tags.ilike(search_term)
-                    )
-                )
-            
-            # Ordenação: featured primeiro, depois por rating, depois por uso
-            query = query.order_by(
-                SceneTemplate.is_featured.desc(),
-                SceneTemplate.rating_avg.desc().nullslast(),
-                SceneTemplate.usage_count.desc(),
-                SceneTemplate.created_at.desc()
-            )
-            
-            templates = query.offset(skip).limit(limit).all()
-            return [SceneTemplateResponse.from_orm(t) for t in templates]
-            
-        finally:
-            db.close()
+                return template.is_public or template.created_by == user_id
+            return True
+        
+        return catalog.filter(
+            category=category,
+            style=style,
+            search=search,
+            predicate=visible,
+            offset=skip,
+            limit=limit
+        )
     
     def update_template(self, template_id: int, template_data: SceneTemplateUpdate, user_id: int, db: Session = None) -> Optional[SceneTemplateResponse]:
         """Atualizar template."""
@@ -467,7 +546,9 @@ class SceneTemplateService:
             db.refresh(template)
             
             logger.info(f"Template atualizado: {template.name}")
-            return SceneTemplateResponse.from_orm(template)
+            response = self._template_response(template)
+            self._publish(response)
+            return response
             
         except Exception as e:
             db.rollback()
@@ -497,6 +578,7 @@ class SceneTemplateService:
             
             db.delete(template)
             db.commit()
+            self._unpublish(template_id)
             
             logger.info(f"Template deletado: {template.name}")
             return True
@@ -562,6 +644,7 @@ class SceneTemplateService:
             template.usage_count = (template.usage_count or 0) + 1
             
             db.commit()
+            self._publish(self._template_response(template))
             
             logger.info(f"Template {template.name} aplicado à cena {scene.name}")
             return True
@@ -625,6 +708,7 @@ class SceneTemplateService:
             template.usage_count = (template.usage_count or 0) + 1
             
             db.commit()
+            self._publish(self._template_response(template))
             
             logger.info(f"Nova cena criada do template {template.name}: {scene.name}")
             return scene.id
@@ -695,6 +779,8 @@ class SceneTemplateService:
             
             db.commit()
             logger.info(f"Criados {created_count} templates predefinidos")
+            if created_count:
+                self.load_catalog()
             return created_count
             
         except Exception as e:
@@ -8,12 +8,29 @@ dos endpoints de cenas, seguindo as melhores práticas do FastAPI.
 
 Funcionalidades:
 - Cache automático de consultas frequentes
-- Invalidação inteligente de cache
+- Invalidação por geração: um INCR por usuário/projeto/cena, sem KEYS/SCAN
+- Leituras em um único MGET (entrada + contadores de geração)
+- Cache em processo (near cache) com TTL curto para detalhes de cena
 - Compressão de dados para economia de memória
 - TTL dinâmico baseado no tipo de dados
 - Métricas de cache para monitoramento
 - Fallback para operação sem Redis
 
+Invalidação por geração:
+    Cada entidade referenciada nos parâmetros da chave (user_id, project_id,
+    scene_id) tem um contador `scenes:gen:{tipo}:{id}`. A entrada gravada
+    carrega as gerações vistas no momento do MISS; na leitura, a entrada e os
+    contadores vêm no mesmo MGET e a entrada só vale se as gerações ainda
+    coincidirem. Invalidar é incrementar o contador — entradas antigas deixam
+    de ser servidas e expiram pelo próprio TTL.
+
+Escritas fora deste router:
+    Cenas e assets também mudam em outros routers (arquivos, templates,
+    processamento de vídeo). Eventos da Session incrementam, após o commit,
+    as gerações dos projetos e cenas de todo Scene/Asset gravado pelo ORM
+    (cena que só mudou de `ordem` incrementa apenas a geração de ordenação);
+    comandos em massa do Core continuam invalidando explicitamente.
+
 Autor: TecnoCursos AI System
 Data: 17/01/2025
 """
@@ -24,11 +41,19 @@ import pickle
 import gzip
 import hashlib
 import logging
-from typing import Any, Optional, Union, Dict, List
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Union, Dict, Iterable, List, Tuple
 from datetime import datetime, timedelta
 from functools import wraps
 from dataclasses import dataclass
 
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.core.tracing import traced
+
 try:
     from app.config import get_settings
     CONFIG_AVAILABLE = True
@@ -37,6 +62,23 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Contadores de geração: vivem mais que qualquer entrada (TTL máximo de 1h),
+# então um contador expirado nunca "ressuscita" entradas antigas
+GENERATION_PREFIX = "scenes:gen"
+GENERATION_TTL = 7 * 24 * 3600
+
+# Parâmetro da chave -> tipo de entidade com contador próprio
+ENTITY_PARAMS = (("user_id", "user"), ("project_id", "project"), ("scene_id", "scene"))
+
+# Geração global: flush_all incrementa este contador
+GLOBAL_TAG = ("global", 0)
+
+# Tipos que dependem da ordem das cenas do projeto (invalidate_project_ordering)
+ORDERED_CACHE_TYPES = frozenset({"scene_list", "scene_summary", "project_scenes"})
+
+Tag = Tuple[str, int]
+
+
 @dataclass
 class CacheStats:
     """Estatísticas de cache"""
@@ -45,12 +87,65 @@ class CacheStats:
     sets: int = 0
     deletes: int = 0
     errors: int = 0
+    near_hits: int = 0
+    stale: int = 0
+    invalidations: int = 0
     
     @property
     def hit_rate(self) -> float:
         total = self.hits + self.misses
         return (self.hits / total * 100) if total > 0 else 0.0
 
+
+class NearCache:
+    """
+    Cache em processo (LRU com TTL curto) para as leituras mais quentes.
+    
+    Guarda o objeto já deserializado junto das gerações com que foi lido;
+    o serviço só o entrega se as gerações conhecidas localmente forem as
+    mesmas, então invalidações feitas neste processo valem imediatamente e
+    as de outros processos em no máximo `ttl` segundos.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 2.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Tuple[int, ...], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Tuple[Tuple[int, ...], Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, generations, data = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return generations, data
+    
+    def set(self, key: str, generations: Tuple[int, ...], data: Any):
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, generations, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def discard(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class ScenesCacheService:
     """
     Serviço de cache inteligente para cenas
@@ -60,15 +155,33 @@ class ScenesCacheService:
     - TTL baseado no tipo de conteúdo
     - Compressão para economia de memória
     - Fallback para operação sem Redis
-    - Invalidação em cascata
+    - Invalidação por geração (O(1), sem varredura de chaves)
     """
     
+    # Tipos servidos também pelo near cache
+    NEAR_CACHE_TYPES = frozenset({"scene_detail"})
+    
+    # Limite de gerações/snapshots mantidos em memória
+    MAX_TRACKED_KEYS = 4096
+    
     def __init__(self):
         self.redis_client = None
         self.stats = CacheStats()
         self.cache_enabled = False
+        self._lock = threading.Lock()
+        # Gerações conhecidas localmente (atualizadas a cada leitura/INCR)
+        self._generations: "OrderedDict[Tag, int]" = OrderedDict()
+        # Gerações vistas no último MISS de cada chave, usadas pelo set()
+        self._miss_generations: "OrderedDict[str, Tuple[int, ...]]" = OrderedDict()
         self._init_redis()
         
+        near_ttl, near_size = 2.0, 1024
+        if CONFIG_AVAILABLE:
+            settings = get_settings()
+            near_ttl = getattr(settings, 'scenes_near_cache_ttl', near_ttl)
+            near_size = getattr(settings, 'scenes_near_cache_size', near_size)
+        self.near_cache = NearCache(maxsize=near_size, ttl=near_ttl)
+        
         # Configurações de TTL por tipo de dados
         self.ttl_config = {
             'scene_list': 300,      # 5 minutos - listagens mudam frequentemente
@@ -99,10 +212,10 @@ class ScenesCacheService:
                 self.redis_client.ping()
                 self.cache_enabled = True
                 logger.info("✅ Cache Redis conectado com sucesso")
-                
+            
             else:
                 logger.warning("⚠️ Configurações não disponíveis - cache desabilitado")
-                
+        
         except Exception as e:
             logger.warning(f"⚠️ Redis não disponível: {e} - operando sem cache")
             self.redis_client = None
@@ -119,6 +232,50 @@ class ScenesCacheService:
         
         return f"scenes:{prefix}:{params_hash}"
     
+    # ------------------------------------------------------------------
+    # Gerações
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _generation_key(tag: Tag) -> str:
+        return f"{GENERATION_PREFIX}:{tag[0]}:{tag[1]}"
+    
+    @staticmethod
+    def _tags_for(cache_type: str, params: Dict[str, Any]) -> List[Tag]:
+        """Entidades das quais a entrada depende, derivadas dos parâmetros"""
+        tags = [GLOBAL_TAG]
+        for param, kind in ENTITY_PARAMS:
+            if params.get(param) is not None:
+                tags.append((kind, params[param]))
+        if cache_type in ORDERED_CACHE_TYPES and params.get("project_id") is not None:
+            tags.append(("ordering", params["project_id"]))
+        return tags
+    
+    @staticmethod
+    def _track(mapping: OrderedDict, key, value, limit: int):
+        mapping[key] = value
+        mapping.move_to_end(key)
+        while len(mapping) > limit:
+            mapping.popitem(last=False)
+    
+    def _remember_generations(self, generations: Dict[Tag, int]):
+        with self._lock:
+            for tag, generation in generations.items():
+                self._track(self._generations, tag, generation, self.MAX_TRACKED_KEYS)
+    
+    def _locally_current(self, tags: List[Tag], generations: Tuple[int, ...]) -> bool:
+        """Confere gerações contra o que este processo já sabe (sem rede)"""
+        with self._lock:
+            return all(self._generations.get(tag) == generation
+                       for tag, generation in zip(tags, generations))
+    
+    def _fetch_generations(self, tags: Iterable[Tag]) -> Dict[Tag, int]:
+        tags = list(dict.fromkeys(tags))
+        values = self.redis_client.mget([self._generation_key(tag) for tag in tags])
+        generations = {tag: int(value or 0) for tag, value in zip(tags, values)}
+        self._remember_generations(generations)
+        return generations
+    
     def _serialize_data(self, data: Any) -> bytes:
         """Serializar dados com compressão"""
         try:
@@ -132,7 +289,7 @@ class ScenesCacheService:
                     return b'GZIP:' + compressed_data
             
             return b'RAW:' + pickled_data
-            
+        
         except Exception as e:
             logger.error(f"Erro ao serializar dados: {e}")
             raise
@@ -152,15 +309,52 @@ class ScenesCacheService:
                 pickled_data = data
             
             return pickle.loads(pickled_data)
-            
+        
         except Exception as e:
             logger.error(f"Erro ao deserializar dados: {e}")
             raise
     
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+    
+    def _read_entry(self, cache_type: str, key: str, tags: List[Tag],
+                    raw: Optional[bytes], generations: Dict[Tag, int]) -> Optional[Any]:
+        """Valida a entrada lida contra as gerações atuais e registra o resultado"""
+        current = tuple(generations[tag] for tag in tags)
+        if raw:
+            envelope = self._deserialize_data(raw)
+            if isinstance(envelope, tuple) and len(envelope) == 2 and envelope[0] == current:
+                self.stats.hits += 1
+                if cache_type in self.NEAR_CACHE_TYPES:
+                    self.near_cache.set(key, current, envelope[1])
+                logger.debug(f"Cache HIT: {key}")
+                return envelope[1]
+            self.stats.stale += 1
+        
+        self.stats.misses += 1
+        with self._lock:
+            self._track(self._miss_generations, key, current, self.MAX_TRACKED_KEYS)
+        logger.debug(f"Cache MISS: {key}")
+        return None
+    
+    def _near_get(self, cache_type: str, key: str, tags: List[Tag]) -> Tuple[bool, Any]:
+        if cache_type not in self.NEAR_CACHE_TYPES:
+            return False, None
+        entry = self.near_cache.get(key)
+        if entry is None or not self._locally_current(tags, entry[0]):
+            return False, None
+        self.stats.hits += 1
+        self.stats.near_hits += 1
+        return True, entry[1]
+    
+    @traced("scenes_cache.get", category="cache")
     def get(self, cache_type: str, **kwargs) -> Optional[Any]:
         """
         Recuperar dados do cache
         
+        Uma única ida ao Redis: MGET da entrada e dos contadores de geração.
+        
         Args:
             cache_type: Tipo de cache (scene_list, scene_detail, etc.)
             **kwargs: Parâmetros para gerar chave única
@@ -173,24 +367,81 @@ class ScenesCacheService:
         
         try:
             key = self._generate_cache_key(cache_type, **kwargs)
-            cached_data = self.redis_client.get(key)
-            
-            if cached_data:
-                self.stats.hits += 1
-                data = self._deserialize_data(cached_data)
-                
-                logger.debug(f"Cache HIT: {key}")
+            tags = self._tags_for(cache_type, kwargs)
+            found, data = self._near_get(cache_type, key, tags)
+            if found:
                 return data
-            else:
-                self.stats.misses += 1
-                logger.debug(f"Cache MISS: {key}")
-                return None
-                
+            
+            values = self.redis_client.mget([key] + [self._generation_key(tag) for tag in tags])
+            generations = {tag: int(value or 0) for tag, value in zip(tags, values[1:])}
+            self._remember_generations(generations)
+            return self._read_entry(cache_type, key, tags, values[0], generations)
+        
         except Exception as e:
             self.stats.errors += 1
             logger.error(f"Erro ao recuperar cache: {e}")
             return None
     
+    @traced("scenes_cache.get_many", category="cache")
+    def get_many(self, cache_type: str, params_list: List[Dict[str, Any]]) -> List[Optional[Any]]:
+        """
+        Recuperar várias entradas do mesmo tipo em um único MGET
+        
+        Args:
+            cache_type: Tipo de cache
+            params_list: Parâmetros de cada chave (mesmos de get)
+        
+        Returns:
+            Lista alinhada com params_list (None para ausentes/obsoletas)
+        """
+        if not self.cache_enabled or not params_list:
+            return [None] * len(params_list)
+        
+        try:
+            keys = [self._generate_cache_key(cache_type, **params) for params in params_list]
+            tags_list = [self._tags_for(cache_type, params) for params in params_list]
+            all_tags = list(dict.fromkeys(tag for tags in tags_list for tag in tags))
+            
+            values = self.redis_client.mget(keys + [self._generation_key(tag) for tag in all_tags])
+            generations = {tag: int(value or 0) for tag, value in zip(all_tags, values[len(keys):])}
+            self._remember_generations(generations)
+            return [
+                self._read_entry(cache_type, key, tags, raw, generations)
+                for key, tags, raw in zip(keys, tags_list, values)
+            ]
+        
+        except Exception as e:
+            self.stats.errors += 1
+            logger.error(f"Erro ao recuperar cache em lote: {e}")
+            return [None] * len(params_list)
+    
+    # ------------------------------------------------------------------
+    # Escrita
+    # ------------------------------------------------------------------
+    
+    def _entry_generations(self, keys_tags: List[Tuple[str, List[Tag]]]) -> Dict[str, Tuple[int, ...]]:
+        """
+        Gerações a gravar em cada entrada.
+        
+        Usa as vistas no MISS que originou a escrita: se a entidade foi
+        invalidada enquanto o dado era montado, a entrada já nasce obsoleta
+        em vez de servir dado antigo sob a geração nova.
+        """
+        result = {}
+        missing = []
+        with self._lock:
+            for key, tags in keys_tags:
+                snapshot = self._miss_generations.get(key)
+                if snapshot is not None and len(snapshot) == len(tags):
+                    result[key] = snapshot
+                else:
+                    missing.append((key, tags))
+        if missing:
+            generations = self._fetch_generations(tag for _, tags in missing for tag in tags)
+            for key, tags in missing:
+                result[key] = tuple(generations[tag] for tag in tags)
+        return result
+    
     def set(self, cache_type: str, data: Any, ttl: Optional[int] = None, **kwargs) -> bool:
         """
         Armazenar dados no cache
@@ -204,30 +455,55 @@ class ScenesCacheService:
         Returns:
             True se sucesso, False caso contrário
         """
-        if not self.cache_enabled:
-            return False
+        return self.set_many(cache_type, [(kwargs, data)], ttl) == 1
+    
+    @traced("scenes_cache.set_many", category="cache")
+    def set_many(self, cache_type: str, items: List[Tuple[Dict[str, Any], Any]],
+                 ttl: Optional[int] = None) -> int:
+        """
+        Armazenar várias entradas do mesmo tipo em um único pipeline
+        
+        Args:
+            cache_type: Tipo de cache
+            items: Pares (parâmetros da chave, dados)
+            ttl: TTL customizado (opcional)
+        
+        Returns:
+            Número de entradas gravadas
+        """
+        if not self.cache_enabled or not items:
+            return 0
         
         try:
-            key = self._generate_cache_key(cache_type, **kwargs)
-            serialized_data = self._serialize_data(data)
-            
             # Usar TTL configurado ou padrão
             cache_ttl = ttl or self.ttl_config.get(cache_type, 300)
+            keys_tags = [
+                (self._generate_cache_key(cache_type, **params), self._tags_for(cache_type, params))
+                for params, _ in items
+            ]
+            generations = self._entry_generations(keys_tags)
             
-            result = self.redis_client.setex(key, cache_ttl, serialized_data)
+            pipe = self.redis_client.pipeline(transaction=False)
+            for (key, tags), (_, data) in zip(keys_tags, items):
+                pipe.setex(key, cache_ttl, self._serialize_data((generations[key], data)))
+            results = pipe.execute()
             
-            if result:
-                self.stats.sets += 1
+            written = 0
+            for (key, tags), (_, data), result in zip(keys_tags, items, results):
+                if not result:
+                    logger.warning(f"Falha ao armazenar cache: {key}")
+                    continue
+                written += 1
+                if cache_type in self.NEAR_CACHE_TYPES and self._locally_current(tags, generations[key]):
+                    self.near_cache.set(key, generations[key], data)
                 logger.debug(f"Cache SET: {key} (TTL: {cache_ttl}s)")
-                return True
-            else:
-                logger.warning(f"Falha ao armazenar cache: {key}")
-                return False
-                
+            self.stats.sets += written
+            return written
+        
         except Exception as e:
             self.stats.errors += 1
             logger.error(f"Erro ao armazenar cache: {e}")
-            return False
+            return 0
     
     def delete(self, cache_type: str, **kwargs) -> bool:
         """Deletar entrada específica do cache"""
@@ -236,6 +512,7 @@ class ScenesCacheService:
         
         try:
             key = self._generate_cache_key(cache_type, **kwargs)
+            self.near_cache.discard(key)
             result = self.redis_client.delete(key)
             
             if result:
@@ -244,86 +521,84 @@ class ScenesCacheService:
                 return True
             else:
                 return False
-                
+        
         except Exception as e:
             self.stats.errors += 1
             logger.error(f"Erro ao deletar cache: {e}")
             return False
     
-    def invalidate_user_cache(self, user_id: int) -> int:
+    # ------------------------------------------------------------------
+    # Invalidação
+    # ------------------------------------------------------------------
+    
+    def invalidate(self, user_ids: Iterable[int] = (), project_ids: Iterable[int] = (),
+                   scene_ids: Iterable[int] = (), ordering_project_ids: Iterable[int] = ()) -> int:
         """
-        Invalidar todo cache relacionado a um usuário
+        Invalidar entidades incrementando seus contadores de geração
         
-        Args:
-            user_id: ID do usuário
+        Todos os INCR seguem em um único pipeline, independente de quantas
+        chaves dependem de cada entidade.
         
         Returns:
-            Número de chaves deletadas
+            Número de entidades invalidadas
         """
         if not self.cache_enabled:
             return 0
         
+        tags = list(dict.fromkeys(
+            [("user", i) for i in user_ids] +
+            [("project", i) for i in project_ids] +
+            [("scene", i) for i in scene_ids] +
+            [("ordering", i) for i in ordering_project_ids]
+        ))
+        if not tags:
+            return 0
+        
         try:
-            # Buscar todas as chaves relacionadas ao usuário
-            pattern = f"scenes:*:*user_id*{user_id}*"
-            keys = self.redis_client.keys(pattern)
-            
-            if keys:
-                deleted_count = self.redis_client.delete(*keys)
-                self.stats.deletes += deleted_count
-                logger.info(f"Cache invalidado para usuário {user_id}: {deleted_count} chaves")
-                return deleted_count
-            else:
-                return 0
-                
+            pipe = self.redis_client.pipeline(transaction=False)
+            for tag in tags:
+                key = self._generation_key(tag)
+                pipe.incr(key)
+                pipe.expire(key, GENERATION_TTL)
+            results = pipe.execute()
+            self._remember_generations(dict(zip(tags, results[::2])))
+            self.stats.invalidations += len(tags)
+            logger.debug(f"Cache invalidado: {', '.join(f'{kind} {i}' for kind, i in tags)}")
+            return len(tags)
+        
         except Exception as e:
             self.stats.errors += 1
-            logger.error(f"Erro ao invalidar cache do usuário {user_id}: {e}")
+            logger.error(f"Erro ao invalidar cache: {e}")
             return 0
     
+    def invalidate_user_cache(self, user_id: int) -> int:
+        """
+        Invalidar todo cache relacionado a um usuário
+        
+        Args:
+            user_id: ID do usuário
+        
+        Returns:
+            Número de entidades invalidadas (0 se o cache estiver desabilitado)
+        """
+        return self.invalidate(user_ids=[user_id])
+    
     def invalidate_project_cache(self, project_id: int) -> int:
         """Invalidar cache relacionado a um projeto"""
-        if not self.cache_enabled:
-            return 0
+        return self.invalidate(project_ids=[project_id])
+    
+    def invalidate_project_ordering(self, project_id: int) -> int:
+        """
+        Invalidar apenas a ordenação de cenas do projeto.
         
-        try:
-            pattern = f"scenes:*:*project_id*{project_id}*"
-            keys = self.redis_client.keys(pattern)
-            
-            if keys:
-                deleted_count = self.redis_client.delete(*keys)
-                self.stats.deletes += deleted_count
-                logger.info(f"Cache invalidado para projeto {project_id}: {deleted_count} chaves")
-                return deleted_count
-            else:
-                return 0
-                
-        except Exception as e:
-            self.stats.errors += 1
-            logger.error(f"Erro ao invalidar cache do projeto {project_id}: {e}")
-            return 0
+        Reordenar não altera o conteúdo das demais cenas, então só os tipos
+        que dependem da ordem (ORDERED_CACHE_TYPES) são descartados.
+        """
+        return self.invalidate(ordering_project_ids=[project_id])
     
     def invalidate_scene_cache(self, scene_id: int) -> int:
         """Invalidar cache relacionado a uma cena específica"""
-        if not self.cache_enabled:
-            return 0
-        
-        try:
-            pattern = f"scenes:*:*scene_id*{scene_id}*"
-            keys = self.redis_client.keys(pattern)
-            
-            if keys:
-                deleted_count = self.redis_client.delete(*keys)
-                self.stats.deletes += deleted_count
-                logger.info(f"Cache invalidado para cena {scene_id}: {deleted_count} chaves")
-                return deleted_count
-            else:
-                return 0
-                
-        except Exception as e:
-            self.stats.errors += 1
-            logger.error(f"Erro ao invalidar cache da cena {scene_id}: {e}")
-            return 0
+        return self.invalidate(scene_ids=[scene_id])
     
     def get_stats(self) -> Dict[str, Any]:
         """Obter estatísticas de cache"""
@@ -335,25 +610,33 @@ class ScenesCacheService:
             "deletes": self.stats.deletes,
             "errors": self.stats.errors,
             "hit_rate": round(self.stats.hit_rate, 2),
+            "near_hits": self.stats.near_hits,
+            "stale": self.stats.stale,
+            "invalidations": self.stats.invalidations,
+            "near_cache": {
+                "entries": len(self.near_cache),
+                "ttl": self.near_cache.ttl,
+                "types": sorted(self.NEAR_CACHE_TYPES)
+            },
             "ttl_config": self.ttl_config
         }
     
     def flush_all(self) -> bool:
-        """Limpar todo cache de cenas (usar com cuidado)"""
+        """Limpar todo cache de cenas (incrementa a geração global)"""
         if not self.cache_enabled:
             return False
         
         try:
-            pattern = "scenes:*"
-            keys = self.redis_client.keys(pattern)
-            
-            if keys:
-                deleted_count = self.redis_client.delete(*keys)
-                logger.warning(f"Cache FLUSH: {deleted_count} chaves de cenas deletadas")
-                return True
-            else:
-                return True
-                
+            key = self._generation_key(GLOBAL_TAG)
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.incr(key)
+            pipe.expire(key, GENERATION_TTL)
+            generation = pipe.execute()[0]
+            self._remember_generations({GLOBAL_TAG: generation})
+            self.near_cache.clear()
+            logger.warning(f"Cache FLUSH: geração global de cenas -> {generation}")
+            return True
+        
         except Exception as e:
             logger.error(f"Erro ao limpar cache: {e}")
             return False
@@ -406,6 +689,61 @@ def cache_result(cache_type: str, ttl: Optional[int] = None):
 # Instância singleton do serviço de cache
 scenes_cache = ScenesCacheService()
 
+# ============================================================================
+# INVALIDAÇÃO PELAS ESCRITAS DO ORM
+# ============================================================================
+
+_PENDING_KEY = "scenes_cache_pending"
+
+
+def _history_values(obj, attr: str) -> List[Any]:
+    """Valor atual e o anterior (se alterado no flush) de um atributo"""
+    history = inspect(obj).attrs[attr].history
+    return [value for value in (*history.unchanged, *history.added, *history.deleted) if value is not None]
+
+
+def _changed_attributes(obj) -> set:
+    return {attr.key for attr in inspect(obj).attrs if attr.history.has_changes()}
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_scene_writes(session, flush_context):
+    """Anota projetos e cenas afetados por Scene/Asset gravados neste flush"""
+    from app.models import Asset, Scene
+    
+    pending = session.info.setdefault(_PENDING_KEY, (set(), set(), set()))
+    project_ids, scene_ids, ordering_project_ids = pending
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Scene):
+            if obj in session.dirty and _changed_attributes(obj) <= {"ordem"}:
+                # Só a posição mudou: basta a geração de ordenação do projeto
+                ordering_project_ids.update(_history_values(obj, "project_id"))
+            else:
+                project_ids.update(_history_values(obj, "project_id"))
+            if obj.id is not None:
+                scene_ids.add(obj.id)
+        elif isinstance(obj, Asset):
+            project_ids.update(_history_values(obj, "project_id"))
+            scene_ids.update(_history_values(obj, "scene_id"))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_scene_writes(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending and any(pending):
+        project_ids, scene_ids, ordering_project_ids = pending
+        scenes_cache.invalidate(
+            project_ids=project_ids,
+            scene_ids=scene_ids,
+            ordering_project_ids=ordering_project_ids - project_ids
+        )
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_scene_writes(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
 # Funções de conveniência para uso direto
 def get_cache(cache_type: str, **kwargs) -> Optional[Any]:
     """Função de conveniência para recuperar cache"""
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Índices de Busca para Cenas e Assets - TecnoCursos AI
+
+Substitui os filtros `ilike('%termo%')` das listagens de cenas e da
+biblioteca de assets por índices full-text (SQLite FTS5) mantidos em
+sincronia a cada escrita via eventos do SQLAlchemy.
+
+Funcionalidades:
+- Tabelas FTS5 `scenes_fts` (name, texto, notes) e `assets_fts`
+  (name, description, tags), com rowid igual ao id da linha original
+- Sincronização automática em insert/update/delete pelo ORM
+- Tags de assets normalizadas na tabela indexada `asset_tags`
+- Fallback transparente para `ilike` em bancos sem FTS5
+
+Observação: operações em massa (`query.update()`/`query.delete()`,
+`insert()`/`delete()` do Core) não disparam eventos do ORM; chame
+`index_scenes`/`index_assets` e `unindex_scenes`/`unindex_assets` na mesma
+transação, ou `rebuild_search_indexes` após cargas maiores.
+
+Autor: TecnoCursos AI System
+"""
+
+import json
+import logging
+from typing import Any, Iterable, List, Optional
+
+from sqlalchemy import bindparam, event, func, literal, or_, select, text, column, table
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.models import Asset, AssetTag, Scene
+from app.services.text_search_index import build_match_query
+
+logger = logging.getLogger(__name__)
+
+SCENE_FTS_TABLE = "scenes_fts"
+ASSET_FTS_TABLE = "assets_fts"
+
+SCENE_INDEXED_FIELDS = ("name", "texto", "notes")
+ASSET_INDEXED_FIELDS = ("name", "description", "library_tags")
+
+MAX_TAG_LENGTH = 100
+
+_scenes_fts = table(SCENE_FTS_TABLE, column("rowid"))
+_assets_fts = table(ASSET_FTS_TABLE, column("rowid"))
+
+# Preenchido por `ensure_search_indexes` quando as tabelas FTS existem
+_fts_ready = False
+
+
+# ============================================================================
+# TAGS
+# ============================================================================
+
+def normalize_tag(tag: Any) -> str:
+    """Normaliza uma tag para armazenamento e comparação"""
+    return " ".join(str(tag).split()).lower()[:MAX_TAG_LENGTH]
+
+
+def parse_tags(raw: Any) -> List[str]:
+    """
+    Converte `library_tags` (JSON array, lista ou texto separado por
+    vírgulas) em uma lista de tags normalizadas e sem duplicatas.
+    """
+    if not raw:
+        return []
+    values: Iterable[Any] = raw
+    if isinstance(raw, str):
+        try:
+            parsed = json.loads(raw)
+            values = parsed if isinstance(parsed, list) else [parsed]
+        except (json.JSONDecodeError, ValueError):
+            values = raw.split(",")
+
+    tags: List[str] = []
+    for value in values:
+        tag = normalize_tag(value) if value is not None else ""
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def sync_asset_tags(connection: Connection, asset_id: int, raw_tags: Any) -> List[str]:
+    """Regrava as linhas de `asset_tags` de um asset"""
+    tags = parse_tags(raw_tags)
+    tag_table = AssetTag.__table__
+    connection.execute(tag_table.delete().where(tag_table.c.asset_id == asset_id))
+    if tags:
+        connection.execute(
+            tag_table.insert(),
+            [{"asset_id": asset_id, "tag": tag} for tag in tags],
+        )
+    return tags
+
+
+# ============================================================================
+# CRIAÇÃO E RECONSTRUÇÃO
+# ============================================================================
+
+def _fts_enabled(bind) -> bool:
+    return _fts_ready and bind is not None and bind.dialect.name == "sqlite"
+
+
+def _has_rows(connection: Connection, source) -> bool:
+    return connection.execute(select(literal(1)).select_from(source).limit(1)).first() is not None
+
+
+def ensure_search_indexes(engine: Engine) -> bool:
+    """
+    Cria as tabelas FTS5 (apenas SQLite) e popula índices vazios.
+
+    A tabela `asset_tags` é preenchida em qualquer banco: o filtro por tags
+    depende dela mesmo sem busca full-text.
+
+    Returns:
+        bool: True se a busca full-text está ativa
+    """
+    global _fts_ready
+
+    if engine.dialect.name != "sqlite":
+        logger.info("Busca full-text de cenas/assets desativada: banco não é SQLite")
+        _fts_ready = False
+    else:
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SCENE_FTS_TABLE} USING fts5("
+                    "name, texto, notes, tokenize = 'unicode61 remove_diacritics 2')"
+                ))
+                conn.execute(text(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {ASSET_FTS_TABLE} USING fts5("
+                    "name, description, tags, tokenize = 'unicode61 remove_diacritics 2')"
+                ))
+            _fts_ready = True
+        except Exception as e:
+            logger.warning(f"FTS5 indisponível, usando busca por ilike: {e}")
+            _fts_ready = False
+
+    with engine.connect() as conn:
+        tags_missing = (
+            not _has_rows(conn, AssetTag.__table__)
+            and conn.execute(
+                select(Asset.id).where(Asset.library_tags.isnot(None)).limit(1)
+            ).first() is not None
+        )
+        # Um índice vazio só é reconstruído se a tabela de origem tiver linhas;
+        # bibliotecas sem cenas ou sem assets não disparam rebuild a cada startup
+        scenes_missing = _fts_ready and not _has_rows(conn, _scenes_fts) and _has_rows(conn, Scene.__table__)
+        assets_missing = _fts_ready and not _has_rows(conn, _assets_fts) and _has_rows(conn, Asset.__table__)
+
+    if tags_missing or scenes_missing or assets_missing:
+        rebuild_search_indexes(engine, tags=tags_missing, scenes=scenes_missing, assets=assets_missing)
+
+    return _fts_ready
+
+
+def rebuild_search_indexes(engine: Engine, tags: bool = True, scenes: bool = True,
+                           assets: bool = True) -> dict:
+    """
+    Reconstrói `asset_tags` e os índices FTS a partir das tabelas originais.
+
+    Os flags permitem reconstruir só as partes desatualizadas; o índice de
+    assets usa `asset_tags`, então as tags vêm antes.
+    """
+    stats = {"scenes": 0, "assets": 0, "tags": 0}
+
+    with engine.begin() as conn:
+        if tags:
+            rows = conn.execute(
+                select(Asset.id, Asset.library_tags).where(Asset.library_tags.isnot(None))
+            ).all()
+            for asset_id, raw_tags in rows:
+                stats["tags"] += len(sync_asset_tags(conn, asset_id, raw_tags))
+
+        if not _fts_enabled(engine):
+            return stats
+
+        if scenes:
+            conn.execute(text(f"DELETE FROM {SCENE_FTS_TABLE}"))
+            conn.execute(text(
+                f"INSERT INTO {SCENE_FTS_TABLE} (rowid, name, texto, notes) "
+                "SELECT id, COALESCE(name, ''), COALESCE(texto, ''), COALESCE(notes, '') FROM scenes"
+            ))
+            stats["scenes"] = conn.execute(text(f"SELECT COUNT(*) FROM {SCENE_FTS_TABLE}")).scalar()
+        if assets:
+            conn.execute(text(f"DELETE FROM {ASSET_FTS_TABLE}"))
+            conn.execute(text(
+                f"INSERT INTO {ASSET_FTS_TABLE} (rowid, name, description, tags) "
+                "SELECT a.id, COALESCE(a.name, ''), COALESCE(a.description, ''), "
+                "COALESCE((SELECT group_concat(t.tag, ' ') FROM asset_tags t WHERE t.asset_id = a.id), '') "
+                "FROM assets a"
+            ))
+            stats["assets"] = conn.execute(text(f"SELECT COUNT(*) FROM {ASSET_FTS_TABLE}")).scalar()
+
+    logger.info(f"Índices de busca reconstruídos: {stats}")
+    return stats
+
+
+# ============================================================================
+# SINCRONIZAÇÃO EM LOTE
+# ============================================================================
+
+def index_scenes(connection: Connection, scene_ids: List[int]) -> None:
+    """Regrava as linhas FTS de várias cenas com um DELETE e um INSERT ... SELECT"""
+    if not scene_ids or not _fts_enabled(connection):
+        return
+    connection.execute(_scenes_fts.delete().where(_scenes_fts.c.rowid.in_(scene_ids)))
+    connection.execute(text(
+        f"INSERT INTO {SCENE_FTS_TABLE} (rowid, name, texto, notes) "
+        "SELECT id, COALESCE(name, ''), COALESCE(texto, ''), COALESCE(notes, '') "
+        "FROM scenes WHERE id IN :ids"
+    ).bindparams(bindparam("ids", expanding=True)), {"ids": list(scene_ids)})
+
+
+def unindex_scenes(connection: Connection, scene_ids: Any) -> None:
+    """Remove do FTS as cenas em `scene_ids` (lista ou subconsulta de ids)"""
+    if _fts_enabled(connection):
+        connection.execute(_scenes_fts.delete().where(_scenes_fts.c.rowid.in_(scene_ids)))
+
+
+def index_assets(connection: Connection, asset_ids: List[int]) -> None:
+    """Regrava `asset_tags` e as linhas FTS de vários assets"""
+    if not asset_ids:
+        return
+    tag_table = AssetTag.__table__
+    tagged = connection.execute(
+        select(Asset.id, Asset.library_tags)
+        .where(Asset.id.in_(asset_ids), Asset.library_tags.isnot(None))
+    ).all()
+    connection.execute(tag_table.delete().where(tag_table.c.asset_id.in_(asset_ids)))
+    tag_rows = [
+        {"asset_id": asset_id, "tag": tag}
+        for asset_id, raw_tags in tagged for tag in parse_tags(raw_tags)
+    ]
+    if tag_rows:
+        connection.execute(tag_table.insert(), tag_rows)
+
+    if not _fts_enabled(connection):
+        return
+    connection.execute(_assets_fts.delete().where(_assets_fts.c.rowid.in_(asset_ids)))
+    connection.execute(text(
+        f"INSERT INTO {ASSET_FTS_TABLE} (rowid, name, description, tags) "
+        "SELECT a.id, COALESCE(a.name, ''), COALESCE(a.description, ''), "
+        "COALESCE((SELECT group_concat(t.tag, ' ') FROM asset_tags t WHERE t.asset_id = a.id), '') "
+        "FROM assets a WHERE a.id IN :ids"
+    ).bindparams(bindparam("ids", expanding=True)), {"ids": list(asset_ids)})
+
+
+def unindex_assets(connection: Connection, asset_ids: Any) -> None:
+    """Remove tags e linhas FTS dos assets em `asset_ids` (lista ou subconsulta de ids)"""
+    tag_table = AssetTag.__table__
+    connection.execute(tag_table.delete().where(tag_table.c.asset_id.in_(asset_ids)))
+    if _fts_enabled(connection):
+        connection.execute(_assets_fts.delete().where(_assets_fts.c.rowid.in_(asset_ids)))
+
+
+# ============================================================================
+# SINCRONIZAÇÃO NA ESCRITA
+# ============================================================================
+
+def _changed(target, fields: Iterable[str]) -> bool:
+    state = target._sa_instance_state
+    return any(state.attrs[field].history.has_changes() for field in fields)
+
+
+def _write_scene_row(connection: Connection, scene: Scene) -> None:
+    connection.execute(text(f"DELETE FROM {SCENE_FTS_TABLE} WHERE rowid = :id"), {"id": scene.id})
+    connection.execute(
+        text(f"INSERT INTO {SCENE_FTS_TABLE} (rowid, name, texto, notes) VALUES (:id, :name, :texto, :notes)"),
+        {"id": scene.id, "name": scene.name or "", "texto": scene.texto or "", "notes": scene.notes or ""},
+    )
+
+
+def _write_asset_row(connection: Connection, asset: Asset, tags: List[str]) -> None:
+    connection.execute(text(f"DELETE FROM {ASSET_FTS_TABLE} WHERE rowid = :id"), {"id": asset.id})
+    connection.execute(
+        text(f"INSERT INTO {ASSET_FTS_TABLE} (rowid, name, description, tags) VALUES (:id, :name, :description, :tags)"),
+        {"id": asset.id, "name": asset.name or "", "description": asset.description or "", "tags": " ".join(tags)},
+    )
+
+
+@event.listens_for(Scene, "after_insert")
+def _scene_after_insert(mapper, connection, target):
+    if _fts_enabled(connection):
+        _write_scene_row(connection, target)
+
+
+@event.listens_for(Scene, "after_update")
+def _scene_after_update(mapper, connection, target):
+    if _fts_enabled(connection) and _changed(target, SCENE_INDEXED_FIELDS):
+        _write_scene_row(connection, target)
+
+
+@event.listens_for(Scene, "after_delete")
+def _scene_after_delete(mapper, connection, target):
+    if _fts_enabled(connection):
+        connection.execute(text(f"DELETE FROM {SCENE_FTS_TABLE} WHERE rowid = :id"), {"id": target.id})
+
+
+@event.listens_for(Asset, "after_insert")
+def _asset_after_insert(mapper, connection, target):
+    tags = sync_asset_tags(connection, target.id, target.library_tags) if target.library_tags else []
+    if _fts_enabled(connection):
+        _write_asset_row(connection, target, tags)
+
+
+@event.listens_for(Asset, "after_update")
+def _asset_after_update(mapper, connection, target):
+    if not _changed(target, ASSET_INDEXED_FIELDS):
+        return
+    tags = sync_asset_tags(connection, target.id, target.library_tags)
+    if _fts_enabled(connection):
+        _write_asset_row(connection, target, tags)
+
+
+@event.listens_for(Asset, "after_delete")
+def _asset_after_delete(mapper, connection, target):
+    tag_table = AssetTag.__table__
+    connection.execute(tag_table.delete().where(tag_table.c.asset_id == target.id))
+    if _fts_enabled(connection):
+        connection.execute(text(f"DELETE FROM {ASSET_FTS_TABLE} WHERE rowid = :id"), {"id": target.id})
+
+
+# ============================================================================
+# CONDIÇÕES DE BUSCA
+# ============================================================================
+
+def scene_search_condition(db: Session, search: str):
+    """
+    Condição de busca textual para `Scene` (nome, texto e notas).
+
+    Usa o índice FTS com termos por prefixo quando disponível; caso
+    contrário, mantém o comportamento anterior com `ilike`.
+    """
+    match = build_match_query(search, prefix=True)
+    if match and _fts_enabled(db.get_bind()):
+        matches = select(_scenes_fts.c.rowid).where(
+            text(f"{SCENE_FTS_TABLE} MATCH :scene_fts_query").bindparams(scene_fts_query=match)
+        )
+        return Scene.id.in_(matches)
+
+    search_term = f"%{search}%"
+    return or_(
+        Scene.name.ilike(search_term),
+        Scene.texto.ilike(search_term),
+        Scene.notes.ilike(search_term)
+    )
+
+
+def asset_search_condition(db: Session, search: str):
+    """Condição de busca textual para `Asset` (nome, descrição e tags)"""
+    match = build_match_query(search, prefix=True)
+    if match and _fts_enabled(db.get_bind()):
+        matches = select(_assets_fts.c.rowid).where(
+            text(f"{ASSET_FTS_TABLE} MATCH :asset_fts_query").bindparams(asset_fts_query=match)
+        )
+        return Asset.id.in_(matches)
+
+    search_term = f"%{search}%"
+    return or_(
+        Asset.name.ilike(search_term),
+        Asset.description.ilike(search_term),
+        Asset.library_tags.ilike(search_term)
+    )
+
+
+def asset_tags_condition(tags: List[str]) -> Optional[Any]:
+    """
+    Condição "asset possui todas as tags" resolvida pelo índice
+    `(tag, asset_id)` de `asset_tags`, em uma única subconsulta.
+    """
+    normalized = list(dict.fromkeys(normalize_tag(tag) for tag in tags if tag and str(tag).strip()))
+    if not normalized:
+        return None
+
+    matches = (
+        select(AssetTag.asset_id)
+        .where(AssetTag.tag.in_(normalized))
+        .group_by(AssetTag.asset_id)
+        .having(func.count(AssetTag.tag) == len(normalized))
+    )
+    return Asset.id.in_(matches)
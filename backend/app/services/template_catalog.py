@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Catálogo Imutável de Templates - TecnoCursos AI
+
+Snapshot em memória de templates (cenas, textos) com índices pré-calculados,
+para que os endpoints de catálogo respondam sem varrer a lista nem consultar
+o banco a cada chamada.
+
+Funcionalidades:
+- Índices categoria/estilo/tag -> ids, na ordem canônica do catálogo
+- Índice de tokens (sem acentos) para busca por nome, descrição e tags,
+  com correspondência por prefixo via busca binária
+- Snapshots imutáveis: leituras nunca veem um índice pela metade
+- Troca atômica de referência (CatalogRef.swap) a cada escrita
+
+Autor: TecnoCursos AI System
+"""
+
+import re
+import time
+import bisect
+import logging
+import threading
+import unicodedata
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Tokens em minúsculas e sem acentos ("Educação" -> "educacao")"""
+    if not text:
+        return []
+    normalized = unicodedata.normalize("NFKD", str(text))
+    normalized = "".join(ch for ch in normalized if not unicodedata.combining(ch))
+    return _TOKEN_RE.findall(normalized.lower())
+
+
+def _normalize(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    value = getattr(value, "value", value)  # Enums
+    return str(value).lower()
+
+
+class TemplateCatalog(Generic[T]):
+    """
+    Snapshot imutável de templates e seus índices.
+
+    Os registros são extraídos por funções (`key`, `category`, `style`,
+    `tags`, `text`) para que o mesmo catálogo sirva dataclasses, dicts ou
+    schemas Pydantic. A ordem de `records` é a ordem canônica: todos os
+    resultados são devolvidos nela.
+    """
+
+    __slots__ = (
+        "_extract", "_records", "_by_key", "_position",
+        "_by_category", "_by_style", "_by_tag", "_tokens", "_token_list",
+        "built_at",
+    )
+
+    def __init__(self, records: Iterable[T], key: Callable[[T], Hashable],
+                 category: Callable[[T], Any] = lambda r: None,
+                 style: Callable[[T], Any] = lambda r: None,
+                 tags: Callable[[T], Iterable[str]] = lambda r: (),
+                 text: Callable[[T], Iterable[Optional[str]]] = lambda r: ()):
+        self._extract = (key, category, style, tags, text)
+        self._records: Tuple[T, ...] = tuple(records)
+        self.built_at = time.time()
+
+        by_key: Dict[Hashable, T] = {}
+        position: Dict[Hashable, int] = {}
+        by_category: Dict[str, List[Hashable]] = {}
+        by_style: Dict[str, List[Hashable]] = {}
+        by_tag: Dict[str, List[Hashable]] = {}
+        tokens: Dict[str, set] = {}
+
+        for index, record in enumerate(self._records):
+            record_key = key(record)
+            by_key[record_key] = record
+            position[record_key] = index
+
+            record_category = _normalize(category(record))
+            if record_category:
+                by_category.setdefault(record_category, []).append(record_key)
+            record_style = _normalize(style(record))
+            if record_style:
+                by_style.setdefault(record_style, []).append(record_key)
+
+            record_tags = [tag for tag in (tags(record) or ()) if tag]
+            for tag in dict.fromkeys(_normalize(tag) for tag in record_tags):
+                by_tag.setdefault(tag, []).append(record_key)
+
+            for field in list(text(record) or ()) + record_tags:
+                for token in tokenize(field):
+                    tokens.setdefault(token, set()).add(record_key)
+
+        self._by_key = MappingProxyType(by_key)
+        self._position = MappingProxyType(position)
+        self._by_category = MappingProxyType({k: tuple(v) for k, v in by_category.items()})
+        self._by_style = MappingProxyType({k: tuple(v) for k, v in by_style.items()})
+        self._by_tag = MappingProxyType({k: tuple(v) for k, v in by_tag.items()})
+        self._tokens = MappingProxyType({k: frozenset(v) for k, v in tokens.items()})
+        self._token_list: Tuple[str, ...] = tuple(sorted(tokens))
+
+    # ------------------------------------------------------------------
+    # Consulta
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    @property
+    def records(self) -> Tuple[T, ...]:
+        return self._records
+
+    def get(self, key: Hashable) -> Optional[T]:
+        return self._by_key.get(key)
+
+    def categories(self) -> List[str]:
+        return list(self._by_category)
+
+    def styles(self) -> List[str]:
+        return list(self._by_style)
+
+    def tags(self) -> List[str]:
+        return list(self._by_tag)
+
+    def _prefix_matches(self, prefix: str) -> FrozenSet[Hashable]:
+        """Ids cujos tokens começam com `prefix` (busca binária no vocabulário)"""
+        start = bisect.bisect_left(self._token_list, prefix)
+        end = bisect.bisect_left(self._token_list, prefix + "\uffff")
+        if start == end:
+            return frozenset()
+        if end - start == 1:
+            return self._tokens[self._token_list[start]]
+        matches = set()
+        for token in self._token_list[start:end]:
+            matches |= self._tokens[token]
+        return frozenset(matches)
+
+    def search_keys(self, query: str) -> Optional[FrozenSet[Hashable]]:
+        """
+        Ids que contêm todos os termos da consulta (prefixo de palavra).
+
+        Returns:
+            None se a consulta não tiver termos (sem filtro)
+        """
+        terms = tokenize(query)
+        if not terms:
+            return None
+        result = None
+        for term in sorted(set(terms), key=len, reverse=True):
+            matches = self._prefix_matches(term)
+            result = matches if result is None else result & matches
+            if not result:
+                return frozenset()
+        return result
+
+    def filter(self, category: Optional[str] = None, style: Optional[str] = None,
+               tag: Optional[str] = None, search: Optional[str] = None,
+               predicate: Optional[Callable[[T], bool]] = None,
+               offset: int = 0, limit: Optional[int] = None) -> List[T]:
+        """
+        Registros que atendem a todos os filtros, na ordem do catálogo.
+
+        Categoria, estilo, tag e busca são resolvidos pelos índices; só os
+        candidatos restantes passam por `predicate`.
+        """
+        candidates: Optional[FrozenSet[Hashable]] = None
+        for index, value in ((self._by_category, category), (self._by_style, style), (self._by_tag, tag)):
+            if value is None:
+                continue
+            keys = frozenset(index.get(_normalize(value), ()))
+            candidates = keys if candidates is None else candidates & keys
+        if search:
+            keys = self.search_keys(search)
+            if keys is not None:
+                candidates = keys if candidates is None else candidates & keys
+
+        if candidates is None:
+            records: Iterable[T] = self._records
+        else:
+            records = (self._by_key[k] for k in sorted(candidates, key=self._position.__getitem__))
+        if predicate is not None:
+            records = (record for record in records if predicate(record))
+
+        result = []
+        end = None if limit is None else offset + limit
+        for index, record in enumerate(records):
+            if end is not None and index >= end:
+                break
+            if index >= offset:
+                result.append(record)
+        return result
+
+    # ------------------------------------------------------------------
+    # Cópias modificadas (o snapshot atual nunca muda)
+    # ------------------------------------------------------------------
+
+    def rebuild(self, records: Iterable[T]) -> "TemplateCatalog[T]":
+        """Novo catálogo com os mesmos extratores"""
+        key, category, style, tags, text = self._extract
+        return TemplateCatalog(records, key=key, category=category, style=style, tags=tags, text=text)
+
+    def with_record(self, record: T, sort_key: Optional[Callable[[T], Any]] = None) -> "TemplateCatalog[T]":
+        """Novo catálogo com o registro inserido ou substituído"""
+        key = self._extract[0]
+        records = [r for r in self._records if key(r) != key(record)] + [record]
+        if sort_key is not None:
+            records.sort(key=sort_key)
+        return self.rebuild(records)
+
+    def without(self, record_key: Hashable) -> "TemplateCatalog[T]":
+        """Novo catálogo sem o registro"""
+        key = self._extract[0]
+        return self.rebuild(r for r in self._records if key(r) != record_key)
+
+
+class CatalogRef(Generic[T]):
+    """
+    Referência para o snapshot atual do catálogo.
+
+    Leitores usam `current` sem lock (a atribuição de referência é atômica);
+    escritores serializam entre si com `update`, que monta o novo snapshot
+    fora do caminho de leitura e troca a referência de uma vez.
+    """
+
+    def __init__(self, catalog: Optional[TemplateCatalog[T]] = None):
+        self._catalog = catalog
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> Optional[TemplateCatalog[T]]:
+        return self._catalog
+
+    def swap(self, catalog: TemplateCatalog[T]) -> Optional[TemplateCatalog[T]]:
+        """Publica um novo snapshot; devolve o anterior"""
+        with self._lock:
+            previous, self._catalog = self._catalog, catalog
+        return previous
+
+    def update(self, change: Callable[[Optional[TemplateCatalog[T]]], Optional[TemplateCatalog[T]]]) -> Optional[TemplateCatalog[T]]:
+        """Aplica `change` ao snapshot atual e publica o resultado"""
+        with self._lock:
+            self._catalog = change(self._catalog)
+            return self._catalog
@@ -13,6 +13,8 @@ from datetime import datetime
 import logging
 from dataclasses import dataclass
 
+from app.services.template_catalog import TemplateCatalog
+
 try:
     from PIL import Image, ImageDraw, ImageFont
     from PIL import ImageFilter, ImageEnhance
@@ -97,8 +99,9 @@ class TextEditorService:
         self.font_cache = {}
         self.available_fonts = self._load_available_fonts()
         
-        # Templates de texto
-        self.text_templates = self._load_text_templates()
+        # Templates de texto (catálogo imutável compartilhado entre instâncias)
+        self.template_catalog = get_text_template_catalog()
+        self.text_templates = list(self.template_catalog.records)
         
         logger.info("📝 Text Editor Service inicializado")
     
@@ -135,7 +138,8 @@ class TextEditorService:
         logger.info(f"🔤 {len(fonts)} fontes carregadas")
         return fonts
     
-    def _load_text_templates(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _load_text_templates() -> List[Dict[str, Any]]:
         """Carregar templates de texto predefinidos"""
         return [
             {
@@ -281,7 +285,7 @@ class TextEditorService:
         """Aplicar template predefinido ao texto"""
         try:
             # Buscar template
-            template = next((t for t in self.text_templates if t["id"] == template_id), None)
+            template = self.template_catalog.get(template_id)
             if not template:
                 raise ValueError(f"Template não encontrado: {template_id}")
             
@@ -550,17 +554,14 @@ class TextEditorService:
         """Obter lista de fontes disponíveis"""
         return self.available_fonts
     
-    def get_text_templates(self) -> List[Dict[str, Any]]:
+    def get_text_templates(self, category: Optional[str] = None,
+                           search: Optional[str] = None) -> List[Dict[str, Any]]:
         """Obter templates de texto disponíveis"""
-        return [
-            {
-                "id": template["id"],
-                "name": template["name"],
-                "category": template["category"],
-                "preview": f"/static/previews/{template['id']}.jpg"
-            }
-            for template in self.text_templates
-        ]
+        if category or search:
+            templates = self.template_catalog.filter(category=category, search=search)
+        else:
+            templates = self.template_catalog.records
+        return [dict(_TEXT_TEMPLATE_SUMMARIES[template["id"]]) for template in templates]
     
     def export_text_styles(self) -> Dict[str, Any]:
         """Exportar estilos para uso no frontend"""
@@ -613,6 +614,35 @@ class TextEditorService:
             "warnings": warnings
         }
 
+# ============================================================================
+# CATÁLOGO DE TEMPLATES DE TEXTO
+# ============================================================================
+
+_text_template_catalog: Optional[TemplateCatalog] = None
+_TEXT_TEMPLATE_SUMMARIES: Dict[str, Dict[str, Any]] = {}
+
+def get_text_template_catalog() -> TemplateCatalog:
+    """Catálogo dos templates de texto, montado uma única vez por processo"""
+    global _text_template_catalog
+    if _text_template_catalog is None:
+        templates = TextEditorService._load_text_templates()
+        _TEXT_TEMPLATE_SUMMARIES.update({
+            template["id"]: {
+                "id": template["id"],
+                "name": template["name"],
+                "category": template["category"],
+                "preview": f"/static/previews/{template['id']}.jpg"
+            }
+            for template in templates
+        })
+        _text_template_catalog = TemplateCatalog(
+            templates,
+            key=lambda t: t["id"],
+            category=lambda t: t["category"],
+            text=lambda t: (t["name"],),
+        )
+    return _text_template_catalog
+
 # Instância global do serviço
 text_editor_service = TextEditorService()
 
@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Índice Full-Text de Documentos - TecnoCursos AI
+
+Índice invertido persistente (SQLite FTS5) sobre o texto extraído de PDFs e
+apresentações. O índice é alimentado no momento do upload, de modo que as
+buscas na biblioteca do usuário não precisam reabrir os arquivos originais.
+
+Funcionalidades:
+- Indexação por página (hits com número da página e snippet)
+- Consultas por termos (AND), frase exata e prefixo
+- Ranking BM25 nativo do FTS5
+- Remoção/reindexação por arquivo
+- Banco dedicado, independente do banco principal da aplicação
+
+Autor: TecnoCursos AI System
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+try:
+    from app.config import get_settings
+    CONFIG_AVAILABLE = True
+except ImportError:
+    CONFIG_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = "app/static/search/text_index.db"
+
+# Formatos com texto por página/slide reextraível do arquivo armazenado
+PAGED_FILE_TYPES = (".pdf", ".pptx")
+
+# Tokens de palavra (unicode) usados para montar consultas MATCH seguras
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS indexed_documents (
+        file_id INTEGER PRIMARY KEY,
+        user_id INTEGER NOT NULL,
+        filename TEXT,
+        page_count INTEGER NOT NULL DEFAULT 0,
+        indexed_at TEXT NOT NULL,
+        file_path TEXT,
+        file_mtime REAL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_indexed_documents_user ON indexed_documents(user_id)",
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS page_text USING fts5(
+        content,
+        file_id UNINDEXED,
+        user_id UNINDEXED,
+        page_number UNINDEXED,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+)
+
+# Colunas acrescentadas depois da primeira versão do esquema
+_MIGRATIONS = {
+    "file_path": "ALTER TABLE indexed_documents ADD COLUMN file_path TEXT",
+    "file_mtime": "ALTER TABLE indexed_documents ADD COLUMN file_mtime REAL",
+}
+
+
+def _file_signature(file_path: Optional[str]) -> tuple:
+    """Caminho absoluto e mtime do arquivo (mtime None se ele não existir)"""
+    if not file_path:
+        return None, None
+    path = os.path.abspath(str(file_path))
+    try:
+        return path, os.stat(path).st_mtime
+    except OSError:
+        return path, None
+
+
+def pages_from_extraction(extracted: Any) -> List[str]:
+    """
+    Normaliza o retorno dos extratores de `app.utils` para uma lista de páginas.
+
+    Aceita o dict de `extract_pdf_text`/`extract_pptx_text`, uma lista de
+    páginas (`extract_text_from_pdf`) ou um texto único.
+    """
+    if not extracted:
+        return []
+    if isinstance(extracted, str):
+        return [extracted]
+    if isinstance(extracted, dict):
+        for key in ("text_pages", "text_slides", "pages"):
+            if isinstance(extracted.get(key), list):
+                return [str(page or "") for page in extracted[key]]
+        text = extracted.get("text") or extracted.get("plain_text")
+        return [text] if text else []
+    if isinstance(extracted, (list, tuple)):
+        return [str(page or "") for page in extracted]
+    return []
+
+
+def pages_from_file(file_path: Optional[str], file_type: Optional[str] = None) -> List[str]:
+    """
+    Reextrai o texto por página do arquivo armazenado (PDF/PPTX).
+
+    Retorna lista vazia se o arquivo não existir, o formato não for
+    paginado ou a extração falhar.
+    """
+    if not file_path or not Path(file_path).is_file():
+        return []
+    suffix = (file_type or Path(file_path).suffix or "").lower()
+    if not suffix.startswith("."):
+        suffix = f".{suffix}"
+    if suffix not in PAGED_FILE_TYPES:
+        return []
+
+    from app.utils import extract_pdf_text, extract_pptx_text
+    extractor = extract_pdf_text if suffix == ".pdf" else extract_pptx_text
+    extracted = extractor(Path(file_path))
+    if not isinstance(extracted, dict) or extracted.get("error"):
+        logger.warning(f"Falha ao reextrair páginas de {file_path}")
+        return []
+    return pages_from_extraction(extracted)
+
+
+def build_match_query(query: str, phrase: bool = False, prefix: bool = False) -> str:
+    """
+    Converte a consulta do usuário em uma expressão MATCH do FTS5.
+
+    Cada token é citado, o que neutraliza operadores do FTS5 digitados pelo
+    usuário. Termos entre aspas na consulta viram frase; termos terminados
+    em `*` viram prefixo.
+
+    Args:
+        query: Texto digitado pelo usuário
+        phrase: Tratar a consulta inteira como frase exata
+        prefix: Tratar todos os termos como prefixo
+
+    Returns:
+        str: Expressão MATCH (vazia se não houver termos)
+    """
+    query = (query or "").strip()
+    if not query:
+        return ""
+
+    if phrase:
+        tokens = _TOKEN_RE.findall(query)
+        if not tokens:
+            return ""
+        expression = '"' + " ".join(tokens) + '"'
+        return expression + "*" if prefix else expression
+
+    parts: List[str] = []
+    # Separar trechos entre aspas (frases) do restante
+    for quoted, loose in re.findall(r'"([^"]*)"|(\S+)', query):
+        if quoted:
+            tokens = _TOKEN_RE.findall(quoted)
+            if tokens:
+                parts.append('"' + " ".join(tokens) + '"')
+            continue
+        wants_prefix = prefix or loose.endswith("*")
+        for token in _TOKEN_RE.findall(loose):
+            parts.append(f'"{token}"*' if wants_prefix else f'"{token}"')
+
+    return " AND ".join(parts)
+
+
+class TextSearchIndex:
+    """
+    Índice invertido de texto por página sobre SQLite FTS5.
+
+    Uma única conexão é compartilhada entre threads; escritas são
+    serializadas por lock e as leituras aproveitam o modo WAL.
+    """
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_INDEX_PATH):
+        self.db_path = str(db_path)
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+            columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(indexed_documents)")}
+            for column, statement in _MIGRATIONS.items():
+                if column not in columns:
+                    self._conn.execute(statement)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_indexed_documents_path ON indexed_documents(file_path)"
+            )
+
+    # ------------------------------------------------------------------
+    # Escrita
+    # ------------------------------------------------------------------
+
+    def index_document(self, file_id: int, user_id: int, pages: Iterable[str],
+                       filename: Optional[str] = None, file_path: Optional[str] = None) -> int:
+        """
+        Indexa (ou reindexa) o texto de um arquivo, página a página.
+
+        O `file_path` (com o mtime atual) permite que as buscas por caminho
+        em `app.utils` consultem o índice em vez de reabrir o arquivo.
+
+        Returns:
+            int: Número de páginas indexadas
+        """
+        rows = [
+            (text, file_id, user_id, page_number)
+            for page_number, text in enumerate(pages, start=1)
+            if text and text.strip()
+        ]
+        path, mtime = _file_signature(file_path)
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM page_text WHERE file_id = ?", (file_id,))
+            self._conn.executemany(
+                "INSERT INTO page_text (content, file_id, user_id, page_number) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute(
+                """
+                INSERT INTO indexed_documents
+                    (file_id, user_id, filename, page_count, indexed_at, file_path, file_mtime)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(file_id) DO UPDATE SET
+                    user_id = excluded.user_id,
+                    filename = excluded.filename,
+                    page_count = excluded.page_count,
+                    indexed_at = excluded.indexed_at,
+                    file_path = excluded.file_path,
+                    file_mtime = excluded.file_mtime
+                """,
+                (file_id, user_id, filename, len(rows), datetime.now().isoformat(), path, mtime),
+            )
+
+        logger.debug(f"Arquivo {file_id} indexado: {len(rows)} páginas")
+        return len(rows)
+
+    def remove_document(self, file_id: int) -> bool:
+        """Remove um arquivo do índice. Retorna True se ele estava indexado."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM page_text WHERE file_id = ?", (file_id,))
+            cursor = self._conn.execute(
+                "DELETE FROM indexed_documents WHERE file_id = ?", (file_id,)
+            )
+        return cursor.rowcount > 0
+
+    def optimize(self) -> None:
+        """Funde os segmentos do índice FTS5 (útil após grandes reindexações)."""
+        with self._lock, self._conn:
+            self._conn.execute("INSERT INTO page_text(page_text) VALUES ('optimize')")
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    def is_indexed(self, file_id: int) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM indexed_documents WHERE file_id = ?", (file_id,)
+        ).fetchone()
+        return row is not None
+
+    def candidate_pages(self, file_path: Union[str, Path],
+                        terms: List[str]) -> Optional[Dict[int, str]]:
+        """
+        Páginas de um arquivo indexado que contêm algum dos termos.
+
+        Cada termo é consultado como frase com prefixo; o resultado é um
+        superconjunto das páginas com a substring exata, que o chamador
+        ainda confere (maiúsculas, contagem de ocorrências).
+
+        Returns:
+            Optional[Dict[int, str]]: `{página: texto}`, ou None se o arquivo
+            não estiver indexado, tiver mudado desde a indexação ou algum
+            termo não puder ser consultado no índice
+        """
+        path, mtime = _file_signature(file_path)
+        if path is None or mtime is None:
+            return None
+
+        expressions = [build_match_query(term, phrase=True, prefix=True) for term in terms]
+        if not expressions or not all(expressions):
+            return None
+
+        document = self._conn.execute(
+            "SELECT file_id, file_mtime FROM indexed_documents WHERE file_path = ? "
+            "ORDER BY indexed_at DESC LIMIT 1",
+            (path,),
+        ).fetchone()
+        if document is None or document["file_mtime"] != mtime:
+            return None
+
+        try:
+            rows = self._conn.execute(
+                "SELECT page_number, content FROM page_text WHERE page_text MATCH ? AND file_id = ?",
+                (" OR ".join(expressions), document["file_id"]),
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Consulta ao índice falhou para {path}: {e}")
+            return None
+        return {int(row["page_number"]): row["content"] for row in rows}
+
+    def search(self, query: str, user_id: Optional[int] = None,
+               file_ids: Optional[List[int]] = None, phrase: bool = False,
+               prefix: bool = False, limit: int = 50, offset: int = 0,
+               snippet_tokens: int = 12) -> dict:
+        """
+        Busca no índice com hits por página, snippet e ranking BM25.
+
+        Args:
+            query: Consulta do usuário
+            user_id: Restringe à biblioteca do usuário
+            file_ids: Restringe a arquivos específicos
+            phrase: Consulta como frase exata
+            prefix: Termos como prefixo
+            limit: Máximo de hits retornados
+            offset: Deslocamento para paginação
+            snippet_tokens: Tamanho do snippet em tokens
+
+        Returns:
+            dict: Resultado da busca
+        """
+        start_time = time.perf_counter()
+        match_query = build_match_query(query, phrase=phrase, prefix=prefix)
+
+        result = {
+            "success": False,
+            "query": query,
+            "match_query": match_query,
+            "total_hits": 0,
+            "hits": [],
+            "files": [],
+            "search_time_ms": 0.0,
+            "error": None,
+        }
+
+        if not match_query:
+            result["success"] = True
+            return result
+
+        filters = ["page_text MATCH ?"]
+        params: List[Any] = [match_query]
+        if user_id is not None:
+            filters.append("page_text.user_id = ?")
+            params.append(user_id)
+        if file_ids:
+            filters.append(f"page_text.file_id IN ({','.join('?' * len(file_ids))})")
+            params.extend(file_ids)
+        where = " AND ".join(filters)
+
+        try:
+            total = self._conn.execute(
+                f"SELECT COUNT(*) FROM page_text WHERE {where}", params
+            ).fetchone()[0]
+
+            rows = self._conn.execute(
+                f"""
+                SELECT page_text.file_id AS file_id,
+                       page_text.page_number AS page_number,
+                       d.filename AS filename,
+                       snippet(page_text, 0, '[', ']', '...', ?) AS snippet,
+                       bm25(page_text) AS score
+                FROM page_text
+                LEFT JOIN indexed_documents d ON d.file_id = page_text.file_id
+                WHERE {where}
+                ORDER BY score
+                LIMIT ? OFFSET ?
+                """,
+                [snippet_tokens, *params, limit, offset],
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            result["error"] = f"Consulta inválida: {e}"
+            return result
+
+        files: Dict[int, Dict[str, Any]] = {}
+        for row in rows:
+            hit = {
+                "file_id": row["file_id"],
+                "filename": row["filename"],
+                "page_number": row["page_number"],
+                "snippet": row["snippet"],
+                # bm25() retorna valores negativos: quanto menor, mais relevante
+                "score": round(-row["score"], 4),
+            }
+            result["hits"].append(hit)
+            entry = files.setdefault(row["file_id"], {
+                "file_id": row["file_id"],
+                "filename": row["filename"],
+                "pages": [],
+            })
+            entry["pages"].append(row["page_number"])
+
+        result["files"] = list(files.values())
+        result["total_hits"] = total
+        result["success"] = True
+        result["search_time_ms"] = round((time.perf_counter() - start_time) * 1000, 3)
+        return result
+
+    def get_stats(self) -> dict:
+        documents, pages = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(page_count), 0) FROM indexed_documents"
+        ).fetchone()
+        return {"documents": documents, "pages": pages, "db_path": self.db_path}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# Instância global
+_text_search_index: Optional[TextSearchIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_text_search_index() -> TextSearchIndex:
+    """Retorna a instância global do índice de texto"""
+    global _text_search_index
+    if _text_search_index is None:
+        with _index_lock:
+            if _text_search_index is None:
+                path = DEFAULT_INDEX_PATH
+                if CONFIG_AVAILABLE:
+                    path = getattr(get_settings(), "search_index_path", path) or path
+                _text_search_index = TextSearchIndex(path)
+    return _text_search_index
+
+
+def index_file_upload(file_upload, extracted: Any = None) -> int:
+    """
+    Indexa um registro `FileUpload` usando o texto já extraído no upload.
+
+    Na falta dele, reextrai as páginas do arquivo armazenado; o
+    `text_content` persistido (texto único, sem divisão de páginas) só é
+    usado quando o arquivo não está mais disponível.
+    """
+    pages = (
+        pages_from_extraction(extracted)
+        or pages_from_file(getattr(file_upload, "file_path", None), getattr(file_upload, "file_type", None))
+        or pages_from_extraction(getattr(file_upload, "text_content", None))
+    )
+    return get_text_search_index().index_document(
+        file_upload.id,
+        file_upload.user_id,
+        pages,
+        filename=getattr(file_upload, "original_filename", None) or file_upload.filename,
+        file_path=getattr(file_upload, "file_path", None),
+    )
@@ -0,0 +1,393 @@
+"""
+Armazenamento de Versões com Deltas - TecnoCursos AI
+Versões de projeto gravadas como snapshots periódicos + JSON Patch (RFC 6902),
+com índice por projeto que responde listagens sem ler os payloads.
+
+Layout em disco:
+    <root>/project_<id>/index.jsonl        uma linha de metadados por versão
+    <root>/project_<id>/v<n>.snap.json.gz  dados completos
+    <root>/project_<id>/v<n>.delta.json.gz patch em relação à versão anterior
+"""
+
+import copy
+import gzip
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.jsonl"
+
+
+# ============================================================================
+# JSON PATCH (RFC 6902) - subconjunto add/remove/replace
+# ============================================================================
+
+def _escape(token: Any) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def json_diff(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    Diferença estrutural entre dois documentos JSON como lista de operações.
+
+    Dicionários são comparados por chave e listas por posição; subárvores
+    iguais são descartadas pela comparação nativa (`==`) sem serializar
+    (portanto, como no Python, `1`, `1.0` e `True` aninhados são iguais).
+    """
+    if old is new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[Dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            elif old[key] != value or type(old[key]) is not type(value):
+                ops.extend(json_diff(old[key], value, child))
+        return ops
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        common = min(len(old), len(new))
+        for index in range(common):
+            if old[index] != new[index] or type(old[index]) is not type(new[index]):
+                ops.extend(json_diff(old[index], new[index], f"{path}/{index}"))
+        for index in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{index}"})
+        for index in range(common, len(new)):
+            ops.append({"op": "add", "path": f"{path}/-", "value": new[index]})
+        return ops
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document: Any, patch: Iterable[Dict[str, Any]]) -> Any:
+    """Aplicar operações geradas por `json_diff` (o documento é copiado)"""
+    document = copy.deepcopy(document)
+    for operation in patch:
+        op, path = operation["op"], operation["path"]
+        if path == "":
+            if op == "remove":
+                document = None
+            else:
+                document = copy.deepcopy(operation["value"])
+            continue
+
+        tokens = [_unescape(token) for token in path.split("/")[1:]]
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+
+        if isinstance(parent, list):
+            if op == "add":
+                value = copy.deepcopy(operation["value"])
+                if last == "-":
+                    parent.append(value)
+                else:
+                    parent.insert(int(last), value)
+            elif op == "remove":
+                del parent[int(last)]
+            else:
+                parent[int(last)] = copy.deepcopy(operation["value"])
+        else:
+            if op == "remove":
+                del parent[last]
+            else:
+                parent[last] = copy.deepcopy(operation["value"])
+    return document
+
+
+def count_changes(old: Any, new: Any) -> int:
+    """Número de caminhos alterados entre dois documentos"""
+    return len(json_diff(old, new))
+
+
+# ============================================================================
+# ÍNDICE E ARMAZENAMENTO
+# ============================================================================
+
+@dataclass
+class VersionIndexEntry:
+    """Metadados de uma versão (uma linha do índice)"""
+    id: str
+    version_number: int
+    user_id: int
+    data_hash: str
+    size: int
+    stored_size: int
+    created_at: str
+    kind: str  # "snapshot" ou "delta"
+    base: Optional[int] = None  # versão de referência do delta
+    is_manual: bool = False
+    description: Optional[str] = None
+
+
+class VersionStore:
+    """
+    Histórico de versões por projeto.
+
+    O índice de cada projeto fica em memória após a primeira leitura e
+    é estendido por append; a versão mais recente também fica em memória,
+    então gravar uma nova versão só calcula o delta contra ela.
+    """
+
+    def __init__(self, root_dir: Union[str, Path], snapshot_interval: int = 20,
+                 compression: bool = True, max_delta_ratio: float = 0.5):
+        self.root_dir = Path(root_dir)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self.snapshot_interval = snapshot_interval
+        self.compression = compression
+        self.max_delta_ratio = max_delta_ratio
+
+        self._indexes: Dict[int, List[VersionIndexEntry]] = {}
+        self._heads: Dict[int, Any] = {}  # project_id -> dados da última versão
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # Índice
+    # ------------------------------------------------------------------
+
+    def _project_dir(self, project_id: int) -> Path:
+        return self.root_dir / f"project_{int(project_id)}"
+
+    def _index(self, project_id: int) -> List[VersionIndexEntry]:
+        index = self._indexes.get(project_id)
+        if index is not None:
+            return index
+
+        index = []
+        index_path = self._project_dir(project_id) / INDEX_FILENAME
+        if index_path.exists():
+            with open(index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        index.append(VersionIndexEntry(**json.loads(line)))
+                    except (ValueError, TypeError) as e:
+                        # Linha truncada por queda durante o append
+                        logger.warning(f"Linha inválida no índice de versões do projeto {project_id}: {e}")
+        self._indexes[project_id] = index
+        return index
+
+    def _append_index(self, project_id: int, entry: VersionIndexEntry) -> None:
+        index_path = self._project_dir(project_id) / INDEX_FILENAME
+        with open(index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(asdict(entry), separators=(",", ":")) + "\n")
+
+    def _rewrite_index(self, project_id: int) -> None:
+        index_path = self._project_dir(project_id) / INDEX_FILENAME
+        tmp_path = index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in self._indexes[project_id]:
+                f.write(json.dumps(asdict(entry), separators=(",", ":")) + "\n")
+        os.replace(tmp_path, index_path)
+
+    # ------------------------------------------------------------------
+    # Payloads
+    # ------------------------------------------------------------------
+
+    def _payload_path(self, project_id: int, version_number: int, kind: str) -> Path:
+        suffix = "snap" if kind == "snapshot" else "delta"
+        extension = ".json.gz" if self.compression else ".json"
+        return self._project_dir(project_id) / f"v{version_number}.{suffix}{extension}"
+
+    def _write_payload(self, path: Path, payload: Any) -> int:
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        if self.compression:
+            raw = gzip.compress(raw, compresslevel=6)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(raw)
+        os.replace(tmp_path, path)
+        return len(raw)
+
+    def _remove_payload(self, project_id: int, version_number: int, kind: str) -> None:
+        suffix = "snap" if kind == "snapshot" else "delta"
+        for extension in (".json.gz", ".json"):
+            path = self._project_dir(project_id) / f"v{version_number}.{suffix}{extension}"
+            if path.exists():
+                path.unlink()
+
+    def _read_payload(self, project_id: int, entry: VersionIndexEntry) -> Any:
+        suffix = "snap" if entry.kind == "snapshot" else "delta"
+        for extension in (".json.gz", ".json"):
+            path = self._project_dir(project_id) / f"v{entry.version_number}.{suffix}{extension}"
+            if path.exists():
+                raw = path.read_bytes()
+                if extension == ".json.gz":
+                    raw = gzip.decompress(raw)
+                return json.loads(raw)
+        raise FileNotFoundError(f"Payload da versão {entry.version_number} não encontrado")
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    def list_versions(self, project_id: int, limit: Optional[int] = None) -> List[VersionIndexEntry]:
+        """Versões do projeto, mais recente primeiro (apenas metadados)"""
+        with self._lock:
+            entries = list(reversed(self._index(project_id)))
+        return entries[:limit] if limit else entries
+
+    def latest(self, project_id: int) -> Optional[VersionIndexEntry]:
+        with self._lock:
+            index = self._index(project_id)
+            return index[-1] if index else None
+
+    def count(self, project_id: int) -> int:
+        with self._lock:
+            return len(self._index(project_id))
+
+    def find(self, project_id: int, version_id: str) -> Optional[VersionIndexEntry]:
+        with self._lock:
+            return next((e for e in self._index(project_id) if e.id == version_id), None)
+
+    def append(self, project_id: int, entry: VersionIndexEntry, data: Any) -> VersionIndexEntry:
+        """
+        Gravar uma nova versão (snapshot ou delta contra a anterior).
+
+        `entry.version_number`, `kind`, `base` e `stored_size` são definidos
+        aqui; os demais metadados vêm do chamador.
+        """
+        with self._lock:
+            index = self._index(project_id)
+            self._project_dir(project_id).mkdir(parents=True, exist_ok=True)
+
+            previous = index[-1] if index else None
+            entry.version_number = previous.version_number + 1 if previous else 1
+
+            patch = None
+            if previous is not None and not self._snapshot_due(index):
+                head = self._head(project_id, previous)
+                patch = json_diff(head, data)
+                patch_size = len(json.dumps(patch, separators=(",", ":")))
+                if patch_size > entry.size * self.max_delta_ratio:
+                    patch = None
+
+            if patch is None:
+                entry.kind, entry.base = "snapshot", None
+                payload = data
+            else:
+                entry.kind, entry.base = "delta", previous.version_number
+                payload = patch
+
+            entry.stored_size = self._write_payload(
+                self._payload_path(project_id, entry.version_number, entry.kind), payload
+            )
+            self._append_index(project_id, entry)
+            index.append(entry)
+            self._heads[project_id] = copy.deepcopy(data)
+            return entry
+
+    def _snapshot_due(self, index: List[VersionIndexEntry]) -> bool:
+        since_snapshot = 0
+        for entry in reversed(index):
+            if entry.kind == "snapshot":
+                break
+            since_snapshot += 1
+        return since_snapshot + 1 >= self.snapshot_interval
+
+    def _head(self, project_id: int, latest: VersionIndexEntry) -> Any:
+        if project_id not in self._heads:
+            self._heads[project_id] = self._materialize(project_id, latest.version_number)
+        return self._heads[project_id]
+
+    def _materialize(self, project_id: int, version_number: int) -> Any:
+        index = self._index(project_id)
+        position = next(i for i, e in enumerate(index) if e.version_number == version_number)
+
+        start = position
+        while index[start].kind != "snapshot":
+            start -= 1
+            if start < 0:
+                raise ValueError(f"Cadeia de deltas sem snapshot no projeto {project_id}")
+
+        data = self._read_payload(project_id, index[start])
+        for entry in index[start + 1:position + 1]:
+            data = apply_patch(data, self._read_payload(project_id, entry))
+        return data
+
+    def load_data(self, project_id: int, version_number: int) -> Any:
+        """Reconstruir os dados completos de uma versão"""
+        with self._lock:
+            latest = self.latest(project_id)
+            if latest is not None and latest.version_number == version_number:
+                return copy.deepcopy(self._head(project_id, latest))
+            return self._materialize(project_id, version_number)
+
+    def delete_versions(self, project_id: int, version_numbers: Iterable[int]) -> int:
+        """
+        Remover versões, convertendo em snapshot os deltas que dependiam delas.
+
+        Returns:
+            int: quantidade de versões removidas
+        """
+        with self._lock:
+            index = self._index(project_id)
+            doomed = set(version_numbers)
+            if not doomed:
+                return 0
+
+            survivors = [e for e in index if e.version_number not in doomed]
+            previous_by_number = {
+                entry.version_number: index[i - 1].version_number if i > 0 else None
+                for i, entry in enumerate(index)
+            }
+
+            # Rebase antes de apagar qualquer payload
+            for entry in survivors:
+                if entry.kind == "delta" and previous_by_number[entry.version_number] in doomed:
+                    data = self._materialize(project_id, entry.version_number)
+                    entry.stored_size = self._write_payload(
+                        self._payload_path(project_id, entry.version_number, "snapshot"), data
+                    )
+                    self._remove_payload(project_id, entry.version_number, "delta")
+                    entry.kind, entry.base = "snapshot", None
+
+            removed = 0
+            for entry in index:
+                if entry.version_number in doomed:
+                    self._remove_payload(project_id, entry.version_number, entry.kind)
+                    removed += 1
+
+            if index and index[-1].version_number in doomed:
+                self._heads.pop(project_id, None)
+            self._indexes[project_id] = survivors
+            self._rewrite_index(project_id)
+            return removed
+
+    def project_ids(self) -> List[int]:
+        ids = []
+        for path in self.root_dir.glob("project_*"):
+            if path.is_dir():
+                try:
+                    ids.append(int(path.name.split("_", 1)[1]))
+                except ValueError:
+                    pass
+        return ids
+
+    def get_stats(self, project_id: int) -> Dict[str, Any]:
+        with self._lock:
+            index = self._index(project_id)
+            return {
+                "versions": len(index),
+                "snapshots": sum(1 for e in index if e.kind == "snapshot"),
+                "deltas": sum(1 for e in index if e.kind == "delta"),
+                "logical_bytes": sum(e.size for e in index),
+                "stored_bytes": sum(e.stored_size for e in index),
+            }
@@ -7,6 +7,7 @@ from app.models import Scene, Asset, Project
 import logging
 from fastapi import BackgroundTasks
 import shutil
+from app.core.tracing import ensure_trace, span
 
 def process_scene_with_ia(scene: Scene, assets: List[Asset], tts_model: str = "coqui", avatar_model: str = "hunyuan3d2") -> dict:
     """
@@ -18,13 +19,15 @@ def process_scene_with_ia(scene: Scene, assets: List[Asset], tts_model: str = "c
     # 1. Gerar narração TTS
     tts_path = os.path.join(output_dir, "narration.mp3")
     logging.info(f"[Pipeline IA] Gerando TTS para cena {scene.id}...")
-    generate_tts_narration(scene.texto or "", tts_path, model=tts_model)
+    with span("video.scene.tts", category="tts", scene_id=scene.id, model=tts_model):
+        generate_tts_narration(scene.texto or "", tts_path, model=tts_model)
     # 2. Gerar avatar IA (se necessário)
     avatar_path = None
     if hasattr(scene, "avatar") and scene.avatar:
         avatar_path = os.path.join(output_dir, "avatar.mp4")
         logging.info(f"[Pipeline IA] Gerando avatar IA para cena {scene.id}...")
-        generate_avatar_video(scene.texto or "", tts_path, avatar_path, model=avatar_model)
+        with span("video.scene.avatar", category="video", scene_id=scene.id, model=avatar_model):
+            generate_avatar_video(scene.texto or "", tts_path, avatar_path, model=avatar_model)
     # 3. Gerar vídeo da cena (imagem de fundo + áudio + assets)
     bg_img = None
     for asset in assets:
@@ -38,7 +41,8 @@ def process_scene_with_ia(scene: Scene, assets: List[Asset], tts_model: str = "c
     clip = ImageClip(bg_img).set_duration(duration).set_audio(AudioFileClip(tts_path))
     # TODO: adicionar outros assets (imagens, overlays, etc) como layers
     scene_video_path = os.path.join(output_dir, "scene_final.mp4")
-    clip.write_videofile(scene_video_path, fps=24, codec="libx264", audio_codec="aac")
+    with span("video.scene.encode", category="video", scene_id=scene.id, duration=duration):
+        clip.write_videofile(scene_video_path, fps=24, codec="libx264", audio_codec="aac")
     logging.info(f"[Pipeline IA] Cena {scene.id} processada com sucesso: {scene_video_path}")
     return {"scene_id": scene.id, "video_path": scene_video_path, "tts_path": tts_path, "avatar_path": avatar_path}
 
@@ -47,22 +51,26 @@ def export_project_video_with_ia(project: Project, scenes: List[Scene], all_asse
     Exporta vídeo final do projeto: processa cada cena com IA, une vídeos e retorna caminho do MP4 final.
     """
     logging.info(f"[Pipeline IA] Exportando vídeo final do projeto {project.id} - '{project.name}'")
-    scene_videos = []
-    temp_dirs = []
-    for scene in scenes:
-        scene_assets = [a for a in all_assets if a.scene_id == scene.id]
-        result = process_scene_with_ia(scene, scene_assets, tts_model, avatar_model)
-        scene_videos.append(result["video_path"])
-        temp_dirs.append(os.path.dirname(result["video_path"]))
-    # Unir vídeos das cenas
-    logging.info(f"[Pipeline IA] Unindo vídeos das cenas...")
-    clips = [AudioFileClip(v) if v.endswith(".mp3") else ImageClip(v) for v in scene_videos]
-    video_clips = [c if hasattr(c, 'set_audio') else c for c in clips]
-    final_clip = concatenate_videoclips(video_clips, method="compose")
-    output_dir = f"app/static/videos/generated/project_{project.id}"
-    os.makedirs(output_dir, exist_ok=True)
-    final_video_path = os.path.join(output_dir, "final_project_video.mp4")
-    final_clip.write_videofile(final_video_path, fps=24, codec="libx264", audio_codec="aac")
+    with ensure_trace("video.export", project_id=project.id, scenes=len(scenes)):
+        scene_videos = []
+        temp_dirs = []
+        for scene in scenes:
+            scene_assets = [a for a in all_assets if a.scene_id == scene.id]
+            with span("video.scene", category="video", scene_id=scene.id):
+                result = process_scene_with_ia(scene, scene_assets, tts_model, avatar_model)
+            scene_videos.append(result["video_path"])
+            temp_dirs.append(os.path.dirname(result["video_path"]))
+        # Unir vídeos das cenas
+        logging.info(f"[Pipeline IA] Unindo vídeos das cenas...")
+        with span("video.concatenate", category="video", clips=len(scene_videos)):
+            clips = [AudioFileClip(v) if v.endswith(".mp3") else ImageClip(v) for v in scene_videos]
+            video_clips = [c if hasattr(c, 'set_audio') else c for c in clips]
+            final_clip = concatenate_videoclips(video_clips, method="compose")
+        output_dir = f"app/static/videos/generated/project_{project.id}"
+        os.makedirs(output_dir, exist_ok=True)
+        final_video_path = os.path.join(output_dir, "final_project_video.mp4")
+        with span("video.encode_final", category="video"):
+            final_clip.write_videofile(final_video_path, fps=24, codec="libx264", audio_codec="aac")
     logging.info(f"[Pipeline IA] Exportação finalizada: {final_video_path}")
     # Limpeza de arquivos temporários
     for d in temp_dirs:
@@ -0,0 +1,96 @@
+"""
+Utilitários do TecnoCursos AI
+Fachada compatível para os módulos de app.utils
+
+O antigo app/utils.py foi dividido por domínio:
+    files      - upload, validação e armazenamento de arquivos
+    text       - análise de texto (estatísticas, palavras-chave, resumo)
+    documents  - PDF/PPTX: extração, thumbnails, processamento em lote (PyMuPDF)
+    slides     - renderização de slides e frames (PIL)
+    narration  - narração TTS
+    video      - vídeos, avatar e apresentações (MoviePy)
+
+`from app.utils import X` continua funcionando: cada nome é resolvido no
+primeiro acesso, importando apenas o submódulo que o define. Assim
+`from app.utils import format_file_size` não carrega PyMuPDF, PIL, MoviePy
+nem o serviço TTS. Código novo pode importar direto do submódulo
+(`from app.utils.files import format_file_size`).
+"""
+
+import importlib
+from typing import Dict, List
+
+_EXPORTS: Dict[str, tuple] = {
+    "files": (
+        'magic', 'MAGIC_AVAILABLE', 'ALLOWED_EXTENSIONS', 'MAX_FILE_SIZE_MB', 'UPLOAD_DIRECTORY',
+        'VIDEO_DIRECTORY', 'THUMBNAIL_DIRECTORY', 'ensure_directories_exist',
+        'generate_unique_filename', 'sanitize_filename', 'validate_file_type', 'validate_file_size',
+        'get_file_type_directory', 'save_uploaded_file', 'calculate_file_checksum', 'delete_file',
+        'format_file_size', 'get_storage_usage', 'get_directory_size', 'cleanup_old_files',
+        'validate_file', 'get_file_metadata', 'test_utils'
+    ),
+    "text": (
+        'clean_extracted_text', 'extract_context', 'search_text_in_pages',
+        'extract_search_contexts', 'analyze_text_statistics', 'extract_keywords',
+        'generate_text_summary', 'analyze_text_language_patterns'
+    ),
+    "documents": (
+        'fitz', 'get_file_info', 'get_pdf_info', 'get_pptx_info', 'create_thumbnail',
+        'create_multiple_thumbnails', 'get_pdf_page_info', 'extract_pdf_text_with_formatting',
+        'search_text_in_pdf', 'extract_text_from_pptx', 'extract_pdf_text', 'extract_pptx_text',
+        'extract_text_from_pdf', 'batch_process_files', 'batch_search_across_files',
+        'search_indexed_library', 'export_batch_results_to_json', 'create_batch_processing_report'
+    ),
+    "slides": (
+        'Image', 'ImageDraw', 'ImageFont', '_create_video_frames', '_add_visual_elements',
+        '_get_enhanced_template_config', '_create_enhanced_video_frames',
+        '_apply_background_effects', '_apply_gradient', '_apply_soft_gradient', '_apply_tech_grid',
+        '_apply_professional_border', '_apply_cyber_border', '_apply_friendly_border',
+        '_setup_enhanced_fonts', '_format_text_for_display', '_create_text_layer',
+        '_apply_final_effects', '_get_template_config', '_create_advanced_slide_image',
+        '_create_gradient_background', '_add_background_effects', '_draw_tech_grid',
+        '_draw_corporate_lines', '_draw_education_elements', '_render_advanced_text',
+        '_wrap_text_advanced', '_render_basic_text_fallback', '_add_decorative_elements',
+        '_create_slide_image', '_wrap_text'
+    ),
+    "narration": (
+        'TTSService', 'TTSConfig', 'TTSProvider', 'AudioResult', 'tts_available',
+        '_get_audio_duration', 'generate_narration', 'generate_narration_sync',
+        '_generate_tts_audio', '_create_silent_audio_fallback', 'TTS_AVAILABLE'
+    ),
+    "video": (
+        'ImageClip', 'AudioFileClip', 'MOVIEPY_AVAILABLE', 'PIL_AVAILABLE', 'generate_avatar_video',
+        '_check_avatar_cache', '_detect_language_and_configure', '_check_avatar_apis_availability',
+        '_test_d_id_api_connection', '_test_synthesia_api_connection',
+        '_generate_real_avatar_video', '_generate_with_d_id_api', '_generate_with_synthesia_api',
+        '_generate_enhanced_slide_video', '_combine_frames_with_audio', '_combine_with_opencv',
+        '_combine_with_ffmpeg', '_cleanup_temp_files', '_create_error_result',
+        '_create_cached_result', '_save_to_avatar_cache', '_calculate_video_quality_score',
+        '_calculate_quality_score', 'create_video_from_text_and_audio',
+        'create_video_pipeline_automatic', 'create_batch_videos', 'optimize_video_for_platform',
+        'create_videos_from_pdf_and_audio', 'optimize_batch_processing',
+        'stitch_videos_to_presentation', '_create_intro_slide_clip', '_create_outro_slide_clip',
+        'create_complete_presentation_from_pdf', 'concatenate_videos', 'create_videos_for_slides'
+    ),
+}
+
+_NAME_TO_MODULE: Dict[str, str] = {
+    name: module for module, names in _EXPORTS.items() for name in names
+}
+
+__all__: List[str] = [name for name in _NAME_TO_MODULE if not name.startswith("_")]
+
+
+def __getattr__(name: str):
+    module = _NAME_TO_MODULE.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    # Flags calculadas sob demanda (TTS_AVAILABLE) não são fixadas na fachada
+    if name != "TTS_AVAILABLE":
+        globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_NAME_TO_MODULE))
@@ -0,0 +1,66 @@
+"""
+Imports sob demanda para os módulos de app.utils
+
+`lazy_import("fitz")` devolve um proxy que só importa o módulo no primeiro
+acesso a atributo ou chamada; `lazy_import("moviepy.editor", "ImageClip")`
+faz o mesmo para um atributo do módulo. Assim `fitz.open(...)` e
+`ImageClip(...)` continuam funcionando no corpo das funções, mas o custo do
+import (e a falha, se a dependência não estiver instalada) aparece apenas
+quando a função é usada.
+"""
+
+import importlib
+import importlib.util
+import threading
+from typing import Any, Optional
+
+
+class LazyImport:
+    """Proxy para um módulo (ou atributo de módulo) importado no primeiro uso"""
+
+    __slots__ = ("_module", "_attr", "_target", "_lock")
+
+    def __init__(self, module: str, attr: Optional[str] = None):
+        object.__setattr__(self, "_module", module)
+        object.__setattr__(self, "_attr", attr)
+        object.__setattr__(self, "_target", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _load(self) -> Any:
+        target = self._target
+        if target is None:
+            with self._lock:
+                target = self._target
+                if target is None:
+                    target = importlib.import_module(self._module)
+                    if self._attr:
+                        target = getattr(target, self._attr)
+                    object.__setattr__(self, "_target", target)
+        return target
+
+    @property
+    def loaded(self) -> bool:
+        return self._target is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        name = f"{self._module}.{self._attr}" if self._attr else self._module
+        state = "carregado" if self.loaded else "pendente"
+        return f"<LazyImport {name} ({state})>"
+
+
+def lazy_import(module: str, attr: Optional[str] = None) -> LazyImport:
+    return LazyImport(module, attr)
+
+
+def module_available(name: str) -> bool:
+    """Verifica se o pacote está instalado sem executá-lo (find_spec do nível raiz)"""
+    try:
+        return importlib.util.find_spec(name.split(".")[0]) is not None
+    except (ImportError, ValueError):
+        return False
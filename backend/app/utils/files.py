@@ -0,0 +1,458 @@
+"""
+Utilitários de arquivos - TecnoCursos AI
+Nomes únicos, validações, salvamento de uploads, checksums e uso de disco
+
+Módulo leve: não depende das pilhas de PDF, imagem, vídeo ou TTS.
+"""
+
+from __future__ import annotations
+
+import os
+import hashlib
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from ._lazy import lazy_import, module_available
+
+magic = lazy_import("magic")
+MAGIC_AVAILABLE = module_available("magic")
+
+# Configurações de arquivos
+ALLOWED_EXTENSIONS = ['.pdf', '.pptx']
+MAX_FILE_SIZE_MB = 50
+UPLOAD_DIRECTORY = "app/static/uploads"
+VIDEO_DIRECTORY = "app/static/videos"
+THUMBNAIL_DIRECTORY = "app/static/thumbnails"
+
+def ensure_directories_exist():
+    """
+    Garantir que todos os diretórios necessários existam
+    Cria os diretórios se eles não existirem
+    """
+    directories = [
+        UPLOAD_DIRECTORY,
+        VIDEO_DIRECTORY,
+        THUMBNAIL_DIRECTORY,
+        f"{UPLOAD_DIRECTORY}/pdf",
+        f"{UPLOAD_DIRECTORY}/pptx",
+        f"{VIDEO_DIRECTORY}/processed",
+        f"{THUMBNAIL_DIRECTORY}/videos"
+    ]
+    
+    for directory in directories:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+    
+    print(f"✅ Diretórios criados/verificados: {len(directories)} diretórios")
+
+def generate_unique_filename(original_filename: str, user_id: int = 1) -> str:
+    """
+    Gerar nome único para arquivo evitando conflitos
+    
+    Args:
+        original_filename: Nome original do arquivo
+        user_id: ID do usuário (para organização)
+    
+    Returns:
+        str: Nome único do arquivo
+    """
+    # Extrair extensão do arquivo
+    file_extension = Path(original_filename).suffix.lower()
+    
+    # Gerar timestamp único
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    # Gerar UUID curto para garantir unicidade
+    unique_id = str(uuid.uuid4()).replace('-', '')[:8]
+    
+    # Nome base sem extensão
+    base_name = Path(original_filename).stem
+    
+    # Remover caracteres especiais do nome base
+    clean_base_name = sanitize_filename(base_name)
+    
+    # Construir nome único
+    unique_filename = f"{user_id}_{timestamp}_{unique_id}_{clean_base_name}{file_extension}"
+    
+    return unique_filename
+
+def sanitize_filename(filename: str) -> str:
+    """
+    Limpar nome do arquivo removendo caracteres especiais
+    
+    Args:
+        filename: Nome do arquivo original
+    
+    Returns:
+        str: Nome limpo e seguro
+    """
+    # Caracteres permitidos: letras, números, underscore, hífen
+    import re
+    
+    # Remover acentos e caracteres especiais
+    filename = filename.replace(' ', '_')
+    filename = re.sub(r'[^\w\-_\.]', '', filename)
+    
+    # Limitar tamanho
+    if len(filename) > 50:
+        filename = filename[:50]
+    
+    return filename
+
+def validate_file_type(filename: str) -> bool:
+    """
+    Validar se o tipo de arquivo é permitido
+    
+    Args:
+        filename: Nome do arquivo
+    
+    Returns:
+        bool: True se arquivo é válido
+    """
+    if not filename:
+        return False
+    
+    file_extension = Path(filename).suffix.lower()
+    return file_extension in ALLOWED_EXTENSIONS
+
+def validate_file_size(file_size: int) -> bool:
+    """
+    Validar tamanho do arquivo
+    
+    Args:
+        file_size: Tamanho em bytes
+    
+    Returns:
+        bool: True se tamanho é válido
+    """
+    max_size_bytes = MAX_FILE_SIZE_MB * 1024 * 1024
+    return 0 < file_size <= max_size_bytes
+
+def get_file_type_directory(filename: str) -> str:
+    """
+    Obter diretório baseado no tipo de arquivo
+    
+    Args:
+        filename: Nome do arquivo
+    
+    Returns:
+        str: Caminho do diretório específico
+    """
+    file_extension = Path(filename).suffix.lower()
+    
+    if file_extension == '.pdf':
+        return f"{UPLOAD_DIRECTORY}/pdf"
+    elif file_extension == '.pptx':
+        return f"{UPLOAD_DIRECTORY}/pptx"
+    else:
+        return UPLOAD_DIRECTORY
+
+async def save_uploaded_file(file, user_id: int = 1) -> str:
+    """
+    Salvar arquivo enviado no sistema de arquivos
+    
+    Args:
+        file: UploadFile do FastAPI
+        user_id: ID do usuário (padrão 1 para testes)
+    
+    Returns:
+        str: Caminho completo do arquivo salvo
+    
+    Raises:
+        ValueError: Se arquivo for inválido
+        IOError: Se houver erro ao salvar
+    """
+    # Garantir que diretórios existam
+    ensure_directories_exist()
+    
+    # Validar tipo de arquivo
+    if not validate_file_type(file.filename):
+        raise ValueError(f"Tipo de arquivo não suportado: {file.filename}")
+    
+    # Ler conteúdo do arquivo
+    file_content = await file.read()
+    file_size = len(file_content)
+    
+    # Validar tamanho
+    if not validate_file_size(file_size):
+        raise ValueError(f"Arquivo muito grande: {file_size / (1024*1024):.2f}MB. Máximo: {MAX_FILE_SIZE_MB}MB")
+    
+    # Gerar nome único
+    unique_filename = generate_unique_filename(file.filename, user_id)
+    
+    # Determinar diretório de destino
+    target_directory = get_file_type_directory(file.filename)
+    
+    # Caminho completo do arquivo
+    file_path = os.path.join(target_directory, unique_filename)
+    
+    try:
+        # Salvar arquivo
+        with open(file_path, "wb") as buffer:
+            buffer.write(file_content)
+        
+        print(f"✅ Arquivo salvo: {file_path} ({file_size / 1024:.2f} KB)")
+        return file_path
+        
+    except Exception as e:
+        print(f"❌ Erro ao salvar arquivo: {e}")
+        raise IOError(f"Erro ao salvar arquivo: {str(e)}")
+
+def calculate_file_checksum(file_path: str) -> str:
+    """
+    Calcular checksum MD5 do arquivo para verificação de integridade
+    
+    Args:
+        file_path: Caminho do arquivo
+    
+    Returns:
+        str: Hash MD5 hexadecimal
+    """
+    hash_md5 = hashlib.md5()
+    
+    try:
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(4096), b""):
+                hash_md5.update(chunk)
+        
+        return hash_md5.hexdigest()
+        
+    except Exception as e:
+        print(f"❌ Erro ao calcular checksum: {e}")
+        return ""
+
+def delete_file(file_path: str) -> bool:
+    """
+    Deletar arquivo do sistema de arquivos
+    
+    Args:
+        file_path: Caminho do arquivo
+    
+    Returns:
+        bool: True se arquivo foi deletado com sucesso
+    """
+    try:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+            print(f"✅ Arquivo deletado: {file_path}")
+            return True
+        else:
+            print(f"⚠️ Arquivo não encontrado: {file_path}")
+            return False
+            
+    except Exception as e:
+        print(f"❌ Erro ao deletar arquivo: {e}")
+        return False
+
+def format_file_size(size_bytes: int) -> str:
+    """
+    Formatar tamanho do arquivo em formato legível
+    
+    Args:
+        size_bytes: Tamanho em bytes
+    
+    Returns:
+        str: Tamanho formatado (ex: "1.5 MB")
+    """
+    if size_bytes == 0:
+        return "0 B"
+    
+    size_names = ["B", "KB", "MB", "GB", "TB"]
+    import math
+    i = int(math.floor(math.log(size_bytes, 1024)))
+    p = math.pow(1024, i)
+    s = round(size_bytes / p, 2)
+    
+    return f"{s} {size_names[i]}"
+
+def get_storage_usage() -> dict:
+    """
+    Obter informações de uso de armazenamento
+    
+    Returns:
+        dict: Informações de uso de espaço
+    """
+    usage = {
+        'total_files': 0,
+        'total_size': 0,
+        'pdf_files': 0,
+        'pptx_files': 0,
+        'videos': 0,
+        'directories': {}
+    }
+    
+    try:
+        directories_to_check = [
+            UPLOAD_DIRECTORY,
+            VIDEO_DIRECTORY,
+            THUMBNAIL_DIRECTORY
+        ]
+        
+        for directory in directories_to_check:
+            if os.path.exists(directory):
+                dir_info = get_directory_size(directory)
+                usage['directories'][directory] = dir_info
+                usage['total_files'] += dir_info['file_count']
+                usage['total_size'] += dir_info['total_size']
+        
+        return usage
+        
+    except Exception as e:
+        print(f"❌ Erro ao calcular uso de armazenamento: {e}")
+        return usage
+
+def get_directory_size(directory: str) -> dict:
+    """
+    Calcular tamanho total de um diretório
+    
+    Args:
+        directory: Caminho do diretório
+    
+    Returns:
+        dict: Informações do diretório
+    """
+    total_size = 0
+    file_count = 0
+    
+    try:
+        for dirpath, dirnames, filenames in os.walk(directory):
+            for filename in filenames:
+                file_path = os.path.join(dirpath, filename)
+                if os.path.exists(file_path):
+                    total_size += os.path.getsize(file_path)
+                    file_count += 1
+        
+        return {
+            'total_size': total_size,
+            'file_count': file_count,
+            'formatted_size': format_file_size(total_size)
+        }
+        
+    except Exception as e:
+        print(f"❌ Erro ao calcular tamanho do diretório: {e}")
+        return {'total_size': 0, 'file_count': 0, 'formatted_size': '0 B'}
+
+def cleanup_old_files(days_old: int = 30) -> int:
+    """
+    Limpar arquivos antigos do sistema
+    
+    Args:
+        days_old: Idade em dias para considerar arquivo antigo
+    
+    Returns:
+        int: Número de arquivos deletados
+    """
+    from datetime import timedelta
+    
+    cutoff_date = datetime.now() - timedelta(days=days_old)
+    deleted_count = 0
+    
+    try:
+        directories_to_clean = [UPLOAD_DIRECTORY, VIDEO_DIRECTORY, THUMBNAIL_DIRECTORY]
+        
+        for directory in directories_to_clean:
+            if os.path.exists(directory):
+                for root, dirs, files in os.walk(directory):
+                    for file in files:
+                        file_path = os.path.join(root, file)
+                        
+                        # Verificar data de modificação
+                        if os.path.exists(file_path):
+                            file_time = datetime.fromtimestamp(os.path.getmtime(file_path))
+                            
+                            if file_time < cutoff_date:
+                                if delete_file(file_path):
+                                    deleted_count += 1
+        
+        print(f"✅ Limpeza concluída: {deleted_count} arquivos removidos")
+        return deleted_count
+        
+    except Exception as e:
+        print(f"❌ Erro na limpeza de arquivos: {e}")
+        return 0
+
+def validate_file(file_content: bytes, file_extension: str) -> bool:
+    """
+    Valida se o arquivo está íntegro baseado no conteúdo e extensão
+    """
+    try:
+        # Verificar magic bytes básicos
+        if file_extension == '.pdf':
+            return file_content.startswith(b'%PDF-')
+        elif file_extension == '.pptx':
+            # Arquivo ZIP (PPTX é baseado em ZIP)
+            return file_content.startswith(b'PK\x03\x04')
+        elif file_extension == '.docx':
+            # Arquivo ZIP (DOCX é baseado em ZIP)
+            return file_content.startswith(b'PK\x03\x04')
+        
+        # Se python-magic estiver disponível, usar verificação avançada
+        if MAGIC_AVAILABLE:
+            try:
+                file_type = magic.from_buffer(file_content, mime=True)
+                return file_type is not None
+            except:
+                pass
+        
+        return True
+    except Exception:
+        return False
+
+def get_file_metadata(file_path: Path, file_extension: str) -> dict:
+    """
+    Extrai metadados básicos do arquivo
+    """
+    metadata = {
+        "file_size": file_path.stat().st_size,
+        "created_at": file_path.stat().st_ctime,
+        "modified_at": file_path.stat().st_mtime,
+        "extension": file_extension
+    }
+    
+    try:
+        if file_extension == '.pdf':
+            # Metadados básicos para PDF
+            metadata["type"] = "pdf"
+            metadata["page_count"] = 1  # Placeholder
+            
+        elif file_extension in ['.pptx', '.docx']:
+            metadata["type"] = "office_document"
+            
+    except Exception as e:
+        print(f"Erro ao extrair metadados: {e}")
+    
+    return metadata
+
+# Função para teste das utilidades
+def test_utils():
+    """
+    Função para testar as utilidades
+    """
+    print("🔧 Testando funções utilitárias...")
+    
+    try:
+        # Testar criação de diretórios
+        ensure_directories_exist()
+        
+        # Testar validações
+        assert validate_file_type("documento.pdf") == True
+        assert validate_file_type("apresentacao.pptx") == True
+        assert validate_file_type("arquivo.txt") == False
+        print("✅ Validação de tipos funcionando")
+        
+        # Testar geração de nome único
+        unique_name = generate_unique_filename("test_file.pdf", 1)
+        assert unique_name.endswith(".pdf")
+        assert "test_file" in unique_name
+        print(f"✅ Geração de nome único: {unique_name}")
+        
+        # Testar formatação de tamanho
+        assert format_file_size(1024) == "1.0 KB"
+        assert format_file_size(1048576) == "1.0 MB"
+        print("✅ Formatação de tamanho funcionando")
+        
+        print("🎉 Funções utilitárias testadas com sucesso!")
+        
+    except Exception as e:
+        print(f"❌ Erro ao testar utilidades: {e}")
+        raise
@@ -0,0 +1,478 @@
+"""
+Engine de narração - TecnoCursos AI
+Geração de narração TTS (Bark/gTTS via backend.services.tts_service) e
+utilitários de áudio. O serviço TTS (torch/transformers) é importado apenas
+na primeira narração.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Optional, Dict
+
+from ._lazy import lazy_import
+
+# Classes do serviço TTS: o módulo só é importado quando usadas
+TTSService = lazy_import("backend.services.tts_service", "TTSService")
+TTSConfig = lazy_import("backend.services.tts_service", "TTSConfig")
+TTSProvider = lazy_import("backend.services.tts_service", "TTSProvider")
+AudioResult = lazy_import("backend.services.tts_service", "AudioResult")
+
+
+def tts_available() -> bool:
+    """
+    Verifica (uma vez, no primeiro uso) se o serviço TTS pode ser importado.
+    O resultado fica em TTS_AVAILABLE.
+    """
+    global TTS_AVAILABLE
+    if "TTS_AVAILABLE" not in globals():
+        try:
+            import backend.services.tts_service  # noqa: F401
+            TTS_AVAILABLE = True
+        except ImportError:
+            print("Servico TTS nao disponivel - instale as dependencias: pip install torch transformers gtts pydub")
+            TTS_AVAILABLE = False
+    return TTS_AVAILABLE
+
+
+def __getattr__(name):
+    if name == "TTS_AVAILABLE":
+        return tts_available()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_audio_duration(audio_path: str) -> float:
+    """
+    Obtém a duração do arquivo de áudio em segundos.
+    
+    Args:
+        audio_path (str): Caminho do arquivo de áudio
+    
+    Returns:
+        float: Duração em segundos (0.0 se erro)
+    """
+    try:
+        # Tentar usar mutagen para obter informações do áudio
+        try:
+            from mutagen import File
+            audio_file = File(audio_path)
+            if audio_file and audio_file.info:
+                duration = audio_file.info.length
+                return float(duration)
+        except ImportError:
+            print("⚠️ mutagen não disponível, usando método alternativo")
+        
+        # Método alternativo usando FFmpeg (se disponível)
+        try:
+            import subprocess
+            result = subprocess.run([
+                'ffprobe', '-v', 'quiet', '-show_entries', 
+                'format=duration', '-of', 'csv=p=0', audio_path
+            ], capture_output=True, text=True, timeout=10)
+            
+            if result.returncode == 0:
+                return float(result.stdout.strip())
+        except (subprocess.SubprocessError, FileNotFoundError, ValueError):
+            print("⚠️ FFmpeg não disponível")
+        
+        # Fallback: estimar duração baseado no tamanho do arquivo
+        # Para MP3: aproximadamente 1MB = 60-80 segundos (128kbps)
+        file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
+        estimated_duration = file_size_mb * 70  # Estimativa conservadora
+        
+        print(f"⚠️ Usando estimativa de duração: {estimated_duration:.2f}s baseado no tamanho")
+        return estimated_duration
+        
+    except Exception as e:
+        print(f"❌ Erro ao obter duração do áudio: {e}")
+        return 10.0  # Fallback: 10 segundos
+
+
+# ============================================================================
+# FUNÇÃO DE NARRAÇÃO DE TEXTO (TTS - TEXT-TO-SPEECH)
+# ============================================================================
+
+async def generate_narration(
+    text: str, 
+    output_path: str,
+    voice: Optional[str] = None,
+    provider: str = "auto",
+    language: str = "pt"
+) -> Dict:
+    """
+    Gera narração em áudio MP3 a partir de texto usando modelos TTS da Hugging Face
+    
+    Args:
+        text (str): Texto para narrar (máximo recomendado: 1000 caracteres por vez)
+        output_path (str): Caminho completo onde salvar o arquivo MP3
+        voice (str, optional): Voz específica a usar (ex: "v2/pt_speaker_0" para Bark)
+        provider (str): Provedor TTS ("bark", "gtts", "auto")
+        language (str): Código do idioma (padrão: "pt" para português)
+    
+    Returns:
+        Dict: Resultado da geração com success, audio_path, duration, provider_used, error
+        
+    Example:
+        >>> # Narração simples com gTTS (Google)
+        >>> result = await generate_narration(
+        ...     "Olá! Este é um teste de narração em português.",
+        ...     "narracao_teste.mp3"
+        ... )
+        >>> print(f"Sucesso: {result['success']}")
+        >>> print(f"Arquivo: {result['audio_path']}")
+        
+        >>> # Narração com Bark (Hugging Face) - voz específica
+        >>> result = await generate_narration(
+        ...     "Bem-vindos ao curso de inteligência artificial!",
+        ...     "intro_curso.mp3",
+        ...     voice="v2/pt_speaker_2",
+        ...     provider="bark"
+        ... )
+        
+    Note:
+        Para usar modelos Bark da Hugging Face:
+        1. Configure sua chave da Hugging Face (opcional para modelos públicos):
+           export HUGGINGFACE_TOKEN="sua_chave_aqui"
+           
+        2. Instale dependências:
+           pip install torch transformers torchaudio gtts pydub
+           
+        3. Para GPU (recomendado para Bark):
+           pip install torch torchvision torchaudio --index-url https://download.pytorch.org/whl/cu118
+           
+        4. Modelos disponíveis:
+           - Bark: Vozes naturais em português (v2/pt_speaker_0 a v2/pt_speaker_9)
+           - gTTS: Google TTS (mais rápido, menor qualidade)
+           
+        5. Configurações do ambiente:
+           - O modelo Bark requer ~2GB de VRAM
+           - Processamento pode levar 30s-2min dependendo do hardware
+           - Para produção, use cache de modelos pré-carregados
+    """
+    
+    # Verificar disponibilidade do serviço TTS
+    if not tts_available():
+        return {
+            'success': False,
+            'error': 'Serviço TTS não disponível. Instale as dependências necessárias.',
+            'audio_path': None,
+            'duration': 0.0,
+            'provider_used': None
+        }
+    
+    # Validar entrada
+    if not text or not text.strip():
+        return {
+            'success': False,
+            'error': 'Texto não pode estar vazio',
+            'audio_path': None,
+            'duration': 0.0,
+            'provider_used': None
+        }
+    
+    if len(text) > 2000:
+        return {
+            'success': False,
+            'error': f'Texto muito longo ({len(text)} caracteres). Máximo recomendado: 2000 caracteres.',
+            'audio_path': None,
+            'duration': 0.0,
+            'provider_used': None
+        }
+    
+    try:
+        # Garantir que o diretório de saída existe
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            Path(output_dir).mkdir(parents=True, exist_ok=True)
+        
+        # Configurar provedor TTS
+        if provider.lower() == "bark":
+            tts_provider = TTSProvider.BARK
+        elif provider.lower() == "gtts":
+            tts_provider = TTSProvider.GTTS
+        else:
+            tts_provider = TTSProvider.AUTO  # Auto-detecta melhor opção
+        
+        # Configurar TTS
+        tts_config = TTSConfig(
+            provider=tts_provider,
+            language=language,
+            voice=voice,
+            output_format="mp3"
+        )
+        
+        # Inicializar serviço TTS
+        tts_service = TTSService()
+        
+        # Verificar cache primeiro (se disponível)
+        cached_result = None
+        try:
+            from app.services.tts_cache_service import get_cached_tts_audio
+            cached_result = await get_cached_tts_audio(text, provider, voice, language)
+        except ImportError:
+            pass  # Cache não disponível
+        
+        if cached_result:
+            print(f"🎯 Áudio encontrado no cache!")
+            return cached_result
+        
+        # Registrar início da métrica
+        start_time = time.time()
+        
+        # Gerar áudio
+        print(f"🎤 Gerando narração com {provider}...")
+        print(f"📝 Texto: {text[:100]}{'...' if len(text) > 100 else ''}")
+        
+        result = await tts_service.generate_audio(
+            text=text,
+            config=tts_config,
+            output_path=output_path
+        )
+        
+        # Calcular tempo de processamento
+        processing_time = time.time() - start_time
+        
+        if result.success:
+            print(f"✅ Narração gerada com sucesso!")
+            print(f"📁 Arquivo: {result.audio_path}")
+            print(f"⏱️ Duração: {result.duration:.2f} segundos")
+            print(f"🔊 Provedor: {result.provider_used}")
+            print(f"⚡ Tempo de processamento: {processing_time:.2f}s")
+            
+            # Armazenar no cache (se disponível)
+            try:
+                from app.services.tts_cache_service import store_tts_audio
+                await store_tts_audio(
+                    text=text,
+                    provider=result.provider_used,
+                    audio_path=result.audio_path,
+                    duration=result.duration,
+                    voice=voice,
+                    language=language,
+                    metadata=result.metadata
+                )
+                print(f"💾 Áudio armazenado no cache")
+            except ImportError:
+                pass  # Cache não disponível
+            
+            # Registrar métrica (se disponível)
+            try:
+                from app.services.tts_analytics_service import record_tts_metric
+                await record_tts_metric(
+                    user_id=None,  # Será passado via contexto em versões futuras
+                    provider=result.provider_used,
+                    voice=voice,
+                    text_length=len(text),
+                    processing_time=processing_time,
+                    success=True,
+                    file_size=os.path.getsize(result.audio_path) if os.path.exists(result.audio_path) else 0,
+                    duration=result.duration,
+                    cached=False
+                )
+            except ImportError:
+                pass  # Analytics não disponível
+            
+            return {
+                'success': True,
+                'audio_path': result.audio_path,
+                'duration': result.duration,
+                'provider_used': result.provider_used,
+                'error': None,
+                'metadata': result.metadata,
+                'processing_time': processing_time,
+                'cached': False
+            }
+        else:
+            print(f"❌ Falha na geração: {result.error}")
+            
+            # Registrar métrica de erro (se disponível)
+            try:
+                from app.services.tts_analytics_service import record_tts_metric
+                await record_tts_metric(
+                    user_id=None,
+                    provider=result.provider_used or provider,
+                    voice=voice,
+                    text_length=len(text),
+                    processing_time=processing_time,
+                    success=False,
+                    error_type=result.error[:100] if result.error else "unknown_error"
+                )
+            except ImportError:
+                pass
+            
+            return {
+                'success': False,
+                'error': result.error or 'Erro desconhecido na geração de áudio',
+                'audio_path': None,
+                'duration': 0.0,
+                'provider_used': result.provider_used,
+                'processing_time': processing_time,
+                'cached': False
+            }
+            
+    except Exception as e:
+        error_msg = f"Erro na geração de narração: {str(e)}"
+        print(f"❌ {error_msg}")
+        return {
+            'success': False,
+            'error': error_msg,
+            'audio_path': None,
+            'duration': 0.0,
+            'provider_used': None
+        }
+
+
+def generate_narration_sync(
+    text: str, 
+    output_path: str,
+    voice: Optional[str] = None,
+    provider: str = "auto",
+    language: str = "pt"
+) -> Dict:
+    """
+    Versão síncrona da função generate_narration para uso sem async/await
+    
+    Args:
+        text (str): Texto para narrar
+        output_path (str): Caminho onde salvar o arquivo MP3
+        voice (str, optional): Voz específica a usar
+        provider (str): Provedor TTS ("bark", "gtts", "auto")
+        language (str): Código do idioma (padrão: "pt")
+    
+    Returns:
+        Dict: Resultado da geração
+        
+    Example:
+        >>> result = generate_narration_sync(
+        ...     "Olá! Este é um teste de narração.",
+        ...     "narracao.mp3"
+        ... )
+        >>> if result['success']:
+        ...     print(f"Áudio salvo em: {result['audio_path']}")
+    """
+    import asyncio
+    
+    # Executar a função async de forma síncrona
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    
+    return loop.run_until_complete(
+        generate_narration(text, output_path, voice, provider, language)
+    )
+
+
+def _generate_tts_audio(text: str, voice: str = "pt") -> dict:
+    """
+    Gera áudio usando TTS (Text-to-Speech) automático.
+    
+    Args:
+        text (str): Texto para conversão
+        voice (str): Idioma/voz
+    
+    Returns:
+        dict: Resultado da geração de áudio
+    """
+    try:
+        import time
+        start_time = time.time()
+        
+        # Criar nome único para arquivo temporário
+        temp_audio_name = f"temp_tts_{int(time.time())}_{hash(text) % 10000}.wav"
+        temp_audio_path = os.path.join("app/static/audios", temp_audio_name)
+        
+        # Garantir que diretório existe
+        os.makedirs(os.path.dirname(temp_audio_path), exist_ok=True)
+        
+        # Tentar usar gTTS primeiro
+        try:
+            from gtts import gTTS
+            
+            # Mapear idiomas
+            lang_map = {"pt": "pt", "en": "en", "es": "es"}
+            lang = lang_map.get(voice, "pt")
+            
+            # Gerar áudio
+            tts = gTTS(text=text, lang=lang, slow=False)
+            tts.save(temp_audio_path)
+            
+            generation_time = time.time() - start_time
+            
+            return {
+                'success': True,
+                'audio_path': temp_audio_path,
+                'method': 'gTTS',
+                'language': lang,
+                'generation_time': generation_time,
+                'file_size': os.path.getsize(temp_audio_path),
+                'error': None
+            }
+            
+        except ImportError:
+            print("⚠️ gTTS não disponível, criando áudio silencioso")
+            return _create_silent_audio_fallback(temp_audio_path, text)
+            
+        except Exception as e:
+            print(f"⚠️ Erro no gTTS: {e}, criando áudio silencioso")
+            return _create_silent_audio_fallback(temp_audio_path, text)
+            
+    except Exception as e:
+        return {
+            'success': False,
+            'audio_path': None,
+            'error': str(e)
+        }
+
+
+def _create_silent_audio_fallback(audio_path: str, text: str) -> dict:
+    """
+    Cria áudio silencioso como fallback quando TTS falha.
+    
+    Args:
+        audio_path (str): Caminho para salvar o áudio
+        text (str): Texto (usado para calcular duração)
+    
+    Returns:
+        dict: Resultado da criação de áudio
+    """
+    try:
+        import wave
+        import time
+        
+        # Calcular duração baseada no texto (aproximadamente)
+        words_per_minute = 150  # Velocidade média de leitura
+        word_count = len(text.split())
+        duration = max(3.0, (word_count / words_per_minute) * 60)  # Mínimo 3 segundos
+        
+        # Configurações de áudio
+        sample_rate = 44100
+        frames = int(duration * sample_rate)
+        
+        # Criar áudio silencioso
+        with wave.open(audio_path, 'w') as wav_file:
+            wav_file.setnchannels(1)  # Mono
+            wav_file.setsampwidth(2)  # 16-bit
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(b'\x00' * (frames * 2))  # Silêncio
+        
+        return {
+            'success': True,
+            'audio_path': audio_path,
+            'method': 'silent_fallback',
+            'language': 'silent',
+            'generation_time': 0.1,
+            'file_size': os.path.getsize(audio_path),
+            'duration': duration,
+            'error': None
+        }
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'audio_path': None,
+            'error': str(e)
+        }
@@ -0,0 +1,1194 @@
+"""
+Engine de renderização de slides - TecnoCursos AI
+Templates visuais, fundos, efeitos e quebra de texto para os frames dos
+vídeos. PIL é importado no primeiro uso.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import List
+
+from ._lazy import lazy_import
+
+Image = lazy_import("PIL.Image")
+ImageDraw = lazy_import("PIL.ImageDraw")
+ImageFont = lazy_import("PIL.ImageFont")
+
+def _create_video_frames(text: str, config: dict) -> str:
+    """
+    Cria os frames do vídeo com o texto formatado.
+    
+    Args:
+        text (str): Texto para exibir
+        config (dict): Configurações do vídeo
+    
+    Returns:
+        str: Caminho do arquivo de frame criado (None se erro)
+    """
+    try:
+        from PIL import Image, ImageDraw, ImageFont
+        import textwrap
+        
+        # Criar imagem com fundo
+        img = Image.new('RGB', (config['width'], config['height']), config['background_color'])
+        draw = ImageDraw.Draw(img)
+        
+        # Tentar carregar uma fonte melhor
+        try:
+            # Tentar fontes do sistema
+            if os.name == 'nt':  # Windows
+                font_path = "C:/Windows/Fonts/arial.ttf"
+            else:  # Linux/Mac
+                font_path = "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf"
+            
+            if os.path.exists(font_path):
+                font = ImageFont.truetype(font_path, config['font_size'])
+            else:
+                font = ImageFont.load_default()
+        except Exception:
+            font = ImageFont.load_default()
+        
+        # Quebrar texto em linhas
+        max_chars_per_line = (config['width'] - 2 * config['padding']) // (config['font_size'] // 2)
+        lines = textwrap.wrap(text, width=max_chars_per_line)
+        
+        # Calcular posicionamento vertical centralizado
+        line_height = config['font_size'] + 10
+        total_text_height = len(lines) * line_height
+        start_y = (config['height'] - total_text_height) // 2
+        
+        # Desenhar cada linha de texto
+        for i, line in enumerate(lines):
+            # Centralizar horizontalmente
+            bbox = draw.textbbox((0, 0), line, font=font)
+            text_width = bbox[2] - bbox[0]
+            x = (config['width'] - text_width) // 2
+            y = start_y + i * line_height
+            
+            # Desenhar texto com sombra (efeito visual)
+            shadow_offset = 2
+            draw.text((x + shadow_offset, y + shadow_offset), line, 
+                     fill=(0, 0, 0), font=font)  # Sombra preta
+            draw.text((x, y), line, fill=config['text_color'], font=font)  # Texto principal
+        
+        # Adicionar elementos visuais extras (opcional)
+        _add_visual_elements(draw, config)
+        
+        # Salvar frame
+        temp_dir = "temp"
+        os.makedirs(temp_dir, exist_ok=True)
+        frame_path = os.path.join(temp_dir, f"slide_frame_{int(time.time())}.png")
+        img.save(frame_path, 'PNG', quality=95)
+        
+        print(f"🖼️ Frame criado: {frame_path}")
+        return frame_path
+        
+    except Exception as e:
+        print(f"❌ Erro ao criar frames: {e}")
+        return None
+
+
+def _add_visual_elements(draw, config: dict):
+    """
+    Adiciona elementos visuais decorativos ao slide.
+    
+    Args:
+        draw: Objeto ImageDraw
+        config: Configurações do vídeo
+    """
+    try:
+        # Adicionar bordas decorativas
+        border_width = 5
+        border_color = (70, 130, 180)  # Azul aço
+        
+        # Borda superior
+        draw.rectangle([0, 0, config['width'], border_width], fill=border_color)
+        # Borda inferior  
+        draw.rectangle([0, config['height'] - border_width, config['width'], config['height']], fill=border_color)
+        
+        # Adicionar logo ou marca d'água (futuro)
+        # TODO: Implementar logo da empresa/marca
+        
+        # Adicionar gradiente sutil (futuro)
+        # TODO: Implementar efeito de gradiente no fundo
+        
+    except Exception as e:
+        print(f"⚠️ Erro ao adicionar elementos visuais: {e}")
+
+
+def _get_enhanced_template_config(template: str, language_info: dict, kwargs: dict) -> dict:
+    """
+    Configurações avançadas por template visual.
+    
+    Args:
+        template (str): Nome do template
+        language_info (dict): Informações de idioma
+        kwargs (dict): Parâmetros adicionais
+    
+    Returns:
+        dict: Configuração completa do template
+    """
+    
+    # Configurações base por template
+    template_configs = {
+        'professional': {
+            'background_color': (25, 35, 50),      # Azul corporativo escuro
+            'accent_color': (70, 130, 180),        # Azul aço
+            'text_color': (255, 255, 255),         # Branco
+            'secondary_text_color': (200, 200, 200), # Cinza claro
+            'font_size': 52,
+            'title_font_size': 64,
+            'padding': 120,
+            'effects': ['gradient_background', 'professional_border', 'subtle_shadow'],
+            'style': 'corporate'
+        },
+        'educational': {
+            'background_color': (240, 248, 255),   # Alice blue
+            'accent_color': (65, 105, 225),        # Royal blue
+            'text_color': (25, 25, 112),           # Midnight blue
+            'secondary_text_color': (70, 70, 70),  # Cinza escuro
+            'font_size': 48,
+            'title_font_size': 58,
+            'padding': 100,
+            'effects': ['soft_gradient', 'educational_icons', 'friendly_border'],
+            'style': 'friendly'
+        },
+        'tech': {
+            'background_color': (15, 15, 20),      # Preto tech
+            'accent_color': (0, 255, 127),         # Verde neon
+            'text_color': (255, 255, 255),         # Branco
+            'secondary_text_color': (0, 255, 127), # Verde neon
+            'font_size': 50,
+            'title_font_size': 62,
+            'padding': 80,
+            'effects': ['neon_glow', 'tech_grid', 'cyber_border'],
+            'style': 'futuristic'
+        },
+        'minimal': {
+            'background_color': (250, 250, 250),   # Off-white
+            'accent_color': (100, 100, 100),       # Cinza médio
+            'text_color': (50, 50, 50),            # Cinza escuro
+            'secondary_text_color': (120, 120, 120), # Cinza
+            'font_size': 46,
+            'title_font_size': 56,
+            'padding': 140,
+            'effects': ['clean_lines', 'minimal_shadow'],
+            'style': 'clean'
+        }
+    }
+    
+    # Configuração base
+    base_config = template_configs.get(template, template_configs['professional'])
+    
+    # Aplicar configurações de idioma
+    if language_info['detected_code'] == 'pt':
+        base_config['font_family'] = 'Arial, sans-serif'
+        base_config['line_spacing'] = 1.4
+    elif language_info['detected_code'] == 'en':
+        base_config['font_family'] = 'Helvetica, sans-serif'
+        base_config['line_spacing'] = 1.3
+    else:
+        base_config['font_family'] = 'Arial, sans-serif'
+        base_config['line_spacing'] = 1.4
+    
+    # Configurações de vídeo
+    base_config.update({
+        'width': kwargs.get('width', 1920),
+        'height': kwargs.get('height', 1080),
+        'fps': kwargs.get('fps', 30),
+        'quality': kwargs.get('quality', 'high'),
+        'format': kwargs.get('format', 'mp4')
+    })
+    
+    # Efeitos adicionais solicitados
+    additional_effects = kwargs.get('effects', [])
+    if additional_effects:
+        base_config['effects'].extend(additional_effects)
+    
+    return base_config
+
+
+def _create_enhanced_video_frames(text: str, config: dict, language_info: dict) -> str:
+    """
+    Cria frames de vídeo com recursos visuais avançados.
+    
+    Args:
+        text (str): Texto a ser exibido
+        config (dict): Configurações do template
+        language_info (dict): Informações de idioma
+    
+    Returns:
+        str: Caminho do frame criado
+    """
+    try:
+        from PIL import Image, ImageDraw, ImageFont, ImageFilter
+        import textwrap
+        
+        # Criar imagem base
+        img = Image.new('RGBA', (config['width'], config['height']), (0, 0, 0, 0))
+        
+        # Aplicar efeitos de fundo
+        img = _apply_background_effects(img, config)
+        
+        # Configurar fonte
+        font, title_font = _setup_enhanced_fonts(config)
+        
+        # Processar e formatar texto
+        formatted_text = _format_text_for_display(text, config, language_info)
+        
+        # Criar layer de texto
+        text_layer = _create_text_layer(formatted_text, config, font, title_font)
+        
+        # Combinar layers
+        final_img = Image.alpha_composite(img.convert('RGBA'), text_layer)
+        
+        # Aplicar efeitos finais
+        final_img = _apply_final_effects(final_img, config)
+        
+        # Salvar frame
+        temp_dir = "temp"
+        os.makedirs(temp_dir, exist_ok=True)
+        frame_path = os.path.join(temp_dir, f"enhanced_frame_{int(time.time())}.png")
+        
+        final_img.convert('RGB').save(frame_path, 'PNG', quality=95, optimize=True)
+        
+        print(f"🎨 Frame avançado criado: {frame_path}")
+        return frame_path
+        
+    except Exception as e:
+        print(f"❌ Erro ao criar frames avançados: {e}")
+        # Fallback para frame simples
+        return _create_video_frames(text, config)
+
+
+def _apply_background_effects(img: Image, config: dict) -> Image:
+    """
+    Aplica efeitos de fundo baseados no template.
+    
+    Args:
+        img (Image): Imagem base
+        config (dict): Configurações do template
+    
+    Returns:
+        Image: Imagem com efeitos de fundo
+    """
+    try:
+        from PIL import ImageDraw
+        
+        draw = ImageDraw.Draw(img)
+        width, height = img.size
+        
+        # Fundo base
+        draw.rectangle([0, 0, width, height], fill=config['background_color'])
+        
+        effects = config.get('effects', [])
+        
+        # Gradiente de fundo
+        if 'gradient_background' in effects:
+            _apply_gradient(draw, width, height, config)
+        elif 'soft_gradient' in effects:
+            _apply_soft_gradient(draw, width, height, config)
+        
+        # Grid tecnológico
+        if 'tech_grid' in effects:
+            _apply_tech_grid(draw, width, height, config)
+        
+        # Bordas especiais
+        if 'professional_border' in effects:
+            _apply_professional_border(draw, width, height, config)
+        elif 'cyber_border' in effects:
+            _apply_cyber_border(draw, width, height, config)
+        elif 'friendly_border' in effects:
+            _apply_friendly_border(draw, width, height, config)
+        
+        return img
+        
+    except Exception as e:
+        print(f"⚠️ Erro ao aplicar efeitos de fundo: {e}")
+        return img
+
+
+def _apply_gradient(draw, width: int, height: int, config: dict):
+    """Aplica gradiente profissional."""
+    try:
+        bg_color = config['background_color']
+        accent_color = config['accent_color']
+        
+        # Gradiente vertical sutil
+        for y in range(height):
+            alpha = y / height
+            r = int(bg_color[0] * (1 - alpha) + accent_color[0] * alpha * 0.3)
+            g = int(bg_color[1] * (1 - alpha) + accent_color[1] * alpha * 0.3)
+            b = int(bg_color[2] * (1 - alpha) + accent_color[2] * alpha * 0.3)
+            
+            if y % 10 == 0:  # Otimização: desenhar a cada 10 pixels
+                draw.rectangle([0, y, width, y + 10], fill=(r, g, b))
+                
+    except Exception as e:
+        print(f"⚠️ Erro no gradiente: {e}")
+
+
+def _apply_soft_gradient(draw, width: int, height: int, config: dict):
+    """Aplica gradiente suave para template educacional."""
+    try:
+        bg_color = config['background_color']
+        
+        # Gradiente radial suave do centro
+        center_x, center_y = width // 2, height // 2
+        max_distance = ((width // 2) ** 2 + (height // 2) ** 2) ** 0.5
+        
+        for y in range(0, height, 20):  # Otimização
+            for x in range(0, width, 20):
+                distance = ((x - center_x) ** 2 + (y - center_y) ** 2) ** 0.5
+                alpha = min(distance / max_distance, 1.0) * 0.1
+                
+                r = max(0, min(255, int(bg_color[0] * (1 - alpha))))
+                g = max(0, min(255, int(bg_color[1] * (1 - alpha))))
+                b = max(0, min(255, int(bg_color[2] * (1 - alpha))))
+                
+                draw.rectangle([x, y, x + 20, y + 20], fill=(r, g, b))
+                
+    except Exception as e:
+        print(f"⚠️ Erro no gradiente suave: {e}")
+
+
+def _apply_tech_grid(draw, width: int, height: int, config: dict):
+    """Aplica grid tecnológico."""
+    try:
+        accent_color = config['accent_color']
+        grid_color = (*accent_color, 30)  # Transparente
+        
+        # Linhas verticais
+        for x in range(0, width, 50):
+            draw.line([(x, 0), (x, height)], fill=color, width=1)
+        
+        # Linhas horizontais
+        for y in range(0, height, 50):
+            draw.line([(0, y), (width, y)], fill=color, width=1)
+            
+    except Exception as e:
+        print(f"⚠️ Erro no grid tech: {e}")
+
+
+def _apply_professional_border(draw, width: int, height: int, config: dict):
+    """Aplica borda profissional."""
+    try:
+        accent_color = config['accent_color']
+        border_width = 8
+        
+        # Borda superior
+        draw.rectangle([0, 0, width, border_width], fill=accent_color)
+        # Borda inferior
+        draw.rectangle([0, height - border_width, width, height], fill=accent_color)
+        
+    except Exception as e:
+        print(f"⚠️ Erro na borda profissional: {e}")
+
+
+def _apply_cyber_border(draw, width: int, height: int, config: dict):
+    """Aplica borda cyber/tech."""
+    try:
+        accent_color = config['accent_color']
+        
+        # Cantos com detalhes cyber
+        corner_size = 50
+        
+        # Canto superior esquerdo
+        draw.rectangle([0, 0, corner_size, 4], fill=accent_color)
+        draw.rectangle([0, 0, 4, corner_size], fill=accent_color)
+        
+        # Canto superior direito
+        draw.rectangle([width - corner_size, 0, width, 4], fill=accent_color)
+        draw.rectangle([width - 4, 0, width, corner_size], fill=accent_color)
+        
+        # Cantos inferiores similares
+        draw.rectangle([0, height - 4, corner_size, height], fill=accent_color)
+        draw.rectangle([0, height - corner_size, 4, height], fill=accent_color)
+        
+        draw.rectangle([width - corner_size, height - 4, width, height], fill=accent_color)
+        draw.rectangle([width - 4, height - corner_size, width, height], fill=accent_color)
+        
+    except Exception as e:
+        print(f"⚠️ Erro na borda cyber: {e}")
+
+
+def _apply_friendly_border(draw, width: int, height: int, config: dict):
+    """Aplica borda amigável para template educacional."""
+    try:
+        accent_color = config['accent_color']
+        
+        # Borda arredondada sutil
+        border_width = 6
+        corner_radius = 20
+        
+        # Simulação de cantos arredondados
+        draw.rectangle([corner_radius, 0, width - corner_radius, border_width], fill=accent_color)
+        draw.rectangle([corner_radius, height - border_width, width - corner_radius, height], fill=accent_color)
+        draw.rectangle([0, corner_radius, border_width, height - corner_radius], fill=accent_color)
+        draw.rectangle([width - border_width, corner_radius, width, height - corner_radius], fill=accent_color)
+        
+    except Exception as e:
+        print(f"⚠️ Erro na borda amigável: {e}")
+
+
+def _setup_enhanced_fonts(config: dict) -> tuple:
+    """
+    Configura fontes otimizadas para o template.
+    
+    Returns:
+        tuple: (fonte_principal, fonte_titulo)
+    """
+    try:
+        from PIL import ImageFont
+        
+        font_size = config['font_size']
+        title_font_size = config['title_font_size']
+        
+        # Tentar carregar fontes do sistema
+        font_paths = []
+        
+        if os.name == 'nt':  # Windows
+            font_paths = [
+                "C:/Windows/Fonts/arial.ttf",
+                "C:/Windows/Fonts/calibri.ttf",
+                "C:/Windows/Fonts/segoeui.ttf"
+            ]
+        else:  # Linux/Mac
+            font_paths = [
+                "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+                "/System/Library/Fonts/Arial.ttf",
+                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+            ]
+        
+        # Carregar primeira fonte disponível
+        font = None
+        title_font = None
+        
+        for font_path in font_paths:
+            if os.path.exists(font_path):
+                try:
+                    font = ImageFont.truetype(font_path, font_size)
+                    title_font = ImageFont.truetype(font_path, title_font_size)
+                    break
+                except:
+                    continue
+        
+        # Fallback para fonte padrão
+        if not font:
+            font = ImageFont.load_default()
+            title_font = ImageFont.load_default()
+        
+        return font, title_font
+        
+    except Exception as e:
+        print(f"⚠️ Erro ao configurar fontes: {e}")
+        return ImageFont.load_default(), ImageFont.load_default()
+
+
+def _format_text_for_display(text: str, config: dict, language_info: dict) -> dict:
+    """
+    Formata texto para exibição otimizada.
+    
+    Returns:
+        dict: Texto formatado com metadados
+    """
+    try:
+        import textwrap
+        
+        # Detectar se há título (primeira linha com menos de 80 chars e seguida de linha vazia)
+        lines = text.strip().split('\n')
+        title = None
+        body_text = text
+        
+        if len(lines) > 2 and len(lines[0]) < 80 and (not lines[1].strip()):
+            title = lines[0].strip()
+            body_text = '\n'.join(lines[2:]).strip()
+        
+        # Quebrar texto em linhas otimizadas
+        max_chars_per_line = (config['width'] - 2 * config['padding']) // (config['font_size'] // 2)
+        body_lines = textwrap.wrap(body_text, width=max_chars_per_line)
+        
+        return {
+            'title': title,
+            'body_lines': body_lines,
+            'total_lines': len(body_lines) + (1 if title else 0),
+            'estimated_height': len(body_lines) * config['font_size'] * config.get('line_spacing', 1.4)
+        }
+        
+    except Exception as e:
+        print(f"⚠️ Erro ao formatar texto: {e}")
+        return {
+            'title': None,
+            'body_lines': [text],
+            'total_lines': 1,
+            'estimated_height': config['font_size']
+        }
+
+
+def _create_text_layer(formatted_text: dict, config: dict, font, title_font) -> Image:
+    """
+    Cria layer de texto com formatação avançada.
+    
+    Returns:
+        Image: Layer de texto transparente
+    """
+    try:
+        from PIL import Image, ImageDraw
+        
+        # Criar layer transparente
+        text_layer = Image.new('RGBA', (config['width'], config['height']), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(text_layer)
+        
+        # Configurações
+        width = config['width']
+        height = config['height']
+        padding = config['padding']
+        line_spacing = int(config['font_size'] * config.get('line_spacing', 1.4))
+        
+        # Calcular posicionamento vertical centralizado
+        total_height = formatted_text['estimated_height']
+        if formatted_text['title']:
+            total_height += config['title_font_size'] + 20  # Espaço entre título e corpo
+        
+        start_y = (height - total_height) // 2
+        current_y = start_y
+        
+        # Desenhar título se existir
+        if formatted_text['title']:
+            title_text = formatted_text['title']
+            
+            # Centralizar título horizontalmente
+            bbox = draw.textbbox((0, 0), title_text, font=title_font)
+            title_width = bbox[2] - bbox[0]
+            title_x = (width - title_width) // 2
+            
+            # Efeito de sombra para título
+            shadow_offset = 3
+            draw.text((title_x + shadow_offset, current_y + shadow_offset), 
+                     title_text, fill=(0, 0, 0, 128), font=title_font)
+            
+            # Título principal
+            draw.text((title_x, current_y), title_text, 
+                     fill=config['accent_color'], font=title_font)
+            
+            current_y += config['title_font_size'] + 30
+        
+        # Desenhar linhas do corpo
+        for line in formatted_text['body_lines']:
+            if not line.strip():
+                current_y += line_spacing // 2
+                continue
+            
+            # Centralizar linha horizontalmente
+            bbox = draw.textbbox((0, 0), line, font=font)
+            line_width = bbox[2] - bbox[0]
+            line_x = (width - line_width) // 2
+            
+            # Efeito de sombra sutil
+            shadow_offset = 2
+            draw.text((line_x + shadow_offset, current_y + shadow_offset), 
+                     line, fill=(0, 0, 0, 80), font=font)
+            
+            # Texto principal
+            draw.text((line_x, current_y), line, 
+                     fill=config['text_color'], font=font)
+            
+            current_y += line_spacing
+        
+        return text_layer
+        
+    except Exception as e:
+        print(f"❌ Erro ao criar layer de texto: {e}")
+        # Fallback para texto simples
+        simple_layer = Image.new('RGBA', (config['width'], config['height']), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(simple_layer)
+        
+        # Texto centralizado simples
+        all_text = formatted_text.get('title', '') + '\n' + '\n'.join(formatted_text.get('body_lines', []))
+        bbox = draw.textbbox((0, 0), all_text, font=font)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+        
+        x = (config['width'] - text_width) // 2
+        y = (config['height'] - text_height) // 2
+        
+        draw.text((x, y), all_text, fill=config['text_color'], font=font)
+        
+        return simple_layer
+
+
+def _apply_final_effects(img: Image, config: dict) -> Image:
+    """
+    Aplica efeitos finais à imagem.
+    
+    Args:
+        img (Image): Imagem processada
+        config (dict): Configurações do template
+    
+    Returns:
+        Image: Imagem com efeitos finais
+    """
+    try:
+        effects = config.get('effects', [])
+        
+        # Aplicar blur sutil se necessário
+        if 'subtle_shadow' in effects:
+            img = img.filter(ImageFilter.SMOOTH)
+        
+        # Aplicar brilho neon para template tech
+        if 'neon_glow' in effects:
+            # Simular brilho neon (simplificado)
+            enhanced = img.copy()
+            for _ in range(2):
+                enhanced = enhanced.filter(ImageFilter.SMOOTH_MORE)
+            
+            # Combinar com original para efeito de brilho
+            img = Image.blend(img, enhanced, 0.1)
+        
+        return img
+        
+    except Exception as e:
+        print(f"⚠️ Erro nos efeitos finais: {e}")
+        return img
+
+
+def _get_template_config(template: str, background_style: str) -> dict:
+    """
+    Retorna configurações específicas para cada template visual.
+    
+    Args:
+        template (str): Nome do template
+        background_style (str): Estilo do background
+    
+    Returns:
+        dict: Configurações do template
+    """
+    templates = {
+        "modern": {
+            "background_color": (245, 245, 255) if background_style == "solid" else None,
+            "text_color": (30, 30, 50),
+            "accent_color": (100, 150, 255),
+            "margin": 80,
+            "font_size": 36,
+            "animations": ["fade_in", "slide_up", "text_glow"],
+            "gradient": [(240, 248, 255), (225, 235, 255)] if background_style == "gradient" else None
+        },
+        "corporate": {
+            "background_color": (250, 250, 250) if background_style == "solid" else None,
+            "text_color": (20, 40, 60),
+            "accent_color": (0, 100, 180),
+            "margin": 100,
+            "font_size": 34,
+            "animations": ["fade_in", "professional_reveal"],
+            "gradient": [(248, 250, 252), (230, 240, 250)] if background_style == "gradient" else None
+        },
+        "tech": {
+            "background_color": (15, 15, 25) if background_style == "solid" else None,
+            "text_color": (200, 255, 200),
+            "accent_color": (0, 255, 100),
+            "margin": 60,
+            "font_size": 38,
+            "animations": ["matrix_effect", "neon_glow", "cyber_reveal"],
+            "gradient": [(10, 15, 30), (25, 35, 50)] if background_style == "gradient" else None
+        },
+        "education": {
+            "background_color": (255, 252, 240) if background_style == "solid" else None,
+            "text_color": (60, 60, 80),
+            "accent_color": (255, 140, 0),
+            "margin": 90,
+            "font_size": 32,
+            "animations": ["friendly_bounce", "warm_fade"],
+            "gradient": [(255, 250, 235), (250, 245, 220)] if background_style == "gradient" else None
+        },
+        "minimal": {
+            "background_color": (255, 255, 255) if background_style == "solid" else None,
+            "text_color": (50, 50, 50),
+            "accent_color": (120, 120, 120),
+            "margin": 120,
+            "font_size": 30,
+            "animations": ["subtle_fade"],
+            "gradient": [(255, 255, 255), (248, 248, 248)] if background_style == "gradient" else None
+        }
+    }
+    
+    return templates.get(template, templates["modern"])
+
+
+def _create_advanced_slide_image(text: str, width: int, height: int, 
+                                template_config: dict, animations: bool) -> Image.Image:
+    """
+    Cria uma imagem de slide avançada com template e efeitos visuais.
+    
+    Args:
+        text (str): Texto a ser renderizado
+        width (int): Largura da imagem
+        height (int): Altura da imagem
+        template_config (dict): Configurações do template
+        animations (bool): Se deve preparar para animações
+    
+    Returns:
+        Image.Image: Imagem PIL com design avançado
+    """
+    try:
+        # Criar imagem base
+        if template_config.get('gradient') and template_config['gradient']:
+            # Criar gradiente
+            image = _create_gradient_background(width, height, template_config['gradient'])
+        else:
+            # Cor sólida
+            bg_color = template_config['background_color'] or (255, 255, 255)
+            image = Image.new('RGB', (width, height), bg_color)
+        
+        draw = ImageDraw.Draw(image)
+        
+        # Adicionar efeitos de background baseados no template
+        _add_background_effects(image, draw, template_config, width, height)
+        
+        # Configurar fonte
+        font_size = template_config['font_size']
+        try:
+            if os.name == 'nt':  # Windows
+                font_path = "C:/Windows/Fonts/segoeui.ttf"  # Fonte moderna
+            else:  # Linux/Mac
+                font_path = "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf"
+            
+            if os.path.exists(font_path):
+                font = ImageFont.truetype(font_path, font_size)
+                font_small = ImageFont.truetype(font_path, int(font_size * 0.8))
+            else:
+                raise OSError("Fonte não encontrada")
+                
+        except (OSError, ImportError):
+            print("⚠️ Usando fonte padrão")
+            font = ImageFont.load_default()
+            font_small = ImageFont.load_default()
+        
+        # Renderizar texto com formatação avançada
+        _render_advanced_text(draw, text, font, template_config, width, height)
+        
+        # Adicionar elementos decorativos
+        if animations:
+            _add_decorative_elements(draw, template_config, width, height)
+        
+        return image
+        
+    except Exception as e:
+        print(f"⚠️ Erro ao criar slide avançado: {e}")
+        # Fallback para slide básico
+        return _create_slide_image(text, width, height, 
+                                 template_config['background_color'],
+                                 template_config['text_color'],
+                                 template_config['margin'])
+
+
+def _create_gradient_background(width: int, height: int, colors: list) -> Image.Image:
+    """
+    Cria um background com gradiente vertical.
+    
+    Args:
+        width (int): Largura da imagem
+        height (int): Altura da imagem
+        colors (list): Lista de cores RGB [(r,g,b), (r,g,b)]
+    
+    Returns:
+        Image.Image: Imagem com gradiente
+    """
+    try:
+        import numpy as np
+        
+        # Criar gradiente
+        color1, color2 = colors[0], colors[1]
+        
+        # Array para o gradiente
+        gradient = np.zeros((height, width, 3), dtype=np.uint8)
+        
+        for y in range(height):
+            # Interpolação linear entre as cores
+            ratio = y / height
+            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
+            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
+            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
+            gradient[y, :] = [r, g, b]
+        
+        return Image.fromarray(gradient)
+        
+    except ImportError:
+        # Fallback sem numpy
+        image = Image.new('RGB', (width, height), colors[0])
+        return image
+    except Exception as e:
+        print(f"⚠️ Erro ao criar gradiente: {e}")
+        image = Image.new('RGB', (width, height), colors[0])
+        return image
+
+
+def _add_background_effects(image: Image.Image, draw, template_config: dict, 
+                           width: int, height: int):
+    """
+    Adiciona efeitos visuais ao background baseados no template.
+    
+    Args:
+        image: Imagem PIL
+        draw: Objeto de desenho
+        template_config: Configurações do template
+        width: Largura da imagem
+        height: Altura da imagem
+    """
+    try:
+        accent_color = template_config['accent_color']
+        
+        # Efeitos específicos por template
+        if 'tech' in str(template_config.get('animations', [])):
+            # Grid tecnológico
+            _draw_tech_grid(draw, width, height, accent_color)
+        
+        elif 'corporate' in str(template_config.get('animations', [])):
+            # Linhas sutis corporativas
+            _draw_corporate_lines(draw, width, height, accent_color)
+        
+        elif 'education' in str(template_config.get('animations', [])):
+            # Elementos educacionais amigáveis
+            _draw_education_elements(draw, width, height, accent_color)
+            
+    except Exception as e:
+        print(f"⚠️ Erro ao adicionar efeitos: {e}")
+
+
+def _draw_tech_grid(draw, width: int, height: int, color: tuple):
+    """Desenha grid tecnológico de background."""
+    try:
+        grid_size = 50
+        alpha_color = tuple(list(color) + [30])  # Transparência simulada
+        
+        # Linhas verticais
+        for x in range(0, width, grid_size):
+            draw.line([(x, 0), (x, height)], fill=color, width=1)
+        
+        # Linhas horizontais  
+        for y in range(0, height, grid_size):
+            draw.line([(0, y), (width, y)], fill=color, width=1)
+            
+    except Exception:
+        pass
+
+
+def _draw_corporate_lines(draw, width: int, height: int, color: tuple):
+    """Desenha linhas corporativas sutis."""
+    try:
+        # Linha superior
+        draw.rectangle([(0, 20), (width, 25)], fill=color)
+        # Linha inferior
+        draw.rectangle([(0, height-25), (width, height-20)], fill=color)
+        # Linha lateral
+        draw.rectangle([(20, 0), (25, height)], fill=color)
+        
+    except Exception:
+        pass
+
+
+def _draw_education_elements(draw, width: int, height: int, color: tuple):
+    """Desenha elementos educacionais amigáveis."""
+    try:
+        # Círculos decorativos
+        for i in range(3):
+            x = width - 100 - (i * 30)
+            y = 50 + (i * 20)
+            draw.ellipse([(x-10, y-10), (x+10, y+10)], outline=color, width=2)
+            
+    except Exception:
+        pass
+
+
+def _render_advanced_text(draw, text: str, font, template_config: dict, 
+                          width: int, height: int):
+    """
+    Renderiza texto com formatação avançada e efeitos.
+    
+    Args:
+        draw: Objeto de desenho PIL
+        text: Texto a ser renderizado
+        font: Fonte PIL
+        template_config: Configurações do template
+        width: Largura da imagem
+        height: Altura da imagem
+    """
+    try:
+        margin = template_config['margin']
+        text_color = template_config['text_color']
+        accent_color = template_config['accent_color']
+        
+        # Área útil para texto
+        text_area_width = width - (2 * margin)
+        
+        # Quebrar texto em linhas
+        lines = _wrap_text_advanced(text, font, text_area_width, draw)
+        
+        # Configurações de layout
+        line_height = int(template_config['font_size'] * 1.4)
+        total_text_height = len(lines) * line_height
+        start_y = (height - total_text_height) // 2
+        
+        # Renderizar cada linha com efeitos
+        for i, line in enumerate(lines):
+            # Calcular posição X centralizada
+            bbox = draw.textbbox((0, 0), line, font=font)
+            line_width = bbox[2] - bbox[0]
+            x = (width - line_width) // 2
+            y = start_y + (i * line_height)
+            
+            # Efeito de sombra (se não for minimal)
+            if template_config.get('animations') and 'minimal' not in str(template_config['animations']):
+                shadow_offset = 2
+                shadow_color = (0, 0, 0, 50)  # Sombra transparente
+                draw.text((x + shadow_offset, y + shadow_offset), line, 
+                         fill=(100, 100, 100), font=font)
+            
+            # Texto principal
+            draw.text((x, y), line, fill=text_color, font=font)
+            
+            # Destacar primeira linha se for título
+            if i == 0 and len(lines) > 1:
+                # Sublinhado colorido
+                underline_y = y + int(template_config['font_size'] * 1.1)
+                draw.rectangle([(x, underline_y), (x + line_width, underline_y + 3)], 
+                             fill=accent_color)
+        
+    except Exception as e:
+        print(f"⚠️ Erro ao renderizar texto avançado: {e}")
+        # Fallback para renderização básica
+        _render_basic_text_fallback(draw, text, font, text_color, width, height, margin)
+
+
+def _wrap_text_advanced(text: str, font, max_width: int, draw) -> list:
+    """
+    Versão avançada da quebra de texto com melhor formatação.
+    
+    Args:
+        text: Texto a ser quebrado
+        font: Fonte PIL
+        max_width: Largura máxima
+        draw: Objeto de desenho
+    
+    Returns:
+        list: Lista de linhas otimizadas
+    """
+    try:
+        lines = []
+        paragraphs = text.split('\n')
+        
+        for paragraph in paragraphs:
+            if not paragraph.strip():
+                lines.append("")  # Linha vazia para espaçamento
+                continue
+                
+            words = paragraph.split()
+            current_line = ""
+            
+            for word in words:
+                test_line = current_line + " " + word if current_line else word
+                bbox = draw.textbbox((0, 0), test_line, font=font)
+                line_width = bbox[2] - bbox[0]
+                
+                if line_width <= max_width:
+                    current_line = test_line
+                else:
+                    if current_line:
+                        lines.append(current_line)
+                    current_line = word
+            
+            if current_line:
+                lines.append(current_line)
+        
+        return lines if lines else [text]
+        
+    except Exception as e:
+        print(f"⚠️ Erro na quebra avançada: {e}")
+        return _wrap_text(text, font, max_width, draw)
+
+
+def _render_basic_text_fallback(draw, text: str, font, color: tuple, 
+                               width: int, height: int, margin: int):
+    """Renderização básica de texto como fallback."""
+    try:
+        # Simplificado para fallback
+        lines = text.split('\n')[:5]  # Máximo 5 linhas
+        line_height = 40
+        total_height = len(lines) * line_height
+        start_y = (height - total_height) // 2
+        
+        for i, line in enumerate(lines):
+            if line.strip():
+                bbox = draw.textbbox((0, 0), line, font=font)
+                line_width = bbox[2] - bbox[0]
+                x = (width - line_width) // 2
+                y = start_y + (i * line_height)
+                draw.text((x, y), line, fill=color, font=font)
+                
+    except Exception:
+        # Último recurso
+        draw.text((margin, height//2), "Erro na renderização", fill=color)
+
+
+def _add_decorative_elements(draw, template_config: dict, width: int, height: int):
+    """
+    Adiciona elementos decorativos baseados no template.
+    
+    Args:
+        draw: Objeto de desenho
+        template_config: Configurações do template
+        width: Largura da imagem
+        height: Altura da imagem
+    """
+    try:
+        accent_color = template_config['accent_color']
+        animations = template_config.get('animations', [])
+        
+        # Elementos baseados em animações previstas
+        if 'glow' in str(animations):
+            # Pontos de luz nos cantos
+            for corner in [(50, 50), (width-50, 50), (50, height-50), (width-50, height-50)]:
+                draw.ellipse([(corner[0]-5, corner[1]-5), (corner[0]+5, corner[1]+5)], 
+                           fill=accent_color)
+        
+        if 'professional' in str(animations):
+            # Bordas profissionais
+            border_width = 3
+            draw.rectangle([(0, 0), (width, border_width)], fill=accent_color)
+            draw.rectangle([(0, height-border_width), (width, height)], fill=accent_color)
+        
+    except Exception as e:
+        print(f"⚠️ Erro ao adicionar elementos decorativos: {e}")
+
+
+def _create_slide_image(text: str, width: int, height: int, 
+                       bg_color: tuple, text_color: tuple, margin: int) -> Image.Image:
+    """
+    Cria uma imagem de slide com texto centralizado.
+    
+    Esta função auxiliar gera uma imagem PIL com o texto formatado
+    de forma centralizada, com quebras de linha automáticas e
+    formatação adequada para um slide simples.
+    
+    Args:
+        text (str): Texto a ser renderizado
+        width (int): Largura da imagem em pixels
+        height (int): Altura da imagem em pixels
+        bg_color (tuple): Cor de fundo RGB (R, G, B)
+        text_color (tuple): Cor do texto RGB (R, G, B)
+        margin (int): Margem das bordas em pixels
+    
+    Returns:
+        Image.Image: Imagem PIL com o texto renderizado
+    """
+    try:
+        # Criar imagem com cor de fundo
+        image = Image.new('RGB', (width, height), bg_color)
+        draw = ImageDraw.Draw(image)
+        
+        # Tentar carregar fonte do sistema (com fallback)
+        try:
+            # Tentar carregar uma fonte TrueType do sistema
+            if os.name == 'nt':  # Windows
+                font_path = "C:/Windows/Fonts/arial.ttf"
+            else:  # Linux/Mac
+                font_path = "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf"
+            
+            if os.path.exists(font_path):
+                font = ImageFont.truetype(font_path, 32)
+                font_small = ImageFont.truetype(font_path, 24)
+            else:
+                raise OSError("Fonte não encontrada")
+                
+        except (OSError, ImportError):
+            # Usar fonte padrão se não conseguir carregar TrueType
+            print("⚠️ Usando fonte padrão (TrueType não disponível)")
+            font = ImageFont.load_default()
+            font_small = ImageFont.load_default()
+        
+        # Área útil para o texto (considerando margem)
+        text_area_width = width - (2 * margin)
+        text_area_height = height - (2 * margin)
+        
+        # Quebrar texto em linhas que cabem na largura
+        lines = _wrap_text(text, font, text_area_width, draw)
+        
+        # Calcular altura total do texto
+        line_height = 40  # Espaçamento entre linhas
+        total_text_height = len(lines) * line_height
+        
+        # Posição inicial Y para centralizar verticalmente
+        start_y = (height - total_text_height) // 2
+        
+        # Renderizar cada linha de texto
+        for i, line in enumerate(lines):
+            # Calcular largura da linha para centralizar horizontalmente
+            bbox = draw.textbbox((0, 0), line, font=font)
+            line_width = bbox[2] - bbox[0]
+            
+            # Posição X para centralizar
+            x = (width - line_width) // 2
+            y = start_y + (i * line_height)
+            
+            # Desenhar o texto
+            draw.text((x, y), line, fill=text_color, font=font)
+        
+        return image
+        
+    except Exception as e:
+        print(f"⚠️ Erro ao criar imagem do slide: {e}")
+        # Criar imagem básica em caso de erro
+        image = Image.new('RGB', (width, height), bg_color)
+        draw = ImageDraw.Draw(image)
+        draw.text((margin, height//2), "Erro ao renderizar texto", fill=text_color)
+        return image
+
+
+def _wrap_text(text: str, font, max_width: int, draw) -> List[str]:
+    """
+    Quebra o texto em linhas que cabem na largura especificada.
+    
+    Esta função auxiliar divide o texto em múltiplas linhas,
+    respeitando a largura máxima disponível e tentando
+    quebrar em espaços quando possível.
+    
+    Args:
+        text (str): Texto a ser quebrado
+        font: Fonte PIL a ser usada
+        max_width (int): Largura máxima em pixels
+        draw: Objeto de desenho PIL
+    
+    Returns:
+        List[str]: Lista de linhas de texto
+    """
+    try:
+        words = text.split()
+        lines = []
+        current_line = ""
+        
+        for word in words:
+            # Testar se a palavra cabe na linha atual
+            test_line = current_line + " " + word if current_line else word
+            bbox = draw.textbbox((0, 0), test_line, font=font)
+            line_width = bbox[2] - bbox[0]
+            
+            if line_width <= max_width:
+                # Palavra cabe, adicionar à linha atual
+                current_line = test_line
+            else:
+                # Palavra não cabe, começar nova linha
+                if current_line:
+                    lines.append(current_line)
+                current_line = word
+        
+        # Adicionar última linha
+        if current_line:
+            lines.append(current_line)
+        
+        return lines if lines else [text]
+        
+    except Exception as e:
+        print(f"⚠️ Erro ao quebrar texto: {e}")
+        # Retornar texto original em caso de erro
+        return [text]
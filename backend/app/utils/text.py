@@ -0,0 +1,532 @@
+"""
+Análise de texto - TecnoCursos AI
+Estatísticas, palavras-chave, resumo, busca e padrões linguísticos sobre
+textos já extraídos (Python puro).
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+
+def clean_extracted_text(text: str) -> str:
+    """
+    Limpa e formata o texto extraído do PDF
+    
+    Args:
+        text: Texto bruto extraído
+    
+    Returns:
+        str: Texto limpo e formatado
+    """
+    if not text:
+        return ""
+    
+    # Remover caracteres de controle excessivos
+    import re
+    
+    # Substituir múltiplas quebras de linha por uma única
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    
+    # Remover espaços excessivos
+    text = re.sub(r' {2,}', ' ', text)
+    
+    # Remover tabs excessivos
+    text = re.sub(r'\t+', ' ', text)
+    
+    # Limpar início e fim
+    text = text.strip()
+    
+    return text
+
+def extract_context(text: str, search_term: str, context_length: int = 50) -> str:
+    """
+    Extrai contexto ao redor de um termo encontrado
+    
+    Args:
+        text: Texto completo
+        search_term: Termo encontrado
+        context_length: Número de caracteres de contexto em cada lado
+    
+    Returns:
+        str: Contexto extraído
+    """
+    try:
+        index = text.lower().find(search_term.lower())
+        if index == -1:
+            return ""
+        
+        start = max(0, index - context_length)
+        end = min(len(text), index + len(search_term) + context_length)
+        
+        context = text[start:end]
+        
+        # Adicionar indicadores se o contexto foi cortado
+        if start > 0:
+            context = "..." + context
+        if end < len(text):
+            context = context + "..."
+        
+        return context
+        
+    except Exception:
+        return ""
+
+def search_text_in_pages(text_pages: List[str], search_terms: List[str], case_sensitive: bool = False) -> dict:
+    """
+    Busca termos específicos nas páginas de texto extraído.
+    
+    Args:
+        text_pages (List[str]): Lista de textos das páginas
+        search_terms (List[str]): Lista de termos para buscar
+        case_sensitive (bool): Se a busca deve ser sensível a maiúsculas
+    
+    Returns:
+        dict: Resultados da busca com detalhes de localização
+    """
+    try:
+        search_results = {
+            "search_terms": search_terms,
+            "case_sensitive": case_sensitive,
+            "total_matches": 0,
+            "results_by_term": {},
+            "pages_with_matches": []
+        }
+        
+        pages_with_any_match = set()
+        
+        # Buscar cada termo
+        for term in search_terms:
+            term_results = {
+                "term": term,
+                "total_occurrences": 0,
+                "pages_found": [],
+                "contexts": []
+            }
+            
+            # Buscar em cada página
+            for page_num, page_text in enumerate(text_pages):
+                search_text = page_text if case_sensitive else page_text.lower()
+                search_term = term if case_sensitive else term.lower()
+                
+                # Contar ocorrências na página
+                occurrences = search_text.count(search_term)
+                
+                if occurrences > 0:
+                    term_results["total_occurrences"] += occurrences
+                    term_results["pages_found"].append({
+                        "page_number": page_num + 1,
+                        "occurrences": occurrences
+                    })
+                    pages_with_any_match.add(page_num + 1)
+                    
+                    # Extrair contexto (50 caracteres antes e depois)
+                    contexts = extract_search_contexts(page_text, term, case_sensitive)
+                    for context in contexts:
+                        term_results["contexts"].append({
+                            "page_number": page_num + 1,
+                            "context": context
+                        })
+            
+            search_results["results_by_term"][term] = term_results
+            search_results["total_matches"] += term_results["total_occurrences"]
+        
+        search_results["pages_with_matches"] = sorted(list(pages_with_any_match))
+        
+        print(f"🔍 Busca concluída:")
+        print(f"   📋 Termos buscados: {len(search_terms)}")
+        print(f"   🎯 Total de ocorrências: {search_results['total_matches']}")
+        print(f"   📄 Páginas com resultados: {len(search_results['pages_with_matches'])}")
+        
+        return search_results
+        
+    except Exception as e:
+        print(f"❌ Erro na busca: {str(e)}")
+        return {"error": str(e)}
+
+def extract_search_contexts(text: str, search_term: str, case_sensitive: bool = False, context_length: int = 50) -> List[str]:
+    """
+    Extrai contextos ao redor das ocorrências de um termo de busca.
+    
+    Args:
+        text (str): Texto onde buscar
+        search_term (str): Termo a ser buscado
+        case_sensitive (bool): Se a busca deve ser sensível a maiúsculas
+        context_length (int): Número de caracteres de contexto em cada lado
+    
+    Returns:
+        List[str]: Lista de contextos encontrados
+    """
+    contexts = []
+    search_text = text if case_sensitive else text.lower()
+    term = search_term if case_sensitive else search_term.lower()
+    
+    start_pos = 0
+    while True:
+        pos = search_text.find(term, start_pos)
+        if pos == -1:
+            break
+        
+        # Extrair contexto
+        start_context = max(0, pos - context_length)
+        end_context = min(len(text), pos + len(search_term) + context_length)
+        
+        context = text[start_context:end_context]
+        
+        # Adicionar indicadores se o contexto foi cortado
+        if start_context > 0:
+            context = "..." + context
+        if end_context < len(text):
+            context = context + "..."
+        
+        contexts.append(context)
+        start_pos = pos + 1
+    
+    return contexts
+
+# Função extract_text_from_pptx duplicada removida - mantendo apenas a versão completa acima
+
+def analyze_text_statistics(text_pages: List[str]) -> dict:
+    """
+    Analisa estatísticas básicas do texto.
+    
+    Args:
+        text_pages (List[str]): Lista de textos das páginas
+    
+    Returns:
+        dict: Estatísticas do texto
+    """
+    try:
+        # Combinar todo o texto
+        full_text = " ".join(text_pages)
+        
+        # Análise de estatísticas
+        words = full_text.split()
+        word_count = len(words)
+        unique_words = len(set(words))
+        character_count = len(full_text)
+        paragraphs = full_text.split('\n\n')
+        paragraph_count = len(paragraphs)
+        avg_words_per_paragraph = word_count / paragraph_count if paragraph_count > 0 else 0
+        
+        # Análise de sentenças
+        import re
+        sentences = re.split(r'[.!?]+', full_text)
+        sentence_count = len(sentences)
+        avg_words_per_sentence = word_count / sentence_count if sentence_count > 0 else 0
+        
+        # Análise de complexidade
+        long_words = [w for w in words if len(w) > 8]
+        complex_sentences = [s for s in sentences if len(s.split()) > 20]
+        
+        # Preparar resultado
+        statistics = {
+            "word_count": word_count,
+            "unique_words": unique_words,
+            "character_count": character_count,
+            "paragraph_count": paragraph_count,
+            "avg_words_per_paragraph": round(avg_words_per_paragraph, 1),
+            "sentence_count": sentence_count,
+            "avg_words_per_sentence": round(avg_words_per_sentence, 1),
+            "long_words_count": len(long_words),
+            "long_words_percentage": round(len(long_words) / word_count * 100, 2) if word_count > 0 else 0,
+            "complex_sentences_count": len(complex_sentences),
+            "complex_sentences_percentage": round(len(complex_sentences) / sentence_count * 100, 2) if sentence_count > 0 else 0
+        }
+        
+        print(f"📊 Análise de estatísticas concluída:")
+        print(f"   📝 Palavras: {word_count:,}")
+        print(f"   🔤 Caracteres: {character_count:,}")
+        print(f"   📃 Parágrafos: {paragraph_count}")
+        print(f"   📜 Sentenças: {sentence_count}")
+        print(f"   📈 Complexidade: {statistics['long_words_percentage']}% palavras longas")
+        
+        return statistics
+        
+    except Exception as e:
+        print(f"❌ Erro na análise de estatísticas: {str(e)}")
+        return {"error": str(e)}
+
+def extract_keywords(text_pages: List[str], top_n: int = 20, min_word_length: int = 4) -> dict:
+    """
+    Extrai palavras-chave mais relevantes do texto.
+    
+    Args:
+        text_pages (List[str]): Lista de textos das páginas
+        top_n (int): Número de palavras-chave para retornar
+        min_word_length (int): Comprimento mínimo das palavras
+    
+    Returns:
+        dict: Palavras-chave com pontuações de relevância
+    """
+    try:
+        # Combinar todo o texto
+        full_text = " ".join(text_pages).lower()
+        
+        # Palavras comuns em português para filtrar (stop words básicas)
+        stop_words = {
+            'o', 'a', 'os', 'as', 'um', 'uma', 'uns', 'umas', 'de', 'do', 'da', 'dos', 'das',
+            'em', 'no', 'na', 'nos', 'nas', 'por', 'para', 'com', 'sem', 'sob', 'sobre',
+            'e', 'ou', 'mas', 'que', 'se', 'não', 'sim', 'como', 'quando', 'onde',
+            'este', 'esta', 'estes', 'estas', 'esse', 'essa', 'esses', 'essas',
+            'aquele', 'aquela', 'aqueles', 'aquelas', 'isto', 'isso', 'aquilo',
+            'eu', 'tu', 'ele', 'ela', 'nós', 'vós', 'eles', 'elas', 'me', 'te', 'se', 'nos', 'vos',
+            'meu', 'minha', 'meus', 'minhas', 'teu', 'tua', 'teus', 'tuas',
+            'seu', 'sua', 'seus', 'suas', 'nosso', 'nossa', 'nossos', 'nossas',
+            'foi', 'são', 'tem', 'ter', 'ser', 'estar', 'foi', 'era', 'será', 'sendo',
+            'muito', 'mais', 'menos', 'bem', 'mal', 'melhor', 'pior', 'tanto', 'quanto',
+            'já', 'ainda', 'também', 'só', 'apenas', 'sempre', 'nunca', 'hoje', 'ontem', 'amanhã'
+        }
+        
+        # Extrair palavras válidas
+        import re
+        words = re.findall(r'\b[a-záàâãéêíîóôõúûçA-ZÁÀÂÃÉÊÍÎÓÔÕÚÛÇ]+\b', full_text)
+        
+        # Filtrar palavras por comprimento e stop words
+        filtered_words = [
+            word for word in words 
+            if len(word) >= min_word_length and word.lower() not in stop_words
+        ]
+        
+        # Calcular frequência das palavras
+        word_freq = {}
+        for word in filtered_words:
+            word_lower = word.lower()
+            word_freq[word_lower] = word_freq.get(word_lower, 0) + 1
+        
+        # Calcular pontuação TF (Term Frequency)
+        total_words = len(filtered_words)
+        tf_scores = {}
+        for word, freq in word_freq.items():
+            tf_scores[word] = freq / total_words
+        
+        # Aplicar boost para palavras mais longas (assumindo que são mais específicas)
+        length_boost = {}
+        for word in tf_scores:
+            length_boost[word] = min(2.0, len(word) / 8)  # Máximo de 2x boost
+        
+        # Calcular pontuação final (TF * length_boost)
+        final_scores = {}
+        for word in tf_scores:
+            final_scores[word] = tf_scores[word] * length_boost[word]
+        
+        # Ordenar por pontuação e pegar top N
+        sorted_keywords = sorted(final_scores.items(), key=lambda x: x[1], reverse=True)[:top_n]
+        
+        # Preparar resultado
+        keywords_result = {
+            "total_unique_words": len(word_freq),
+            "total_filtered_words": total_words,
+            "extraction_params": {
+                "top_n": top_n,
+                "min_word_length": min_word_length,
+                "stop_words_count": len(stop_words)
+            },
+            "keywords": []
+        }
+        
+        for word, score in sorted_keywords:
+            keywords_result["keywords"].append({
+                "word": word,
+                "frequency": word_freq[word],
+                "tf_score": round(tf_scores[word], 6),
+                "final_score": round(score, 6),
+                "relevance_percentage": round(score / sorted_keywords[0][1] * 100, 2) if sorted_keywords else 0
+            })
+        
+        print(f"🔑 Extração de palavras-chave concluída:")
+        print(f"   📊 {len(sorted_keywords)} palavras-chave extraídas")
+        print(f"   📝 Top 5: {[kw['word'] for kw in keywords_result['keywords'][:5]]}")
+        
+        return keywords_result
+        
+    except Exception as e:
+        print(f"❌ Erro na extração de palavras-chave: {str(e)}")
+        return {"error": str(e)}
+
+def generate_text_summary(text_pages: List[str], max_sentences: int = 5) -> dict:
+    """
+    Gera um resumo automático do texto baseado na frequência de palavras e posicionamento.
+    
+    Args:
+        text_pages (List[str]): Lista de textos das páginas
+        max_sentences (int): Número máximo de sentenças no resumo
+    
+    Returns:
+        dict: Resumo gerado com métricas
+    """
+    try:
+        # Combinar todo o texto
+        full_text = " ".join(text_pages)
+        
+        # Dividir em sentenças
+        import re
+        sentences = re.split(r'[.!?]+', full_text)
+        sentences = [s.strip() for s in sentences if len(s.strip()) > 20]  # Filtrar sentenças muito curtas
+        
+        if len(sentences) <= max_sentences:
+            return {
+                "summary": full_text,
+                "original_sentences": len(sentences),
+                "summary_sentences": len(sentences),
+                "compression_ratio": 1.0,
+                "method": "no_compression_needed"
+            }
+        
+        # Extrair palavras-chave para scoring
+        keywords_data = extract_keywords(text_pages, top_n=30, min_word_length=3)
+        important_words = set()
+        
+        if "keywords" in keywords_data:
+            important_words = {kw["word"] for kw in keywords_data["keywords"][:15]}
+        
+        # Pontuar sentenças
+        sentence_scores = {}
+        
+        for i, sentence in enumerate(sentences):
+            score = 0
+            sentence_lower = sentence.lower()
+            words_in_sentence = re.findall(r'\b[a-záàâãéêíîóôõúûçA-ZÁÀÂÃÉÊÍÎÓÔÕÚÛÇ]+\b', sentence_lower)
+            
+            # Pontuação baseada em palavras-chave
+            for word in words_in_sentence:
+                if word in important_words:
+                    score += 2
+            
+            # Boost para sentenças no início (introdução) e final (conclusão)
+            if i < len(sentences) * 0.2:  # Primeiros 20%
+                score *= 1.3
+            elif i > len(sentences) * 0.8:  # Últimos 20%
+                score *= 1.2
+            
+            # Penalizar sentenças muito curtas ou muito longas
+            if len(words_in_sentence) < 5:
+                score *= 0.5
+            elif len(words_in_sentence) > 40:
+                score *= 0.8
+            
+            # Boost para sentenças com números (possíveis dados importantes)
+            if re.search(r'\d+', sentence):
+                score *= 1.1
+            
+            sentence_scores[i] = score
+        
+        # Selecionar melhores sentenças
+        best_sentences_indices = sorted(sentence_scores.keys(), 
+                                      key=lambda x: sentence_scores[x], 
+                                      reverse=True)[:max_sentences]
+        
+        # Manter ordem original das sentenças selecionadas
+        best_sentences_indices.sort()
+        
+        # Construir resumo
+        summary_sentences = [sentences[i] for i in best_sentences_indices]
+        summary_text = ". ".join(summary_sentences) + "."
+        
+        # Limpar resumo
+        summary_text = re.sub(r'\s+', ' ', summary_text).strip()
+        
+        compression_ratio = len(summary_sentences) / len(sentences)
+        
+        result = {
+            "summary": summary_text,
+            "original_sentences": len(sentences),
+            "summary_sentences": len(summary_sentences),
+            "compression_ratio": round(compression_ratio, 3),
+            "method": "keyword_frequency_position",
+            "selected_sentence_indices": best_sentences_indices,
+            "summary_stats": {
+                "characters": len(summary_text),
+                "words": len(summary_text.split()),
+                "estimated_reading_time": round(len(summary_text.split()) / 200, 1)
+            }
+        }
+        
+        print(f"📝 Resumo automático gerado:")
+        print(f"   📊 Compressão: {len(sentences)} → {len(summary_sentences)} sentenças")
+        print(f"   📈 Taxa de compressão: {compression_ratio:.1%}")
+        print(f"   ⏱️ Tempo de leitura: {result['summary_stats']['estimated_reading_time']} min")
+        
+        return result
+        
+    except Exception as e:
+        print(f"❌ Erro na geração de resumo: {str(e)}")
+        return {"error": str(e)}
+
+def analyze_text_language_patterns(text_pages: List[str]) -> dict:
+    """
+    Analisa padrões linguísticos básicos do texto.
+    
+    Args:
+        text_pages (List[str]): Lista de textos das páginas
+    
+    Returns:
+        dict: Análise de padrões linguísticos
+    """
+    try:
+        full_text = " ".join(text_pages)
+        
+        # Análise de pontuação
+        import re
+        punctuation_counts = {
+            "periods": len(re.findall(r'\.', full_text)),
+            "commas": len(re.findall(r',', full_text)),
+            "exclamations": len(re.findall(r'!', full_text)),
+            "questions": len(re.findall(r'\?', full_text)),
+            "semicolons": len(re.findall(r';', full_text)),
+            "colons": len(re.findall(r':', full_text))
+        }
+        
+        # Análise de estrutura
+        paragraphs = [p.strip() for p in full_text.split('\n\n') if p.strip()]
+        words = full_text.split()
+        
+        # Detectar possível idioma (português vs inglês - básico)
+        portuguese_indicators = ['ção', 'são', 'não', 'com', 'para', 'que', 'uma', 'dos', 'das']
+        english_indicators = ['the', 'and', 'for', 'are', 'with', 'that', 'this', 'have']
+        
+        pt_score = sum(1 for word in words if any(ind in word.lower() for ind in portuguese_indicators))
+        en_score = sum(1 for word in words if word.lower() in english_indicators)
+        
+        likely_language = "português" if pt_score > en_score else "inglês" if en_score > pt_score else "indeterminado"
+        
+        # Análise de complexidade (aproximada)
+        long_words = [w for w in words if len(w) > 8]
+        complex_sentences = [s for s in full_text.split('.') if len(s.split()) > 20]
+        
+        analysis = {
+            "text_structure": {
+                "total_paragraphs": len(paragraphs),
+                "avg_paragraph_length": round(len(words) / len(paragraphs), 1) if paragraphs else 0,
+                "longest_paragraph_words": max(len(p.split()) for p in paragraphs) if paragraphs else 0
+            },
+            "punctuation_analysis": punctuation_counts,
+            "language_detection": {
+                "likely_language": likely_language,
+                "portuguese_score": pt_score,
+                "english_score": en_score,
+                "confidence": "low" if abs(pt_score - en_score) < 5 else "medium"
+            },
+            "complexity_indicators": {
+                "long_words_count": len(long_words),
+                "long_words_percentage": round(len(long_words) / len(words) * 100, 2) if words else 0,
+                "complex_sentences_count": len(complex_sentences),
+                "avg_sentence_length": round(len(words) / punctuation_counts["periods"], 1) if punctuation_counts["periods"] > 0 else 0
+            },
+            "text_style": {
+                "question_ratio": round(punctuation_counts["questions"] / len(paragraphs), 2) if paragraphs else 0,
+                "exclamation_ratio": round(punctuation_counts["exclamations"] / len(paragraphs), 2) if paragraphs else 0,
+                "formal_indicators": len(re.findall(r'\b(portanto|entretanto|ademais|outrossim|todavia)\b', full_text.lower()))
+            }
+        }
+        
+        print(f"🔍 Análise linguística concluída:")
+        print(f"   🌐 Idioma provável: {likely_language}")
+        print(f"   📊 Complexidade: {analysis['complexity_indicators']['long_words_percentage']}% palavras longas")
+        print(f"   📝 Estilo: {analysis['text_style']['formal_indicators']} indicadores formais")
+        
+        return analysis
+        
+    except Exception as e:
+        print(f"❌ Erro na análise linguística: {str(e)}")
+        return {"error": str(e)}
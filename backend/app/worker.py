@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Worker da Fila de Jobs - TecnoCursos AI
+
+Processo dedicado que executa jobs de render, exportação e TTS. Rode quantos
+forem necessários, no mesmo host (backend SQLite ou Redis) ou em outros
+(backend Redis); a API pode então desligar o worker embutido com
+JOB_QUEUE_EMBEDDED_WORKER=false.
+
+Uso:
+    python -m app.worker
+    python -m app.worker --queues render=2,tts=4 --url redis://redis:6379/1
+    python -m app.worker --queues render=1 --max-running render=4
+
+SIGTERM/SIGINT param de buscar jobs e aguardam os em execução (até
+--shutdown-timeout); o que não terminar volta para a fila quando a lease
+expira.
+
+Autor: TecnoCursos AI System
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from app.config import get_settings
+from app.core.job_queue import JobQueue, Worker, create_backend, parse_concurrency
+
+logger = logging.getLogger("app.worker")
+
+
+def parse_args(argv=None):
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Worker da fila de jobs do TecnoCursos AI")
+    parser.add_argument("--url", default=settings.job_queue_url,
+                        help="Backend da fila (sqlite:///caminho ou redis://host:porta/db)")
+    parser.add_argument("--queues", default=settings.job_queue_concurrency,
+                        help="Filas e slots por fila, ex.: render=1,export=1,tts=2")
+    parser.add_argument("--max-running", default="",
+                        help="Limite global de jobs em execução por fila, ex.: render=4")
+    parser.add_argument("--lease", type=float, default=settings.job_queue_lease_seconds,
+                        help="Segundos de lease (heartbeat a cada 1/3)")
+    parser.add_argument("--shutdown-timeout", type=float, default=60.0)
+    parser.add_argument("--log-level", default=settings.log_level)
+    return parser.parse_args(argv)
+
+
+async def run(args) -> None:
+    import app.jobs  # noqa: F401  registra os handlers
+    import app.services.scenes_cache_service  # noqa: F401  invalida o cache nas escritas de cenas/assets
+
+    worker = Worker(
+        JobQueue(create_backend(args.url)),
+        parse_concurrency(args.queues),
+        lease_seconds=args.lease,
+        max_running=parse_concurrency(args.max_running),
+    )
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows
+            signal.signal(sig, lambda *_: loop.call_soon_threadsafe(stop.set))
+
+    await worker.start()
+    await stop.wait()
+    logger.info("Encerrando worker...")
+    await worker.stop(timeout=args.shutdown_timeout)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level.upper(),
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
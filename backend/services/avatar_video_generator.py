@@ -3,6 +3,8 @@ Sistema de Geração de Vídeo Avatar - TecnoCursosAI
 Gera vídeos educacionais com avatar virtual e slides sincronizados
 """
 
+from __future__ import annotations
+
 import asyncio
 import os
 import tempfile
@@ -19,7 +21,7 @@ from PIL import Image, ImageDraw, ImageFont, ImageFilter
 # MoviePy imports (corrigidos)
 try:
     from moviepy.editor import (
-        VideoFileClip, AudioFileClip, ImageClip, CompositeVideoClip,
+        VideoClip, VideoFileClip, AudioFileClip, ImageClip, CompositeVideoClip,
         concatenate_videoclips, CompositeAudioClip
     )
     MOVIEPY_AVAILABLE = True
@@ -45,7 +47,6 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 from app.config import get_settings
-from backend.app.logger import logger
 
 settings = get_settings()
 
@@ -115,9 +116,18 @@ class VideoContent:
 class AvatarGenerator:
     """Gerador de avatar usando PIL"""
     
+    # Estados distintos de rosto: (estado da boca, olhos abertos)
+    FRAME_STATES = [
+        ("talking", True), ("neutral", True), ("smiling", True),
+        ("talking", False), ("neutral", False), ("smiling", False),
+    ]
+    
     def __init__(self, config: AvatarConfig):
         self.config = config
         self.avatar_size = (400, 600)  # Largura x Altura do avatar
+        # Cache de templates: (boca, olhos) -> RGBA e RGB já composto
+        self._rgba_templates: Dict[Tuple[str, bool], np.ndarray] = {}
+        self._rgb_templates: Dict[Tuple[Tuple[str, bool], Tuple[int, int, int]], np.ndarray] = {}
         
     def create_base_avatar(self) -> Image.Image:
         """Cria avatar base"""
@@ -159,7 +169,8 @@ class AvatarGenerator:
         
         return avatar
     
-    def add_facial_features(self, avatar: Image.Image, mouth_state: str = "neutral") -> Image.Image:
+    def add_facial_features(self, avatar: Image.Image, mouth_state: str = "neutral",
+                            eyes_open: bool = True) -> Image.Image:
         """Adiciona características faciais"""
         draw = ImageDraw.Draw(avatar)
         width, height = self.avatar_size
@@ -169,24 +180,30 @@ class AvatarGenerator:
         eye_y = head_center[1] - 20
         left_eye = (head_center[0] - 25, eye_y)
         right_eye = (head_center[0] + 25, eye_y)
-        
-        # Desenhar olhos
         eye_radius = 6
-        draw.ellipse([left_eye[0] - eye_radius, left_eye[1] - eye_radius,
-                     left_eye[0] + eye_radius, left_eye[1] + eye_radius],
-                    fill="white", outline="black")
-        draw.ellipse([right_eye[0] - eye_radius, right_eye[1] - eye_radius,
-                     right_eye[0] + eye_radius, right_eye[1] + eye_radius],
-                    fill="white", outline="black")
-        
-        # Pupilas
-        pupil_radius = 3
-        draw.ellipse([left_eye[0] - pupil_radius, left_eye[1] - pupil_radius,
-                     left_eye[0] + pupil_radius, left_eye[1] + pupil_radius],
-                    fill="black")
-        draw.ellipse([right_eye[0] - pupil_radius, right_eye[1] - pupil_radius,
-                     right_eye[0] + pupil_radius, right_eye[1] + pupil_radius],
-                    fill="black")
+        
+        if eyes_open:
+            # Desenhar olhos
+            draw.ellipse([left_eye[0] - eye_radius, left_eye[1] - eye_radius,
+                         left_eye[0] + eye_radius, left_eye[1] + eye_radius],
+                        fill="white", outline="black")
+            draw.ellipse([right_eye[0] - eye_radius, right_eye[1] - eye_radius,
+                         right_eye[0] + eye_radius, right_eye[1] + eye_radius],
+                        fill="white", outline="black")
+            
+            # Pupilas
+            pupil_radius = 3
+            draw.ellipse([left_eye[0] - pupil_radius, left_eye[1] - pupil_radius,
+                         left_eye[0] + pupil_radius, left_eye[1] + pupil_radius],
+                        fill="black")
+            draw.ellipse([right_eye[0] - pupil_radius, right_eye[1] - pupil_radius,
+                         right_eye[0] + pupil_radius, right_eye[1] + pupil_radius],
+                        fill="black")
+        else:
+            # Olhos fechados (piscada)
+            for eye in (left_eye, right_eye):
+                draw.line([eye[0] - eye_radius, eye[1], eye[0] + eye_radius, eye[1]],
+                         fill="black", width=2)
         
         # Nariz
         nose_center = (head_center[0], head_center[1] + 5)
@@ -218,39 +235,110 @@ class AvatarGenerator:
         
         return avatar
     
-    def create_animated_frames(self, audio_duration: float, fps: int = 30) -> List[Image.Image]:
-        """Cria frames animados do avatar sincronizados com o áudio"""
-        total_frames = int(audio_duration * fps)
-        frames = []
+    def frame_state(self, frame_num: int, fps: int = 30) -> Tuple[str, bool]:
+        """Estado do rosto (boca, olhos abertos) em um frame"""
+        time_pos = frame_num / fps
+        
+        # Simula movimento de fala: 4 ciclos por segundo
+        mouth_cycle = (time_pos * 4) % 1.0
+        if not self.config.mouth_animation:
+            mouth_state = "neutral"
+        elif mouth_cycle < 0.3:
+            mouth_state = "talking"
+        elif mouth_cycle < 0.6:
+            mouth_state = "neutral"
+        else:
+            mouth_state = "talking"
+        
+        # Piscar olhos a cada 3 segundos (boca neutra durante a piscada)
+        eyes_open = True
+        if frame_num % (fps * 3) == 0:
+            mouth_state = "neutral"
+            eyes_open = not self.config.eye_blink
+        
+        return mouth_state, eyes_open
+    
+    def get_frame_template(self, mouth_state: str = "neutral", eyes_open: bool = True) -> np.ndarray:
+        """
+        Template RGBA (uint8, HxWx4) de um estado do rosto.
         
+        Cada estado é desenhado uma única vez; os frames seguintes apenas
+        referenciam o array em cache.
+        """
+        key = (mouth_state, eyes_open)
+        template = self._rgba_templates.get(key)
+        if template is None:
+            avatar = self.add_facial_features(self.create_base_avatar(), mouth_state, eyes_open)
+            template = np.asarray(avatar, dtype=np.uint8)
+            template.setflags(write=False)
+            self._rgba_templates[key] = template
+        return template
+    
+    def prerender_templates(self, background: Tuple[int, int, int] = (255, 255, 255)) -> None:
+        """Desenha e compõe todos os estados do rosto de uma vez"""
+        for mouth_state, eyes_open in self.FRAME_STATES:
+            self.get_composited_template(mouth_state, eyes_open, background)
+    
+    def get_composited_template(self, mouth_state: str = "neutral", eyes_open: bool = True,
+                                background: Tuple[int, int, int] = (255, 255, 255)) -> np.ndarray:
+        """Template RGB (uint8, HxWx3) já composto sobre uma cor de fundo"""
+        key = ((mouth_state, eyes_open), tuple(background))
+        frame = self._rgb_templates.get(key)
+        if frame is None:
+            frame = composite_over_color(self.get_frame_template(mouth_state, eyes_open), background)
+            frame.setflags(write=False)
+            self._rgb_templates[key] = frame
+        return frame
+    
+    def iter_frames(self, audio_duration: float, fps: int = 30,
+                    background: Tuple[int, int, int] = (255, 255, 255)):
+        """
+        Gera os frames RGB do avatar sob demanda.
+        
+        A memória fica limitada aos poucos templates em cache,
+        independente da duração da narração.
+        """
+        total_frames = int(audio_duration * fps)
         for frame_num in range(total_frames):
-            time_pos = frame_num / fps
-            
-            # Criar avatar base
-            avatar = self.create_base_avatar()
-            
-            # Determinar estado da boca baseado no tempo
-            # Simula movimento de fala
-            mouth_cycle = (time_pos * 4) % 1.0  # 4 ciclos por segundo
-            
-            if mouth_cycle < 0.3:
-                mouth_state = "talking"
-            elif mouth_cycle < 0.6:
-                mouth_state = "neutral"
-            else:
-                mouth_state = "talking"
-            
-            # Piscar olhos ocasionalmente
-            if frame_num % (fps * 3) == 0:  # Piscar a cada 3 segundos
-                mouth_state = "neutral"  # Sincronizar com piscar
-            
-            # Adicionar características faciais
-            avatar = self.add_facial_features(avatar, mouth_state)
-            
-            frames.append(avatar)
+            yield self.get_composited_template(*self.frame_state(frame_num, fps), background=background)
+    
+    def make_frame_function(self, fps: int = 30,
+                            background: Tuple[int, int, int] = (255, 255, 255)) -> Callable[[float], np.ndarray]:
+        """Função `t -> frame RGB` para `moviepy.VideoClip`"""
+        self.prerender_templates(background)
+        
+        def make_frame(t: float) -> np.ndarray:
+            return self.get_composited_template(*self.frame_state(int(t * fps), fps), background=background)
+        return make_frame
+    
+    def create_animated_frames(self, audio_duration: float, fps: int = 30) -> List[Image.Image]:
+        """
+        Cria frames animados do avatar sincronizados com o áudio.
         
+        Mantido por compatibilidade: os frames são instâncias compartilhadas
+        dos templates em cache. Para vídeos longos prefira `iter_frames`.
+        """
+        images: Dict[Tuple[str, bool], Image.Image] = {}
+        frames = []
+        for frame_num in range(int(audio_duration * fps)):
+            state = self.frame_state(frame_num, fps)
+            if state not in images:
+                images[state] = Image.fromarray(self.get_frame_template(*state), "RGBA")
+            frames.append(images[state])
         return frames
 
+def composite_over_color(rgba: np.ndarray, background: Tuple[int, int, int] = (255, 255, 255)) -> np.ndarray:
+    """
+    Compõe um frame RGBA sobre uma cor sólida (alpha blending vetorizado).
+    
+    Usa aritmética inteira: out = (fg * a + bg * (255 - a) + 127) // 255
+    """
+    alpha = rgba[:, :, 3:4].astype(np.uint16)
+    foreground = rgba[:, :, :3].astype(np.uint16)
+    bg = np.asarray(background, dtype=np.uint16).reshape(1, 1, 3)
+    out = (foreground * alpha + bg * (255 - alpha) + 127) // 255
+    return out.astype(np.uint8)
+
 class SlideGenerator:
     """Gerador de slides usando PIL"""
     
@@ -396,13 +484,8 @@ class AvatarVideoGenerator:
                 audio_clip = AudioFileClip(audio_file)
                 duration = audio_clip.duration
                 
-                # Criar frames animados do avatar
-                avatar_frames = self.avatar_generator.create_animated_frames(
-                    duration, self.video_config.fps
-                )
-                
-                # Combinar slide com avatar animado
-                clip = await self._create_slide_clip(slide_img, avatar_frames, audio_clip, i + 1)
+                # Combinar slide com avatar animado (frames gerados sob demanda)
+                clip = await self._create_slide_clip(slide_img, audio_clip, i + 1)
                 video_clips.append(clip)
                 
                 logger.info(f"✅ Slide {i+1} processado - Duração: {duration:.2f}s")
@@ -519,7 +602,6 @@ class AvatarVideoGenerator:
     async def _create_slide_clip(
         self, 
         slide_path: str, 
-        avatar_frames: List[Image.Image], 
         audio_clip: AudioFileClip,
         slide_number: int
     ) -> CompositeVideoClip:
@@ -529,7 +611,7 @@ class AvatarVideoGenerator:
         slide_clip = ImageClip(slide_path, duration=audio_clip.duration)
         
         # Criar clipe do avatar animado
-        avatar_clip = await self._create_avatar_video_clip(avatar_frames, audio_clip.duration)
+        avatar_clip = await self._create_avatar_video_clip(audio_clip.duration)
         
         # Posicionar avatar no lado esquerdo
         avatar_position = (50, (self.video_config.resolution[1] - self.avatar_generator.avatar_size[1]) // 2)
@@ -549,52 +631,42 @@ class AvatarVideoGenerator:
         
         return final_clip
     
-    async def _create_avatar_video_clip(self, frames: List[Image.Image], duration: float) -> VideoFileClip:
-        """Cria clip de vídeo do avatar a partir dos frames"""
+    async def _create_avatar_video_clip(self, duration: float) -> VideoClip:
+        """
+        Cria clip do avatar cujos frames são produzidos sob demanda pelo encoder.
         
-        # Salvar frames como imagens temporárias
-        frame_paths = []
-        for i, frame in enumerate(frames):
-            frame_path = self.temp_dir / f"avatar_frame_{i:04d}.png"
-            frame.save(str(frame_path), "PNG")
-            frame_paths.append(str(frame_path))
+        Não grava PNGs nem vídeo intermediário: cada frame é um template RGB
+        em cache, composto sobre fundo branco uma única vez por estado.
+        """
+        make_frame = self.avatar_generator.make_frame_function(self.video_config.fps)
+        return VideoClip(make_frame, duration=duration)
+    
+    def write_avatar_video(self, output_path: str, duration: float) -> str:
+        """
+        Grava apenas a animação do avatar em um arquivo (OpenCV), em streaming.
         
-        # Criar vídeo usando OpenCV
-        avatar_video_path = self.temp_dir / "avatar_animation.mp4"
+        Útil para pré-visualização; os frames vão direto para o encoder.
+        """
+        if not CV2_AVAILABLE:
+            raise RuntimeError("OpenCV não disponível para gravar vídeo do avatar")
         
-        # Configurar codec de vídeo
         fourcc = cv2.VideoWriter_fourcc(*'mp4v')
         width, height = self.avatar_generator.avatar_size
+        out = cv2.VideoWriter(str(output_path), fourcc, self.video_config.fps, (width, height))
         
-        out = cv2.VideoWriter(
-            str(avatar_video_path), 
-            fourcc, 
-            self.video_config.fps, 
-            (width, height)
-        )
-        
-        for frame_path in frame_paths:
-            frame_cv = cv2.imread(frame_path, cv2.IMREAD_UNCHANGED)
-            
-            # Converter RGBA para RGB se necessário
-            if frame_cv.shape[2] == 4:
-                # Criar fundo transparente
-                rgb_frame = np.zeros((height, width, 3), dtype=np.uint8)
-                alpha = frame_cv[:, :, 3] / 255.0
-                
-                for c in range(3):
-                    rgb_frame[:, :, c] = (1 - alpha) * 255 + alpha * frame_cv[:, :, c]
-                
-                frame_cv = rgb_frame
-            
-            out.write(frame_cv)
-        
-        out.release()
-        
-        # Carregar como clip do MoviePy
-        avatar_clip = VideoFileClip(str(avatar_video_path))
-        
-        return avatar_clip
+        # Conversão RGB -> BGR feita uma vez por template, não por frame
+        bgr_cache: Dict[int, np.ndarray] = {}
+        try:
+            for frame in self.avatar_generator.iter_frames(duration, self.video_config.fps):
+                bgr = bgr_cache.get(id(frame))
+                if bgr is None:
+                    bgr = np.ascontiguousarray(frame[:, :, ::-1])
+                    bgr_cache[id(frame)] = bgr
+                out.write(bgr)
+        finally:
+            out.release()
+        
+        return str(output_path)
     
     def _add_background_music(self, video_clip: CompositeVideoClip) -> CompositeVideoClip:
         """Adiciona música de fundo ao vídeo"""
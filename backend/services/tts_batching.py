@@ -0,0 +1,223 @@
+"""
+Inferência TTS em Lote - TecnoCursos AI
+Thread dedicada de inferência com fila de requisições e micro-batching
+
+Requisições de vários textos (e de vários chamadores) chegam como listas de
+segmentos. A thread de inferência espera uma janela curta para acumular
+pedidos, agrupa os segmentos pela chave (ex.: voz do Bark), ordena por
+tamanho para reduzir o padding e executa cada grupo em uma única chamada
+`run_batch`, devolvendo os resultados na ordem original de cada requisição.
+
+O módulo não depende de torch: o modelo entra apenas pela função `run_batch`,
+o que permite testá-lo com um modelo stub.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# run_batch(chave, segmentos) -> uma saída por segmento, na mesma ordem
+BatchRunner = Callable[[Hashable, List[str]], Sequence[Any]]
+
+
+@dataclass
+class _InferenceRequest:
+    """Pedido de inferência de um texto (um ou mais segmentos)"""
+    key: Hashable
+    segments: List[str]
+    future: Future
+    results: List[Any] = field(default_factory=list)
+    pending: int = 0
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class BatchStats:
+    """Estatísticas da thread de inferência"""
+    requests: int = 0
+    segments: int = 0
+    batches: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    queue_wait_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "segments": self.segments,
+            "batches": self.batches,
+            "errors": self.errors,
+            "avg_batch_size": round(self.segments / self.batches, 2) if self.batches else 0.0,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "segments_per_second": round(self.segments / self.busy_seconds, 2) if self.busy_seconds else 0.0,
+            "avg_queue_wait_ms": round(self.queue_wait_seconds / self.requests * 1000, 2) if self.requests else 0.0,
+        }
+
+
+class BatchInferenceWorker:
+    """
+    Executa `run_batch` em uma thread dedicada, com micro-batching.
+
+    Args:
+        run_batch: Função de inferência em lote (chamada só na thread do worker)
+        max_batch_size: Máximo de segmentos por chamada
+        batch_window: Tempo (s) que o primeiro pedido espera por companhia
+        name: Nome da thread
+    """
+
+    _STOP = object()
+
+    def __init__(self, run_batch: BatchRunner, max_batch_size: int = 8,
+                 batch_window: float = 0.02, name: str = "tts-inference"):
+        self.run_batch = run_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.batch_window = batch_window
+        self.name = name
+        self.stats = BatchStats()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # API pública (thread-safe)
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        with self._lock:
+            if not self.running:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Processa o que já está na fila e encerra a thread"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(self._STOP)
+            thread.join(timeout)
+
+    def submit(self, key: Hashable, segments: Sequence[str]) -> Future:
+        """Enfileira os segmentos; o Future resolve com uma saída por segmento"""
+        request = _InferenceRequest(key=key, segments=list(segments), future=Future())
+        if not request.segments:
+            request.future.set_result([])
+            return request.future
+        self.start()
+        self._queue.put(request)
+        return request.future
+
+    async def infer(self, key: Hashable, segments: Sequence[str]) -> List[Any]:
+        """Versão assíncrona de submit: não bloqueia o event loop"""
+        return await asyncio.wrap_future(self.submit(key, segments))
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self.stats.to_dict()
+        stats.update(
+            running=self.running,
+            queued=self._queue.qsize(),
+            max_batch_size=self.max_batch_size,
+            batch_window_ms=self.batch_window * 1000,
+        )
+        return stats
+
+    # ------------------------------------------------------------------
+    # Thread de inferência
+    # ------------------------------------------------------------------
+
+    def _collect(self, first: _InferenceRequest) -> Tuple[List[_InferenceRequest], bool]:
+        """Acumula pedidos até a janela expirar ou haver segmentos para um lote cheio"""
+        requests = [first]
+        segments = len(first.segments)
+        deadline = time.perf_counter() + self.batch_window
+        while segments < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is self._STOP:
+                return requests, True
+            requests.append(item)
+            segments += len(item.segments)
+        # Pedidos que já chegaram entram sem esperar mais
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return requests, False
+            if item is self._STOP:
+                return requests, True
+            requests.append(item)
+
+    def _plan(self, requests: List[_InferenceRequest]) -> List[Tuple[Hashable, List[Tuple[_InferenceRequest, int]]]]:
+        """Agrupa segmentos por chave, ordenados por tamanho, em lotes de max_batch_size"""
+        by_key: Dict[Hashable, List[Tuple[_InferenceRequest, int]]] = defaultdict(list)
+        for request in requests:
+            request.results = [None] * len(request.segments)
+            request.pending = len(request.segments)
+            for index in range(len(request.segments)):
+                by_key[request.key].append((request, index))
+
+        batches = []
+        for key, items in by_key.items():
+            items.sort(key=lambda item: len(item[0].segments[item[1]]))
+            for start in range(0, len(items), self.max_batch_size):
+                batches.append((key, items[start:start + self.max_batch_size]))
+        return batches
+
+    def _execute(self, key: Hashable, items: List[Tuple[_InferenceRequest, int]]):
+        live = [(request, index) for request, index in items if not request.future.done()]
+        if not live:
+            return
+        started = time.perf_counter()
+        try:
+            outputs = list(self.run_batch(key, [request.segments[index] for request, index in live]))
+            if len(outputs) != len(live):
+                raise RuntimeError(f"run_batch devolveu {len(outputs)} saídas para {len(live)} segmentos")
+        except Exception as e:
+            self.stats.errors += 1
+            logger.error(f"Erro na inferência em lote ({len(live)} segmentos): {e}")
+            for request, _ in live:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+        finally:
+            self.stats.busy_seconds += time.perf_counter() - started
+
+        self.stats.batches += 1
+        self.stats.segments += len(live)
+        for (request, index), output in zip(live, outputs):
+            request.results[index] = output
+            request.pending -= 1
+            if request.pending == 0 and not request.future.done():
+                request.future.set_result(request.results)
+
+    def _run(self):
+        logger.info(f"Thread de inferência '{self.name}' iniciada")
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is self._STOP:
+                break
+            requests, stopping = self._collect(first)
+            now = time.perf_counter()
+            for request in requests:
+                self.stats.requests += 1
+                self.stats.queue_wait_seconds += now - request.enqueued_at
+            for key, items in self._plan(requests):
+                self._execute(key, items)
+        logger.info(f"Thread de inferência '{self.name}' encerrada")
@@ -10,7 +10,7 @@ import tempfile
 import torch
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Literal
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 import numpy as np
 import scipy.io.wavfile as wavfile
@@ -18,6 +18,13 @@ from pydub import AudioSegment
 import logging
 from backend.app.logger import logger
 from backend.app.config import settings
+from backend.services.tts_batching import BatchInferenceWorker
+
+try:
+    # Mesmo módulo usado pela aplicação (app.*), para compartilhar o trace da requisição
+    from app.core.tracing import span, traced
+except ImportError:
+    from backend.app.core.tracing import span, traced
 
 # Imports condicionais para evitar erros se não instalados
 try:
@@ -60,14 +67,26 @@ class AudioResult:
     metadata: Optional[Dict] = None
 
 class BarkTTSEngine:
-    """Engine TTS usando Bark (Hugging Face)"""
+    """
+    Engine TTS usando Bark (Hugging Face)
     
-    def __init__(self):
+    A inferência roda em uma thread dedicada (BatchInferenceWorker): segmentos
+    de todas as requisições concorrentes com a mesma voz são agrupados, com
+    padding, em uma única chamada a model.generate.
+    """
+    
+    def __init__(self, max_batch_size: int = 8, batch_window: float = 0.02):
         self.model = None
         self.processor = None
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         self.model_name = "suno/bark"
         self.loaded = False
+        self.worker = BatchInferenceWorker(
+            self._generate_batch,
+            max_batch_size=max_batch_size,
+            batch_window=batch_window,
+            name="bark-inference",
+        )
         
         # Vozes disponíveis para português
         self.portuguese_voices = [
@@ -84,7 +103,12 @@ class BarkTTSEngine:
         ]
     
     async def load_model(self) -> bool:
-        """Carrega o modelo Bark"""
+        """Carrega o modelo Bark (em thread, sem bloquear o event loop)"""
+        if self.loaded:
+            return True
+        return await asyncio.to_thread(self._load_model_sync)
+    
+    def _load_model_sync(self) -> bool:
         if self.loaded:
             return True
             
@@ -140,6 +164,54 @@ class BarkTTSEngine:
         
         return segments
     
+    def _generate_batch(self, voice_preset: str, segments: List[str]) -> List[np.ndarray]:
+        """
+        Gera o áudio de vários segmentos (mesma voz) em uma chamada a generate.
+        Executado apenas na thread de inferência.
+        """
+        # O BarkProcessor já faz padding="max_length" no tokenizer
+        inputs = self.processor(segments, voice_preset=voice_preset)
+        
+        with torch.no_grad():
+            try:
+                audio_array, lengths = self.model.generate(
+                    **inputs.to(self.device), return_output_lengths=True
+                )
+                lengths = lengths.cpu().tolist()
+            except TypeError:
+                # Versões antigas do transformers não devolvem os comprimentos
+                audio_array = self.model.generate(**inputs.to(self.device))
+                lengths = None
+        
+        audio_np = audio_array.cpu().float().numpy().reshape(len(segments), -1)
+        outputs = []
+        for i, row in enumerate(audio_np):
+            if lengths is not None:
+                row = row[:int(lengths[i])]
+            else:
+                # Remover o padding (zeros) do final de cada amostra
+                nonzero = np.flatnonzero(row)
+                row = row[:nonzero[-1] + 1] if nonzero.size else row[:0]
+            peak = np.max(np.abs(row)) if row.size else 0.0
+            outputs.append(row / peak if peak > 0 else row)
+        return outputs
+    
+    def _write_audio(self, final_audio: np.ndarray, config: TTSConfig, output_path: str):
+        """Salva WAV e converte para MP3 se necessário"""
+        temp_wav = output_path.replace('.mp3', '.wav')
+        wavfile.write(temp_wav, config.sample_rate, (final_audio * 32767).astype(np.int16))
+        
+        if config.output_format == "mp3":
+            audio_segment = AudioSegment.from_wav(temp_wav)
+            audio_segment.export(output_path, format="mp3", bitrate="128k")
+            os.remove(temp_wav)  # Remover WAV temporário
+        else:
+            os.rename(temp_wav, output_path)
+    
+    def get_inference_stats(self) -> Dict:
+        """Estatísticas da thread de inferência (tamanho médio de lote, throughput)"""
+        return self.worker.get_stats()
+    
     async def generate_audio(self, text: str, config: TTSConfig, output_path: str) -> AudioResult:
         """Gera áudio usando Bark"""
         if not self.loaded:
@@ -158,41 +230,19 @@ class BarkTTSEngine:
             
             # Dividir texto em segmentos
             text_segments = self._split_text(text, config.max_length)
-            audio_segments = []
             
             logger.info(f"Gerando {len(text_segments)} segmentos de áudio com Bark...")
             
-            for i, segment in enumerate(text_segments):
-                logger.info(f"Processando segmento {i+1}/{len(text_segments)}")
-                
-                # Preparar texto para o modelo
-                inputs = self.processor(segment, voice_preset=voice_preset)
-                
-                # Gerar áudio
-                with torch.no_grad():
-                    audio_array = self.model.generate(**inputs.to(self.device))
-                
-                # Converter para numpy
-                audio_np = audio_array.cpu().numpy().squeeze()
-                
-                # Normalizar áudio
-                audio_np = audio_np / np.max(np.abs(audio_np))
-                audio_segments.append(audio_np)
+            # Segmentos vão para a fila da thread de inferência, agrupados em lote
+            # com os de outras requisições da mesma voz
+            with span("tts.bark.infer", category="tts", segments=len(text_segments), voice=voice_preset):
+                audio_segments = await self.worker.infer(voice_preset, text_segments)
             
             # Concatenar segmentos
             final_audio = np.concatenate(audio_segments)
             
-            # Salvar como WAV temporário
-            temp_wav = output_path.replace('.mp3', '.wav')
-            wavfile.write(temp_wav, config.sample_rate, (final_audio * 32767).astype(np.int16))
-            
-            # Converter para MP3 se necessário
-            if config.output_format == "mp3":
-                audio_segment = AudioSegment.from_wav(temp_wav)
-                audio_segment.export(output_path, format="mp3", bitrate="128k")
-                os.remove(temp_wav)  # Remover WAV temporário
-            else:
-                os.rename(temp_wav, output_path)
+            with span("tts.write_audio", category="io", format=config.output_format):
+                await asyncio.to_thread(self._write_audio, final_audio, config, output_path)
             
             # Calcular duração
             duration = len(final_audio) / config.sample_rate
@@ -226,6 +276,7 @@ class GTTSEngine:
     def __init__(self):
         self.supported_languages = ['pt', 'en', 'es', 'fr', 'de', 'it']
     
+    @traced("tts.gtts.generate", category="tts")
     async def generate_audio(self, text: str, config: TTSConfig, output_path: str) -> AudioResult:
         """Gera áudio usando gTTS"""
         try:
@@ -297,6 +348,7 @@ class TTSService:
         else:
             return TTSProvider.GTTS
     
+    @traced("tts.generate_speech", category="tts")
     async def generate_speech(
         self,
         text: str,
@@ -305,9 +357,8 @@ class TTSService:
     ) -> AudioResult:
         """Gera áudio a partir de texto"""
         
-        # Configuração padrão
-        if config is None:
-            config = TTSConfig()
+        # Configuração padrão (cópia: o provider é ajustado por chamada)
+        config = replace(config) if config is not None else TTSConfig()
         
         # Auto-selecionar provider se necessário
         if config.provider == TTSProvider.AUTO:
@@ -364,15 +415,17 @@ class TTSService:
         texts: List[str],
         config: Optional[TTSConfig] = None
     ) -> List[AudioResult]:
-        """Gera múltiplos áudios em lote"""
-        results = []
-        
-        for i, text in enumerate(texts):
-            filename = f"batch_{i}_{hash(text) % 100000}.mp3"
-            result = await self.generate_speech(text, config, filename)
-            results.append(result)
+        """
+        Gera múltiplos áudios em lote
         
-        return results
+        Os textos são enviados concorrentemente; com Bark, os segmentos de todos
+        eles chegam juntos à thread de inferência e são gerados nas mesmas
+        chamadas a model.generate.
+        """
+        return list(await asyncio.gather(*[
+            self.generate_speech(text, config, f"batch_{i}_{hash(text) % 100000}.mp3")
+            for i, text in enumerate(texts)
+        ]))
     
     async def cleanup_temp_files(self, max_age_hours: int = 24):
         """Limpa arquivos temporários antigos"""
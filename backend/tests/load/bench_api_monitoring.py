@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark do Monitoramento de API - TecnoCursos AI
+
+Compara o AdvancedAPIMonitoringService atual (sketches de quantis) com a
+versão de uma revisão do git (pontos em deque + statistics.quantiles):
+custo por record_request, custo do get_dashboard_data, memória retida
+(tracemalloc) e erro de p50/p95/p99 em relação aos valores exatos.
+
+Uso:
+    python tests/load/bench_api_monitoring.py [--requests 100000] [--baseline-ref <commit>]
+"""
+
+import argparse
+import importlib.util
+import logging
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(BACKEND_DIR))
+
+ENDPOINTS = [f"/api/resource/{i}" for i in range(20)]
+
+
+def load_baseline(ref: str):
+    source = subprocess.run(
+        ["git", "show", f"{ref}:backend/app/services/api_monitoring_service.py"],
+        cwd=str(BACKEND_DIR), capture_output=True, text=True, check=True,
+    ).stdout
+    path = Path(tempfile.mkdtemp(prefix="bench_monitoring_")) / "api_monitoring_baseline.py"
+    path.write_text(source, encoding="utf-8")
+    spec = importlib.util.spec_from_file_location("api_monitoring_baseline", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def workload(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    return [
+        (rng.choice(ENDPOINTS), rng.choice(("GET", "POST")),
+         200 if rng.random() > 0.02 else 500, rng.lognormvariate(5, 1))
+        for _ in range(count)
+    ]
+
+
+def record_all(service, requests):
+    for endpoint, method, status, latency in requests:
+        service.record_request(endpoint=endpoint, method=method, status_code=status, response_time_ms=latency)
+
+
+def measure(service_cls, requests) -> dict:
+    # Tempo sem tracemalloc (que encarece cada alocação); memória em uma segunda carga
+    service = service_cls()
+    started = time.perf_counter()
+    record_all(service, requests)
+    record_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    dashboard = service.get_dashboard_data()
+    dashboard_s = time.perf_counter() - started
+
+    tracemalloc.start()
+    retained_service = service_cls()
+    record_all(retained_service, requests)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "record_us": record_s / len(requests) * 1e6,
+        "dashboard_ms": dashboard_s * 1000,
+        "retained_mb": retained / 1024 / 1024,
+        "summary": dashboard["response_time_analysis"].get("summary", {}),
+        "counted": dashboard["total_requests_15min"],
+    }
+
+
+def exact(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def report(label: str, result: dict, latencies: list):
+    errors = []
+    for key, q in (("median", 0.5), ("p95", 0.95), ("p99", 0.99)):
+        value = result["summary"].get(key)
+        if value is not None:
+            errors.append(f"{key} {abs(value - exact(latencies, q)) / exact(latencies, q) * 100:.2f}%")
+    print(f"{label:>10}: record {result['record_us']:6.2f}µs  dashboard {result['dashboard_ms']:8.1f}ms  "
+          f"memória {result['retained_mb']:7.2f}MB  contadas {result['counted']}  erro: {', '.join(errors)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=100000)
+    parser.add_argument("--baseline-ref", help="revisão do git com o coletor baseado em pontos")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    from app.services.api_monitoring_service import AdvancedAPIMonitoringService
+
+    requests = workload(args.requests)
+    latencies = [r[3] for r in requests]
+    print(f"{args.requests} requisições, {len(ENDPOINTS)} endpoints\n")
+    report("sketches", measure(AdvancedAPIMonitoringService, requests), latencies)
+
+    if args.baseline_ref:
+        baseline = load_baseline(args.baseline_ref)
+        # O coletor antigo guarda no máximo 10.000 pontos: os quantis cobrem só o fim do fluxo
+        report("pontos", measure(baseline.AdvancedAPIMonitoringService, requests), latencies[-10000:])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark do Logging - TecnoCursos AI
+
+Mede a latência na thread que loga (p50/p99 por chamada) com o
+TecnoCursosJSONFormatter escrevendo direto em arquivo (um write e um
+flush por registro, formatação na thread chamadora) e com o LogPipeline
+(fila + thread de escrita em lotes), além da vazão de escrita.
+
+Uso:
+    python tests/load/bench_logging.py [--records 50000] [--threads 4]
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.core.enhanced_logging import (  # noqa: E402
+    BatchFileSink, LogContext, LogPipeline, TecnoCursosJSONFormatter,
+)
+
+
+def run(handler: logging.Handler, records: int, threads: int) -> list:
+    logger = logging.getLogger(f"bench.{id(handler)}")
+    logger.handlers = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    per_thread = records // threads
+    samples: list = []
+    lock = threading.Lock()
+
+    def worker(index: int):
+        local = []
+        payload = {"scene_id": index, "headers": {"authorization": "Bearer x", "accept": "*/*"}}
+        with LogContext(correlation_id=f"req-{index}", request_path="/api/scenes"):
+            for i in range(per_thread):
+                started = time.perf_counter()
+                logger.info("cena %d renderizada", i, extra={"payload": payload, "duration_ms": 12.5})
+                local.append(time.perf_counter() - started)
+        with lock:
+            samples.extend(local)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return samples
+
+
+def report(label: str, samples: list, total_seconds: float):
+    samples.sort()
+    p50 = statistics.median(samples) * 1e6
+    p99 = samples[int(len(samples) * 0.99)] * 1e6
+    print(f"{label:<28} p50 {p50:7.1f}µs  p99 {p99:8.1f}µs  vazão {len(samples) / total_seconds:9.0f} reg/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=50000)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        direct = logging.FileHandler(Path(tmp) / "direct.log", encoding="utf-8")
+        direct.setFormatter(TecnoCursosJSONFormatter())
+        started = time.perf_counter()
+        samples = run(direct, args.records, args.threads)
+        direct.close()
+        report("formatação na chamada", samples, time.perf_counter() - started)
+
+        sink = BatchFileSink(str(Path(tmp) / "pipeline.log"), TecnoCursosJSONFormatter())
+        # Fila maior que o total: mede latência e vazão sem descartes
+        pipeline = LogPipeline([sink], queue_size=args.records * 2)
+        started = time.perf_counter()
+        samples = run(pipeline.handler, args.records, args.threads)
+        pipeline.stop(timeout=60)
+        report("LogPipeline (até gravar)", samples, time.perf_counter() - started)
+        stats = pipeline.get_stats()
+        print(f"  lotes {stats['batches']}, registros {stats['written']}, descartes {stats['dropped']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de Operações em Lote de Cenas - TecnoCursos AI
+
+Compara a implementação por linha (ORM, um flush por cena/asset) com as
+operações baseadas em conjuntos de app.services.scene_bulk_operations,
+em projetos com 10, 100 e 1.000 cenas (3 assets por cena), usando SQLite
+em arquivo com as mesmas opções de engine da aplicação.
+
+Uso:
+    python tests/load/bench_scene_bulk_operations.py [--sizes 10 100 1000] [--assets 3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.database import Base, build_engine
+from app.models import Asset, Project, Scene, User
+from app.services.scene_bulk_operations import (
+    ASSET_COPY_COLUMNS, SCENE_COPY_COLUMNS,
+    bulk_delete_scenes, bulk_duplicate_scenes, bulk_reorder_scenes, bulk_update_style
+)
+from app.services.scene_ordering import RANK_GAP
+
+
+def seed(db: Session, scenes: int, assets: int):
+    user = User(email="bench@tecnocursos.ai", username="bench", full_name="Bench", hashed_password="x")
+    db.add(user)
+    db.flush()
+    project = Project(name="Benchmark", slug="benchmark", owner_id=user.id)
+    db.add(project)
+    db.flush()
+    db.bulk_insert_mappings(Scene, [
+        {"project_id": project.id, "name": f"Cena {i}", "ordem": (i + 1) * RANK_GAP,
+         "texto": "Texto da narração " * 40, "layout_config": '{"cols": 2}'}
+        for i in range(scenes)
+    ])
+    scene_ids = [s.id for s in db.query(Scene.id).filter(Scene.project_id == project.id)]
+    db.bulk_insert_mappings(Asset, [
+        {"scene_id": scene_id, "project_id": project.id, "name": f"asset {j}", "tipo": "image",
+         "caminho_arquivo": f"/static/{scene_id}_{j}.png"}
+        for scene_id in scene_ids for j in range(assets)
+    ])
+    db.commit()
+    return user.id, project.id
+
+
+# ----------------------------------------------------------------------------
+# Implementações por linha (comportamento anterior)
+# ----------------------------------------------------------------------------
+
+def per_row_duplicate(db: Session, scenes, user_id: int):
+    for scene in scenes:
+        max_ordem = db.query(Scene.ordem).filter(Scene.project_id == scene.project_id) \
+            .order_by(Scene.ordem.desc()).limit(1).scalar()
+        copy = Scene(project_id=scene.project_id, name=f"{scene.name} (Cópia)",
+                     ordem=(max_ordem or 0) + 1, created_by=user_id, parent_scene_id=scene.id,
+                     **{c: getattr(scene, c) for c in SCENE_COPY_COLUMNS})
+        db.add(copy)
+        db.flush()
+        for asset in db.query(Asset).filter(Asset.scene_id == scene.id).all():
+            db.add(Asset(scene_id=copy.id, created_by=user_id, parent_asset_id=asset.id,
+                         **{c: getattr(asset, c) for c in ASSET_COPY_COLUMNS}))
+            db.flush()
+    db.commit()
+
+
+def per_row_update_style(db: Session, scenes):
+    for scene in scenes:
+        db.query(Scene).filter(Scene.id == scene.id).update(
+            {Scene.style_preset: "tech", Scene.updated_at: datetime.utcnow()})
+    db.commit()
+
+
+def per_row_reorder(db: Session, scenes):
+    for position, scene in enumerate(reversed(scenes)):
+        db.query(Scene).filter(Scene.id == scene.id).update(
+            {Scene.ordem: position + 1, Scene.updated_at: datetime.utcnow()})
+    db.commit()
+
+
+def per_row_delete(db: Session, scenes):
+    for scene in scenes:
+        db.delete(scene)
+        db.flush()
+    db.commit()
+
+
+# ----------------------------------------------------------------------------
+# Implementações em lote
+# ----------------------------------------------------------------------------
+
+def set_based_duplicate(db: Session, scenes, user_id: int):
+    bulk_duplicate_scenes(db, scenes, user_id)
+    db.commit()
+
+
+def set_based_update_style(db: Session, scenes):
+    bulk_update_style(db, [s.id for s in scenes], "tech")
+    db.commit()
+
+
+def set_based_reorder(db: Session, scenes):
+    orders = {str(s.id): position for position, s in enumerate(reversed(scenes))}
+    bulk_reorder_scenes(db, scenes, orders)
+    db.commit()
+
+
+def set_based_delete(db: Session, scenes):
+    bulk_delete_scenes(db, [s.id for s in scenes])
+    db.commit()
+
+
+def run(size: int, assets: int, set_based: bool):
+    """Executa as quatro operações sobre um banco novo; retorna {op: (s, comandos)}"""
+    directory = tempfile.mkdtemp(prefix="bench_bulk_")
+    engine = build_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+    Base.metadata.create_all(engine)
+    statements = []
+    results = {}
+    with Session(engine) as db:
+        user_id, project_id = seed(db, size, assets)
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(1))
+
+        def scenes():
+            return db.query(Scene).filter(Scene.project_id == project_id).order_by(Scene.ordem).all()
+
+        operations = [
+            ("duplicate", lambda s: (set_based_duplicate if set_based else per_row_duplicate)(db, s, user_id)),
+            ("update_style", lambda s: (set_based_update_style if set_based else per_row_update_style)(db, s)),
+            ("reorder", lambda s: (set_based_reorder if set_based else per_row_reorder)(db, s)),
+            ("delete", lambda s: (set_based_delete if set_based else per_row_delete)(db, s)),
+        ]
+        for name, operation in operations:
+            db.expire_all()
+            target = scenes()[:size]
+            statements.clear()
+            started = time.perf_counter()
+            operation(target)
+            results[name] = (time.perf_counter() - started, len(statements))
+    engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--assets", type=int, default=3, help="Assets por cena")
+    args = parser.parse_args()
+
+    print(f"{'cenas':>6} {'operação':<13} {'por linha':>12} {'cmds':>6} {'em lote':>10} {'cmds':>6} {'ganho':>7}")
+    for size in args.sizes:
+        baseline = run(size, args.assets, set_based=False)
+        batched = run(size, args.assets, set_based=True)
+        for name, (seconds, statements) in baseline.items():
+            fast_seconds, fast_statements = batched[name]
+            print(f"{size:>6} {name:<13} {seconds * 1000:>10.1f}ms {statements:>6} "
+                  f"{fast_seconds * 1000:>8.1f}ms {fast_statements:>6} {seconds / fast_seconds:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
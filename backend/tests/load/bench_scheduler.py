@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark do Agendador - TecnoCursos AI
+
+Compara N jobs periódicos rodando como loops `while True: await
+asyncio.sleep(intervalo)` independentes com os mesmos jobs registrados no
+agendador compartilhado (roda de tempo): CPU gasta no processo, atraso das
+execuções em relação ao vencimento e atraso do event loop para uma task
+de requisição (sleep de 10 ms medido).
+
+Uso:
+    python tests/load/bench_scheduler.py [--jobs 500] [--seconds 10]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.core.scheduler import Scheduler  # noqa: E402
+
+INTERVALS = (1.0, 5.0, 30.0, 60.0)
+
+
+async def probe_loop_lag(seconds: float) -> list:
+    lags = []
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append(time.perf_counter() - started - 0.01)
+    return lags
+
+
+async def with_sleep_loops(jobs: int, seconds: float):
+    delays = []
+
+    async def loop(interval: float):
+        due = time.monotonic() + random.uniform(0, interval)
+        while True:
+            await asyncio.sleep(due - time.monotonic())
+            delays.append(time.monotonic() - due)
+            due += interval
+
+    tasks = [asyncio.create_task(loop(random.choice(INTERVALS))) for _ in range(jobs)]
+    lags = await probe_loop_lag(seconds)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return delays, lags
+
+
+async def with_scheduler(jobs: int, seconds: float):
+    scheduler = Scheduler(tick=0.1)
+    delays = []
+
+    def make_job(name: str):
+        def job():
+            delays.append(time.monotonic() - scheduler.get_job(name).grid_at
+                          + scheduler.get_job(name).interval)
+        return job
+
+    for i in range(jobs):
+        interval = random.choice(INTERVALS)
+        scheduler.add_job(f"job{i}", make_job(f"job{i}"), interval=interval,
+                          initial_delay=random.uniform(0, interval))
+    lags = await probe_loop_lag(seconds)
+    await scheduler.stop()
+    return delays, lags, scheduler.wakeups
+
+
+def report(label: str, cpu: float, delays: list, lags: list, extra: str = ""):
+    delays.sort()
+    lags.sort()
+    p99 = lambda values: values[int(len(values) * 0.99)] * 1000 if values else 0.0  # noqa: E731
+    print(f"{label:<16} CPU {cpu * 1000:8.1f} ms  execuções {len(delays):6d}  "
+          f"atraso p50 {statistics.median(delays) * 1000 if delays else 0:6.2f} ms p99 {p99(delays):6.2f} ms  "
+          f"lag do loop p99 {p99(lags):6.2f} ms {extra}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    started = time.process_time()
+    delays, lags = asyncio.run(with_sleep_loops(args.jobs, args.seconds))
+    report("loops com sleep", time.process_time() - started, delays, lags, f"(tasks {args.jobs})")
+
+    started = time.process_time()
+    delays, lags, wakeups = asyncio.run(with_scheduler(args.jobs, args.seconds))
+    report("agendador", time.process_time() - started, delays, lags, f"(wakeups {wakeups})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de Tempo de Startup - TecnoCursos AI
+
+Mede, em subprocessos limpos, o tempo de `import app.main` e do primeiro
+request a um endpoint leve (/api/health), com routers montados sob demanda
+(LAZY_ROUTERS=true) e todos montados no import (LAZY_ROUTERS=false). Também
+lista quais pilhas pesadas (torch, PyMuPDF, MoviePy, PIL...) foram carregadas.
+
+Serve como teste de regressão: com --max-import-ms, termina com código 1 se a
+mediana do import no modo preguiçoso passar do limite.
+
+Uso:
+    python tests/load/bench_startup.py [--runs 5] [--max-import-ms 1500]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+HEAVY_MODULES = ["torch", "transformers", "fitz", "moviepy", "PIL", "cv2", "numpy", "pandas", "sklearn"]
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app.main.app) as client:
+    ready = time.perf_counter()
+    client.get("/api/health")
+    first = time.perf_counter()
+print("BENCH" + json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "startup_ms": (ready - imported) * 1000,
+    "first_request_ms": (first - ready) * 1000,
+    "modules": len(sys.modules),
+    "heavy": [m for m in %r if m in sys.modules],
+    "mounted": app.main.router_registry.get_status()["mounted"],
+}))
+""" % (HEAVY_MODULES,)
+
+
+def probe(lazy: bool) -> dict:
+    env = dict(os.environ, LAZY_ROUTERS="true" if lazy else "false", PYTHONPATH=str(BACKEND_DIR))
+    completed = subprocess.run([sys.executable, "-c", PROBE], cwd=str(BACKEND_DIR), env=env,
+                               capture_output=True, text=True, timeout=600)
+    for line in completed.stdout.splitlines():
+        if line.startswith("BENCH"):
+            return json.loads(line[len("BENCH"):])
+    raise RuntimeError(f"probe falhou (código {completed.returncode}):\n{completed.stderr[-2000:]}")
+
+
+def summarize(runs: list) -> dict:
+    return {
+        key: statistics.median(run[key] for run in runs)
+        for key in ("import_ms", "startup_ms", "first_request_ms", "modules", "mounted")
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, help="limite de regressão para o modo preguiçoso")
+    args = parser.parse_args()
+
+    results = {}
+    for lazy in (True, False):
+        runs = [probe(lazy) for _ in range(args.runs)]
+        results[lazy] = summarize(runs)
+        label = "preguiçoso" if lazy else "eager"
+        r = results[lazy]
+        print(f"{label:>11}: import {r['import_ms']:7.0f}ms  startup {r['startup_ms']:6.0f}ms  "
+              f"1º request {r['first_request_ms']:6.0f}ms  {r['modules']:5.0f} módulos  "
+              f"{r['mounted']:.0f} routers montados  pesados: {', '.join(runs[-1]['heavy']) or '-'}")
+
+    speedup = results[False]["import_ms"] / results[True]["import_ms"]
+    print(f"\nImport {speedup:.1f}x mais rápido com montagem sob demanda")
+
+    if args.max_import_ms is not None and results[True]["import_ms"] > args.max_import_ms:
+        print(f"❌ Regressão: import {results[True]['import_ms']:.0f}ms > limite {args.max_import_ms:.0f}ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark do Tracing - TecnoCursos AI
+
+Mede o custo de `span()` fora de um trace (caminho sem tracing), dentro de
+um trace ativo, e o custo por requisição do TracingMiddleware em um app
+FastAPI mínimo com e sem o middleware.
+
+Uso:
+    python tests/load/bench_tracing.py [--spans 200000] [--requests 2000]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.core.tracing import TailSampler, TraceStore, TracingMiddleware, span, trace  # noqa: E402
+
+
+def span_cost(count: int, active: bool) -> float:
+    store = TraceStore(TailSampler(slow_ms=float("inf"), sample_rate=0.0))
+    started = time.perf_counter()
+    if active:
+        # Traces de 1000 spans (limite por trace é 2000)
+        for _ in range(count // 1000):
+            with trace("bench", store=store):
+                for _ in range(1000):
+                    with span("db.query", category="db"):
+                        pass
+    else:
+        for _ in range(count):
+            with span("db.query", category="db"):
+                pass
+    return (time.perf_counter() - started) / count * 1e9
+
+
+def request_cost(requests: int, traced: bool) -> float:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+    if traced:
+        app.add_middleware(TracingMiddleware, store=TraceStore(TailSampler(slow_ms=float("inf"), sample_rate=0.0)))
+
+    @app.get("/api/scenes")
+    async def scenes():
+        for _ in range(10):
+            with span("cache.get", category="cache"):
+                pass
+        return {"ok": True}
+
+    samples = []
+    with TestClient(app) as client:
+        for _ in range(requests):
+            started = time.perf_counter()
+            client.get("/api/scenes")
+            samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--spans", type=int, default=200000)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"span() sem trace ativo: {span_cost(args.spans, active=False):7.0f} ns")
+    print(f"span() com trace ativo: {span_cost(args.spans, active=True):7.0f} ns")
+    plain = request_cost(args.requests, traced=False)
+    with_tracing = request_cost(args.requests, traced=True)
+    print(f"requisição (10 spans):  {plain:7.0f} µs sem middleware, {with_tracing:7.0f} µs com "
+          f"(+{with_tracing - plain:.0f} µs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de Inferência TTS em Lote - TecnoCursos AI
+
+Compara a geração por segmento (uma chamada ao modelo por segmento, como o
+BarkTTSEngine fazia) com o BatchInferenceWorker, que agrupa com padding os
+segmentos de vários textos concorrentes em uma única chamada.
+
+Sem torch/transformers, usa um modelo stub autorregressivo em numpy (um passo
+de decodificação por token, camadas densas sobre o estado do lote), com o mesmo
+perfil de custo do Bark em CPU: overhead fixo por passo e produtos
+matriz-vetor que viram matriz-matriz quando há lote.
+Com --bark, usa o modelo real (suno/bark-small) se estiver instalado.
+
+Uso:
+    python tests/load/bench_tts_batching.py [--texts 16] [--segments 3] [--batch-sizes 1 4 8 16]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from backend.services.tts_batching import BatchInferenceWorker
+
+
+class StubAcousticModel:
+    """
+    Modelo stub autorregressivo: um passo de decodificação por token, cada passo
+    com camadas densas sobre o estado (lote x hidden). Como no Bark, o lote
+    transforma produtos matriz-vetor em matriz-matriz, ao custo do padding.
+    """
+
+    def __init__(self, hidden: int = 512, layers: int = 4, samples_per_token: int = 64, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        self.embedding = rng.standard_normal((256, hidden)).astype(np.float32)
+        self.layers = [rng.standard_normal((hidden, hidden)).astype(np.float32) / np.sqrt(hidden)
+                       for _ in range(layers)]
+        self.output = rng.standard_normal((hidden, samples_per_token)).astype(np.float32)
+
+    def generate(self, voice_preset, segments):
+        tokens = [np.frombuffer(s.encode("utf-8"), dtype=np.uint8) for s in segments]
+        lengths = [len(t) for t in tokens]
+        padded = np.zeros((len(tokens), max(lengths)), dtype=np.uint8)
+        for row, t in zip(padded, tokens):
+            row[:len(t)] = t
+        state = np.zeros((len(segments), self.embedding.shape[1]), dtype=np.float32)
+        frames = []
+        for step in range(padded.shape[1]):
+            state = state + self.embedding[padded[:, step]]
+            for weights in self.layers:
+                state = np.tanh(state @ weights)
+            frames.append(state @ self.output)
+        audio = np.stack(frames, axis=1).reshape(len(segments), -1)
+        samples = self.output.shape[1]
+        return [row[:length * samples] for row, length in zip(audio, lengths)]
+
+
+class BarkModel:
+    """Modelo real (opcional) com a mesma interface do stub"""
+
+    def __init__(self, model_name: str = "suno/bark-small"):
+        import torch
+        from transformers import AutoProcessor, BarkModel as HFBarkModel
+        self.torch = torch
+        self.processor = AutoProcessor.from_pretrained(model_name)
+        self.model = HFBarkModel.from_pretrained(model_name)
+
+    def generate(self, voice_preset, segments):
+        inputs = self.processor(segments, voice_preset=voice_preset, padding=True)
+        with self.torch.no_grad():
+            audio, lengths = self.model.generate(**inputs, return_output_lengths=True)
+        return [row[:int(n)].numpy() for row, n in zip(audio, lengths)]
+
+
+def make_texts(count: int, segments: int):
+    rng = np.random.default_rng(42)
+    words = "o curso apresenta conceitos de programação com exemplos práticos e exercícios".split()
+    return [
+        [" ".join(rng.choice(words, size=int(rng.integers(8, 24)))) + "." for _ in range(segments)]
+        for _ in range(count)
+    ]
+
+
+def bench_sequential(model, texts):
+    started = time.perf_counter()
+    for segments in texts:
+        for segment in segments:
+            model.generate("v2/pt_speaker_0", [segment])
+    return time.perf_counter() - started
+
+
+def bench_batched(model, texts, batch_size: int):
+    worker = BatchInferenceWorker(model.generate, max_batch_size=batch_size, batch_window=0.005)
+
+    async def run():
+        return await asyncio.gather(*[worker.infer("v2/pt_speaker_0", segments) for segments in texts])
+
+    started = time.perf_counter()
+    asyncio.run(run())
+    elapsed = time.perf_counter() - started
+    stats = worker.get_stats()
+    worker.stop(timeout=5)
+    return elapsed, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=16)
+    parser.add_argument("--segments", type=int, default=3)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--bark", action="store_true", help="usar o modelo Bark real")
+    args = parser.parse_args()
+
+    model = BarkModel() if args.bark else StubAcousticModel()
+    texts = make_texts(args.texts, args.segments)
+    total = args.texts * args.segments
+    model.generate("v2/pt_speaker_0", texts[0])  # aquecimento
+
+    print(f"{total} segmentos ({args.texts} textos x {args.segments}), modelo: {type(model).__name__}")
+    baseline = bench_sequential(model, texts)
+    print(f"{'por segmento':>16}: {baseline:8.3f}s  {total / baseline:8.1f} seg/s")
+    for batch_size in args.batch_sizes:
+        elapsed, stats = bench_batched(model, texts, batch_size)
+        print(f"{'lote ' + str(batch_size):>16}: {elapsed:8.3f}s  {total / elapsed:8.1f} seg/s"
+              f"  ({stats['batches']} chamadas, média {stats['avg_batch_size']}, x{baseline / elapsed:.2f})")
+
+
+if __name__ == "__main__":
+    main()
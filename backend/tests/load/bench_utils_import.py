@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de Import de app.utils - TecnoCursos AI
+
+Mede, em subprocessos limpos, o tempo de import, a memória residente (RSS) e
+os módulos carregados para cada ponto de entrada típico de app.utils
+(helpers de arquivo, análise de texto, documentos, narração, vídeo).
+
+Com --baseline-ref, compara com o app/utils.py monolítico de uma revisão do
+git (ex.: a anterior à divisão), extraído para um diretório temporário.
+
+Uso:
+    python tests/load/bench_utils_import.py [--runs 5] [--baseline-ref <commit>]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+HEAVY_MODULES = ["fitz", "PIL", "moviepy", "magic", "torch", "transformers", "backend.services.tts_service"]
+
+ENTRY_POINTS = {
+    "arquivos": "format_file_size, validate_file_type",
+    "texto": "extract_keywords, analyze_text_statistics",
+    "documentos": "extract_pdf_text",
+    "narração": "generate_narration_sync",
+    "vídeo": "create_video_from_text_and_audio",
+}
+
+PROBE = """
+import json, resource, sys, time
+baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+started = time.perf_counter()
+from app.utils import {names}
+elapsed = time.perf_counter() - started
+print("BENCH" + json.dumps({{
+    "import_ms": elapsed * 1000,
+    "rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_rss,
+    "modules": len(sys.modules),
+    "heavy": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def probe(names: str, cwd: Path) -> dict:
+    env = dict(os.environ, PYTHONPATH=str(cwd))
+    code = PROBE.format(names=names, heavy=HEAVY_MODULES)
+    completed = subprocess.run([sys.executable, "-c", code], cwd=str(cwd), env=env,
+                               capture_output=True, text=True, timeout=600)
+    for line in completed.stdout.splitlines():
+        if line.startswith("BENCH"):
+            return json.loads(line[len("BENCH"):])
+    raise RuntimeError(f"probe falhou (código {completed.returncode}):\n{completed.stderr[-1000:]}")
+
+
+def baseline_tree(ref: str) -> Path:
+    """Cópia mínima de app/ com o utils.py monolítico da revisão `ref`"""
+    source = subprocess.run(["git", "show", f"{ref}:backend/app/utils.py"], cwd=str(BACKEND_DIR),
+                            capture_output=True, text=True, check=True).stdout
+    root = Path(tempfile.mkdtemp(prefix="bench_utils_"))
+    (root / "app").mkdir()
+    shutil.copy(BACKEND_DIR / "app" / "__init__.py", root / "app" / "__init__.py")
+    (root / "app" / "utils.py").write_text(source, encoding="utf-8")
+    return root
+
+
+def measure(cwd: Path, runs: int) -> dict:
+    results = {}
+    for label, names in ENTRY_POINTS.items():
+        try:
+            samples = [probe(names, cwd) for _ in range(runs)]
+        except RuntimeError as e:
+            results[label] = {"error": str(e).splitlines()[-1]}
+            continue
+        results[label] = {
+            "import_ms": statistics.median(s["import_ms"] for s in samples),
+            "rss_kb": statistics.median(s["rss_kb"] for s in samples),
+            "modules": statistics.median(s["modules"] for s in samples),
+            "heavy": samples[-1]["heavy"],
+        }
+    return results
+
+
+def print_results(title: str, results: dict):
+    print(f"\n{title}")
+    for label, r in results.items():
+        if "error" in r:
+            print(f"  {label:>11}: ❌ {r['error']}")
+            continue
+        print(f"  {label:>11}: {r['import_ms']:8.1f}ms  {r['rss_kb'] / 1024:7.1f}MB  "
+              f"{r['modules']:5.0f} módulos  pesados: {', '.join(r['heavy']) or '-'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--baseline-ref", help="revisão do git com o app/utils.py monolítico")
+    args = parser.parse_args()
+
+    print_results("app.utils (módulos por domínio)", measure(BACKEND_DIR, args.runs))
+
+    if args.baseline_ref:
+        root = baseline_tree(args.baseline_ref)
+        try:
+            print_results(f"app/utils.py monolítico ({args.baseline_ref})", measure(root, args.runs))
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
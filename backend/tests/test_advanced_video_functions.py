@@ -76,7 +76,7 @@ def sample_slides_text():
 @pytest.fixture
 def mock_moviepy():
     """Mock do MoviePy para testes sem dependência."""
-    with patch('app.utils.MOVIEPY_AVAILABLE', True):
+    with patch('app.utils.video.MOVIEPY_AVAILABLE', True):
         with patch('moviepy.editor.VideoFileClip') as mock_clip:
             mock_instance = Mock()
             mock_instance.duration = 10.0
@@ -193,7 +193,7 @@ class TestBatchVideoCreation:
         output_folder = os.path.join(temp_directory, "videos_output")
 
         # Mock das funções de vídeo para evitar dependências pesadas
-        with patch('app.utils.create_video_from_text_and_audio') as mock_create_video:
+        with patch('app.utils.video.create_video_from_text_and_audio') as mock_create_video:
             mock_create_video.return_value = {
                 'success': True,
                 'output_path': 'fake_video.mp4',
@@ -397,7 +397,7 @@ class TestBatchInfo:
 class TestVideoStitching:
     """Testes para união de vídeos (com mocks)."""
 
-    @patch('app.utils.MOVIEPY_AVAILABLE', True)
+    @patch('app.utils.video.MOVIEPY_AVAILABLE', True)
     def test_stitch_videos_mock(self, temp_directory):
         """Testa união de vídeos com mock do MoviePy."""
         video_paths = ["video1.mp4", "video2.mp4", "video3.mp4"]
@@ -0,0 +1,67 @@
+"""
+Testes unitários para a renderização de frames do avatar a partir de templates
+Arquivo: tests/test_avatar_video_generator.py
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+try:
+    from backend.services.avatar_video_generator import AvatarConfig, AvatarGenerator, composite_over_color
+except ImportError:
+    pytest.skip("Módulo avatar_video_generator não encontrado", allow_module_level=True)
+
+
+class CountingAvatarGenerator(AvatarGenerator):
+    """Conta quantas vezes um estado do rosto é de fato desenhado"""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.draw_calls = 0
+
+    def add_facial_features(self, avatar, mouth_state="neutral", eyes_open=True):
+        self.draw_calls += 1
+        return super().add_facial_features(avatar, mouth_state, eyes_open)
+
+
+class TestAvatarFrames:
+    """Frames compartilham os templates em cache"""
+
+    def test_frames_have_expected_shape(self):
+        generator = AvatarGenerator(AvatarConfig())
+        width, height = generator.avatar_size
+
+        frames = list(generator.iter_frames(audio_duration=0.5, fps=10))
+
+        assert len(frames) == 5
+        for frame in frames:
+            assert frame.shape == (height, width, 3)
+            assert frame.dtype == np.uint8
+
+    def test_frames_reuse_cached_templates(self):
+        generator = CountingAvatarGenerator(AvatarConfig())
+
+        frames = list(generator.iter_frames(audio_duration=4.0, fps=10))
+        states = {generator.frame_state(n, 10) for n in range(len(frames))}
+
+        # 40 frames, mas cada estado do rosto é desenhado uma única vez
+        assert len(frames) == 40
+        assert generator.draw_calls == len(states) < len(frames)
+        assert len({id(frame) for frame in frames}) == len(states)
+        assert generator.get_composited_template(*generator.frame_state(0, 10)) is frames[0]
+
+    def test_composite_over_color(self):
+        rgba = np.zeros((2, 2, 4), dtype=np.uint8)
+        rgba[0, 0] = (255, 0, 0, 255)
+        rgba[1, 1] = (0, 0, 255, 128)
+
+        out = composite_over_color(rgba, (255, 255, 255))
+
+        assert tuple(out[0, 0]) == (255, 0, 0)
+        assert tuple(out[0, 1]) == (255, 255, 255)
+        assert tuple(out[1, 1]) == (127, 127, 255)
@@ -0,0 +1,117 @@
+"""
+Testes unitários para a mesclagem LWW do CollaborationEngine
+Arquivo: tests/test_collaboration_engine.py
+"""
+
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+try:
+    from system.collaboration_engine import (
+        Action, ActionType, CollaborationEngine, PermissionLevel, User
+    )
+except ImportError:
+    pytest.skip("Módulo collaboration_engine não encontrado", allow_module_level=True)
+
+
+class _Socket:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+
+class _Redis:
+    def __init__(self):
+        self.saved = {}
+
+    def setex(self, key, ttl, value):
+        self.saved[key] = json.loads(value)
+
+
+def _user(user_id):
+    return User(id=user_id, name=user_id, email=f"{user_id}@x", avatar="", color="#000",
+                permission=PermissionLevel.EDITOR, status="online", last_seen=datetime.now())
+
+
+def _update(user_id, target, lamport=None, **properties):
+    return Action(id=f"{user_id}-{target}-{sorted(properties.items())}", user_id=user_id, project_id="p",
+                  action_type=ActionType.UPDATE, target_id=target, data={"properties": properties},
+                  timestamp=datetime.now(), lamport=lamport)
+
+
+async def _engine_with_session():
+    engine = CollaborationEngine()
+    session = await engine.create_session("p", _user("ana"))
+    session.users["bia"] = _user("bia")
+    sockets = {"ana": _Socket(), "bia": _Socket()}
+    for user_id, socket in sockets.items():
+        engine.user_connections[user_id].add(socket)
+    return engine, session, sockets
+
+
+class TestCollaborationEngine:
+    """Testes de convergência LWW, ack de rejeição e relógio de Lamport"""
+
+    def test_concurrent_writes_converge_in_any_order(self):
+        def actions():
+            return [_update("ana", "el", lamport=1, x=10, color="red"),
+                    _update("bia", "el", lamport=1, x=20),
+                    _update("ana", "el", lamport=2, y=5)]
+
+        async def run(order):
+            engine, session, _ = await _engine_with_session()
+            batch = actions()
+            for index in order:
+                assert await engine.apply_action(session.id, batch[index])
+            return session.elements.to_dict()["el"]["properties"]
+
+        states = [asyncio.run(run(order)) for order in ([0, 1, 2], [1, 0, 2], [2, 1, 0])]
+        assert states[0] == states[1] == states[2] == {"x": 20, "color": "red", "y": 5}
+
+    def test_losing_write_is_acked_with_current_value(self):
+        async def run():
+            engine, session, sockets = await _engine_with_session()
+            await engine.apply_action(session.id, _update("bia", "el", lamport=1, x=20))
+            await engine.apply_action(session.id, _update("ana", "el", lamport=1, x=10, y=1))
+            return sockets
+
+        sockets = asyncio.run(run())
+        ack = [m for m in sockets["ana"].sent if m["type"] == "action_ack"][-1]
+        assert ack["rejected"] == {"x": 20}
+        applied = [m for m in sockets["bia"].sent if m["type"] == "action_applied"][-1]
+        assert applied["resolved_properties"] == {"y": 1}
+
+    def test_inflated_client_lamport_is_clamped(self):
+        async def run():
+            engine, session, _ = await _engine_with_session()
+            await engine.apply_action(session.id, _update("ana", "el", lamport=10 ** 9, x=1))
+            await engine.apply_action(session.id, _update("bia", "el", x=2))
+            return session
+
+        session = asyncio.run(run())
+        assert session.lamport == 2
+        assert session.elements.to_dict()["el"]["properties"] == {"x": 2}
+
+    def test_redis_snapshot_keeps_only_recent_actions(self):
+        async def run():
+            engine, session, _ = await _engine_with_session()
+            engine.redis_client = _Redis()
+            for i in range(150):
+                await engine.apply_action(session.id, _update("ana", f"el-{i % 3}", x=i))
+            return engine.redis_client.saved[f"session:{session.id}"]
+
+        saved = asyncio.run(run())
+        assert "actions" not in saved and "op_log" not in saved
+        assert len(saved["recent_actions"]) == 100
+        assert saved["recent_actions"][-1]["data"] == {"properties": {"x": 149}}
+        assert saved["elements"]["el-2"]["properties"] == {"x": 149}
+        assert set(saved["users"]) == {"ana", "bia"}
@@ -0,0 +1,103 @@
+"""
+Testes unitários para a configuração de engines e pools do banco
+Arquivo: tests/test_database.py
+"""
+
+import asyncio
+import importlib.util
+
+import pytest
+
+try:
+    from sqlalchemy import text
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import QueuePool, StaticPool
+    from app import database
+except ImportError:
+    pytest.skip("Módulo database não encontrado", allow_module_level=True)
+
+
+class TestEngineOptions:
+    """Pool e PRAGMAs escolhidos conforme a URL"""
+
+    def test_sqlite_memory_uses_static_pool(self):
+        options = database.engine_options("sqlite://")
+
+        assert options["poolclass"] is StaticPool
+        assert "pool_size" not in options
+
+    def test_server_database_uses_queue_pool(self):
+        options = database.engine_options("postgresql://user:secret@db/tecnocursos")
+
+        assert options["poolclass"] is QueuePool
+        assert options["pool_pre_ping"] == database.settings.db_pool_pre_ping
+        assert options["pool_recycle"] == database.settings.db_pool_recycle
+        assert database.async_url_for("postgresql://user:secret@db/tecnocursos") == \
+            "postgresql+asyncpg://user:secret@db/tecnocursos"
+
+    def test_sqlite_file_enables_wal(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(database.settings, "sqlite_wal", True)
+        engine = database.build_engine(f"sqlite:///{tmp_path / 'app.db'}")
+        try:
+            with engine.connect() as conn:
+                journal_mode = conn.execute(text("PRAGMA journal_mode")).scalar()
+                busy_timeout = conn.execute(text("PRAGMA busy_timeout")).scalar()
+                synchronous = conn.execute(text("PRAGMA synchronous")).scalar()
+
+            assert isinstance(engine.pool, QueuePool)
+            assert journal_mode == "wal"
+            assert busy_timeout == int(database.settings.sqlite_busy_timeout_ms)
+            assert synchronous == 1  # NORMAL
+        finally:
+            engine.dispose()
+
+    @pytest.mark.skipif(
+        not database.ASYNC_SQLALCHEMY_AVAILABLE or importlib.util.find_spec("aiosqlite") is None,
+        reason="aiosqlite/greenlet não instalados"
+    )
+    def test_async_session_runs_sync_queries(self, tmp_path, monkeypatch):
+        url = f"sqlite:///{tmp_path / 'app.db'}"
+        monkeypatch.setattr(database, "SQLALCHEMY_DATABASE_URL", url)
+        monkeypatch.setattr(database.settings, "async_database_url", None)
+        monkeypatch.setattr(database, "_async_engine", None)
+        monkeypatch.setattr(database, "_async_session_factory", None)
+
+        async def scenario():
+            try:
+                session_gen = database.get_async_db()
+                db = await session_gen.__anext__()
+                value = await db.run_sync(lambda sync_db: sync_db.execute(text("SELECT 41 + 1")).scalar())
+                await session_gen.aclose()
+                return value, database.get_pool_status()["async"]
+            finally:
+                await database.dispose_engines()
+
+        value, async_pool = asyncio.run(scenario())
+
+        assert value == 42
+        assert async_pool["pool_class"] == "AsyncAdaptedQueuePool"
+
+    def test_memory_database_async_session_shares_sync_engine(self, monkeypatch):
+        engine = database.build_engine("sqlite://")
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE notas (valor INTEGER)"))
+            conn.execute(text("INSERT INTO notas VALUES (42)"))
+        monkeypatch.setattr(database, "SQLALCHEMY_DATABASE_URL", "sqlite://")
+        monkeypatch.setattr(database.settings, "async_database_url", None)
+        monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=engine))
+        monkeypatch.setattr(database, "_async_engine", None)
+
+        async def scenario():
+            session_gen = database.get_async_db()
+            db = await session_gen.__anext__()
+            value = await db.run_sync(lambda sync_db: sync_db.execute(text("SELECT valor FROM notas")).scalar())
+            await session_gen.aclose()
+            return value
+
+        try:
+            assert asyncio.run(scenario()) == 42
+            assert database.get_pool_status()["async"] == {"pool_class": "shared_sync_engine"}
+            with pytest.raises(RuntimeError):
+                database.get_async_engine()
+        finally:
+            engine.dispose()
@@ -0,0 +1,138 @@
+"""
+Testes unitários para o pipeline de logging (fila, lotes, amostragem)
+Arquivo: tests/test_enhanced_logging.py
+"""
+
+import json
+import logging
+import threading
+
+import pytest
+
+try:
+    from app.core.enhanced_logging import (
+        BatchFileSink, LevelAwareSampler, LogContext, LogPipeline, TecnoCursosJSONFormatter,
+    )
+except ImportError:
+    pytest.skip("Módulo enhanced_logging não encontrado", allow_module_level=True)
+
+
+class ThreadRecordingFormatter(TecnoCursosJSONFormatter):
+    def __init__(self):
+        super().__init__()
+        self.threads = set()
+
+    def format(self, record):
+        self.threads.add(threading.current_thread().name)
+        return super().format(record)
+
+
+class BlockingSink:
+    """Destino que segura a thread de escrita até `release` ser sinalizado"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.records = []
+
+    def write_batch(self, records):
+        self.release.wait(5)
+        self.records.extend(records)
+
+    def sync(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def make_logger(name, pipeline):
+    logger = logging.getLogger(name)
+    logger.handlers = [pipeline.handler]
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    return logger
+
+
+class TestLogPipeline:
+    """Testes do pipeline fila + thread de escrita"""
+
+    def test_formats_on_writer_thread_with_captured_context(self, tmp_path):
+        formatter = ThreadRecordingFormatter()
+        sink = BatchFileSink(str(tmp_path / "app.log"), formatter)
+        pipeline = LogPipeline([sink], flush_interval=0.01)
+        logger = make_logger("test.pipeline.context", pipeline)
+
+        with LogContext(correlation_id="req-42", path="/api/x"):
+            logger.info("processando %s", "item", extra={"api_key": "segredo"})
+        logger.info("fora do contexto")
+        pipeline.stop()
+
+        lines = [json.loads(line) for line in (tmp_path / "app.log").read_text().splitlines()]
+        assert [line["message"] for line in lines] == ["processando item", "fora do contexto"]
+        assert lines[0]["correlation_id"] == "req-42"
+        assert lines[0]["request"] == {"path": "/api/x"}
+        assert lines[0]["api_key"] == "[REDACTED]"
+        assert "correlation_id" not in lines[1]
+        assert formatter.threads == {"log-writer"}
+        assert pipeline.get_stats()["written"] == 2
+
+    def test_bounded_queue_drops_low_priority_first(self):
+        sink = BlockingSink()
+        pipeline = LogPipeline([sink], queue_size=20, low_priority_fill=0.5, flush_interval=0.01)
+        logger = make_logger("test.pipeline.bounded", pipeline)
+
+        for i in range(100):
+            logger.debug("ruído %d", i)
+        for i in range(5):
+            logger.error("falha %d", i)
+        sink.release.set()
+        pipeline.stop()
+
+        stats = pipeline.get_stats()
+        errors = [record for record in sink.records if record.levelno == logging.ERROR]
+        assert len(errors) == 5
+        assert stats["dropped"]["DEBUG"] >= 80
+        assert "ERROR" not in stats["dropped"]
+        assert stats["written"] + stats["dropped"]["DEBUG"] == 105
+
+    def test_file_sink_batches_and_rotates(self, tmp_path):
+        path = tmp_path / "rot.log"
+        sink = BatchFileSink(str(path), logging.Formatter("%(message)s"), max_bytes=200, backup_count=2)
+        pipeline = LogPipeline([sink], batch_size=10, flush_interval=0.01, fsync_interval=0)
+        logger = make_logger("test.pipeline.rotate", pipeline)
+
+        for i in range(60):
+            logger.warning("linha %03d", i)
+        pipeline.stop()
+
+        stats = pipeline.get_stats()
+        assert stats["written"] == 60
+        assert stats["batches"] < 60
+        assert stats["fsyncs"] >= 1
+        assert (tmp_path / "rot.log.1").exists() and (tmp_path / "rot.log.2").exists()
+        assert not (tmp_path / "rot.log.3").exists()
+        assert "linha 059" in path.read_text()
+
+
+class TestLevelAwareSampler:
+    """Testes de amostragem por nível e limite por logger"""
+
+    @staticmethod
+    def record(name, level):
+        return logging.LogRecord(name, level, __file__, 1, "msg", None, None)
+
+    def test_sampling_spares_warnings_and_rate_limits_per_logger(self):
+        sampler = LevelAwareSampler({logging.DEBUG: 0.1}, rate_limit=0.001, burst=20)
+
+        debug_kept = sum(sampler.allow(self.record("noisy", logging.DEBUG)) for _ in range(100))
+        info_kept = sum(sampler.allow(self.record("noisy", logging.INFO)) for _ in range(100))
+        errors_kept = sum(sampler.allow(self.record("noisy", logging.ERROR)) for _ in range(100))
+        quiet_kept = sum(sampler.allow(self.record("quiet", logging.INFO)) for _ in range(10))
+
+        assert debug_kept == 10
+        assert info_kept == 10  # bucket de 20 tokens: 10 já usados pelo DEBUG
+        assert errors_kept == 100
+        assert quiet_kept == 10
+        stats = sampler.get_stats()
+        assert stats["sampled_out"]["DEBUG"] == 90
+        assert stats["rate_limited"] == {"noisy": 90}
@@ -0,0 +1,166 @@
+"""
+Testes unitários para a fila de jobs durável (backends SQLite/Redis e worker)
+Arquivo: tests/test_job_queue.py
+"""
+
+import asyncio
+import os
+import time
+import uuid
+
+import pytest
+
+try:
+    from app.core.job_queue import (
+        CANCELLED, FAILED, QUEUED, RUNNING, SUCCEEDED, Job, JobQueue, PermanentJobError,
+        RedisJobBackend, SQLiteJobBackend, Worker, job_task,
+    )
+except ImportError:
+    pytest.skip("Módulo job_queue não encontrado", allow_module_level=True)
+
+REDIS_URL = os.environ.get("TEST_REDIS_URL", "redis://localhost:6379/15")
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def backend(request, tmp_path):
+    if request.param == "sqlite":
+        yield SQLiteJobBackend(str(tmp_path / "jobs.db"))
+        return
+    try:
+        redis_backend = RedisJobBackend(REDIS_URL, prefix=f"test:jobs:{uuid.uuid4().hex[:8]}")
+        redis_backend.client.ping()
+    except Exception:
+        pytest.skip("Redis não disponível")
+    yield redis_backend
+    for key in redis_backend.client.scan_iter(f"{redis_backend.prefix}:*"):
+        redis_backend.client.delete(key)
+
+
+def make_job(task="test.noop", queue="q", priority=0, key=None, delay=0.0, max_attempts=3):
+    now = time.time()
+    return Job(id=uuid.uuid4().hex, task=task, queue=queue, payload={"n": priority},
+               priority=priority, idempotency_key=key, run_at=now + delay,
+               max_attempts=max_attempts, created_at=now)
+
+
+class TestBackend:
+    """Testes de claim, idempotência e leases"""
+
+    def test_priority_order_idempotency_and_delay(self, backend):
+        low = backend.enqueue(make_job(priority=0))
+        high = backend.enqueue(make_job(priority=5))
+        delayed = backend.enqueue(make_job(priority=9, delay=60))
+        first = backend.enqueue(make_job(key="export:42"))
+        again = backend.enqueue(make_job(key="export:42", priority=7))
+        assert again.id == first.id
+
+        claimed = [backend.claim("q", "w1", 30) for _ in range(4)]
+        assert [job.id for job in claimed[:3]] == [high.id, low.id, first.id]
+        assert claimed[3] is None  # o adiado ainda não venceu
+        assert claimed[0].status == RUNNING and claimed[0].attempts == 1
+        assert backend.get(delayed.id).status == QUEUED
+
+        assert backend.complete(high.id, "w1", {"ok": True})
+        done = backend.get(high.id)
+        assert done.status == SUCCEEDED and done.result == {"ok": True} and done.progress == 100
+
+    def test_expired_lease_is_reclaimed_and_old_owner_rejected(self, backend):
+        job = backend.enqueue(make_job(max_attempts=2))
+        assert backend.claim("q", "dead-worker", 0.05).id == job.id
+        assert backend.heartbeat(job.id, "dead-worker", 0.05, progress=40, stage="render")
+        assert backend.get(job.id).progress == 40
+        time.sleep(0.1)
+
+        reclaimed = backend.claim("q", "w2", 30)
+        assert reclaimed.id == job.id and reclaimed.attempts == 2
+        assert not backend.heartbeat(job.id, "dead-worker", 30)
+        assert not backend.complete(job.id, "dead-worker")
+
+        # Segunda lease expirada com tentativas esgotadas: falha definitiva
+        backend.heartbeat(job.id, "w2", 0.05)
+        time.sleep(0.1)
+        assert backend.claim("q", "w3", 30) is None
+        assert backend.get(job.id).status == FAILED
+
+        # Cancelamento derruba a lease do worker em execução
+        other = backend.enqueue(make_job())
+        backend.claim("q", "w3", 30)
+        assert backend.cancel(other.id)
+        assert backend.get(other.id).status == CANCELLED
+        assert not backend.heartbeat(other.id, "w3", 30)
+
+
+@job_task("test.flaky", queue="flaky", max_attempts=3, retry_base=0.01, retry_max=0.02)
+def flaky(ctx):
+    if ctx.attempt < 3:
+        raise RuntimeError(f"falha na tentativa {ctx.attempt}")
+    return {"attempt": ctx.attempt}
+
+
+@job_task("test.invalid", queue="flaky", max_attempts=3, retry_base=0.01)
+async def invalid(ctx):
+    raise PermanentJobError("payload inválido")
+
+
+_running = {"now": 0, "peak": 0}
+
+
+@job_task("test.render", queue="render")
+async def render(ctx):
+    _running["now"] += 1
+    _running["peak"] = max(_running["peak"], _running["now"])
+    ctx.set_progress(50, "render")
+    await asyncio.sleep(0.05)
+    _running["now"] -= 1
+    return ctx.payload
+
+
+async def wait_final(queue, job_ids, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        jobs = [await queue.get(job_id) for job_id in job_ids]
+        if all(job.is_final for job in jobs):
+            return jobs
+        await asyncio.sleep(0.02)
+    raise AssertionError("jobs não terminaram")
+
+
+class TestWorker:
+    """Testes do worker: retries e concorrência por fila"""
+
+    def test_retries_with_backoff_and_permanent_errors(self, backend):
+        async def scenario():
+            queue = JobQueue(backend)
+            worker = Worker(queue, {"flaky": 2}, lease_seconds=5, poll_interval=0.01)
+            await worker.start()
+            flaky_job = await queue.enqueue("test.flaky")
+            invalid_job = await queue.enqueue("test.invalid")
+            jobs = await wait_final(queue, [flaky_job.id, invalid_job.id])
+            await worker.stop()
+            return jobs
+
+        flaky_job, invalid_job = asyncio.run(scenario())
+        assert flaky_job.status == SUCCEEDED
+        assert flaky_job.attempts == 3 and flaky_job.result == {"attempt": 3}
+        assert invalid_job.status == FAILED and invalid_job.attempts == 1
+        assert "payload inválido" in invalid_job.error
+
+    def test_slots_per_worker_and_global_limit(self, backend):
+        async def scenario():
+            queue = JobQueue(backend)
+            workers = [Worker(queue, {"render": 3}, max_running={"render": 4}, poll_interval=0.01)
+                       for _ in range(2)]
+            for worker in workers:
+                await worker.start()
+            jobs = [await queue.enqueue("test.render", {"i": i}) for i in range(16)]
+            done = await wait_final(queue, [job.id for job in jobs])
+            for worker in workers:
+                await worker.stop()
+            return done, workers
+
+        _running.update(now=0, peak=0)
+        done, workers = asyncio.run(scenario())
+        assert all(job.status == SUCCEEDED for job in done)
+        assert [job.result for job in done] == [{"i": i} for i in range(16)]
+        assert _running["peak"] <= 4  # 2 workers x 3 slots, limitados a 4 na fila
+        assert sum(worker.processed for worker in workers) == 16
@@ -0,0 +1,143 @@
+"""
+Testes unitários para a montagem preguiçosa de routers e o relatório de imports
+Arquivo: tests/test_lazy_routers.py
+"""
+
+import importlib
+import importlib.machinery
+import sys
+import types
+
+import pytest
+
+try:
+    from fastapi import APIRouter, FastAPI
+    from fastapi.testclient import TestClient
+    from app.core.lazy_routers import LazyRouterMiddleware, LazyRouterRegistry
+    from app.core.import_profile import build_report, parse_importtime
+except ImportError:
+    pytest.skip("Módulo lazy_routers não encontrado", allow_module_level=True)
+
+
+@pytest.fixture
+def router_modules(monkeypatch):
+    """Módulos de router falsos; registra quais foram importados"""
+    imported = []
+
+    def make(name, path):
+        module = types.ModuleType(name)
+        module.router = APIRouter()
+
+        @module.router.get(path)
+        async def endpoint():
+            return {"router": name}
+
+        return module
+
+    modules = {
+        "lazy_fake.video": make("video", "/render"),
+        "lazy_fake.auth": make("auth", "/login"),
+    }
+    for fullname, module in modules.items():
+        module.__spec__ = importlib.machinery.ModuleSpec(fullname, None)
+        monkeypatch.setitem(sys.modules, fullname, module)
+    real_import = importlib.import_module
+
+    def tracking_import(name, package=None):
+        imported.append(name)
+        return real_import(name, package)
+
+    monkeypatch.setattr("app.core.lazy_routers.importlib.import_module", tracking_import)
+    return imported
+
+
+def build_app():
+    app = FastAPI()
+    registry = LazyRouterRegistry(app)
+    registry.register("video", "lazy_fake.video", prefix="/api/video")
+    registry.register("auth", "lazy_fake.auth", prefix="/api/auth")
+    registry.register("missing", "lazy_fake.inexistente", prefix="/api/missing")
+    app.add_middleware(LazyRouterMiddleware, registry=registry)
+    return app, registry
+
+
+class TestLazyRouters:
+    """Testes do carregamento sob demanda"""
+
+    def test_router_is_imported_on_first_request_to_its_prefix(self, router_modules):
+        app, registry = build_app()
+
+        with TestClient(app) as client:
+            assert router_modules == []
+            assert client.get("/api/auth/login").json() == {"router": "auth"}
+            assert router_modules == ["lazy_fake.auth"]
+            assert client.get("/api/auth/login").status_code == 200
+            assert router_modules == ["lazy_fake.auth"]
+
+        status = registry.get_status()
+        assert status["routers"]["auth"]["state"] == "mounted"
+        assert status["routers"]["video"]["state"] == "pending"
+
+        # Pendente existe mas ainda não foi importado: não é reportado como disponível
+        assert registry.status("auth") == "available"
+        assert registry.status("video") == "pending"
+        assert registry.status("video", "auth") == "available"
+        assert registry.status("missing") == "unavailable"
+        assert not registry.available("video")
+
+    def test_openapi_loads_every_router(self, router_modules):
+        app, registry = build_app()
+
+        with TestClient(app) as client:
+            paths = client.get("/openapi.json").json()["paths"]
+
+        assert set(paths) == {"/api/video/render", "/api/auth/login"}
+        assert registry.get_status()["routers"]["missing"]["state"] == "unavailable"
+        assert not registry.available("missing")
+
+
+class TestStartupDiagnostics:
+    """Relatório de imports: só administradores e um subprocesso por vez"""
+
+    def test_import_report_requires_admin_and_is_cached(self, monkeypatch):
+        system_control = importlib.import_module("app.routers.system_control")
+        import_profile = importlib.import_module("app.core.import_profile")
+        runs = []
+        monkeypatch.setattr(import_profile, "profile_imports",
+                            lambda module, top: runs.append(module) or {"total_ms": 1.0})
+        monkeypatch.setattr(system_control, "_import_report_cache", {})
+        app = FastAPI()
+        app.include_router(system_control.router)
+
+        with TestClient(app) as client:
+            denied = client.get("/api/system/diagnostics/startup", params={"import_report": True})
+            app.dependency_overrides[system_control.get_current_admin_user] = lambda: object()
+            first = client.get("/api/system/diagnostics/startup", params={"import_report": True})
+            second = client.get("/api/system/diagnostics/startup", params={"import_report": True})
+            client.get("/api/system/diagnostics/startup", params={"import_report": True, "refresh": True})
+
+        assert denied.status_code in (401, 403, 503)
+        assert first.json()["imports"]["total_ms"] == 1.0
+        assert second.json()["imports"]["generated_at"] == first.json()["imports"]["generated_at"]
+        assert runs == ["app.main", "app.main"]
+
+
+class TestImportProfile:
+    """Testes da análise de -X importtime"""
+
+    def test_report_aggregates_by_package(self):
+        output = [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 |     torch._C",
+            "import time:       900 |       1000 |   torch",
+            "import time:       200 |       1200 | app.utils",
+            "Traceback (most recent call last):",
+        ]
+
+        records = parse_importtime(output)
+        report = build_report(records, top=2)
+
+        assert [(r.module, r.depth) for r in records] == [("torch._C", 2), ("torch", 1), ("app.utils", 0)]
+        assert report["total_ms"] == 1.2
+        assert report["packages"][0] == {"package": "torch", "self_ms": 1.0, "percent": 83.3}
+        assert [m["module"] for m in report["slowest_modules"]] == ["app.utils", "torch"]
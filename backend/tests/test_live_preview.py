@@ -0,0 +1,88 @@
+"""
+Testes unitários para o preview incremental por camadas
+Arquivo: tests/test_live_preview.py
+"""
+
+import pytest
+
+try:
+    from PIL import Image, ImageChops
+    from app.services.live_preview import (
+        LayerCache, SceneCompositor, decode_patch, encode_patch, merge_regions
+    )
+except ImportError:
+    pytest.skip("Módulo live_preview não encontrado", allow_module_level=True)
+
+
+def _scene(text_x=100, title="Cena"):
+    return {
+        "id": 1,
+        "title": title,
+        "elements": [
+            {"id": "bg", "type": "image", "x": 0, "y": 0, "width": 1920, "height": 540},
+            {"id": "txt", "type": "text", "text": "Olá", "x": text_x, "y": 700, "width": 300, "height": 90},
+            {"id": "vid", "type": "video", "x": 1200, "y": 600, "width": 400, "height": 300},
+        ],
+    }
+
+
+class TestSceneCompositor:
+    """Testes da recomposição por regiões"""
+
+    def test_first_update_is_full_frame(self):
+        compositor = SceneCompositor(layer_cache=LayerCache())
+        assert compositor.update(_scene()) == [(0, 0, 640, 360)]
+
+    def test_moving_element_only_dirties_its_area(self):
+        compositor = SceneCompositor(layer_cache=LayerCache())
+        compositor.update(_scene())
+
+        dirty = compositor.update(_scene(text_x=160))
+
+        assert len(dirty) == 1
+        x0, y0, x1, y1 = dirty[0]
+        assert (x1 - x0) * (y1 - y0) < 640 * 360 * 0.2
+        assert compositor.update(_scene(text_x=160)) == []
+
+    def test_incremental_frame_matches_full_render(self):
+        compositor = SceneCompositor(layer_cache=LayerCache())
+        compositor.update(_scene())
+        for x in range(100, 1000, 150):
+            compositor.update(_scene(text_x=x, title=f"Cena {x}"))
+
+        reference = SceneCompositor(layer_cache=LayerCache())
+        reference.update(_scene(text_x=850, title="Cena 850"))
+
+        assert ImageChops.difference(compositor.frame, reference.frame).getbbox() is None
+
+    def test_large_changes_collapse_to_full_frame(self):
+        regions = merge_regions([(0, 0, 600, 300), (10, 10, 20, 20)], (640, 360))
+        assert regions == [(0, 0, 640, 360)]
+
+
+def test_binary_patch_roundtrip():
+    header = {"type": "preview_patch", "regions": [{"x": 0}, {"x": 16}]}
+    message = encode_patch(header, [b"abc", b"defg"])
+
+    decoded, blobs = decode_patch(message)
+
+    assert blobs == [b"abc", b"defg"]
+    assert decoded["regions"][1]["offset"] == 3
+
+
+class TestLayerCache:
+    """Testes do orçamento em bytes do cache de camadas"""
+
+    def test_layers_are_evicted_by_bytes(self):
+        layer_bytes = 200 * 100 * 4
+        cache = LayerCache(max_bytes=layer_bytes * 3)
+
+        for i in range(5):
+            cache.get_or_create(f"layer-{i}", lambda: Image.new("RGBA", (200, 100)))
+        oversized = cache.get_or_create("big", lambda: (Image.new("RGBA", (400, 400)), (0, 0)))
+        stats = cache.get_stats()
+
+        assert oversized[0].size == (400, 400)
+        assert (stats["layers"], stats["bytes"], stats["evictions"]) == (3, layer_bytes * 3, 2)
+        cache.get_or_create("layer-4", lambda: pytest.fail("camada recente foi expulsa"))
+        assert cache.get_or_create("layer-0", lambda: "recriada") == "recriada"
@@ -0,0 +1,56 @@
+"""
+Testes unitários para os helpers de paginação
+Arquivo: tests/test_pagination.py
+"""
+
+import pytest
+
+try:
+    from sqlalchemy import Column, Integer, create_engine
+    from sqlalchemy.orm import DeclarativeBase, Session
+    from app.core.pagination import apply_keyset_pagination, build_keyset_page, estimate_count
+except ImportError:
+    pytest.skip("Módulo pagination não encontrado", allow_module_level=True)
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Item(_Base):
+    __tablename__ = "items"
+    id = Column(Integer, primary_key=True)
+    ordem = Column(Integer, nullable=False)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    _Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        # Ordens repetidas exercitam o desempate por id
+        db.add_all([_Item(id=i, ordem=i // 3) for i in range(1, 101)])
+        db.commit()
+        yield db
+
+
+class TestKeysetPagination:
+    """Testes de paginação por cursor e contagem estimada"""
+
+    def test_pages_cover_all_rows_once(self, session):
+        columns = [_Item.ordem, _Item.id]
+        seen, cursor = [], None
+        while True:
+            rows = apply_keyset_pagination(session.query(_Item), columns, cursor, 7).all()
+            items, cursor = build_keyset_page(rows, ["ordem", "id"], 7)
+            seen.extend(item.id for item in items)
+            if cursor is None:
+                break
+
+        assert seen == sorted(seen, key=lambda i: (i // 3, i))
+        assert len(seen) == len(set(seen)) == 100
+
+    def test_estimate_count_is_exact_below_cap(self, session):
+        query = session.query(_Item).filter(_Item.ordem < 10)
+        assert estimate_count(query, cap=1000) == (29, True)
+        assert estimate_count(session.query(_Item), cap=50) == (50, False)
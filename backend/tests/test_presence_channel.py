@@ -0,0 +1,118 @@
+"""
+Testes unitários para o canal de presença da colaboração
+Arquivo: tests/test_presence_channel.py
+"""
+
+import asyncio
+import json
+
+import pytest
+
+try:
+    from app.services.presence_channel import (
+        BINARY_PRESENCE_SUBPROTOCOL, FLAG_CURSOR, FLAG_SELECTION, PresenceChannel,
+        decode_presence_frame, negotiate_presence_format
+    )
+except ImportError:
+    pytest.skip("Módulo presence_channel não encontrado", allow_module_level=True)
+
+
+class _Socket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_bytes(self, data):
+        self.sent.append(data)
+
+    async def send_text(self, data):
+        self.sent.append(data)
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+    async def accept(self, subprotocol=None):
+        self.subprotocol = subprotocol
+
+
+class TestPresenceChannel:
+    """Testes de coalescência e montagem dos quadros"""
+
+    def test_updates_are_coalesced_per_user(self):
+        channel = PresenceChannel()
+        channel.add_connection("a", _Socket(), user_id=1)
+        channel.add_connection("b", _Socket(), user_id=2)
+
+        for x in range(50):
+            channel.update_cursor(2, {"x": x, "y": 5})
+        channel.update_selection(2, ["el-1", "título"])
+
+        frames = channel.collect()
+
+        assert set(frames) == {"a"}  # o próprio usuário não recebe seu cursor
+        tick, updates = decode_presence_frame(frames["a"])
+        assert tick == 1
+        assert len(updates) == 1
+        assert (updates[0].x, updates[0].y) == (49.0, 5.0)
+        assert updates[0].flags == FLAG_CURSOR | FLAG_SELECTION
+        assert updates[0].selection == ["el-1", "título"]
+        assert channel.collect() == {}
+
+    def test_busy_connection_accumulates_latest_state(self):
+        channel = PresenceChannel()
+        channel.add_connection("a", _Socket(), user_id=1, binary=False)
+        channel.update_cursor(2, {"x": 1, "y": 1})
+        channel.collect()
+
+        channel._connections["a"].sending = True
+        channel.update_cursor(2, {"x": 2, "y": 2})
+        channel.update_cursor(3, {"x": 7, "y": 7})
+        assert channel.collect() == {}
+
+        channel._connections["a"].sending = False
+        channel.update_cursor(2, {"x": 3, "y": 3})
+        payload = json.loads(channel.collect()["a"])
+
+        assert payload["type"] == "presence"
+        assert sorted((u["id"], u["x"]) for u in payload["users"]) == [(2, 3.0), (3, 7.0)]
+
+
+class TestPresenceNegotiation:
+    """Quadros binários só para clientes que os pedem"""
+
+    def test_negotiation_defaults_to_json(self):
+        assert negotiate_presence_format() == (False, None)
+        assert negotiate_presence_format("binary") == (True, None)
+        assert negotiate_presence_format(None, ["chat", BINARY_PRESENCE_SUBPROTOCOL]) == \
+            (True, BINARY_PRESENCE_SUBPROTOCOL)
+
+    def test_join_project_sends_json_presence_by_default(self, monkeypatch):
+        try:
+            from app.services.collaboration_service import CollaborationService
+        except ImportError:
+            pytest.skip("Módulo collaboration_service não encontrado")
+
+        service = CollaborationService()
+
+        async def allow(*args):
+            return True
+
+        async def owner(project_id):
+            return 1
+
+        monkeypatch.setattr(service, "_project_exists", allow)
+        monkeypatch.setattr(service, "_check_user_permission", allow)
+        monkeypatch.setattr(service, "_get_project_owner", owner)
+
+        async def scenario():
+            socket = _Socket()
+            assert await service.join_project(1, 1, "Ana", "ana@x.io", socket)
+            session = service.active_sessions[1]
+            await session.presence.stop()
+            return socket, session
+
+        socket, session = asyncio.run(scenario())
+
+        assert socket.subprotocol is None
+        assert not next(iter(session.presence._connections.values())).binary
+        state = next(m for m in socket.sent if m.get("type") == "project_state")
+        assert state["data"]["presence"]["format"] == "json"
@@ -0,0 +1,82 @@
+"""
+Testes unitários para o cache de previews (memória + disco)
+Arquivo: tests/test_preview_cache.py
+"""
+
+import pytest
+
+try:
+    from app.services.preview_cache import PreviewCache, PreviewEntry, is_valid_key
+except ImportError:
+    pytest.skip("Módulo preview_cache não encontrado", allow_module_level=True)
+
+
+def _entry(i: int, size: int = 100) -> PreviewEntry:
+    return PreviewEntry(key=f"{i:032x}", data=bytes([i]) * size)
+
+
+class TestPreviewCache:
+    """Testes do LRU limitado por bytes e do nível em disco"""
+
+    def test_memory_is_bounded_by_bytes(self):
+        cache = PreviewCache(max_memory_bytes=250)
+        for i in range(5):
+            cache.put(_entry(i))
+
+        stats = cache.get_stats()
+        assert stats["memory_bytes"] <= 250
+        assert stats["memory_entries"] == 2
+        assert cache.get(_entry(0).key) is None
+        assert cache.get(_entry(4).key) is not None
+
+    def test_lru_order_respects_access(self):
+        cache = PreviewCache(max_memory_bytes=250)
+        cache.put(_entry(1))
+        cache.put(_entry(2))
+        cache.get(_entry(1).key)
+        cache.put(_entry(3))
+
+        assert cache.get(_entry(1).key, include_disk=False) is not None
+        assert cache.get(_entry(2).key, include_disk=False) is None
+
+    def test_evicted_entries_are_promoted_from_disk(self, tmp_path):
+        cache = PreviewCache(max_memory_bytes=150, disk_dir=tmp_path, max_disk_bytes=1000)
+        first = _entry(1)
+        cache.put(first)
+        cache.put(_entry(2))
+
+        restored = cache.get(first.key)
+        assert restored is not None
+        assert restored.data == first.data
+        assert restored.etag == first.etag
+        assert cache.get_stats()["disk_hits"] == 1
+
+    def test_disk_is_bounded_by_bytes(self, tmp_path):
+        cache = PreviewCache(max_memory_bytes=100, disk_dir=tmp_path, max_disk_bytes=300)
+        for i in range(10):
+            cache.put(_entry(i))
+
+        assert cache.get_stats()["disk_bytes"] <= 300
+        assert sum(path.stat().st_size for path in tmp_path.iterdir()) == cache.get_stats()["disk_bytes"]
+
+    def test_disk_index_is_loaded_once(self, tmp_path, monkeypatch):
+        cache = PreviewCache(max_memory_bytes=100, disk_dir=tmp_path, max_disk_bytes=1000)
+        for i in range(4):
+            cache.put(_entry(i))
+
+        # Reinício: o índice vem do diretório; depois disso, nada de listar/statar
+        restarted = PreviewCache(max_memory_bytes=100, disk_dir=tmp_path, max_disk_bytes=250)
+        monkeypatch.setattr(type(tmp_path), "iterdir", lambda self: pytest.fail("diretório listado"))
+        monkeypatch.setattr(type(tmp_path), "stat", lambda self, **kw: pytest.fail("stat no disco"))
+        for i in range(4, 8):
+            restarted.put(_entry(i))
+
+        stats = restarted.get_stats()
+        assert (stats["disk_entries"], stats["disk_bytes"]) == (2, 200)
+        assert restarted.get(_entry(6).key).data == _entry(6).data
+        assert restarted.get(_entry(0).key) is None
+
+    def test_invalid_keys_never_touch_disk(self, tmp_path):
+        assert not is_valid_key("../../etc/passwd")
+        cache = PreviewCache(disk_dir=tmp_path)
+        assert cache.get("../segredo") is None
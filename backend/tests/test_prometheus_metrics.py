@@ -0,0 +1,127 @@
+"""
+Testes unitários para as métricas Prometheus (labels por rota e multiprocesso)
+Arquivo: tests/test_prometheus_metrics.py
+"""
+
+import glob
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+try:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from prometheus_client import CollectorRegistry, multiprocess
+    from app.monitoring.prometheus_metrics import (
+        UNMATCHED_PATH, PrometheusMiddleware, compact_dead_workers, registry,
+    )
+except ImportError:
+    pytest.skip("Módulo prometheus_metrics não encontrado", allow_module_level=True)
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def requests_count(path, status="200", method="GET"):
+    value = registry.get_sample_value(
+        "http_requests_total",
+        {"method": method, "path": path, "status": status, "user_type": "anonymous"},
+    )
+    return value or 0.0
+
+
+class TestRouteLabels:
+    """Testes de labels de baixa cardinalidade"""
+
+    def test_requests_grouped_by_route_template(self):
+        app = FastAPI()
+        app.add_middleware(PrometheusMiddleware)
+
+        @app.get("/api/scenes/{scene_id}")
+        async def get_scene(scene_id: int):
+            return {"id": scene_id}
+
+        sub = FastAPI()
+
+        @sub.get("/items/{item_id}")
+        async def get_item(item_id: str):
+            return {"id": item_id}
+
+        app.mount("/v2", sub)
+
+        before = {
+            "scene": requests_count("/api/scenes/{scene_id}"),
+            "item": requests_count("/v2/items/{item_id}"),
+            "unmatched": requests_count(UNMATCHED_PATH, status="404"),
+        }
+        with TestClient(app) as client:
+            for scene_id in range(25):
+                client.get(f"/api/scenes/{scene_id}")
+            client.get("/v2/items/abc")
+            client.get("/v2/items/def")
+            client.get("/wp-admin/setup.php")
+            client.get("/.env")
+
+        assert requests_count("/api/scenes/{scene_id}") - before["scene"] == 25
+        assert requests_count("/v2/items/{item_id}") - before["item"] == 2
+        assert requests_count(UNMATCHED_PATH, status="404") - before["unmatched"] == 2
+        paths = {
+            sample.labels["path"]
+            for metric in registry.collect() if metric.name == "http_requests"
+            for sample in metric.samples
+        }
+        assert not any(path.startswith("/api/scenes/") and "{" not in path for path in paths)
+        assert registry.get_sample_value(
+            "http_request_duration_seconds_count",
+            {"method": "GET", "path": "/api/scenes/{scene_id}", "status_class": "2xx"},
+        ) >= 25
+
+
+class TestMultiprocess:
+    """Testes do modo multiprocesso com workers encerrados"""
+
+    @staticmethod
+    def run_worker(directory, requests):
+        code = (
+            "from app.monitoring.prometheus_metrics import observe_http_request\n"
+            f"for _ in range({requests}):\n"
+            "    observe_http_request('GET', '/api/scenes/{scene_id}', 200, 0.2, 512)\n"
+        )
+        env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=str(directory))
+        subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, env=env, check=True, timeout=60)
+
+    @staticmethod
+    def scrape(directory):
+        scrape_registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(scrape_registry, path=str(directory))
+        labels = {"method": "GET", "path": "/api/scenes/{scene_id}"}
+        return (
+            scrape_registry.get_sample_value(
+                "http_requests_total", dict(labels, status="200", user_type="anonymous")),
+            scrape_registry.get_sample_value(
+                "http_request_duration_seconds_bucket", dict(labels, status_class="2xx", le="0.25")),
+            scrape_registry.get_sample_value(
+                "http_request_duration_seconds_count", dict(labels, status_class="2xx")),
+        )
+
+    def test_dead_workers_compacted_without_losing_counts(self, tmp_path):
+        for requests in (3, 5):
+            self.run_worker(tmp_path, requests)
+        assert self.scrape(tmp_path) == (8.0, 8.0, 8.0)
+
+        counter_files = glob.glob(str(tmp_path / "counter_*.db"))
+        assert len(counter_files) == 2
+        assert compact_dead_workers(str(tmp_path)) >= 6  # contador, histogramas e gauges de 2 workers
+
+        assert self.scrape(tmp_path) == (8.0, 8.0, 8.0)
+        assert sorted(os.path.basename(f) for f in glob.glob(str(tmp_path / "*.db"))) == [
+            "counter_archive.db", "histogram_archive.db",
+        ]
+
+        # Novos workers somam ao arquivo, que é compactado de novo
+        self.run_worker(tmp_path, 4)
+        compact_dead_workers(str(tmp_path))
+        assert self.scrape(tmp_path) == (12.0, 12.0, 12.0)
+        assert len(glob.glob(str(tmp_path / "*.db"))) == 2
@@ -0,0 +1,104 @@
+"""
+Testes unitários para os sketches de quantis e o coletor de métricas da API
+Arquivo: tests/test_quantile_sketch.py
+"""
+
+import random
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+try:
+    from app.services.quantile_sketch import DDSketch, WindowedSketch
+    from app.services import api_monitoring_service
+    from app.services.api_monitoring_service import AdvancedAPIMonitoringService, MetricsCollector
+except ImportError:
+    pytest.skip("Módulo quantile_sketch não encontrado", allow_module_level=True)
+
+
+def exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestDDSketch:
+    """Testes de precisão e mescla"""
+
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(5, 1.2) for _ in range(20000)]
+        sketch = DDSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.95, 0.99):
+            expected = exact_quantile(values, q)
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.011)
+        assert sketch.quantiles((0.99, 0.5)) == [sketch.quantile(0.99), sketch.quantile(0.5)]
+        assert sketch.summary()["count"] == 20000
+
+    def test_merge_equals_single_sketch(self):
+        left, right, single = DDSketch(), DDSketch(), DDSketch()
+        for value in range(1, 1001):
+            (left if value % 2 else right).add(value)
+            single.add(value)
+
+        left.merge(right)
+
+        assert left.bins == single.bins
+        assert left.summary() == pytest.approx(single.summary())
+
+    def test_window_drops_expired_intervals(self):
+        windowed = WindowedSketch(fine_seconds=60, fine_retention=300)
+        windowed.add(10.0, timestamp=1000.0)
+        windowed.add(20.0, timestamp=1500.0)
+
+        assert windowed.merged(120, now=1500.0).count == 1
+        assert windowed.merged(3600, now=1500.0).count == 2  # resolução grossa
+
+
+class TestMetricsCollector:
+    """Testes do coletor baseado em sketches"""
+
+    def test_request_stats_and_prometheus_export(self):
+        collector = MetricsCollector()
+        for i in range(100):
+            collector.record_request("/api/files", "GET", 200 if i % 10 else 503, float(i + 1))
+
+        stats = collector.get_request_stats(timedelta(minutes=5))["/api/files"]
+        text = collector.export_prometheus()
+
+        assert (stats["requests"], stats["errors"], stats["server_errors"]) == (100, 10, 10)
+        assert collector.get_metric_summary("response_time", status="503")["count"] == 10
+        assert "# TYPE tecnocursos_api_response_time_ms summary" in text
+        assert 'tecnocursos_api_response_time_ms_count{endpoint="/api/files",method="GET",status="503"} 10' in text
+
+    def test_counters_bounded_by_series_limit(self):
+        collector = MetricsCollector(max_series=5)
+        for i in range(50):
+            collector.record_request(f"/api/scenes/{i}", "GET", 404 if i % 2 else 200, 10.0)
+
+        assert len(collector.series) <= 6
+        assert len(collector.request_count) <= 6
+        assert sum(collector.request_count.values()) == 50
+        assert sum(collector.status_code_count.values()) == 50
+
+    def test_track_api_call_uses_route_template(self, monkeypatch):
+        service = AdvancedAPIMonitoringService()
+        monkeypatch.setattr(api_monitoring_service, "monitoring_service", service)
+
+        def request(path, route):
+            return SimpleNamespace(
+                scope={"route": route}, url=SimpleNamespace(path=path), method="GET",
+                state=SimpleNamespace(), client=None, headers={}
+            )
+
+        route = SimpleNamespace(path="/api/scenes/{scene_id}")
+        for scene_id in range(3):
+            api_monitoring_service.track_api_call(request(f"/api/scenes/{scene_id}", route),
+                                                  SimpleNamespace(status_code=200), 5.0)
+        api_monitoring_service.track_api_call(request("/nao-existe", None),
+                                              SimpleNamespace(status_code=404), 1.0)
+
+        assert service.collector.request_count == {"/api/scenes/{scene_id}": 3, "<unmatched>": 1}
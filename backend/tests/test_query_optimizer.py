@@ -0,0 +1,97 @@
+"""
+Testes unitários para as consultas agregadas do OptimizedQueries
+Arquivo: tests/test_query_optimizer.py
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+try:
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from app.database import Base
+    from app.models import FileUpload, Project, Scene, User, Video
+    from app.core.query_optimizer import OptimizedQueries
+except ImportError:
+    pytest.skip("Módulo query_optimizer não encontrado", allow_module_level=True)
+
+
+def _file(file_id, project_id, user_id=1, day=1):
+    return FileUpload(id=file_id, filename=f"f{file_id}.pdf", original_filename=f"f{file_id}.pdf",
+                      file_path=f"/tmp/f{file_id}.pdf", file_size=10, file_type="pdf",
+                      mime_type="application/pdf", user_id=user_id, project_id=project_id,
+                      uploaded_at=datetime(2025, 1, day))
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([
+            User(id=1, email="a@b.c", username="ana", full_name="Ana", hashed_password="x"),
+            User(id=2, email="b@b.c", username="bia", full_name="Bia", hashed_password="x"),
+        ])
+        statuses = ["completed", "draft", "completed", "draft"]
+        for pid, status in enumerate(statuses, start=1):
+            session.add(Project(id=pid, name=f"P{pid}", slug=f"p{pid}", owner_id=1, status=status,
+                                is_public=pid == 1, updated_at=datetime(2025, 2, pid)))
+        session.add(Project(id=9, name="Outro", slug="outro", owner_id=2, updated_at=datetime(2025, 3, 1)))
+        # P2: 3 arquivos, 1 vídeo, 2 cenas; P3: 1 arquivo; P1 e P4 vazios
+        session.add_all([_file(1, 2, day=3), _file(2, 2, day=5), _file(3, 2, day=4), _file(4, 3, day=2),
+                         _file(5, 9, user_id=2, day=9), _file(6, None, day=6)])
+        session.add(Video(id=1, title="v", filename="v.mp4", file_path="/tmp/v.mp4",
+                          project_id=2, source_file_id=1))
+        session.add_all([Scene(id=1, project_id=2, name="c1", ordem=1024),
+                         Scene(id=2, project_id=2, name="c2", ordem=2048),
+                         Scene(id=3, project_id=9, name="c3", ordem=1024)])
+        session.commit()
+        yield session
+
+
+def projects_page(db, **kwargs):
+    # Sem o decorador @cached: mede a consulta, não o cache
+    method = OptimizedQueries.get_user_projects_optimized.__wrapped__
+    return asyncio.run(method(OptimizedQueries(db), 1, **kwargs))
+
+
+class TestOptimizedQueries:
+    """Testes das agregações (GROUP BY) e do dashboard em UNION ALL"""
+
+    def test_project_stats_are_aggregated_per_page(self, db):
+        projects = projects_page(db)
+        assert [p["id"] for p in projects] == [4, 3, 2, 1]
+        stats = {p["id"]: (p["total_files"], p["total_videos"], p["total_scenes"]) for p in projects}
+        assert stats == {4: (0, 0, 0), 3: (1, 0, 0), 2: (3, 1, 2), 1: (0, 0, 0)}
+        by_id = {p["id"]: p for p in projects}
+        assert by_id[2]["last_file_upload"].day == 5
+        assert by_id[1]["last_file_upload"] is None
+        assert by_id[2]["owner"] == {"id": 1, "username": "ana", "full_name": "Ana"}
+
+        page = projects_page(db, skip=1, limit=2)
+        assert [(p["id"], p["total_files"]) for p in page] == [(3, 1), (2, 3)]
+        assert "total_files" not in projects_page(db, include_stats=False)[0]
+
+    def test_dashboard_combines_stats_and_recent_items(self, db):
+        data = asyncio.run(OptimizedQueries(db).get_user_dashboard_data(1))
+
+        assert data["statistics"] == {
+            "total_projects": 4, "completed_projects": 2, "public_projects": 1, "completion_rate": 50.0
+        }
+        assert [p["id"] for p in data["recent_projects"]] == [4, 3, 2, 1]
+        assert [f["id"] for f in data["recent_files"]] == [6, 2, 3, 1, 4]
+        assert data["recent_files"][1]["project_name"] == "P2"
+        assert data["recent_files"][0]["project_name"] is None
+
+    def test_dashboard_for_user_without_projects(self, db):
+        db.query(FileUpload).filter(FileUpload.user_id == 2).delete()
+        db.query(Scene).filter(Scene.project_id == 9).delete()
+        db.query(Project).filter(Project.owner_id == 2).delete()
+        db.commit()
+
+        data = asyncio.run(OptimizedQueries(db).get_user_dashboard_data(2))
+        assert data["statistics"]["total_projects"] == 0
+        assert data["statistics"]["completion_rate"] == 0
+        assert data["recent_projects"] == [] and data["recent_files"] == []
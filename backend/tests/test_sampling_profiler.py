@@ -0,0 +1,88 @@
+"""
+Testes unitários para o profiler por amostragem sob demanda
+Arquivo: tests/test_sampling_profiler.py
+"""
+
+import threading
+import time
+
+import pytest
+
+try:
+    from app.core.sampling_profiler import ProfilerBusyError, StackSampler, profile, _session_lock
+except ImportError:
+    pytest.skip("Módulo sampling_profiler não encontrado", allow_module_level=True)
+
+
+def busy_loop(stop: threading.Event):
+    while not stop.is_set():
+        sum(i * i for i in range(500))
+
+
+def run_busy_thread():
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_loop, args=(stop,), name="busy-worker", daemon=True)
+    worker.start()
+    return stop, worker
+
+
+class TestStackSampler:
+    """Testes de amostragem e formatos de saída"""
+
+    def test_wall_sampling_finds_busy_function(self):
+        stop, worker = run_busy_thread()
+        try:
+            result = StackSampler(interval=0.005).run(0.5)
+        finally:
+            stop.set()
+            worker.join()
+
+        assert result.samples > 10
+        busy_stacks = {stack: weight for stack, weight in result.stacks.items() if stack[0] == "busy-worker"}
+        assert busy_stacks
+        assert all(any(frame.startswith("busy_loop ") for frame in stack) for stack in busy_stacks)
+        top_names = [entry["function"] for entry in result.top_functions(50)]
+        assert any("busy_loop" in name or "genexpr" in name for name in top_names)
+        assert result.overhead_percent < 50
+
+    def test_collapsed_and_speedscope_formats(self):
+        stop, worker = run_busy_thread()
+        try:
+            result = StackSampler(interval=0.005, include_threads=["busy-worker"]).run(0.2)
+        finally:
+            stop.set()
+            worker.join()
+
+        lines = result.collapsed().strip().splitlines()
+        assert lines and all(line.startswith("busy-worker;") for line in lines)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+        document = result.speedscope()
+        frames = document["shared"]["frames"]
+        (profile_,) = document["profiles"]
+        assert profile_["type"] == "sampled"
+        assert len(profile_["samples"]) == len(profile_["weights"])
+        assert all(0 <= index < len(frames) for sample in profile_["samples"] for index in sample)
+        assert any(frame["name"] == "busy_loop" and "line" in frame for frame in frames)
+
+    def test_tracemalloc_diff_and_single_session(self):
+        retained = []
+
+        def allocate():
+            for _ in range(20):
+                retained.append(bytearray(100_000))
+                time.sleep(0.005)
+
+        allocator = threading.Thread(target=allocate)
+        allocator.start()
+        result = profile(duration=0.3, interval=0.01, allocations=True, allocation_top=5)
+        allocator.join()
+
+        assert result.allocations is not None
+        assert len(result.allocations) <= 5
+        assert result.allocations[0]["size_diff_kb"] > 500
+        assert "test_sampling_profiler.py" in result.allocations[0]["location"]
+
+        with _session_lock:
+            with pytest.raises(ProfilerBusyError):
+                profile(duration=0.05)
@@ -0,0 +1,94 @@
+"""
+Testes unitários para as operações em lote de cenas
+Arquivo: tests/test_scene_bulk_operations.py
+"""
+
+import pytest
+
+try:
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.orm import Session
+    from app.database import Base
+    from app.models import Asset, Project, Scene, User
+    from app.models import AssetTag
+    from app.services import search_index_service
+    from app.services.scene_bulk_operations import (
+        bulk_delete_scenes, bulk_duplicate_scenes, bulk_reorder_scenes
+    )
+    from app.services.search_index_service import (
+        asset_search_condition, asset_tags_condition, ensure_search_indexes, scene_search_condition
+    )
+except ImportError:
+    pytest.skip("Módulo scene_bulk_operations não encontrado", allow_module_level=True)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    ensure_search_indexes(engine)
+    with Session(engine) as session:
+        user = User(id=1, email="a@b.c", username="ana", full_name="Ana", hashed_password="x")
+        session.add_all([user, Project(id=1, name="Curso", slug="curso", owner_id=1)])
+        for i in range(1, 6):
+            session.add(Scene(id=i, project_id=1, name=f"Cena {i}", ordem=i * 1024, texto=f"t{i}"))
+            session.add(Asset(id=i, scene_id=i, project_id=1, name=f"img {i}", tipo="image",
+                              library_tags=f'["tag{i}"]'))
+        session.commit()
+        yield session
+    search_index_service._fts_ready = False
+
+
+def _ids(db, model, condition):
+    return sorted(row.id for row in db.query(model.id).filter(condition))
+
+
+def _order(db):
+    return [s.id for s in db.query(Scene).order_by(Scene.ordem, Scene.id)]
+
+
+class TestSceneBulkOperations:
+    """Testes das operações baseadas em conjuntos"""
+
+    def test_duplicate_copies_scenes_and_assets(self, db):
+        copies = bulk_duplicate_scenes(db, db.query(Scene).filter(Scene.id.in_([2, 4])).all(), user_id=1)
+        db.commit()
+
+        assert set(copies) == {2, 4}
+        assert _order(db)[-2:] == [copies[2], copies[4]]
+        copy = db.get(Scene, copies[4])
+        assert (copy.name, copy.texto, copy.parent_scene_id) == ("Cena 4 (Cópia)", "t4", 4)
+        assert [a.name for a in db.query(Asset).filter(Asset.scene_id == copy.id)] == ["img 4"]
+
+    def test_reorder_permutes_within_own_slots(self, db):
+        scenes = db.query(Scene).filter(Scene.id.in_([1, 3, 5])).all()
+        assert bulk_reorder_scenes(db, scenes, {"1": 3, "3": 2, "5": 1}) == 3
+        db.commit()
+        db.expire_all()
+
+        assert _order(db) == [5, 2, 3, 4, 1]
+
+    def test_delete_removes_assets(self, db):
+        assert bulk_delete_scenes(db, [1, 2]) == 2
+        db.commit()
+
+        assert _order(db) == [3, 4, 5]
+        assert db.query(Asset).filter(Asset.scene_id.in_([1, 2])).count() == 0
+
+    def test_search_indexes_follow_duplicate_and_delete(self, db):
+        copies = bulk_duplicate_scenes(db, [db.get(Scene, 4)], user_id=1)
+        db.commit()
+        copy_asset = db.query(Asset).filter(Asset.scene_id == copies[4]).one()
+
+        assert _ids(db, Scene, scene_search_condition(db, "t4")) == [4, copies[4]]
+        assert _ids(db, Asset, asset_search_condition(db, "tag4")) == [4, copy_asset.id]
+        assert _ids(db, Asset, asset_tags_condition(["tag4"])) == [4, copy_asset.id]
+
+        assert bulk_delete_scenes(db, [1, 4]) == 2
+        db.commit()
+
+        assert _ids(db, Scene, scene_search_condition(db, "t1")) == []
+        assert _ids(db, Scene, scene_search_condition(db, "t4")) == [copies[4]]
+        assert _ids(db, Asset, asset_search_condition(db, "tag4")) == [copy_asset.id]
+        assert db.execute(text("SELECT COUNT(*) FROM scenes_fts WHERE rowid IN (1, 4)")).scalar() == 0
+        assert db.query(AssetTag).filter(AssetTag.asset_id.in_([1, 4])).count() == 0
@@ -0,0 +1,76 @@
+"""
+Testes unitários para a ordenação esparsa de cenas
+Arquivo: tests/test_scene_ordering.py
+"""
+
+import random
+
+import pytest
+
+try:
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.orm import Session
+    from app.database import Base
+    from app.models import Project, Scene, User
+    from app.services.scene_ordering import RANK_GAP, move_scene, next_scene_rank, rank_between
+except ImportError:
+    pytest.skip("Módulo scene_ordering não encontrado", allow_module_level=True)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        user = User(email="a@b.c", username="ana", full_name="Ana", hashed_password="x")
+        session.add(user)
+        session.flush()
+        session.add(Project(id=1, name="Curso", slug="curso", owner_id=user.id))
+        session.flush()
+        for i in range(30):
+            session.add(Scene(id=i + 1, project_id=1, name=f"Cena {i}", ordem=next_scene_rank(session, 1)))
+            session.flush()
+        session.commit()
+        yield session
+
+
+def _order(db):
+    return [s.id for s in db.query(Scene).filter(Scene.project_id == 1).order_by(Scene.ordem, Scene.id)]
+
+
+class TestSceneOrdering:
+    """Testes de movimentos com atualização de uma única linha"""
+
+    def test_rank_between(self):
+        assert rank_between(None, None) == RANK_GAP
+        assert rank_between(1024, 2048) == 1536
+        assert rank_between(None, 1) is None
+        assert rank_between(5, 6) is None
+
+    def test_move_updates_a_single_row(self, db):
+        updates = []
+        event.listen(db.get_bind(), "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: updates.append(statement)
+                     if statement.startswith("UPDATE") else None)
+
+        scene = db.get(Scene, 25)
+        move = move_scene(db, scene, 3)
+        db.commit()
+
+        assert len(updates) == 1 and not move.rebalanced
+        assert _order(db)[:4] == [1, 2, 25, 3]
+
+    def test_random_moves_match_list_semantics(self, db):
+        rng = random.Random(7)
+        expected = _order(db)
+        rebalanced = 0
+        for _ in range(300):
+            scene_id = rng.choice(expected)
+            position = rng.randint(1, len(expected))
+            rebalanced += move_scene(db, db.get(Scene, scene_id), position).rebalanced
+            db.commit()
+            expected.remove(scene_id)
+            expected.insert(position - 1, scene_id)
+
+        assert _order(db) == expected
+        assert rebalanced < 30
@@ -0,0 +1,173 @@
+"""
+Testes unitários para a invalidação por geração do cache de cenas
+Arquivo: tests/test_scenes_cache_service.py
+"""
+
+import pytest
+
+try:
+    from app.services.scenes_cache_service import ScenesCacheService
+except ImportError:
+    pytest.skip("Módulo scenes_cache_service não encontrado", allow_module_level=True)
+
+
+class FakeRedis:
+    """Subconjunto de comandos do Redis em memória, contando idas à rede"""
+
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+        self.commands = []
+
+    def mget(self, keys):
+        self.round_trips += 1
+        return [self.data.get(key) for key in keys]
+
+    def delete(self, *keys):
+        self.round_trips += 1
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queued = []
+
+    def setex(self, key, ttl, value):
+        self.queued.append(("setex", key, value))
+
+    def incr(self, key):
+        self.queued.append(("incr", key, None))
+
+    def expire(self, key, ttl):
+        self.queued.append(("expire", key, None))
+
+    def execute(self):
+        self.redis.round_trips += 1
+        results = []
+        for command, key, value in self.queued:
+            self.redis.commands.append(command)
+            if command == "setex":
+                self.redis.data[key] = value
+                results.append(True)
+            elif command == "incr":
+                self.redis.data[key] = int(self.redis.data.get(key, 0)) + 1
+                results.append(self.redis.data[key])
+            else:
+                results.append(True)
+        return results
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(ScenesCacheService, "_init_redis", lambda self: None)
+    service = ScenesCacheService()
+    service.redis_client = FakeRedis()
+    service.cache_enabled = True
+    service.near_cache.clear()
+    return service
+
+
+class TestScenesCacheService:
+    """Testes de leitura em MGET e invalidação por INCR"""
+
+    def test_invalidation_is_a_single_incr(self, cache):
+        cache.get('scene_list', user_id=1, project_id=7, page=1)
+        cache.set('scene_list', ["a"], user_id=1, project_id=7, page=1)
+        assert cache.get('scene_list', user_id=1, project_id=7, page=1) == ["a"]
+
+        cache.redis_client.commands.clear()
+        assert cache.invalidate_project_cache(7) == 1
+        assert cache.redis_client.commands == ["incr", "expire"]
+        assert cache.get('scene_list', user_id=1, project_id=7, page=1) is None
+
+        # Ordenação invalida listas do projeto, mas não o detalhe da cena
+        cache.set('scene_detail', {"id": 3}, scene_id=3, user_id=1)
+        cache.set('scene_list', ["b"], user_id=1, project_id=7, page=1)
+        cache.invalidate_project_ordering(7)
+        cache.near_cache.clear()
+        assert cache.get('scene_list', user_id=1, project_id=7, page=1) is None
+        assert cache.get('scene_detail', scene_id=3, user_id=1) == {"id": 3}
+
+    def test_write_after_concurrent_invalidation_is_stale(self, cache):
+        assert cache.get('scene_detail', scene_id=3, user_id=1) is None
+        cache.invalidate_scene_cache(3)  # cena alterada enquanto a resposta era montada
+        cache.set('scene_detail', {"versao": "antiga"}, scene_id=3, user_id=1)
+
+        assert cache.get('scene_detail', scene_id=3, user_id=1) is None
+
+    def test_get_many_is_one_round_trip(self, cache):
+        params = [{'project_id': pid, 'user_id': 1} for pid in (1, 2, 3)]
+        assert cache.get_many('project_scenes', params) == [None, None, None]
+        cache.set_many('project_scenes', [(params[0], ["p1"]), (params[2], ["p3"])])
+
+        cache.redis_client.round_trips = 0
+        assert cache.get_many('project_scenes', params) == [["p1"], None, ["p3"]]
+        assert cache.redis_client.round_trips == 1
+
+    def test_near_cache_serves_hot_reads_locally(self, cache):
+        cache.get('scene_detail', scene_id=5, user_id=1)
+        cache.set('scene_detail', {"id": 5}, scene_id=5, user_id=1)
+
+        cache.redis_client.round_trips = 0
+        assert cache.get('scene_detail', scene_id=5, user_id=1) == {"id": 5}
+        assert cache.redis_client.round_trips == 0
+
+        cache.invalidate_user_cache(1)
+        assert cache.get('scene_detail', scene_id=5, user_id=1) is None
+
+    def test_orm_writes_from_any_session_invalidate_projects(self, cache, monkeypatch):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+        from app.database import Base
+        from app.models import Asset, Project, Scene, User
+        from app.services import scenes_cache_service
+
+        monkeypatch.setattr(scenes_cache_service, "scenes_cache", cache)
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            db.add_all([User(id=1, email="a@b.c", username="ana", full_name="Ana", hashed_password="x"),
+                        Project(id=1, name="Curso", slug="curso", owner_id=1),
+                        Scene(id=1, project_id=1, name="Cena", ordem=1024)])
+            db.commit()
+            cache.set('project_scenes', ["p1"], project_id=1, user_id=1)
+
+            db.add(Asset(scene_id=1, project_id=1, name="img", tipo="image"))
+            db.flush()
+            db.rollback()
+            assert cache.get('project_scenes', project_id=1, user_id=1) == ["p1"]
+
+            db.add(Asset(scene_id=1, project_id=1, name="img", tipo="image"))
+            db.commit()
+            assert cache.get('project_scenes', project_id=1, user_id=1) is None
+
+    def test_reorder_commit_bumps_only_ordering_generation(self, cache, monkeypatch):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+        from app.database import Base
+        from app.models import Project, Scene, User
+        from app.services import scenes_cache_service
+        from app.services.scene_ordering import move_scene
+
+        monkeypatch.setattr(scenes_cache_service, "scenes_cache", cache)
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            db.add_all([User(id=1, email="a@b.c", username="ana", full_name="Ana", hashed_password="x"),
+                        Project(id=1, name="Curso", slug="curso", owner_id=1),
+                        Scene(id=1, project_id=1, name="A", ordem=1024),
+                        Scene(id=2, project_id=1, name="B", ordem=2048)])
+            db.commit()
+            generations = cache.redis_client.data
+            project_gen = generations.get(cache._generation_key(("project", 1)))
+            ordering_gen = int(generations.get(cache._generation_key(("ordering", 1)), 0))
+
+            move_scene(db, db.get(Scene, 2), 1)
+            db.commit()
+
+            assert generations.get(cache._generation_key(("project", 1))) == project_gen
+            assert int(generations[cache._generation_key(("ordering", 1))]) == ordering_gen + 1
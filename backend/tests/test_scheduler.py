@@ -0,0 +1,117 @@
+"""
+Testes unitários para o agendador compartilhado (roda de tempo e jobs)
+Arquivo: tests/test_scheduler.py
+"""
+
+import asyncio
+import random
+import threading
+import time
+
+import pytest
+
+try:
+    from app.core.scheduler import Scheduler, ScheduledJob, TimingWheel
+except ImportError:
+    pytest.skip("Módulo scheduler não encontrado", allow_module_level=True)
+
+
+class TestTimingWheel:
+    """Testes da roda de tempo hierárquica"""
+
+    def test_jobs_expire_on_their_tick_across_levels(self):
+        now = [0.0]
+        wheel = TimingWheel(tick=1.0, clock=lambda: now[0])
+        rng = random.Random(7)
+        deadlines = {}
+        for i in range(2000):
+            job = ScheduledJob(f"job{i}", lambda: None, interval=1)
+            # Do nível 0 até além da roda (fila de espera)
+            deadlines[job.name] = rng.choice([rng.randint(1, 63), rng.randint(64, 4095),
+                                              rng.randint(4096, 300000), rng.randint(1, 20000000)])
+            wheel.add(job, deadlines[job.name])
+
+        expired = {}
+        wakeups = 0
+        while len(wheel):
+            now[0] = wheel.next_tick()
+            wakeups += 1
+            for job in wheel.advance(now[0]):
+                expired[job.name] = now[0]
+
+        assert expired == deadlines
+        # Só acorda em vencimentos e cascatas, não a cada tick
+        assert wakeups < 5000
+
+
+class TestScheduler:
+    """Testes de execução, coalescência e executor"""
+
+    def test_periodic_async_job_and_removal(self):
+        async def scenario():
+            scheduler = Scheduler(tick=0.01)
+            calls = []
+
+            async def job():
+                calls.append(time.monotonic())
+
+            scheduler.add_job("test.tick", job, interval=0.05, jitter=0.01)
+            await asyncio.sleep(0.4)
+            scheduler.remove_job("test.tick")
+            runs = len(calls)
+            await asyncio.sleep(0.15)
+            await scheduler.stop()
+            return calls, runs, scheduler
+
+        calls, runs, scheduler = asyncio.run(scenario())
+        assert 4 <= runs <= 9
+        assert len(calls) == runs
+        assert scheduler.get_stats()["jobs"] == {}
+        # Uma task de agendador, acordando por vencimento (não por tick de 10 ms)
+        assert scheduler.wakeups < 40
+
+    def test_missed_ticks_are_coalesced_or_caught_up(self):
+        async def scenario():
+            scheduler = Scheduler(tick=0.01)
+            coalesced_runs, catch_up_runs = [], []
+            scheduler.add_job("test.coalesce", lambda: coalesced_runs.append(1), interval=0.05)
+            scheduler.add_job("test.catch_up", lambda: catch_up_runs.append(1), interval=0.05,
+                              coalesce=False)
+            await asyncio.sleep(0.07)
+            time.sleep(0.3)  # loop bloqueado: ~6 ticks perdidos
+            await asyncio.sleep(0.01)
+            stats = scheduler.get_stats()["jobs"]
+            await scheduler.stop()
+            return len(coalesced_runs), len(catch_up_runs), stats
+
+        coalesced, caught_up, stats = asyncio.run(scenario())
+        assert coalesced in (2, 3)  # antes do bloqueio + uma única depois
+        assert stats["test.coalesce"]["coalesced_ticks"] >= 4
+        assert caught_up >= 6
+        assert stats["test.catch_up"]["runs"] == caught_up
+
+    def test_executor_job_runs_off_loop_and_records_failures(self):
+        async def scenario():
+            scheduler = Scheduler(tick=0.01)
+            threads = []
+
+            def cpu_job():
+                threads.append(threading.current_thread().name)
+                sum(i * i for i in range(20000))
+                if len(threads) == 2:
+                    raise RuntimeError("falha simulada")
+
+            scheduler.add_job("test.cpu", cpu_job, interval=0.05, executor=True)
+            with pytest.raises(ValueError):
+                scheduler.add_job("test.bad", asyncio.sleep, interval=1, executor=True)
+            await asyncio.sleep(0.3)
+            stats = scheduler.get_stats()["jobs"]["test.cpu"]
+            await scheduler.stop()
+            return threads, stats
+
+        threads, stats = asyncio.run(scenario())
+        assert threads and all(name.startswith("scheduler") for name in threads)
+        assert stats["failures"] == 1
+        assert stats["runs"] == len(threads)
+        assert stats["runtime_ms"]["count"] == stats["runs"]
+        assert stats["runtime_ms"]["p95"] > 0
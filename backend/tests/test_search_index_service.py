@@ -0,0 +1,139 @@
+"""
+Testes unitários para os índices de busca de cenas e assets
+Arquivo: tests/test_search_index_service.py
+"""
+
+import json
+
+import pytest
+
+try:
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.orm import Session
+    from app.database import Base
+    from app.models import Asset, AssetTag, Project, Scene, User
+    from app.core.pagination import apply_keyset_pagination, build_keyset_page
+    from app.services import search_index_service
+    from app.services.search_index_service import (
+        asset_search_condition, asset_tags_condition, ensure_search_indexes, scene_search_condition
+    )
+except ImportError:
+    pytest.skip("Módulo search_index_service não encontrado", allow_module_level=True)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    assert ensure_search_indexes(engine)
+    with Session(engine) as session:
+        session.add_all([
+            User(id=1, email="a@b.c", username="ana", full_name="Ana", hashed_password="x"),
+            Project(id=1, name="Curso", slug="curso", owner_id=1),
+        ])
+        session.commit()
+        yield session
+    search_index_service._fts_ready = False
+
+
+def scene_hits(db, term):
+    return sorted(row.id for row in db.query(Scene.id).filter(scene_search_condition(db, term)))
+
+
+def asset_hits(db, condition):
+    return sorted(row.id for row in db.query(Asset.id).filter(condition))
+
+
+class TestSearchIndexSync:
+    """Sincronização do FTS e de asset_tags nas escritas do ORM"""
+
+    def test_scene_fts_follows_insert_update_and_delete(self, db):
+        db.add_all([
+            Scene(id=1, project_id=1, name="Abertura", ordem=1024, texto="Introdução à programação"),
+            Scene(id=2, project_id=1, name="Fechamento", ordem=2048, texto="Resumo final"),
+        ])
+        db.commit()
+        assert scene_hits(db, "programacao") == [1]  # sem acento e por prefixo
+        assert scene_hits(db, "resum") == [2]
+
+        db.get(Scene, 2).texto = "Exercícios de programação"
+        db.commit()
+        assert scene_hits(db, "programação") == [1, 2]
+        assert scene_hits(db, "resumo") == []
+
+        db.delete(db.get(Scene, 1))
+        db.commit()
+        assert scene_hits(db, "programação") == [2]
+        assert db.execute(text("SELECT COUNT(*) FROM scenes_fts WHERE rowid = 1")).scalar() == 0
+
+    def test_tag_filter_matches_all_tags_exactly(self, db):
+        db.add_all([
+            Asset(id=1, project_id=1, name="logo", tipo="image", library_tags=json.dumps(["Python", "Curso"])),
+            Asset(id=2, project_id=1, name="fundo", tipo="image", library_tags="python, pythonista"),
+            Asset(id=3, project_id=1, name="trilha", tipo="audio", library_tags=None),
+        ])
+        db.commit()
+
+        assert asset_hits(db, asset_tags_condition([" python "])) == [1, 2]
+        assert asset_hits(db, asset_tags_condition(["python", "CURSO"])) == [1]
+        assert asset_hits(db, asset_tags_condition(["pyth"])) == []
+        assert asset_hits(db, asset_search_condition(db, "pythonista")) == [2]
+
+        db.delete(db.get(Asset, 2))
+        db.commit()
+        assert db.query(AssetTag).filter(AssetTag.asset_id == 2).count() == 0
+
+    def test_ensure_backfills_missing_asset_tags(self, db):
+        db.add(Asset(id=1, project_id=1, name="logo", tipo="image", library_tags='["marca"]'))
+        db.commit()
+        db.execute(text("DELETE FROM asset_tags"))
+        db.commit()
+
+        ensure_search_indexes(db.get_bind())
+        assert asset_hits(db, asset_tags_condition(["marca"])) == [1]
+
+    def test_ensure_rebuilds_only_stale_fts_table(self, db, monkeypatch):
+        db.add(Scene(id=1, project_id=1, name="Abertura", ordem=1024, texto="Introdução"))
+        db.commit()
+
+        calls = []
+        rebuild = search_index_service.rebuild_search_indexes
+        monkeypatch.setattr(search_index_service, "rebuild_search_indexes",
+                            lambda engine, **flags: calls.append(flags) or rebuild(engine, **flags))
+
+        # Sem assets, o índice de assets vazio é legítimo e não dispara rebuild
+        ensure_search_indexes(db.get_bind())
+        assert calls == []
+
+        db.execute(text("DELETE FROM scenes_fts"))
+        db.commit()
+        ensure_search_indexes(db.get_bind())
+        assert calls == [{"tags": False, "scenes": True, "assets": False}]
+        assert scene_hits(db, "introducao") == [1]
+
+
+class TestAssetKeysetPaging:
+    """Paginação por cursor de assets com coluna de ordenação anulável"""
+
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_pages_cover_rows_once_with_null_sort_keys(self, db, descending):
+        durations = [None, 3.0, None, 1.0, 3.0, None, 2.0, 1.0]
+        db.add_all([
+            Asset(id=i, project_id=1, name=f"a{i}", tipo="audio", duration=duration)
+            for i, duration in enumerate(durations, start=1)
+        ])
+        db.commit()
+
+        columns = [Asset.duration, Asset.id]
+        seen, cursor = [], None
+        while True:
+            rows = apply_keyset_pagination(db.query(Asset), columns, cursor, 3, descending=descending).all()
+            items, cursor = build_keyset_page(rows, ["duration", "id"], 3)
+            seen.extend(asset.id for asset in items)
+            if cursor is None:
+                break
+
+        # NULL ordena antes dos valores
+        expected = sorted(range(1, 9), key=lambda i: (durations[i - 1] is not None, durations[i - 1] or 0, i),
+                          reverse=descending)
+        assert seen == expected
@@ -0,0 +1,106 @@
+"""
+Testes unitários para o catálogo imutável de templates
+Arquivo: tests/test_template_catalog.py
+"""
+
+import pytest
+
+try:
+    from app.services.template_catalog import CatalogRef, TemplateCatalog, tokenize
+except ImportError:
+    pytest.skip("Módulo template_catalog não encontrado", allow_module_level=True)
+
+from app.services import scene_template_service
+
+
+TEMPLATES = [
+    {"id": 1, "name": "Apresentação Moderna", "category": "presentation", "style": "modern", "tags": ["gradiente"]},
+    {"id": 2, "name": "Aula Educacional", "category": "education", "style": "education", "tags": ["ensino", "aula"]},
+    {"id": 3, "name": "Relatório Corporativo", "category": "report", "style": "corporate", "tags": ["empresa"]},
+    {"id": 4, "name": "Tutorial de Educação Física", "category": "education", "style": "modern", "tags": []},
+]
+
+
+def build(records=TEMPLATES):
+    return TemplateCatalog(
+        records,
+        key=lambda t: t["id"],
+        category=lambda t: t["category"],
+        style=lambda t: t["style"],
+        tags=lambda t: t["tags"],
+        text=lambda t: (t["name"],),
+    )
+
+
+def ids(records):
+    return [r["id"] for r in records]
+
+
+class TestTemplateCatalog:
+    """Testes dos índices e da troca atômica"""
+
+    def test_tokenize_strips_accents(self):
+        assert tokenize("Educação Física!") == ["educacao", "fisica"]
+
+    def test_indexes_keep_catalog_order(self):
+        catalog = build()
+
+        assert ids(catalog.filter(category="EDUCATION")) == [2, 4]
+        assert ids(catalog.filter(style="modern")) == [1, 4]
+        assert ids(catalog.filter(category="education", style="modern")) == [4]
+        assert ids(catalog.filter(tag="aula")) == [2]
+        assert ids(catalog.filter(offset=1, limit=2)) == [2, 3]
+
+    def test_search_matches_word_prefixes(self):
+        catalog = build()
+
+        assert ids(catalog.filter(search="educa")) == [2, 4]
+        assert ids(catalog.filter(search="educação fís")) == [4]
+        assert ids(catalog.filter(search="ensino")) == [2]
+        assert catalog.filter(search="inexistente") == []
+
+    def test_writes_publish_a_new_snapshot(self):
+        ref = CatalogRef(build())
+        before = ref.current
+
+        ref.update(lambda c: c.with_record({**TEMPLATES[0], "name": "Abertura", "category": "intro"}))
+        ref.update(lambda c: c.without(3))
+
+        assert ids(before.filter(category="presentation")) == [1]
+        assert before.get(3) is not None
+        assert ids(ref.current.filter(category="intro")) == [1]
+        assert ref.current.filter(category="presentation") == []
+        assert ref.current.get(3) is None
+
+
+@pytest.mark.skipif(not scene_template_service.DATABASE_AVAILABLE, reason="Modelos/schemas indisponíveis")
+class TestTemplateServiceCatalog:
+    """O catálogo do serviço acompanha as escritas no banco"""
+
+    def test_template_usage_is_published_to_catalog(self):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+        from sqlalchemy.pool import StaticPool
+        from app.database import Base
+        from app.models import Project, Scene, SceneTemplate, User
+
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            db.add_all([
+                User(id=1, email="a@b.c", username="ana", full_name="Ana", hashed_password="x"),
+                Project(id=1, name="Curso", slug="curso", owner_id=1),
+                Scene(id=1, project_id=1, name="Abertura", ordem=1024),
+                SceneTemplate(id=1, name="Aula", category="education", style="education",
+                              template_data="{}", created_by=1, usage_count=0),
+            ])
+            db.commit()
+
+        service = scene_template_service.SceneTemplateService()
+        service.load_catalog(Session(engine))
+
+        assert service.apply_template_to_scene(1, 1, user_id=1, db=Session(engine))
+        assert service.get_catalog().get(1).usage_count == 1
+
+        assert service.create_scene_from_template(1, 1, "Nova", user_id=1, db=Session(engine))
+        assert service.get_catalog().get(1).usage_count == 2
@@ -0,0 +1,152 @@
+"""
+Testes unitários para o índice full-text de documentos
+Arquivo: tests/test_text_search_index.py
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+try:
+    import app.utils
+    from app.services import text_search_index
+    from app.services.text_search_index import (
+        TextSearchIndex, build_match_query, index_file_upload, pages_from_extraction
+    )
+except ImportError:
+    pytest.skip("Módulo text_search_index não encontrado", allow_module_level=True)
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = TextSearchIndex(tmp_path / "index.db")
+    idx.index_document(1, 10, [
+        "Introdução à programação em Python",
+        "Estruturas de dados: listas, tuplas e dicionários",
+        "Programação orientada a objetos",
+    ], filename="python.pdf")
+    idx.index_document(2, 10, ["Introdução ao JavaScript moderno"], filename="js.pptx")
+    idx.index_document(3, 20, ["Python para ciência de dados"], filename="outro.pdf")
+    yield idx
+    idx.close()
+
+
+class TestBuildMatchQuery:
+    """Testes da montagem de expressões MATCH"""
+
+    def test_terms_are_quoted_and_joined(self):
+        assert build_match_query("python dados") == '"python" AND "dados"'
+
+    def test_phrase_and_prefix(self):
+        assert build_match_query("estruturas de", phrase=True) == '"estruturas de"'
+        assert build_match_query("prog*") == '"prog"*'
+        assert build_match_query('"orientada a" obj*') == '"orientada a" AND "obj"*'
+
+    def test_operators_are_neutralized(self):
+        assert build_match_query("NEAR(a OR b)") == '"NEAR" AND "a" AND "OR" AND "b"'
+        assert build_match_query("   ") == ""
+
+
+class TestTextSearchIndex:
+    """Testes de indexação e busca"""
+
+    def test_search_returns_page_level_hits(self, index):
+        result = index.search("dicionarios", user_id=10)
+
+        assert result["success"]
+        assert result["total_hits"] == 1
+        hit = result["hits"][0]
+        assert hit["file_id"] == 1
+        assert hit["page_number"] == 2
+        assert "[dicionários]" in hit["snippet"]
+
+    def test_search_is_scoped_to_user(self, index):
+        assert index.search("python", user_id=10)["total_hits"] == 1
+        assert index.search("python", user_id=20)["hits"][0]["file_id"] == 3
+
+    def test_phrase_and_prefix_queries(self, index):
+        assert index.search("orientada a objetos", phrase=True)["total_hits"] == 1
+        assert index.search("objetos orientada", phrase=True)["total_hits"] == 0
+        result = index.search("introdu", prefix=True, user_id=10)
+        assert {hit["file_id"] for hit in result["hits"]} == {1, 2}
+
+    def test_reindex_and_remove(self, index):
+        index.index_document(2, 10, ["TypeScript avançado"], filename="js.pptx")
+        assert index.search("javascript")["total_hits"] == 0
+        assert index.search("typescript")["total_hits"] == 1
+
+        assert index.remove_document(2)
+        assert index.search("typescript")["total_hits"] == 0
+        assert index.get_stats()["documents"] == 2
+
+    def test_reindex_file_upload_keeps_page_numbers(self, index, tmp_path, monkeypatch):
+        pdf_path = tmp_path / "aula.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        monkeypatch.setattr(text_search_index, "_text_search_index", index)
+        monkeypatch.setattr(app.utils, "extract_pdf_text", lambda path: {
+            "text_pages": ["Capa do curso", "Recursão e pilha de chamadas"]
+        })
+        file_upload = SimpleNamespace(
+            id=4, user_id=10, filename="aula.pdf", original_filename="aula.pdf", file_type=".pdf",
+            file_path=str(pdf_path), text_content="Capa do curso Recursão e pilha de chamadas"
+        )
+
+        assert index_file_upload(file_upload) == 2
+        assert [hit["page_number"] for hit in index.search("recursão")["hits"]] == [2]
+
+        # Arquivo removido do disco: o texto persistido é o fallback
+        pdf_path.unlink()
+        assert index_file_upload(file_upload) == 1
+
+
+def test_pages_from_extraction_formats():
+    assert pages_from_extraction({"text_pages": ["a", "b"]}) == ["a", "b"]
+    assert pages_from_extraction({"text_slides": ["s1"]}) == ["s1"]
+    assert pages_from_extraction(["p1", None]) == ["p1", ""]
+    assert pages_from_extraction("texto") == ["texto"]
+    assert pages_from_extraction({"error": "falhou"}) == []
+
+
+class TestPathSearch:
+    """Buscas por caminho em app.utils consultam o índice"""
+
+    def test_candidate_pages_follow_file_mtime(self, index, tmp_path):
+        pdf_path = tmp_path / "curso.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        index.index_document(5, 10, ["Capa", "Machine learning aplicado", "Redes neurais"],
+                             filename="curso.pdf", file_path=str(pdf_path))
+
+        assert index.candidate_pages(pdf_path, ["learn", "neurais"]) == {
+            2: "Machine learning aplicado", 3: "Redes neurais"
+        }
+        assert index.candidate_pages(tmp_path / "outro.pdf", ["learn"]) is None
+
+        # Arquivo alterado depois da indexação: o índice não é mais confiável
+        os.utime(pdf_path, (0, 0))
+        assert index.candidate_pages(pdf_path, ["learn"]) is None
+
+    def test_utils_search_uses_index_without_opening_files(self, index, tmp_path, monkeypatch):
+        from app.utils import documents
+
+        pdf_path = tmp_path / "curso.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        index.index_document(5, 10, ["Capa", "IA e mais IA", "Sem termos"],
+                             filename="curso.pdf", file_path=str(pdf_path))
+        monkeypatch.setattr(text_search_index, "_text_search_index", index)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("arquivo não deveria ser reaberto")
+
+        monkeypatch.setattr(documents, "extract_text_from_pdf", fail)
+        monkeypatch.setattr(documents, "fitz", SimpleNamespace(open=fail))
+
+        single = documents.search_text_in_pdf(pdf_path, "ia")
+        assert single["success"]
+        assert single["total_matches"] == 2
+        assert [page["page_number"] for page in single["pages_with_matches"]] == [2]
+
+        batch = documents.batch_search_across_files(str(tmp_path), ["IA"], file_patterns=["*.pdf"], case_sensitive=True)
+        assert batch["errors"] == []
+        assert batch["global_summary"]["total_matches_across_files"] == 2
+        assert batch["files_results"][0]["search_results"]["pages_with_matches"] == [2]
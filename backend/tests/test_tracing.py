@@ -0,0 +1,118 @@
+"""
+Testes unitários para o tracing de requisições (spans, amostragem e exportação)
+Arquivo: tests/test_tracing.py
+"""
+
+import asyncio
+import time
+
+import pytest
+
+try:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from sqlalchemy import create_engine, text
+    from app.core.tracing import (
+        TailSampler, TraceStore, TracingMiddleware, span, to_chrome_trace, to_speedscope, trace, traced,
+    )
+    from app.database import configure_tracing
+except ImportError:
+    pytest.skip("Módulo tracing não encontrado", allow_module_level=True)
+
+
+def keep_all_store():
+    return TraceStore(TailSampler(slow_ms=0.0, sample_rate=0.0))
+
+
+class TestSpans:
+    """Testes de propagação e amostragem"""
+
+    def test_nested_and_concurrent_spans_keep_parents(self):
+        store = keep_all_store()
+
+        @traced("child", category="db")
+        async def child(delay):
+            await asyncio.sleep(delay)
+
+        async def handler():
+            with trace("GET /api/scenes", store=store) as current:
+                with span("cache.get", category="cache"):
+                    pass
+                with span("load") as load:
+                    await asyncio.gather(child(0.01), child(0.02))
+            return current, load
+
+        current, load = asyncio.run(handler())
+
+        names = [s.name for s in current.spans]
+        assert names == ["GET /api/scenes", "cache.get", "load", "child", "child"]
+        assert [s.parent_id for s in current.spans[3:]] == [load.span_id, load.span_id]
+        assert current.summary()["time_by_category_ms"]["db"] >= 30
+        assert store.get(current.trace_id) is current
+
+    def test_tail_sampler_keeps_only_slow_or_failed(self):
+        store = TraceStore(TailSampler(slow_ms=20.0, sample_rate=0.0))
+
+        with trace("rápida", store=store):
+            pass
+        with trace("lenta", store=store):
+            time.sleep(0.025)
+        with pytest.raises(ValueError):
+            with trace("falha", store=store):
+                with span("etapa"):
+                    raise ValueError("boom")
+
+        assert [t["name"] for t in store.list()] == ["falha", "lenta"]
+        assert store.get_stats()["discarded"] == 1
+        # Fora de um trace, span não registra nada
+        assert span("solto").span_id is None
+
+
+class TestTracingIntegration:
+    """Middleware, spans de banco e exportação"""
+
+    def test_middleware_traces_request_with_db_spans(self):
+        store = keep_all_store()
+        engine = create_engine("sqlite://")
+        configure_tracing(engine)
+        app = FastAPI()
+        app.add_middleware(TracingMiddleware, store=store)
+
+        @app.get("/api/scenes/{scene_id}")
+        def get_scene(scene_id: int):
+            with engine.connect() as conn:
+                return {"value": conn.execute(text("SELECT :v"), {"v": scene_id}).scalar()}
+
+        with TestClient(app) as client:
+            response = client.get("/api/scenes/7")
+
+        current = store.get(response.headers["x-trace-id"])
+        assert response.json() == {"value": 7}
+        assert current.name == "GET /api/scenes/{scene_id}"
+        assert current.status_code == 200
+        assert any(s.name == "db.query" and "SELECT" in s.attrs["statement"] for s in current.spans)
+
+    def test_exports_are_well_formed(self):
+        store = keep_all_store()
+
+        async def handler():
+            with trace("POST /api/export", store=store):
+                await asyncio.gather(*[traced("render")(asyncio.sleep)(0.005) for _ in range(3)])
+
+        asyncio.run(handler())
+        traces = store.select()
+
+        chrome = to_chrome_trace(traces)
+        assert sum(1 for e in chrome["traceEvents"] if e["ph"] == "X") == 4
+
+        speedscope = to_speedscope(traces)
+        # Spans concorrentes em faixas separadas; cada faixa abre/fecha em pilha
+        assert len(speedscope["profiles"]) == 3
+        for profile in speedscope["profiles"]:
+            stack = []
+            for event in profile["events"]:
+                if event["type"] == "O":
+                    stack.append(event["frame"])
+                else:
+                    assert stack.pop() == event["frame"]
+            assert stack == []
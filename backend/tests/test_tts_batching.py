@@ -0,0 +1,152 @@
+"""
+Testes unitários para a inferência TTS em lote
+Arquivo: tests/test_tts_batching.py
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+try:
+    from backend.services.tts_batching import BatchInferenceWorker
+except ImportError:
+    pytest.skip("Módulo tts_batching não encontrado", allow_module_level=True)
+
+
+class StubModel:
+    """Modelo stub: marca cada segmento com a chave e registra as chamadas"""
+
+    def __init__(self, fail_on=None):
+        self.calls = []
+        self.fail_on = fail_on
+
+    def __call__(self, key, segments):
+        self.calls.append((key, list(segments)))
+        if self.fail_on in segments:
+            raise ValueError("falha no modelo")
+        return [f"{key}:{segment}" for segment in segments]
+
+
+@pytest.fixture
+def model():
+    return StubModel()
+
+
+@pytest.fixture
+def worker(model):
+    worker = BatchInferenceWorker(model, max_batch_size=4, batch_window=0.05)
+    yield worker
+    worker.stop(timeout=5)
+
+
+class TestBatchInferenceWorker:
+    """Testes do agrupamento e da distribuição dos resultados"""
+
+    def test_concurrent_requests_share_one_generate_call(self, worker, model):
+        async def run():
+            return await asyncio.gather(
+                worker.infer("voz", ["aaa", "b"]),
+                worker.infer("voz", ["cc"]),
+            )
+
+        first, second = asyncio.run(run())
+
+        assert first == ["voz:aaa", "voz:b"]
+        assert second == ["voz:cc"]
+        assert len(model.calls) == 1
+        # Ordenados por tamanho para reduzir o padding
+        assert model.calls[0] == ("voz", ["b", "cc", "aaa"])
+
+    def test_batches_split_by_key_and_max_size(self, worker, model):
+        futures = [
+            worker.submit("voz", ["x"]),
+            worker.submit("voz", ["a", "b", "c"]),
+            worker.submit("voz", ["d", "e"]),
+            worker.submit("outra", ["f"]),
+        ]
+
+        assert [f.result(5) for f in futures] == [
+            ["voz:x"], ["voz:a", "voz:b", "voz:c"], ["voz:d", "voz:e"], ["outra:f"]
+        ]
+        sizes = [(key, len(segments)) for key, segments in model.calls]
+        assert sizes == [("voz", 4), ("voz", 2), ("outra", 1)]
+        assert worker.get_stats()["avg_batch_size"] == round(7 / 3, 2)
+
+    def test_errors_reach_every_request_in_the_batch(self):
+        model = StubModel(fail_on="ruim")
+        worker = BatchInferenceWorker(model, max_batch_size=8, batch_window=0.05)
+        try:
+            ok = worker.submit("voz", ["bom"])
+            bad = worker.submit("voz", ["ruim"])
+
+            with pytest.raises(ValueError):
+                ok.result(5)
+            with pytest.raises(ValueError):
+                bad.result(5)
+            assert worker.submit("voz", []).result(1) == []
+        finally:
+            worker.stop(timeout=5)
+
+
+class StubBarkProcessor:
+    """Mesma assinatura do BarkProcessor: padding fixo e **kwargs repassados ao tokenizer"""
+
+    def __init__(self):
+        self.calls = []
+
+    def _tokenizer(self, text, return_tensors=None, padding=None, max_length=None, **kwargs):
+        import torch
+        self.calls.append((list(text), padding, kwargs))
+        return StubInputs(input_ids=torch.ones(len(text), max_length, dtype=torch.long))
+
+    def __call__(self, text=None, voice_preset=None, return_tensors="pt", max_length=256,
+                 add_special_tokens=False, return_attention_mask=True, return_token_type_ids=False,
+                 **kwargs):
+        return self._tokenizer(text, return_tensors=return_tensors, padding="max_length",
+                               max_length=max_length, add_special_tokens=add_special_tokens,
+                               return_attention_mask=return_attention_mask,
+                               return_token_type_ids=return_token_type_ids, **kwargs)
+
+
+class StubInputs(dict):
+    def to(self, device):
+        return self
+
+
+class StubBarkModel:
+    """Devolve amostras com padding e os comprimentos reais de cada segmento"""
+
+    def generate(self, input_ids=None, return_output_lengths=False, **kwargs):
+        import torch
+        lengths = torch.tensor([3, 5][:input_ids.shape[0]])
+        audio = torch.zeros(input_ids.shape[0], 6)
+        for i, length in enumerate(lengths.tolist()):
+            audio[i, :length] = torch.arange(1, length + 1, dtype=torch.float32)
+        return (audio, lengths) if return_output_lengths else audio
+
+
+class TestBarkGenerateBatch:
+    """_generate_batch com processor e modelo de assinaturas reais"""
+
+    def test_generate_batch_trims_and_normalizes_each_segment(self):
+        try:
+            from backend.services.tts_service import BarkTTSEngine
+        except ImportError:
+            pytest.skip("Módulo tts_service não encontrado")
+
+        engine = BarkTTSEngine()
+        try:
+            engine.processor = StubBarkProcessor()
+            engine.model = StubBarkModel()
+            short, long = engine._generate_batch("v2/pt_speaker_0", ["Olá.", "Tudo bem?"])
+        finally:
+            engine.worker.stop(timeout=5)
+
+        assert engine.processor.calls[0][0] == ["Olá.", "Tudo bem?"]
+        assert engine.processor.calls[0][1] == "max_length"
+        assert short.tolist() == pytest.approx([1 / 3, 2 / 3, 1.0])
+        assert len(long) == 5 and long.max() == 1.0
@@ -35,8 +35,8 @@ class TestGenerateNarration(unittest.TestCase):
         if os.path.exists(self.temp_dir):
             shutil.rmtree(self.temp_dir)
     
-    @patch('app.utils.TTS_AVAILABLE', True)
-    @patch('app.utils.TTSService')
+    @patch('app.utils.narration.TTS_AVAILABLE', True)
+    @patch('app.utils.narration.TTSService')
     def test_generate_narration_sync_success(self, mock_tts_service):
         """Testa geração síncrona bem-sucedida"""
         from app.utils import generate_narration_sync
@@ -67,8 +67,8 @@ class TestGenerateNarration(unittest.TestCase):
         self.assertEqual(result['provider_used'], "gtts")
         self.assertIsNone(result['error'])
         
-    @patch('app.utils.TTS_AVAILABLE', True)
-    @patch('app.utils.TTSService')
+    @patch('app.utils.narration.TTS_AVAILABLE', True)
+    @patch('app.utils.narration.TTSService')
     async def test_generate_narration_async_success(self, mock_tts_service):
         """Testa geração assíncrona bem-sucedida"""
         from app.utils import generate_narration
@@ -99,7 +99,7 @@ class TestGenerateNarration(unittest.TestCase):
         self.assertEqual(result['duration'], 8.7)
         self.assertEqual(result['provider_used'], "bark")
         
-    @patch('app.utils.TTS_AVAILABLE', False)
+    @patch('app.utils.narration.TTS_AVAILABLE', False)
     def test_tts_not_available(self):
         """Testa comportamento quando TTS não está disponível"""
         from app.utils import generate_narration_sync
@@ -117,7 +117,7 @@ class TestGenerateNarration(unittest.TestCase):
         """Testa validação de texto vazio"""
         from app.utils import generate_narration_sync
         
-        with patch('app.utils.TTS_AVAILABLE', True):
+        with patch('app.utils.narration.TTS_AVAILABLE', True):
             # Texto vazio
             result = generate_narration_sync(text="", output_path=self.test_output_path)
             self.assertFalse(result['success'])
@@ -132,7 +132,7 @@ class TestGenerateNarration(unittest.TestCase):
         """Testa validação de comprimento do texto"""
         from app.utils import generate_narration_sync
         
-        with patch('app.utils.TTS_AVAILABLE', True):
+        with patch('app.utils.narration.TTS_AVAILABLE', True):
             # Texto muito longo
             long_text = "x" * 3000
             result = generate_narration_sync(text=long_text, output_path=self.test_output_path)
@@ -141,8 +141,8 @@ class TestGenerateNarration(unittest.TestCase):
             self.assertIn("muito longo", result['error'])
             self.assertIn("3000 caracteres", result['error'])
             
-    @patch('app.utils.TTS_AVAILABLE', True)
-    @patch('app.utils.TTSService')
+    @patch('app.utils.narration.TTS_AVAILABLE', True)
+    @patch('app.utils.narration.TTSService')
     def test_tts_service_failure(self, mock_tts_service):
         """Testa tratamento de falha no serviço TTS"""
         from app.utils import generate_narration_sync
@@ -168,8 +168,8 @@ class TestGenerateNarration(unittest.TestCase):
         self.assertIn("Erro no modelo TTS", result['error'])
         self.assertIsNone(result['audio_path'])
         
-    @patch('app.utils.TTS_AVAILABLE', True)
-    @patch('app.utils.TTSService')
+    @patch('app.utils.narration.TTS_AVAILABLE', True)
+    @patch('app.utils.narration.TTSService')
     def test_exception_handling(self, mock_tts_service):
         """Testa tratamento de exceções"""
         from app.utils import generate_narration_sync
@@ -188,12 +188,12 @@ class TestGenerateNarration(unittest.TestCase):
         self.assertIn("Erro na geração de narração", result['error'])
         self.assertIn("Erro de conexão", result['error'])
         
-    @patch('app.utils.TTS_AVAILABLE', True)
+    @patch('app.utils.narration.TTS_AVAILABLE', True)
     def test_provider_configuration(self):
         """Testa configuração de diferentes provedores"""
         from app.utils import TTSProvider
         
-        with patch('app.utils.TTSService') as mock_tts_service:
+        with patch('app.utils.narration.TTSService') as mock_tts_service:
             from app.utils import generate_narration_sync
             
             mock_result = MagicMock()
@@ -226,8 +226,8 @@ class TestGenerateNarration(unittest.TestCase):
         non_existent_dir = os.path.join(self.temp_dir, "subdir", "audio")
         output_path = os.path.join(non_existent_dir, "test.mp3")
         
-        with patch('app.utils.TTS_AVAILABLE', True), \
-             patch('app.utils.TTSService') as mock_tts_service:
+        with patch('app.utils.narration.TTS_AVAILABLE', True), \
+             patch('app.utils.narration.TTSService') as mock_tts_service:
             
             mock_result = MagicMock()
             mock_result.success = True
@@ -288,8 +288,8 @@ class TestTTSIntegration(unittest.TestCase):
 class TestTTSPerformance(unittest.TestCase):
     """Testes de performance e stress"""
     
-    @patch('app.utils.TTS_AVAILABLE', True)
-    @patch('app.utils.TTSService')
+    @patch('app.utils.narration.TTS_AVAILABLE', True)
+    @patch('app.utils.narration.TTSService')
     def test_concurrent_requests(self, mock_tts_service):
         """Testa múltiplas requisições concorrentes"""
         from app.utils import generate_narration
@@ -323,7 +323,7 @@ class TestTTSPerformance(unittest.TestCase):
         for result in results:
             self.assertTrue(result['success'])
     
-    @patch('app.utils.TTS_AVAILABLE', True)
+    @patch('app.utils.narration.TTS_AVAILABLE', True)
     def test_large_text_chunking(self):
         """Testa comportamento com texto grande"""
         from app.utils import generate_narration_sync
@@ -331,7 +331,7 @@ class TestTTSPerformance(unittest.TestCase):
         # Texto no limite (2000 caracteres)
         limit_text = "A" * 2000
         
-        with patch('app.utils.TTSService') as mock_tts_service:
+        with patch('app.utils.narration.TTSService') as mock_tts_service:
             mock_result = MagicMock()
             mock_result.success = True
             mock_result.audio_path = "large_test.mp3"
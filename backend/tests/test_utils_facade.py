@@ -0,0 +1,52 @@
+"""
+Testes unitários para a fachada de app.utils e os imports sob demanda
+Arquivo: tests/test_utils_facade.py
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+try:
+    import app.utils as utils
+    from app.utils._lazy import lazy_import
+except ImportError:
+    pytest.skip("Módulo app.utils não encontrado", allow_module_level=True)
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+class TestUtilsFacade:
+    """Testes da resolução de nomes pela fachada"""
+
+    def test_every_exported_name_resolves_from_its_submodule(self):
+        for module, names in utils._EXPORTS.items():
+            for name in names:
+                assert hasattr(utils, name), f"{module}.{name}"
+
+        assert utils.format_file_size(2048) == "2.0 KB"
+        assert utils.extract_keywords is sys.modules["app.utils.text"].extract_keywords
+        with pytest.raises(AttributeError):
+            utils.funcao_inexistente
+
+    def test_light_helpers_do_not_import_heavy_stacks(self):
+        probe = (
+            "import sys\n"
+            "from app.utils import format_file_size, validate_file_type, extract_keywords\n"
+            "heavy = ['fitz', 'PIL', 'moviepy', 'backend.services.tts_service', 'app.utils.video']\n"
+            "print([m for m in heavy if m in sys.modules])\n"
+        )
+        completed = subprocess.run([sys.executable, "-c", probe], cwd=str(BACKEND_DIR),
+                                   capture_output=True, text=True, timeout=120)
+
+        assert completed.returncode == 0, completed.stderr
+        assert completed.stdout.strip().splitlines()[-1] == "[]"
+
+    def test_lazy_import_defers_until_first_use(self):
+        proxy = lazy_import("json", "dumps")
+
+        assert not proxy.loaded
+        assert proxy([1]) == "[1]"
+        assert proxy.loaded
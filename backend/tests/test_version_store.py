@@ -0,0 +1,73 @@
+"""
+Testes unitários para o armazenamento de versões com deltas
+Arquivo: tests/test_version_store.py
+"""
+
+import pytest
+
+try:
+    from app.services.version_store import (
+        VersionIndexEntry, VersionStore, apply_patch, count_changes, json_diff
+    )
+except ImportError:
+    pytest.skip("Módulo version_store não encontrado", allow_module_level=True)
+
+
+def _entry(version_id: str, size: int = 1000) -> VersionIndexEntry:
+    return VersionIndexEntry(
+        id=version_id, version_number=0, user_id=1, data_hash=version_id,
+        size=size, stored_size=0, created_at="2026-01-01T00:00:00", kind="snapshot"
+    )
+
+
+def _project(step: int) -> dict:
+    return {
+        "title": "Curso",
+        "scenes": [{"id": i, "texto": "conteúdo " * 20, "x": step if i == 3 else i} for i in range(10)],
+    }
+
+
+class TestJsonPatch:
+    """Testes do diff estrutural"""
+
+    def test_roundtrip(self):
+        old = {"a": [1, {"b": "x/y~"}, 3], "c": {"d": 1}}
+        new = {"a": [1, {"b": "z", "e": None}], "c": {}, "f": []}
+        assert apply_patch(old, json_diff(old, new)) == new
+
+    def test_count_changes_is_structural(self):
+        assert count_changes({"a": 1, "b": [1, 2]}, {"a": 2, "b": [1, 2, 3]}) == 2
+        assert count_changes({"a": {"b": 1}}, {"a": {"b": 1}}) == 0
+
+
+class TestVersionStore:
+    """Testes de snapshots, deltas e índice"""
+
+    def test_deltas_between_snapshots(self, tmp_path):
+        store = VersionStore(tmp_path, snapshot_interval=5)
+        for step in range(12):
+            store.append(1, _entry(f"v{step}"), _project(step))
+
+        stats = store.get_stats(1)
+        assert stats["versions"] == 12
+        assert stats["snapshots"] == 3
+        assert store.list_versions(1, limit=1)[0].version_number == 12
+
+    def test_every_version_is_reconstructed(self, tmp_path):
+        store = VersionStore(tmp_path, snapshot_interval=4)
+        for step in range(10):
+            store.append(1, _entry(f"v{step}"), _project(step))
+
+        reopened = VersionStore(tmp_path, snapshot_interval=4)
+        for step in range(10):
+            assert reopened.load_data(1, step + 1) == _project(step)
+
+    def test_delete_rebases_dependent_deltas(self, tmp_path):
+        store = VersionStore(tmp_path, snapshot_interval=100)
+        for step in range(6):
+            store.append(1, _entry(f"v{step}"), _project(step))
+
+        assert store.delete_versions(1, [1, 2, 3]) == 3
+        assert store.list_versions(1)[-1].kind == "snapshot"
+        assert store.load_data(1, 6) == _project(5)
+        assert store.append(1, _entry("novo"), _project(99)).version_number == 7
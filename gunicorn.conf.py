@@ -0,0 +1,38 @@
+"""
+Hooks do Gunicorn - TecnoCursos AI
+
+Carregado automaticamente pelo gunicorn a partir do diretório de trabalho
+(/app no Dockerfile.production). Mantém o diretório PROMETHEUS_MULTIPROC_DIR
+consistente entre os workers:
+
+- on_starting: apaga os arquivos .db de execuções anteriores (antes de
+  qualquer worker existir), para os contadores começarem do zero
+- child_exit: remove os gauges live* do worker encerrado; contadores e
+  histogramas dele são compactados no próximo scrape
+  (app.monitoring.prometheus_metrics.compact_dead_workers)
+"""
+
+import glob
+import os
+
+
+def _multiproc_dir():
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR") or os.environ.get("prometheus_multiproc_dir")
+
+
+def on_starting(server):
+    path = _multiproc_dir()
+    if not path:
+        return
+    os.makedirs(path, exist_ok=True)
+    for filename in glob.glob(os.path.join(path, "*.db")):
+        os.remove(filename)
+    server.log.info(f"Diretório de métricas multiprocesso limpo: {path}")
+
+
+def child_exit(server, worker):
+    path = _multiproc_dir()
+    if not path:
+        return
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid, path)
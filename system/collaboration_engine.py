@@ -23,11 +23,11 @@ import json
 import uuid
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Set
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Set, Tuple, Iterator
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
 import redis
 import websockets
 
@@ -76,6 +76,13 @@ class Action:
     timestamp: datetime
     applied: bool = False
     conflicts: List[str] = None
+    # Vector clock observado pelo cliente ao gerar a ação ({user_id: contador})
+    clock: Optional[Dict[str, int]] = None
+    # Relógio de Lamport do cliente; se ausente, o servidor atribui
+    lamport: Optional[int] = None
+    # Preenchidos pelo servidor: carimbo LWW [lamport, user_id, contador] e propriedades perdedoras
+    stamp: Optional[List[Any]] = None
+    rejected: List[str] = None
 
 @dataclass
 class Comment:
@@ -89,6 +96,163 @@ class Comment:
     resolved: bool = False
     replies: List['Comment'] = None
 
+# ===================================================================
+# ESTADO CONVERGENTE (CRDT) E LOG DE OPERAÇÕES POR ELEMENTO
+# ===================================================================
+
+# Carimbo com ordem total: (lamport, user_id, contador do usuário)
+Stamp = Tuple[int, str, int]
+
+@dataclass
+class LWWRegister:
+    """Registrador last-writer-wins de uma propriedade"""
+    value: Any
+    stamp: Stamp
+    origin: Tuple[str, int]  # (user_id, contador do usuário no vector clock)
+
+@dataclass
+class ElementState:
+    """Estado de um elemento: existência + registradores por propriedade"""
+    exists: Optional[LWWRegister] = None
+    properties: Dict[str, LWWRegister] = field(default_factory=dict)
+
+class ElementCRDTMap:
+    """
+    Mapa de elementos da cena com registradores LWW por propriedade.
+    
+    Aplicar as mesmas operações em qualquer ordem leva ao mesmo estado,
+    pois cada propriedade mantém apenas o valor com o maior carimbo.
+    """
+    
+    def __init__(self):
+        self.elements: Dict[str, ElementState] = {}
+    
+    def apply(self, action_type: "ActionType", target_id: str, properties: Dict[str, Any],
+              stamp: Stamp, origin: Tuple[str, int]) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Mesclar uma operação.
+        
+        Returns:
+            (propriedades efetivamente gravadas, propriedades rejeitadas por
+            já existir escrita com carimbo maior)
+        """
+        state = self.elements.setdefault(target_id, ElementState())
+        applied: Dict[str, Any] = {}
+        rejected: List[str] = []
+        
+        if action_type in (ActionType.CREATE, ActionType.DELETE):
+            exists = action_type == ActionType.CREATE
+            if state.exists is None or stamp > state.exists.stamp:
+                state.exists = LWWRegister(exists, stamp, origin)
+                applied["_exists"] = exists
+            else:
+                rejected.append("_exists")
+        
+        for name, value in properties.items():
+            register = state.properties.get(name)
+            if register is None or stamp > register.stamp:
+                state.properties[name] = LWWRegister(value, stamp, origin)
+                applied[name] = value
+            else:
+                rejected.append(name)
+        
+        return applied, rejected
+    
+    def register(self, target_id: str, name: str) -> Optional[LWWRegister]:
+        state = self.elements.get(target_id)
+        if state is None:
+            return None
+        return state.exists if name == "_exists" else state.properties.get(name)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Estado visível (para novos participantes e persistência)"""
+        return {
+            element_id: {
+                "exists": state.exists.value if state.exists else True,
+                "properties": {name: reg.value for name, reg in state.properties.items()},
+                "stamps": {name: list(reg.stamp) for name, reg in state.properties.items()},
+            }
+            for element_id, state in self.elements.items()
+        }
+
+@dataclass
+class OpLogEntry:
+    """Operação recente em um elemento"""
+    action_id: str
+    user_id: str
+    action_type: "ActionType"
+    properties: frozenset
+    counter: int  # posição da operação no vector clock do autor
+    at: float  # time.monotonic()
+
+class ElementOpLog:
+    """
+    Log de operações recentes indexado por elemento.
+    
+    Cada elemento guarda no máximo `max_per_element` operações dentro da
+    janela de `window_seconds`, então a verificação de conflitos não depende
+    do tamanho do histórico da sessão.
+    """
+    
+    def __init__(self, window_seconds: float = 5.0, max_per_element: int = 64):
+        self.window_seconds = window_seconds
+        self.max_per_element = max_per_element
+        self._ops: Dict[str, deque] = {}
+        self._records_since_sweep = 0
+    
+    def record(self, target_id: str, entry: OpLogEntry):
+        ops = self._ops.get(target_id)
+        if ops is None:
+            ops = self._ops[target_id] = deque(maxlen=self.max_per_element)
+        ops.append(entry)
+        
+        # Varredura ocasional de elementos que pararam de receber edições
+        self._records_since_sweep += 1
+        if self._records_since_sweep >= 1024:
+            self._records_since_sweep = 0
+            self.sweep(entry.at)
+    
+    def recent(self, target_id: str, now: Optional[float] = None) -> Iterator[OpLogEntry]:
+        ops = self._ops.get(target_id)
+        if not ops:
+            return iter(())
+        cutoff = (now if now is not None else time.monotonic()) - self.window_seconds
+        while ops and ops[0].at < cutoff:
+            ops.popleft()
+        return iter(ops)
+    
+    def sweep(self, now: float):
+        cutoff = now - self.window_seconds
+        for target_id in [t for t, ops in self._ops.items() if not ops or ops[-1].at < cutoff]:
+            del self._ops[target_id]
+    
+    def __len__(self) -> int:
+        return len(self._ops)
+
+def action_properties(action: "Action") -> Dict[str, Any]:
+    """Propriedades do elemento escritas por uma ação"""
+    data = action.data or {}
+    if action.action_type == ActionType.UPDATE:
+        return dict(data.get("properties", {}))
+    if action.action_type == ActionType.MOVE:
+        position = data.get("position", data)
+        return {k: v for k, v in position.items() if k in ("x", "y", "z", "layer", "index", "parent_id")}
+    if action.action_type == ActionType.CREATE:
+        return dict(data.get("properties", data))
+    return {}
+
+def _json_default(obj: Any):
+    """Serialização de enums, datas e estruturas do engine"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    return str(obj)
+
 @dataclass
 class Session:
     """Sessão de colaboração"""
@@ -103,6 +267,11 @@ class Session:
     version: int
     locked_by: Optional[str] = None
     locked_until: Optional[datetime] = None
+    # Vector clock da sessão ({user_id: ações aplicadas}) e relógio de Lamport
+    clock: Dict[str, int] = field(default_factory=dict)
+    lamport: int = 0
+    elements: ElementCRDTMap = field(default_factory=ElementCRDTMap)
+    op_log: ElementOpLog = field(default_factory=ElementOpLog)
 
 class CollaborationEngine:
     """Engine principal de colaboração"""
@@ -118,7 +287,9 @@ class CollaborationEngine:
         self.config = {
             "max_users_per_session": 50,
             "action_history_limit": 10000,
+            "persisted_actions": 100,  # ações recentes gravadas no Redis
             "conflict_resolution_timeout": 30,  # segundos
+            "conflict_window_seconds": 5,  # janela do log de operações por elemento
             "cursor_update_interval": 0.1,  # segundos
             "auto_save_interval": 30,  # segundos
         }
@@ -160,7 +331,8 @@ class CollaborationEngine:
             users={creator_user.id: creator_user},
             actions=[],
             comments=[],
-            version=1
+            version=1,
+            op_log=ElementOpLog(window_seconds=self.config["conflict_window_seconds"])
         )
         
         self.sessions[session_id] = session
@@ -227,7 +399,14 @@ class CollaborationEngine:
         logger.info(f"👋 Usuário {user_id} saiu da sessão {session_id}")
 
     async def apply_action(self, session_id: str, action: Action) -> bool:
-        """Aplicar ação colaborativa"""
+        """
+        Aplicar ação colaborativa.
+        
+        As propriedades são mescladas no mapa LWW da sessão: escritas com
+        carimbo menor que o já registrado são rejeitadas. Os demais usuários
+        recebem só as propriedades vencedoras e o autor recebe um `action_ack`
+        com as perdedoras (e seus valores atuais) para corrigir o estado local.
+        """
         session = self.sessions.get(session_id)
         if not session:
             return False
@@ -237,28 +416,78 @@ class CollaborationEngine:
         if not user or not self._has_permission(user, action.action_type):
             return False
         
-        # Verificar conflitos
-        conflicts = await self._detect_conflicts(session, action)
+        properties = action_properties(action)
+        
+        # Verificar conflitos (apenas o log recente do elemento)
+        conflicts = await self._detect_conflicts(session, action, properties)
+        
+        # Carimbos: vector clock da sessão e Lamport (cliente ou servidor)
+        counter = session.clock.get(action.user_id, 0) + 1
+        session.clock[action.user_id] = counter
+        # Lamport do cliente limitado ao relógio do servidor + 1: um valor
+        # inflado não pode vencer todas as mesclagens futuras
+        lamport = session.lamport + 1
+        if action.lamport is not None:
+            lamport = min(action.lamport, lamport)
+        session.lamport = max(session.lamport, lamport)
+        stamp: Stamp = (lamport, action.user_id, counter)
+        action.stamp = list(stamp)
+        
+        # Mesclar no estado convergente
+        applied, rejected = {}, []
+        if action.action_type in (ActionType.CREATE, ActionType.UPDATE, ActionType.DELETE, ActionType.MOVE):
+            applied, rejected = session.elements.apply(
+                action.action_type, action.target_id, properties, stamp, (action.user_id, counter)
+            )
+        action.rejected = rejected
+        
         if conflicts:
             action.conflicts = conflicts
             await self._resolve_conflicts(session, action)
         
+        session.op_log.record(action.target_id, OpLogEntry(
+            action_id=action.id,
+            user_id=action.user_id,
+            action_type=action.action_type,
+            properties=frozenset(properties),
+            counter=counter,
+            at=time.monotonic()
+        ))
+        
         # Aplicar ação
-        action.applied = True
+        action.applied = bool(applied) or not rejected
         action.timestamp = datetime.now()
         session.actions.append(action)
         session.version += 1
         
-        # Limitar histórico
-        if len(session.actions) > self.config["action_history_limit"]:
-            session.actions = session.actions[-self.config["action_history_limit"]:]
-        
-        # Broadcast para outros usuários
-        await self._broadcast_to_session(session_id, {
-            "type": "action_applied",
-            "action": asdict(action),
+        # Limitar histórico (corte em blocos para não copiar a lista a cada ação)
+        limit = self.config["action_history_limit"]
+        if len(session.actions) > limit + limit // 10:
+            del session.actions[:len(session.actions) - limit]
+        
+        # Broadcast para outros usuários (somente o que venceu a mesclagem)
+        if action.applied:
+            await self._broadcast_to_session(session_id, {
+                "type": "action_applied",
+                "action": asdict(action),
+                "resolved_properties": applied,
+                "origin": [action.user_id, counter],
+                "session_version": session.version
+            }, exclude_user=action.user_id)
+        
+        current_values = {}
+        for name in rejected:
+            register = session.elements.register(action.target_id, name)
+            current_values[name] = register.value if register else None
+
+        await self._send_to_user(action.user_id, {
+            "type": "action_ack",
+            "action_id": action.id,
+            "stamp": action.stamp,
+            "origin": [action.user_id, counter],
+            "rejected": current_values,
             "session_version": session.version
-        }, exclude_user=action.user_id)
+        })
         
         # Persistir mudanças
         await self._save_session_to_redis(session)
@@ -419,47 +648,57 @@ class CollaborationEngine:
         else:  # ADMIN ou OWNER
             return True
 
-    async def _detect_conflicts(self, session: Session, action: Action) -> List[str]:
-        """Detectar conflitos com outras ações recentes"""
-        conflicts = []
+    async def _detect_conflicts(self, session: Session, action: Action,
+                                properties: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Detectar conflitos com ações concorrentes no mesmo elemento.
         
-        # Verificar ações dos últimos 5 segundos no mesmo elemento
-        cutoff = datetime.now() - timedelta(seconds=5)
-        recent_actions = [
-            a for a in session.actions 
-            if a.target_id == action.target_id and a.timestamp > cutoff and a.user_id != action.user_id
-        ]
+        Com vector clock, uma operação recente de outro usuário é concorrente
+        se o cliente ainda não a tinha visto; sem vector clock, vale a janela
+        de tempo do log. Só o log do elemento é consultado (tamanho limitado).
+        """
+        conflicts = []
+        if properties is None:
+            properties = action_properties(action)
+        touched = frozenset(properties)
         
-        for recent_action in recent_actions:
-            if self._actions_conflict(action, recent_action):
-                conflicts.append(f"Conflito com ação {recent_action.id} do usuário {recent_action.user_id}")
+        for entry in session.op_log.recent(action.target_id):
+            if entry.user_id == action.user_id:
+                continue
+            if action.clock is not None and action.clock.get(entry.user_id, 0) >= entry.counter:
+                continue  # o autor já tinha visto esta operação
+            if self._ops_conflict(action.action_type, touched, entry):
+                conflicts.append(f"Conflito com ação {entry.action_id} do usuário {entry.user_id}")
         
         return conflicts
 
-    def _actions_conflict(self, action1: Action, action2: Action) -> bool:
-        """Verificar se duas ações conflitam"""
-        # Mesmo elemento, ações diferentes
-        if action1.target_id == action2.target_id:
-            # UPDATE + UPDATE = conflito se propriedades sobrepostas
-            if action1.action_type == ActionType.UPDATE and action2.action_type == ActionType.UPDATE:
-                props1 = set(action1.data.get("properties", {}).keys())
-                props2 = set(action2.data.get("properties", {}).keys())
-                return bool(props1.intersection(props2))
-            
-            # DELETE + qualquer coisa = conflito
-            if action1.action_type == ActionType.DELETE or action2.action_type == ActionType.DELETE:
-                return True
+    def _ops_conflict(self, action_type: ActionType, properties: frozenset, entry: OpLogEntry) -> bool:
+        """Verificar se uma ação conflita com uma operação do log"""
+        # DELETE + qualquer coisa = conflito
+        if action_type == ActionType.DELETE or entry.action_type == ActionType.DELETE:
+            return True
         
-        return False
+        # Escritas concorrentes em propriedades sobrepostas
+        return bool(properties & entry.properties)
 
     async def _resolve_conflicts(self, session: Session, action: Action):
-        """Resolver conflitos automaticamente"""
-        # Estratégia simples: último a escrever vence
-        # Em implementação real, poderia usar operational transforms
+        """
+        Registrar a resolução dos conflitos.
         
+        A resolução em si é a mesclagem LWW feita em `apply_action`: todos
+        convergem para o valor de maior carimbo `(lamport, user_id, contador)`.
+        """
         for conflict in action.conflicts or []:
-            logger.warning(f"⚠️ Resolvendo conflito: {conflict}")
-            # Por agora, apenas log. Implementação futura: merge automático
+            logger.debug(f"⚠️ {conflict} (LWW, rejeitadas: {action.rejected or []})")
+
+    async def _send_to_user(self, user_id: str, message: Dict[str, Any]):
+        """Enviar mensagem para todas as conexões de um usuário"""
+        message_json = json.dumps(message, default=_json_default)
+        for connection in list(self.user_connections.get(user_id, ())):
+            try:
+                await connection.send(message_json)
+            except Exception:
+                self.user_connections[user_id].discard(connection)
 
     async def _broadcast_to_session(self, session_id: str, message: Dict[str, Any], 
                                   exclude_user: Optional[str] = None, throttle: bool = False):
@@ -468,7 +707,7 @@ class CollaborationEngine:
         if not session:
             return
         
-        message_json = json.dumps(message)
+        message_json = json.dumps(message, default=_json_default)
         
         for user_id, user in session.users.items():
             if exclude_user and user_id == exclude_user:
@@ -503,6 +742,9 @@ class CollaborationEngine:
                 "users": {uid: asdict(user) for uid, user in session.users.items()},
                 "recent_actions": [asdict(a) for a in session.actions[-100:]],  # Últimas 100 ações
                 "comments": [asdict(c) for c in session.comments if not c.resolved],
+                "elements": session.elements.to_dict(),
+                "clock": dict(session.clock),
+                "lamport": session.lamport,
                 "locked_by": session.locked_by,
                 "locked_until": session.locked_until.isoformat() if session.locked_until else None
             }
@@ -511,7 +753,7 @@ class CollaborationEngine:
         connections = self.user_connections.get(user_id, set())
         for connection in connections:
             try:
-                await connection.send(json.dumps(state))
+                await connection.send(json.dumps(state, default=_json_default))
             except Exception:
                 self.user_connections[user_id].discard(connection)
 
@@ -521,13 +763,24 @@ class CollaborationEngine:
             return
         
         try:
-            # Converter dataclasses para dict
-            session_data = asdict(session)
-            
-            # Converter datetime para strings
-            session_data["created_at"] = session.created_at.isoformat()
-            if session.locked_until:
-                session_data["locked_until"] = session.locked_until.isoformat()
+            # Só o estado necessário para retomar a sessão: o histórico completo
+            # e o log de operações não são copiados a cada ação
+            session_data = {
+                "id": session.id,
+                "project_id": session.project_id,
+                "name": session.name,
+                "created_by": session.created_by,
+                "created_at": session.created_at.isoformat(),
+                "version": session.version,
+                "users": {uid: asdict(user) for uid, user in session.users.items()},
+                "elements": session.elements.to_dict(),
+                "recent_actions": [asdict(a) for a in session.actions[-self.config["persisted_actions"]:]],
+                "comments": [asdict(c) for c in session.comments],
+                "clock": dict(session.clock),
+                "lamport": session.lamport,
+                "locked_by": session.locked_by,
+                "locked_until": session.locked_until.isoformat() if session.locked_until else None
+            }
             
             # Salvar no Redis
             await asyncio.get_event_loop().run_in_executor(
@@ -535,7 +788,7 @@ class CollaborationEngine:
                 self.redis_client.setex,
                 f"session:{session.id}",
                 3600 * 24,  # 24 horas TTL
-                json.dumps(session_data)
+                json.dumps(session_data, default=_json_default)
             )
             
         except Exception as e:
@@ -12,14 +12,20 @@ Funcionalidades:
 ✅ AI-powered suggestions
 ✅ Brand customization
 ✅ Multi-language support
+✅ Catálogo imutável com índices (categoria, tag, tokens, duração)
 
 Data: 17 de Janeiro de 2025
 Versão: 6.0.0
 """
 
 import json
+import re
 import uuid
+import bisect
+import threading
+import unicodedata
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from pathlib import Path
@@ -69,11 +75,87 @@ class Template:
     version: str
     premium: bool
 
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+def _tokenize(text: str) -> List[str]:
+    """Tokens em minúsculas e sem acentos ("Educação" -> "educacao")"""
+    normalized = unicodedata.normalize("NFKD", text or "")
+    normalized = "".join(ch for ch in normalized if not unicodedata.combining(ch))
+    return _TOKEN_RE.findall(normalized.lower())
+
+class TemplateIndex:
+    """
+    Snapshot imutável dos templates com índices pré-calculados.
+    
+    Montado uma vez por escrita; as consultas só fazem lookups em dicts,
+    interseções de conjuntos e buscas binárias. Resultados seguem a ordem
+    de inserção dos templates.
+    """
+    
+    __slots__ = ("templates", "position", "by_category", "by_tag", "premium",
+                 "tokens", "vocabulary", "durations", "by_duration")
+    
+    def __init__(self, templates: Dict[str, Template]):
+        self.templates = MappingProxyType(dict(templates))
+        self.position = MappingProxyType({template_id: i for i, template_id in enumerate(templates)})
+        
+        by_category: Dict[str, List[str]] = {}
+        by_tag: Dict[str, List[str]] = {}
+        tokens: Dict[str, set] = {}
+        for template in templates.values():
+            by_category.setdefault(template.category, []).append(template.id)
+            for tag in template.tags:
+                by_tag.setdefault(tag.lower(), []).append(template.id)
+            for text in [template.name, template.description] + list(template.tags):
+                for token in _tokenize(text):
+                    tokens.setdefault(token, set()).add(template.id)
+        
+        self.by_category = MappingProxyType({k: tuple(v) for k, v in by_category.items()})
+        self.by_tag = MappingProxyType({k: tuple(v) for k, v in by_tag.items()})
+        self.premium = tuple(t.id for t in templates.values() if t.premium)
+        self.tokens = MappingProxyType({k: frozenset(v) for k, v in tokens.items()})
+        self.vocabulary = tuple(sorted(tokens))
+        
+        ordered = sorted(templates.values(), key=lambda t: t.duration)
+        self.durations = tuple(t.duration for t in ordered)
+        self.by_duration = tuple(t.id for t in ordered)
+    
+    def ordered(self, ids) -> List[Template]:
+        """Templates dos ids, na ordem de inserção"""
+        return [self.templates[i] for i in sorted(set(ids), key=self.position.__getitem__)]
+    
+    def _prefix_ids(self, prefix: str) -> set:
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        end = bisect.bisect_left(self.vocabulary, prefix + "\uffff")
+        ids = set()
+        for token in self.vocabulary[start:end]:
+            ids |= self.tokens[token]
+        return ids
+    
+    def search(self, query: str) -> List[Template]:
+        """Templates com todos os termos (prefixo de palavra) em nome, descrição ou tags"""
+        terms = _tokenize(query)
+        if not terms:
+            return []
+        ids = None
+        for term in terms:
+            matches = self._prefix_ids(term)
+            ids = matches if ids is None else ids & matches
+            if not ids:
+                return []
+        return self.ordered(ids)
+    
+    def up_to_duration(self, seconds: float) -> List[str]:
+        """Ids com duração <= seconds (busca binária)"""
+        return list(self.by_duration[:bisect.bisect_right(self.durations, seconds)])
+
 class TemplateEngine:
     """Engine principal para gerenciar templates"""
     
     def __init__(self):
         self.templates: Dict[str, Template] = {}
+        self._index = TemplateIndex({})
+        self._write_lock = threading.Lock()
         self.categories = [
             "business", "education", "marketing", "social_media", 
             "presentation", "explainer", "tutorial", "promo"
@@ -107,6 +189,7 @@ class TemplateEngine:
         social_template = self._create_social_media_template()
         self.templates[social_template.id] = social_template
         
+        self._index = TemplateIndex(self.templates)
         logger.info(f"✅ {len(self.templates)} templates padrão carregados")
 
     def _create_corporate_presentation_template(self) -> Template:
@@ -684,21 +767,32 @@ class TemplateEngine:
     # MÉTODOS PÚBLICOS
     # ===================================================================
     
+    def _publish(self, template: Template):
+        """Copia os templates com a alteração e troca o índice de uma vez"""
+        with self._write_lock:
+            templates = dict(self.templates)
+            templates[template.id] = template
+            index = TemplateIndex(templates)
+            self.templates, self._index = templates, index
+
     def get_templates(self, category: Optional[str] = None, premium_only: bool = False) -> List[Template]:
         """Obter lista de templates"""
-        templates = list(self.templates.values())
+        index = self._index
         
         if category:
-            templates = [t for t in templates if t.category == category]
+            ids = set(index.by_category.get(category, ()))
+            if premium_only:
+                ids &= set(index.premium)
+            return index.ordered(ids)
         
         if premium_only:
-            templates = [t for t in templates if t.premium]
+            return index.ordered(index.premium)
         
-        return templates
+        return list(index.templates.values())
 
     def get_template(self, template_id: str) -> Optional[Template]:
         """Obter template específico"""
-        return self.templates.get(template_id)
+        return self._index.templates.get(template_id)
 
     def customize_template(self, template_id: str, customizations: Dict[str, Any]) -> Optional[Template]:
         """Personalizar template"""
@@ -746,7 +840,7 @@ class TemplateEngine:
             if format == "json":
                 data = json.loads(template_data)
                 template = Template(**data)
-                self.templates[template.id] = template
+                self._publish(template)
                 return True
         except Exception as e:
             logger.error(f"Erro ao importar template: {e}")
@@ -754,42 +848,27 @@ class TemplateEngine:
         return False
 
     def search_templates(self, query: str) -> List[Template]:
-        """Buscar templates"""
-        query = query.lower()
-        results = []
-        
-        for template in self.templates.values():
-            # Buscar em nome, descrição e tags
-            if (query in template.name.lower() or 
-                query in template.description.lower() or
-                any(query in tag.lower() for tag in template.tags)):
-                results.append(template)
-        
-        return results
+        """Buscar templates (prefixos de palavras em nome, descrição e tags)"""
+        return self._index.search(query)
 
     def get_template_suggestions(self, context: Dict[str, Any]) -> List[Template]:
         """Obter sugestões de templates baseadas no contexto"""
-        suggestions = []
+        index = self._index
+        suggestions: List[str] = []
         
         # Lógica de sugestão baseada no contexto
         if context.get("industry") == "education":
-            suggestions.extend([t for t in self.templates.values() if t.category == "education"])
+            suggestions.extend(index.by_category.get("education", ()))
         
         if context.get("purpose") == "marketing":
-            suggestions.extend([t for t in self.templates.values() if t.category == "marketing"])
+            suggestions.extend(index.by_category.get("marketing", ()))
         
         if context.get("duration", 0) < 30:
-            suggestions.extend([t for t in self.templates.values() if t.duration <= 30])
+            suggestions.extend(sorted(index.up_to_duration(30), key=index.position.__getitem__))
         
         # Remover duplicatas e limitar resultados
-        seen = set()
-        unique_suggestions = []
-        for template in suggestions:
-            if template.id not in seen:
-                seen.add(template.id)
-                unique_suggestions.append(template)
-        
-        return unique_suggestions[:10]
+        unique_ids = list(dict.fromkeys(suggestions))[:10]
+        return [index.templates[template_id] for template_id in unique_ids]
 
 # ===================================================================
 # INSTÂNCIA SINGLETON